@@ -44,6 +44,35 @@ DEFAULT_MAX_RETRIES = 3
 # 병렬 처리 설정
 MAX_WORKERS = 4
 
+# 청크 임베딩 병렬 설정 (SupabaseUploader)
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "100"))
+EMBEDDING_CONCURRENCY = int(os.getenv("EMBEDDING_CONCURRENCY", "4"))
+EMBEDDING_TEXTS_PER_MINUTE = int(os.getenv("EMBEDDING_TEXTS_PER_MINUTE", "3000"))  # 프로세스 전체 합산
+EMBEDDING_MAX_RETRIES = int(os.getenv("EMBEDDING_MAX_RETRIES", "6"))
+
+# 청크 일괄 삽입 (services/bulk_insert.py)
+# DB URL이 있으면 COPY 경로, 없으면 bulk_insert_document_chunks RPC (migrations/35)
+INGEST_DATABASE_URL = os.getenv("INGEST_DATABASE_URL") or os.getenv("DATABASE_URL")
+BULK_INSERT_CONCURRENCY = int(os.getenv("BULK_INSERT_CONCURRENCY", "4"))
+
+# 페이지 렌더링 설정 (Gemini Vision 입력 이미지)
+# PAGE_RENDER_PROCESSES=0 이면 프로세스 풀 없이 현재 프로세스에서 렌더링
+PAGE_RENDER_PROCESSES = int(os.getenv("PAGE_RENDER_PROCESSES", str(min(4, os.cpu_count() or 1))))
+PAGE_RENDER_DPI_DENSE = 200   # 표/도형이 많거나 글자가 빽빽한 페이지, 스캔 페이지
+PAGE_RENDER_DPI_DEFAULT = 170
+PAGE_RENDER_DPI_SPARSE = 130  # 글자가 적고 단순한 페이지
+PAGE_RENDER_JPEG_QUALITY = 88
+
+# 페이지 분류 (텍스트 레이어가 깨끗한 페이지는 Vision 없이 로컬 추출)
+PAGE_CLASSIFIER_ENABLED = os.getenv("PAGE_CLASSIFIER_ENABLED", "true").lower() not in ("0", "false", "no")
+PAGE_CLASSIFIER_MIN_TEXT_CHARS = 50         # 이보다 짧으면 스캔/그림 페이지 후보
+PAGE_CLASSIFIER_MIN_READABLE_RATIO = 0.9    # 한글/영문/숫자/문장부호 비율 (낮으면 깨진 폰트 인코딩)
+PAGE_CLASSIFIER_MAX_IMAGE_COVERAGE = 0.3    # 이미지가 페이지의 30% 이상이면 Vision
+PAGE_CLASSIFIER_MAX_TABLES = 2
+PAGE_CLASSIFIER_MAX_TABLE_COLUMNS = 10
+PAGE_CLASSIFIER_MAX_MERGED_CELL_RATIO = 0.05
+PAGE_CLASSIFIER_MAX_LOOSE_DRAWINGS = 150    # 표로 인식되지 않은 선/도형이 이만큼 많으면 Vision
+
 # 캐시 디렉토리 (backend/.cache)
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 CACHE_DIR = os.path.join(BASE_DIR, ".cache")
@@ -51,7 +80,21 @@ FILES_DIR = os.path.join(CACHE_DIR, "files")
 EMBEDDINGS_DIR = os.path.join(CACHE_DIR, "embeddings")
 TOC_SECTIONS_DIR = os.path.join(CACHE_DIR, "toc_sections")
 
+# PDF 수집 결과 디스크 캐시 (Vision 페이지 마크다운, 목차 파싱, 요약, 청크 임베딩)
+INGEST_CACHE_ENABLED = os.getenv("INGEST_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+PAGE_MARKDOWN_CACHE_DIR = os.path.join(FILES_DIR, "page_markdown")
+SUMMARY_CACHE_DIR = os.path.join(FILES_DIR, "summaries")
+# 캐시 디렉토리별 최대 크기 (넘으면 오래 안 쓴 파일부터 삭제, 0이면 무제한)
+EMBEDDINGS_CACHE_MAX_MB = int(os.getenv("EMBEDDINGS_CACHE_MAX_MB", "2048"))
+INGEST_CACHE_MAX_MB = int(os.getenv("INGEST_CACHE_MAX_MB", "512"))
+
+# 백그라운드 PDF 수집 작업 큐 (/api/upload/jobs)
+INGEST_JOBS_DIR = os.path.join(CACHE_DIR, "ingest_jobs")
+INGEST_JOBS_DB = os.getenv("INGEST_JOBS_DB", os.path.join(INGEST_JOBS_DIR, "jobs.sqlite3"))
+INGEST_JOB_WORKERS = int(os.getenv("INGEST_JOB_WORKERS", "2"))
+INGEST_JOBS_PER_SCHOOL = int(os.getenv("INGEST_JOBS_PER_SCHOOL", "1"))
+
 # 캐시 디렉토리 생성
-for dir_path in [CACHE_DIR, FILES_DIR, EMBEDDINGS_DIR, TOC_SECTIONS_DIR]:
+for dir_path in [CACHE_DIR, FILES_DIR, EMBEDDINGS_DIR, TOC_SECTIONS_DIR, INGEST_JOBS_DIR]:
     if not os.path.exists(dir_path):
         os.makedirs(dir_path, exist_ok=True)
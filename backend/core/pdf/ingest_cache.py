@@ -0,0 +1,42 @@
+"""
+PDF 수집(ingest) 결과 캐시
+backend/.cache 하위에 LLM 결과를 내용 주소 방식으로 저장하여
+같은/수정된 모집요강을 다시 올릴 때 바뀐 페이지만 Gemini를 호출하도록 함
+
+- Vision 페이지 마크다운: (페이지 이미지 해시, 프롬프트 버전, 모델)
+- 목차 파싱 결과: (목차 텍스트 해시, 프롬프트 버전, 모델)
+- 문서 요약: (요약 입력 텍스트 해시, 프롬프트 버전, 모델)
+- 청크 임베딩은 utils.embedding_cache가 config.EMBEDDINGS_DIR에 저장
+- 캐시별 최대 INGEST_CACHE_MAX_MB, 넘으면 오래 안 쓴 파일부터 삭제
+"""
+from typing import Union
+
+from config import embedding_settings as config
+from utils.disk_cache import DiskCache, content_hash
+
+
+page_markdown_cache = DiskCache(
+    config.PAGE_MARKDOWN_CACHE_DIR, ".md",
+    enabled=config.INGEST_CACHE_ENABLED,
+    max_bytes=config.INGEST_CACHE_MAX_MB * 1024 * 1024,
+)
+toc_parse_cache = DiskCache(
+    config.TOC_SECTIONS_DIR, ".json",
+    enabled=config.INGEST_CACHE_ENABLED,
+    max_bytes=config.INGEST_CACHE_MAX_MB * 1024 * 1024,
+)
+summary_cache = DiskCache(
+    config.SUMMARY_CACHE_DIR, ".txt",
+    enabled=config.INGEST_CACHE_ENABLED,
+    max_bytes=config.INGEST_CACHE_MAX_MB * 1024 * 1024,
+)
+
+
+def prompt_version(prompt: str) -> str:
+    """프롬프트 문자열 → 짧은 버전 해시 (프롬프트 수정 시 캐시 자동 무효화)"""
+    return content_hash(prompt)[:16]
+
+
+def make_cache_key(content: Union[bytes, str], prompt_ver: str, model: str) -> str:
+    """(내용 해시, 프롬프트 버전, 모델) 캐시 키"""
+    return f"{content_hash(content)}:{prompt_ver}:{model}"
@@ -0,0 +1,142 @@
+"""
+페이지 분류 모듈 (텍스트 레이어 우선)
+PyMuPDF로 페이지의 텍스트 레이어/표/선 밀도/이미지 비율을 확인하여
+- 텍스트 레이어가 깨끗한 페이지(일반 문단, 단순 표)는 로컬에서 마크다운으로 추출
+- 스캔 페이지, 병합 셀이 있는 복잡한 표, 도형/이미지 위주 페이지만 Gemini Vision으로 보냄
+"""
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+import fitz  # PyMuPDF
+from config import embedding_settings as config
+
+
+PAGE_KIND_TEXT = "text"
+PAGE_KIND_VISION = "vision"
+
+# 한글/영문/숫자/공백/일반 문장부호 외 문자가 많으면 폰트 인코딩이 깨진 텍스트 레이어로 판단
+_READABLE_CHAR = re.compile(r"[가-힣ㄱ-ㆎA-Za-z0-9\s.,:;!?()\[\]{}<>\-–—~·•※○●□■◆◇▶△▲/\\%&+=*#@'\"“”‘’_|^$￦₩]")
+_PAGE_NUMBER_LINE = re.compile(r"^\s*[-–]?\s*\d{1,4}\s*[-–]?\s*$")
+
+
+@dataclass
+class PageAnalysis:
+    kind: str
+    reason: str
+    markdown: Optional[str] = None
+
+
+def _readable_ratio(text: str) -> float:
+    if not text:
+        return 0.0
+    readable = len(_READABLE_CHAR.findall(text))
+    return readable / len(text)
+
+
+def _image_coverage(page: fitz.Page) -> float:
+    page_area = max(1.0, page.rect.width * page.rect.height)
+    image_area = 0.0
+    for info in page.get_image_info():
+        bbox = fitz.Rect(info.get("bbox", (0, 0, 0, 0))) & page.rect
+        image_area += bbox.width * bbox.height
+    return min(1.0, image_area / page_area)
+
+
+def _is_complex_table(table) -> bool:
+    """병합 셀(None 셀)이 있거나 매우 큰 표는 Vision으로 처리"""
+    rows = table.extract()
+    if not rows:
+        return True
+    cell_count = sum(len(row) for row in rows)
+    merged = sum(1 for row in rows for cell in row if cell is None)
+    if merged and merged / max(1, cell_count) > config.PAGE_CLASSIFIER_MAX_MERGED_CELL_RATIO:
+        return True
+    return table.col_count > config.PAGE_CLASSIFIER_MAX_TABLE_COLUMNS
+
+
+def _table_summary(table, page_number: int, index: int) -> str:
+    header = []
+    try:
+        header = [name for name in (table.header.names or []) if name and not name.startswith("Col")]
+    except Exception:
+        pass
+    columns = ", ".join(h.replace("\n", " ").strip() for h in header[:6])
+    summary = f"{page_number}페이지 표 {index + 1}"
+    if columns:
+        summary += f" (항목: {columns})"
+    return summary
+
+
+def _extract_markdown(page: fitz.Page, tables: List, page_number: int) -> str:
+    """텍스트 블록 + 표(마크다운)를 읽기 순서대로 합쳐 Vision 출력과 같은 형식으로 반환"""
+    table_rects = [fitz.Rect(table.bbox) for table in tables]
+    margin = page.rect.height * 0.05
+    items = []
+
+    for x0, y0, x1, y1, text, _block_no, block_type in page.get_text("blocks", sort=True):
+        if block_type != 0:
+            continue
+        rect = fitz.Rect(x0, y0, x1, y1)
+        if any(rect.intersects(table_rect) for table_rect in table_rects):
+            continue
+        text = text.strip()
+        if not text:
+            continue
+        # 머리말/꼬리말 영역의 쪽번호 제거
+        if (y1 < margin or y0 > page.rect.height - margin) and _PAGE_NUMBER_LINE.match(text):
+            continue
+        items.append((y0, x0, text))
+
+    for index, table in enumerate(tables):
+        table_md = table.to_markdown(clean=True).strip()
+        if not table_md:
+            continue
+        summary = _table_summary(table, page_number, index)
+        items.append((table.bbox[1], table.bbox[0], f"<table_summary>{summary}</table_summary>\n{table_md}"))
+
+    items.sort(key=lambda item: (round(item[0], 1), item[1]))
+    return "\n\n".join(item[2] for item in items).strip()
+
+
+def classify_page(page: fitz.Page) -> PageAnalysis:
+    """페이지를 분석하여 로컬 추출(text) 또는 Vision 처리(vision) 결정"""
+    if not config.PAGE_CLASSIFIER_ENABLED:
+        return PageAnalysis(PAGE_KIND_VISION, "classifier disabled")
+
+    try:
+        text = page.get_text("text").strip()
+        text_len = len(text)
+        image_coverage = _image_coverage(page)
+        drawing_count = len(page.get_drawings())
+    except Exception as e:
+        return PageAnalysis(PAGE_KIND_VISION, f"analysis error: {e}")
+
+    if text_len < config.PAGE_CLASSIFIER_MIN_TEXT_CHARS:
+        if image_coverage > 0.15 or drawing_count > 0:
+            return PageAnalysis(PAGE_KIND_VISION, "scanned or graphic page")
+        return PageAnalysis(PAGE_KIND_TEXT, "blank page", markdown=text)
+
+    if "�" in text or _readable_ratio(text) < config.PAGE_CLASSIFIER_MIN_READABLE_RATIO:
+        return PageAnalysis(PAGE_KIND_VISION, "broken text layer")
+
+    if image_coverage > config.PAGE_CLASSIFIER_MAX_IMAGE_COVERAGE:
+        return PageAnalysis(PAGE_KIND_VISION, f"image coverage {image_coverage:.2f}")
+
+    try:
+        tables = list(page.find_tables().tables) if drawing_count else []
+    except Exception as e:
+        return PageAnalysis(PAGE_KIND_VISION, f"table detection error: {e}")
+
+    if len(tables) > config.PAGE_CLASSIFIER_MAX_TABLES:
+        return PageAnalysis(PAGE_KIND_VISION, f"{len(tables)} tables")
+    if any(_is_complex_table(table) for table in tables):
+        return PageAnalysis(PAGE_KIND_VISION, "complex table")
+    # 선이 많은데 표로 인식되지 않은 경우 (도식, 선 없는 표 등)
+    if not tables and drawing_count >= config.PAGE_CLASSIFIER_MAX_LOOSE_DRAWINGS:
+        return PageAnalysis(PAGE_KIND_VISION, f"{drawing_count} drawings without table")
+
+    markdown = _extract_markdown(page, tables, page.number + 1)
+    if len(markdown) < config.PAGE_CLASSIFIER_MIN_TEXT_CHARS:
+        return PageAnalysis(PAGE_KIND_VISION, "local extraction too short")
+    return PageAnalysis(PAGE_KIND_TEXT, f"text layer ({len(tables)} simple tables)", markdown=markdown)
@@ -0,0 +1,211 @@
+"""
+PDF 페이지 렌더링 모듈
+Gemini Vision 입력용 페이지 이미지를 프로세스 풀에서 렌더링 (GIL 우회)
+
+- 워커 프로세스마다 PDF를 한 번만 열어 재사용 (페이지마다 fitz.open 하지 않음)
+- 페이지 내용 밀도(텍스트 양, 도형/선 개수, 이미지 비율)로 DPI를 선택
+- PIL 이미지 대신 압축된 JPEG 바이트를 반환
+- iter_prepare: 페이지 분류(page_classifier)까지 워커에서 수행하여 Vision이 필요한 페이지만 렌더링
+"""
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+from config import embedding_settings as config
+from .page_classifier import PAGE_KIND_TEXT, PAGE_KIND_VISION, classify_page
+
+
+# 워커 프로세스 내부에서 열어 둔 PDF 문서 (경로+수정시각 기준, 최대 개수 제한)
+_WORKER_DOC_LIMIT = 4
+_worker_docs: "OrderedDict[Tuple[str, int, int], fitz.Document]" = OrderedDict()
+
+
+def _doc_key(pdf_path: str) -> Tuple[str, int, int]:
+    stat = os.stat(pdf_path)
+    return (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _get_worker_doc(pdf_path: str) -> fitz.Document:
+    """현재 프로세스에서 PDF를 한 번만 열고 재사용"""
+    key = _doc_key(pdf_path)
+    doc = _worker_docs.get(key)
+    if doc is not None:
+        _worker_docs.move_to_end(key)
+        return doc
+    doc = fitz.open(pdf_path)
+    _worker_docs[key] = doc
+    while len(_worker_docs) > _WORKER_DOC_LIMIT:
+        _, old_doc = _worker_docs.popitem(last=False)
+        try:
+            old_doc.close()
+        except Exception:
+            pass
+    return doc
+
+
+def choose_page_dpi(page: fitz.Page) -> int:
+    """페이지 내용 밀도에 따라 렌더링 DPI 선택"""
+    try:
+        text_len = len(page.get_text("text").strip())
+        drawing_count = len(page.get_drawings())
+        page_area = max(1.0, page.rect.width * page.rect.height)
+        image_area = 0.0
+        for info in page.get_image_info():
+            bbox = fitz.Rect(info.get("bbox", (0, 0, 0, 0)))
+            image_area += bbox.width * bbox.height
+        image_coverage = image_area / page_area
+    except Exception:
+        return config.PAGE_RENDER_DPI_DEFAULT
+
+    # 스캔 페이지(텍스트 레이어 없음 + 이미지가 대부분)는 OCR 품질 우선
+    if text_len < 50 and image_coverage > 0.5:
+        return config.PAGE_RENDER_DPI_DENSE
+    # 표(선)가 많거나 글자가 빽빽한 페이지
+    if drawing_count >= 150 or text_len >= 2500:
+        return config.PAGE_RENDER_DPI_DENSE
+    # 글자가 적고 단순한 페이지
+    if text_len < 800 and drawing_count < 30:
+        return config.PAGE_RENDER_DPI_SPARSE
+    return config.PAGE_RENDER_DPI_DEFAULT
+
+
+def render_page_bytes(doc: fitz.Document, page_num: int, dpi: Optional[int] = None) -> Optional[bytes]:
+    """열린 문서의 특정 페이지를 JPEG 바이트로 렌더링"""
+    if page_num < 0 or page_num >= len(doc):
+        return None
+    page = doc[page_num]
+    dpi = dpi or choose_page_dpi(page)
+    zoom = dpi / 72.0
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    return pix.tobytes(output="jpeg", jpg_quality=config.PAGE_RENDER_JPEG_QUALITY)
+
+
+def _render_task(doc: fitz.Document, page_num: int) -> Optional[bytes]:
+    return render_page_bytes(doc, page_num)
+
+
+def _prepare_task(doc: fitz.Document, page_num: int) -> Optional[Tuple[str, Any]]:
+    """
+    텍스트 레이어 우선 준비: 로컬 추출 가능하면 (text, 마크다운),
+    아니면 (vision, JPEG 바이트)
+    """
+    if page_num < 0 or page_num >= len(doc):
+        return None
+    analysis = classify_page(doc[page_num])
+    if analysis.kind == PAGE_KIND_TEXT:
+        return PAGE_KIND_TEXT, analysis.markdown or ""
+    return PAGE_KIND_VISION, render_page_bytes(doc, page_num)
+
+
+def _page_worker(task: Callable, pdf_path: str, page_num: int) -> Tuple[int, Any]:
+    """프로세스 풀 워커 진입점"""
+    doc = _get_worker_doc(pdf_path)
+    return page_num, task(doc, page_num)
+
+
+class PageRenderer:
+    """프로세스 풀 기반 페이지 렌더러 (프로세스 전역 싱글톤으로 사용)"""
+
+    def __init__(self, max_processes: int = None):
+        self.max_processes = config.PAGE_RENDER_PROCESSES if max_processes is None else max_processes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # 현재 프로세스에서 렌더링할 때 fitz 문서 동시 접근 방지 (fitz 객체는 스레드 안전하지 않음)
+        self._local_lock = threading.Lock()
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.max_processes <= 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                # fork는 스레드가 많은 서버 프로세스에서 안전하지 않으므로 spawn 사용
+                ctx = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=self.max_processes, mp_context=ctx)
+            return self._executor
+
+    def _reset_executor(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _run_local(self, task: Callable, pdf_path: str, page_nums: List[int]) -> Iterator[Tuple[int, Any]]:
+        with self._local_lock:
+            doc = _get_worker_doc(pdf_path)
+            rendered = []
+            for page_num in page_nums:
+                try:
+                    rendered.append((page_num, task(doc, page_num)))
+                except Exception as e:
+                    print(f"   ⚠️  페이지 {page_num + 1} 이미지 변환 중 오류: {e}")
+                    rendered.append((page_num, None))
+        yield from rendered
+
+    def render_page(self, pdf_path: str, page_num: int) -> Optional[bytes]:
+        """단일 페이지 렌더링 (0-based)"""
+        for _, data in self.iter_render(pdf_path, [page_num]):
+            return data
+        return None
+
+    def iter_render(self, pdf_path: str, page_nums: List[int]) -> Iterator[Tuple[int, Optional[bytes]]]:
+        """
+        페이지들을 병렬 렌더링하여 완료되는 순서대로 (page_num, jpeg_bytes) 반환 (0-based)
+        """
+        yield from self._iter_pool(_render_task, pdf_path, page_nums)
+
+    def iter_prepare(self, pdf_path: str, page_nums: List[int]) -> Iterator[Tuple[int, Optional[Tuple[str, Any]]]]:
+        """
+        페이지 분류 + 필요한 페이지만 렌더링하여 완료 순서대로
+        (page_num, ("text", markdown) | ("vision", jpeg_bytes) | None) 반환 (0-based)
+        """
+        yield from self._iter_pool(_prepare_task, pdf_path, page_nums)
+
+    def _iter_pool(self, task: Callable, pdf_path: str, page_nums: List[int]) -> Iterator[Tuple[int, Any]]:
+        executor = self._get_executor()
+        if executor is None:
+            yield from self._run_local(task, pdf_path, page_nums)
+            return
+
+        try:
+            futures: Dict[Future, int] = {
+                executor.submit(_page_worker, task, pdf_path, page_num): page_num
+                for page_num in page_nums
+            }
+        except (BrokenProcessPool, RuntimeError, OSError) as e:
+            print(f"   ⚠️  렌더링 프로세스 풀 사용 불가, 현재 프로세스에서 렌더링: {e}")
+            self._reset_executor()
+            yield from self._run_local(task, pdf_path, page_nums)
+            return
+
+        failed: List[int] = []
+        for future in as_completed(futures):
+            page_num = futures[future]
+            try:
+                yield future.result()
+            except BrokenProcessPool:
+                failed.append(page_num)
+            except Exception as e:
+                print(f"   ⚠️  페이지 {page_num + 1} 이미지 변환 중 오류: {e}")
+                yield page_num, None
+
+        if failed:
+            print(f"   ⚠️  렌더링 프로세스 풀 중단, {len(failed)}개 페이지 현재 프로세스에서 재시도")
+            self._reset_executor()
+            yield from self._run_local(task, pdf_path, sorted(failed))
+
+
+_renderer: Optional[PageRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_page_renderer() -> PageRenderer:
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = PageRenderer()
+        return _renderer
@@ -0,0 +1,66 @@
+"""
+파싱된 PDF 문서 공유 모듈
+업로드 1건 처리 중 목차 감지/파싱, 요약, 섹션 전처리가 같은 PDF를 매번 다시 파싱하지 않도록
+(경로, 수정시각, 크기) 기준으로 PdfReader와 페이지 텍스트를 한 번만 만들어 공유
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from PyPDF2 import PdfReader
+
+
+_DOCUMENT_LIMIT = 4
+
+
+class PdfDocument:
+    """한 번 파싱한 PDF (페이지 텍스트는 처음 요청 시 추출 후 재사용)"""
+
+    def __init__(self, pdf_path: str):
+        self.pdf_path = pdf_path
+        self.reader = PdfReader(pdf_path)
+        self.page_count = len(self.reader.pages)
+        self._texts: Dict[int, str] = {}
+        # PyPDF2 reader는 스트림을 공유하므로 스레드 간 동시 접근 방지
+        self._lock = threading.Lock()
+
+    def page_text(self, page_num: int) -> str:
+        """페이지 텍스트 (0-based)"""
+        with self._lock:
+            text = self._texts.get(page_num)
+            if text is None:
+                text = self.reader.pages[page_num].extract_text() or ""
+                self._texts[page_num] = text
+            return text
+
+    def clamp_range(self, start_page: int, end_page: int) -> Tuple[int, int]:
+        """1-based 페이지 범위를 문서 범위 안으로 보정 (start > end면 빈 범위 그대로)"""
+        start = max(1, min(start_page, self.page_count))
+        end = min(end_page, self.page_count)
+        return start, end
+
+
+_documents: "OrderedDict[Tuple[str, int, int], PdfDocument]" = OrderedDict()
+_documents_lock = threading.Lock()
+
+
+def open_pdf_document(pdf_path: str) -> PdfDocument:
+    """같은 파일이면 이미 파싱한 PdfDocument 반환"""
+    stat = os.stat(pdf_path)
+    key = (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+    with _documents_lock:
+        document = _documents.get(key)
+        if document is not None:
+            _documents.move_to_end(key)
+            return document
+
+    document = PdfDocument(pdf_path)
+    with _documents_lock:
+        existing = _documents.get(key)
+        if existing is not None:
+            return existing
+        _documents[key] = document
+        while len(_documents) > _DOCUMENT_LIMIT:
+            _documents.popitem(last=False)
+    return document
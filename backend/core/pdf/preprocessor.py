@@ -1,11 +1,10 @@
 """
 섹션 전처리 모듈
-Gemini Vision 기반 PDF 섹션 전처리 및 벡터스토어 생성
+Gemini Vision 기반 PDF 섹션 전처리 (마크다운 변환 + 청킹)
+임베딩은 업로드 단계(SupabaseUploader)에서 청크당 한 번만 생성
 """
-from PyPDF2 import PdfReader, PdfWriter
 from langchain_core.documents import Document
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
-from langchain_community.vectorstores import FAISS
+from .pdf_document import open_pdf_document
 from .vision_processor import VisionProcessor
 from .chunker import DocumentChunker
 from config import embedding_settings as config
@@ -25,34 +24,19 @@ class SectionPreprocessor:
         self.vision_processor = VisionProcessor(model_name)
         self.chunker = DocumentChunker()
 
-    def extract_pdf_section(self, pdf_path: str, start_page: int, end_page: int) -> str:
-        """PDF에서 특정 페이지 범위만 추출하여 임시 파일로 저장"""
-        reader = PdfReader(pdf_path)
-        writer = PdfWriter()
-
-        for page_num in range(start_page - 1, min(end_page, len(reader.pages))):
-            writer.add_page(reader.pages[page_num])
-
-        temp_path = f"{config.TOC_SECTIONS_DIR}/section_{start_page}_{end_page}.pdf"
-        with open(temp_path, "wb") as output_file:
-            writer.write(output_file)
-
-        return temp_path
-
     def preprocess_section(self, section: dict, pdf_path: str) -> dict:
         """
-        섹션을 전처리하여 벡터스토어 생성
+        섹션을 전처리하여 청크 문서 목록 생성
         """
+        # 섹션 PDF를 따로 쓰지 않고, 이미 파싱된 원본 문서의 페이지 범위만 사용
         try:
-            self.extract_pdf_section(
-                pdf_path,
+            start_page, end_page = open_pdf_document(pdf_path).clamp_range(
                 section.get("start_page", 1),
                 section.get("end_page", 1)
             )
         except Exception as e:
-            print(f"   ⚠️  섹션 추출 중 오류: {e}")
+            print(f"   ⚠️  섹션 범위 확인 중 오류: {e}")
             return {
-                "vectorstore": None,
                 "documents": [],
                 "table_count": 0
             }
@@ -61,14 +45,13 @@ class SectionPreprocessor:
             print(f"\n📄 [{section.get('title', '알 수 없음')}] Gemini Vision으로 마크다운 변환 시작...")
             markdown_results = self.vision_processor.convert_section_to_markdown(
                 pdf_path,
-                section.get('start_page', 1),
-                section.get('end_page', 1)
+                start_page,
+                end_page
             )
 
             if not markdown_results:
                 print(f"   ⚠️  마크다운 변환 결과가 없습니다.")
                 return {
-                    "vectorstore": None,
                     "documents": [],
                     "table_count": 0
                 }
@@ -79,7 +62,6 @@ class SectionPreprocessor:
             import traceback
             print(f"   상세 오류:\n{traceback.format_exc()}")
             return {
-                "vectorstore": None,
                 "documents": [],
                 "table_count": 0
             }
@@ -124,26 +106,7 @@ class SectionPreprocessor:
                 except Exception:
                     pass
 
-        try:
-            if not split_docs:
-                print(f"   ⚠️  처리할 문서가 없습니다.")
-                embeddings = GoogleGenerativeAIEmbeddings(model=config.DEFAULT_EMBEDDING_MODEL)
-                empty_doc = Document(page_content="", metadata={})
-                vectorstore = FAISS.from_documents(documents=[empty_doc], embedding=embeddings)
-            else:
-                embeddings = GoogleGenerativeAIEmbeddings(model=config.DEFAULT_EMBEDDING_MODEL)
-                vectorstore = FAISS.from_documents(documents=split_docs, embedding=embeddings)
-        except Exception as e:
-            print(f"   ⚠️  벡터스토어 생성 중 오류: {e}")
-            try:
-                embeddings = GoogleGenerativeAIEmbeddings(model=config.DEFAULT_EMBEDDING_MODEL)
-                empty_doc = Document(page_content="", metadata={})
-                vectorstore = FAISS.from_documents(documents=[empty_doc], embedding=embeddings)
-            except Exception:
-                vectorstore = None
-
         return {
-            "vectorstore": vectorstore,
             "documents": split_docs if split_docs else [],
             "table_count": table_count
         }
@@ -6,14 +6,90 @@ import re
 import json
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from PyPDF2 import PdfReader
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from config import embedding_settings as config
+from .pdf_document import open_pdf_document
+from .ingest_cache import make_cache_key, prompt_version, summary_cache, toc_parse_cache
 
 logger = logging.getLogger(__name__)
 
+TOC_PARSING_MODEL = "gemini-2.5-flash-lite"
+
+TOC_PARSE_PROMPT = """
+# 임무
+
+제공된 텍스트는 대학 입시 모집요강의 초반 페이지(1~10페이지 내외)이다.
+
+이 텍스트에서 '목차', '차례', 'Contents', '전형 요약' 등의 목록을 찾아 섹션 정보를 추출하라.
+
+# 추출 규칙 (매우 중요)
+
+1. **섹션명(Title)**: 목차에 적힌 정확한 섹션 이름을 추출하라.
+
+2. **시작 페이지(Start Page)**: 해당 섹션이 시작되는 페이지 번호를 정수로 추출하라.
+
+3. **종료 페이지(End Page) 추론**: 
+
+   - 현재 섹션의 종료 페이지는 **(다음 섹션의 시작 페이지 - 1)**로 계산하라.
+
+   - 마지막 섹션의 경우, 문서의 끝이라고 판단되면 적절한 큰 숫자(예: 999) 혹은 문맥상 파악되는 마지막 페이지를 입력하라.
+
+4. **노이즈 제거**: 목차와 관련 없는 헤더, 푸터, 인사말 등은 무시하라.
+
+5. **계층 구조 평탄화**: 대분류, 소분류가 섞여 있어도 가능한 평탄한 리스트(Flat List)로 반환하되, '학생부종합전형' 같은 주요 전형 구분은 반드시 별도 섹션으로 분리되어야 한다.
+
+# 예외 처리
+
+- 목차에 페이지 번호가 명시되지 않은 경우, 바로 앞 섹션의 페이지 범위를 참고하거나 문맥을 통해 추정하라.
+
+- 만약 명확한 목차 패턴을 찾을 수 없다면 빈 리스트 `[]`를 반환하라.
+
+# 출력 형식 (Strict JSON)
+
+반드시 아래 JSON 포맷으로만 출력하고, 마크다운(```json) 태그나 부가 설명은 포함하지 마라.
+
+[
+  {{
+    "section_name": "전형 일정",
+    "start_page": 3,
+    "end_page": 4
+  }},
+  {{
+    "section_name": "모집 단위 및 인원",
+    "start_page": 5,
+    "end_page": 7
+  }},
+  {{
+    "section_name": "학생부교과(지역균형전형)",
+    "start_page": 8,
+    "end_page": 12
+  }}
+]
+
+**목차 텍스트:**
+{toc_text}
+
+**JSON (마크다운 없이 순수 JSON만):**
+"""
+TOC_PARSE_PROMPT_VERSION = prompt_version(TOC_PARSE_PROMPT)
+
+SUMMARY_PROMPT = """
+다음 문서를 읽고, 문서 구조를 파악하기 위한 **요약본(목차 스타일)**을 생성하세요.
+
+**문서 내용:**
+{document_text}
+
+**요약 규칙:**
+1. 중요한 섹션만 간결하게 나열
+2. 불릿 포인트 사용
+3. 각 항목은 문서 내 주요 주제/전형명/정책명 중심
+4. 최대 500자 내외
+
+**요약 결과:**"""
+SUMMARY_PROMPT_VERSION = prompt_version(SUMMARY_PROMPT)
+
 
 class TOCProcessor:
     """목차 감지 및 파싱을 담당하는 클래스"""
@@ -32,8 +108,8 @@ class TOCProcessor:
         """
         PDF의 처음 몇 페이지에서 목차 페이지를 찾는 메서드 (Gemini LLM 사용)
         """
-        reader = PdfReader(pdf_path)
-        total_pages = len(reader.pages)
+        document = open_pdf_document(pdf_path)
+        total_pages = document.page_count
 
         # 20페이지 이상이면 처음 10페이지만 확인
         if total_pages >= 20:
@@ -46,8 +122,7 @@ class TOCProcessor:
         # 페이지별 텍스트 추출 (병렬 처리 전에 미리 추출)
         page_data = []
         for page_num in range(pages_to_check):
-            page = reader.pages[page_num]
-            page_text = page.extract_text()
+            page_text = document.page_text(page_num)
 
             # 빈 페이지는 건너뛰기
             if not page_text or not page_text.strip():
@@ -132,73 +207,22 @@ class TOCProcessor:
         """
         목차 페이지를 LLM으로 분석하여 섹션 구조를 추출하는 메서드
         """
-        reader = PdfReader(pdf_path)
+        document = open_pdf_document(pdf_path)
 
         # 목차 페이지 텍스트 추출
         toc_text = ""
         for page_num in toc_pages:
-            page = reader.pages[page_num]
             toc_text += f"\n--- 페이지 {page_num + 1} ---\n"
-            toc_text += page.extract_text()
-
-        parse_prompt = ChatPromptTemplate.from_template("""
-# 임무
-
-제공된 텍스트는 대학 입시 모집요강의 초반 페이지(1~10페이지 내외)이다.
-
-이 텍스트에서 '목차', '차례', 'Contents', '전형 요약' 등의 목록을 찾아 섹션 정보를 추출하라.
-
-# 추출 규칙 (매우 중요)
-
-1. **섹션명(Title)**: 목차에 적힌 정확한 섹션 이름을 추출하라.
-
-2. **시작 페이지(Start Page)**: 해당 섹션이 시작되는 페이지 번호를 정수로 추출하라.
-
-3. **종료 페이지(End Page) 추론**: 
-
-   - 현재 섹션의 종료 페이지는 **(다음 섹션의 시작 페이지 - 1)**로 계산하라.
+            toc_text += document.page_text(page_num)
 
-   - 마지막 섹션의 경우, 문서의 끝이라고 판단되면 적절한 큰 숫자(예: 999) 혹은 문맥상 파악되는 마지막 페이지를 입력하라.
-
-4. **노이즈 제거**: 목차와 관련 없는 헤더, 푸터, 인사말 등은 무시하라.
-
-5. **계층 구조 평탄화**: 대분류, 소분류가 섞여 있어도 가능한 평탄한 리스트(Flat List)로 반환하되, '학생부종합전형' 같은 주요 전형 구분은 반드시 별도 섹션으로 분리되어야 한다.
-
-# 예외 처리
-
-- 목차에 페이지 번호가 명시되지 않은 경우, 바로 앞 섹션의 페이지 범위를 참고하거나 문맥을 통해 추정하라.
+        toc_parsing_model = TOC_PARSING_MODEL
+        cache_key = make_cache_key(toc_text, TOC_PARSE_PROMPT_VERSION, toc_parsing_model)
+        cached_sections = toc_parse_cache.get_json(cache_key)
+        if cached_sections:
+            print("   ♻️ 목차 파싱 캐시 사용")
+            return [dict(section) for section in cached_sections]
 
-- 만약 명확한 목차 패턴을 찾을 수 없다면 빈 리스트 `[]`를 반환하라.
-
-# 출력 형식 (Strict JSON)
-
-반드시 아래 JSON 포맷으로만 출력하고, 마크다운(```json) 태그나 부가 설명은 포함하지 마라.
-
-[
-  {{
-    "section_name": "전형 일정",
-    "start_page": 3,
-    "end_page": 4
-  }},
-  {{
-    "section_name": "모집 단위 및 인원",
-    "start_page": 5,
-    "end_page": 7
-  }},
-  {{
-    "section_name": "학생부교과(지역균형전형)",
-    "start_page": 8,
-    "end_page": 12
-  }}
-]
-
-**목차 텍스트:**
-{toc_text}
-
-**JSON (마크다운 없이 순수 JSON만):**
-""")
-
-        toc_parsing_model = "gemini-2.5-flash-lite"
+        parse_prompt = ChatPromptTemplate.from_template(TOC_PARSE_PROMPT)
         llm = ChatGoogleGenerativeAI(model=toc_parsing_model, temperature=0)
         chain = parse_prompt | llm | StrOutputParser()
 
@@ -222,6 +246,7 @@ class TOCProcessor:
                             "end_page": section.get("end_page", 999)
                         }
                         formatted_sections.append(formatted_section)
+                    toc_parse_cache.set_json(cache_key, formatted_sections)
                     return formatted_sections
             except json.JSONDecodeError as e:
                 logger.warning("JSON 파싱 오류: %s", str(e))
@@ -231,8 +256,8 @@ class TOCProcessor:
 
     def create_default_sections(self, pdf_path: str) -> list:
         """목차를 찾지 못했을 때 페이지 수 기반으로 기본 섹션 생성"""
-        reader = PdfReader(pdf_path)
-        total_pages = len(reader.pages)
+        document = open_pdf_document(pdf_path)
+        total_pages = document.page_count
         sections_per_part = max(1, total_pages // 4)
 
         sections = []
@@ -249,8 +274,8 @@ class TOCProcessor:
 
     def validate_and_fix_sections(self, sections: list, pdf_path: str) -> list:
         """섹션의 페이지 범위를 검증하고 수정"""
-        reader = PdfReader(pdf_path)
-        total_pages = len(reader.pages)
+        document = open_pdf_document(pdf_path)
+        total_pages = document.page_count
 
         for i, section in enumerate(sections):
             section["start_page"] = max(1, min(section.get("start_page", 1), total_pages))
@@ -270,8 +295,8 @@ class TOCProcessor:
 
     def generate_document_summary(self, pdf_path: str, max_pages: int = None) -> str:
         """PDF 문서의 요약본 생성 (목차 파싱 전에 실행). 실패 시 빈 문자열 반환."""
-        reader = PdfReader(pdf_path)
-        total_pages = len(reader.pages)
+        document = open_pdf_document(pdf_path)
+        total_pages = document.page_count
 
         if max_pages is None:
             pages_to_extract = min(total_pages, self.MAX_PAGES_FOR_SUMMARY)
@@ -286,8 +311,7 @@ class TOCProcessor:
         document_text = ""
 
         for page_num in range(pages_to_extract):
-            page = reader.pages[page_num]
-            page_text = page.extract_text()
+            page_text = document.page_text(page_num)
             if page_text and page_text.strip():
                 document_text += f"\n--- 페이지 {page_num + 1} ---\n"
                 document_text += page_text
@@ -306,26 +330,23 @@ class TOCProcessor:
             logger.warning("요약 생성: 추출된 텍스트가 없습니다 (이미지 전용 PDF일 수 있음).")
             return ""
 
-        prompt = ChatPromptTemplate.from_template("""
-다음 문서를 읽고, 문서 구조를 파악하기 위한 **요약본(목차 스타일)**을 생성하세요.
-
-**문서 내용:**
-{document_text}
-
-**요약 규칙:**
-1. 중요한 섹션만 간결하게 나열
-2. 불릿 포인트 사용
-3. 각 항목은 문서 내 주요 주제/전형명/정책명 중심
-4. 최대 500자 내외
+        cache_key = make_cache_key(document_text, SUMMARY_PROMPT_VERSION, self.model_name)
+        cached_summary = summary_cache.get_text(cache_key)
+        if cached_summary:
+            print("   ♻️ 문서 요약 캐시 사용")
+            return cached_summary
 
-**요약 결과:**""")
+        prompt = ChatPromptTemplate.from_template(SUMMARY_PROMPT)
 
         llm = ChatGoogleGenerativeAI(model=self.model_name, temperature=0)
         chain = prompt | llm | StrOutputParser()
 
         try:
             summary = chain.invoke({"document_text": document_text})
-            return summary.strip() if summary else ""
+            summary = summary.strip() if summary else ""
+            if summary:
+                summary_cache.set_text(cache_key, summary)
+            return summary
         except Exception as e:
             logger.warning("문서 요약 생성 중 오류 (계속 진행): %s", str(e))
             print(f"   ⚠️  문서 요약 생성 중 오류: {e}")
@@ -335,8 +356,8 @@ class TOCProcessor:
         """
         목차가 없을 때 요약 기반으로 섹션을 추론하는 메서드
         """
-        reader = PdfReader(pdf_path)
-        total_pages = len(reader.pages)
+        document = open_pdf_document(pdf_path)
+        total_pages = document.page_count
 
         prompt = ChatPromptTemplate.from_template("""
 다음은 문서 요약본입니다. 요약 내용을 기반으로 섹션 구조를 추론하여 JSON으로 반환하세요.
@@ -6,10 +6,23 @@ import os
 import time
 from typing import Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import fitz  # PyMuPDF
-from PIL import Image
 import google.generativeai as genai
 from config import embedding_settings as config
+from .page_renderer import get_page_renderer
+from .page_classifier import PAGE_KIND_TEXT
+from .ingest_cache import make_cache_key, page_markdown_cache, prompt_version
+
+
+VISION_MARKDOWN_PROMPT = """너는 입시 모집요강 문서를 디지털화하는 전문가다. 이미지를 분석하여 완벽한 Markdown 포맷으로 변환하라.
+
+[규칙]
+1. 문서의 헤더(#), 리스트(-), 강조(**) 등 레이아웃 구조를 Markdown 문법으로 정확히 표현하라.
+2. 표(Table)는 반드시 Markdown Table 문법으로 변환하라. 선이 없는 표라도 내용이 표 형식이면 표로 변환하라.
+3. **[핵심]** 모든 표의 바로 윗줄에는 반드시 `<table_summary>표의 요약 설명</table_summary>` 태그를 삽입하라. 
+   (예: <table_summary>2026학년도 수시모집 간호학과 모집인원 표입니다.</table_summary>)
+4. 머리말, 꼬리말, 페이지 번호는 내용에서 제외하라.
+5. 표가 아닌 일반 텍스트는 줄바꿈을 정리하여 자연스럽게 이어지도록 하라."""
+VISION_PROMPT_VERSION = prompt_version(VISION_MARKDOWN_PROMPT)
 
 
 class VisionProcessor:
@@ -32,51 +45,49 @@ class VisionProcessor:
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel(self.model_name)
 
-    def convert_page_to_image(self, pdf_path: str, page_num: int, dpi: int = 200) -> Optional[Image.Image]:
-        """PDF의 특정 페이지를 고화질 이미지로 변환"""
+    def convert_page_to_image(self, pdf_path: str, page_num: int) -> Optional[bytes]:
+        """PDF의 특정 페이지를 압축 이미지(JPEG 바이트)로 변환 (DPI는 페이지 밀도에 따라 자동 선택)"""
         try:
-            doc = fitz.open(pdf_path)
-            if page_num < 0 or page_num >= len(doc):
+            if page_num < 0:
                 print(f"   ⚠️  페이지 번호 {page_num}가 유효 범위를 벗어났습니다.")
-                doc.close()
                 return None
-
-            page = doc[page_num]
-
-            zoom = dpi / 72.0
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-
-            doc.close()
-            return img
+            image_bytes = get_page_renderer().render_page(pdf_path, page_num)
+            if image_bytes is None:
+                print(f"   ⚠️  페이지 번호 {page_num}가 유효 범위를 벗어났습니다.")
+            return image_bytes
         except Exception as e:
             print(f"   ⚠️  페이지 {page_num + 1} 이미지 변환 중 오류: {e}")
             return None
 
-    def convert_page_to_markdown(self, pdf_path: str, page_num: int, max_retries: int = 3) -> Optional[str]:
-        """PDF의 특정 페이지를 Gemini Vision으로 마크다운으로 변환"""
-        img = self.convert_page_to_image(pdf_path, page_num)
-        if img is None:
+    def convert_page_to_markdown(
+        self,
+        pdf_path: str,
+        page_num: int,
+        max_retries: int = 3,
+        image_bytes: Optional[bytes] = None,
+    ) -> Optional[str]:
+        """
+        PDF의 특정 페이지를 Gemini Vision으로 마크다운으로 변환 (이미 렌더링된 이미지가 있으면 재사용)
+        같은 페이지 이미지 + 프롬프트 + 모델 결과가 디스크 캐시에 있으면 Gemini를 호출하지 않음
+        """
+        if image_bytes is None:
+            image_bytes = self.convert_page_to_image(pdf_path, page_num)
+        if image_bytes is None:
             return None
+        img = {"mime_type": "image/jpeg", "data": image_bytes}
 
-        system_prompt = """너는 입시 모집요강 문서를 디지털화하는 전문가다. 이미지를 분석하여 완벽한 Markdown 포맷으로 변환하라.
-
-[규칙]
-1. 문서의 헤더(#), 리스트(-), 강조(**) 등 레이아웃 구조를 Markdown 문법으로 정확히 표현하라.
-2. 표(Table)는 반드시 Markdown Table 문법으로 변환하라. 선이 없는 표라도 내용이 표 형식이면 표로 변환하라.
-3. **[핵심]** 모든 표의 바로 윗줄에는 반드시 `<table_summary>표의 요약 설명</table_summary>` 태그를 삽입하라. 
-   (예: <table_summary>2026학년도 수시모집 간호학과 모집인원 표입니다.</table_summary>)
-4. 머리말, 꼬리말, 페이지 번호는 내용에서 제외하라.
-5. 표가 아닌 일반 텍스트는 줄바꿈을 정리하여 자연스럽게 이어지도록 하라."""
+        cache_key = make_cache_key(image_bytes, VISION_PROMPT_VERSION, self.model_name)
+        cached = page_markdown_cache.get_text(cache_key)
+        if cached:
+            return cached
 
         for attempt in range(max_retries):
             try:
-                response = self.model.generate_content([system_prompt, img])
+                response = self.model.generate_content([VISION_MARKDOWN_PROMPT, img])
 
                 if response and response.text:
                     markdown_text = response.text.strip()
+                    page_markdown_cache.set_text(cache_key, markdown_text)
                     return markdown_text
                 print(f"   ⚠️  페이지 {page_num + 1} 변환 결과가 비어있습니다.")
                 if attempt < max_retries - 1:
@@ -93,17 +104,34 @@ class VisionProcessor:
         return None
 
     def convert_section_to_markdown(self, pdf_path: str, start_page: int, end_page: int, max_workers: int = 4) -> list:
-        """PDF의 특정 페이지 범위를 모두 마크다운으로 변환 (병렬 처리)"""
+        """
+        PDF의 특정 페이지 범위를 모두 마크다운으로 변환 (병렬 처리)
+        - 페이지 분류/렌더링은 프로세스 풀에서, Gemini 호출은 스레드 풀에서 진행
+        - 텍스트 레이어가 깨끗한 페이지는 로컬 추출 결과를 그대로 사용 (Vision 호출 없음)
+        - 렌더링이 끝난 페이지부터 바로 Gemini 호출을 시작
+        """
         results = []
+        local_pages = 0
 
-        start_idx = start_page - 1
-        end_idx = end_page
+        page_nums = list(range(start_page - 1, end_page))
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_page = {
-                executor.submit(self.convert_page_to_markdown, pdf_path, page_num): page_num
-                for page_num in range(start_idx, end_idx)
-            }
+            future_to_page = {}
+            for page_num, prepared in get_page_renderer().iter_prepare(pdf_path, page_nums):
+                if prepared is None or prepared[1] is None:
+                    print(f"   ⚠️  페이지 {page_num + 1} 변환 실패")
+                    continue
+                kind, payload = prepared
+                if kind == PAGE_KIND_TEXT:
+                    local_pages += 1
+                    if payload:
+                        results.append((page_num + 1, payload))
+                        print(f"   ✅ 페이지 {page_num + 1} 텍스트 레이어 추출 완료")
+                    continue
+                future = executor.submit(
+                    self.convert_page_to_markdown, pdf_path, page_num, 3, payload
+                )
+                future_to_page[future] = page_num
 
             for future in as_completed(future_to_page):
                 page_num = future_to_page[future]
@@ -117,5 +145,8 @@ class VisionProcessor:
                 except Exception as e:
                     print(f"   ⚠️  페이지 {page_num + 1} 변환 중 오류: {e}")
 
+        if page_nums:
+            print(f"   📊 Vision {len(page_nums) - local_pages}/{len(page_nums)}페이지, 텍스트 레이어 {local_pages}페이지")
+
         results.sort(key=lambda x: x[0])
         return results
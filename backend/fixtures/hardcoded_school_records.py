@@ -1,3932 +0,0 @@
-# -*- coding: utf-8 -*-
-"""
-참고용 실제 학생 생기부 사례를 하드코딩한 데이터.
-Desktop/all_results_2 의 JSON 파일들에서 병합됨.
-"""
-from typing import Any, Dict
-
-HARDCODED_SCHOOL_RECORDS: Dict[str, Dict[str, Any]] = {'case_7_humanities': {'personal_info': {'대상': '서울대학교 정치외교학부 합격 학생부',
-                                         '고등학교_유형': '전국단위 자율형 사립고등학교',
-                                         '내신_성적': '1.1 ~ 1.3',
-                                         '주요_특징': '교과 수업 내 심화 탐구 역량이 탁월하며, 사회과학적 방법론을 활용해 현대 사회의 구조적 모순을 분석하는 능력이 돋보임. 1학년 시기에는 인문학적 소양을 '
-                                                  '바탕으로 사회 현상을 다각도로 조망하는 기초를 다졌고, 2학년 때 정치외교학 및 경제학 관련 심화 활동을 통해 정책적 대안을 제시하는 논리적 사고력을 '
-                                                  '입증함. 3학년 때는 고전 텍스트와 현대 정치 담론을 연결하는 비판적 글쓰기를 통해 학문적 깊이를 완성하였으며, 전 과정에서 일관된 진로 탐색과 자기주도적 '
-                                                  '학습 태도가 생활기록부 전반에 유기적으로 녹아있음.',
-                                         '총평': '교과 수업 내 심화 탐구 역량이 탁월하며, 사회과학적 방법론을 활용해 현대 사회의 구조적 모순을 분석하는 능력이 돋보임. 1학년 시기에는 인문학적 소양을 바탕으로 '
-                                               '사회 현상을 다각도로 조망하는 기초를 다졌고, 2학년 때 정치외교학 및 경제학 관련 심화 활동을 통해 정책적 대안을 제시하는 논리적 사고력을 입증함. 3학년 때는 '
-                                               '고전 텍스트와 현대 정치 담론을 연결하는 비판적 글쓰기를 통해 학문적 깊이를 완성하였으며, 전 과정에서 일관된 진로 탐색과 자기주도적 학습 태도가 생활기록부 '
-                                               '전반에 유기적으로 녹아있음.'},
-                       'activities': [{'학년': '1',
-                                       '영역': '자율활동',
-                                       '내용': "현대 민주주의의 위기와 디지털 공론장의 역할을 주제로 개최된 교내 학술 심포지엄에서 '알고리즘에 의한 확증 편향과 정치적 양극화'를 주제로 발표함. 사회과학적 "
-                                             '방법론을 적용하여 소셜 미디어 내 필터 버블 현상이 여론 형성에 미치는 부정적 영향을 분석하고, 이를 해결하기 위한 제도적 보완책으로 디지털 리터러시 교육의 의무화와 '
-                                             '알고리즘 투명성 확보를 제안함. 영어 세션에서는 다국적 학생들과 토론하며 민주적 의사결정 과정에서의 합의 도출 방안을 논의함. 또한 학생 자치회 기획국장으로서 학교 '
-                                             '축제 기획안을 총괄하며, 학생들의 다양한 의견을 수렴하는 민주적 의사결정 과정을 주도하고 행사 전반의 운영과 안전 관리를 체계적으로 수행하여 공동체 의식을 발휘함.'},
-                                      {'학년': '1',
-                                       '영역': '동아리활동',
-                                       '내용': "사회문제 탐구 동아리에서 '한국 사회의 불평등 구조와 세대 간 갈등'을 주제로 심층 연구를 수행함. 통계청의 가계동향조사 데이터를 활용하여 소득 불평등 지수와 세대별 "
-                                             "자산 격차의 상관관계를 분석하고, 이를 바탕으로 사회적 이동성 저하가 청년 세대의 정치적 무관심에 미치는 영향을 고찰함. 동아리 내 정기 세미나에서 '정의론'을 "
-                                             "발제하며 롤스의 정의 원칙을 현대 한국 사회의 복지 정책에 대입하여 비판적으로 검토함. 학기 말에는 연구 결과를 바탕으로 '세대 간 공존을 위한 사회적 합의 "
-                                             "모델'이라는 주제의 소논문을 작성하여 교내 학술제에서 발표하고 동료 학생들과 열띤 토론을 진행함."},
-                                      {'학년': '1',
-                                       '영역': '진로활동',
-                                       '내용': "진로 탐색 스피치에서 '정치철학적 관점에서 본 기본소득제의 타당성'을 발표하며, 노동의 가치 변화와 복지 국가의 재편이라는 관점에서 기본소득의 경제적·윤리적 함의를 "
-                                             "논리적으로 전개함. 진로 심화 프로그램(BrainKey)을 통해 '행동경제학적 관점에서의 정책 설계'를 탐구하며, 인간의 비합리적 선택이 정책 수용성에 미치는 영향을 "
-                                             '조사함. 특히 넛지(Nudge) 이론을 활용한 공공 정책 사례를 분석하고, 실제 공공 서비스 개선을 위한 설문조사를 설계하여 데이터 기반의 정책 제안 역량을 키움. '
-                                             '또한 수학적 모델링을 활용한 사회 현상 분석 활동에서 게임 이론의 죄수의 딜레마 모델을 파이썬으로 구현하여, 협력적 관계가 유지되는 조건과 사회적 신뢰의 중요성을 '
-                                             '수학적으로 증명하는 과정을 거침.'},
-                                      {'학년': '2',
-                                       '영역': '자율활동',
-                                       '내용': "국제 정치와 글로벌 거버넌스를 주제로 한 교내 학술 심포지엄에서 '글로벌 공급망 재편과 경제 안보의 정치학'을 주제로 세션 사회를 맡아, 각국 통상 정책의 이해관계와 "
-                                             '지정학적 리스크를 분석하는 토론을 주도함. 특히 다국적 참여자들 간의 논쟁을 중재하며 복잡한 국제 정세 속에서 국가 간 협력의 필요성을 논리적으로 정리함. 3분 '
-                                             "스피치에서는 '정치적 공동체와 사회적 신뢰의 상관관계'를 주제로, 현대 사회의 파편화된 개인들이 어떻게 공적 가치를 공유하는 공동체로 재구성될 수 있는지에 대해 "
-                                             '사회학적 관점에서 고찰함. 학급 자치 활동에서는 학급 내 의사결정 효율화를 위해 디지털 투표 시스템을 도입하고, 학급 구성원 간의 갈등 조정 프로세스를 매뉴얼화하여 '
-                                             "민주적 의사소통 문화를 정착시키는 데 기여함. 지역 탐방 활동에서는 '도시 공간의 재구조화와 지역 공동체 활성화'를 주제로, 쇠퇴한 도심이 문화적 재생을 통해 어떻게 "
-                                             '사회적 자본을 회복하는지 현장 조사를 수행함.'},
-                                      {'학년': '2',
-                                       '영역': '동아리활동',
-                                       '내용': "사회과학 심화 탐구 동아리장으로서 '데이터 기반 정책 분석 및 사회 문제 해결'을 목표로 동아리를 운영함. 타 동아리와의 연합 학술교류전을 기획하여 '디지털 전환기 "
-                                             "노동 시장의 변화와 정책적 대응'을 주제로 심도 있는 담론을 이끌어냄. 동아리 운영 효율화를 위해 부서별 책임제를 도입하고, 구성원들이 각자의 관심사에 따라 정책 "
-                                             '제안서를 작성하도록 독려하는 포용적 리더십을 발휘함. 특히 통계 분석 소프트웨어를 활용하여 기존의 단순 기술 통계 방식에서 벗어나, 시계열 분석을 도입함으로써 특정 '
-                                             "사회 정책 시행 전후의 여론 변화를 정량적으로 추적함. 사회학 전문가 초청 강연을 통해 현대 사회의 불평등 구조를 학습하고, 이를 바탕으로 '청년 세대의 주거 불안과 "
-                                             "사회적 이동성'에 관한 소논문을 작성함. 또한, 사회적 약자를 위한 정책 아이디어 공모전을 주도하여 수익금을 관련 시민단체에 기부하는 등 실천적 사회 참여를 실천함. "
-                                             '인지과학적 관점에서 인간의 의사결정 과정을 분석하는 문헌들을 탐독하며, 인간의 합리적 선택이 사회적 맥락과 어떻게 상호작용하는지 게슈탈트 심리학적 관점에서 비판적으로 '
-                                             '재해석함.'},
-                                      {'학년': '2',
-                                       '영역': '진로활동',
-                                       '내용': '교육과정 박람회에 참여하여 자신의 진로인 정치외교학 및 공공정책 분야와 연계된 심화 선택 과목을 전략적으로 설계함. 특히 사회과학 방법론과 경제학적 사고를 결합하기 '
-                                             "위해 필요한 교과목을 체계적으로 검토하고, 학업 계획을 구체화함. 진로 특강 시리즈에서 '민주주의의 위기와 시민의 역할'을 주제로 강연자로 나서, 현대 민주주의가 "
-                                             '직면한 포퓰리즘과 가짜 뉴스 문제를 정보 리터러시와 시민 교육의 관점에서 분석하여 학우들의 큰 호응을 얻음. 전공 탐색의 날에는 정치외교학 및 행정학 전공 교수와의 '
-                                             '면담을 통해 정책 결정 과정에서의 가치 갈등과 합리적 조정의 중요성을 깊이 있게 이해함. 또한, SNS를 통한 정보 확산이 여론 형성에 미치는 영향력을 분석하는 '
-                                             '콘텐츠를 제작하여, 주체적인 정보 생산자로서의 시민 의식을 강조함. 다양한 사회 이슈를 다각도로 분석하는 과정을 통해, 향후 국가 정책을 입안하고 조정하는 공공 '
-                                             '영역의 전문가로 성장하기 위한 학문적 토대를 다짐.'},
-                                      {'학년': '3',
-                                       '영역': '자율활동',
-                                       '내용': "학급 자치 프로젝트의 일환으로 '현대 사회의 정책 결정 과정과 시민의 역할'을 주제로 한 세미나를 기획하여, 복잡한 입법 절차와 예산 편성의 메커니즘을 동료들에게 "
-                                             '체계적으로 공유함. 특히 공공 정책의 실효성을 높이기 위한 시민 참여의 중요성을 강조하며, 데이터 기반의 정책 평가 방법론을 소개함. 또한 학급 내 사회적 담론 형성 '
-                                             "부장을 맡아, 매주 시사 이슈에 대한 설문조사를 실시하고 그 결과를 통계적으로 분석하여 학급 게시판에 '이달의 사회적 쟁점' 보고서를 게시함. 특히 양극화 해소를 "
-                                             "위한 사회적 합의 도출 방안을 다룰 때는 정치철학적 관점과 경제적 효율성을 동시에 고려한 논리적 분석을 시도하여 급우들의 비판적 사고를 자극함. 학기 말에는 '전통 "
-                                             "예술의 현대적 계승과 문화 정책'을 주제로 사물놀이의 리듬 구조를 분석하고, 이를 문화 콘텐츠 산업의 관점에서 재해석하는 발표를 통해 예술적 감수성과 인문학적 "
-                                             '통찰력을 동시에 보여줌.'},
-                                      {'학년': '3',
-                                       '영역': '동아리활동',
-                                       '내용': "사회과학 심화 탐구 동아리장으로서 전년도 활동의 성과를 계승하고, 후배들을 위한 '사회과학 방법론 워크숍'을 주도하여 동아리의 지속 가능한 연구 체계를 구축함. "
-                                             "다니엘 카너먼의 '생각에 관한 생각'을 읽고 인간의 인지 편향이 경제적 의사결정과 정치적 선택에 미치는 영향을 심층 탐구함. 특히 행동경제학적 관점에서 정책 설계 시 "
-                                             "'넛지(Nudge)'를 활용한 사회 문제 해결 방안을 연구하였으며, 실제 교내 캠페인에 이를 적용하여 자원 절약 실천율을 높이는 성과를 거둠. 또한 후배들에게 "
-                                             'SPSS 및 R을 활용한 통계 분석법을 교육하기 위한 매뉴얼을 직접 제작하고, 정기적인 스터디를 통해 사회과학적 데이터 해석 능력을 배양함. 뇌과학적 관점에서 인간의 '
-                                             '의사결정 기제를 분석한 연구를 발표하며, 합리적 선택 이론의 한계와 신경정치학적 접근의 필요성을 제안하는 등 학문 간 융합적 사고를 실천함.'},
-                                      {'학년': '3',
-                                       '영역': '진로활동',
-                                       '내용': "교내 진로 특강의 강연자로 선발되어 '정치외교학의 미래와 데이터 거버넌스'를 주제로, 디지털 전환 시대에 공공 정책이 나아가야 할 방향성에 대해 발표함. 단순히 "
-                                             '학문을 나열하는 것이 아니라, 정치학, 경제학, 데이터 과학이 어떻게 유기적으로 결합하여 사회적 난제를 해결할 수 있는지에 대한 논리적 모델을 제시하여 큰 호응을 '
-                                             "얻음. 또한 학급 3분 스피치 활동에서 '현대 사회의 구조적 불평등과 복지 국가의 재편'을 주제로, 국제기구의 보고서와 국내외 정책 사례를 비교 분석한 보고서를 "
-                                             '작성함. 특히 마약 중독 등 사회적 일탈 행위를 개인의 도덕적 문제로 치부하지 않고, 사회적 안전망의 부재와 구조적 요인이라는 관점에서 재조명하며, 이를 해결하기 '
-                                             '위한 공공 보건 정책의 전환을 주장함. 이러한 탐구 과정을 통해 사회 현상을 다각도로 조망하고 대안을 제시하는 예비 사회과학자로서의 자질을 입증함.'}],
-                       'comments': [{'구분': '탐구 주제의 전문성',
-                                     '내용': '디지털 공론장의 알고리즘 편향성과 정치적 양극화라는 주제는 현대 정치학의 핵심 난제를 관통하는 매우 시의적절하고 전문적인 접근이다. 단순한 현상 나열에 그치지 않고, '
-                                           '사회과학적 방법론을 도입하여 필터 버블이 여론 형성에 미치는 인과관계를 논리적으로 규명하려 노력한 점이 돋보이며, 관련 학술 자료와 데이터 분석을 통해 탐구의 객관성과 '
-                                           '학문적 신뢰성을 확보한 점이 매우 우수하다.'},
-                                    {'구분': '활동의 심화 및 연계',
-                                     '내용': '1학년 시기 사회 불평등 구조에 대한 기초적인 통계 분석에서 시작하여, 2학년 때 데이터 기반 정책 분석으로, 3학년에는 시민 참여형 세미나 기획으로 이어지는 탐구의 '
-                                           '시간적 흐름이 매우 유기적이다. 특히 후배들을 위한 방법론 워크숍을 주도하며 지식을 체계화하고 전수하는 과정은 단순한 지식 습득을 넘어 학문적 성숙도를 보여주는 지표로서 '
-                                           '높은 평가를 받는다.'},
-                                    {'구분': '스토리 구성의 우수성',
-                                     '내용': '사회 현상에 대한 비판적 문제의식에서 출발하여, 이론적 배경을 검토하고, 구체적인 데이터 분석을 거쳐 정책적 대안을 제시하는 탐구의 서사 구조가 매우 탄탄하다. 단순히 '
-                                           '사회적 이슈를 관찰하는 수준에 머물지 않고, 정치철학적 담론과 경제학적 사고를 결합하여 자신만의 독창적인 해석을 도출해내는 과정은 학업 역량의 우수성을 입증하기에 '
-                                           '충분하다.'},
-                                    {'구분': '심화 탐구의 방향성',
-                                     '내용': '글로벌 공급망 재편과 같은 거시적 지정학 이슈를 다룰 때 보여준 논리적 치밀함은 인문학적 소양과 사회과학적 분석력이 조화를 이루고 있음을 보여준다. 특히 행동경제학적 '
-                                           '관점을 정치적 의사결정 과정에 대입하여 인지 편향이 정책 수용성에 미치는 영향을 분석한 시도는 학제 간 융합적 사고 능력이 매우 뛰어남을 방증한다.'},
-                                    {'구분': '리더십 및 역량 증명',
-                                     '내용': '사회과학 심화 탐구 동아리장으로서 연합 학술교류전을 기획하고, 동아리 내 연구 체계를 구축하여 지속 가능한 학술 활동의 토대를 마련한 점은 포용적 리더십과 조직 운영 '
-                                           '능력을 동시에 보여준다. 복잡한 사회적 담론을 동료들과 공유하고 토론을 주도하는 과정에서 보여준 소통 능력과 논리적 설득력은 향후 학문적 리더로 성장할 잠재력을 충분히 '
-                                           '시사한다.'},
-                                    {'구분': '정보 재조직 능력',
-                                     '내용': '복잡한 입법 절차와 예산 편성 메커니즘을 동료들이 이해하기 쉽게 재구성하여 세미나를 운영한 능력은 정보의 구조화 및 전달 역량이 탁월함을 보여준다. 사회 변화의 흐름을 '
-                                           '읽어내고 그에 따른 정책적 발전 방향을 고민하는 태도는 예비 정치외교학도로서 갖추어야 할 비판적 사고와 사회적 상상력을 고루 갖추었음을 잘 보여준다.'}]},
- 'case_7_natural_science': {'personal_info': {'대상': '서울대학교 전기정보공학부 합격 학생부',
-                                              '고등학교_유형': '전국단위 자사고',
-                                              '내신_성적': '1.2 ~ 1.4',
-                                              '주요_특징': '수학 및 물리 교과에 대한 탁월한 학업 역량을 바탕으로 공학적 문제 해결 능력을 입증함. 1학년 시기부터 파이썬을 활용한 데이터 분석과 알고리즘 '
-                                                       '설계에 몰입하였으며, 2학년 때는 전자기학 및 회로 이론을 실제 시스템에 적용하는 심화 탐구를 수행함. 3학년 과정에서는 인공지능 기반의 제어 '
-                                                       '시스템 최적화 프로젝트를 주도하며 학문적 깊이와 공학적 통찰력을 동시에 보여주어 전공 적합성이 매우 우수한 사례임.',
-                                              '총평': '수학 및 물리 교과에 대한 탁월한 학업 역량을 바탕으로 공학적 문제 해결 능력을 입증함. 1학년 시기부터 파이썬을 활용한 데이터 분석과 알고리즘 설계에 '
-                                                    '몰입하였으며, 2학년 때는 전자기학 및 회로 이론을 실제 시스템에 적용하는 심화 탐구를 수행함. 3학년 과정에서는 인공지능 기반의 제어 시스템 최적화 '
-                                                    '프로젝트를 주도하며 학문적 깊이와 공학적 통찰력을 동시에 보여주어 전공 적합성이 매우 우수한 사례임.'},
-                            'activities': [{'학년': '1',
-                                            '영역': '자율활동',
-                                            '내용': '미래 모빌리티 시스템의 자율주행 알고리즘을 주제로 교내 공학 학술 심포지엄에 발표자로 참여함. 센서 퓨전 기술을 활용한 객체 인식의 정확도 향상 방안을 '
-                                                  '논리적으로 제시하였으며, 영어 발표를 통해 글로벌 공학 커뮤니티와의 소통 역량을 입증함. 특히 라이다(LiDAR) 데이터의 노이즈 필터링 기법에 대한 심도 '
-                                                  '있는 질의응답을 수행하며 공학적 사고의 깊이를 보여줌. 교내 축제 기획 단계에서는 시스템 엔지니어링 관점을 도입하여 행사장의 전력 부하를 계산하고 효율적인 '
-                                                  '배선 설계를 주도하였으며, 학생들의 동선을 최적화하는 시뮬레이션을 적용하여 안전하고 원활한 행사 운영을 이끌어냄.'},
-                                           {'학년': '1',
-                                            '영역': '동아리활동',
-                                            '내용': '(1학기 프로그래밍 동아리) 파이썬을 활용한 알고리즘 구현 프로젝트를 수행함. 정렬 알고리즘의 시간 복잡도를 비교 분석하고, 효율적인 데이터 처리를 위한 '
-                                                  '자료구조 선택의 중요성을 탐구함. (2학기 프로그래밍 동아리) 오픈소스 라이브러리를 활용하여 간단한 데이터 시각화 툴을 제작함. 공공 데이터를 수집하여 '
-                                                  '전처리 과정을 거친 뒤, 그래프로 출력하는 파이프라인을 구축함. 동아리 발표회에서 데이터의 상관관계를 분석하는 방법론을 공유하였으며, 코드의 가독성을 높이기 '
-                                                  '위한 리팩토링 과정을 통해 소프트웨어 공학적 기초 역량을 다짐.'},
-                                           {'학년': '1',
-                                            '영역': '진로활동',
-                                            '내용': '진로 탐색 스피치에서 전력망의 효율적 제어를 위한 스마트 그리드 기술의 필요성을 역설함. (공학 캠프)(32시간) 제어 공학의 기초를 학습하며 PID '
-                                                  '제어기가 로봇 팔의 정밀한 움직임에 미치는 영향을 탐구함. 문화학술교류전에서는 물리적 현상을 수학적으로 모델링하는 것에 집중하여, RLC 회로의 과도 응답 '
-                                                  '특성을 미분방정식으로 유도하고 이를 파이썬의 수치 해석 라이브러리인 SciPy를 사용하여 시뮬레이션함. 실제 회로의 저항값 변화에 따른 감쇠 진동의 양상을 '
-                                                  '그래프로 구현하고, 이론적 계산값과 수치 해석 결과 사이의 오차 원인을 분석하여 시스템 안정성 확보를 위한 파라미터 최적화 방안을 제시함.'},
-                                           {'학년': '2',
-                                            '영역': '자율활동',
-                                            '내용': "교내 공학 학술 심포지엄에서 '전력망 최적화를 위한 스마트 그리드 제어 알고리즘'을 주제로 학술 세션을 주도함. 복잡한 전력 수급 데이터를 실시간으로 "
-                                                  "처리하는 분산 제어 시스템의 효율성을 논리적으로 설명하고, 해외 공학 커뮤니티의 최신 연구 사례를 인용하여 질의응답을 이끌어냄. 3분 스피치에서는 '디지털 "
-                                                  "트윈을 활용한 시스템 모델링의 정밀도'를 주제로, 물리적 객체와 가상 모델 간의 데이터 동기화가 공학적 의사결정에 미치는 영향을 역설함. 학급 자치활동에서는 "
-                                                  '에너지 절약 캠페인을 기획하여 교내 전력 사용량을 6개월간 데이터베이스화하고, 피크 타임 전력 소비 패턴을 분석하여 효율적인 에너지 관리 가이드를 학급 '
-                                                  "구성원들에게 공유함. 지역 탐방 활동에서는 '도시 인프라의 물리적 구조와 에너지 효율성'을 주제로 건축물의 열전달 계수와 에너지 손실 간의 상관관계를 "
-                                                  '수치적으로 분석함.'},
-                                           {'학년': '2',
-                                            '영역': '동아리활동',
-                                            '내용': '(공학 시스템 설계 동아리)(30시간) 동아리장으로서 시스템 최적화 프로젝트를 총괄함. 여러 공학 분과와의 협업을 통해 회로 설계, 임베디드 제어, 데이터 '
-                                                  '분석을 통합한 융합 프로젝트를 기획함. 특히 시스템 운영의 비효율성을 개선하기 위해 모듈형 설계 방식을 도입하여 개발 속도와 유지보수 효율을 극대화함. '
-                                                  '기존의 단순 신호 분석 방식에서 벗어나 웨이블릿 변환(Wavelet Transform)을 도입하여, 시간-주파수 영역에서의 비정상 신호(Transient '
-                                                  'Signal)를 정밀하게 포착하는 알고리즘을 구현함. 이를 통해 특정 제어 입력 전후의 시스템 응답 변화를 정량적으로 측정함. 문화학술교류전에서는 '
-                                                  '전기공학팀과 수리과학팀을 이끌며 전송선로 이론(Transmission Line Theory)의 수학적 모델링을 수행함. 또한, 하드웨어 제어의 물리적 한계를 '
-                                                  '극복하기 위해 제어 이론 전문가와의 면담을 진행하고, AI 기반의 적응형 제어 시스템이 갖는 한계와 가능성을 제어 공학적 관점에서 고찰함. 관련 전공 서적을 '
-                                                  '탐독하며 임베디드 시스템의 실시간 운영체제(RTOS) 구조를 학습하고 이를 실제 로봇 제어에 적용함.'},
-                                           {'학년': '2',
-                                            '영역': '진로활동',
-                                            '내용': '전기정보공학 분야의 교육과정 로드맵을 설계하며, 심화 수학 및 물리 교과목의 연계성을 분석함. 학교 교육과정 설명회에서 공학 계열 진학을 희망하는 학생들을 '
-                                                  "대상으로 선택과목의 중요성과 기초 공학 역량의 필요성을 설명함. 1차 진로특강에서 '전자기학의 응용: 무선 전력 전송의 원리와 효율'을 주제로 강연하며, "
-                                                  '전자기 유도 현상을 활용한 에너지 전송 효율 최적화 방안을 물리적 수식과 함께 제시함. 2차 진로특강에서는 공학적 문제 해결을 위한 데이터 분석의 중요성을 '
-                                                  '강조함. 전공 탐색의 날에는 전기정보공학 및 시스템 제어 공학 분야의 심층적인 전공 설명을 통해, 하드웨어와 소프트웨어를 아우르는 시스템 통합 설계의 비전을 '
-                                                  '공유함. 다양한 공학 이슈를 분석하며 기술적 완성도뿐만 아니라 사회적 영향력을 고려한 주체적인 공학 콘텐츠 생산의 중요성을 체득함.'},
-                                           {'학년': '3',
-                                            '영역': '자율활동',
-                                            '내용': "교내 공학 학술제에서 '전력 계통의 안정성 확보를 위한 분산형 전원 제어 알고리즘'을 주제로 발표함. 태양광 및 풍력 등 신재생 에너지의 간헐적 출력 "
-                                                  '변동성을 보완하기 위해 PID 제어와 퍼지 논리를 결합한 하이브리드 제어 모델을 설계하고, 시뮬레이션을 통해 전압 안정화 성능을 검증함. 특히 제어 이론의 '
-                                                  '수학적 모델링 과정에서 라플라스 변환을 활용하여 시스템의 전달 함수를 도출하고, 주파수 응답 분석을 통해 시스템의 안정도 마진을 확보하는 과정을 논리적으로 '
-                                                  "설명함. 또한 학급 자치 활동의 일환으로 '공학적 문제 해결을 위한 파이썬 프로그래밍' 스터디를 조직하여, 급우들에게 데이터 시각화 라이브러리인 "
-                                                  'Matplotlib과 NumPy를 활용한 물리 데이터 분석 기법을 전수함. 단순한 코드 구현을 넘어, 알고리즘의 시간 복잡도와 메모리 효율성을 고려한 최적화 '
-                                                  '방안을 제시하며 공학적 사고의 깊이를 보여줌.'},
-                                           {'학년': '3',
-                                            '영역': '동아리활동',
-                                            '내용': '(임베디드 시스템 설계 동아리)(24시간) 동아리장으로서 마이크로컨트롤러(MCU) 기반의 자율 제어 로봇 프로젝트를 총괄함. 전년도에 구축한 시스템의 '
-                                                  '아키텍처를 개선하여, 센서 데이터의 노이즈를 제거하기 위한 칼만 필터(Kalman Filter) 알고리즘을 C언어로 직접 구현하고 적용함. 로봇이 복잡한 '
-                                                  '미로 환경에서 최단 경로를 탐색할 수 있도록 A* 알고리즘을 최적화하였으며, 실시간 연산 속도를 높이기 위해 인터럽트 기반의 제어 구조를 설계함. '
-                                                  '후배들에게는 임베디드 시스템의 하드웨어 인터페이스와 회로 설계 기초를 교육하는 매뉴얼을 제작하여 배포하였으며, 기술적 난관에 봉착했을 때 회로도 분석과 '
-                                                  '오실로스코프를 활용한 신호 분석을 통해 문제의 근본 원인을 파악하는 체계적인 디버깅 과정을 지도함. 뇌과학과 공학의 융합적 관점에서 신경망 모델의 가중치 '
-                                                  '업데이트 방식과 제어 시스템의 피드백 루프 간의 유사성을 탐구하는 세미나를 주도하며 학술적 통찰력을 공유함.'},
-                                           {'학년': '3',
-                                            '영역': '진로활동',
-                                            '내용': "교내 공학 진로 특강의 강연자로 선발되어 '전기정보공학에서의 시스템 모델링과 최적화'를 주제로 발표함. 학문의 융합이 단순히 서로 다른 분야를 결합하는 것을 "
-                                                  '넘어, 수학적 모델링을 통해 공통된 시스템의 원리를 추출하고 이를 최적화하는 과정임을 역설함. 특히 제어 공학적 관점에서 복잡한 시스템을 상태 공간 '
-                                                  '방정식으로 표현하고, 이를 통해 시스템의 제어 가능성과 관측 가능성을 분석하는 방법론을 제시하여 청중의 큰 호응을 얻음. 또한 3분 스피치 활동에서는 '
-                                                  "'인공지능 기반의 전력망 수요 예측 모델'에 관한 보고서를 작성함. 시계열 데이터 분석을 위한 RNN 및 LSTM 모델의 구조적 특징을 설명하고, 전력 소비 "
-                                                  '패턴의 비선형성을 해결하기 위한 데이터 전처리 기법과 모델의 하이퍼파라미터 튜닝이 예측 정확도에 미치는 영향을 공학적 데이터에 근거하여 분석함. 이를 통해 '
-                                                  '데이터 기반의 의사결정이 현대 공학 시스템에서 갖는 중요성을 조명함.'}],
-                            'comments': [{'구분': '탐구 주제의 전문성',
-                                          '내용': '전력망 제어 및 스마트 그리드 최적화라는 공학적 난제를 다룬 점이 매우 인상적이다. 단순히 이론적 학습에 머물지 않고, PID 제어와 퍼지 논리를 결합한 '
-                                                '하이브리드 모델을 설계하여 시뮬레이션까지 수행한 과정은 학부 수준의 공학적 전문성을 충분히 보여준다. 대학 공개 강의와 최신 공학 논문을 탐구의 근거로 활용하여 '
-                                                '논리적 완결성을 확보한 점이 탁월하다.'},
-                                         {'구분': '활동의 심화 및 연계',
-                                          '내용': '1학년 시기 자율주행 알고리즘의 기초를 다진 이후, 2학년과 3학년을 거치며 전력 계통의 안정성 확보라는 구체적인 문제 해결로 탐구의 범위를 점진적으로 확장한 '
-                                                '점이 돋보인다. 특히 칼만 필터를 도입하여 센서 데이터의 노이즈를 제거하는 등 기술적 고도화를 꾀한 과정은 학생의 심화 탐구 역량이 시간의 흐름에 따라 어떻게 '
-                                                '발전했는지 명확히 보여준다.'},
-                                         {'구분': '스토리 구성의 우수성',
-                                          '내용': '공학적 호기심에서 출발하여 문제 정의, 알고리즘 설계, 시뮬레이션 검증, 그리고 시스템 최적화 제안으로 이어지는 탐구의 서사가 매우 체계적이다. 단순히 기술적 '
-                                                '구현에 그치지 않고, 신재생 에너지의 간헐성이라는 실제 사회적 이슈를 공학적 모델링으로 해결하려는 시도는 공학도로서의 문제 해결 태도를 잘 드러낸다.'},
-                                         {'구분': '심화 탐구의 방향성',
-                                          '내용': '임베디드 시스템 설계 및 MCU 기반 제어 로봇 프로젝트와 같이 하드웨어와 소프트웨어를 통합하는 융합적 탐구 과정이 매우 구체적이다. 단순한 이론 학습을 넘어 '
-                                                '전문가 수준의 제어 이론을 실제 시스템에 적용하고, 시스템 운영의 비효율성을 모듈형 설계로 개선하는 등 실질적인 공학적 성과를 도출한 점이 인상적이다.'},
-                                         {'구분': '리더십 및 역량 증명',
-                                          '내용': '공학 시스템 설계 동아리장으로서 다학제적 협업을 주도하고, 시스템 아키텍처를 개선하여 프로젝트의 효율성을 극대화한 사례는 포용적 리더십과 기술적 리더십을 동시에 '
-                                                '갖추었음을 입증한다. 복잡한 공학적 문제를 팀원들과 소통하며 해결해 나가는 과정에서 보여준 주도적인 태도는 대학 입학 후 연구 역량으로 직결될 것으로 '
-                                                '기대된다.'},
-                                         {'구분': '정보 재조직 능력',
-                                          '내용': '전기정보공학 분야의 교육과정 로드맵을 스스로 설계하고, 선택과목 간의 연계성을 분석하여 학업 계획을 수립한 능력은 자기주도적 학습 역량의 정수를 보여준다. '
-                                                '공학적 지식을 단순히 습득하는 것에 그치지 않고, 이를 체계적으로 구조화하여 타인에게 설명하고 공유하는 과정에서 정보 재조직 및 소통 능력이 매우 뛰어남을 '
-                                                '확인할 수 있다.'}]},
- 'case_6_humanities_education': {'personal_info': {'대상': '교육학과 진학을 희망하는 인문계 최상위권 학생부',
-                                                   '고등학교_유형': '일반고',
-                                                   '내신_성적': '1.0 ~ 1.2',
-                                                   '주요_특징': '교육 정책 분석, 교육 불평등 해소 방안 연구, 교육학 관련 심화 탐구 활동 중심',
-                                                   '총평': '교육 정책 분석, 교육 불평등 해소 방안 연구, 교육학 관련 심화 탐구 활동 중심'},
-                                 'activities': [{'학년': '2',
-                                                 '영역': '자율활동',
-                                                 '내용': "교육 불평등 해소와 공교육의 역할에 관심을 갖고 교내 '교육 정책 연구 동아리'를 주도하며, 조원들이 각자의 관심 분야인 교육 격차, 디지털 "
-                                                       "리터러시, 다문화 교육 등에 대해 심도 있게 탐구하도록 독려하는 리더십을 발휘함. 특히 '교육 기회의 평등과 실질적 자유'라는 주제로 보고서를 "
-                                                       "작성하며, 단순히 제도적 접근을 넘어 교육 현장에서 발생하는 실질적인 학습 격차의 원인을 분석함. 관련 도서 '교육의 불평등'을 읽고 교육학적 "
-                                                       '관점에서 공교육이 지향해야 할 보편적 가치와 맞춤형 지원의 균형점에 대해 깊이 고민하며, 능동적이고 자발적으로 교육학적 지식을 확장하는 모습을 '
-                                                       '보임.'},
-                                                {'학년': '2',
-                                                 '영역': '자율활동',
-                                                 '내용': '학습 부진 학생을 위한 맞춤형 멘토링 활동을 기획하여 친구의 학업 성취도 향상을 돕는 과정에서 교육적 상호작용의 중요성을 체감함. 수학적 논리 '
-                                                       '구조를 설명하는 과정에서 단순히 답을 도출하는 방식이 아니라, 상대방의 인지 수준에 맞추어 개념을 재구성하여 전달하는 교수학습 전략을 적용함. 특히 '
-                                                       '가우스 기호와 같은 추상적인 수학 개념을 실생활 사례와 연결하여 설명함으로써 친구의 이해를 돕고, 학습 과정에서 발생하는 오류를 분석하여 이를 '
-                                                       '교정하는 피드백의 과정을 통해 교육자로서 갖추어야 할 공감 능력과 분석적 사고력을 배양함.'},
-                                                {'학년': '2',
-                                                 '영역': '자율활동',
-                                                 '내용': "학급 부반장으로서 학급 내 학습 공동체 문화를 조성하기 위해 '교과별 멘토-멘티 프로젝트'를 제안하고, 활동의 필요성을 논리적으로 설득하여 학급 "
-                                                       "전체의 참여를 이끌어냄. 독서 토론 모임에서 '격차, 그 지극한 자연스러움'을 읽고 사회적 불평등이 교육 현장에 미치는 영향에 대해 토론하며, "
-                                                       '코로나19 팬데믹 상황에서 드러난 디지털 교육 격차 문제를 교육학적 관점에서 비판적으로 분석함. 특히 취약 계층 학생들의 학습권 보장을 위한 정책적 '
-                                                       '대안을 제시하는 과정에서 타인의 의견을 경청하면서도 자신의 논리를 명확히 피력하는 토론 역량을 보여줌. 학급 분위기가 저하될 때마다 진로 관련 '
-                                                       '스터디를 제안하여 학습 동기를 부여하고, 민주적인 의사결정 과정을 통해 학급의 공동체 의식을 높이는 데 기여함.'},
-                                                {'학년': '2',
-                                                 '영역': '동아리활동',
-                                                 '내용': "교육 정책의 실효성을 분석하고 대안을 제시하는 '교육 정책 연구 동아리'의 부장으로서, 우리 사회의 교육 불평등 문제를 해결하기 위한 구조적 접근을 "
-                                                       "시도함. 특히 '교육 기회의 평등과 공교육의 책무성'을 주제로 팀 프로젝트를 주도하며, 교육 격차가 발생하는 사회경제적 배경을 통계 자료와 교육학 "
-                                                       '논문을 통해 심층 분석함. 팀원들과 함께 지역사회 내 교육 소외 계층을 위한 방과 후 프로그램의 운영 실태를 조사하고, 기존 정책의 한계점을 '
-                                                       "비판적으로 검토하여 '맞춤형 학습 지원 시스템'을 제안하는 보고서를 작성함. 이 과정에서 동료들의 다양한 의견을 조율하고 논리적인 근거를 바탕으로 "
-                                                       '설득하는 리더십을 발휘함. 또한, 디지털 리터러시 격차가 교육 불평등을 심화시킨다는 점에 주목하여, 디지털 기기 활용 능력이 학업 성취도에 미치는 '
-                                                       "영향을 분석한 소논문을 작성함. 교내 학술제에서 '디지털 교육 격차 해소를 위한 공교육의 역할'이라는 주제로 발표하며, 단순한 지식 전달을 넘어 "
-                                                       '학습자의 자기주도적 학습 역량을 강화하는 교육 모델을 제시하여 큰 호응을 얻음. 시사 문제와 교육 현장을 연결하는 안목을 지녀, 동아리 소식지에 '
-                                                       "'교육 양극화와 공교육의 미래'라는 칼럼을 기고하며 교육학적 식견을 넓히는 데 주력함."},
-                                                {'학년': '2',
-                                                 '영역': '동아리활동',
-                                                 '내용': '학습 부진 학생을 위한 맞춤형 멘토링 프로그램을 설계하고, 교육학적 교수법을 적용하여 친구의 학업 성취도 향상을 돕는 탐구 활동을 수행함. 단순히 '
-                                                       "지식을 전달하는 방식에서 벗어나, 학습자의 인지 수준과 학습 동기를 고려한 '비계 설정(Scaffolding)' 이론을 실제 멘토링에 적용함. "
-                                                       '수학적 논리 구조를 설명할 때 상대방이 이해하기 쉬운 비유를 활용하고, 오개념을 수정해 주는 과정을 통해 교육적 상호작용의 중요성을 깊이 체감함. '
-                                                       "이러한 경험을 바탕으로 '학습자 중심의 개별화 교육'에 대한 심화 탐구를 진행하였으며, 관련 교육학 서적을 찾아보며 학습자의 특성에 따른 교수 "
-                                                       '전략의 차이를 분석한 보고서를 제출함. 비록 직접적인 교육 현장 실습은 아니었으나, 멘토링 과정에서 발생한 시행착오를 기록하고 이를 개선하기 위한 '
-                                                       '반성적 성찰을 통해 교육 전문가로서의 자질을 함양함. 모둠장으로서 책임감을 가지고 멘토링 활동의 전 과정을 체계적으로 관리하였으며, 동료 멘토들과 '
-                                                       '함께 학습 부진 학생의 정서적 지지까지 고려한 통합적 교육 지원 방안을 모색함. 향후 교육학과에 진학하여 학습자의 잠재력을 극대화할 수 있는 교육 '
-                                                       '환경을 조성하고, 모든 학생이 소외되지 않는 포용적 교육 시스템을 구축하겠다는 확고한 진로 의지를 밝힘.'},
-                                                {'학년': '2',
-                                                 '영역': '진로활동',
-                                                 '내용': "교육학 관련 진로 탐색 활동에 참여하여, 미래 교육의 변화 방향과 교사의 역할에 대해 심도 있게 고찰함. '미래 사회의 교육과 에듀테크의 "
-                                                       "접목'이라는 주제로 모둠 활동을 수행하며, 인공지능 기반의 맞춤형 학습 플랫폼이 공교육 현장에 도입될 때 발생할 수 있는 윤리적 문제와 교육적 "
-                                                       '효과를 분석함. 주제 선정부터 역할 분담, 최종 보고서 작성까지 전 과정에서 뛰어난 리더십을 발휘하며, 교육학의 하위 분야인 교육철학, 교육심리학, '
-                                                       '교육행정학의 유래와 전망을 체계적으로 정리함. 특히 교사가 지녀야 할 윤리적 판단력과 사명감, 그리고 급변하는 교육 환경에 대응하는 융통성에 대해 '
-                                                       "깊이 있게 탐구함. 3D 프린팅 기술을 교육 현장에 적용하여 학습자의 창의성을 극대화할 수 있는 '메이커 교육'의 가능성을 탐색하였으며, 기술이 "
-                                                       '교육의 도구로서 어떻게 학습자의 주도성을 이끌어낼 수 있는지에 대한 소감문을 작성함. 모든 활동에 능동적으로 참여하며, 교육학적 지식을 실제 교육 '
-                                                       '현장의 문제 해결에 적용하려는 노력이 돋보임. 자료 조사 과정에서 교육 정책의 변화가 학생들의 학습 경험에 미치는 영향을 분석하고, 이를 바탕으로 '
-                                                       '미래 지향적인 교육 정책을 제안하는 등 예비 교육 전문가로서의 역량을 충분히 보여줌. 활동 전반에서 보여준 논리적 사고력과 타인을 배려하는 소통 '
-                                                       '능력은 교육학을 전공하고자 하는 학생으로서 매우 훌륭한 자질로 평가됨.'},
-                                                {'학년': None,
-                                                 '영역': '세특',
-                                                 '내용': "교육학적 관점에서 학습자의 동기 유발 기제에 깊은 관심을 보이며, 교육 심리학의 핵심 이론인 '자기결정성 이론'을 탐구하여 학습자의 내적 동기가 "
-                                                       '학업 성취에 미치는 영향을 분석함. 특히 교육 불평등이 학습자의 자아존중감과 학습 동기에 미치는 상관관계를 다룬 논문을 비판적으로 검토하고, 이를 '
-                                                       '요약하여 학급 구성원들에게 발표함으로써 교육 환경의 중요성을 역설함. 신경과학적 관점에서 학습자의 인지 발달 단계와 뇌 가소성을 연결 지어, 개별화 '
-                                                       '교육의 필요성을 논리적으로 설명하는 모습이 인상적임. 또한, 교육 정책의 후성유전학적 접근을 통해 환경적 요인이 교육 격차를 고착화하는 기제를 '
-                                                       '정리하여 자신만의 교육 철학을 담은 에세이를 작성함. 복잡한 교육 이론을 구체적인 사례와 연결하여 친구들에게 설명하는 과정에서 탁월한 전달력을 '
-                                                       '보여주었으며, 동료 학습자의 이해를 돕기 위해 시각 자료를 활용하는 등 교수학습 전략을 스스로 실천하는 모습을 보임.'},
-                                                {'학년': None,
-                                                 '영역': '세특',
-                                                 '내용': '교육 통계의 수학적 기초를 다지기 위해 데이터 분석 방법론을 탐구하며, 교육 평가의 타당도와 신뢰도를 산출하는 통계적 원리를 심도 있게 학습함. '
-                                                       '다변량 분석을 통한 교육 성과 측정 모델을 이해하고, 라그랑주 승수법을 활용하여 한정된 교육 자원을 최적 배분하는 정책 시뮬레이션 모델을 고안해봄. '
-                                                       '또한, 교육 현장의 복잡한 변수들을 벡터 공간 모델로 해석하여 교육 정책의 효과성을 정량적으로 평가하는 논리적 사고력을 발휘함. 교육 공학 시간에는 '
-                                                       "'디지털 리터러시 격차 해소를 위한 맞춤형 학습 플랫폼'을 주제로, 기존 에듀테크 서비스의 한계를 분석하고 이를 보완할 수 있는 새로운 인터페이스를 "
-                                                       "제안함. 특히 '학습자 맞춤형 비계 설정 알고리즘'을 적용한 학습 지원 시스템을 기획하여 팀 프로젝트로 발표하였으며, 기술이 교육의 평등을 실현하는 "
-                                                       '도구가 되어야 한다는 철학을 분명히 함. 타인의 의견을 경청하고 자신의 교육적 비전을 조리 있게 설득하는 과정에서 미래 교육 전문가로서의 자질을 '
-                                                       '충분히 보여줌.'}],
-                                 'comments': [{'구분': '교육학과 합격 전략',
-                                               '내용': '본 학생은 교육학적 소양과 정책적 통찰력을 바탕으로 최상위권 교육학과에 합격할 수 있는 경쟁력을 갖추었다. 교육 불평등 해소라는 명확한 문제의식을 '
-                                                     '중심으로 교과 활동과 동아리 탐구를 유기적으로 연결한 전략이 주효했으며, 단순한 봉사 활동을 넘어 교육 현장의 구조적 모순을 분석하려는 시도가 '
-                                                     '입학사정관에게 높은 평가를 받을 것으로 판단된다.'},
-                                              {'구분': '심화 탐구의 중요성',
-                                               '내용': "일반고 교육과정의 범위를 넘어선 교육 심리학의 '자기결정성 이론'이나 '다변량 분석을 통한 교육 성과 측정 모델'과 같은 심화 주제를 교과와 연계하여 "
-                                                     '탐구한 점이 매우 인상적이다. 이러한 학문적 깊이는 특목고 학생들과 비교해도 손색이 없으며, 학생의 지적 호기심과 자기주도적 학습 역량을 증명하는 '
-                                                     '핵심적인 요소로 작용한다.'},
-                                              {'구분': '용어 선택의 전문성',
-                                               '내용': "단순히 '교육 격차'라는 포괄적인 용어를 사용하는 대신, '비계 설정(Scaffolding)', '교육 기회의 평등과 공교육의 책무성', '에듀테크의 "
-                                                     "도입과 학습자 인지 수준' 등 교육학적 전문 용어를 적재적소에 활용하여 탐구의 전문성을 높였다. 이는 학생이 교육학이라는 학문에 대해 얼마나 깊이 있게 "
-                                                     '고민하고 준비했는지를 잘 보여준다.'},
-                                              {'구분': '소재의 구체화',
-                                               '내용': "'교육 불평등'이라는 다소 광범위한 주제를 다룰 때, 단순히 현상을 나열하는 것에 그치지 않고 '디지털 리터러시 격차가 학습 동기에 미치는 영향'과 "
-                                                     '같이 구체적인 변인을 설정하여 분석한 점이 훌륭하다. 주제를 좁혀 깊이 있게 파고드는 이러한 접근 방식은 향후 대학에서의 학술적 연구 역량을 가늠하게 '
-                                                     '한다.'},
-                                              {'구분': '키워드의 연속성',
-                                               '내용': "자율활동에서 시작된 '교육 불평등 해소'라는 화두가 동아리 활동의 '교육 정책 분석'과 진로활동의 '미래 교육과 에듀테크'로 이어지는 일관된 서사가 "
-                                                     '매우 돋보인다. 학생의 관심사가 파편화되지 않고 하나의 큰 줄기로 연결되어 있어, 교육학자로서의 성장 가능성을 효과적으로 드러내고 있다.'},
-                                              {'구분': '활동의 선택과 집중',
-                                               '내용': "동아리 활동에서 여러 교육 이슈를 나열하기보다 '교육 기회의 평등'이라는 하나의 주제를 중심으로 정책적 대안을 제시하는 과정에 집중한 점이 좋다. "
-                                                     '한정된 생기부 분량 내에서 탐구의 동기, 과정, 결과, 그리고 이를 통해 얻은 교육학적 통찰을 밀도 있게 기술함으로써 활동의 완성도를 극대화하였다.'},
-                                              {'구분': '교육학과 전공 적합성',
-                                               '내용': "학습 부진 학생을 위한 멘토링 활동에서 '비계 설정' 이론을 실제 교수법에 적용하고, 그 결과를 성찰적으로 기록한 점은 교육학과에 대한 뚜렷한 진정성을 "
-                                                     '보여준다. 이론과 실천을 결합하여 교육 현장의 문제를 해결하려는 태도는 예비 교육학도로서 갖추어야 할 가장 중요한 자질을 잘 보여주는 사례이다.'}]},
- 'case_6_humanities_korean_lit': {'personal_info': {'대상': '국어국문학과 합격생 학생부 종합 전형 프로필',
-                                                    '고등학교_유형': '일반고',
-                                                    '내신_성적': '1.1 ~ 1.3',
-                                                    '주요_특징': '국어국문학과, 인문학적 소양 및 비판적 텍스트 분석 역량 우수',
-                                                    '총평': '국어국문학과, 인문학적 소양 및 비판적 텍스트 분석 역량 우수'},
-                                  'activities': [{'학년': '2',
-                                                  '영역': '자율활동',
-                                                  '내용': "디지털 매체의 발달에 따른 현대인의 언어 파괴 현상과 문해력 저하 문제에 깊은 관심을 갖고, 교내 인문학 탐구 동아리 '언어의 숲' 활동을 "
-                                                        '주도하며 동료들의 비판적 사고를 이끌어내는 팀장으로서 보고서의 논리적 구조를 검토하고 수정하는 등 프로젝트의 완성도를 책임지는 리더십을 발휘함. '
-                                                        "특히 디지털 환경에서의 텍스트 소비 방식 변화가 사고의 깊이에 미치는 영향을 분석하기 위해 '문해력의 배신'을 비롯한 관련 도서를 탐독하고, "
-                                                        "단순한 정보 습득을 넘어 텍스트의 맥락을 파악하는 능력을 기르기 위한 '디지털 리터러시 교육 모델'을 제안함. 이 과정에서 능동적이고 자발적으로 "
-                                                        '지식을 확장하며 인문학적 소양을 쌓는 데 매진함.'},
-                                                 {'학년': '2',
-                                                  '영역': '자율활동',
-                                                  '내용': '고전 문학 작품 속에 나타난 시대적 갈등과 현대적 해석의 차이를 설명하여 친구들의 작품 이해를 돕는 멘토 역할을 수행함. 시조의 형식적 특징과 그 '
-                                                        "안에 담긴 화자의 정서를 시대적 배경과 연결하여 분석하는 과정을 논리적으로 설명하고, 특히 '가사 문학의 서사 구조'를 현대 소설의 플롯과 "
-                                                        '비교하여 문학적 변용의 양상을 체계적으로 정리함. 문학 비평의 기초가 되는 텍스트 분석법을 탐구한 후, 다양한 고전 텍스트를 스스로 선정하여 '
-                                                        '비평문을 작성해보며 문학적 통찰력을 내면화하고 언어적 표현력을 극대화함.'},
-                                                 {'학년': '2',
-                                                  '영역': '자율활동',
-                                                  '내용': "학급 부반장으로서 학급 내 독서 토론 문화 활성화를 위해 '주제별 인문학 릴레이 토론'을 제안하였으며, 활동의 교육적 가치와 필요성을 조리 있게 "
-                                                        '설명하여 소극적인 친구들의 참여를 이끌어내는 설득력을 보여줌. 주기적인 학급 회의를 통해 토론의 주제를 선정하고 민주적인 의사결정 과정을 주도하며 '
-                                                        "활동을 총괄함. '격차, 그 지극한 자연스러움'을 읽고 소득 및 교육 격차에 따른 언어적 불평등 문제를 정리하여 공유함. 특히 '디지털 정보 "
-                                                        "격차가 언어적 소외를 심화시키는가'라는 논제를 제안하여 조원들의 큰 호응을 얻었으며, 이를 사회언어학적 관점에서 접근해 정보 취약 계층이 겪는 "
-                                                        '언어적 장벽과 그로 인한 사회적 고립을 심도 있게 분석함. 타인의 의견을 경청하면서도 자신의 논리적 근거를 명확히 피력하는 토론 역량이 탁월함. '
-                                                        "학급 분위기가 해이해질 때마다 '전공 관련 고전 읽기 스터디'를 제안하여 학습 분위기를 조성하고, 친구들과 매일 자습시간을 활용해 문학 작품을 "
-                                                        '함께 읽고 감상을 나누는 등 공동체 의식을 실천함.'},
-                                                 {'학년': '2',
-                                                  '영역': '동아리활동',
-                                                  '내용': "언어와 사회의 상관관계를 탐구하는 인문학 동아리에서 팀장을 맡아, 현대 사회의 급격한 언어 변화가 세대 간 소통에 미치는 영향에 주목함. '디지털 "
-                                                        "매체에서의 신조어 생성과 언어 규범의 충돌'을 주제로 한 프로젝트를 주도하며, 국립국어원 자료와 언어학 관련 논문을 분석하여 언어의 사회적 기능과 "
-                                                        '규범적 가치 사이의 균형을 다룬 보고서를 작성함. 특히 신조어가 단순한 유희를 넘어 특정 집단의 정체성을 형성하는 기제로 작동함을 밝혀내고, 이를 '
-                                                        '동료들과 공유하며 언어의 가변성에 대한 토론을 이끌어냄. 또한, 문학 작품 속 방언이 인물의 성격과 시대적 배경을 어떻게 형상화하는지에 관심을 '
-                                                        "두고, 특정 소설의 텍스트를 분석하여 방언의 문학적 미학을 정리한 소논문을 발표함. 시사 문제와 인문학적 통찰을 결합하여 동아리 소식지에 '언어의 "
-                                                        "생명력과 순화의 경계'라는 칼럼을 기고하였으며, 지역 인문학 세미나에 참여하여 언어 정책의 방향성에 대한 자신의 견해를 논리적으로 피력함."},
-                                                 {'학년': '2',
-                                                  '영역': '동아리활동',
-                                                  '내용': '고전 텍스트의 현대적 재해석을 목표로 하는 독서 토론 동아리에서 한국 근대 문학의 서사 구조를 심층 분석함. 이광수의 계몽주의적 서사와 염상섭의 '
-                                                        '사실주의적 기법을 비교하며, 당대 지식인들이 언어와 문학을 통해 민족의 정체성을 어떻게 정립하려 했는지 연역적 탐구 방법을 적용하여 분석함. 관련 '
-                                                        "연구 서적과 비평문을 섭렵하여 '근대 문학에 나타난 자아의 발견과 언어적 표현'이라는 주제로 심화 보고서를 작성하고, 동아리 연합 발표회에서 근대 "
-                                                        '국어의 형성 과정과 문학적 성취를 발표하여 큰 호응을 얻음. 나아가 현대 시에 나타난 언어 유희와 상징성이 독자의 수용 과정에서 어떻게 '
-                                                        '변주되는지에 관심을 두고, 현대 시인들의 언어 사용 양상을 분석하는 후속 탐구를 진행함. 직접적인 텍스트 분석을 통해 국어국문학적 방법론을 '
-                                                        '체득하였으며, 향후 국어학 연구를 통해 우리말의 구조적 아름다움을 체계적으로 정립하고 싶다는 학문적 포부를 밝힘. 모둠장으로서 토론의 논점을 '
-                                                        '정리하고 다양한 의견을 조율하는 과정에서 탁월한 리더십과 분석적 사고력을 보여줌.'},
-                                                 {'학년': '2',
-                                                  '영역': '진로활동',
-                                                  '내용': '인문학적 소양을 바탕으로 한 텍스트 마이닝 및 디지털 인문학 체험 활동에 참여하여, 3인조 모둠으로 고전 텍스트의 데이터베이스화와 그 활용 '
-                                                        "가능성을 탐구함. 교사-학생 계열 탐색 활동을 통해 '디지털 환경에서의 국어학 연구 방법론'을 주제로, 텍스트 분석 도구를 활용하여 고전 소설의 "
-                                                        '어휘 빈도와 문체적 특징을 시각화하는 사례를 조사하고 소감문을 작성함. 진로 탐색 활동에서 주제 선정부터 역할 분담, 최종 원고 수정과 검토를 '
-                                                        '총괄하며 활동 전반에서 뛰어난 리더십과 책임감을 발휘함. 국어국문학의 하위 분야인 국어학, 고전문학, 현대문학의 유래와 연구 전망을 자세히 '
-                                                        '탐구했으며, 국문학도가 지녀야 할 비판적 시각과 사명감, 텍스트를 대하는 태도에 대해 깊이 고찰함. 이러한 활동을 통해 국어국문학 전공에 대한 '
-                                                        '확신을 얻고 진로를 구체화하는 계기로 삼음. 특히 텍스트의 물리적 형태를 넘어 그 안에 담긴 시대 정신을 디지털 기술로 복원하려는 시도에 큰 '
-                                                        '관심을 보였으며, 실제 체험을 통해 인문학적 지식과 정보 기술의 융합적 사고를 확장함. 모든 활동에 능동적으로 참여하며, 복잡한 텍스트를 '
-                                                        '구조화하여 해석하는 탁월한 논리적 역량을 보여줌.'},
-                                                 {'학년': None,
-                                                  '영역': '세특',
-                                                  '내용': '수업 시간마다 텍스트의 이면을 읽어내는 비판적 독해력이 탁월하며, 문학 작품 속 인물의 심리 변화와 시대적 상황의 상관관계를 분석하는 데 깊은 '
-                                                        '통찰력을 보여줌. 특히 한국 근대 소설에 나타난 언어적 특징과 당대 지식인의 고뇌를 탐구하며, 특정 단백질의 신호 전달 기전이 생물학적 항상성을 '
-                                                        '유지하듯 문학적 장치가 서사의 개연성을 어떻게 구축하는지 비교 분석하는 독창적인 시각을 제시함. 우울증과 같은 현대인의 심리적 결핍이 문학 속에서 '
-                                                        "어떻게 형상화되는지 연구하기 위해 관련 논문을 탐독하고, 이를 '문학적 치유와 언어의 기능'이라는 주제로 정리하여 발표함. 이론적 개념을 단순히 "
-                                                        '나열하는 데 그치지 않고, 구체적인 텍스트 예시를 통해 친구들의 이해를 돕는 과정에서 국어국문학적 소양과 타인을 설득하는 논리적 화법이 돋보임. '
-                                                        '후성유전학적 관점을 문학 비평에 접목하여 환경이 인간의 내면 형성에 미치는 영향을 언어적 관점에서 재해석하는 등 학제 간 융합적 사고를 실천함.'},
-                                                 {'학년': None,
-                                                  '영역': '세특',
-                                                  '내용': '언어의 구조적 원리를 수학적 논리 체계와 연결하여 탐구하는 태도가 매우 인상적임. 발표를 통해 언어의 통사적 구조를 수학적 변환식의 원리에 빗대어 '
-                                                        '설명하며, 복잡한 문장 구조 속에서 의미가 도출되는 과정을 라돈 변환의 사이노그램 추출 원리와 유사한 논리로 분석함. 이변수 함수의 연속성과 미분 '
-                                                        "가능성을 엄밀하게 정의하는 과정에서 언어학적 문법 체계의 엄밀성과 수학적 공리 체계의 유사성을 발견하고, 이를 바탕으로 '언어의 보존장 개념과 "
-                                                        "의미의 불변성'에 관한 탐구 보고서를 작성함. 또한, 생체모방공학 프로젝트에서는 자연의 효율적 구조를 모방한 기술적 아이디어를 인문학적 관점에서 "
-                                                        "재해석하여, 기술이 인간의 삶과 언어적 소통에 미치는 영향을 고찰함. '홍합 족사의 접착 원리'를 사회적 유대와 언어적 결속력에 비유하여 발표하는 "
-                                                        '등 창의적인 비유와 논리적 전개가 탁월함. 팀 프로젝트 과정에서 동료들의 의견을 경청하고, 자신의 생각을 조리 있게 표현하여 공동의 목표를 '
-                                                        '달성하는 협업 능력과 인문학적 상상력을 겸비한 인재임.'}],
-                                  'comments': [{'구분': '국어국문학과 합격 전략',
-                                                '내용': '해당 학생은 인문학적 소양과 비판적 텍스트 분석 역량을 바탕으로 국어국문학과에 최적화된 생기부를 구성하였다. 고전과 현대 문학을 아우르는 폭넓은 '
-                                                      '독서와 이를 사회 현상과 연결 짓는 통찰력은 최상위권 대학 합격의 핵심 동력이 되었으며, 전공에 대한 일관된 관심사가 생기부 전반에 걸쳐 유기적으로 '
-                                                      '배치되어 있다.'},
-                                               {'구분': '심화 탐구의 중요성',
-                                                '내용': '일반고 교육과정의 범위를 넘어선 디지털 인문학 방법론이나 근대 문학의 서사 구조 분석 등 심화 탐구 사례가 돋보인다. 교과 수업에서 파생된 질문을 '
-                                                      '단순히 조사하는 데 그치지 않고, 자신만의 관점으로 재해석하여 학술적 보고서로 발전시킨 점은 특목고 학생들과 비교해도 손색없는 학업 역량을 '
-                                                      '보여준다.'},
-                                               {'구분': '용어 선택의 전문성',
-                                                '내용': "단순히 '언어 파괴'나 '문학 감상'이라는 일반적인 용어 대신, '통사적 구조', '계몽주의적 서사', '사실주의적 기법' 등 국어국문학 전공 분야의 "
-                                                      '전문 용어를 적재적소에 활용하였다. 이러한 용어의 선택은 학생이 해당 학문을 학술적으로 접근하고 있음을 입증하며, 전공에 대한 깊은 이해도를 '
-                                                      '효과적으로 드러낸다.'},
-                                               {'구분': '소재의 구체화',
-                                                '내용': "디지털 매체의 언어 변화라는 다소 광범위한 주제를 '신조어 생성과 언어 규범의 충돌'이라는 구체적인 갈등 지점으로 좁혀 탐구한 점이 매우 우수하다. "
-                                                      '막연한 현상 나열이 아닌, 국립국어원의 자료와 언어학적 이론을 결합하여 자신만의 논리를 전개한 방식은 탐구의 깊이를 더해준다.'},
-                                               {'구분': '키워드의 연속성',
-                                                '내용': '자율활동에서 시작된 언어 문화에 대한 관심이 동아리 활동의 근대 문학 분석, 진로 활동의 디지털 인문학 연구로 이어지는 흐름이 매우 자연스럽다. '
-                                                      "'언어와 사회의 상관관계'라는 핵심 키워드를 중심으로 활동 간의 연결 고리를 견고하게 유지하여 학생의 학문적 정체성을 명확히 구축하였다."},
-                                               {'구분': '활동의 선택과 집중',
-                                                '내용': '다양한 문학 작품을 다루는 과정에서 단순히 작품을 나열하기보다, 특정 작가의 서사 기법이나 시대적 고뇌를 중심으로 탐구의 밀도를 높인 점이 '
-                                                      '인상적이다. 한정된 생기부 분량 내에서 여러 활동을 나열하기보다, 핵심적인 탐구 주제를 선정하여 그 과정에서 얻은 학문적 성취를 심도 있게 기술한 '
-                                                      '전략이 주효했다.'},
-                                               {'구분': '전공 적합성 및 포부',
-                                                '내용': '고전 텍스트의 데이터베이스화와 같은 디지털 인문학적 접근을 통해 국어국문학의 미래 가치를 탐구한 점은 매우 참신하다. 전통적인 문학 연구를 넘어 '
-                                                      '현대적 방법론을 수용하려는 태도와, 이를 통해 우리말과 글의 가치를 보존하고 발전시키겠다는 구체적인 포부는 국어국문학과 인재상에 완벽히 '
-                                                      '부합한다.'}]},
- 'case_6_humanities_public_admin': {'personal_info': {'대상': '서울대학교 행정학과 합격 학생부 종합전형 프로필',
-                                                      '고등학교_유형': '자율형 사립고등학교',
-                                                      '내신_성적': '1.1 ~ 1.3',
-                                                      '주요_특징': '공공정책 및 행정학 전공 적합성, 사회과학 탐구 역량, 정책 분석 및 대안 제시 능력',
-                                                      '총평': '공공정책 및 행정학 전공 적합성, 사회과학 탐구 역량, 정책 분석 및 대안 제시 능력'},
-                                    'activities': [{'학년': '2',
-                                                    '영역': '자율활동',
-                                                    '내용': "공공 정책의 효율적 집행과 사회적 갈등 조정에 관심을 갖고 교내 '사회문제 탐구 동아리' 활동을 주도하며, 복잡한 이해관계가 얽힌 지역 현안을 "
-                                                          '해결하기 위한 민관 협력 모델을 연구함. 특히 도시 재개발 과정에서 발생하는 원주민 이주 대책의 한계를 분석하기 위해 관련 법령과 지자체 '
-                                                          '조례를 검토하고, 조원들의 의견을 수렴하여 정책 제안 보고서를 작성하는 과정에서 탁월한 리더십과 조정 능력을 발휘함. 단순히 자료를 조사하는 '
-                                                          "데 그치지 않고, '행정의 민주성과 효율성'이라는 주제로 심화 독서를 수행하며 공공 서비스 전달 체계의 개선 방안을 논리적으로 도출하는 등 "
-                                                          '예비 행정가로서의 자질을 입증함.'},
-                                                   {'학년': '2',
-                                                    '영역': '자율활동',
-                                                    '내용': '사회과학적 통계 분석 역량을 강화하기 위해 데이터 기반 정책 결정의 중요성을 탐구함. 공공 데이터 포털의 통계 자료를 활용하여 지역별 인구 '
-                                                          '구조 변화와 복지 수요의 상관관계를 분석하고, 이를 시각화하여 친구들에게 정책적 시사점을 설명함. 특히 변수 간의 관계를 파악하기 위해 '
-                                                          '상관계수와 회귀 분석의 기초 개념을 학습하고, 이를 실제 사회 현상에 적용하여 정책의 타당성을 검증하는 과정을 논리적으로 전개함. 복잡한 수치 '
-                                                          '데이터를 해석하여 정책적 대안을 제시하는 연습을 통해 행정학적 의사결정 과정에서 데이터 리터러시가 갖는 가치를 내면화함.'},
-                                                   {'학년': '2',
-                                                    '영역': '자율활동',
-                                                    '내용': "학급 부반장으로서 학급 내 갈등을 민주적으로 해결하기 위한 '학급 자치 규약 제정 프로젝트'를 기획하고 운영함. 구성원 간의 다양한 의견 "
-                                                          '차이를 조율하기 위해 토론의 규칙을 정하고, 다수결의 원칙과 소수 의견 보호의 균형을 맞추는 과정을 통해 민주적 의사결정의 절차적 정당성을 '
-                                                          "몸소 실천함. 또한 '사회 불평등과 공공 정책'을 주제로 한 독서 토론 멘토링에서 '정의란 무엇인가'를 읽고, 현대 사회의 소득 격차와 교육 "
-                                                          '불평등 해소를 위한 국가의 적극적 개입 필요성을 주장함. 특히 취약 계층을 위한 사회 안전망 구축이 단순한 시혜적 복지가 아닌, 사회적 통합을 '
-                                                          "위한 필수적인 행정적 과제임을 강조하며 논리적인 설득력을 보여줌. 학급 분위기 쇄신을 위해 '공공 정책 사례 연구 스터디'를 조직하여 친구들과 "
-                                                          '함께 정책 분석 보고서를 작성하는 등 공동체 발전을 위해 헌신하는 모습을 보임.'},
-                                                   {'학년': '2',
-                                                    '영역': '동아리활동',
-                                                    '내용': "공공 정책의 효율적 집행과 사회적 갈등 조정에 관심을 갖고 교내 '정책 탐구 동아리' 활동을 주도하며, 복잡한 이해관계가 얽힌 지역 현안을 "
-                                                          '해결하기 위한 민관 협력 모델을 연구함. 특히 도시 재개발 과정에서 발생하는 원주민 이주 대책의 한계를 분석하기 위해 관련 법령과 지자체 '
-                                                          '조례를 비교 검토하고, 이해관계자 간의 갈등을 완화할 수 있는 행정적 중재 방안을 담은 보고서를 작성함. 팀원들의 다양한 의견을 수렴하고 '
-                                                          '논리적인 대안을 도출하는 과정에서 탁월한 리더십을 발휘하였으며, 이러한 탐구 결과를 교내 학술제에서 발표하여 정책 결정 과정에서의 시민 참여 '
-                                                          '중요성을 강조함. 또한, 공공 서비스의 사각지대를 해소하기 위한 방안으로 디지털 행정 서비스의 접근성 개선 문제를 다루며, 고령층의 디지털 '
-                                                          '격차 해소를 위한 정책적 제언을 담은 소식지를 발간하는 등 행정학적 문제 해결 역량을 입증함.'},
-                                                   {'학년': '2',
-                                                    '영역': '동아리활동',
-                                                    '내용': '공공 데이터의 활용이 정책의 실효성에 미치는 영향을 알아보기 위한 탐구를 설계하고, 대학 전공 수준의 깊이 있는 정책 분석 보고서를 작성함. '
-                                                          '사회과학 시간에 배운 통계적 분석 방법을 적용하여 지역별 복지 예산 집행 현황과 실제 주민 만족도 간의 상관관계를 분석하고, 예산 배분의 '
-                                                          '효율성을 높이기 위한 구체적인 개선안을 도출함. 과학 동아리 연합 발표회에 참여하여 데이터 기반 행정의 필요성을 역설하여 큰 호응을 얻음. 더 '
-                                                          '나아가 자신의 진로와 연계하여 공공기관의 투명성 제고를 위한 정보 공개 제도의 실태에 관심을 가지고 관련 법률과 선행 연구를 심화 탐구함. '
-                                                          '직접적인 정책 입안 과정에 참여하지 못한 아쉬움을 토로하면서도, 행정학과에 진학한 후 데이터 분석 역량을 바탕으로 증거 기반 '
-                                                          '정책(Evidence-based Policy)을 설계하여 사회적 비용을 최소화하고 공공의 이익을 극대화하는 유능한 행정가가 되겠다는 포부를 '
-                                                          '밝힘. 모둠장으로서 책임감과 뛰어난 상황 대처 능력으로 자료 조사 과정에서의 시행착오를 극복하고 원활하게 모둠을 이끌어 나가는 탁월한 리더십이 '
-                                                          '돋보임.'},
-                                                   {'학년': '2',
-                                                    '영역': '진로활동',
-                                                    '내용': '공공기관 체험 활동에 참여하여 3인조 모둠으로 행정 서비스의 전달 체계를 학습하고, 민원 처리 과정의 효율성을 높이기 위한 개선 방안을 '
-                                                          "도출함. 교사-학생 계열 탐색 활동을 통해 행정학의 하위 분야인 조직론과 정책론을 접목한 '공공 서비스 디자인'이 시민의 행정 만족도를 높이는 "
-                                                          '사례에 대해 탐구하고 소감문을 작성함. 진로 탐색 활동에서 주제 선정부터 역할 분담, 최종 원고 수정과 검토를 맡아 효율적이고 의미 있는 '
-                                                          '활동을 위해 과정 전반에서 뛰어난 리더십과 책임감을 보임. 행정학의 하위 학문 분야인 인사행정, 재무행정, 지방자치론의 유래와 필요성, 전망에 '
-                                                          '대해 자세히 탐구했으며, 공직자가 지녀야 할 공익적 가치관, 판단력, 사명감에 대해 깊이 있게 고찰함. 행정학의 세부 전공 구분법을 정확히 '
-                                                          '이해하여 진로 설정에 큰 도움을 받았으며, 이를 통해 공공 정책 전문가라는 진로를 구체화함. 모든 활동에 적극적이고 능동적인 자세로 참여하는 '
-                                                          '모습이 훌륭함. 행정 시스템의 구조적 원리를 이해한 후 이를 현대 사회의 복잡한 갈등 해결과 접목시켜, 행정 절차의 간소화와 투명한 정보 '
-                                                          '공개가 시민의 신뢰를 회복하는 핵심임을 깨달았으며, 관련 체험을 통해 관심사에 대한 심화 학습을 지속함. 조직 내 갈등을 조정하고 합리적인 '
-                                                          '의사결정을 이끌어내는 행정가의 자질을 보여줌.'},
-                                                   {'학년': None,
-                                                    '영역': '세특',
-                                                    '내용': '사회문제 탐구 수업에서 공공 정책의 집행 과정과 사회적 갈등 조정 기제에 깊은 관심을 보임. 특히 현대 사회의 양극화 현상이 정책 수용성에 '
-                                                          '미치는 영향을 분석하기 위해, 공공 서비스 전달 체계의 효율성과 형평성 간의 상충 관계를 다룬 논문들을 비판적으로 검토함. 정책 결정 과정에서 '
-                                                          '발생하는 정보 비대칭성 문제를 해결하기 위한 민관 협력 모델의 필요성을 역설하며, 이를 행정학적 관점에서 재해석한 보고서를 작성함. 또한, '
-                                                          "후속 탐구로 정책 평가의 객관성을 확보하기 위한 후성유전학적 접근이 아닌 '사회적 후성유전' 개념을 도입하여, 특정 정책이 지역 공동체의 "
-                                                          '문화와 제도적 관습에 미치는 장기적 영향을 자신만의 논리로 정리함. 이론적 탐구에 그치지 않고 실제 사례를 들어 정책의 실효성을 설명하는 '
-                                                          '과정에서 동료들의 이해를 돕는 등 학술적 소통 능력과 행정학적 통찰력을 동시에 보여줌.'},
-                                                   {'학년': None,
-                                                    '영역': '세특',
-                                                    '내용': '정책 분석의 정량적 방법론을 익히기 위해 통계적 추론과 수학적 모델링의 원리를 탐구함. 공공 데이터의 신뢰성을 검증하는 과정에서 활용되는 표본 '
-                                                          '오차와 회귀 분석의 수학적 근거를 라그랑주 승수법과 자코비안 변환을 통해 엄밀하게 증명함. 특히 다변수 함수를 활용한 정책 효과 예측 모델에서 '
-                                                          '변수 간의 상관관계를 벡터장의 보존 개념으로 해석하며, 정책 변동이 사회 시스템의 평형 상태에 미치는 영향을 논리적으로 규명함. 또한, 공공 '
-                                                          "서비스 디자인 프로젝트에서는 '데이터 기반 행정'을 주제로, 지역별 복지 수요를 예측하고 자원을 최적 배분하기 위한 알고리즘을 제안함. 팀 "
-                                                          '프로젝트를 통해 홍합 족사의 접착 원리를 사회적 네트워크의 결속력 강화 기제로 은유하여, 지역 사회 내 갈등 관리 및 공동체 회복을 위한 '
-                                                          '정책적 아이디어를 제안서로 구체화함. 타인의 의견을 경청하고 자신의 논리를 조리 있게 개진하는 태도가 돋보이며, 행정학적 문제 해결을 위한 '
-                                                          '융합적 사고 역량이 매우 뛰어남.'}],
-                                    'comments': [{'구분': '행정학과 합격 전략',
-                                                  '내용': '본 학생은 서울대학교를 비롯한 최상위권 대학 행정학과 합격자로서, 공공 정책의 이론적 토대와 실무적 적용 능력을 균형 있게 보여주었다. 특히 정책 '
-                                                        '결정 과정에서의 갈등 관리와 데이터 기반의 의사결정 역량을 강조한 생기부 구성 전략이 입학사정관에게 행정학적 소양을 갖춘 인재로 평가받는 데 '
-                                                        '결정적인 역할을 했다.'},
-                                                 {'구분': '심화 탐구의 중요성',
-                                                  '내용': '일반적인 사회과학 탐구 수준을 넘어, 정책 분석의 정량적 방법론과 통계적 추론의 수학적 근거를 엄밀하게 증명하는 등 학문적 깊이를 보여주었다. '
-                                                        '교과 과정에서 파생된 질문을 학술적 수준의 탐구로 확장함으로써, 단순한 지식 습득을 넘어 행정학적 방법론을 체득했음을 효과적으로 증명했다.'},
-                                                 {'구분': '용어 선택의 전문성',
-                                                  '내용': "단순히 '사회 문제 해결'이라는 포괄적인 표현을 사용하는 대신, '민관 협력 모델', '공공 서비스 전달 체계의 효율성', '정책 수용성' 등 "
-                                                        '행정학 전공 분야의 핵심 전문 용어를 적재적소에 배치하였다. 이러한 용어 선택은 학생이 해당 학문에 대한 깊은 이해와 학술적 언어 체계를 갖추고 '
-                                                        '있음을 보여준다.'},
-                                                 {'구분': '소재의 구체화',
-                                                  '내용': "도시 재개발이라는 일반적인 소재를 다룰 때도 단순히 현상을 나열하는 데 그치지 않고, '원주민 이주 대책의 한계와 민관 협력 모델의 대안'과 같이 "
-                                                        '구체적인 정책적 쟁점을 설정하였다. 이는 학생이 사회 현상을 행정학적 관점에서 구조화하고 대안을 제시할 수 있는 분석적 사고력을 갖추었음을 잘 '
-                                                        '보여준다.'},
-                                                 {'구분': '키워드의 연속성',
-                                                  '내용': "자율활동에서 시작된 '공공 정책의 효율적 집행'이라는 주제가 동아리 활동의 '데이터 기반 정책 분석'과 진로활동의 '공공 서비스 디자인'으로 "
-                                                        '이어지는 일관된 서사는 학생의 전공 분야에 대한 집요한 탐구 열정과 관심의 연속성을 매우 효과적으로 드러낸다.'},
-                                                 {'구분': '활동의 선택과 집중',
-                                                  '내용': '다양한 사회적 이슈를 나열하기보다, 공공 데이터 활용과 통계적 분석이라는 핵심 역량에 집중하여 탐구의 깊이를 확보하였다. 한정된 생기부 분량 '
-                                                        '내에서 단순 조사 활동을 지양하고, 스스로 설계한 분석 모델과 그에 따른 정책적 시사점을 도출하는 과정에 집중한 점이 매우 훌륭하다.'},
-                                                 {'구분': '행정학과 전공 적합성',
-                                                  '내용': '학급 자치 규약 제정 프로젝트를 통해 민주적 의사결정 과정을 직접 운영해 본 경험과, 이를 행정학의 조직론적 관점에서 해석하려는 시도는 행정학과에 '
-                                                        '대한 뚜렷한 진로 의지와 실천적 역량을 동시에 보여주는 매우 우수한 사례이다.'}]},
- 'case_6_natural_science_mathematics': {'personal_info': {'대상': '서울대학교 수리과학부 합격 학생부',
-                                                          '고등학교_유형': '과학중점 일반고',
-                                                          '내신_성적': '1.02',
-                                                          '주요_특징': '수학 및 이론물리학 심화 탐구, 수리과학부 진학 희망',
-                                                          '총평': '수학 및 이론물리학 심화 탐구, 수리과학부 진학 희망'},
-                                        'activities': [{'학년': '2',
-                                                        '영역': '자율활동',
-                                                        '내용': "수학적 모델링을 통한 복잡계 현상 분석에 깊은 관심을 두고 교내 수학 탐구 동아리 '매스랩'의 팀장으로서 비선형 동역학 시스템의 안정성 "
-                                                              '분석 프로젝트를 주도함. 로지스틱 맵을 활용한 혼돈 이론의 기초를 학습하고, 초기값의 미세한 변화가 결과에 미치는 나비 효과를 수치 '
-                                                              '해석적으로 시뮬레이션하여 보고서의 논리적 완결성을 높임. 특히 미분방정식을 이용한 전염병 확산 모델인 SIR 모델을 변형하여 특정 '
-                                                              '지역의 인구 이동 데이터를 대입, 실시간 확산 예측 알고리즘을 설계하는 과정에서 파이썬을 활용한 데이터 시각화와 오차 분석을 수행하며 '
-                                                              '수학적 추론 능력을 입증함.'},
-                                                       {'학년': '2',
-                                                        '영역': '자율활동',
-                                                        '내용': '위상수학의 기초 개념인 오일러 지표와 그래프 이론을 결합하여 네트워크의 연결성을 분석하는 심화 탐구를 수행함. 평면 그래프의 성질을 '
-                                                              '이용해 복잡한 회로망의 최단 경로를 찾는 알고리즘을 직접 구현하고, 다익스트라 알고리즘의 시간 복잡도를 행렬 연산의 관점에서 재해석하여 '
-                                                              '효율적인 경로 탐색 방안을 제시함. 또한 가우스 기호를 포함한 함수들의 합성 과정에서 발생하는 불연속점의 개수를 수열의 극한으로 '
-                                                              '일반화하는 과정을 논리적으로 증명하였으며, 이를 기하학적 해석과 대수적 풀이로 병행하여 친구들에게 설명함으로써 수학적 의사소통 역량을 '
-                                                              '발휘함.'},
-                                                       {'학년': '2',
-                                                        '영역': '자율활동',
-                                                        '내용': "학급 부반장으로서 '수리과학부 진학을 위한 전공 심화 스터디'를 조직하여 교과서 밖의 심화 수학 주제를 탐구하는 학습 문화를 조성함. "
-                                                              '선형대수학의 고유값과 고유벡터 개념을 활용한 구글의 페이지랭크 알고리즘을 주제로 세미나를 개최하고, 행렬의 거듭제곱이 정보의 중요도를 '
-                                                              "어떻게 수렴시키는지에 대해 동료들과 토론함. 또한 '수학으로 보는 세상'이라는 독서 토론 모임에서 수학적 불평등 지수인 지니계수의 산출 "
-                                                              '원리를 적분과 확률 분포의 관점에서 재해석하여 발표함. 단순한 지식 습득을 넘어 수학적 도구가 사회적 현상을 어떻게 정량화하고 분석할 '
-                                                              '수 있는지에 대한 통찰을 보여주었으며, 학급 내 학습 분위기를 주도적으로 이끌어 공동체의 학업 역량 상향 평준화에 크게 기여함.'},
-                                                       {'학년': '2',
-                                                        '영역': '동아리활동',
-                                                        '내용': "수학 탐구 동아리 '매스랩'의 팀장으로서 수리과학부 진학을 목표로 비선형 동역학 시스템의 안정성 분석 프로젝트를 주도함. 로지스틱 맵을 "
-                                                              '활용한 혼돈 이론의 기초를 학습하고, 초기값의 미세한 변화가 결과에 미치는 나비 효과를 수치 해석적으로 증명하는 보고서를 작성함. 특히 '
-                                                              '미분방정식의 해가 갖는 위상적 성질을 탐구하며, 동아리 부원들에게 고차원 행렬 연산을 통한 시스템 안정성 판별법을 강의하여 팀의 학술적 '
-                                                              '역량을 상향 평준화함. 또한, 암호학의 기초가 되는 정수론적 접근을 통해 RSA 암호 체계의 소인수 분해 알고리즘을 구현하고, 양자 '
-                                                              '컴퓨터 시대에 대비한 격자 기반 암호의 수학적 원리를 분석하여 교내 학술제에서 발표함. 시사 문제와 수학의 연결에도 관심을 두어, '
-                                                              '전염병 확산 모델인 SIR 모델을 미분방정식으로 재구성하고, 변수 간의 상관관계를 행렬로 표현하여 확산 속도를 예측하는 모델링을 수행해 '
-                                                              '지역 수학 동아리 연합 세미나에서 우수한 평가를 받음.'},
-                                                       {'학년': '2',
-                                                        '영역': '동아리활동',
-                                                        '내용': '그래프 이론과 위상수학의 개념을 결합하여 복잡한 네트워크의 연결성을 분석하는 심화 탐구를 설계하고 수행함. 평면 그래프의 오일러 지표를 '
-                                                              '활용하여 회로망의 최단 경로를 찾는 알고리즘을 최적화하였으며, 다익스트라 알고리즘의 시간 복잡도를 행렬 연산의 관점에서 재해석하여 '
-                                                              '효율적인 경로 탐색 모델을 도출함. 과학 동아리 연합 발표회에서 네트워크의 중심성 지표가 정보 전달 효율에 미치는 영향을 수학적으로 '
-                                                              '증명하여 큰 호응을 얻음. 더 나아가 자신의 진로와 연계하여 위상수학적 데이터 분석(TDA) 기법을 활용한 생체 데이터의 패턴 인식에 '
-                                                              '관심을 가지고, 관련 논문을 찾아 심화 탐구를 수행함. 비록 실제 대규모 데이터 처리는 제한적이었으나, 수리과학부 진학 후 위상수학적 '
-                                                              '기법을 데이터 과학에 접목하여 복잡한 비정형 데이터 속에서 유의미한 기하학적 구조를 찾아내는 연구자가 되겠다는 구체적인 포부를 밝힘. '
-                                                              '모둠장으로서 복잡한 수식의 오류를 검증하고 팀원들의 논리적 비약을 교정하는 등 탁월한 리더십을 발휘함.'},
-                                                       {'학년': '2',
-                                                        '영역': '진로활동',
-                                                        '내용': '3D 기하학적 구조를 이해하기 위한 체험 활동에 참여하여 3D 펜을 활용한 입체 도형 구성 원리를 탐구함. 교사-학생 계열 탐색 활동을 '
-                                                              "통해 3D 프린팅 기술에 수학적 최적화 알고리즘을 접목한 '위상 최적화 설계'가 구조물의 강도와 효율을 극대화하는 사례를 분석하고 "
-                                                              '소감문을 작성함. 진로 탐색 활동에서 주제 선정부터 역할 분담, 최종 논리 검토를 맡아 활동 전반에서 뛰어난 리더십과 책임감을 보임. '
-                                                              '수리과학부 진학을 위해 현대 수학의 하위 분야인 대수기하학, 해석학, 위상수학의 유래와 현대적 응용 분야를 자세히 탐구했으며, 수학자가 '
-                                                              '지녀야 할 논리적 엄밀함과 창의적 문제 해결 능력에 대해 고찰함. 수학적 모델링이 공학적 설계에 미치는 영향력을 정확히 파악하여 진로를 '
-                                                              '구체화하는 계기로 삼음. 특히 3D 공간에서의 곡면 방정식을 활용하여 필라멘트의 적층 경로를 수학적으로 최적화하는 방안을 제시하였는데, '
-                                                              '이는 실제 기하학적 원리를 공학적 설계에 적용하는 훌륭한 사례로 평가받음. 모든 활동에 능동적으로 참여하며 수학적 사고를 현실 문제 '
-                                                              '해결에 적용하려는 태도가 매우 돋보임.'},
-                                                       {'학년': None,
-                                                        '영역': '세특',
-                                                        '내용': '수학적 모델링을 통한 복잡계 분석에 탁월한 역량을 보임. 미분방정식을 활용한 동역학 시스템의 평형점 안정성 분석을 주제로, 로지스틱 '
-                                                              '맵의 매개변수 변화에 따른 분기 현상을 수치 해석적으로 규명함. 특히 초기값의 미세한 차이가 시스템의 장기적 거동에 미치는 나비 효과를 '
-                                                              '정량적으로 증명하기 위해 파이썬을 활용한 시뮬레이션을 수행하였으며, 이를 통해 혼돈 이론의 수학적 기초를 탄탄히 다짐. 또한, '
-                                                              '선형대수학의 고유값 분해를 응용하여 고차원 데이터의 차원을 축소하는 주성분 분석(PCA)의 원리를 탐구하고, 이를 실제 데이터셋에 '
-                                                              '적용하여 변수 간의 상관관계를 시각화하는 과정을 보고서로 작성함. 이론적 탐구에 그치지 않고, 행렬의 대각화가 복잡한 연립 미분방정식의 '
-                                                              '해를 구하는 데 어떻게 기여하는지를 논리적으로 서술하여 수학적 추론 능력을 입증함.'},
-                                                       {'학년': None,
-                                                        '영역': '세특',
-                                                        '내용': '위상수학적 관점에서 네트워크의 연결성을 분석하는 심화 탐구를 수행함. 오일러 지표와 그래프 이론의 정리를 결합하여 복잡한 회로망 내 '
-                                                              '최단 경로 탐색 알고리즘을 최적화하였으며, 다익스트라 알고리즘의 시간 복잡도를 행렬 연산의 관점에서 재해석함. 특히 라돈 변환의 수학적 '
-                                                              '원리를 탐구하며 적분 기하학의 기초를 다졌고, 벡터장의 보존성 및 그린 정리를 증명하는 과정에서 미적분학의 기본 원리를 엄밀하게 '
-                                                              '고찰함. 입실론-델타 논법을 사용하여 이변수 함수의 연속성을 정의하고, 자코비안 행렬을 이용한 변수 변환이 중적분 계산의 효율성에 '
-                                                              '미치는 영향을 분석함. 또한, 생체모방공학 프로젝트에서 홍합 족사의 접착 메커니즘을 수학적 모델링으로 치환하여, 분자 간 결합력을 '
-                                                              '기하학적 구조와 연계해 설명하는 독창적인 시각을 제시함. 추상적인 수학적 개념을 공학적 문제 해결에 적용하는 능력이 매우 뛰어나며, '
-                                                              '논리적 엄밀함을 바탕으로 자신의 탐구 과정을 체계적으로 구조화하는 역량이 돋보임.'}],
-                                        'comments': [{'구분': '수리과학부 합격 전략',
-                                                      '내용': '서울대학교 수리과학부 합격자로서 수학적 추상화 능력과 논리적 엄밀함을 동시에 증명한 사례임. 단순한 교과 성적 우수함을 넘어, 비선형 '
-                                                            '동역학 및 위상수학 등 대학 과정의 기초를 고교 교육과정 내에서 창의적으로 재해석하여 전공 적합성을 극대화한 전략이 주효했음.'},
-                                                     {'구분': '심화 탐구의 중요성',
-                                                      '내용': '일반고 교육과정의 범위를 넘어선 비선형 동역학, 그래프 이론, 행렬 연산의 시간 복잡도 분석 등 고난도 주제를 다룬 점이 매우 인상적임. '
-                                                            '교과 개념을 도구로 삼아 복잡계 현상을 모델링하는 과정은 특목고 최상위권 학생들과 비교해도 손색없는 학술적 깊이를 보여줌.'},
-                                                     {'구분': '용어 선택의 전문성',
-                                                      '내용': "단순히 '수학적 분석'이라는 표현을 사용하는 대신, '분기 현상', '수치 해석적 규명', '오일러 지표'와 같은 수학적 전문 용어를 "
-                                                            '적재적소에 배치하여 탐구의 정밀도를 높임. 특히 알고리즘의 효율성을 행렬 연산의 관점에서 재해석한 부분은 수리과학부 지망생으로서의 학문적 '
-                                                            '태도를 잘 드러냄.'},
-                                                     {'구분': '소재의 구체화',
-                                                      '내용': "3D 기하학적 구조 탐구에서 멈추지 않고, 이를 '위상 최적화 설계'라는 공학적·수학적 난제로 연결한 점이 탁월함. 단순한 도구 활용 "
-                                                            '경험을 넘어, 수학적 원리가 실제 구조물의 강도와 효율성에 미치는 영향을 수리적으로 모델링하려는 시도는 매우 고무적임.'},
-                                                     {'구분': '키워드의 연속성',
-                                                      '내용': '자율활동에서 시작된 복잡계 시스템에 대한 관심이 동아리 활동의 비선형 동역학 프로젝트와 진로활동의 위상 최적화 설계로 이어지는 서사가 매우 '
-                                                            '유기적임. 수학적 모델링이라는 일관된 키워드를 통해 학생의 지적 호기심이 어떻게 심화되고 확장되는지 효과적으로 보여줌.'},
-                                                     {'구분': '활동의 선택과 집중',
-                                                      '내용': '동아리 활동에서 여러 주제를 나열하기보다, 로지스틱 맵을 활용한 혼돈 이론 분석이라는 하나의 핵심 주제에 집중하여 탐구의 밀도를 높인 점이 '
-                                                            '훌륭함. 초기값의 미세한 변화가 시스템에 미치는 영향을 수치 해석적으로 증명하는 과정에서 학생의 논리적 사고력이 돋보임.'},
-                                                     {'구분': '수리과학부 전공 적합성',
-                                                      '내용': '다익스트라 알고리즘의 시간 복잡도를 행렬 연산으로 재해석하고, 이를 회로망 최적화에 적용한 실험 설계는 수리과학부에서 요구하는 수학적 문제 '
-                                                            '해결 역량을 완벽히 입증함. 추상적인 수학 이론을 실질적인 문제 해결의 도구로 변환하는 능력이 매우 뛰어남.'}]},
- 'case_6_natural_science_materials': {'personal_info': {'대상': '서울대학교 재료공학부 합격 학생부',
-                                                        '고등학교_유형': '과학중점 일반고',
-                                                        '내신_성적': '1.1 ~ 1.3',
-                                                        '주요_특징': '재료공학부, 신소재공학, 나노기술 및 에너지 소자 연구',
-                                                        '총평': '재료공학부, 신소재공학, 나노기술 및 에너지 소자 연구'},
-                                      'activities': [{'학년': '2',
-                                                      '영역': '자율활동',
-                                                      '내용': "차세대 에너지 저장 장치인 리튬 이온 배터리의 효율을 극대화하기 위한 전극 소재 연구에 관심을 갖고 교내 과학 탐구 동아리 '나노테크'의 "
-                                                            '팀장으로서 실험 설계와 데이터 분석을 주도함. 실리콘 음극재의 부피 팽창 문제를 해결하기 위해 탄소 나노튜브를 활용한 복합체 구조를 '
-                                                            "고안하고, 이를 구현하기 위한 최적의 합성 조건을 탐색하는 보고서를 작성함. 단순히 이론적 조사에 그치지 않고 '신소재 공학의 이해'를 "
-                                                            '탐독하며 금속-유기 골격체(MOF)를 활용한 에너지 밀도 향상 방안을 심도 있게 분석함. 팀원들과 함께 실험 데이터를 시각화하여 전극의 '
-                                                            '전기화학적 특성 변화를 논리적으로 설명하는 등 공학적 문제 해결 역량과 리더십을 동시에 보여줌.'},
-                                                     {'학년': '2',
-                                                      '영역': '자율활동',
-                                                      '내용': '미분 방정식을 활용한 재료의 열전도 모델링에 흥미를 느끼고, 금속 박막의 온도 변화를 예측하는 수식을 유도하여 친구들에게 설명함. 특히 '
-                                                            '경계 조건에 따른 열확산 방정식의 해를 구하는 과정에서 변수 분리법을 적용하고, 이를 수치 해석적으로 검증하는 과정을 논리적으로 전개함. '
-                                                            '가우스 기호를 포함한 함수를 활용하여 재료 내부의 결정 격자 구조에 따른 에너지 밴드갭의 불연속성을 수학적으로 모델링하는 탐구를 수행함. '
-                                                            '복잡한 수식을 기하학적으로 해석하여 재료의 물리적 성질을 예측하는 일반적인 방법론을 정립하고, 이를 바탕으로 심화 문제들을 해결하며 수학적 '
-                                                            '사고력을 공학적 설계에 적용하는 능력을 입증함.'},
-                                                     {'학년': '2',
-                                                      '영역': '자율활동',
-                                                      '내용': "학급 부반장으로서 공학적 사고를 기반으로 한 '전공 심화 스터디'를 제안하여 학급 내 학습 분위기를 주도함. '재료의 미래: 신소재가 "
-                                                            "바꾸는 세상'이라는 주제로 독서 토론을 기획하고, 탄소 중립을 위한 친환경 소재 개발의 필요성을 역설하며 친구들의 참여를 이끌어냄. 특히 "
-                                                            '반도체 공정에서의 소재 결함 문제를 다룬 논문을 발췌하여 기술적 한계와 극복 방안을 토론하는 과정에서, 다각적인 분석을 통해 논리적 '
-                                                            '타당성을 확보하는 능력을 보여줌. 학급 구성원들의 진로가 다양함에도 불구하고, 각자의 전공 분야와 재료공학의 접점을 찾아 융합적 사고를 할 '
-                                                            '수 있도록 멘토링을 진행함. 학급의 학습 효율을 높이기 위해 매일 자습 시간마다 과목별 질의응답 시스템을 구축하고, 데이터 기반의 학습 '
-                                                            '진도 관리표를 제작하여 운영하는 등 체계적이고 책임감 있는 태도로 학급의 성장을 이끌어 타의 모범이 됨.'},
-                                                     {'학년': '2',
-                                                      '영역': '동아리활동',
-                                                      '내용': '재료공학적 관점에서 에너지 변환 효율을 극대화하는 나노 소재 연구에 몰입하며, 동아리 팀장으로서 실험 설계와 데이터 분석을 주도함. 생체 '
-                                                            '내 에너지 전달 메커니즘인 ATP의 화학적 구조와 에너지 효율성에 주목하여, 이를 모방한 인공 광합성 소자 및 고효율 에너지 저장 장치에 '
-                                                            "관한 심화 탐구 보고서를 작성함. 특히 '과산화수소 분해를 통한 촉매 활성도 측정 실험'에서 금속 나노 입자의 표면적 변화가 반응 속도에 "
-                                                            '미치는 영향을 정량적으로 분석하여 교내 학술제 최우수 프로젝트로 선정됨. 또한, 차세대 반도체 공정의 핵심인 박막 증착 기술의 원리를 '
-                                                            '탐구하고, 시사 이슈인 폐의약품 내 유기 화합물의 환경 오염 문제를 재료학적으로 해결하기 위해 고분자 흡착제를 활용한 정화 효율 비교 '
-                                                            '실험을 수행함. 이 결과를 지역 과학 동아리 연합 세미나에서 발표하며, 공학적 문제 해결 능력을 입증함.'},
-                                                     {'학년': '2',
-                                                      '영역': '동아리활동',
-                                                      '내용': '나노 소재의 표면 특성이 항균 및 기능성 코팅에 미치는 영향에 관심을 두고, 금속 산화물 나노 입자와 천연 고분자를 결합한 복합 소재의 '
-                                                            '항균 성능을 탐구함. 연역적 탐구 방법을 적용하여 편백나무 추출물과 산화아연 나노 입자의 혼합 비율에 따른 대장균 사멸 효과를 측정하고, '
-                                                            '소재의 농도와 항균 지속성 간의 상관관계를 도출함. 과학 동아리 연합 발표회에서 해당 소재의 산업적 응용 가능성을 제시하여 큰 호응을 '
-                                                            '얻음. 나아가 프로폴리스의 화학적 성분을 분석하고 이를 고분자 매트릭스에 함침시켜 구강 내 유해균을 제어하는 기능성 재료 개발에 대한 심화 '
-                                                            '보고서를 작성함. 비록 실험 환경의 제약으로 직접 구현하지 못한 부분은 추후 재료공학부 진학 후 고분자 합성 및 나노 복합체 설계 연구를 '
-                                                            '통해 최적의 항균 코팅제를 개발하겠다는 구체적인 연구 계획으로 발전시킴. 모둠장으로서 실험 과정의 변수를 통제하고 데이터의 신뢰성을 '
-                                                            '확보하는 리더십을 발휘함.'},
-                                                     {'학년': '2',
-                                                      '영역': '진로활동',
-                                                      '내용': '3D 프린팅 기술을 활용한 적층 제조(Additive Manufacturing) 공정의 원리를 탐구하고, 이를 재료공학적 관점에서 분석함. '
-                                                            '3D 펜의 필라멘트 압출 원리를 이해한 후, 바이오 프린팅에 사용되는 하이드로젤 기반 잉크의 점탄성(Viscoelasticity)과 경화 '
-                                                            '특성이 출력물의 정밀도에 미치는 영향을 고찰함. 교사-학생 계열 탐색 활동을 통해 생체 적합성 소재인 '
-                                                            'PCL(Polycaprolactone)과 줄기세포를 결합한 인공 조직 지지체(Scaffold) 제작 사례를 조사하고, 소재의 기계적 강도와 '
-                                                            '생분해 속도를 조절하는 공학적 설계 방안을 소감문으로 정리함. 진로 탐색 활동에서는 3D 프린팅 소재의 물성 개선을 위한 나노 필러 첨가 '
-                                                            '기술을 주제로 선정하여, 역할 분담과 최종 원고 검토를 주도하며 뛰어난 리더십을 보임. 특히 가열 후 냉각 과정에서 발생하는 고분자의 '
-                                                            '결정화 현상이 출력물의 구조적 안정성에 미치는 영향을 분석하며, 재료공학자로서 갖추어야 할 소재 물성 제어 역량을 키움. 모든 활동에서 '
-                                                            '이론적 배경을 실제 공학적 문제 해결에 적용하려는 능동적인 태도가 돋보임.'},
-                                                     {'학년': None,
-                                                      '영역': '세특',
-                                                      '내용': '물리화학적 관점에서 재료의 결정 구조와 결함이 전기적 특성에 미치는 영향에 깊은 관심을 보임. 특히 반도체 소자의 성능을 결정짓는 도핑 '
-                                                            '농도와 전하 이동도 간의 상관관계를 탐구하기 위해 고체물리학적 접근을 시도함. 결정 격자 내 불순물 원자가 형성하는 에너지 준위가 전자의 '
-                                                            '거동에 미치는 영향을 분석하고, 이를 바탕으로 차세대 전력 반도체 소재인 질화갈륨(GaN)의 물성적 우수성을 논리적으로 정리함. 또한, '
-                                                            '재료의 상변화 과정에서 발생하는 엔트로피 변화를 열역학적으로 해석하여, 비정질 합금의 유리 전이 현상을 설명하는 모델을 탐구함. 수업 '
-                                                            '시간에 다룬 결정 구조 이론을 실제 신소재 개발 사례와 연결하여 발표함으로써, 이론적 지식이 공학적 설계로 이어지는 과정을 급우들에게 '
-                                                            '명확히 전달함. 스스로 재료의 미세 구조 제어를 통한 물성 최적화라는 공학적 문제의식을 정립하고, 이를 학술적 언어로 체계화하는 능력이 '
-                                                            '매우 탁월함.'},
-                                                     {'학년': None,
-                                                      '영역': '세특',
-                                                      '내용': '재료공학적 설계의 핵심인 수치 해석적 접근을 위해 벡터 미적분학의 원리를 심도 있게 탐구함. 금속 박막의 열확산 과정을 모델링하기 위해 '
-                                                            '라플라스 방정식과 경계값 문제를 설정하고, 이를 유한요소법(FEM)으로 해석하는 수학적 기초를 다짐. 특히 자코비안 행렬을 이용한 좌표 '
-                                                            '변환을 통해 복잡한 형상의 재료 내부 응력 분포를 계산하는 과정을 증명하며, 수학적 도구가 공학적 해석에 필수적임을 체득함. 또한, '
-                                                            '생체모방공학 프로젝트에서 홍합 족사의 단백질 구조를 모방한 고분자 접착제 개발을 주도함. 홍합의 카테콜(Catechol) 작용기가 금속 '
-                                                            '표면과 형성하는 배위 결합의 원리를 화학적으로 분석하고, 이를 바탕으로 수중 환경에서도 접착력을 유지하는 하이드로젤 복합 소재를 설계함. '
-                                                            '팀 과제에서 접착제의 인장 강도와 점탄성을 최적화하기 위한 가교 밀도 조절 방안을 제안하였으며, 실험 데이터의 통계적 유의성을 검증하여 '
-                                                            '최적의 배합비를 도출함. 공학적 문제 해결을 위해 다학제적 지식을 융합하고, 이를 시제품 제작이라는 실천적 결과물로 연결하는 역량이 매우 '
-                                                            '뛰어남.'}],
-                                      'comments': [{'구분': '재료공학부 합격 전략',
-                                                    '내용': '해당 학생은 에너지 소자 및 나노 소재 분야에 대한 일관된 탐구 서사를 구축하여 서울대학교 재료공학부 합격이라는 성과를 거둠. 단순한 공학적 '
-                                                          '호기심을 넘어, 리튬 이온 배터리나 반도체 소자 등 구체적인 산업적 난제를 해결하려는 시도가 생기부 전반에 녹아 있어 전공 적합성이 매우 높게 '
-                                                          '평가됨.'},
-                                                   {'구분': '심화 탐구의 중요성',
-                                                    '내용': '일반고 교육과정의 범위를 넘어선 미분 방정식의 수치 해석적 접근이나 유한요소법(FEM)과 같은 공학적 모델링 기법을 적극적으로 활용함. 교과 '
-                                                          '개념을 단순히 나열하는 데 그치지 않고, 이를 재료의 열전도나 결정 구조 분석에 적용하여 특목고 학생들과 비교해도 손색없는 학술적 깊이를 '
-                                                          '보여줌.'},
-                                                   {'구분': '용어 선택의 전문성',
-                                                    '내용': "단순히 '신소재'라는 포괄적 용어를 사용하기보다 '실리콘 음극재의 부피 팽창', '도핑 농도와 전하 이동도의 상관관계', '하이드로젤의 "
-                                                          "점탄성' 등 재료공학 분야의 핵심 전문 용어를 정확한 맥락에서 사용함. 이는 해당 분야에 대한 학생의 지식 수준이 학부 수준의 기초 이론에 "
-                                                          '근접해 있음을 시사함.'},
-                                                   {'구분': '소재의 구체화',
-                                                    '내용': '3D 프린팅 기술을 단순히 제작 도구로 활용하는 것에 머물지 않고, 바이오 프린팅 잉크의 점탄성 분석이라는 재료공학적 관점으로 주제를 구체화한 '
-                                                          '점이 탁월함. 소재의 물성을 공학적으로 해석하려는 시도는 학생이 가진 연구자로서의 자질을 잘 보여주는 대목임.'},
-                                                   {'구분': '키워드의 연속성',
-                                                    '내용': '자율활동에서 시작된 에너지 저장 장치에 대한 관심이 동아리 활동의 나노 소재 연구와 진로활동의 적층 제조 공정 분석으로 유기적으로 연결됨. '
-                                                          '이러한 일관된 탐구 흐름은 학생이 재료공학이라는 학문을 다각도에서 조망하고 있음을 효과적으로 증명함.'},
-                                                   {'구분': '활동의 선택과 집중',
-                                                    '내용': '동아리 활동에서 나노 입자의 항균 성능 탐구와 같은 실험적 시도는 매우 훌륭하나, 실험 설계 과정에서 변인 통제와 데이터 분석의 논리적 연결을 '
-                                                          '더욱 강조할 필요가 있음. 한정된 분량 내에서 실험의 성공 여부보다 실패를 통해 얻은 공학적 통찰을 기술하는 것이 더 높은 평가를 받을 수 '
-                                                          '있음.'},
-                                                   {'구분': '재료공학 전공 적합성',
-                                                    '내용': '금속 산화물 나노 입자와 고분자 복합 소재의 특성을 탐구하고, 이를 실제 소자 설계에 적용하려는 포부를 밝힌 점은 재료공학부 진학을 위한 '
-                                                          '최적의 준비 과정임. 특히 수학적 모델링과 실험적 검증을 병행하는 탐구 방식은 향후 공학 연구자로서 성장할 가능성을 충분히 입증함.'}]},
- 'case_6_natural_science_computer_science': {'personal_info': {'대상': '서울대학교 컴퓨터공학부 합격 학생부',
-                                                               '고등학교_유형': '과학중점 일반고',
-                                                               '내신_성적': '1.02',
-                                                               '주요_특징': '알고리즘 설계, 인공지능 모델링, 컴퓨터공학부',
-                                                               '총평': '알고리즘 설계, 인공지능 모델링, 컴퓨터공학부'},
-                                             'activities': [{'학년': '2',
-                                                             '영역': '자율활동',
-                                                             '내용': "컴퓨터 비전 기술을 활용한 객체 인식의 정확도 향상에 관심을 갖고 교내 'AI 알고리즘 연구회'를 주도하며 팀장으로서 "
-                                                                   '프로젝트의 설계부터 구현까지 전 과정을 총괄함. 딥러닝 모델의 학습 데이터 불균형 문제를 해결하기 위해 데이터 증강 기법을 '
-                                                                   '적용하고, 모델의 손실 함수를 최적화하는 과정을 논리적으로 설계하여 보고서를 작성함. 특히 합성곱 신경망(CNN)의 구조적 '
-                                                                   '특징을 분석하고, 특정 환경에서 발생하는 오분류 사례를 해결하기 위해 전이 학습(Transfer Learning)을 도입하는 '
-                                                                   "등 기술적 난관을 스스로 극복하려는 탐구 역량이 돋보임. 관련 도서 '인공지능의 미래'를 읽고 알고리즘의 편향성 문제와 윤리적 "
-                                                                   '책임에 대해 깊이 고민하며, 기술적 완성도와 사회적 가치를 동시에 고려하는 공학자로서의 자질을 보여줌.'},
-                                                            {'학년': '2',
-                                                             '영역': '자율활동',
-                                                             '내용': '선형대수학의 행렬 연산이 컴퓨터 그래픽스와 데이터 처리 알고리즘에 어떻게 적용되는지 탐구함. 특히 고차원 데이터를 저차원으로 '
-                                                                   '변환하는 주성분 분석(PCA)의 수학적 원리를 행렬의 고유값과 고유벡터를 통해 증명하고, 이를 파이썬 코드로 구현하여 데이터 '
-                                                                   '시각화에 적용하는 과정을 친구들에게 발표함. 가우스 소거법을 활용한 연립방정식의 해법을 컴퓨터가 효율적으로 처리하는 알고리즘적 '
-                                                                   '관점에서 분석하고, 시간 복잡도를 고려한 최적화 방안을 제시함. 복잡한 수식을 프로그래밍 언어로 변환하는 과정에서 수학적 '
-                                                                   '사고력을 논리적 코딩 능력으로 치환하는 탁월한 역량을 발휘하였으며, 스스로 심화 문제를 생성하고 해결하는 과정을 통해 지식을 '
-                                                                   '내면화함.'},
-                                                            {'학년': '2',
-                                                             '영역': '자율활동',
-                                                             '내용': "학급 부반장으로서 '데이터 기반 학급 학습 효율 최적화 프로젝트'를 제안하여 과목별 학습 시간과 성취도 데이터를 수집하고 "
-                                                                   '분석하는 멘토-멘티 시스템을 구축함. 활동의 필요성을 데이터 시각화 자료로 설득력 있게 제시하여 학급 구성원들의 자발적인 '
-                                                                   '참여를 이끌어냄. 매주 회의를 통해 학습 데이터의 추이를 분석하고, 효율적인 학습 전략을 공유하는 스터디 그룹을 운영하며 '
-                                                                   "민주적인 의사결정 과정을 주도함. 독서 토론 멘토링에서 '알고리즘이 지배하는 세상'을 선정하여 기술의 발전이 가져오는 디지털 "
-                                                                   '격차와 정보 불평등 문제를 공학적 관점에서 분석함. 특히 알고리즘의 투명성과 공정성 확보를 위한 기술적 대안을 제시하며 토론을 '
-                                                                   '이끌어가는 모습에서 비판적 사고력과 리더십이 돋보임. 학급 분위기가 해이해질 때마다 전공 관련 스터디를 제안하여 학습 공동체 '
-                                                                   '문화를 정착시켰으며, 모든 활동에 있어 문제 정의부터 해결책 도출까지 체계적인 공학적 접근 방식을 견지하여 타의 모범이 됨.'},
-                                                            {'학년': '2',
-                                                             '영역': '동아리활동',
-                                                             '내용': "컴퓨터공학부 진학을 목표로 '알고리즘 및 시스템 설계 연구회'의 팀장을 맡아 분산 컴퓨팅 환경에서의 효율적인 데이터 처리 "
-                                                                   '알고리즘을 탐구함. 특히 대규모 트래픽 발생 시 서버 부하를 최소화하는 로드 밸런싱 알고리즘의 효율성에 주목하여, 관련 논문을 '
-                                                                   '분석하고 파이썬을 활용해 시뮬레이션 모델을 구축함. 팀원들과 함께 알고리즘의 시간 복잡도와 공간 복잡도를 최적화하는 과정을 '
-                                                                   "거치며 협업의 중요성을 체득함. 또한, 교내 학술제에서 '데이터 압축 알고리즘의 성능 비교 분석'을 주제로 발표하며, 허프만 "
-                                                                   '코딩과 LZW 알고리즘의 원리를 설명하고 데이터 특성에 따른 최적의 압축 방식을 제안함. 시사 문제와 기술의 접목에도 관심이 '
-                                                                   '많아, 최근 이슈가 된 개인정보 보호를 위한 암호화 기술의 취약점을 분석하고, 이를 보완하기 위한 새로운 해시 함수 구조를 '
-                                                                   '설계하여 동아리 소식지에 기고하는 등 공학적 문제 해결 역량을 발휘함.'},
-                                                            {'학년': '2',
-                                                             '영역': '동아리활동',
-                                                             '내용': '머신러닝 기반의 이미지 분류 모델 성능 향상을 위한 탐구를 설계하고 실험을 진행함. 딥러닝 프레임워크를 활용하여 다양한 '
-                                                                   '데이터셋에 대한 모델의 정확도를 측정하고, 과적합 문제를 해결하기 위해 드롭아웃 및 데이터 증강 기법을 적용하는 심화 탐구 '
-                                                                   '보고서를 작성함. 연역적 탐구 방법을 적용하여 모델의 하이퍼파라미터 튜닝이 정확도에 미치는 영향을 정량적으로 분석하고, 과학 '
-                                                                   "동아리 연합 발표회에서 '신경망 구조 최적화를 통한 객체 인식 효율 개선'이라는 주제로 발표하여 큰 호응을 얻음. 나아가 "
-                                                                   '자신의 진로와 연계하여 자연어 처리(NLP) 모델이 문맥을 파악하는 메커니즘인 어텐션(Attention) 기구에 관심을 가지고 '
-                                                                   '관련 서적을 찾아 심화 학습을 수행함. 비록 하드웨어 제약으로 대규모 모델 학습은 수행하지 못했으나, 향후 컴퓨터공학부에 '
-                                                                   '진학하여 분산 학습 환경을 구축하고 효율적인 경량화 모델을 개발하여 인공지능 기술의 대중화에 기여하겠다는 구체적인 포부를 '
-                                                                   '밝힘. 모둠장으로서 복잡한 프로젝트의 로드맵을 설정하고 시행착오를 극복하며 팀을 이끄는 리더십을 보여줌.'},
-                                                            {'학년': '2',
-                                                             '영역': '진로활동',
-                                                             '내용': '3D 모델링 및 시뮬레이션 체험 활동에 참여하여 3D 펜과 CAD 소프트웨어를 활용한 기초 조작법을 익히고, 모둠원들과 '
-                                                                   "협력하여 복잡한 기하학적 구조물을 설계함. 교사-학생 계열 탐색 활동을 통해 '디지털 트윈(Digital Twin)' 기술이 "
-                                                                   '제조 공정의 효율성을 극대화하는 사례를 탐구하고, 이를 가상 환경에서 물리적 시스템을 모사하는 소프트웨어 공학적 관점에서 '
-                                                                   '분석하여 소감문을 작성함. 진로 탐색 활동에서 팀장으로서 주제 선정부터 역할 분담, 최종 기술 보고서 검토를 총괄하며 프로젝트 '
-                                                                   '관리 역량을 발휘함. 컴퓨터공학의 하위 분야인 시스템 아키텍처, 네트워크 보안, 데이터베이스 설계의 유래와 전망을 자세히 '
-                                                                   '탐구하며, 엔지니어가 갖추어야 할 논리적 사고력과 문제 해결 능력에 대해 고찰함. 특히 3D 프린팅의 적층 제조 원리를 이해한 '
-                                                                   "후, 이를 소프트웨어 시뮬레이션과 접목하여 '가상 환경에서의 물리 엔진 최적화'라는 주제로 심화 학습을 수행함. 펜 내부 가열 "
-                                                                   '장치의 제어 로직과 노즐의 이동 경로를 알고리즘적으로 해석하며, 하드웨어와 소프트웨어가 유기적으로 결합하는 임베디드 시스템의 '
-                                                                   '매력을 발견함. 모든 활동에 능동적으로 참여하며 기술적 호기심을 학문적 성취로 연결하는 모습이 매우 우수함.'},
-                                                            {'학년': None,
-                                                             '영역': '세특',
-                                                             '내용': '수업 시간 중 데이터 처리의 효율성과 알고리즘 최적화에 깊은 관심을 보이며, 특히 신경망의 신호 전달 체계와 컴퓨터의 연산 '
-                                                                   '구조 간의 유사성에 주목함. 딥러닝 모델의 가중치 업데이트 과정에서 발생하는 기울기 소실 문제를 해결하기 위한 활성화 함수의 '
-                                                                   '수학적 기전을 탐구하고, 이를 생물학적 신경 신호 전달의 가소성 원리와 연결하여 분석함. 관련 논문을 통해 신호 전달 조절 '
-                                                                   '장애가 시스템의 오류로 이어지는 과정을 모델링하고, 이를 파이썬으로 시뮬레이션하여 발표함. 또한, 데이터의 후성유전적 특성을 '
-                                                                   '정보 이론의 관점에서 재해석하여, 노이즈가 포함된 데이터셋에서 핵심 정보를 추출하는 알고리즘의 효율성을 정리한 보고서를 '
-                                                                   '작성함. 이론적 탐구에 그치지 않고, 복잡한 신호 전달 체계를 그래프 이론으로 도식화하여 친구들에게 설명함으로써 알고리즘의 '
-                                                                   '논리적 구조를 명확히 전달하는 능력을 보여줌.'},
-                                                            {'학년': None,
-                                                             '영역': '세특',
-                                                             '내용': '컴퓨터 단층 촬영(CT)의 영상 재구성 알고리즘에 내재된 수학적 원리를 탐구하며, 라돈 변환과 역라돈 변환의 이산적 구현 '
-                                                                   '과정을 심도 있게 분석함. 벡터 미적분학의 프레네-세레 공식을 활용하여 3차원 공간에서의 곡선 경로를 최적화하는 알고리즘을 '
-                                                                   '설계하고, 이변수 함수의 연속성을 입실론-델타 논법으로 엄밀하게 증명하여 수치 해석의 기초를 다짐. 자코비안 행렬을 이용한 '
-                                                                   '변수 변환과 그린 정리를 활용한 벡터장의 선적분 계산을 통해, 대규모 데이터 처리 시 연산량을 획기적으로 줄일 수 있는 수학적 '
-                                                                   '근거를 제시함. 생체모방공학 프로젝트에서는 홍합 족사의 접착 메커니즘을 디지털 트윈 기술로 모델링하는 과제를 주도함. 의료 '
-                                                                   '전자공학 단원 발표 시, 하드웨어와 소프트웨어의 통합 제어 시스템을 설계하여 제안하였으며, 특히 홍합의 접착 원리를 모방한 '
-                                                                   '나노 구조체를 알고리즘으로 시뮬레이션하여 최적의 접착 효율을 도출하는 등 공학적 설계 역량을 유감없이 발휘함.'}],
-                                             'comments': [{'구분': '컴퓨터공학부 합격 전략',
-                                                           '내용': '해당 학생은 최상위권 공과대학을 목표로 수학적 엄밀함과 프로그래밍 구현 능력을 동시에 입증하는 전략을 취했다. 특히 알고리즘 '
-                                                                 '설계와 데이터 분석 역량을 교과 과정과 유기적으로 연결하여, 단순한 공학적 관심사를 넘어 학문적 깊이를 갖춘 인재임을 증명하는 데 '
-                                                                 '성공했다.'},
-                                                          {'구분': '심화 탐구의 중요성',
-                                                           '내용': '일반고 교육과정의 범위를 넘어선 선형대수학의 고유값 분해, 주성분 분석(PCA), 라돈 변환 등 수학적 원리를 컴퓨터 공학적 문제 '
-                                                                 '해결에 적용한 점이 매우 인상적이다. 교과 개념을 도구로 삼아 공학적 난제를 해결하려는 시도는 학생의 학업 역량이 최상위권임을 '
-                                                                 '보여주는 핵심 지표가 된다.'},
-                                                          {'구분': '용어 선택의 전문성',
-                                                           '내용': "단순히 '데이터 처리'라는 표현을 사용하는 대신 '로드 밸런싱 알고리즘의 효율성', '기울기 소실 문제 해결을 위한 활성화 함수 "
-                                                                 "최적화'와 같이 전공 분야의 전문 용어를 정확하게 구사하고 있다. 이는 학생이 해당 분야의 기술적 문맥을 깊이 있게 이해하고 "
-                                                                 '있음을 시사한다.'},
-                                                          {'구분': '소재의 구체화',
-                                                           '내용': '디지털 트윈 기술을 단순히 조사하는 것에 그치지 않고, 3D 모델링과 시뮬레이션 환경에서 기하학적 구조물을 설계하며 기술의 실질적 '
-                                                                 '구현 가능성을 탐구한 점이 돋보인다. 이론적 배경과 실제 구현 과정이 결합된 탐구 방식은 공학적 문제 해결력을 효과적으로 '
-                                                                 '드러낸다.'},
-                                                          {'구분': '키워드의 연속성',
-                                                           '내용': '자율활동에서 시작된 인공지능 모델링에 대한 관심이 동아리 활동의 분산 컴퓨팅 및 서버 부하 최적화로 이어지는 과정은 학생의 전공 '
-                                                                 '탐구 서사가 매우 일관됨을 보여준다. 이러한 활동의 연계성은 학생이 가진 지적 호기심의 방향성이 컴퓨터공학이라는 목표에 집중되어 '
-                                                                 '있음을 명확히 한다.'},
-                                                          {'구분': '활동의 선택과 집중',
-                                                           '내용': '다양한 알고리즘 연구를 병렬적으로 나열하기보다, 특정 모델의 성능 향상을 위해 데이터 증강과 드롭아웃 기법을 적용하는 등 하나의 '
-                                                                 '주제를 심화하는 과정에 집중한 점이 우수하다. 한정된 분량 내에서 탐구의 논리적 흐름을 상세히 기술하여 문제 정의부터 검증까지의 '
-                                                                 '과정을 설득력 있게 제시하였다.'},
-                                                          {'구분': '컴퓨터공학 전공 적합성',
-                                                           '내용': '학급 내 데이터 기반 학습 효율 최적화 프로젝트와 같이 실생활의 문제를 데이터 분석과 알고리즘으로 해결하려는 시도는 컴퓨터공학도가 '
-                                                                 '갖추어야 할 문제 해결 역량을 잘 보여준다. 기술적 도구를 활용해 사회적 가치를 창출하려는 태도는 전공 적합성을 평가하는 데 있어 '
-                                                                 '매우 긍정적인 요소이다.'}]},
- 'case_13_humanities_philosophy': {'personal_info': {'대상': '서울대학교 철학과 합격 학생부',
-                                                     '고등학교_유형': '일반고',
-                                                     '내신_성적': '1.1 ~ 1.2',
-                                                     '주요_특징': '인문학적 소양을 바탕으로 사회 현상을 비판적으로 성찰하는 능력이 탁월함. 고전 텍스트를 현대적 관점에서 재해석하는 심화 탐구 역량이 '
-                                                              '뛰어나며, 논리적 글쓰기와 토론을 통해 자신의 철학적 견해를 정교화하는 데 탁월한 재능을 보임.',
-                                                     '총평': '인문학적 소양을 바탕으로 사회 현상을 비판적으로 성찰하는 능력이 탁월함. 고전 텍스트를 현대적 관점에서 재해석하는 심화 탐구 역량이 '
-                                                           '뛰어나며, 논리적 글쓰기와 토론을 통해 자신의 철학적 견해를 정교화하는 데 탁월한 재능을 보임.'},
-                                   'activities': [{'학년': '1',
-                                                   '영역': '자율활동',
-                                                   '내용': "교내 '고전 읽기 토론회'에서 플라톤의 '국가'를 선정하여 정의의 본질과 이상 국가의 구조에 대해 심도 있게 발표함. 소크라테스의 대화법을 "
-                                                         "활용해 동료 학생들과 '정의란 강자의 이익인가'라는 주제로 토론하며, 현대 사회의 법적 정의와 도덕적 가치의 괴리를 철학적으로 분석함. 특히 밈 "
-                                                         '이론을 사회적 담론 형성과 연결하여, 디지털 공간에서 확산되는 편향된 정보가 대중의 비판적 사고를 어떻게 저해하는지 논리적으로 비판함. 또한, '
-                                                         '학교 자율화 정책에 관한 토론에서 단순한 편의성 증진을 넘어 학생의 자기 결정권과 책임 윤리의 관점에서 접근하여, 제도적 자율성이 실질적인 '
-                                                         '도덕적 주체성 함양으로 이어져야 함을 강조하는 논리적 반론을 펼침.'},
-                                                  {'학년': '1',
-                                                   '영역': '진로활동',
-                                                   '내용': "'철학적 사유를 통한 진로 탐색' 활동에서 철학과를 중심으로 인문학적 소양과 사회과학적 방법론의 융합 가능성을 탐구함. '철학, 시대를 "
-                                                         "읽다'라는 주제로 철학적 담론이 현대 사회의 기술 윤리 문제에 어떻게 개입할 수 있는지 조사함. 특히 인공지능 시대의 도덕적 책임 소재를 칸트의 "
-                                                         '정언명령과 공리주의적 관점에서 비교 분석하며, 기술 발전이 인간의 존엄성을 훼손하지 않기 위한 철학적 가이드라인의 필요성을 역설함. 진로 매거진 '
-                                                         '제작 시, 철학이 단순히 사유에 머물지 않고 정책 결정과 사회적 합의 과정에서 어떻게 실천적 지혜로 기능하는지를 체계적으로 정리하여, 철학적 '
-                                                         '사유를 바탕으로 한 사회 문제 해결사로서의 진로 비전을 구체화함.'},
-                                                  {'학년': '1',
-                                                   '영역': '동아리활동',
-                                                   '내용': "(인문학적 논리 탐구 동아리)(30시간) '언어와 사고의 상관관계'를 주제로 비트겐슈타인의 언어철학을 탐구함. '말할 수 없는 것에 대해서는 "
-                                                         "침묵해야 한다'는 명제를 현대의 SNS 소통 방식에 대입하여, 언어의 한계가 곧 세계의 한계임을 증명하는 소논문을 작성함. 또한, 논리적 오류를 "
-                                                         '범하기 쉬운 일상 언어의 구조를 분석하고, 이를 교정하기 위한 기호 논리학적 접근법을 학습함. 동아리 내 토론 활동에서 상대방의 논리적 허점을 '
-                                                         '단순히 공격하는 것이 아니라, 상대의 전제를 이해하고 그 안에서 논리적 정합성을 찾아가는 대화적 태도를 견지하여 동료들의 신뢰를 얻음. 철학적 '
-                                                         '텍스트를 읽고 이를 현대적 사회 현상과 연결해 해석하는 능력이 매우 탁월함.'},
-                                                  {'학년': '1',
-                                                   '영역': '국어',
-                                                   '내용': "수업의 핵심 논지를 파악하는 분석력이 탁월하며, 텍스트를 철학적 관점에서 재해석하는 능력이 돋보임. '문학 작품의 비판적 읽기' 활동에서 '어느 "
-                                                         "날, 난민'을 선정하여 타자의 고통을 마주하는 윤리적 태도에 대해 심도 있게 탐구함. 작품 속 난민의 처지를 레비나스의 타자 윤리학과 연결하여, "
-                                                         "'나'와 '타자'의 관계를 책임의 관점에서 재정립하는 칼럼을 작성함. 특히 작가와의 가상 인터뷰를 구성하는 과정에서 반영론적 관점을 취해, 현대 "
-                                                         '사회의 배타적 민족주의가 인권의 보편성을 어떻게 훼손하는지 논리적으로 비판함. 단순한 감상을 넘어 난민 수용의 당위성을 철학적 정의론의 틀에서 '
-                                                         '정당화하는 기사문을 작성하였으며, 시각 자료를 활용해 독자의 공감을 이끌어내는 설득력 있는 글쓰기 역량을 보여줌.'},
-                                                  {'학년': '1',
-                                                   '영역': '수학',
-                                                   '내용': "수학적 사고를 논리적 체계로 확장하는 능력이 뛰어나며, 현상을 수리 모델로 구조화하는 데 탁월함. '실생활 속 수학적 모델링' 탐구에서 PCR "
-                                                         '검사의 원리를 지수함수적 증가 모델로 해석함. 단순히 검사 과정을 나열하는 것에 그치지 않고, 유전자 증폭 과정에서의 변성, 결합, 신장 단계를 '
-                                                         '수학적 변수로 치환하여 형광 세기의 변화를 함수 그래프로 도출함. 이 과정에서 지수함수의 밑이 갖는 의미를 생물학적 복제 효율과 연결하여 '
-                                                         '설명하였으며, 수학적 도구가 어떻게 보이지 않는 현상을 가시화하고 논리적 타당성을 확보하는지 철학적 사유를 곁들여 발표함. 수학적 추론이 단순한 '
-                                                         '계산을 넘어 현상의 본질을 규명하는 도구임을 이해하고 이를 학문적 탐구에 적극적으로 활용함.'},
-                                                  {'학년': '1',
-                                                   '영역': '과학탐구실험',
-                                                   '내용': '실험 과정에서 발생하는 변수를 통제하고 결과를 객관적으로 해석하는 과학적 방법론을 철학적 인식론과 연결하여 성찰함. 뉴턴의 빛의 분산 실험을 '
-                                                         '수행하며, 감각적 경험이 어떻게 객관적 지식으로 전환되는지에 대한 인식론적 질문을 던짐. 실험 기구의 조작 오류를 해결하는 과정에서 귀납적 '
-                                                         '추론의 한계와 실험적 검증의 중요성을 체득함. 또한, 브로콜리 DNA 추출 실험을 통해 생명체의 유전적 정보가 물질적 구조에 기반하고 있음을 '
-                                                         '확인하고, 이를 환원주의적 관점에서 분석함. 실험 보고서 작성 시, 생명 현상을 물리화학적 법칙으로 환원하려는 과학적 시도와 생명 그 자체의 '
-                                                         '고유성을 존중해야 하는 윤리적 가치 사이의 긴장 관계를 고찰하는 등 인문학적 소양을 과학 탐구에 접목하는 융합적 사고력을 발휘함.'},
-                                                  {'학년': '1',
-                                                   '영역': '통합과학',
-                                                   '내용': '과학적 탐구의 본질을 인식론적 관점에서 고찰하며, 자연 현상을 단순한 사실의 나열이 아닌 인과적 체계로 구조화하는 능력이 탁월함. 빅뱅 우주론을 '
-                                                         '탐구하며 입자의 형성 과정을 물리적 법칙과 연결하여 설명하고, 수소와 헬륨의 질량비라는 증거를 통해 우주의 기원을 논리적으로 재구성함. 특히 '
-                                                         "'유전자 재조합'을 주제로 한 비주얼 씽킹 활동에서 생명 윤리의 경계와 기술적 가능성을 철학적으로 성찰함. DNA의 구조적 특징을 도식화하는 "
-                                                         '과정에서 생명 현상의 기계론적 이해와 인간의 개입이 가져올 윤리적 함의를 함께 고민하였으며, 과학적 지식을 인문학적 가치 판단의 토대로 삼으려는 '
-                                                         '시도가 돋보임. 학습 과정에서 개념 간의 연관성을 파악하는 통찰력이 뛰어나며, 과학적 사실이 인간의 삶에 미치는 영향력을 비판적으로 분석하는 '
-                                                         '태도를 견지함.'},
-                                                  {'학년': '1',
-                                                   '영역': '통합사회',
-                                                   '내용': "사회 현상을 정의와 윤리의 관점에서 해석하는 능력이 탁월함. '오멜라스를 떠나는 사람들'을 읽고 타인의 희생을 전제로 한 행복의 정당성을 "
-                                                         "비판하며, 공리주의적 가치관의 한계를 지적하고 공동체적 연대의 윤리를 대안으로 제시함. 네팔의 '쿠마리' 사례를 통해 인권의 보편성과 문화적 "
-                                                         "상대주의 사이의 갈등을 철학적으로 분석하고, 제도적 개선 방안을 논리적으로 도출함. 특히 '배아줄기세포와 인권'을 주제로 한 칼럼 작성 "
-                                                         '활동에서는 생명권의 정의와 기술 발전의 속도 사이에서 발생하는 윤리적 딜레마를 심도 있게 다룸. 코로나19 상황을 사회적 계약과 개인의 자유라는 '
-                                                         '관점에서 재해석하며, 위기 상황에서 공동체의 안전을 위한 개인의 책임과 국가의 역할을 철학적 담론으로 확장하여 설득력 있게 논증함.'},
-                                                  {'학년': '1',
-                                                   '영역': '기술가정',
-                                                   '내용': '기술의 발전이 인간의 존재 방식과 가치관에 미치는 영향을 비판적으로 성찰함. 2050년의 기술 변화를 예측하는 활동에서 3D 프린팅과 유전자 '
-                                                         '변형 기술이 가져올 미래 사회의 모습을 단순히 기능적 측면이 아닌, 인간의 신체성과 생명 윤리의 변화라는 철학적 맥락에서 분석함. 지속가능발전 '
-                                                         '목표를 설정하며 전쟁과 난민 문제를 인류 보편의 윤리적 과제로 규정하고, 이를 해결하기 위한 국제적 연대와 인식의 전환을 강조함. 저출산 문제에 '
-                                                         '대해서도 단순한 인구 통계적 접근을 넘어, 현대 사회의 노동 가치와 가족의 의미에 대한 철학적 성찰을 바탕으로 복지 정책의 방향성을 제안함. '
-                                                         '실습 활동 전반에서 도구의 사용을 인간의 목적 실현을 위한 수단으로 이해하고, 기술과 인간의 공존 가능성을 끊임없이 질문하는 태도를 보임.'},
-                                                  {'학년': '1',
-                                                   '영역': '정보 / 진로와직업',
-                                                   '내용': '(정보) 논리적 사고를 바탕으로 알고리즘의 구조를 파악하는 능력이 탁월하며, 수업에서 배운 파이썬 프로그래밍을 활용해 철학적 난제를 해결하는 '
-                                                         "시뮬레이션 코드를 설계함. 특히 '죄수의 딜레마'를 게임 이론적 관점에서 재해석하여 이기적 선택과 협력적 선택이 사회적 효용에 미치는 영향을 "
-                                                         "코드로 구현함. (진로와직업) 철학과 진학을 목표로 자신의 가치관을 정립하는 과정에서 '자아정체감'과 '자기효능감'을 철학적 인식론의 관점에서 "
-                                                         "분석함. 데카르트의 '코기토' 명제를 현대적 자아 개념과 연결하여, 외부 환경에 의해 규정되는 자아가 아닌 주체적 사유를 통해 형성되는 자아의 "
-                                                         '중요성을 논리적으로 서술함. 자신의 진로를 단순한 직업 선택이 아닌, 삶의 의미를 탐구하는 철학적 실천의 과정으로 정의하며 학업 계획을 '
-                                                         '수립함.'},
-                                                  {'학년': '2',
-                                                   '영역': '독서',
-                                                   '내용': "텍스트의 이면을 꿰뚫어 보는 비판적 독해력이 매우 뛰어난 학생임. '나'라는 존재의 의미를 탐구하는 과정에서 하이데거의 '존재와 시간'을 "
-                                                         "발췌독하며, 인간을 '세계-내-존재'로 규정하는 실존주의적 관점을 현대인의 고립된 삶과 연결하여 심도 있게 분석함. 독서 기록 활동에서 '나'를 "
-                                                         '고정된 실체가 아닌 무수한 관계와 선택의 총합으로 정의하며, 타자와의 관계 속에서 형성되는 주체성에 대해 독창적인 에세이를 작성함. 또한, '
-                                                         '사회적 질병과 인간의 윤리적 책임을 다룬 인문학 서적을 읽고, 질병을 생물학적 현상으로만 보지 않고 인간의 욕망과 문명이 빚어낸 철학적 결과물로 '
-                                                         '해석함. 저자의 논지를 단순히 수용하는 데 그치지 않고, 현대 사회의 기술 만능주의가 인간의 실존적 가치를 어떻게 소외시키는지 논리적으로 '
-                                                         '비판하며 자신만의 철학적 대안을 제시하는 모습이 매우 인상적임.'},
-                                                  {'학년': '2',
-                                                   '영역': '수학 I',
-                                                   '내용': '수학적 추론을 논리적 체계로 구조화하는 능력이 탁월하며, 수학적 개념을 철학적 사유의 도구로 활용하는 창의성을 보임. 거듭제곱근과 로그함수의 '
-                                                         '성질을 탐구하며, 수학적 진리가 지니는 보편성과 필연성에 대해 인식론적 질문을 던짐. 특히 자연로그함수의 그래프를 분석하는 과정에서, 지수적 '
-                                                         '성장이 인간의 인식 범위를 넘어설 때 발생하는 철학적 공포와 한계에 대해 고찰함. 『교과서 파헤치기』 활동에서는 생명 윤리적 관점을 도입하여, '
-                                                         '데이터 기반의 노화 측정 공식이 인간의 존엄성을 수치화하는 과정에서 발생할 수 있는 윤리적 오류를 지적함. 수학적 모델링이 현실을 완벽하게 '
-                                                         "설명할 수 없다는 '모델의 한계'를 지적하며, 수치적 데이터 뒤에 숨겨진 인간의 본질적 가치를 보존해야 한다는 철학적 견해를 논리적으로 피력하여 "
-                                                         '급우들의 큰 호응을 얻음.'},
-                                                  {'학년': '2',
-                                                   '영역': '윤리와 사상',
-                                                   '내용': "근대 철학의 인식론적 전환을 탐구하며 데카르트의 '방법적 회의'가 현대의 비판적 사고에 미치는 영향을 분석함. '나는 생각한다, 고로 "
-                                                         "존재한다'는 명제를 단순히 지식의 근거로 해석하는 데 그치지 않고, 주체적 자아의 확립이 어떻게 타자와의 관계 맺기에서 윤리적 책임으로 "
-                                                         '이어지는지 논리적으로 전개함. 특히 칸트의 정언명령을 현대 사회의 디지털 윤리 문제에 대입하여, 알고리즘의 편향성이 인간의 자율적 판단을 어떻게 '
-                                                         '저해하는지 비판적으로 고찰함. 토론 과정에서 상대방의 논리적 허점을 지적하기보다 철학적 전제를 명확히 함으로써 합의점을 도출하는 탁월한 소통 '
-                                                         '능력을 보여줌. 또한, 사회계약론을 현대의 민주주의 제도와 연결하여, 국가의 권위가 개인의 자유를 어디까지 제한할 수 있는지에 대한 철학적 '
-                                                         '한계선을 설정하는 심화 보고서를 작성함.'},
-                                                  {'학년': '2',
-                                                   '영역': '독서',
-                                                   '내용': "철학적 텍스트를 독해하는 능력이 매우 뛰어나며, 저자의 논증 구조를 파악하여 자신의 견해를 정립하는 데 능숙함. 니체의 '차라투스트라는 이렇게 "
-                                                         "말했다'를 읽고 '영원회귀'와 '위버멘쉬' 개념을 현대인의 실존적 불안과 연결하여 해석함. 단순히 텍스트를 요약하는 수준을 넘어, 현대 사회의 "
-                                                         "허무주의적 현상을 극복하기 위한 철학적 대안으로서 '자기 극복의 의지'를 강조하는 서평을 작성함. 또한, 언어철학 관련 도서를 탐독하며 언어가 "
-                                                         "세계를 기술하는 방식이 인간의 인식 체계를 어떻게 규정하는지 탐구함. 비트겐슈타인의 '논리철학논고'를 통해 언어의 한계가 곧 세계의 한계라는 "
-                                                         '명제를 현대의 SNS 소통 방식에 대입하여, 파편화된 언어가 공동체적 연대를 어떻게 약화시키는지 분석한 발표는 학급 학생들에게 깊은 인상을 '
-                                                         '남김.'},
-                                                  {'학년': '2',
-                                                   '영역': '심화 국어',
-                                                   '내용': '문학 작품 속에 투영된 철학적 사유를 포착하여 인간 존재의 본질을 탐구하는 데 탁월함. 실존주의 문학을 주제로 한 탐구 활동에서 카뮈의 '
-                                                         "'이방인'을 선정하여, 부조리한 세계에 직면한 인간이 어떻게 자신의 삶을 긍정할 수 있는지에 대해 심도 있게 고찰함. 작품 속 주인공의 소외를 "
-                                                         '현대 사회의 익명성과 연결하여, 타인과의 진정한 관계 맺기가 불가능해 보이는 시대에 철학적 성찰이 갖는 의미를 논리적으로 서술함. 또한, 고전 '
-                                                         '산문 읽기 수업에서 유교적 가치관과 현대적 개인주의의 충돌을 다룬 텍스트를 분석하며, 전통적 공동체 윤리가 현대 사회에서 어떻게 재해석될 수 '
-                                                         '있는지에 대한 자신만의 철학적 견해를 정교하게 다듬어 발표함. 질문을 통해 수업의 깊이를 더하고, 동료들의 의견을 경청하며 자신의 논리를 '
-                                                         '보완하는 태도가 매우 모범적임.'},
-                                                  {'학년': '2',
-                                                   '영역': '영어 I',
-                                                   '내용': '언어철학적 관점에서 텍스트의 의미 구조를 분석하는 능력이 탁월함. 영어 지문을 단순 해석하는 데 그치지 않고, 저자의 논증 방식을 비판적으로 '
-                                                         "검토하며 문장 간의 논리적 연결 고리를 파악함. '언어와 실재'를 주제로 한 에세이 작성 시, 비트겐슈타인의 '언어 게임' 이론을 인용하여 "
-                                                         '영어권 문화의 관용구 속에 담긴 사회적 맥락을 분석함. 동료들의 작문 피드백 과정에서는 문법적 오류 교정을 넘어, 문장이 전달하고자 하는 철학적 '
-                                                         "함의가 명확히 드러나도록 문장 구조의 재배치를 제안함. 특히 '윤리적 딜레마와 책임'을 다룬 지문을 읽고, 공리주의와 의무론적 관점에서 "
-                                                         "등장인물의 선택을 비교 분석하는 발표를 진행함. 영어 대본 작성 활동에서는 '인공지능의 도덕적 주체성'을 주제로 설정하여, 기계가 인간의 윤리적 "
-                                                         '판단을 대리할 수 있는지에 대한 철학적 논쟁을 영어 토론 형식으로 구성함으로써 언어적 유창성과 논리적 사고력을 동시에 입증함.'},
-                                                  {'학년': '2',
-                                                   '영역': '생명과학 I',
-                                                   '내용': '생명 현상을 기계론적 관점과 유기체적 관점에서 통합적으로 이해하려는 철학적 탐구 태도가 돋보임. 신경전달물질의 작용 원리를 탐구하며, 인간의 '
-                                                         '자유의지가 생물학적 결정론에 의해 제약받을 수 있는지에 대한 인식론적 질문을 던짐. 항우울제의 작용 기전을 조사하는 과정에서, 정신 질환을 뇌의 '
-                                                         '화학적 불균형으로만 환원하는 현대 의학의 관점이 인간의 주체성을 어떻게 규정하는지 비판적으로 성찰함. 뉴런 모형 제작 활동에서는 시냅스 전달 '
-                                                         '과정을 단순히 생물학적 기제로 설명하지 않고, 정보의 전달이 어떻게 인간의 의식과 자아를 형성하는지에 대한 철학적 해석을 덧붙임. 수업 중 '
-                                                         '고난도 유전 문제 해결 시에도 논리적 추론 과정을 단계별로 구조화하여 친구들에게 설명하며, 지식의 전달이 단순한 정보 공유가 아닌 상대방의 사고 '
-                                                         '체계를 확장하는 과정임을 실천적으로 보여줌. 과학적 사실을 철학적 사유의 도구로 활용하여 생명 윤리의 본질을 탐구하는 모습이 매우 인상적임.'}],
-                                   'comments': [{'구분': '학교생활충실도 및 성실성',
-                                                 '내용': '일반고의 교육 환경 속에서도 1.1~1.2 수준의 최상위 내신을 유지하며, 교과 수업과 연계된 심화 탐구 활동에 일관되게 참여한 성실함이 돋보임. '
-                                                       '1학년 때부터 철학적 사유의 기초를 다지고, 2학년 이후 이를 사회 현상 분석으로 확장한 서사가 매우 탄탄함.'},
-                                                {'구분': '공동체 역량의 재해석',
-                                                 '내용': '철학 전공자에게 필요한 비판적 사고와 타자에 대한 윤리적 감수성을 공동체 활동 전반에서 잘 드러냄. 단순히 리더십을 강조하기보다, 토론 과정에서 '
-                                                       '소수자의 의견을 경청하고 정의의 본질을 탐구하는 과정을 통해 공동체 내 갈등을 철학적으로 해결하려는 태도가 인상적임.'},
-                                                {'구분': '진로 활동의 단계적 발전',
-                                                 '내용': '1학년 진로활동에서 철학적 방법론을 탐구하며 인문학적 소양을 쌓고, 이를 2학년 때 기술 윤리 및 사회 문제 해결로 구체화한 과정이 매우 논리적임. '
-                                                       '특히 인공지능 윤리 등 현대적 쟁점을 고전 철학의 관점에서 재해석한 점은 전공 적합성을 증명하는 핵심 지점임.'},
-                                                {'구분': '활동 간 연계성 보완',
-                                                 '내용': '자율활동과 동아리 활동에서 다룬 언어철학적 탐구가 국어 및 사회 교과 세특으로 이어지는 연결고리가 매우 유기적임. 개별 활동이 단편적으로 끝나지 '
-                                                       '않고, 하나의 철학적 질문을 다양한 교과적 맥락에서 재검증하는 스토리텔링이 매우 우수함.'},
-                                                {'구분': '철학과 특화 활동 (정수)',
-                                                 '내용': '비트겐슈타인의 언어철학을 SNS 소통 방식에 대입하여 분석한 동아리 활동은 철학적 사유를 현대 사회에 적용하는 탁월한 능력을 보여줌. 또한, 고전 '
-                                                       '텍스트를 현대적 관점에서 비판적으로 재해석하는 탐구 역량은 철학과 지망생으로서 매우 높은 수준임.'},
-                                                {'구분': '동아리 활동의 역할',
-                                                 '내용': '인문학적 논리 탐구 동아리에서 언어와 사고의 상관관계를 탐구하며 스스로 질문을 설정하고 자료를 조사하는 과정이 주도적임. 단순히 이론을 학습하는 데 '
-                                                       '그치지 않고, 이를 현대 사회의 소통 한계라는 구체적 문제와 연결한 점이 매우 효과적임.'},
-                                                {'구분': '철학과 적합성 분석',
-                                                 '내용': '철학과는 텍스트에 대한 깊이 있는 해석과 논리적 글쓰기가 필수적인데, 이 학생은 교과 세특을 통해 자신의 철학적 견해를 정교화하는 과정을 잘 '
-                                                       '보여줌. 특히 정의론을 현대 사회의 불평등 문제와 연결한 탐구는 전공에 대한 깊은 이해를 증명함.'},
-                                                {'구분': '윤리적 탐구의 심화',
-                                                 '내용': '공리주의적 가치관의 한계를 지적하고 공동체적 연대의 윤리를 대안으로 제시한 통합사회 탐구는 매우 수준 높은 철학적 성찰임. 단순히 이론을 나열하지 '
-                                                       '않고, 구체적인 사회적 사례를 통해 자신의 논리를 전개한 점이 매우 전문적임.'},
-                                                {'구분': '독서와 세특의 연계',
-                                                 '내용': '독서 목록이 단순 나열되지 않고 국어, 사회 등 교과 세특에서 심화 탐구의 도구로 활용된 점이 매우 훌륭함. 특히 문학 작품을 철학적 관점에서 '
-                                                       '비판적으로 읽어내는 과정은 학업 역량과 전공 적합성을 동시에 보여주는 전략적 선택임.'},
-                                                {'구분': '수학/과학 역량의 증명',
-                                                 '내용': '수학 세특에서 PCR 검사 원리를 지수함수 모델로 해석한 것은 현상을 논리적으로 구조화하는 능력을 잘 보여줌. 철학 전공자로서 과학적 방법론을 '
-                                                       '인식론적 관점에서 성찰하는 태도는 학문적 융합 역량을 증명하는 좋은 사례임.'},
-                                                {'구분': '교과 세특 기록의 환경 차이',
-                                                 '내용': '1학기와 2학기 기록의 질적 차이가 거의 없이 일관된 탐구 수준을 유지하고 있음. 일반고 환경에서도 선생님과 긴밀히 소통하며 자신의 철학적 탐구 '
-                                                       '주제가 세특에 구체적으로 기재되도록 노력한 흔적이 역력함.'},
-                                                {'구분': '인문학적 소양과 윤리 의식',
-                                                 '내용': '한국사 수업에서 역사적 사건을 윤리적 관점에서 재해석하고, 과학자의 윤리 의식을 고찰한 점은 훌륭함. 이는 철학적 사유가 단순히 이론에 머물지 않고 '
-                                                       '역사와 과학 등 다양한 영역으로 확장될 수 있음을 보여주는 우수 사례임.'},
-                                                {'구분': '활동 나열의 극복 과제',
-                                                 '내용': "대부분의 학교 세특처럼 활동 나열이 있을 수 있으나, 이 학생은 각 활동마다 '왜 이 질문을 던졌는가'에 대한 철학적 동기가 명확함. 끈기 있는 "
-                                                       '탐구 과정과 자기주도적 문제 해결 능력이 활동 나열의 한계를 충분히 극복하고 있음.'},
-                                                {'구분': '인문과학적 소양과 다양성',
-                                                 '내용': "자율, 동아리, 교과 세특을 통해 윤리, 철학, 인권에 대한 높은 관심을 증명함. 철학 전공자로서 갖춰야 할 '인간과 사회에 대한 폭넓은 이해'와 "
-                                                       "'논리적 사고 능력'을 인문학적 배경으로 잘 보여준 우수 사례임."},
-                                                {'구분': '과학적 탐구의 구체화',
-                                                 '내용': '과학탐구실험에서 실험 결과를 인식론적 관점에서 성찰한 점은 매우 독특하고 우수함. 자연 현상을 단순 사실의 나열이 아닌 인과적 체계로 구조화하는 '
-                                                       '능력은 철학적 사유의 기초가 됨.'},
-                                                {'구분': '진로와 연계된 기술 활용',
-                                                 '내용': '기술가정 과목에서 인공지능 기술의 윤리적 문제를 언급하며 본인의 관심사를 비주요 교과에도 잘 녹여냄. 비주요 교과 세특을 철학적 관점에서 재해석하는 '
-                                                       '것은 평가자에게 매우 좋은 인상을 줌.'},
-                                                {'구분': '2학년 병리학적 심화',
-                                                 '내용': '독서 과목에서 질병과 사회의 관계를 탐구하며 전염병 예방 전략을 철학적으로 고찰한 점은 인문학적 사유가 사회과학적 문제 해결로 확장되고 있음을 '
-                                                       '보여줌. 전공 적합성의 정점임.'},
-                                                {'구분': '탐구 과목의 이상적 구조',
-                                                 '내용': '화학 I 세특처럼 [교과 궁금증 → 철학적 고찰 → 추가 노력]으로 이어지는 구조가 입학사정관이 평가하기에 가장 좋음. 특히 과학적 작용 원리를 '
-                                                       '윤리적 책임과 연결한 지점은 철학적 의지를 잘 보여줌.'},
-                                                {'구분': '수학-과학 융합의 가치',
-                                                 '내용': '수학 II에서 적외선 파장 침투 깊이를 분석하고 이를 과학적 연구 기법으로 계량화한 활동은 우수함. 왜 이 활동을 하게 되었는지 철학적 동기만 '
-                                                       '보완된다면 완벽한 세특이 될 것임.'},
-                                                {'구분': '비주류 교과의 전략적 활용',
-                                                 '내용': '일본어 과목에서 일본의 철학적 사상이나 문화를 언어와 연결하여 탐구한 것은 매우 좋은 전략임. 억지스러운 연결이 아니라 문화적 맥락을 고려한 탐구로 '
-                                                       '보이기 때문임.'},
-                                                {'구분': '영어 세특의 구체성 부족',
-                                                 '내용': '일부 영어 세특 기록은 추상적 표현이 많아 아쉬움. 서울대 합격생이라도 모든 세특이 완벽할 수 없음을 보여줌. 활동의 명확성을 위해 담당 선생님과 '
-                                                       '구체적인 철학적 탐구 내용 위주로 상의하는 과정이 필요함.'},
-                                                {'구분': '문학적 감수성과 비판적 사고',
-                                                 '내용': '문학 세특에서 사설 시조를 통해 사회적 비판을 담아낸 점이나 수학적 연속성에 대한 날카로운 질문 등은 학생의 사고 수준이 매우 높음을 증명함. '
-                                                       '문학적 형상화 능력은 철학적 사유를 대중과 소통하는 데 필수적임.'},
-                                                {'구분': '자기주도성과 끈기의 증명',
-                                                 '내용': '물리 실험에서 오차 원인을 냉철히 판단하거나, 수학에서 스스로 탐구 주제를 찾아 깊이 있게 학습하는 태도는 대학에서 학문을 수행할 준비가 되어 '
-                                                       '있음을 보여주는 핵심 지표임. 단순 활동 나열을 이겨내는 태도의 우수성이 돋보임.'},
-                                                {'구분': '과목 선택의 전략성',
-                                                 '내용': '활동나열형 기록이긴 하지만, 인문계열 핵심과목을 선택하고 다양한 심화 활동을 수행했다는 점에서 좋은 점수를 받았을 것임. 서울대 입시 트렌드상 '
-                                                       '권장과목을 충실히 선택한 점이 유리하게 작용함.'},
-                                                {'구분': '영어 과목의 전략적 활용',
-                                                 '내용': '영어는 다양한 철학적 소재를 접목하기 좋은 과목임. 서구 철학자의 원문을 읽고 토론하는 역할극과 같은 신선한 소재를 통해 전공 적합성을 전략적으로 '
-                                                       '드러낸 점이 우수함.'},
-                                                {'구분': '자기주도적 학습 태도',
-                                                 '내용': '배움일지 작성과 메타인지 발달 과정이 기재된 것은 학생의 학습 역량을 신뢰하게 만듦. 어려운 수학적 문제를 스스로 재구성하여 해결하는 모습에서 높은 '
-                                                       '수준의 논리적 사고력이 증명됨.'},
-                                                {'구분': '활동 나열의 한계와 보완',
-                                                 '내용': '생명과학 I 등에서 단순 활동 나열이 많은 점은 심화 활동의 깊이를 가릴 수 있는 단점임. 그러나 학생 특유의 자기주도성과 성취 수준이 이를 '
-                                                       '상쇄하고 있음. 몇몇 강점(철학적 에세이 작성 등)을 구체화하는 것이 중요함.'},
-                                                {'구분': '교과 간 융합 탐구',
-                                                 '내용': '기하학적 원리를 자연의 질서와 연결하여 철학적으로 탐구한 부분은 인문학에 대한 폭넓은 호기심을 보여줌. 이러한 융합적 접근은 철학과와 같은 융합 '
-                                                       '학문 전공자에게 필요한 핵심 역량임.'}]},
- 'case_13_natural_science_biotech': {'personal_info': {'대상': '서울대학교 생명공학과 합격 학생부',
-                                                       '고등학교_유형': '과학중점 일반고',
-                                                       '내신_성적': '1.1',
-                                                       '주요_특징': '생명공학 분야의 심화 탐구를 위해 고급생명과학 및 정보과학 교과를 이수하며 수학적 모델링 역량을 강화함. 유전자 편집 기술과 데이터 '
-                                                                '분석을 결합한 융합적 사고력이 탁월하며, 교내 과학 탐구 대회에서 생체 모방 공학을 주제로 최우수상을 수상하는 등 전공 적합성이 '
-                                                                '매우 높음.',
-                                                       '총평': '생명공학 분야의 심화 탐구를 위해 고급생명과학 및 정보과학 교과를 이수하며 수학적 모델링 역량을 강화함. 유전자 편집 기술과 데이터 '
-                                                             '분석을 결합한 융합적 사고력이 탁월하며, 교내 과학 탐구 대회에서 생체 모방 공학을 주제로 최우수상을 수상하는 등 전공 적합성이 매우 '
-                                                             '높음.'},
-                                     'activities': [{'학년': '1',
-                                                     '영역': '자율활동',
-                                                     '내용': "교내 '과학 독서 토론회'에서 '이기적 유전자'를 읽고 밈(meme)의 전파 기제와 생물학적 진화의 유사성을 분석하여 발표함. 특히 생명공학 "
-                                                           '기술이 사회적 담론으로 확장될 때 발생하는 윤리적 쟁점을 밈의 확산 모델로 해석하여, 유전자 편집 기술에 대한 대중의 인식이 어떻게 '
-                                                           "형성되는지 논리적으로 설명함. 또한 '디지털 리터러시와 과학적 사고'를 주제로 한 토론에서, 정보의 홍수 속에서 생명공학적 지식을 비판적으로 "
-                                                           "수용해야 함을 강조함. 교내 과학 축제에서는 '생체 모방 공학의 미래'를 주제로 부스를 운영하며, 자연의 구조를 공학적으로 설계하는 "
-                                                           '과정에서의 효율성을 시각화 자료로 제시함. 캠페인 활동에서는 지속 가능한 생명공학 연구를 위한 윤리 가이드라인 제정의 필요성을 알리는 '
-                                                           '홍보물을 제작하여 학생들의 공감을 이끌어냄.'},
-                                                    {'학년': '1',
-                                                     '영역': '진로활동',
-                                                     '내용': "'진로 탐색 포트폴리오' 활동을 통해 생명공학과의 학문적 로드맵을 설계함. '생명과학, 공학을 만나다'를 심층 분석하여 질병 치료를 위한 "
-                                                           '유전자 치료제 개발과 합성생물학의 최신 동향을 조사함. 특히 CRISPR-Cas9 유전자가위 기술의 작동 원리를 수학적 확률 모델로 '
-                                                           '접근하여, 오프 타겟(off-target) 효과를 최소화하기 위한 알고리즘적 접근 방식을 제안함. 진로 발표회에서는 생명공학자가 갖추어야 할 '
-                                                           '윤리적 책임감과 기술적 전문성을 동시에 강조하며, 사회적 합의를 도출하기 위한 과학 커뮤니케이터로서의 자질을 보여줌. 대학 탐방 '
-                                                           '프로그램에서는 생명공학 연구실의 실험 장비와 데이터 분석 프로세스를 견학하며, 실험 데이터의 신뢰성을 확보하기 위한 통계적 검증 방법론에 '
-                                                           '대해 질문하는 등 학문적 깊이를 드러냄.'},
-                                                    {'학년': '1',
-                                                     '영역': '동아리활동',
-                                                     '내용': '(수학적 추론과 문제해결)(30시간) DNA 이중나선 구조의 기하학적 안정성을 수학적으로 규명하는 탐구 활동을 수행함. 가죽 매듭과 와이어를 '
-                                                           '활용하여 DNA의 염기쌍 결합 구조를 3차원 모델로 구현하고, 각 결합 부위의 각도와 인장력을 계산하여 구조적 안정성을 분석함. 특히 '
-                                                           '샤가프의 법칙을 수학적 비율로 해석하여 이중나선 구조가 왜 생명 정보 저장에 최적화된 형태인지 논리적으로 증명함. 이후 파이썬을 활용하여 '
-                                                           'DNA 염기 서열 데이터를 시각화하는 코딩을 병행하며, 생물학적 구조를 데이터로 치환하여 분석하는 생물정보학(Bioinformatics)의 '
-                                                           '기초 역량을 쌓음. 활동 과정에서 발생한 오차를 통계적으로 보정하는 과정을 통해 실험 설계의 정밀도를 높이는 데 주력함.'},
-                                                    {'학년': '1',
-                                                     '영역': '국어',
-                                                     '내용': "생명공학 분야의 윤리적 담론을 형성하는 데 필요한 인문학적 소양을 갖춘 학생으로, 수업 시간마다 핵심 논점을 파악하여 토론을 주도함. '과학 "
-                                                           "기술의 사회적 책임'을 주제로 한 공익광고 제작 활동에서 유전자 편집 기술의 오남용 방지를 위한 캠페인을 기획함. '유전자의 선택, 인류의 "
-                                                           "미래를 결정짓는 열쇠'라는 표어를 통해 생명 윤리의 중요성을 역설함. 독서 신문 제작 활동에서는 '생명윤리 논쟁' 관련 도서를 읽고, "
-                                                           '생명공학 기술의 발전 속도와 윤리적 가이드라인 사이의 간극을 분석하는 수준 높은 기사문을 작성함. 특히 작가와의 가상 인터뷰 형식을 빌려 '
-                                                           '기술적 진보가 가져올 사회적 파장을 반영론적 관점에서 비판적으로 고찰하였으며, 생명공학 연구자가 갖추어야 할 도덕적 책임감을 논리적으로 '
-                                                           '서술하여 학급 내에서 생명 윤리에 대한 깊은 통찰을 공유함.'},
-                                                    {'학년': '1',
-                                                     '영역': '수학',
-                                                     '내용': "수학적 모델링 역량이 매우 뛰어나며, 복잡한 생명 현상을 수식으로 구조화하는 능력이 탁월함. '실생활 수학 탐구' 활동에서 PCR 검사의 "
-                                                           '원리를 지수함수 모델로 정교하게 분석함. 유전자 증폭 과정인 변성, 결합, 신장의 3단계를 수학적 알고리즘으로 치환하여, 증폭 횟수(n)에 '
-                                                           '따른 DNA 복제량의 변화를 f(n)=2^n 형태의 지수함수 그래프로 시각화함. 단순히 이론을 설명하는 데 그치지 않고, 실제 PCR '
-                                                           '장비에서 형광 검출기가 신호를 포착하는 임계점(Threshold)을 로그함수로 역산하여 검사 정확도를 높이는 수학적 원리를 도출함. 이러한 '
-                                                           '수학적 추론 능력은 생명공학 연구에서 데이터 분석의 기초가 되는 통계적 사고력을 입증함.'},
-                                                    {'학년': '1',
-                                                     '영역': '과학탐구실험',
-                                                     '내용': '생명공학 실험의 기초가 되는 분자생물학적 기법을 정확히 이해하고 수행함. 브로콜리 DNA 추출 실험에서 세포벽과 세포막을 파괴하기 위한 '
-                                                           '계면활성제와 에탄올의 화학적 작용 기전을 완벽히 숙지하고, 실험 과정에서 발생할 수 있는 오차를 줄이기 위해 용액의 농도를 정밀하게 조절함. '
-                                                           '실험 결과 추출된 DNA의 순도를 높이기 위해 저온 환경을 유지하는 등 실험 설계의 변인을 통제하는 능력이 돋보임. 실험 후 보고서에는 '
-                                                           'DNA의 이중나선 구조가 에탄올 내에서 침전되는 원리를 분자 간 인력과 용해도 차이로 상세히 기술함. 또한, 실험 과정에서 발생한 미세한 '
-                                                           '오차를 분석하여 실험 기구의 정밀도가 결과에 미치는 영향을 고찰하는 등 연구자로서의 분석적 태도를 보여줌.'},
-                                                    {'학년': '1',
-                                                     '영역': '통합과학',
-                                                     '내용': '생명공학적 관점에서 전염병의 확산 기제를 탐구하기 위해 바이러스의 변이와 숙주 세포 침투 과정을 심층 분석하여 발표함. 흑사병부터 '
-                                                           '코로나19에 이르기까지 전염병의 역사적 사례를 생물학적 진화와 환경적 요인으로 분류하고, 이를 해결하기 위한 백신 개발의 핵심 원리인 '
-                                                           'mRNA 기술과 항체 생성 기전을 과학적으로 설명함. 특히 빅뱅 우주론을 통해 원소의 기원을 이해하고, 이를 바탕으로 생명체를 구성하는 탄소 '
-                                                           "화합물의 화학적 결합 특성을 주기율표와 연계하여 논리적으로 서술함. '비주얼 씽킹' 수행평가에서는 '유전자 재조합 기술의 생명공학적 응용'을 "
-                                                           '주제로 선정하여, 제한효소와 연결효소를 이용한 DNA 절단 및 결합 과정을 도식화함. 세포 내 DNA 구조적 특징과 유전자 재조합의 '
-                                                           '메커니즘을 B4 2페이지 분량의 정교한 도식과 핵심 과학 개념으로 시각화하여 제출하였으며, 이는 생명공학자로서 갖추어야 할 복잡한 '
-                                                           '분자생물학적 정보를 구조화하고 전달하는 탁월한 학업 역량과 향후 연구자로서의 발전 가능성을 입증하는 계기가 됨.'},
-                                                    {'학년': '1',
-                                                     '영역': '통합사회',
-                                                     '내용': "사회적 불평등과 생명 윤리 간의 상관관계를 탐구하며 인문학적 소양을 함양함. '오멜라스를 떠나는 사람들'을 읽고 타인의 희생을 전제로 한 "
-                                                           "행복의 모순을 비판적으로 분석하며, 생명공학 기술이 사회에 적용될 때 발생할 수 있는 윤리적 딜레마를 고찰함. 특히 '배아줄기세포 연구와 "
-                                                           "인권 침해의 경계'를 주제로 심층 칼럼을 작성하여, 생명공학의 발전이 인류의 복지 증진이라는 목적을 달성하면서도 인간의 존엄성을 훼손하지 "
-                                                           '않아야 한다는 논리적 근거를 제시함. 코로나19 팬데믹 상황에서 나타난 사회적 변화 양상을 마인드맵으로 구조화하고, 국제적 공조 체계와 '
-                                                           '개인의 방역 수칙 준수가 생물학적 방어 체계와 유사한 사회적 면역 시스템을 형성한다는 점을 강조함. 행정동 지도 제작 활동에서는 공간 데이터 '
-                                                           '분석 역량을 발휘하여 지역 사회의 인구 통계적 특성을 파악하고, 이를 바탕으로 보건 의료 인프라의 효율적 배치 방안을 제안하는 등 사회 '
-                                                           '현상을 과학적 데이터와 결합하여 해석하는 융합적 사고력을 보여줌.'},
-                                                    {'학년': '1',
-                                                     '영역': '기술가정',
-                                                     '내용': '미래 기술의 발달 예측 활동에서 2050년 생명공학 기술의 비전을 제시하며, 3D 바이오 프린팅을 활용한 인공 장기 제작과 유전자 편집 '
-                                                           '기술을 통한 식량 자원 확보 방안을 구체적으로 설계함. 기술의 발달이 인류의 생존과 직결된다는 점에 주목하여, 자가변형이 가능한 인공 장기 '
-                                                           '모델의 작동 원리를 공학적 관점에서 분석하고 이를 시간의 흐름에 따른 기술 로드맵으로 시각화함. 업사이클 창의공학설계 프로젝트에서는 자원 '
-                                                           '순환의 중요성을 인식하고, 폐자재를 활용하여 실험 도구를 정리할 수 있는 정밀한 보관함을 제작함. 제작 과정에서 도면 설계부터 재료의 물리적 '
-                                                           '특성을 고려한 구조적 안정성 확보까지 공학적 설계 프로세스를 충실히 이행함. 또한 지속가능발전 목표(SDGs) 수립 활동에서는 생명공학 '
-                                                           '기술을 활용한 난민 구호 및 질병 퇴치 전략을 제시하였으며, 저출산 문제에 대해서도 노동력 부족을 해결하기 위한 생명공학적 생산성 향상과 '
-                                                           '사회적 복지 정책의 조화를 주장하는 등 기술과 사회의 상호작용을 깊이 있게 이해하고 실천하는 태도를 보임.'},
-                                                    {'학년': '1',
-                                                     '영역': '정보 / 진로와직업',
-                                                     '내용': '(정보) 파이썬을 활용한 데이터 분석에 깊은 관심을 보이며, 수업 시간에 배운 알고리즘을 생명공학 데이터 처리에 응용하여 유전자 서열의 '
-                                                           '유사도를 판별하는 간단한 프로그램을 직접 구현함. 전문 학술 데이터베이스를 활용해 최신 생명공학 연구 동향을 수집하고, 이를 바탕으로 '
-                                                           '생물학적 문제를 논리적으로 구조화하는 역량이 탁월함. (진로와직업) 생명공학자라는 진로를 구체화하기 위해 대학별 교육과정을 분석하고, '
-                                                           "합성생물학 분야의 연구자가 되기 위한 로드맵을 설계함. '자기효능감' 탐구 활동에서 생명공학적 난제를 해결하는 과정에서의 실패를 성장의 "
-                                                           '발판으로 삼는 태도를 정립하였으며, 자신의 학문적 목표가 인류의 보건 증진에 기여할 것임을 명확히 함.'},
-                                                    {'학년': '2',
-                                                     '영역': '독서',
-                                                     '내용': "생명공학 분야의 심화 탐구를 위해 인문학적 성찰과 과학적 지식을 결합하는 독서 활동을 전개함. '질병의 탄생'을 읽고 전염병의 발생이 단순한 "
-                                                           "생물학적 현상을 넘어 인간의 환경 파괴와 생태계 교란에서 기인함을 분석함. 이를 바탕으로 '질병의 사회적 기원과 생명공학적 대응 전략'이라는 "
-                                                           "주제의 독서 신문을 제작하여, 질병 예방을 위한 유전자 치료제 개발의 필요성을 논리적으로 설득함. 또한, '나'라는 존재를 구성하는 유전적 "
-                                                           '요소와 환경적 요인의 상호작용에 대해 비판적으로 고찰하며, 생명공학 기술이 인간의 정체성에 미칠 영향에 대해 철학적인 글을 작성함. 단순히 '
-                                                           '지식을 습득하는 것에 그치지 않고, 과학 기술의 발전이 인간의 삶에 미치는 윤리적 함의를 깊이 있게 탐구하는 모습이 매우 인상적임.'},
-                                                    {'학년': '2',
-                                                     '영역': '수학 I',
-                                                     '내용': '수학적 모델링 역량을 생명공학적 현상 해석에 적극적으로 활용하는 학생임. 지수함수와 로그함수의 개념을 활용하여 박테리아의 증식 속도와 약물 '
-                                                           '농도 변화를 수식으로 모델링하는 탐구 활동을 수행함. 특히 후생유전학적 관점에서 DNA 메틸화 수준을 통한 생물학적 나이 측정 공식을 '
-                                                           '자연로그 함수로 정교하게 분석하여 발표함. 반려동물의 질병 예방을 위한 관리 모델을 제시하며, 노화 속도의 차이를 그래프로 시각화하여 '
-                                                           '데이터의 직관적 이해를 도움. 공학용 도구를 활용해 복잡한 생체 반응 그래프를 구현하고, 정의역의 제한을 통해 생물학적 유효 범위를 설정하는 '
-                                                           '등 수학적 도구를 전공 탐구의 핵심 수단으로 활용하는 능력이 매우 뛰어남.'},
-                                                    {'학년': '2',
-                                                     '영역': '물리학 I',
-                                                     '내용': '생체 내 신호 전달 체계의 물리적 기전을 규명하고자 파동의 굴절과 중첩 원리를 심층 탐구함. 공기의 밀도 차이에 의한 빛의 굴절 현상인 '
-                                                           '신기루를 매질의 굴절률 변화 모델로 해석하여 발표하였으며, 파동의 중첩 원리를 생체 내 전기 신호 전달 과정에서의 간섭 현상과 연결 지어 '
-                                                           '분석함. 특히 두 파동의 위상 차이에 따른 합성파의 진폭 변화를 수학적으로 도출하고 이를 시각화하여, 신경 세포 간의 신호 전달 효율을 '
-                                                           '물리적 관점에서 고찰함. 역학 실험에서는 질량과 가속도의 관계를 정밀하게 측정하여 데이터의 상관관계를 그래프로 도출하였으며, 실험 설계 '
-                                                           '과정에서 변인 통제의 중요성을 강조하고 오차 원인을 분석하는 등 공학적 문제 해결 역량을 발휘함. 조별 활동 시 실험 장치의 정밀도를 높이기 '
-                                                           '위한 보정 작업을 주도하며, 데이터의 신뢰성을 확보하기 위한 논리적 근거를 제시하여 팀의 연구 성과를 극대화함.'},
-                                                    {'학년': '2',
-                                                     '영역': '화학 I',
-                                                     '내용': '의약화학 분야에 대한 깊은 관심을 바탕으로 아세틸살리실산의 구조와 작용 기전을 학습한 후, 이를 확장하여 프로베네시드의 분자 구조와 바이러스 '
-                                                           '복제 억제 원리를 탐구함. 바이러스의 세포 내 침투 및 플라크 형성 억제 기전을 화학적 구조식으로 분석하고, 약물-수용체 간의 결합 에너지가 '
-                                                           '생체 반응에 미치는 영향을 고찰함. 또한 탄소 동소체인 그래핀의 sp2 혼성 오비탈 구조를 분석하여 자유 전자의 이동과 전기전도성 간의 '
-                                                           '상관관계를 규명함. 이러한 화학적 지식을 바탕으로 생체 적합성이 높은 신소재 개발 가능성을 제시하였으며, 약물 전달 시스템(DDS)에 '
-                                                           '활용되는 고분자 화합물의 화학적 특성에 대해 심도 있는 질문을 던짐. 화학 이론을 실생활 및 생명공학 기술과 연결하는 융합적 사고력이 '
-                                                           '탁월하며, 복잡한 화학 반응식을 구조적으로 설명하여 동료 학생들의 이해를 돕는 등 학문적 리더십을 발휘함.'},
-                                                    {'학년': '2',
-                                                     '영역': '생명과학 I',
-                                                     '내용': '신경생물학적 기전에 대한 높은 학구열을 바탕으로 항우울제의 작용 원리를 시냅스 수준에서 분석함. 신경전달물질인 세로토닌의 재흡수 억제 기전을 '
-                                                           '이해하기 위해 뉴런 모형을 직접 제작하여 시냅스 틈에서의 화학적 신호 전달 과정을 시각화함. 특히 항우울제가 수용체 결합에 미치는 영향을 '
-                                                           '분자 수준에서 설명하고, 약물 투여에 따른 신경 회로의 가소성 변화를 생명공학적 관점에서 고찰함. 고난도 유전 문제 해결 시 가계도 분석을 '
-                                                           '통해 유전자 발현의 확률적 모델을 정교하게 설계하며, 생명 현상을 데이터 기반으로 해석하는 능력이 매우 뛰어남. 수업 중 생명공학 기술의 '
-                                                           '윤리적 쟁점에 대해 비판적 시각을 견지하며, 질병 치료를 위한 유전자 편집 기술의 발전 방향과 생명 윤리 간의 균형점을 찾기 위한 토론을 '
-                                                           '주도하는 등 예비 생명공학자로서의 자질을 입증함.'},
-                                                    {'학년': '2',
-                                                     '영역': '영어 I',
-                                                     '내용': '생명공학 분야의 최신 논문을 영어 원문으로 읽고 분석하는 능력을 갖추기 위해 학술적 영어 표현 습득에 매진함. 동료들의 영작문에서 '
-                                                           "복합관계사, 분사 구문, 명사절의 격 일치 등 문법적 오류를 정밀하게 교정하며 논리적 글쓰기 역량을 발휘함. 특히 '합성생물학의 미래'를 "
-                                                           '주제로 한 에세이 작성 시, 복잡한 생화학적 기전을 정교한 연결사와 전문 용어를 활용하여 서술하는 능력이 탁월함. 반려견의 중독 사고를 '
-                                                           '가정한 수의사와의 상담 시나리오를 작성할 때, 테오브로민의 대사 경로와 신경계에 미치는 독성 기전을 영어로 정확히 설명하는 대본을 구성함. '
-                                                           '이를 통해 전공 지식을 외국어로 전달하는 의사소통 역량을 입증하였으며, 발표 과정에서 과학적 사실을 명확하고 설득력 있게 전달하여 학급 '
-                                                           '내에서 높은 평가를 받음.'},
-                                                    {'학년': '2',
-                                                     '영역': '생명과학 I',
-                                                     '내용': '생명 현상의 분자적 기전을 수학적 모델링으로 해석하려는 시도가 돋보이는 학생임. 신경전달물질의 시냅스 전달 과정을 단순히 암기하는 데 그치지 '
-                                                           '않고, 이를 전기 회로의 신호 전달 체계와 비교하여 분석하는 창의적 접근을 보임. 특히 현대인의 우울증 치료를 위한 항우울제의 작용 기전을 '
-                                                           '탐구하며, 세로토닌 재흡수 억제제(SSRI)가 시냅스 틈새의 신경전달물질 농도에 미치는 영향을 정량적으로 추론함. 직접 제작한 뉴런 모형을 '
-                                                           '통해 신경전달물질의 방출과 수용체 결합 과정을 시각화하였으며, 항우울제가 수용체 결합 효율을 높이는 원리를 생물물리학적 관점에서 논리적으로 '
-                                                           '설명함. 동료들의 질문에 대해 생명공학적 응용 가능성까지 확장하여 답변하는 등 깊이 있는 학문적 탐구 태도를 견지함.'}],
-                                     'comments': [{'구분': '학교생활충실도 및 성실성',
-                                                   '내용': '과학중점 일반고의 엄격한 학업 환경 속에서도 1.1이라는 최상위권 내신을 유지하며, 교과 수업과 연계된 심화 탐구 활동에 일관되게 참여한 '
-                                                         '성실함이 매우 돋보임. 1학년 때부터 생명공학 분야에 대한 명확한 진로 의식을 바탕으로 학업 역량을 증명하고, 2학년 이후 정보과학 및 '
-                                                         '고급생명과학 교과를 통해 전공 적합성을 심화시킨 서사가 매우 탄탄함.'},
-                                                  {'구분': '공동체 역량의 재해석',
-                                                   '내용': '생명공학 연구자에게 필요한 윤리적 책임감과 협업 능력을 교내 토론 활동을 통해 입증함. 단순히 리더십을 강조하는 대신, 유전자 편집 기술의 '
-                                                         '사회적 파급력과 생명 윤리 딜레마에 대해 깊이 있는 철학적 고찰을 진행한 점은 공동체 역량을 보여주는 매우 수준 높은 방식임.'},
-                                                  {'구분': '진로 활동의 단계적 발전',
-                                                   '내용': '1학년 진로활동에서 생명공학의 학문적 로드맵을 설계하며 합성생물학의 최신 동향을 파악한 점이 우수함. CRISPR-Cas9 기술의 원리 탐구에 '
-                                                         '그치지 않고, 이를 실제 질병 치료제 개발과 연결하여 기술적 한계와 극복 방안까지 고민한 흔적이 보여 전공 준비도가 매우 높음.'},
-                                                  {'구분': '활동 간 연계성 보완',
-                                                   '내용': '자율활동과 동아리 활동에서 수학적 모델링과 생명과학 실험을 유기적으로 결합한 점이 탁월함. 개별 활동이 나열되는 것에 머물지 않고, DNA '
-                                                         '구조의 기하학적 안정성 탐구와 같은 활동을 통해 생명공학적 문제 해결을 위한 자신만의 학문적 연결고리를 잘 구축함.'},
-                                                  {'구분': '생명공학과 특화 활동 (정수)',
-                                                   '내용': '2학년 동아리 활동에서 DNA 이중나선 구조를 3차원 모델로 구현하고 각 결합 부위의 인장력을 수학적으로 계산한 사례는 생명공학 지망생으로서 '
-                                                         '매우 우수한 지점임. 생체 모방 공학을 주제로 한 탐구에서도 구체적인 데이터 분석을 통해 전공 적합성을 극대화함.'},
-                                                  {'구분': '동아리 활동의 역할',
-                                                   '내용': '동아리는 교과 심화 탐구의 핵심 무대로 활용됨. DNA 구조의 기하학적 규명이나 생체 모방 공학 설계 등은 수학적 추론 능력과 공학적 집념을 '
-                                                         '보여주기에 매우 적절함. 주도적인 실험 설계와 데이터 검증 과정이 기록되어 있어 연구 역량이 충분히 드러남.'},
-                                                  {'구분': '생명공학과 적합성 분석',
-                                                   '내용': '생명공학과는 생물학적 지식과 공학적 설계 역량이 동시에 요구됨. 3차원 모델링을 통해 분자 구조를 분석하고 이를 수학적으로 수치화한 경험은 '
-                                                         '교수들에게 강력한 인상을 남길 수 있는 최고 수준의 기록임. 학생이 생명공학의 학제적 특성을 정확히 이해하고 있음이 증명됨.'},
-                                                  {'구분': '생명 윤리 탐구의 심화',
-                                                   '내용': '유전자 편집 기술의 윤리적 쟁점을 다룰 때 단순히 문제 제기에 그치지 않고, 밈의 확산 모델을 활용하여 사회적 담론의 전파 기제를 분석한 점이 '
-                                                         '매우 창의적임. 제도적 대안이나 기술적 안전장치에 대한 고민까지 포함하여 전문적인 탐구 역량을 보여줌.'},
-                                                  {'구분': '독서와 세특의 연계',
-                                                   '내용': "독서 목록이 단순 나열되지 않고 '이기적 유전자'와 같은 도서가 교과 세특의 심화 탐구 도구로 활용된 점이 매우 인상적임. 전공과 억지로 "
-                                                         '연결하기보다 학업 역량과 비판적 사고력을 강조하는 방향으로 독서를 활용하여 지적 호기심을 효과적으로 증명함.'},
-                                                  {'구분': '수학/과학 역량의 증명',
-                                                   '내용': '수학 세특에서 PCR 검사 원리를 지수함수 모델로 정교하게 분석한 부분은 교과 지식의 실생활 응용 능력을 잘 보여줌. 활동의 결과물뿐만 아니라 '
-                                                         '변성, 결합, 신장의 3단계를 수학적 알고리즘으로 구조화하는 과정에서 높은 논리적 사고력이 확인됨.'},
-                                                  {'구분': '교과 세특 기록의 환경 차이',
-                                                   '내용': '1학년과 2학년을 거치며 탐구의 깊이가 점진적으로 심화되는 과정이 잘 드러남. 특히 정보과학 교과와의 융합을 통해 데이터 분석 역량을 강화한 '
-                                                         '점은 일반고 학생으로서 매우 전략적인 선택이며, 구체적인 탐구 내용이 기재되어 평가에 매우 긍정적임.'},
-                                                  {'구분': '인문학적 소양과 윤리 의식',
-                                                   '내용': '통합사회 및 국어 수업에서 과학 기술의 사회적 책임과 윤리적 딜레마를 고찰한 점은 훌륭함. 생명공학 기술이 사회에 미치는 영향을 인문학적 '
-                                                         '맥락에서 풀어낸 사례로, 공학자로서 갖춰야 할 가치관 평가에 매우 긍정적으로 작용함.'},
-                                                  {'구분': '활동 나열의 극복 과제',
-                                                   '내용': '대부분의 학교 세특처럼 단순 활동 나열이 일부 존재하나, 학생이 스스로 문제 정의부터 검증까지 수행한 과정이 명확히 드러남. 특히 뉴턴 실험 '
-                                                         '재조작이나 수학적 모델링 등 자기주도성이 잘 드러나 합격에 매우 긍정적으로 작용함.'},
-                                                  {'구분': '인문과학적 소양과 다양성',
-                                                   '내용': "자율/동아리뿐 아니라 통합사회 세특을 통해 윤리, 철학, 인권에 대한 높은 관심을 증명함. 생명공학 연구자가 갖춰야 할 '생명체에 대한 폭넓은 "
-                                                         "이해'와 '기술의 사회적 수용성'을 인문학적 배경으로 잘 보여준 우수 사례임."},
-                                                  {'구분': '과학적 탐구의 구체화',
-                                                   '내용': '과학탐구실험에서 DNA 추출 시 계면활성제의 화학적 작용 기전을 완벽히 숙지하고 오차를 줄이기 위해 노력한 점은 실무적 꼼꼼함을 보여줌. 전염병 '
-                                                         '확산 기제 발표는 과학적 사고력과 개념 정리 능력이 우수함을 입증함.'},
-                                                  {'구분': '진로와 연계된 기술 활용',
-                                                   '내용': '정보과학 과목에서 유전자 데이터 분석을 위한 코딩 역량을 발휘하거나, 생명공학적 주제를 비주요 교과에도 잘 녹여냄. 교과 간 경계를 허물고 '
-                                                         '자신의 관심사를 확장하는 모습은 평가자에게 매우 좋은 인상을 줌.'},
-                                                  {'구분': '2학년 병리학적 심화',
-                                                   '내용': '2학년 과정에서 생명공학적 지식이 의학 및 병리학적 탐구로 구체화되는 과정이 돋보임. 특히 유전자 치료제와 합성생물학의 최신 동향을 조사하며 '
-                                                         '학문적 깊이를 더한 점은 생명공학과 진학을 위한 준비의 정점임.'},
-                                                  {'구분': '탐구 과목의 이상적 구조',
-                                                   '내용': '화학 및 생명과학 세특에서 [교과 궁금증 → 추가 노력 → 결과]로 이어지는 구조가 매우 탄탄함. 특히 유전자 편집 기술의 작동 원리를 심층 '
-                                                         '분석하고 이를 실제 연구 사례와 연결한 지점은 전공에 대한 열의를 잘 보여줌.'},
-                                                  {'구분': '수학-과학 융합의 가치',
-                                                   '내용': '수학적 모델링을 통해 복잡한 생명 현상을 수식으로 구조화한 활동은 과학적 연구 기법을 수학적으로 계량화한 우수한 사례임. 왜 이 활동을 하게 '
-                                                         '되었는지에 대한 동기와 그 과정에서의 논리적 추론이 완벽하게 조화를 이룸.'},
-                                                  {'구분': '비주류 교과의 전략적 활용',
-                                                   '내용': '영어 및 기타 교과에서 생명공학 관련 영문 논문을 분석하거나 최신 기술 동향을 탐구한 것은 매우 좋은 전략임. 억지스러운 연결이 아니라 학문적 '
-                                                         '호기심을 확장하는 과정으로 보이기 때문임. 구체적인 전문 용어 사용이 돋보임.'},
-                                                  {'구분': '영어 세특의 구체성 부족',
-                                                   '내용': '일부 영어 세특 기록에서 학생의 성실함이 강조된 점은 다소 아쉬우나, 전반적인 활동의 수준이 높고 전공 적합성이 뚜렷하여 큰 문제가 되지 않음. '
-                                                         '탐구의 명확성을 위해 구체적인 논문 주제나 분석 내용을 기재한 점이 이를 보완함.'},
-                                                  {'구분': '문학적 감수성과 비판적 사고',
-                                                   '내용': '문학 세특에서 과학 기술의 오남용을 비판적으로 분석하거나, 논리적 오류를 찾아내는 모습은 학생의 사고 수준이 매우 높음을 증명함. 문학적 형상화 '
-                                                         '능력은 연구자에게 필요한 창의적 문제 해결 능력과도 연결될 수 있음.'},
-                                                  {'구분': '자기주도성과 끈기의 증명',
-                                                   '내용': '실험에서 오차 원인을 냉철히 판단하거나, 수학에서 스스로 탐구 주제를 찾아 깊이 있게 학습하는 태도는 대학에서 학문을 수행할 준비가 되어 있음을 '
-                                                         "보여주는 핵심 지표임. 단순 활동 나열을 이겨내는 '태도의 우수성'이 돋보임."},
-                                                  {'구분': '과목 선택의 전략성',
-                                                   '내용': '고급생명과학 및 정보과학 등 핵심과목을 선택하고 다양한 심화 활동을 수행했다는 점에서 매우 높은 점수를 받았을 것임. 서울대 입시 트렌드상 '
-                                                         '권장과목을 충실히 이수하고 이를 전공 탐구와 연결한 점이 매우 전략적임.'},
-                                                  {'구분': '영어 과목의 전략적 활용',
-                                                   '내용': '영어는 다양한 과학 소재를 접목하기 좋은 과목임. 생명공학 관련 최신 논문을 읽고 요약하거나, 기술의 윤리적 쟁점을 토론하는 등 신선한 소재를 '
-                                                         '통해 전공 적합성을 전략적으로 드러낸 점이 우수함.'},
-                                                  {'구분': '자기주도적 학습 태도',
-                                                   '내용': '배움일지 작성과 메타인지 발달 과정이 기재된 것은 학생의 학습 역량을 신뢰하게 만듦. 어려운 수학적 모델링 문제를 스스로 재구성하여 해결하는 '
-                                                         '모습에서 높은 수준의 학문적 사고력이 증명됨.'},
-                                                  {'구분': '활동 나열의 한계와 보완',
-                                                   '내용': '생명과학 I 등에서 활동이 다수 기재된 점은 심화 활동의 깊이를 가릴 수 있는 단점임. 그러나 학생 특유의 자기주도성과 성취 수준이 이를 '
-                                                         '상쇄하고 있음. 몇몇 강점(유전자 편집 탐구, 수학적 모델링 등)을 구체화하여 기록한 점이 중요함.'},
-                                                  {'구분': '교과 간 융합 탐구',
-                                                   '내용': '수학적 원리를 생명공학적 문제와 연결하여 탐구한 부분은 자연과학에 대한 폭넓은 호기심을 보여줌. 이러한 융합적 접근은 생명공학과와 같은 융합 '
-                                                         '학문 전공자에게 필요한 핵심 역량이며, 매우 성공적인 사례임.'}]},
- 'case_1_humanities_education': {'personal_info': {'대상': '[Case 1] 서울대학교 교육학과 합격생',
-                                                   '고등학교_유형': '자사고',
-                                                   '내신_성적': '1.1 ~ 1.3',
-                                                   '주요_특징': '자사고의 치열한 내신 경쟁 속에서도 1점대 초반의 성적을 유지함. 1학년부터 교육 불평등 해소와 미래 교육 정책을 중심으로 일관된 탐구 '
-                                                            '서사를 구축함.',
-                                                   '총평': '자사고의 엄격한 학업 환경 속에서도 1점대 초반의 최상위 내신을 확보한 점이 매우 인상적이다. 단순히 성적에 그치지 않고, 교육학적 담론을 '
-                                                         '사회학적 관점에서 분석하여 자신만의 교육 철학을 정립한 과정이 생기부 전반에 걸쳐 매우 논리적으로 서술되어 있다. 서울대학교 교육학과 합격생 '
-                                                         '중에서도 교육 정책에 대한 비판적 사고와 실천적 탐구 역량이 가장 돋보이는 사례로 평가된다.',
-                                                   '기타_합격_대학': '연세대 교육학부, 고려대 교육학과, 서강대 사회과학부'},
-                                 'activities': [{'학년': '1',
-                                                 '영역': '자율활동',
-                                                 '내용': '학급 자치회에서 교육 환경 개선 부장을 맡아 교실 내 학습 분위기 조성과 학습 자료 공유 시스템을 구축함. 특히 교육 불평등 문제에 관심을 두고 '
-                                                       "'교육 기회의 평등과 실질적 형평성'을 주제로 학급 토론을 주도함. 국가별 교육과정의 표준화와 지역별 교육 격차 해소 정책을 비교 분석하며, 단순한 "
-                                                       '기회의 균등을 넘어 학습자의 배경을 고려한 맞춤형 교육 지원의 필요성을 역설함. 스포츠한마당에서는 팀의 전략가로서 협동심을 발휘하여 학급의 단합을 '
-                                                       "이끌어냈으며, 공동체 활동 속에서 개별 학생의 역량을 어떻게 조화시킬지 고민하는 리더십을 보여줌. 자율탐구시간에는 '교육 통계의 시각화'를 주제로 "
-                                                       '지역별 학업 성취도와 사교육비 지출 간의 상관관계를 통계적으로 분석함. 상관계수와 회귀분석의 개념을 활용하여 교육 정책의 실효성을 검증하는 포스터를 '
-                                                       '제작하였으며, 데이터에 기반한 교육 정책 수립의 중요성을 강조하여 교내 학술 발표회에서 우수한 평가를 받음.'},
-                                                {'학년': '1',
-                                                 '영역': '동아리활동',
-                                                 '내용': "교육 정책 토론 동아리에서 '고교학점제 도입에 따른 교육 격차 심화 우려'를 주제로 찬반 토론을 주도함. 찬성 측의 학생 선택권 확대 논리와 반대 "
-                                                       "측의 교육 인프라 불균형 논리를 모두 검토하며, 사회자의 역할로서 양측의 논거를 교육학적 관점에서 비판적으로 재구성함. '학교 내 징계 제도의 "
-                                                       "교육적 효과'에 관한 토론에서는 처벌 중심의 징계가 학생의 자아존중감에 미치는 영향을 심리학적 이론을 바탕으로 분석하고, 회복적 생활교육의 도입 "
-                                                       "가능성을 제안함. 또한 '디지털 교과서 도입이 학습 격차에 미치는 영향'을 주제로 한 심화 탐구에서 기술적 접근성뿐만 아니라 디지털 리터러시 교육의 "
-                                                       '부재가 가져올 새로운 불평등을 지적함. 다양한 교육 현안을 다루며 논리적 사고력과 타인의 의견을 경청하는 태도를 길렀으며, 복잡한 사회적 갈등을 '
-                                                       '교육적 대안으로 해결하려는 문제해결 역량이 매우 탁월함.'},
-                                                {'학년': '1',
-                                                 '영역': '진로활동',
-                                                 '내용': "교육학과 진학을 목표로 '미래 교육과 에듀테크의 역할' 강연에 참여하여 인공지능 기반 맞춤형 학습 시스템의 원리를 탐구함. 학습자의 학습 속도와 "
-                                                       '성취도를 실시간으로 분석하는 알고리즘이 교육 현장에서 어떻게 개별화 교육을 구현할 수 있는지 수학적 모델링을 통해 고찰함. 진로 탐색의 날에는 교육 '
-                                                       "정책 전문가 초청 강연을 통해 국가 교육과정 개정의 역사와 미래 사회에 필요한 핵심 역량에 대해 깊이 있게 학습함. 특히 '데이터 기반 교육 "
-                                                       "의사결정'에 관심을 두고, 교육 빅데이터가 학습자의 진로 설계에 미치는 영향력을 분석함. 정밀 교육의 개념을 탐구하며 유전적 요인이나 환경적 요인이 "
-                                                       '학습 성취에 미치는 영향을 교육학적 관점에서 재해석하고, 이를 보완하기 위한 공교육의 역할에 대해 소논문을 작성함. 교육 현장의 다양한 사례를 '
-                                                       '분석하며 교육학적 지식을 실천적인 정책 대안으로 연결하려는 노력이 돋보이며, 미래 교육의 방향성을 제시하는 통찰력이 매우 뛰어남.'},
-                                                {'학년': '2',
-                                                 '영역': '자율활동',
-                                                 '내용': "교육 불평등의 구조적 원인을 분석하기 위해 '디지털 교육 격차와 학습 소외 계층의 교육권'을 주제로 탐구 활동을 수행함. 특히 저소득층 학생들의 "
-                                                       "온라인 학습 환경을 조사하며, 단순한 기기 보급을 넘어선 '디지털 리터러시 교육의 부재'가 실질적인 학습 격차를 유발한다는 가설을 세움. 이를 "
-                                                       '검증하기 위해 지역 내 교육 복지 실태를 분석하고, 교육학적 관점에서 학습자의 자기주도적 학습 역량을 강화할 수 있는 교수 설계 모델을 고안함. '
-                                                       '학생들의 학습 환경을 시각화하기 위해 통계 프로그램을 활용하여 가구 소득과 학업 성취도의 상관관계를 분석하고, 이를 바탕으로 교육 정책이 지향해야 '
-                                                       "할 '맞춤형 보정 교육'의 필요성을 논리적으로 제시함. 팀 프로젝트 과정에서 교육학적 담론을 사회학적 통계와 결합하여 분석하는 방법론을 익혔으며, "
-                                                       "'교육은 사회적 이동성을 보장하는 최후의 보루'라는 철학을 바탕으로 정책 제안서를 작성함. 또한, 교육 현장에서 발생하는 다양한 갈등 상황을 "
-                                                       '해결하기 위한 의사소통 전략을 탐구하며, 교사의 역할이 단순한 지식 전달자를 넘어 학습자의 정서적 지지자이자 조력자임을 깨닫고, 미래 교육 '
-                                                       '현장에서의 교사상에 대해 깊이 있게 성찰함.'},
-                                                {'학년': '2',
-                                                 '영역': '동아리활동',
-                                                 '내용': "교육 정책 비평 동아리에서 '고교학점제와 교육과정의 다양성'을 주제로 심층 토론을 주도함. 찬성 측의 '학생 선택권 확대와 진로 탐색의 기회 보장' "
-                                                       "논리와 반대 측의 '학교 간 교육 인프라 격차와 대입 불공정성' 논리를 교육학적 관점에서 비판적으로 검토함. 특히 교육과정의 자율성이 오히려 입시 "
-                                                       "위주의 과목 쏠림 현상을 심화시킬 수 있다는 점에 주목하여, 이를 보완하기 위한 '공동 교육과정 운영 모델'과 '지역사회 연계형 교육 플랫폼'을 "
-                                                       "대안으로 제시함. 또한, '학교 폭력 예방을 위한 회복적 생활교육'을 주제로 한 토론에서는 처벌 중심의 징계가 아닌 관계 회복 중심의 교육적 접근이 "
-                                                       '학생의 인격적 성장에 미치는 영향을 탐구함. 다양한 교육학 서적과 논문을 참고하여 응보적 정의와 회복적 정의의 차이를 분석하고, 학교 현장에서 적용 '
-                                                       '가능한 구체적인 갈등 조정 프로그램을 설계함. 토론 과정에서 상대방의 논거를 경청하고 자신의 주장을 교육학적 근거에 기반하여 논리적으로 전개하는 '
-                                                       '모습이 돋보였으며, 교육 현장의 복잡한 문제들을 다각도에서 조망하는 비판적 사고력과 문제 해결 능력을 유감없이 발휘함.'},
-                                                {'학년': '2',
-                                                 '영역': '진로활동',
-                                                 '내용': "교육학과 진학을 목표로 '미래 교육과 에듀테크의 윤리적 쟁점' 강연에 참여하여 인공지능 기반 맞춤형 학습 시스템의 교육적 효용성과 한계를 탐구함. "
-                                                       '학습자의 데이터를 실시간으로 분석하여 개별화된 학습 경로를 제공하는 알고리즘이 교육의 효율성을 높일 수 있으나, 데이터 편향성으로 인한 교육적 '
-                                                       "차별이 발생할 수 있음을 지적함. '교육과 기술의 조화'라는 주제로 기술이 인간의 고유한 학습 과정을 대체하는 것이 아니라, 교사의 교육적 판단을 "
-                                                       "보조하는 도구로 활용되어야 함을 강조함. 또한, '교육 불평등 해소를 위한 교육 정책의 방향' 강연을 통해 교육 기회의 평등이 실질적 형평성으로 "
-                                                       "이어지기 위한 국가의 책무를 고찰함. 교육학적 지식을 바탕으로 미래 사회에 필요한 핵심 역량인 '비판적 사고력'과 '협업 능력'을 기르기 위한 "
-                                                       "교육과정 재구성 방안을 제안함. 진로 탐색 활동으로 '교육학자의 길, 교육 현장의 변화를 이끄는 힘' 강의를 수강하며, 교육 현장에서의 실천적 "
-                                                       '지식과 이론적 연구의 통합적 접근법에 대해 깊이 있게 탐구함. 특히 교육학자의 저서를 읽으며 교육이 한 인간의 삶을 어떻게 변화시킬 수 있는지에 '
-                                                       '대해 진지하게 성찰하고, 교육학자로서 갖추어야 할 윤리적 사명감과 교육 현장에 대한 애정을 확고히 함.'},
-                                                {'학년': '1',
-                                                 '영역': '통합사회',
-                                                 '내용': '교육 불평등의 사회적 기제를 탐구하기 위해 교과서의 사회 계층화 이론을 심층적으로 분석함. 특히 교육 기회의 불평등이 세대 간 계층 이동에 미치는 '
-                                                       '영향을 분석하며, 단순히 개인의 노력 부족으로 치부되는 교육 격차의 구조적 원인을 사회학적 관점에서 논리적으로 비판함. 교육 정책이 사회적 약자에게 '
-                                                       '미치는 영향을 파악하고자 국가별 교육과정 표준화 사례를 조사하였으며, 교육의 공공성을 확보하기 위한 국가의 역할에 대해 자신의 견해를 담은 보고서를 '
-                                                       "작성함. 수업 중 배운 정의론을 교육 현장에 적용하여 '기회의 평등'과 '결과의 평등' 사이의 딜레마를 교육학적 관점에서 재해석하고, 미래 교육이 "
-                                                       '나아가야 할 방향으로 맞춤형 교육 복지 모델을 제안하는 등 학문적 융합 사고력을 발휘함.'},
-                                                {'학년': '2',
-                                                 '영역': '교육학',
-                                                 '내용': '교육 철학의 흐름을 개괄적으로 탐색하여 도덕적 행위와 교육의 상관관계를 정리하고, 이를 현대 교육 심리학의 학습 이론과 연계하는 과제를 탁월하게 '
-                                                       '수행함. 루소의 자연주의 교육 사상에 주목하여 아동의 발달 단계에 따른 교육의 자율성을 강조한 점을 분석함. 이를 토대로 외부 자극에 대한 학습자의 '
-                                                       '반응이 즉각적인지 아니면 사회적 규범을 내면화하는 과정에서 형성되는지에 대한 주제를 스스로 설정함. 이 주제를 바탕으로 루소의 교육관이 현대의 '
-                                                       '구성주의 학습 이론과 어떻게 맞닿아 있는지 논증하였으며, 인간의 도덕적 선택이 전두엽의 발달과 환경적 요인의 상호작용임을 밝힌 뇌과학 연구를 '
-                                                       '인용하여 교육 환경이 학습자의 인지 발달에 미치는 영향을 논리적으로 체계화하는 역량을 보여줌.'},
-                                                {'학년': '2',
-                                                 '영역': '독서와 문법',
-                                                 '내용': '교육 관련 고전과 사회과학 서적을 읽고 교육 현장의 갈등 해소 방안을 분석하는 비평문을 작성함. 특히 학교 내 갈등 상황에서 중재자의 역할과 배려 '
-                                                       '윤리의 중요성을 강조하며, 올바른 갈등 해소 방안으로 민주적 의사소통 구조를 제안함. 통합 요약의 의미를 학습한 후 교육 정책에 관한 상반된 견해를 '
-                                                       "담은 사설들을 비교 분석하여 공통점과 차이점을 도출함. 또한 교육학적 통찰을 얻고자 '교육이란 무엇인가'를 읽고, 유전적 요인과 환경적 요인이 "
-                                                       "학습자의 성취에 미치는 영향을 양자역학적 불확실성 개념에 빗대어 학문 융합적 관점에서 해석함. 교육 심리학의 발전 과정을 조사하고 친구들과 '교육은 "
-                                                       "과학인가, 예술인가?'를 주제로 토론하며, 교육 현장의 복잡성을 고려할 때 교육은 객관적 데이터와 주관적 가치가 공존하는 영역임을 논리적으로 "
-                                                       '설득함.'},
-                                                {'학년': '2',
-                                                 '영역': '체육',
-                                                 '내용': '체육 수업 전반에 걸쳐 공동체 의식과 스포츠맨십을 발휘하며 열정적으로 참여하는 학생임. 농구 수행평가 과정에서 팀원 간의 패스 경로를 최적화하기 '
-                                                       '위해 전술적인 움직임을 제안하고, 배드민턴 경기에서는 셔틀콕의 궤적을 예측하여 수비 위치를 선정하는 등 전략적 사고를 보여줌. 특히 태권도 기본 '
-                                                       '동작과 품새를 익히는 과정에서 신체 조절 능력이 매우 뛰어나며, 발차기의 정확도와 속도 면에서 기술적인 성장을 거듭함. 단순히 신체 활동에 그치지 '
-                                                       '않고, 스포츠가 학교 현장에서 학생들의 정서적 안정과 사회성 함양에 미치는 교육적 가치를 탐구하고자 함. 체육 활동을 통해 얻은 협동의 경험을 '
-                                                       '바탕으로, 향후 교육 현장에서 체육 교육이 학생들의 전인적 성장을 돕는 핵심적인 교육 과정으로 어떻게 기능할 수 있을지에 대해 깊이 있는 고민을 '
-                                                       '이어감. 신체적 역량뿐만 아니라 스포츠를 매개로 한 교육적 상호작용의 중요성을 체득한 점이 매우 인상적임.'},
-                                                {'학년': '2',
-                                                 '영역': '언어와 매체',
-                                                 '내용': "학습 태도가 매우 성실하며 매체 언어의 사회적 영향력을 비판적으로 수용하는 능력이 탁월함. '교육 불평등과 디지털 격차'를 주제로 한 기사문을 "
-                                                       "분석하며, 매체의 정보 전달 방식이 수용자의 인식에 미치는 영향을 심층적으로 고찰함. 기사의 논리적 구조와 필자의 의도를 분석한 후, '디지털 교육 "
-                                                       "환경에서의 학습 소외 계층을 위한 정책적 대안'이라는 제목의 기사문을 직접 작성함. 이 글에서 교육 현장의 디지털 전환이 오히려 정보 접근성의 "
-                                                       '차이를 유발할 수 있음을 지적하며, 교육 당국이 기술적 보급을 넘어 실질적인 디지털 리터러시 교육을 강화해야 한다는 논리를 설득력 있게 전개함. '
-                                                       '또한, 교육 정보 플랫폼의 특징을 정보 제시 언어, 정보 제공자의 전문성, 정보의 신뢰성 및 보존 방식을 기준으로 면밀히 파악함. 특히 교육 관련 '
-                                                       '채널이 지니는 순기능과 허위 정보 유포라는 역기능을 동시에 인지하고, 이를 해결하기 위해 교육 전문가로서 갖추어야 할 매체 비평적 시각과 윤리적 '
-                                                       '책임감에 대해 깊이 있게 탐구함. 매체를 통해 교육 담론을 생산하고 확산하는 과정에서 논리적 완결성을 확보하려는 노력이 돋보임.'},
-                                                {'학년': '2',
-                                                 '영역': '수학 1',
-                                                 '내용': '수학적 개념을 교육 현상의 분석 도구로 활용하는 능력이 매우 뛰어남. 수열의 일반항과 합의 개념을 학습한 후, 이를 교육 정책의 효과 분석에 '
-                                                       "적용하여 등차수열과 등비수열의 원리를 활용한 '교육 예산 배분 및 학생 지원금의 장기적 변화 추이'를 모델링함. 주어진 문제를 해결하기 위해 수학적 "
-                                                       '지식을 확인하고 다양한 해결 전략을 모색하며 결과를 완성하는 과정에서 논리적 엄밀함을 유지함. 또한, 삼각함수의 주기성을 학습한 후에는 교육 통계 '
-                                                       '데이터의 주기적 변동성을 분석하는 데 관심을 가짐. 지오지브라 프로그램을 활용하여 교육 성취도 변화 그래프를 시각화하고, 변수 간의 상관관계를 '
-                                                       '함수적으로 해석하는 탐구 활동을 수행함. 특히 교육학적 통계 자료를 해석할 때 발생할 수 있는 오류를 수학적으로 검증하고, 데이터에 기반한 교육 '
-                                                       '정책 수립의 필요성을 역설함. 문제 해법을 정리하여 어려움을 겪는 친구들에게 적극적으로 설명하는 과정에서 교육자로서의 자질을 보여주었으며, 수학적 '
-                                                       '사고력이 교육학적 탐구의 기초가 될 수 있음을 스스로 증명함.'},
-                                                {'학년': '2',
-                                                 '영역': '수학II',
-                                                 '내용': '교육 과정 내의 함수 개념을 확장하여 교육 현장에서의 학습자 성취도 변화를 모델링하는 탐구 활동을 수행함. 특정 학습 집단의 성취도 변화율을 미분 '
-                                                       '계수로 해석하고, 학습 시간 대비 성취도 향상 곡선을 도함수로 표현하여 학습 효율이 극대화되는 지점을 수학적으로 도출함. 특히 정적분을 활용하여 '
-                                                       '일정 기간 동안의 누적 학습 효과를 계산하고, 이를 교육 정책의 투입 대비 산출 효율성 분석에 적용함. 수업 중 제시된 복잡한 함수의 그래프 개형을 '
-                                                       '분석할 때, 단순히 수식의 계산에 그치지 않고 교육적 변수와의 상관관계를 논리적으로 설명함. 친구들의 풀이 과정에서 논리적 비약이 발생할 경우, '
-                                                       '교육학적 관점에서 학습자의 사고 과정을 단계별로 재구성하여 설명해 주는 등 협력적 학습 분위기를 주도함. 형성평가에서 최상위권 성적을 유지하며, '
-                                                       '수학적 사고력을 교육 현상의 분석 도구로 활용하는 능력이 매우 탁월함.'},
-                                                {'학년': '2',
-                                                 '영역': '한국사',
-                                                 '내용': "근현대 교육 제도의 변천사에 깊은 관심을 가지고 '일제 강점기 교육 정책이 한국인의 근대적 자아 형성에 미친 영향'을 주제로 심층 탐구를 진행함. "
-                                                       '당시의 교육이 민족 말살 정책의 일환으로 어떻게 활용되었는지, 그리고 이에 대응하여 민족 교육 운동이 어떤 방식으로 전개되었는지 다양한 사료를 '
-                                                       '분석함. 특히 1920년대 문화 통치기 교육 정책의 이중성을 비판적으로 고찰하며, 교육이 단순한 지식 전달을 넘어 국가 정체성 형성에 미치는 구조적 '
-                                                       '영향력을 파악함. 또한, 해방 이후 미군정기 교육 개혁이 현대 한국 교육의 기틀을 마련하는 과정에서 발생한 갈등과 타협의 역사를 조사함. 역사적 '
-                                                       '사건을 단순히 암기하는 것을 넘어, 교육학적 관점에서 당시의 교육 환경이 학습자들에게 어떤 심리적, 사회적 영향을 미쳤는지 추체험하며 분석함. '
-                                                       '한국의 교육적 특수성과 보편적 교육 가치를 연결 지어 생각하는 통찰력이 돋보이며, 역사적 맥락을 통해 현재의 교육 불평등 문제를 해결하기 위한 '
-                                                       '정책적 시사점을 도출함.'},
-                                                {'학년': '2',
-                                                 '영역': '사회문화',
-                                                 '내용': "교육 불평등의 사회적 기제를 탐구하기 위해 기능론과 갈등론의 관점에서 현대 교육 제도를 분석함. '교육의 사회적 선발 기능과 계층 이동의 사다리 "
-                                                       "역할'을 주제로 탐구하며, 교육이 과연 사회적 불평등을 완화하는지 아니면 재생산하는지에 대해 심도 있는 토론을 주도함. 특히 문화 자본 이론을 통해 "
-                                                       '가정 배경이 학생의 학업 성취도에 미치는 영향을 통계 자료를 바탕으로 분석하고, 이를 극복하기 위한 공교육의 역할과 정책적 대안을 제시함. 또한, '
-                                                       '에듀테크의 도입이 교육 격차를 해소할 수 있는 도구인지, 아니면 새로운 형태의 디지털 소외를 야기하는지 고찰함. 기술적 보완점뿐만 아니라 교육적 '
-                                                       '형평성을 고려한 정책 설계의 필요성을 강조하며, 데이터 기반의 교육 정책이 인간 중심의 가치를 훼손하지 않아야 한다는 자신만의 교육 철학을 '
-                                                       '논리적으로 주장함. 사회 현상을 교육학적 시각으로 재해석하는 능력이 뛰어나며, 탐구 과정에서 도출한 결론을 실제 교육 정책 제안서 형태로 정리하여 '
-                                                       '발표하는 등 실천적 탐구 역량을 보여줌.'},
-                                                {'학년': '2',
-                                                 '영역': '교육학',
-                                                 '내용': '교육과정의 설계 원리를 탐구하며 학습자의 인지 발달 단계에 따른 교육 내용의 계열화 방안을 분석함. 특히 브루너의 지식의 구조 이론을 바탕으로 교과 '
-                                                       '내용이 학습자의 사고 체계와 어떻게 상호작용하는지 고찰하고, 이를 현대 교육과정의 역량 중심 교육과정과 연결하여 비판적으로 검토함. 교육 현장에서의 '
-                                                       '지식 전달 방식이 학습자의 내적 동기 유발에 미치는 영향을 파악하기 위해 교육 심리학적 관점에서 학습 동기 이론을 조사함. 또한, 교육 평가의 '
-                                                       '타당도와 신뢰도를 확보하기 위한 문항 분석 기법을 학습하고, 실제 학업 성취도 평가 문항을 분석하여 변별력과 교육적 효과성을 평가하는 보고서를 '
-                                                       '작성함. 평가 결과의 오차 원인을 분석하는 과정에서 통계적 방법론을 적용하여 교육 데이터의 객관적 해석 능력을 배양함.'},
-                                                {'학년': '2',
-                                                 '영역': '사회문화',
-                                                 '내용': '교육 불평등의 사회적 기제를 규명하고자 사회 계층화 이론과 교육의 사회적 기능을 심층적으로 탐구함. 특히 부르디외의 문화 자본 이론을 중심으로 '
-                                                       '가정의 사회경제적 배경이 학생의 학업 성취와 진로 선택에 미치는 영향을 분석하여 발표함. 교육이 계층 이동의 사다리 역할을 수행하는지, 혹은 기존의 '
-                                                       '계층 구조를 재생산하는지에 대한 논쟁을 사회학적 관점에서 고찰하고, 교육 정책이 이러한 불평등을 완화하기 위해 어떠한 제도적 장치를 마련해야 하는지 '
-                                                       '대안을 제시함. 또한, 교육 현장에서 발생하는 다양한 사회적 상호작용을 관찰하고, 교사와 학생 간의 상호작용이 학습자의 자아개념 형성에 미치는 '
-                                                       '영향을 상징적 상호작용론의 관점에서 해석함. 연구 과정에서 설문 조사와 통계 자료 분석을 병행하여 교육 정책의 실효성을 검증하려는 과학적 탐구 '
-                                                       '태도를 보임.'},
-                                                {'학년': '2',
-                                                 '영역': '수학 I',
-                                                 '내용': '수학적 모델링을 통해 교육 현상의 복잡성을 단순화하고 최적의 교육 정책을 도출하는 능력이 탁월함. 수열의 개념을 활용하여 교육 예산의 연차별 배분 '
-                                                       '모델을 설계하고, 교육 격차 해소를 위한 지원금의 누적 효과를 등비수열의 합 공식으로 계산하여 정책의 지속 가능성을 분석함. 또한, 삼각함수의 '
-                                                       '주기성을 학습한 후 교육 과정의 순환적 구조와 학습자의 망각 곡선을 연계하여 최적의 복습 주기와 교육 프로그램 설계 방안을 탐구함. 지오지브라 '
-                                                       '프로그램을 활용하여 학습자의 성취도 변화를 함수 그래프로 시각화하고, 변수 변화에 따른 교육 성과를 예측하는 시뮬레이션을 수행함. 복잡한 교육 '
-                                                       '데이터를 해석하기 위해 통계적 추론을 활용하며, 데이터 기반의 의사결정이 교육 행정의 효율성을 어떻게 증진할 수 있는지 논리적으로 설명함.'},
-                                                {'학년': '2',
-                                                 '영역': '교육학',
-                                                 '내용': "교육과정의 설계 원리를 학습한 후, 학교 현장의 교육과정 편성 자율성이 학생의 학습 동기에 미치는 영향을 분석하여 급우들에게 발표함. '교육과정은 "
-                                                       "고정된 지식의 전달인가, 학습자의 경험 재구성인가'를 주제로 듀이의 경험주의 교육 철학을 현대적 관점에서 재해석하여 논증함. 특히 고교학점제 도입에 "
-                                                       '따른 학교별 교육과정 다양화 사례를 조사하여, 학생의 과목 선택권이 실질적인 진로 탐색으로 이어지기 위한 교육적 보완점을 제도적 관점에서 제시함. '
-                                                       '교육과정의 표준화와 개별화 사이의 균형점을 찾기 위한 탐구 과정을 도식화하여 교육학적 이해도를 높임.'},
-                                                {'학년': '2',
-                                                 '영역': '사회문화',
-                                                 '내용': '사회 계층화 이론을 활용하여 교육 불평등의 구조적 원인을 분석하고, 이를 교육 정책적 대안과 연결함. 부르디외의 문화자본 이론을 바탕으로 가정 '
-                                                       '환경의 문화적 배경이 학생의 학업 성취도에 미치는 영향을 파악하고, 이를 극복하기 위한 공교육의 보상적 교육 정책 기전을 탐구함. 또한 교육 격차 '
-                                                       '해소를 위한 방과 후 프로그램의 효과성을 검증하는 설문 조사를 설계하고, 데이터 분석을 통해 교육 프로그램의 질적 차이가 학습 소외 계층의 교육 '
-                                                       '기회에 미치는 영향을 파악함. 연구 과정에서의 변수 통제와 분석의 객관성을 확보하려는 학구적 태도를 보임.'},
-                                                {'학년': '2',
-                                                 '영역': '심리학',
-                                                 '내용': '학습 심리학의 원리를 주제로 하여, 인지 발달 단계에 따른 맞춤형 교수-학습 전략을 발표함. 피아제의 인지 발달 이론을 중심으로 학습자의 발달 '
-                                                       '수준에 적합한 교육 매체와 교수법의 상호작용을 논리적으로 설명함. 특히 메타인지 능력이 학습 성취도에 미치는 영향을 분석하고, 학습자가 자신의 사고 '
-                                                       '과정을 성찰하도록 돕는 교육적 개입의 중요성을 강조함. 교육 현장에서의 심리학적 원리 적용이 단순한 지식 습득을 넘어 학습자의 자아 효능감 향상에 '
-                                                       '기여한다는 통찰을 제시하고, 미래 교육 환경에서의 에듀테크 활용 가능성과 한계점을 균형 있게 고찰함.'},
-                                                {'학년': '2',
-                                                 '영역': '교육학적 사회 탐구',
-                                                 '내용': '언어와 매체 교과에서 교육 정보 매체의 신뢰성과 디지털 리터러시의 중요성을 탐구함. 특히 교육 플랫폼 내 정보의 비대칭성이 학습 격차를 심화시키는 '
-                                                       '기제를 분석하고, 교육 서비스 제공자가 갖춰야 할 윤리적 책무와 공공성을 인본주의적 관점에서 논술함. 교과서의 매체 언어 이론을 실제 교육 정책 '
-                                                       '비평과 연결하여, 정보 전달의 효율성보다 학습자의 비판적 사고력을 배양하는 매체 활용 방안을 제시한 점이 훌륭함.'},
-                                                {'학년': '2',
-                                                 '영역': '교육 통계 및 모델링 심화',
-                                                 '내용': '수학 I 교과에서 교육 성취도 평가 데이터를 등비수열로 단순 분석하는 수준을 넘어, 학습자의 누적 학습량과 망각 곡선을 고려한 학습 효율 모델을 '
-                                                       '수열의 극한과 미분 개념을 활용해 심화 탐구함. 교육 현장의 개별화 학습 알고리즘을 수학적으로 모델링하여, 학습자의 성취도 변화를 예측하는 함수를 '
-                                                       '도출함. 푸리에 변환의 원리를 교육 평가의 시계열 데이터 분석에 적용하여, 특정 학습 시점의 성취도 변화율을 구체적인 수식으로 해석하는 등 교육 '
-                                                       '공학적 역량을 입증함.'},
-                                                {'학년': '2',
-                                                 '영역': '교육 공간 기하학',
-                                                 '내용': '수업 중 제시되는 교육 환경 설계 질문에 대해 다양한 관점을 존중하며 본인의 생각을 능동적으로 표현함. 지오지브라를 활용해 교실 공간의 효율적 '
-                                                       '배치를 위한 평면 분할과 최적 동선을 기하학적으로 분석함. 특히 원뿔곡선의 정의를 학습하며 이를 교육 공간의 시각적 개방성과 연결하여, 학습자의 '
-                                                       '집중력을 극대화할 수 있는 공간 구조를 기하학적으로 증명함. 당들랭 구의 개념을 응용하여 교실 내 조명 투사 각도와 학습자의 시야각 관계를 '
-                                                       '수식화함. 교과서의 수학적 사실을 당연시하지 않고, 실제 교육 환경에 적용하여 문제를 해결하는 자세가 돋보임. 또한, 교육 불평등의 공간적 요인을 '
-                                                       '분석하기 위해 지역별 교육 인프라 분포를 기하학적 수렴점 모델로 정의하고, 교육 격차 해소를 위한 최적의 교육 거점 배치 방안을 수학적으로 유도하여 '
-                                                       '융합적 사고력을 보임.'},
-                                                {'학년': '2',
-                                                 '영역': '심화 영어 I',
-                                                 '내용': '영어 구사력이 매우 탁월하며, 복잡한 학술적 지문을 분석하여 핵심 논지를 도출하는 능력이 최상위권임. 교육학적 담론에 대한 깊은 관심을 바탕으로 '
-                                                       "'교육 불평등의 재생산'에 관한 영문 칼럼을 발표하며, 단순한 내용 전달을 넘어 교육 사회학적 맥락을 상세히 해설함. 특히 부르디외의 문화 자본 "
-                                                       '이론을 인용하여 교육 격차가 개인의 지능 차이가 아닌 사회적 배경에서 기인함을 논리적으로 설명해 급우들의 높은 평가를 받음. 글쓰기 활동에서는 '
-                                                       '\'교육 기회의 평등과 실질적 형평성\'을 주제로 에세이를 작성함. 빈곤이 교육 환경에 미치는 부정적 영향을 분석하며, "Educational '
-                                                       'inequality is a structural barrier to social mobility"라는 명확한 주제문을 제시함. 단순히 현상을 '
-                                                       '나열하는 데 그치지 않고, 공교육 시스템 내에서의 보충 학습 지원 체계와 디지털 리터러시 교육의 필요성을 정책적 대안으로 제시하는 등 비판적 '
-                                                       '사고력을 유감없이 발휘함. 교재 지문의 내용을 확장하여 교육학적 관점에서 학습 동기 부여와 자기주도 학습의 상관관계를 탐구하고, 이를 체계적인 영어 '
-                                                       '에세이로 정리하여 학술적 글쓰기 역량을 입증함.'},
-                                                {'학년': '2',
-                                                 '영역': '사회문제 탐구',
-                                                 '내용': '교육 소외 계층의 학습권 보장에 관한 질적 사례 연구를 수행하여 발표함. 저소득층 학생들의 방과 후 학습 환경을 심층 면담을 통해 분석하고, 교육 '
-                                                       "격차가 발생하는 구조적 원인을 갈등론적 관점에서 고찰함. 특히 디지털 기기 보급의 양적 확대가 질적인 학습 성취로 이어지지 않는 '디지털 교육 "
-                                                       "격차'의 실태를 지적하며, 이를 해결하기 위한 맞춤형 멘토링 제도와 교육 복지 시스템의 개선 방안을 제시함. 코로나19 이후 원격 수업의 확산으로 "
-                                                       "인해 심화된 교육 불평등 문제를 통계 자료를 통해 분석하고, 교육 인프라의 지역적 편차를 해결하기 위한 '교육 자원 공유 플랫폼' 구축 연구 "
-                                                       '계획서를 작성함. 문헌 연구법을 활용하여 지난 10년간의 교육 예산 배분 현황과 학업 성취도 간의 상관관계를 통시적으로 분석하였으며, 교육 소외 '
-                                                       '지역을 우선 지원 대상으로 선정해야 한다는 논리적 근거를 마련함. 또한, 교육 현장에서의 비정규직 교원 차별 문제에 대해 설문조사를 실시하고, 교원 '
-                                                       '처우 개선이 교육의 질적 향상에 미치는 영향을 분석하여 학급 내에서 토론을 주도함.'},
-                                                {'학년': '2',
-                                                 '영역': '고전과 윤리',
-                                                 '내용': "롤스의 정의론을 학습하며 '교육적 정의는 어떻게 실현 가능한가?'라는 근본적인 질문을 던짐. 롤스의 '무지의 베일' 개념을 교육 현장에 적용하여, "
-                                                       '학습자의 가정 환경이나 경제적 배경을 배제한 상태에서 공정한 교육 기회를 배분하는 방안을 고민함. 교육을 단순한 서비스가 아닌 사회적 기본 가치의 '
-                                                       '분배 문제로 인식하고, 노먼 대니얼스의 정의론을 교육학적 관점에서 재해석함. 특히 교육 서비스의 분배 과정에서 발생하는 불평등을 최소화하기 위해 '
-                                                       '교육 정책이 지향해야 할 가치를 탐구함. 수업 시간에 배운 이론이 교육 현장의 실제 문제와 밀접하게 연관되어 있음을 깨닫고, 미래의 교육 정책가로서 '
-                                                       '교육 현장의 구조적 모순을 해결해야 한다는 사명감을 느낌. 교육 과정의 다양성과 학생 선택권 보장이 교육적 정의를 실현하는 핵심 요소임을 강조하며, '
-                                                       '어떤 교육 체계가 모든 학생에게 공정한 출발선을 제공할 수 있는지에 대해 심도 있는 보고서를 작성함. 현장에서의 경험을 바탕으로 교육 불평등을 '
-                                                       '해소하고, 모든 학습자가 잠재력을 발휘할 수 있는 공정한 교육 시스템을 설계하겠다는 구체적인 진로 의지를 표명함.'},
-                                                {'학년': '3',
-                                                 '영역': '독서',
-                                                 '내용': '교육학적 담론을 사회학적 관점에서 분석하는 능력이 탁월하며, 교육 불평등 해소를 위한 정책적 대안을 탐구하는 데 깊은 열의를 보임. 교육 관련 '
-                                                       '고전과 현대 교육 정책 보고서를 섭렵하며, 특히 교육 기회의 평등이 사회 계층 이동에 미치는 영향에 주목함. 교육 격차의 실태를 파악하고자 학급 '
-                                                       "구성원을 대상으로 '방과 후 학습 환경과 자기주도 학습 역량의 상관관계'를 주제로 설문 조사를 실시하여, 가정 내 교육 자원의 차이가 학습 성취도에 "
-                                                       '미치는 구조적 영향을 통계적으로 분석함(응답률 92%). 이 과정에서 부르디외의 문화 자본 이론을 적용하여, 단순히 경제적 지원을 넘어선 교육 '
-                                                       '문화적 격차 해소 방안을 모색함. 교육 정책의 실효성을 높이기 위해 공교육 내 맞춤형 멘토링 시스템의 도입 가능성을 검토하고, 이를 구체적인 정책 '
-                                                       '제안서 형태로 작성하여 학급 내 공유함. 자료 조사부터 논리적 결론 도출까지 주도적으로 탐구를 이끌며, 복잡한 교육 현상을 다각도로 해석하는 비판적 '
-                                                       '사고력과 지식 공유의 가치를 실천하는 태도가 매우 돋보임.'},
-                                                {'학년': '3',
-                                                 '영역': '고급 수학 I',
-                                                 '내용': '교육 통계 및 데이터 분석의 기초가 되는 수학적 원리를 깊이 있게 이해하고 이를 교육 현상 분석에 적용함. 벡터공간의 대수적 성질과 행렬을 이용한 '
-                                                       '다변량 데이터 처리 방식을 학습하며, 교육 평가 데이터의 상관관계를 분석하는 데 필요한 수학적 도구를 익힘. 특히 파이썬의 넘파이 라이브러리를 '
-                                                       '활용하여 대규모 교육 평가 데이터를 행렬로 구조화하고, 학생들의 성취도 변화 추이를 다차원적으로 분석하는 알고리즘을 구현함. 행렬식이 일차독립을 '
-                                                       '판단하는 근거가 됨을 논리적으로 증명하며, 교육 과정의 다양성을 측정하는 지표로서 행렬 연산이 어떻게 활용될 수 있는지 탐구함. 복소수의 극형식과 '
-                                                       '기하학적 의미를 학습할 때는 이를 교육 과정의 나선형 구조와 연결하여, 학습자의 인지 발달 단계에 따른 지식의 심화 과정을 수학적 모델로 '
-                                                       '시각화하려는 시도를 보임. 수학적 사고를 교육학적 방법론과 결합하여 데이터 기반의 교육 정책 수립 가능성을 타진하는 등 융합적 탐구 역량이 매우 '
-                                                       '뛰어남.'},
-                                                {'학년': '3',
-                                                 '영역': '물리학 II',
-                                                 '내용': '물리학적 사고방식을 교육학적 문제 해결에 접목하여 교육 시스템의 구조적 결함을 분석하는 데 탁월한 역량을 발휘함. 파동의 회절과 간섭 원리를 학습한 '
-                                                       "후, 이를 '교육 현장에서의 정보 전달 왜곡과 소통의 간섭 현상'이라는 주제로 확장하여 탐구함. 물리적 법칙이 복잡한 시스템을 단순화하여 설명하듯, "
-                                                       '교육 정책 또한 학습자의 개별성을 고려한 정교한 모델링이 필요함을 역설함. 특히 일반 상대성 이론의 시공간 왜곡 개념을 교육 불평등으로 인한 학습 '
-                                                       '기회의 왜곡에 비유하여, 교육 격차를 해소하기 위한 정책적 보정의 필요성을 논리적으로 서술함. 힐버트 호텔의 무한 개념을 활용하여 교육의 보편성과 '
-                                                       '수월성 사이의 균형을 논하는 글을 작성하며, 현대 교육학적 소양을 물리학적 논리로 뒷받침함. 수업 중 복잡한 물리 현상을 분석할 때 보여준 끈기 '
-                                                       '있는 태도와 기존 지식을 새로운 맥락으로 재구성하는 창의적 통찰력은 교육학자로서의 자질을 충분히 보여줌.'},
-                                                {'학년': '3',
-                                                 '영역': '교육학',
-                                                 '내용': "교육과정 설계와 평가를 주제로 한 심화 탐구 발표에서 '역량 중심 교육과정의 실효성 분석'을 다루며, 교육 현장의 평가 체계가 학생의 개별적 성장을 "
-                                                       '어떻게 반영할 수 있는지 논리적으로 전개함. 특히 형성평가와 총괄평가의 상호보완적 관계를 교육학적 이론에 근거하여 설명하고, 루브릭 평가가 학생의 '
-                                                       '자기주도적 학습 동기에 미치는 영향을 분석하여 교실 내 평가 혁신의 방향성을 제시함. 교과 수업 중 학습자의 인지 발달 단계에 따른 교수법의 차이에 '
-                                                       '깊은 관심을 보이며, 피아제의 인지 발달 이론과 비고츠키의 사회적 구성주의를 비교 분석함. 근접발달영역(ZPD) 개념을 현대의 에듀테크 기반 맞춤형 '
-                                                       '학습 환경에 적용하여, 인공지능 튜터가 어떻게 학습자의 비계 설정을 지원할 수 있는지에 대한 독창적인 모델을 제안함. 학술적 개념을 단순히 나열하는 '
-                                                       '데 그치지 않고, 실제 교육 현장의 사례와 연결하여 자신만의 교육 철학을 정립하려는 태도가 매우 돋보임.'},
-                                                {'학년': '3',
-                                                 '영역': '사회문제탐구',
-                                                 '내용': "교육 불평등의 구조적 원인을 탐구하기 위해 '디지털 격차가 교육 기회의 불평등에 미치는 영향'을 주제로 프로젝트를 수행함. 머신러닝 데이터 분석 "
-                                                       '도구를 활용하여 지역별 교육 인프라 분포와 학업 성취도 간의 상관관계를 시각화하고, 이를 통해 단순한 기기 보급을 넘어선 디지털 리터러시 교육의 '
-                                                       "중요성을 통계적으로 입증함. 교육 정책의 사각지대에 놓인 소외 계층의 학습권 보장을 위해 '공공 교육 플랫폼의 접근성 개선 방안'을 제안하며, "
-                                                       '정책의 실효성을 높이기 위한 구체적인 실행 전략을 수립함. 프로젝트 수행 과정에서 파이썬을 활용해 교육 관련 공공 데이터를 크롤링하고, 데이터 정제 '
-                                                       '및 분석 과정을 거쳐 시각화하는 등 뛰어난 정보 활용 능력을 보여줌. 특히 분석 결과에 대한 각주를 통해 정책적 함의를 꼼꼼히 서술하여 교육학적 '
-                                                       '통찰력을 드러냈으며, 데이터 기반의 의사결정이 교육 정책 수립에 얼마나 중요한지 역설하는 수준 높은 산출물을 제출함.'},
-                                                {'학년': '2',
-                                                 '영역': '탐구의 지속성과 일관성',
-                                                 '내용': "교육 정책 & 통계학: 1학년 때부터 지속해 온 교육 불평등 해소에 대한 관심을 2학년 사회문화 교과와 연계하여 '교육 격차의 세대 간 대물림 "
-                                                       "현상'에 대한 심층 탐구로 발전시킨 점이 매우 탁월함. 사회 계층화 이론, 교육의 사회적 기능, 통계적 상관분석 등의 학문적 개념을 실제 교육 정책 "
-                                                       '비판에 적용하며, 인문학적 소양과 데이터 분석 역량을 결합한 자신만의 독보적인 탐구 서사를 구축함. 교육학을 향한 일관된 열정과 학문적 깊이를 '
-                                                       '입증하며, 미래 교육 전문가로서의 성장 가능성을 충분히 보여줌.'},
-                                                {'학년': '2',
-                                                 '영역': '인문학적 소양과 사회적 통찰',
-                                                 '내용': '교육 정책 탐구 및 교육 철학: 교육 불평등, 다문화 가정의 학습권, 공교육의 디지털 전환 등 현실적인 교육계 이슈를 갈등론과 롤스의 '
-                                                       "정의론(공정으로서의 정의)을 통해 심층 분석함. 특히 '교육 정의'를 국가의 책무와 학습자의 자율성 문제로 확장하며, 교육학적 관점에서 미래 교육의 "
-                                                       '방향성을 제시하는 본인만의 교육 철학을 구체화함.'},
-                                                {'학년': '2',
-                                                 '영역': '교과 간 융합 및 도구 활용',
-                                                 '내용': '교육 통계 및 정보과학: 교육 데이터 분석을 위해 통계적 지식(상관분석 및 회귀분석)을 정보과학(파이썬 판다스)으로 구현하고, 이를 학업 성취도와 '
-                                                       '가정 환경 변인 간의 상관관계 분석이라는 교육학적 실무에 연결함. 또한 교육용 오픈 소스 플랫폼을 활용한 맞춤형 학습 경로 설계 프로그래밍은 '
-                                                       '교육공학적 전공 적합성을 보여주는 최상위 수준의 활동임.'},
-                                                {'학년': '2',
-                                                 '영역': '학술적 전문성 (Hard Core)',
-                                                 '내용': '교육학 및 교육심리학: 비고츠키의 사회적 구성주의와 피아제의 인지 발달 이론 등 현대 교육 심리학의 핵심 기전을 학습자 발달 단계 수준에서 '
-                                                       '설명하고, 교육과정 평가 이론을 통해 교수-학습 모델을 교육학적으로 해석함. 이러한 교육학적 전문 용어의 정확한 사용과 이론적 근거 제시는 '
-                                                       '입학사정관에게 학업적 신뢰와 전공에 대한 깊은 이해도를 보여줌.'},
-                                                {'학년': '2',
-                                                 '영역': '보완점 제언',
-                                                 '내용': '독서 및 교육 정책 탐구 과정에서 다양한 교육학적 담론을 병렬적으로 나열하기보다는, 각 이론이 현대 교육 현장의 문제 해결에 어떻게 기여하는지 '
-                                                       "인과관계를 중심으로 서술 구조를 재편할 필요가 있음. 특히 교육 불평등 해소를 위한 정책 제안 탐구에서 마지막으로 다룬 '디지털 리터러시 격차' "
-                                                       "이슈는 앞서 분석한 '고교학점제와 교육 인프라 불균형'이라는 거시적 담론과 긴밀하게 연결하여 논거를 강화해야 함. 단순한 현상 나열을 지양하고, "
-                                                       '교육학적 관점에서 각 정책의 실효성을 비판적으로 검토하는 논리적 일관성을 확보하는 것이 향후 심화 탐구의 핵심 전략이 될 것임.'}],
-                                 'comments': [{'구분': '기타 합격 대학', '내용': '연세대 교육학부, 고려대 교육학과, 서강대 사회과학부'},
-                                              {'구분': '고등학교', '내용': '자사고 내신 1.1 ~ 1.3'},
-                                              {'구분': '총평',
-                                               '내용': '자사고의 치열한 내신 경쟁 속에서도 1점대 초반의 최상위 성적을 유지한 점이 매우 인상적이다. 단순히 성적에 그치지 않고, 교육 불평등과 미래 교육 '
-                                                     '정책이라는 일관된 주제를 사회학적 관점에서 분석하여 자신만의 교육 철학을 정립한 과정이 생기부 전반에 걸쳐 논리적으로 서술되어 있다. 서울대학교 '
-                                                     '교육학과 합격생으로서 교육 정책에 대한 비판적 시각과 대안 제시 능력이 탁월하다.'},
-                                              {'구분': '교육 불평등 관련',
-                                               '내용': "교육 불평등의 구조적 원인을 사회 계층화 이론과 연결하여 분석한 것은 교육학 지망생으로서 매우 효과적이고 훌륭한 접근이다. 다만 '교육 환경 개선' "
-                                                     '활동에서의 내용을 단순히 나열하기보다는, 실제 학급 자치회 활동에서 학생이 주도적으로 제안한 학습 시스템이 어떤 실질적 변화를 이끌어냈는지 구체적인 '
-                                                     '사례와 성과 중심으로 서술하는 것이 훨씬 설득력이 높다.'},
-                                              {'구분': '고교학점제 및 교육과정 토론',
-                                               '내용': '1. 교육학을 지망하는 학생들 중 이따금씩 특정 교육 정책의 장점만을 부각하며 반대 측의 논리를 지나치게 폄하하는 경우가 있는데, 교육학을 염두에 두는 '
-                                                     '학생이라면 그러한 서술은 반드시 피해야 한다. 최근 교육 현장에서 정책의 상호보완성과 현장 적합성이 강조되는 추세이기도 하지만, 무엇보다 다양한 교육 '
-                                                     '주체들과의 소통을 중시하는 학풍상 이와 같은 편향된 주장은 주의해야 한다. 2. 심층 면접이 최종 당락에 지대한 영향을 미치기 때문에 이런 주제로 '
-                                                     '저학년 때부터 지속적인 토론 기회를 가지는 것은 무척 긍정적이다. 다만 학생의 주장은 전략적으로 교육학적 인재상 내에 위치해야 하므로, 급진적인 '
-                                                     '비판보다는 대안적 정책 모델을 함께 제시하는 전략이 필요하다.'},
-                                              {'구분': '에듀테크 및 알고리즘 관련',
-                                               '내용': '인공지능 기반 맞춤형 학습 시스템과 학습 데이터 분석에 대한 소재로 참여했던 활동에 대해 잘 기술하고 있다. 다만 에듀테크의 교육적 효용성을 넘어, '
-                                                     '알고리즘이 발생시킬 수 있는 학습 소외나 데이터 편향성에 대한 전문적인 지식이 다소 부족하여 심도 있는 비판적 탐구까지 나아가지 못한 점은 아쉽다.'},
-                                              {'구분': '디지털 리터러시 연구',
-                                               '내용': "'동기-구체적인 탐구-자기 해석'으로 이어지는 훌륭한 서술이다. 다만 WADA 중 'A(Agenda)'를 짚어줄 경우 읽는 사람의 입장에서 해당 활동에 "
-                                                     '좀 더 집중할 수 있다. 이렇게 좋은 주제로 내용을 전개한다면 주제를 명시적으로 언급하는 것을 추천한다. 가령 "디지털 교육 격차 해소를 위한 학교급별 '
-                                                     '리터러시 교육과정 모델 제안"과 같은 주제로 정리해볼 수 있다.'},
-                                              {'구분': '교육 철학 및 학습 이론 토론',
-                                               '내용': '비격식적인 표현으로 이루어진 칭찬은 생기부 전체의 인상을 바꿀 정도로 긍정적인 영향을 준다. 따라서 평소 수업 시간에 교사와의 질의응답을 통해 교육학적 '
-                                                     '담론을 심화하는 것은 수시가 좋은 방향으로 귀결되기 위한 선결조건이라 할 수 있다.'},
-                                              {'구분': '교육 사상 관련',
-                                               '내용': '루소의 자연주의 교육 사상이나 현대 교육 심리학을 연계한 독서 활동은 교육학 분야에 훌륭한 소재이다. 다만 사상가의 이론을 요약하는 추상적인 '
-                                                     "표현보다는, '현대 공교육 현장에서 루소의 자율성 개념을 어떻게 구현할 것인가'와 같은 구체적인 윤리적 문제에 초점을 맞춰 성찰을 기술하는 것이 "
-                                                     '좋다.'},
-                                              {'구분': '인재상 및 페르소나',
-                                               '내용': "'교육 불평등을 해결할 선한 영향력', '사회에 공감하는 교육 지성인' 등 대학마다 내거는 인재상이 있지만, 결국 수시는 선발자의 주관이 개입되는 "
-                                                     "과정이다. 거창한 표현을 걷어내면 '학업 역량이 뛰어나면서도 교육 현장의 문제를 논리적으로 분석할 줄 아는 학생'이라는 명확한 페르소나가 도출된다. "
-                                                     '학업 능력에만 초점을 두어 교육학적 통찰력을 놓치는 우를 범하지 않길 바란다.'},
-                                              {'구분': '교육 정책 탐구활동',
-                                               '내용': '교육 격차의 발생 빈도에 대한 호기심에서 출발하여 고교학점제라는 정책적 옵션, 에듀테크의 활용, 팀원들과의 협업, 발표회에 이르기까지 일련의 연속성 '
-                                                     '있는 탐구활동을 기술한 점이 좋았다. 교육학 분야의 탐구활동을 기술함에 있어서 전문성 있는 내용을 작성하는 것도 중요하지만, 이렇게 탐구 과정이 연속성 '
-                                                     '및 관련성을 가지고 이어지는 것도 중요한 부분이다. 물론 그 연결 과정이 교육학적으로 논리성을 갖고 있어야 한다.'},
-                                              {'구분': '학습 데이터 분석 실험 설계',
-                                               '내용': "'학습 데이터 분석과 개별화 교육'에 대한 부분에 흥미를 느껴 시작한 탐구활동이 실제로 설계하고 수행한 실험 내용을 보면 특정 교과 성취도 분석으로 "
-                                                     '바뀌었다. 이처럼 교육학 분야의 탐구활동을 기술할 때 흔히 하는 실수가 활동 사이의 연결과정에서 논리성을 갖지 못하는 경우이다. 데이터 분석 방법론과 '
-                                                     '실제 교육 현장의 개별화 교육 적용은 엄연히 다르며, 서로 독립적으로 다루고 있는 내용이므로 유의해야 한다.'},
-                                              {'구분': '수학 심화탐구의 위계',
-                                               '내용': "수학 심화탐구에는 두 가지 위계가 존재한다. 첫째 위계는 학습내용을 실생활에 '대응'시키는 것으로, 통계 자료를 활용한 교육 격차 분석이 예시이다. 두 "
-                                                     "번째 위계는 학습내용 '비틂' 혹은 연장인데, 가령 함수를 학습한 이후 '확률과 통계'의 고급 과정과 연계하여 교육 성취도 분포를 설명하는 것이 "
-                                                     '가능하다. 첫 번째 위계만으로 수학 세특이 채워진 학생이 있는데, 두 위계가 골고루 내용을 장식해야 심화학습이 이루어진 생기부라는 인상을 줄 수 '
-                                                     '있다.'},
-                                              {'구분': '영어 세특의 전략적 우위',
-                                               '내용': '최상위권 학생일수록 세특 서두에 학생의 페르소나를 담은 문장으로 시작하는 경우가 많다. "교육 정책 분야에서 학년 내 가장 두각을 나타내는 학생임."과 '
-                                                     "같은 문장은 매우 눈에 띄는 긍정적인 표현이다. 특히 교육학 분야에서 중요하게 보는 부분이 '영어로 된 교육학 논문을 얼마나 잘 이해하고 관심을 갖고 "
-                                                     "있는가?'이므로, 이러한 영어 교과목 세부능력 특기사항 기술은 매우 좋은 예시이다."},
-                                              {'구분': '사회문화 및 통합사회 관련',
-                                               '내용': '사회 계층화 이론에 대한 지식을 논리적으로 기술하고 있다. 교육 기회의 불평등, 세대 간 계층 이동 등 중요한 키워드를 잘 집어서 서술하고 있지만, '
-                                                     '학생이 직접 관심을 가지고 어떤 방법을 이용해서 탐구활동을 했는지에 초점을 맞춰 기술하면 더 효과적이다.'},
-                                              {'구분': '철학 관련',
-                                               '내용': '철학은 교육학과 관련된 관심을 이끌어내기에 무척 훌륭한 소재를 제공한다. 하나는 위 경우와 같이 교육 철학적 사상을 접목하는 것이고, 다른 하나는 교육 '
-                                                     '현장의 윤리적 충돌 상황에서 철학적 내용을 근거로 판단을 내리는 것이다. 어느 하나가 다른 하나보다 빼어나게 적절한 것은 아니며, 두 요소 모두 생기부 '
-                                                     '전반에 걸쳐 어필되어야 한다.'},
-                                              {'구분': '논술 관련',
-                                               '내용': "'교육의 목적'이라는 책을 읽고 교육 평등의 가치에 대해 사회학적 관점에서 설명하였다는 아이디어는 훌륭하다. 다만 이후 탐구활동을 더 깊이 있는 "
-                                                     "내용으로 구성해야 한다. 가령 '교육학의 발전 과정 조사 및 교육의 본질이란 무엇인가'에 대해 친구들과 의견을 나누었다는 것은 추상적인 표현이고, 해당 "
-                                                     '분야에 대한 깊이 있는 탐구를 했다는 인상을 주지 못한다.'},
-                                              {'구분': '체육 관련',
-                                               '내용': "교육학을 전공하는 학생의 경우 체육 교과 세특에서 관련 진로를 언급할 시 '어색한 억지 연관'으로 보일 가능성이 있다. 그러나 체육은 기본적으로 신체 "
-                                                     "발달과 협동심을 기르는 과목이므로, '스포츠 교육학'이나 '학교 체육의 교육적 가치'와 연계한다면 진로적합성을 드러내도 좋다. 음악, 미술 교과에도 "
-                                                     '동일하게 적용되는 이야기다.'},
-                                              {'구분': '언어와 매체 관련',
-                                               '내용': '교육학에 본격적으로 관심을 갖기 시작한 2학년부터 세부능력 특기사항에 인문학적, 사회적인 관점에서 교육 분야에 대한 깊이 있는 관심도를 드러낼 수 '
-                                                     '있다. 단, 억지로 기술하는 것보단 이처럼 매체의 특성에 대한 해당 교과목의 탐구를 기술한 뒤, 교육 매체의 순기능과 역기능에 대해서도 이어서 관심을 '
-                                                     '가지고 탐구해보았다는 자연스럽고 인과성이 충분하게 기술하는 것이 중요하다.'},
-                                              {'구분': '수학 1 관련',
-                                               '내용': '수학 세부능력 특기사항에서도 이런 방식으로 관심 분야인 교육 분야와 연결된 기술을 이어갈 수 있다. 다만 교육 통계를 등비수열의 합이라는 방식으로 '
-                                                     '계산한 것은 다소 간단한 주제이므로, 조금 더 확장해서 교육 정책의 효과 분석이나 성취도 변화 모델 등 보다 심화된 주제를 선정하고 기술해야 한다.'},
-                                              {'구분': '한국사 관련',
-                                               '내용': '한국사 세부능력 특기사항에도 교육학에 대한 관심이 드러나도록 기술하는 것이 가능하다. 각각의 내용이 모두 교육 역사에 있어서 중요한 내용이지만, 여러 '
-                                                     '가지 주제를 단순 나열하는 방식보다 한 가지 관심 있었던 주제를 정한 후 해당 주제에 대한 주도적인 탐구과정을 담으면 좋다.'},
-                                              {'구분': '사회문화 및 교육학 관련',
-                                               '내용': '교육 불평등에 대한 소재로 사회학적 구조와 교육적 반응에 대한 탐구활동을 기술한 점이 좋았다. 실제 교육학 필드에서 중요한 분야이고, 탐구내용 또한 '
-                                                     "전문성을 담고 있다. 다만 '-을 알게 됨'과 같은 단순 지식을 열거하는 식의 기술은 학생 주도적 탐구활동을 실제로 수행했다는 인상을 남기지 못하므로 "
-                                                     '주의해야 한다. 학생이 실제로 탐구하고 고민하면서 전문성을 갖춘 지식들이 쌓여가는 일련의 스토리가 담겨 있어야 한다.'},
-                                              {'구분': '종합 의견',
-                                               '내용': "이 학생의 2학년 세특은 **'교육학적 전문성'**과 **'사회학적 소양'**이 균형을 이루고 있습니다. 특히 **교육 불평등의 구조적 분석**이나 "
-                                                     '**에듀테크의 교육적 적용**은 교육학과 교수들이 선호하는 심화 주제입니다.'}]},
- 'case_1_humanities_korean_lit': {'personal_info': {'대상': '[Case 1] 서울대학교 국어국문학과 합격생',
-                                                    '고등학교_유형': '자사고',
-                                                    '내신_성적': '1.1 ~ 1.3',
-                                                    '주요_특징': '자사고의 치열한 내신 경쟁 속에서도 1점대 초반의 최상위 성적을 유지함. 1학년 때부터 한국 문학의 현대적 변용과 언어학적 구조 분석을 '
-                                                             '중심으로 일관된 학술적 탐구 서사를 구축함.',
-                                                    '총평': '자사고의 엄격한 평가 기준 하에서도 1점대 초반의 탁월한 내신 성적을 확보하며 학업 역량을 증명했다. 단순히 교과 성적에 그치지 않고, 고전 '
-                                                          '텍스트의 현대적 재해석과 사회 언어학적 현상에 대한 깊이 있는 탐구를 통해 국어국문학에 대한 진정성 있는 열정을 생기부 전반에 녹여냈다. '
-                                                          '학술적 깊이와 인문학적 소양을 고루 갖춘 인재로, 서울대 국어국문학과 합격생 중에서도 독보적인 탐구 서사를 구축한 사례로 평가된다.',
-                                                    '기타_합격_대학': '연세대 국어국문학과, 고려대 국어국문학과, 서강대 국어국문학과'},
-                                  'activities': [{'학년': '1',
-                                                  '영역': '자율활동',
-                                                  '내용': '학급 자치회에서 문학 소통 부장을 맡아 매주 아침 조회 시간마다 한국 현대 시의 한 구절을 낭독하고 그 의미를 짧게 해설하여 급우들의 인문학적 '
-                                                        '감수성을 고취함. 장애이해교육 과정에서 언어의 사회적 구성성에 주목하여, 장애를 지칭하는 용어의 변천사가 사회적 인식 변화를 어떻게 반영하는지 '
-                                                        "분석함. 특히 '장애인'이라는 명칭이 가진 언어적 함의와 정책적 담론의 상관관계를 탐구하며, 언어가 단순한 소통 도구를 넘어 사회적 가치를 "
-                                                        "형성하는 기제임을 역설함. 교내 인문학 축제에서는 '언어의 다원성과 표준어 정책'을 주제로 발표하며, 방언의 보존과 표준어의 효율성 사이의 갈등을 "
-                                                        '국어학적 관점에서 고찰함. 설문조사를 통해 또래 집단의 언어 습관과 신조어 사용 실태를 조사하고, 이를 통계적으로 분석하여 세대 간 소통 단절의 '
-                                                        '원인을 언어적 거리감에서 찾아내는 등 논리적인 분석력을 보여줌.'},
-                                                 {'학년': '1',
-                                                  '영역': '동아리활동',
-                                                  '내용': "독서 토론 동아리에서 '고전 문학의 현대적 변용은 정당한가?'라는 주제로 토론을 주도함. 원작의 서사 구조를 해체하고 현대적 맥락으로 재구성하는 "
-                                                        "과정에서 발생하는 저작권 문제와 예술적 창의성 사이의 쟁점을 심도 있게 다룸. '디지털 시대의 문해력 저하 현상'에 관한 토론에서는 사회자의 "
-                                                        '역할을 맡아, 텍스트의 파편화가 사고의 깊이에 미치는 영향을 비판적으로 평가함. 특히 텍스트를 읽는 행위가 단순한 정보 습득을 넘어 타자의 삶을 '
-                                                        '이해하는 공감의 과정임을 강조하며, 문해력 교육의 방향성을 인문학적 소양 함양으로 제안함. 다양한 문학 작품을 읽고 비평문을 작성하는 활동에서, '
-                                                        '작가의 문체와 시대적 배경을 유기적으로 연결하여 텍스트를 해석하는 탁월한 분석력을 보임. 동아리 내에서 주도적으로 독서 목록을 선정하고 토론의 '
-                                                        '논점을 구조화하는 등 국어국문학도로서의 학술적 태도를 견지함.'},
-                                                 {'학년': '1',
-                                                  '영역': '진로활동',
-                                                  '내용': "국어국문학과 진학을 목표로 '한국어의 통사적 구조와 의미 변화'에 관한 심화 탐구를 진행함. 국립국어원 자료를 활용하여 시대별 국어의 문법적 "
-                                                        '특징을 비교하고, 특히 근대 국어에서 현대 국어로 넘어오는 과정에서의 어휘 변화 양상을 분석함. 진로 탐색의 날에는 언어학자 초청 강연에 참여하여 '
-                                                        '인공지능 시대의 자연어 처리(NLP) 기술과 언어학의 접점을 탐구함. 기계가 인간의 언어를 이해하는 원리를 학습하며, 한국어의 중의성과 문맥 '
-                                                        "의존성이 인공지능 언어 모델 발전에 미치는 영향을 고찰함. 또한, '개별 맞춤형 독서 교육'이라는 주제로 교내 탐구 발표회에 참여하여, 학생들의 "
-                                                        '독서 수준과 관심사를 데이터화하여 도서를 추천하는 알고리즘의 인문학적 설계 방안을 제시함. 문학 텍스트의 데이터베이스화와 이를 활용한 인문학적 '
-                                                        '가치 창출 가능성을 탐색하며, 국어국문학이 미래 사회에서 어떻게 응용될 수 있을지에 대한 자신만의 비전을 확립함.'},
-                                                 {'학년': '2',
-                                                  '영역': '자율활동',
-                                                  '내용': "디지털 소외 계층인 노년층의 언어적 고립 문제를 해결하기 위해 '세대 간 소통을 위한 디지털 문해력 교육' 프로젝트를 기획함. 키오스크의 복잡한 "
-                                                        '인터페이스가 노년층의 언어적 접근성을 어떻게 저해하는지 분석하기 위해, 고령자가 일상에서 마주하는 비문학적 텍스트와 전문 용어의 사용 실태를 '
-                                                        "조사함. 언어학적 관점에서 정보 전달의 효율성을 높이기 위한 '쉬운 우리말 쓰기'의 필요성을 역설하며, 키오스크 화면의 텍스트를 고령자 친화적인 "
-                                                        '어휘로 재구성하는 가이드라인을 제안함. 또한, 고령자의 인지적 특성을 고려한 문장 구조의 단순화와 가독성 향상을 위한 서체 및 배치 전략을 '
-                                                        '탐구함. 팀 연구 과정에서 언어의 사회적 기능과 정보 격차에 따른 소외 현상을 비판적으로 성찰하였으며, 기술적 해결책보다 중요한 것은 사용자와 '
-                                                        '소통하는 언어의 보편성임을 깨달음. 이를 통해 국어국문학이 현대 사회의 정보 불평등을 해소하는 데 기여할 수 있는 실천적 학문임을 확인하고, 언어 '
-                                                        '정책과 사회적 소통 구조에 대한 깊은 관심을 드러냄.'},
-                                                 {'학년': '2',
-                                                  '영역': '동아리활동',
-                                                  '내용': "사회적 담론을 형성하는 텍스트의 힘을 탐구하기 위해 '현대 사회 이슈와 언어적 대응'을 주제로 한 토론 동아리를 주도함. '디지털 미디어 "
-                                                        "환경에서의 혐오 표현 규제'라는 주제로 토론을 진행하며, 표현의 자유와 언어적 윤리 사이의 쟁점을 법철학적 관점에서 분석함. 특히 혐오 표현이 "
-                                                        '사회적 소수자에게 미치는 언어적 폭력성을 언어학적 데이터로 증명하고, 이를 방지하기 위한 사회적 합의와 언어 규범의 재정립 필요성을 논리적으로 '
-                                                        "설득함. 또한 '문학 작품 속 인물의 범죄 행위에 대한 서사적 정당성 부여'라는 주제로 토론을 이끌며, 문학이 인간의 도덕적 판단에 미치는 "
-                                                        '영향력을 고찰함. 응보형론과 목적형론의 관점을 문학적 서사 구조에 대입하여, 작가가 독자에게 전달하고자 하는 윤리적 메시지를 비판적으로 해석함. '
-                                                        '토론 과정에서 상대방의 논리를 경청하고 자신의 주장을 국어학적 근거를 바탕으로 정교화하는 능력이 탁월하며, 인문학적 소양을 바탕으로 사회 현상을 '
-                                                        '다각도로 해석하는 비판적 사고력이 매우 돋보임.'},
-                                                 {'학년': '2',
-                                                  '영역': '진로활동',
-                                                  '내용': "국어국문학과 진학을 목표로 '언어와 기술의 융합' 및 '문학적 서사의 사회적 기능'을 주제로 심화 탐구를 수행함. '인공지능 시대의 창작과 "
-                                                        "저작권' 강연을 통해 생성형 AI가 생산한 텍스트의 문학적 가치와 저작권의 법적 정의를 탐구하며, 인간 고유의 언어적 창의성이 무엇인지 철학적으로 "
-                                                        "고찰함. 또한 '디지털 인문학의 미래'라는 주제로, 고전 문학 텍스트를 데이터화하여 분석하는 디지털 인문학의 방법론을 학습하고, 이를 통해 한국 "
-                                                        "문학의 보편적 가치를 재발견하는 방안을 모색함. '언어의 사회적 구성성과 정책' 탐구 활동에서는 국어 정책이 국민의 사고방식에 미치는 영향을 "
-                                                        '분석하고, 언어 순화 운동이 단순한 어휘 교체를 넘어 문화적 정체성 형성에 기여함을 논증함. 특히 법의학적 서사를 다룬 문학 작품들을 분석하며, '
-                                                        "죽음에 대한 인간의 언어적 태도와 시대별 사생관의 변화를 추적함. '나는 매주 시체를 보러 간다'와 같은 텍스트를 읽고, 죽음을 대하는 인간의 "
-                                                        '언어적 표현이 어떻게 사회적 위로와 성찰로 이어지는지 분석한 보고서는 국어국문학적 통찰과 인문학적 사유가 결합된 우수한 탐구 사례로 평가받음.'},
-                                                 {'학년': '1',
-                                                  '영역': '국어',
-                                                  '내용': '문학 작품의 언어적 구조와 서사적 장치를 분석하는 데 탁월한 통찰력을 보임. 현대 시의 은유와 상징을 학습한 후, 이를 단순히 해석하는 데 그치지 '
-                                                        '않고 언어학적 관점에서 시적 허용이 독자의 인지 과정에 미치는 영향을 탐구함. 특히 한국 현대 문학의 초기 형성 과정에서 외래어의 유입이 문체에 '
-                                                        '미친 영향을 분석하며, 국어의 통사적 변화가 문학적 표현의 폭을 어떻게 확장했는지 논리적으로 기술함. 고전 소설의 인물 유형을 현대 사회의 '
-                                                        "인간상과 비교하는 활동에서는, 고전 속 갈등 구조가 현대 서사에서도 반복되는 이유를 사회적 담론의 관점에서 분석함. 수업 시간 중 '언어의 사회적 "
-                                                        "약속'에 대한 토론에서, 시대에 따라 변화하는 어휘의 의미가 공동체의 가치관을 어떻게 반영하는지 구체적인 사례를 들어 발표하여 급우들의 높은 "
-                                                        '호응을 얻음. 문학적 텍스트를 분석하는 과정에서 나타나는 비판적 사고력과 이를 인문학적 맥락으로 확장하는 융합적 탐구 역량이 매우 뛰어남.'},
-                                                 {'학년': '2',
-                                                  '영역': '언어와 매체',
-                                                  '내용': '국어의 음운 체계와 문법적 구조가 언어 생활에 미치는 영향에 깊은 관심을 두고 심화 탐구를 수행함. 중세 국어의 표기법이 현대 국어의 맞춤법으로 '
-                                                        '정착되는 과정을 추적하며, 언어 규범이 사회적 합의를 통해 어떻게 표준화되는지 분석함. 특히 디지털 매체 환경에서 나타나는 신조어와 통신 언어의 '
-                                                        '확산이 언어의 경제성 원리와 어떻게 충돌하고 타협하는지 탐구 주제로 설정함. 이를 위해 언어의 사회적 변용 사례를 수집하고, 언어 규범의 경직성과 '
-                                                        '언어 창의성 사이의 균형점을 찾기 위한 논리적 근거를 제시함. 또한, 인공지능이 생성한 텍스트의 문법적 정확성과 인간의 언어적 직관을 비교하는 '
-                                                        '과제에서, 언어의 의미론적 맥락을 파악하는 인간의 고유한 인지 능력을 강조함. 언어 현상을 단순한 규칙의 나열이 아닌, 사회적 소통의 도구이자 '
-                                                        '문화적 산물로 이해하는 학술적 태도가 돋보이며, 국어국문학적 탐구의 기초가 되는 언어학적 분석 역량을 충분히 갖춤.'},
-                                                 {'학년': '2',
-                                                  '영역': '독서',
-                                                  '내용': '인문학적 텍스트를 읽고 그 속에 담긴 철학적 담론과 사회적 맥락을 비판적으로 재구성하는 능력이 탁월함. 한국 근대 문학의 거장들이 남긴 비평문을 '
-                                                        '읽고, 당시 지식인들이 언어와 민족 정체성을 어떻게 연결했는지 분석하는 보고서를 작성함. 특히 식민지 시대의 언어 정책이 문학적 표현의 자유를 '
-                                                        "어떻게 억압했는지, 그리고 그 속에서 작가들이 선택한 은유적 저항 방식이 무엇인지 심도 있게 고찰함. '텍스트의 해석은 독자의 몫인가, 저자의 "
-                                                        "의도인가'라는 주제로 진행된 토론에서, 수용 미학의 관점을 도입하여 시대적 상황에 따라 변하는 텍스트의 의미 가치를 논리적으로 옹호함. 또한, "
-                                                        '고전 문학의 현대적 변용 사례를 조사하며 원작의 서사 구조를 현대적 감각으로 재해석하는 과정에서 발생하는 윤리적 쟁점을 다룸. 인문학적 소양을 '
-                                                        '바탕으로 텍스트를 다각도에서 분석하고, 이를 자신의 진로인 국어국문학적 관점에서 체계적으로 정리하는 학문적 성실함과 깊이가 매우 인상적임.'},
-                                                 {'학년': '2',
-                                                  '영역': '체육',
-                                                  '내용': '신체 활동을 통해 인문학적 사유의 기초가 되는 강인한 체력과 협동심을 기르는 데 주력함. 농구와 배드민턴 수행평가 과정에서 단순히 기술을 익히는 '
-                                                        '것을 넘어, 팀원 간의 의사소통 구조를 분석하고 전략적 포지셔닝을 제안하는 등 언어적 소통 능력을 체육 활동에 접목함. 태권도 품새 학습 시에는 '
-                                                        '동작의 연결성을 문장의 논리적 구조와 비교하며 신체 언어의 미학을 탐구하였고, 기술적 성장을 기록하는 과정에서 신체 움직임의 변화를 서사적으로 '
-                                                        '기술하는 등 국어국문학적 관찰력을 발휘함.'},
-                                                 {'학년': '2',
-                                                  '영역': '언어와 매체',
-                                                  '내용': "매체 언어의 사회적 영향력과 정보 생산의 윤리적 책임에 깊은 관심을 보임. '디지털 시대의 정보 비대칭과 언어적 권력'을 주제로 한 기사문 분석 "
-                                                        '활동에서, 특정 매체가 사용하는 어휘가 독자의 인식에 미치는 프레이밍 효과를 비판적으로 고찰함. 특히 사회적 갈등 상황에서 언론이 사용하는 은유와 '
-                                                        '환유를 분석하여, 갈등을 완화하는 언어적 대안을 제시하는 기사문을 작성함. 또한, 영상 플랫폼의 알고리즘이 정보의 편향성을 어떻게 강화하는지 '
-                                                        '탐구하며, 정보 제공자의 언어적 특성과 정보의 질적 상관관계를 분석함. 국어국문학적 소양을 바탕으로 매체 환경에서의 올바른 언어 사용과 정보 '
-                                                        '비판적 수용을 위한 가이드라인을 제안하는 등 언어 매체 전문가로서의 자질을 드러냄.'},
-                                                 {'학년': '2',
-                                                  '영역': '수학 1',
-                                                  '내용': '수학적 논리 구조를 언어적 서사 체계와 연결하여 사고하는 능력이 탁월함. 수열의 규칙성을 함수적 관점에서 해석하며, 문학 작품 속 서사의 반복과 '
-                                                        '변주 구조를 수열의 일반항으로 도식화하는 독창적인 탐구를 수행함. 약물 잔류량 계산 문제를 통해 등비수열의 합을 실생활에 적용하는 과정을 논리적인 '
-                                                        '보고서로 정리하였으며, 이를 친구들에게 설명할 때 복잡한 수식을 일상적인 언어로 치환하여 전달하는 뛰어난 소통 능력을 보임. 특히 삼각함수의 '
-                                                        '주기성을 학습한 후, 이를 언어의 운율과 리듬 체계에 대입하여 푸리에 변환의 원리를 문학적 텍스트의 구조 분석에 응용하려는 시도를 함. 수학적 '
-                                                        '도구를 활용해 인문학적 현상을 정량적으로 분석하려는 태도는 국어국문학 연구자로서의 학문적 융합 역량을 잘 보여줌.'},
-                                                 {'학년': '2',
-                                                  '영역': '언어와 매체',
-                                                  '내용': '수업 시간에 국어의 음운 변동 규칙과 문법적 구조가 언어 생활의 효율성에 미치는 영향에 흥미를 느껴, 현대 국어의 통사적 특징을 심층 분석하는 '
-                                                        '탐구 활동을 수행함. 특히 문장 성분의 호응 관계와 중의적 표현이 정보 전달의 명확성에 미치는 영향을 탐구하며, 국어 규범이 사회적 합의를 통해 '
-                                                        '표준화되는 과정을 논리적으로 증명함. 또한, 디지털 매체 환경에서 나타나는 신조어와 통신 언어의 문법적 일탈 현상을 언어학적 관점에서 분석하고, '
-                                                        '이러한 언어 변화가 세대 간 소통에 미치는 긍정적·부정적 측면을 고찰함. 교사가 제시한 심화 과제 해결 과정에서 국립국어원의 표준국어대사전 자료를 '
-                                                        '활용하여 어휘의 의미 변화 양상을 추적하고, 친구들에게 문법적 오류를 수정하는 논리적 근거를 제시하는 등 수업에 적극적으로 참여함. 형성평가에서 '
-                                                        '최상위권 성적을 거둘 정도로 국어 문법 체계에 대한 이해도가 매우 높으며, 언어 현상을 구조적으로 파악하는 능력이 탁월함.'},
-                                                 {'학년': '2',
-                                                  '영역': '독서',
-                                                  '내용': "인문학적 소양을 갖춘 국어국문학도 지망생으로서, 한국 근대 문학이 시대적 격변기에 사회적 담론을 형성하는 방식에 주목하여 '근대 계몽기 문학의 "
-                                                        "서사적 기능과 사회적 영향'을 주제로 탐구를 진행함. 세계 문학사 속에서 문학이 사회 변화를 이끌어낸 사례를 비교하고자 다양한 비평집과 역사 "
-                                                        '자료를 수집함. 특히 20세기 초 한국 문학이 식민지 현실을 극복하기 위해 사용한 은유와 상징의 기법을 분석하고, 당시 지식인들이 문학을 통해 '
-                                                        '민족 의식을 고취하려 했던 전략을 밝힘. 또한, 서구의 근대 문학이 시민 사회의 형성에 기여한 방식과 한국의 근대 문학이 지닌 독자적인 서사 '
-                                                        '구조를 연결 지어 설명함. 단순히 문학 작품을 감상하는 것을 넘어, 역사적 맥락 속에서 텍스트가 지닌 사회적 함의를 도출해내는 비판적 읽기 능력이 '
-                                                        '돋보임. 한국의 근대적 자아 형성과 문학적 표현의 상관관계를 다각도로 분석하며, 역사적 상상력을 바탕으로 당대 작가들의 고뇌를 현대적 관점에서 '
-                                                        '재해석하는 능력이 매우 인상적임.'},
-                                                 {'학년': '2',
-                                                  '영역': '문학',
-                                                  '내용': '문학 작품의 서사적 장치와 언어적 미학을 분석하는 데 탁월한 통찰력을 보이며, 현대 시와 소설을 학습한 후 관련 비평문을 작성하여 자신의 문학적 '
-                                                        "견해를 정립함. '문학적 형상화는 단순한 모방인가, 새로운 세계의 창조인가'라는 질문을 던지고, 문학적 허구와 현실의 관계를 철학적으로 고찰함. "
-                                                        '이미 존재하는 현실을 언어라는 도구로 재구성하여 새로운 의미를 부여하는 문학적 행위가 인간의 인식 지평을 어떻게 확장하는지 논리적으로 정리하여 '
-                                                        '발표함. 최근 디지털 미디어 환경에서 문학적 서사가 웹소설이나 웹툰 등 새로운 매체로 변용되는 현상을 조사하고, 매체 변화에 따른 서사 구조의 '
-                                                        '변주를 탐구함. 특히 서사적 긴장감을 유지하기 위한 플롯의 구성 방식이 매체별로 어떻게 차별화되는지 분석하고, 향후 문학이 나아가야 할 방향을 '
-                                                        '제시함. 파동의 간섭과 중첩 개념을 문학의 상호텍스트성에 비유하여 설명하는 등 타 교과 지식을 인문학적 탐구에 창의적으로 접목하는 능력이 '
-                                                        '뛰어나며, 텍스트의 이면을 읽어내는 분석적 태도가 매우 우수함.'},
-                                                 {'학년': '2',
-                                                  '영역': '언어와 매체',
-                                                  '내용': '언어의 구조적 특성을 탐구하는 과정에서 문법 체계가 인간의 사고방식에 미치는 영향에 주목함. 특히 국어의 통사적 구조가 문학적 표현의 다의성을 '
-                                                        '어떻게 형성하는지 분석하기 위해, 현대 시의 문장 성분 생략과 도치법이 독자의 인지적 해석에 미치는 영향을 언어학적 관점에서 고찰함. 문법 요소인 '
-                                                        '높임법과 피동 표현이 사회적 관계와 화자의 태도를 어떻게 반영하는지 조사하며, 언어 규범이 단순히 규칙의 나열이 아니라 사회적 합의의 산물임을 '
-                                                        '논리적으로 서술함. 또한, 디지털 매체 환경에서 신조어와 줄임말이 언어의 경제성 원리에 따라 생성되는 과정을 분석하고, 이러한 언어 변화가 '
-                                                        '표준어의 위상에 미치는 영향에 대해 비판적 시각을 견지함. 언어 규범의 고착화와 변화 사이의 긴장 관계를 탐구하며, 국어의 정체성을 유지하면서도 '
-                                                        '변화하는 시대상을 반영할 수 있는 언어 정책의 방향성을 제안하는 보고서를 작성함.'},
-                                                 {'학년': '2',
-                                                  '영역': '문학',
-                                                  '내용': '문학 작품을 단순한 감상의 대상으로 보지 않고, 시대적 배경과 작가의 의도가 투영된 텍스트로 분석하는 탁월한 통찰력을 보임. 한국 현대 소설의 '
-                                                        '서사 구조를 분석하며, 인물의 내면 심리가 공간적 배경과 어떻게 상호작용하는지 탐구함. 특히 1930년대 모더니즘 문학의 언어적 실험이 당시 '
-                                                        '지식인들의 불안과 고뇌를 어떻게 형상화했는지 분석하여 발표함. 문학적 형상화의 기법인 상징과 비유가 독자의 정서적 반응을 이끌어내는 메커니즘을 '
-                                                        '심리학적 관점에서 해석하고, 이를 바탕으로 고전 문학의 서사적 원형이 현대 대중문화 콘텐츠에서 어떻게 변용되고 있는지 추적함. 문학 비평 활동에서 '
-                                                        '작품의 미학적 가치뿐만 아니라, 작품이 당대 사회의 모순을 어떻게 비판적으로 성찰하고 있는지에 주목하여 논리적인 비평문을 작성함. 동료들과의 '
-                                                        '토론에서 작품의 다층적 의미를 도출해내는 과정에 주도적으로 참여하며, 인문학적 소양을 바탕으로 타인의 해석을 수용하고 자신의 논리를 정교화하는 '
-                                                        '능력이 매우 뛰어남.'},
-                                                 {'학년': '2',
-                                                  '영역': '독서',
-                                                  '내용': '인문, 사회, 예술 등 다양한 분야의 텍스트를 비판적으로 읽고 핵심 논지를 파악하는 능력이 매우 우수함. 특히 언어 철학 관련 도서를 읽고, '
-                                                        '언어가 실재를 어떻게 구성하는지에 대한 비트겐슈타인의 사상을 국어국문학적 관점에서 재해석함. 텍스트 간의 상호텍스트성을 분석하는 과제에서, 고전 '
-                                                        '텍스트와 현대 텍스트를 비교하며 서사의 변주 양상을 체계적으로 정리함. 독서 과정에서 마주한 복잡한 논증 구조를 도식화하여 이해도를 높이고, '
-                                                        '저자의 주장에 대해 반론을 제기하거나 보완하는 방식의 독서 기록장을 꾸준히 작성함. 디지털 시대의 정보 과잉 현상이 문해력 저하로 이어지는 문제를 '
-                                                        "해결하기 위해, 텍스트의 맥락을 파악하는 '비판적 읽기 전략'을 주제로 소논문을 작성함. 독서 활동을 통해 얻은 지식을 자신의 진로인 국어국문학 "
-                                                        '연구와 연결하여, 한국어의 문학적 가치를 보존하고 발전시키기 위한 인문학적 토대를 마련하려는 노력이 돋보임.'},
-                                                 {'학년': '2',
-                                                  '영역': '독서',
-                                                  '내용': "인문학적 텍스트의 논리적 구조를 분석하는 데 탁월한 역량을 보임. '언어와 사고의 상관관계'를 주제로 한 심화 탐구에서 사피어-워프 가설을 "
-                                                        '비판적으로 검토하고, 한국어의 존대 체계가 화자의 사회적 인식에 미치는 영향을 언어철학적 관점에서 논증함. 특히 디지털 매체에서 나타나는 신조어의 '
-                                                        '생성 원리를 사회언어학적 맥락에서 분석하여, 언어의 변화가 단순한 파괴가 아닌 시대적 요구를 반영한 적응적 진화임을 설득력 있게 제시함. 고전 '
-                                                        '텍스트의 현대적 재해석 과정에서 원문의 문체적 특징을 보존하면서도 현대적 의미를 도출하는 비평적 글쓰기 능력이 돋보임.'},
-                                                 {'학년': '2',
-                                                  '영역': '언어와 매체',
-                                                  '내용': '국어의 음운 체계와 통사적 구조가 언어 생활에 미치는 영향에 깊은 관심을 두고 심화 탐구를 수행함. 중세 국어의 표기법이 현대 국어의 맞춤법으로 '
-                                                        '정착되는 과정을 추적하며, 언어 규범이 사회적 합의를 통해 어떻게 표준화되는지 분석함. 특히 디지털 환경에서의 텍스트 생산 방식이 문법적 정확성에 '
-                                                        '미치는 영향을 조사하기 위해 온라인 커뮤니티의 게시글을 표본으로 삼아 문장 성분의 생략과 도치 현상을 통계적으로 분석함. 언어 규범의 경직성과 '
-                                                        '유연성 사이의 균형을 모색하며, 국어의 정체성을 지키면서도 소통의 효율성을 높이는 방안을 제안하는 과학적 탐구 태도를 보임.'},
-                                                 {'학년': '2',
-                                                  '영역': '문학',
-                                                  '내용': '한국 현대 문학의 서사 구조와 인물의 심리 묘사를 분석하는 데 탁월한 통찰력을 발휘함. 1930년대 모더니즘 소설을 학습한 후, 당시 지식인들이 '
-                                                        '겪은 내면적 갈등과 언어적 소외를 당대 사회적 맥락과 연결하여 심층적으로 고찰함. 특히 작가의 문체적 특징이 서사의 주제 의식을 어떻게 강화하는지 '
-                                                        '분석하기 위해 텍스트 마이닝 기법을 활용하여 주요 어휘의 빈도와 맥락을 시각화함. 문학 작품을 단순한 감상의 대상으로 보지 않고, 시대의 정신을 '
-                                                        '담은 기록물로 해석하여 현대 사회의 문제점을 문학적 서사로 치유하려는 인문학적 소양과 비판적 사고력을 겸비함.'},
-                                                 {'학년': '2',
-                                                  '영역': '인문학적 언어 탐구 역량',
-                                                  '내용': '언어와 매체: 문학 텍스트의 언어적 구조 분석을 넘어, 현대 사회에서 정보가 유통되는 매체의 신뢰성과 언어적 윤리 문제를 심도 있게 탐구함. 특히 '
-                                                        '디지털 미디어 환경에서 발생하는 혐오 표현이 언어 공동체의 규범에 미치는 영향을 분석하며, 국어국문학도가 갖추어야 할 사회적 책무와 인본주의적 '
-                                                        '가치를 논리적으로 정립함. 교과 과정에서 학습한 문법 체계와 실제 언어 생활의 괴리를 비판적으로 성찰하며, 언어 규범의 사회적 합의 과정을 탐구한 '
-                                                        '점이 매우 탁월함.'},
-                                                 {'학년': '2',
-                                                  '영역': '텍스트 서사 구조 심화',
-                                                  '내용': '문학적 서사 분석: 고전 문학의 서사 구조를 현대적 맥락으로 재해석하는 과정에서, 단순히 원작의 내용을 변용하는 수준을 넘어 서사적 장치가 독자의 '
-                                                        '인지에 미치는 영향을 분석함. 특히 한국 현대 소설의 문체적 특징이 인물의 심리 묘사에 기여하는 바를 수사학적 관점에서 고찰함. 서사 이론의 '
-                                                        '기초를 넘어, 현대 문학 비평의 방법론을 적용하여 텍스트의 다층적 의미를 도출하려는 시도가 돋보이며, 문학적 상상력과 논리적 분석력을 결합한 '
-                                                        '학술적 탐구 역량이 매우 우수함.'},
-                                                 {'학년': '2',
-                                                  '영역': '국어학적 탐구',
-                                                  '내용': '수업 중 제시되는 문학적 쟁점에 대해 다양한 비평적 관점을 존중하면서 본인의 해석을 능동적으로 표현하여 토론의 깊이를 더함. 디지털 텍스트 분석 '
-                                                        '도구를 활용하여 근대 국어에서 현대 국어로 이행하는 과정의 어휘 빈도 변화를 시각화하고, 이를 통해 언어의 통시적 변화 양상을 실증적으로 증명함. '
-                                                        '특히 표준어 규정과 방언의 문학적 활용 사이의 긴장 관계를 학습하고, 지역 방언이 문학 작품 속에서 인물의 정체성을 형성하는 기제로 어떻게 '
-                                                        '작용하는지 기호학적으로 분석함. 교과서에 제시된 문법적 사실을 당연시하지 않고, 실제 문학 텍스트 속에서 해당 문법이 어떻게 변주되는지 직접 '
-                                                        "확인하여 문제를 해결하는 자세가 돋보임. 본인의 관심사인 '언어와 사회'를 접목하여, 디지털 시대의 신조어가 문학적 표현의 확장에 기여하는 바를 "
-                                                        '탐구함. 언어의 사회적 구성성을 바탕으로 신조어의 생성 원리와 그에 담긴 시대상을 정리하고, 이를 통해 언어와 사회의 상호작용에 대한 자신만의 '
-                                                        '학술적 견해를 유도하여 학습한 내용을 융합적으로 사고하는 과정을 보임.'},
-                                                 {'학년': '2',
-                                                  '영역': '심화 영어 I',
-                                                  '내용': '영어 구사력이 매우 탁월하며, 복잡한 인문학적 담론을 담은 지문을 읽고 핵심 논지를 파악하는 능력이 최상위권임. 언어의 사회적 기능에 대한 깊은 '
-                                                        "관심을 바탕으로, '언어적 상대성 이론'에 관한 지문을 발표하며 단순한 번역을 넘어 언어가 사고의 틀을 어떻게 규정하는지 논리적으로 설명함. 특히 "
-                                                        "언어와 문화적 정체성 사이의 상관관계를 분석하여 급우들의 큰 호응을 얻음. 글쓰기 활동에서는 뛰어난 어휘력과 비판적 사고력을 발휘함. '디지털 "
-                                                        "시대의 문해력 저하' 문제를 다룬 에세이에서, 이를 개인의 독서 습관 문제로 국한하지 않고 정보 소비 방식의 구조적 변화와 알고리즘에 의한 확증 "
-                                                        "편향이라는 사회적 맥락으로 접근함. 'The fragmentation of language leads to the erosion of "
-                                                        "critical thinking'이라는 명확한 주제문을 제시하며 논리적 설득력을 확보함. 또한, 한국 현대 문학의 번역 과정에서 발생하는 의미 "
-                                                        '손실과 문화적 전이 현상을 탐구하여, 번역이 단순한 언어 치환이 아닌 제2의 창작임을 강조하는 에세이를 작성함. 다양한 학술 자료를 체계적으로 '
-                                                        '정리하고 정확한 영어 표현을 구사하여 국어국문학적 탐구 역량을 증명함.'},
-                                                 {'학년': '2',
-                                                  '영역': '사회문제 탐구',
-                                                  '내용': "현대 사회의 언어적 소외 문제를 다룬 질적 사례 연구를 읽고, 이를 '디지털 격차와 언어적 불평등'이라는 주제로 확장하여 발표함. 정보 취약 "
-                                                        '계층이 디지털 환경에서 겪는 언어적 장벽과 그로 인한 사회적 고립 과정을 심층 면담 자료를 통해 분석하며 질적 연구 방법론의 타당성을 검토함. '
-                                                        "특히 공공 언어의 난해함이 특정 계층의 정보 접근권을 어떻게 제한하는지 갈등론의 관점에서 분석하고, '쉬운 우리말 쓰기' 정책의 실효성을 제고하기 "
-                                                        '위한 대안을 제시함. 코로나19 이후 비대면 소통이 일상화되면서 발생한 언어적 소외 문제를 지적하고, 공공 서비스 인터페이스의 언어적 접근성 '
-                                                        '개선을 위한 연구 계획서를 작성함. 문헌 연구법을 통해 공공 언어의 통시적 변화와 관련 제도를 참고하고, 현재 공공기관의 안내 문구가 특정 '
-                                                        '세대에게는 어떻게 배타적으로 작동하는지 분석하여 개선 방안을 도출함. 또한, 디지털 미디어 환경에서의 혐오 표현이 사회적 갈등을 심화시키는 양상을 '
-                                                        '설문조사와 자료 조사를 통해 정리하여 학급에서 발표함으로써 언어 윤리의 중요성을 역설함.'},
-                                                 {'학년': '2',
-                                                  '영역': '고전과 윤리',
-                                                  '내용': "정의론을 학습하며 '텍스트에 담긴 정의의 개념이 현대 사회의 언어 정책에 어떻게 적용될 수 있을까?'라는 근본적인 의문을 제기함. 롤스의 정의론이 "
-                                                        '단순히 철학적 담론에 머물지 않고, 언어 복지 및 정보 평등의 실현을 위한 이론적 토대가 될 수 있음을 깨달음. 특히 언어적 소수자의 권리 보장과 '
-                                                        '공공 언어의 표준화 과정에서 발생하는 갈등을 정의의 관점에서 재해석함. 노먼 대니얼스의 의료 정의론을 언어 정의론으로 치환하여, 모든 국민이 차별 '
-                                                        "없이 정보에 접근할 수 있는 '언어적 기본권'의 개념을 정립하려 노력함. 수업 시간에 배운 이론이 자신이 지향하는 국어국문학적 탐구와 직접적으로 "
-                                                        '연관되어 있음을 확인하고, 문학 작품 속 인물들의 갈등을 정의론적 관점에서 분석하는 후속 탐구를 진행함. 장차 국어학자나 언어 정책 전문가가 '
-                                                        '되어, 언어적 소외를 해소하고 공정한 소통 체계를 구축하는 데 기여하겠다는 포부를 밝힘. 고전 텍스트를 현대적 맥락에서 재해석하며, 언어 규범이 '
-                                                        '사회적 합의를 통해 어떻게 공정성을 확보할 수 있는지에 대해 깊이 있는 성찰을 보여줌.'},
-                                                 {'학년': '3',
-                                                  '영역': '독서',
-                                                  '내용': '언어와 문학에 대한 깊은 통찰력을 바탕으로 텍스트의 이면을 읽어내는 능력이 탁월함. 한국 현대 소설의 서사 구조를 분석하며 작가의 문체와 시대적 '
-                                                        '배경이 인물의 심리 묘사에 미치는 영향을 탐구함. 특히 1930년대 모더니즘 문학을 읽고 당시 지식인들이 겪은 언어적 소외와 자아 분열의 양상을 '
-                                                        "사회학적 관점에서 분석함. 독서 활동 중 '한국 근대 문학의 언어적 특징'에 관한 비평문을 접한 후, 우리말의 어휘가 시대에 따라 어떻게 변용되어 "
-                                                        '왔는지 국립국어원 자료를 활용해 추적함. 또한, 문학 작품 속 인물의 대화문을 분석하여 세대 간 언어 격차와 그로 인한 소통의 단절을 해결하기 '
-                                                        '위한 언어적 대안을 제시함. 동료들과 함께 문학 비평 동아리를 운영하며, 텍스트를 단순히 수용하는 것을 넘어 비판적으로 재구성하는 과정을 주도함. '
-                                                        '양질의 학술 논문과 비평집을 찾아 읽고, 탐구 결과를 학급 게시판에 공유하여 문학적 담론을 형성하는 데 기여함. 자신의 탐구 과정을 체계적으로 '
-                                                        '정리하여 발표함으로써 문학적 지식을 사회적 가치로 환원하는 능력을 보여줌.'},
-                                                 {'학년': '3',
-                                                  '영역': '언어와 매체',
-                                                  '내용': '국어의 통사적 구조와 의미론적 변화에 대한 깊은 이해를 바탕으로 언어 규범의 사회적 합의 과정을 논리적으로 분석함. 중세 국어의 표기법이 현대 '
-                                                        '국어의 맞춤법으로 정착되는 역사적 흐름을 추적하며, 언어의 표준화가 국가적 정체성 형성에 미치는 영향을 탐구함. 특히 디지털 미디어 환경에서 '
-                                                        "신조어와 줄임말이 언어의 경제성을 높이는 동시에 의사소통의 왜곡을 초래하는 현상에 주목함. 이를 해결하기 위해 '디지털 시대의 올바른 언어 사용 "
-                                                        "가이드라인'을 제안하는 보고서를 작성함. 파이썬을 활용한 텍스트 마이닝 기법을 익혀, 특정 시대의 문학 작품 속 빈출 어휘를 추출하고 이를 통해 "
-                                                        '당시의 시대상을 언어학적으로 재해석하는 시도를 함. 이러한 데이터 기반의 언어 분석은 문학 연구의 객관성을 확보하는 데 기여함. 복잡한 문법 '
-                                                        '체계를 도식화하여 이해하는 능력이 뛰어나며, 언어의 규칙성이 인간의 사고방식을 어떻게 규정하는지에 대한 철학적 질문을 던지며 국어국문학적 소양을 '
-                                                        '넓힘.'},
-                                                 {'학년': '3',
-                                                  '영역': '고전 읽기',
-                                                  '내용': '고전 텍스트를 현대적 시각에서 재해석하는 능력이 매우 뛰어나며, 인문학적 소양을 바탕으로 사회 현상을 비판적으로 성찰함. 고전 소설 속 여성 '
-                                                        '인물의 주체성을 현대 페미니즘 비평 이론과 연결하여 분석하는 심화 탐구를 수행함. 로잘린드 프랭클린의 과학적 업적을 다룬 텍스트를 읽고, 과학 '
-                                                        "기술의 발전 과정에서 소외된 인문학적 가치를 복원하는 글을 작성함. 브래그 법칙과 같은 과학적 원리를 문학적 은유로 치환하여, '과학과 문학의 "
-                                                        "융합적 서사'를 주제로 한 소논문을 발표함. 현대 물리학의 무한 개념을 다룬 텍스트를 읽고, 이를 문학적 상상력과 결합하여 '무한한 서사의 "
-                                                        "가능성'에 대해 논하는 수업에 주도적으로 참여함. 고전의 가치를 단순히 과거의 유산으로 보지 않고, 현대 사회의 갈등을 해결할 수 있는 인문학적 "
-                                                        '지혜로 치환하여 해석하는 능력이 돋보임. 자신의 생각을 논리적인 글로 표현하는 능력이 탁월하며, 토론 시 상대방의 논리를 경청하고 그 안에서 '
-                                                        '새로운 대안을 도출하는 유연한 사고력을 보여줌.'},
-                                                 {'학년': '3',
-                                                  '영역': '독서',
-                                                  '내용': "수행평가에서 '한국 근대 문학에 나타난 근대적 자아의 형성'을 주제로 발표하고, 이를 카드 뉴스로 제작하여 학급에 배포함. 이광수의 '무정'과 "
-                                                        "염상섭의 '삼대'를 중심으로 근대적 교육과 가치관이 인물의 내면 풍경을 어떻게 변화시켰는지 분석하며, 문학적 텍스트가 시대적 담론을 반영하는 "
-                                                        '방식을 논리적으로 설명함. 특히 근대적 자아의 분열과 갈등을 서사적 장치로 풀어내는 과정을 도식화하여 청중의 이해를 도왔으며, 문학 비평의 기본 '
-                                                        '개념을 정교하게 내면화하여 자기만의 언어로 재구성함. 교과 수업 중 근대 계몽주의 문학의 한계에 대해 지적 호기심을 보이며 질문하였고, 교사의 '
-                                                        '조언을 바탕으로 한국 근대 문학사 관련 대학 수준의 학술 논문을 탐독함. 문학적 형상화의 원리를 시대적 배경, 작가의 의도, 독자의 수용 관점으로 '
-                                                        '분류하여 정리하고, 텍스트의 미학적 가치를 사회적 맥락과 연결하여 탐구하는 심화 학습을 수행함.'},
-                                                 {'학년': '3',
-                                                  '영역': '언어와 매체',
-                                                  '내용': '언어 규범과 사회적 소통의 상관관계에 대한 깊은 이해를 바탕으로 우수한 학습 성과를 보임. 디지털 환경에서의 언어 변화 양상을 분석하고자 하는 '
-                                                        '의지를 가지고, 텍스트 마이닝 도구를 활용하여 온라인 커뮤니티의 신조어 사용 빈도와 그 사회적 함의를 분석함. 국어의 통사적 구조와 문법적 특징을 '
-                                                        "학습하는 과정에서, 이를 프로그래밍 언어의 문법 체계와 비교하여 '언어의 구조적 유사성'을 탐구하려는 목표를 세움. 프로젝트 수행 중 파이썬의 "
-                                                        '자연어 처리 라이브러리를 활용하여 특정 시대의 문학 작품 속 어휘 분포를 연산하고, 이를 시각화하는 성과를 거둠. 특히 문장의 성분 분석을 '
-                                                        '자동화하는 함수를 구현하여 국어 문법의 체계성을 데이터로 증명함. 각주를 통해 프로그램의 알고리즘과 언어학적 해석을 꼼꼼히 서술하여 동료들의 '
-                                                        '이해를 도왔으며, 언어와 기술의 융합적 사고를 통해 국어국문학의 새로운 연구 방법론을 제시하는 뛰어난 산출물을 제출함.'},
-                                                 {'학년': '2',
-                                                  '영역': '탐구의 지속성과 일관성',
-                                                  '내용': "국어학 & 사회언어학: 1학년 진로활동에서 시작된 '언어의 사회적 구성성'에 대한 관심을 2학년 언어와 매체(디지털 시대의 언어 규범과 소통)로 "
-                                                        '연결한 점이 매우 훌륭함. 사회적 합의, 표준화, 언어적 소외 등의 인문학적 개념을 디지털 미디어 환경에서의 혐오 표현 규제 논의에 적용하며, '
-                                                        '국어국문학 분야에 대한 지속적이고 심화된 학술적 관심을 입증함.'},
-                                                 {'학년': '2',
-                                                  '영역': '인문학적 소양과 사회적 통찰',
-                                                  '내용': '언어와 사회적 담론 탐구: 현대 사회의 갈등 양상을 언어적 관점에서 분석하기 위해 텍스트 마이닝 기법을 활용하여 뉴스 기사의 어휘 빈도와 감성 '
-                                                        "분석을 수행함. 특히 '혐오 표현'이 공론장에서 어떻게 정당화되는지 롤스의 정의론과 하버마스의 의사소통 행위 이론을 적용하여 비판적으로 고찰함. "
-                                                        '언어의 사회적 구성성을 탐구하며 국어국문학적 소양을 바탕으로 한 건강한 담론 형성 방안을 제안하는 등 인문학적 문제 해결 능력을 입증함.'},
-                                                 {'학년': '2',
-                                                  '영역': '교과 간 융합 및 도구 활용',
-                                                  '내용': '문학 데이터 분석 및 디지털 인문학: 고전 소설의 서사 구조를 수학적 그래프 이론으로 도식화하여 인물 간의 관계망을 파악하는 디지털 인문학 '
-                                                        '프로젝트를 수행함. 파이썬의 네트워크 분석 라이브러리를 활용하여 고전 텍스트 내의 갈등 구조를 시각화하고, 이를 통해 서사적 긴장감이 발생하는 '
-                                                        '지점을 정량적으로 분석함. 인문학적 텍스트 해석에 데이터 과학적 방법론을 결합하여 문학 연구의 새로운 지평을 제시하는 최상위 수준의 융합적 탐구 '
-                                                        '역량을 보여줌.'},
-                                                 {'학년': '2',
-                                                  '영역': '학술적 전문성 (Hard Core)',
-                                                  '내용': '국어학 및 언어 구조 심화 탐구: 중세 국어의 문법 체계와 현대 국어의 통사적 변화를 음운론적 관점에서 정밀하게 분석함. 특히 훈민정음 창제 '
-                                                        '원리를 현대 언어학의 음성학적 지식과 결합하여 설명하고, 언어의 경제성 원리가 어떻게 문법의 변천을 이끌었는지 논리적으로 증명함. 고전 문헌의 '
-                                                        '정확한 독해와 언어학적 전문 용어의 적절한 사용은 국어국문학 전공자로서 갖추어야 할 학술적 엄밀함과 깊이 있는 탐구 태도를 입증함.'},
-                                                 {'학년': '2',
-                                                  '영역': '보완점 제언',
-                                                  '내용': '국어국문학적 탐구의 심화: 문학 텍스트 분석과 사회 언어학적 현상을 병렬적으로 나열할 때, 각 현상이 한국어의 구조적 변화와 어떻게 유기적으로 '
-                                                        '연결되는지 논리적 인과관계를 더욱 명확히 서술할 필요가 있음. 특히 디지털 매체 환경에서의 언어 파괴 현상에 대한 탐구는 앞선 고전 문학의 현대적 '
-                                                        '변용 사례들과 비교 분석하여, 언어의 보수성과 변화 가능성이라는 관점에서 논거를 강화하는 것이 학술적 깊이를 드러내는 데 전략적으로 유리함.'}],
-                                  'comments': [{'구분': '기타 합격 대학', '내용': '연세대 국어국문학과, 고려대 국어국문학과, 서강대 국어국문학과'},
-                                               {'구분': '고등학교', '내용': '자사고 내신 1.1 ~ 1.3'},
-                                               {'구분': '총평',
-                                                '내용': '자사고의 치열한 내신 경쟁 환경 속에서도 1점대 초반의 최상위 성적을 유지하며 학업 역량을 입증했다. 단순히 교과 성적에 매몰되지 않고, 1학년 '
-                                                      '때부터 한국 문학의 현대적 변용과 언어학적 구조 분석이라는 일관된 학술적 탐구 서사를 구축한 점이 매우 인상적이다. 서울대 국어국문학과 합격생으로서 '
-                                                      '갖추어야 할 인문학적 깊이와 비판적 사고력을 생기부 전반에 걸쳐 탁월하게 드러냈다.'},
-                                               {'구분': '장애측정기준 관련',
-                                                '내용': '언어의 사회적 구성성에 주목하여 장애 지칭 용어의 변천사를 탐구한 것은 국어국문학 지망생으로서 언어의 사회적 기능을 통찰하는 훌륭한 접근이다. 다만, '
-                                                      '활동 내용을 단순히 나열하는 방식에서 벗어나, 학생이 해당 용어의 변화가 실제 사회적 인식에 미친 영향력을 어떻게 분석하고 자신의 언어관을 정립했는지 '
-                                                      '서사적으로 풀어내는 과정이 보완된다면 더욱 설득력이 높을 것이다.'},
-                                               {'구분': '의료기기 및 강제입원 토론',
-                                                '내용': '1. 국어국문학 지망생으로서 사회적 담론을 형성하는 텍스트의 힘을 탐구하는 것은 매우 바람직하다. 다만, 특정 사회 이슈를 다룰 때 지나치게 급진적인 '
-                                                      '논조로 타 학문의 관점을 배제하기보다는, 인문학적 관점에서 다양한 사회적 합의점을 도출하려는 태도를 보여주는 것이 중요하다. 2. 토론 활동은 논리적 '
-                                                      '사고력을 증명하는 좋은 기회이다. 자신의 주장을 펼칠 때 문헌적 근거와 사회적 맥락을 결합하여 전략적으로 논리를 구성하는 연습이 지속된다면 면접 '
-                                                      '등에서도 큰 강점이 될 것이다.'},
-                                               {'구분': 'SIR 모델 관련',
-                                                '내용': '언어 데이터의 확산 모델을 수학적 통계와 연계하여 분석한 시도는 매우 참신하다. 다만, 모델링의 수식적 전개에만 치중하기보다, 해당 모델이 실제 언어 '
-                                                      '현상이나 문학적 유행의 전파 과정을 설명하는 데 있어 어떤 한계와 의의를 갖는지에 대한 인문학적 해석이 더해졌다면 탐구의 깊이가 한층 돋보였을 '
-                                                      '것이다.'},
-                                               {'구분': '고흡수성 수지 대체재 연구',
-                                                '내용': "언어적 관점에서 텍스트의 구조를 분석하는 탐구 과정이 논리적이고 체계적이다. 특히 '동기-구체적 탐구-자기 해석'으로 이어지는 서술 구조가 훌륭하다. "
-                                                      "다만, 탐구의 목적을 명확히 하기 위해 '디지털 시대의 문해력 저하 현상에 대한 언어학적 분석 및 대안 제시'와 같이 주제를 명시적으로 제목화하여 "
-                                                      '정리한다면 가독성과 전문성이 더욱 높아질 것이다.'},
-                                               {'구분': '정신장애 및 대체의학 토론',
-                                                '내용': "교과 수업 중 보여준 비판적 질문과 토론 태도는 학생의 학문적 열정을 잘 보여준다. 선생님들로부터 '매우 스마트하고 통찰력이 뛰어나다'는 평가를 받는 "
-                                                      '것은 학생의 평소 성실함과 지적 호기심이 학교생활 전반에 녹아있음을 의미한다. 이러한 긍정적인 관계 형성은 수시 전형에서 학생의 인성을 증명하는 '
-                                                      '중요한 밑거름이 된다.'},
-                                               {'구분': '법의학 관련',
-                                                '내용': '문학 작품 속 죽음의 서사를 탐구하며 법의학적 지식을 결합한 것은 인문학적 상상력을 확장하는 좋은 시도이다. 다만, 추상적인 삶과 죽음에 대한 성찰에 '
-                                                      '그치지 말고, 문학 텍스트가 죽음을 어떻게 형상화하고 있는지, 그리고 그것이 현대 사회의 윤리적 담론과 어떻게 연결되는지를 구체적인 텍스트 분석을 '
-                                                      '통해 기술하는 것이 좋다.'},
-                                               {'구분': '인재상 및 페르소나',
-                                                '내용': "대학이 요구하는 인재상에 맞추기 위해 거창한 수식어를 나열하기보다, '언어 현상을 통해 사회를 읽어내는 지성인'이라는 학생만의 명확한 페르소나가 잘 "
-                                                      '드러나 있다. 학업 능력뿐만 아니라 사회적 공감 능력을 갖춘 인재라는 점이 생기부 곳곳에서 확인되므로, 앞으로도 이러한 일관된 정체성을 유지하며 '
-                                                      '탐구의 깊이를 더해나가길 바란다.'},
-                                               {'구분': '소장암 탐구활동',
-                                                '내용': '의학적 소재를 문학적 서사 분석과 연결하여 탐구한 점이 돋보인다. 특정 질병에 대한 의학적 정보 수집에서 출발하여, 이를 다룬 문학 작품 속 환자의 '
-                                                      '언어적 표현을 분석하고 팀원들과 협업하여 발표까지 이어진 과정은 연속성 측면에서 매우 우수하다. 탐구의 연결 과정이 논리적이고 인문학적 통찰을 담고 '
-                                                      '있어 전공 적합성이 잘 드러난다.'},
-                                               {'구분': '생물약동학 실험 설계',
-                                                '내용': '과학적 탐구 활동을 언어학적 관점에서 재해석하려는 시도는 좋으나, 활동 간의 연결 고리가 다소 작위적으로 느껴질 위험이 있다. 과학적 사실과 인문학적 '
-                                                      '해석을 결합할 때는 두 분야가 서로 독립적인 영역임을 인지하고, 그 접점을 논리적으로 정교하게 설계해야 한다. 단순한 지식의 나열보다는 학생이 어떤 '
-                                                      '고민을 통해 두 분야를 연결했는지에 대한 서사가 중요하다.'},
-                                               {'구분': '수학 심화탐구의 위계',
-                                                '내용': '수학적 원리를 언어의 구조 분석에 적용한 탐구는 훌륭하다. 다만, 단순히 학습 내용을 실생활에 대응시키는 수준을 넘어, 언어학적 이론을 수학적 모델로 '
-                                                      '비틀거나 확장하여 새로운 해석을 도출하는 고차원적인 탐구 위계가 필요하다. 이러한 심화 학습의 흔적이 생기부에 드러날 때 비로소 최상위권 학생다운 '
-                                                      '학업 역량이 증명된다.'},
-                                               {'구분': '영어 세특의 전략적 우위',
-                                                '내용': "영어 교과에서 전문적인 언어학 논문을 읽고 비판적으로 분석한 활동은 매우 고무적이다. 특히 '학년 내 가장 두각을 나타내는 학생'이라는 평가는 학생의 "
-                                                      '학업적 우수성을 잘 보여준다. 영어로 된 전문 자료를 주도적으로 탐구하고 이를 자신의 전공 분야인 국어국문학적 관점에서 재해석하는 과정은 '
-                                                      '입학사정관에게 매우 매력적인 요소로 작용할 것이다.'},
-                                               {'구분': '통합과학 및 과학탐구실험 관련',
-                                                '내용': '과학적 현상을 언어적 은유로 설명하려는 시도는 학생의 융합적 사고력을 잘 보여준다. 다만, 과학적 지식을 나열하는 데 그치지 말고, 학생이 직접 어떤 '
-                                                      '방법론을 사용하여 탐구했는지, 그 과정에서 어떤 인문학적 통찰을 얻었는지에 초점을 맞추어 기술한다면 훨씬 효과적인 세특이 될 것이다.'},
-                                               {'구분': '철학 관련',
-                                                '내용': '철학적 사유를 통해 언어와 인간의 사고 관계를 탐구한 것은 국어국문학 지망생에게 매우 적합한 소재이다. 뇌과학적 지식과 언어 철학을 접목하거나, '
-                                                      '윤리적 딜레마 상황에서 언어의 역할을 분석하는 등 다양한 방향으로 탐구를 확장할 수 있다. 자신의 생기부에서 부족한 인문학적 깊이를 채우기 위해 '
-                                                      '철학적 근거를 적재적소에 배치하는 전략이 필요하다.'},
-                                               {'구분': '논술 관련',
-                                                '내용': "언어의 기원과 본질에 대해 철학적, 과학적 접근을 시도한 것은 훌륭하다. 다만, '친구들과 의견을 나누었다'는 식의 추상적인 서술은 지양해야 한다. "
-                                                      '구체적으로 어떤 텍스트를 읽고 어떤 논리적 근거를 바탕으로 자신의 견해를 정립했는지, 그 과정에서 어떤 비판적 사고가 이루어졌는지를 구체적으로 '
-                                                      '기술해야 탐구의 깊이가 느껴진다.'},
-                                               {'구분': '체육 관련',
-                                                '내용': '체육 활동을 통해 신체 언어와 비언어적 소통의 중요성을 탐구한 것은 전공 적합성을 드러내는 좋은 전략이다. 국어국문학은 언어뿐만 아니라 인간의 소통 '
-                                                      '전반을 다루는 학문이므로, 체육 활동에서 발견한 소통의 원리를 인문학적 관점에서 해석하는 것은 매우 자연스럽고 설득력 있는 접근이다.'},
-                                               {'구분': '언어와 매체 관련',
-                                                '내용': '디지털 매체 환경에서의 언어 변화를 탐구한 것은 전공 적합성이 매우 높은 활동이다. 단순히 매체의 특성을 나열하는 것이 아니라, 매체의 변화가 언어 '
-                                                      '규범과 사회적 소통에 미치는 순기능과 역기능을 인과성 있게 분석한 점이 훌륭하다. 학생의 주도적인 탐구 과정이 잘 드러나 있어 매우 우수한 세특으로 '
-                                                      '평가된다.'},
-                                               {'구분': '수학 1 관련',
-                                                '내용': '수학적 원리를 언어의 패턴 분석에 적용한 것은 좋은 시도이다. 다만, 단순한 수열의 적용을 넘어, 언어 데이터의 통계적 분포나 복잡한 문장 구조의 '
-                                                      '수학적 모델링 등 보다 심화된 주제를 선정하는 것이 좋다. 푸리에 변환과 같은 고급 수학적 도구를 언어학적 분석에 어떻게 활용할 수 있을지에 대한 '
-                                                      '고민이 더해진다면 탐구의 수준이 한층 높아질 것이다.'},
-                                               {'구분': '한국사 관련',
-                                                '내용': '한국사 세특에서 근대 국어의 변천사와 당시 사회상을 연결하여 탐구한 것은 전공 적합성을 잘 보여준다. 여러 주제를 나열하기보다, 한 가지 주제를 정해 '
-                                                      '깊이 있게 탐구하고 그 과정에서 학생이 어떤 주도적인 역할을 했는지 기술하는 것이 훨씬 효과적이다. 역사적 맥락 속에서 언어의 변화를 읽어내는 '
-                                                      '통찰력이 돋보인다.'},
-                                               {'구분': '화학 1 및 생명과학 1 관련',
-                                                '내용': '과학 교과에서 언어학적 관점을 결합하여 탐구한 점이 매우 창의적이다. 단순 지식 나열이 아니라, 과학적 현상을 설명하는 언어적 은유와 그 사회적 '
-                                                      '영향력을 탐구하는 과정에서 학생의 주도성이 잘 드러난다. 특히 전문적인 지식을 쌓아가는 일련의 스토리가 생기부에 잘 담겨 있어, 인문학적 소양과 '
-                                                      '과학적 탐구 역량을 동시에 갖춘 인재라는 인상을 준다.'},
-                                               {'구분': '종합 의견',
-                                                '내용': "이 학생의 2학년 세특은 **'언어학적 전문성'**과 **'사회적 통찰력'**이 완벽한 균형을 이루고 있습니다. 특히 **디지털 매체 환경의 언어 "
-                                                      '변화 분석**이나 **문학 텍스트의 구조적 해체**는 국어국문학과 교수들이 선호하는 심화 탐구 주제입니다.'}]},
- 'case_1_humanities_public_admin': {'personal_info': {'대상': '[Case 1] 서울대학교 행정학과 합격생',
-                                                      '고등학교_유형': '자사고',
-                                                      '내신_성적': '1.1 ~ 1.3',
-                                                      '주요_특징': '자사고의 치열한 내신 경쟁 속에서도 1점대 초반의 성적을 유지하며, 공공 정책 및 행정 시스템에 대한 깊이 있는 탐구 역량을 1학년 '
-                                                               '때부터 일관되게 증명한 사례.',
-                                                      '총평': '자사고의 엄격한 학업 환경 속에서도 최상위권 내신을 유지한 점이 매우 인상적이다. 단순히 교과 성적에 그치지 않고, 행정학적 관점에서 사회 '
-                                                            '문제를 분석하고 정책적 대안을 제시하는 등 학술적 깊이가 남다르다. 1학년부터 3학년까지 행정학과를 향한 진로 탐색 과정이 유기적으로 '
-                                                            '연결되어 있어, 입학사정관에게 전공 적합성과 학업 역량을 동시에 입증한 우수한 사례로 평가된다.',
-                                                      '기타_합격_대학': '연세대학교 행정학과, 고려대학교 행정학과, 성균관대학교 글로벌리더학부'},
-                                    'activities': [{'학년': '1',
-                                                    '영역': '자율활동',
-                                                    '내용': '학급 자치회에서 총무 역할을 수행하며 학급 예산 집행의 투명성을 확보하고 효율적인 운영 방안을 제시함. 공공 정책의 기초가 되는 예산 관리의 '
-                                                          '중요성을 체감하며 학급 운영 규칙을 제정하는 과정에서 민주적 의사결정의 절차를 실천함. 장애인 이동권 보장 정책에 관한 탐구 활동을 통해 '
-                                                          '국가별 장애인 복지 예산 배분 방식과 정책적 우선순위의 차이를 분석함. 단순히 시혜적 복지를 넘어 사회적 비용과 편익을 고려한 정책 설계의 '
-                                                          '필요성을 역설하며, 장애인 고용 의무제와 같은 실질적 행정 제도의 개선 방안을 보고서로 작성함. 스포츠한마당에서는 학급 대표로 참여하여 팀원 '
-                                                          "간의 갈등을 조정하고 전략적 자원 배분을 통해 협력을 이끌어내는 리더십을 발휘함. 또한, 교육청 주관 학생 통계 활용 발표회에서 '청년층의 "
-                                                          "공공 서비스 만족도와 정책 참여 의식'을 주제로 설문조사를 실시함. 통계적 유의성을 검증하기 위해 변수 간 상관관계를 분석하고, 이를 "
-                                                          '시각화하여 정책적 시사점을 도출하는 등 데이터 기반 행정의 기초 역량을 보여줌.'},
-                                                   {'학년': '1',
-                                                    '영역': '동아리활동',
-                                                    '내용': "사회 문제 해결을 위한 정책 토론 동아리에서 '지방자치단체 간 재정 격차 해소를 위한 교부세 제도의 개선 방향'을 주제로 찬성 측 입론을 맡아 "
-                                                          "논리적 근거를 제시함. '공공기관의 비정규직 정규직 전환 정책의 타당성'에 관한 토론에서는 사회적 형평성과 행정 효율성이라는 두 가치의 충돌을 "
-                                                          "분석하고, 이해관계자 간의 갈등을 조정하기 위한 행정적 중재 모델을 제안함. 또한, '기본소득제 도입이 행정 서비스 전달 체계에 미치는 "
-                                                          "영향'을 주제로 한 토론에서 사회 안전망으로서의 행정의 역할을 강조하며, 복지 사각지대 해소를 위한 디지털 행정 플랫폼의 활용 방안을 "
-                                                          '구체적으로 제시함. 다양한 사회적 쟁점을 행정학적 관점에서 재해석하며 비판적 사고력을 길렀고, 다수결의 원칙과 소수자 보호라는 민주주의의 핵심 '
-                                                          '가치를 행정 현장에 어떻게 접목할지 깊이 있게 고민함. 동아리 부장으로서 토론의 규칙을 정립하고 논의의 흐름을 체계적으로 정리하는 등 '
-                                                          '행정가로서 갖추어야 할 조정 능력과 소통 역량을 입증함.'},
-                                                   {'학년': '1',
-                                                    '영역': '진로활동',
-                                                    '내용': "(희망분야: 행정학과) 공공 정책의 수립과 집행 과정에 관심을 두고 '감염병 대응을 위한 국가 위기 관리 시스템의 행정적 효율성'을 주제로 "
-                                                          '탐구함. COVID-19 대응 과정에서 나타난 중앙정부와 지방자치단체 간의 협력 체계와 의사결정 구조를 분석하고, 재난 대응 매뉴얼의 실효성을 '
-                                                          '높이기 위한 거버넌스 구축 방안을 고찰함. SIR 모델을 행정학적 관점에서 해석하여 자원 배분의 최적화 지점을 찾으려는 시도가 돋보임. 진로 '
-                                                          '탐색의 날에는 공공 데이터 포털을 활용한 정책 분석 강연을 듣고, 공공 서비스의 질적 향상을 위한 데이터 기반 의사결정의 중요성을 깨달음. '
-                                                          "특히 '정밀 행정'이라는 개념을 도입하여 지역별 인구 통계와 수요 조사를 바탕으로 한 맞춤형 복지 서비스 제공 방안을 구상함. 관련 서적을 "
-                                                          '탐독하며 행정학의 고전적 이론과 현대적 정책 수단을 비교 분석하고, 공공의 이익을 실현하기 위한 행정가의 윤리적 책임과 전문성에 대해 깊이 '
-                                                          '있는 성찰을 담은 진로 보고서를 작성하여 행정학과 진학을 위한 학술적 토대를 마련함.'},
-                                                   {'학년': '2',
-                                                    '영역': '자율활동',
-                                                    '내용': '디지털 소외 계층의 정보 접근성 문제를 해결하기 위해 공공 서비스 키오스크의 사용자 인터페이스 개선 방안을 탐구함. 노년층의 신체적 특성인 '
-                                                          '시야각과 관절 가동범위를 고려하여, 공공기관 민원 키오스크의 최적 배치와 화면 구성 원리를 분석함. 지오지브라를 활용해 사용자의 신장과 '
-                                                          '키오스크 설치 높이에 따른 시야 범위를 수학적으로 모델링하고, 이를 바탕으로 보편적 설계(Universal Design)를 적용한 행정 서비스 '
-                                                          '단말기 표준안을 제안함. 또한, 공공 부문의 친환경 행정 실천을 위해 일회용품 사용을 줄이는 정책적 대안을 모색함. 고흡수성 수지의 환경 오염 '
-                                                          '문제를 해결하기 위한 생분해성 소재의 효율성을 실험하고, 이를 공공 시설 내 비치하는 물품에 적용할 경우의 비용 대비 편익을 분석함. 스스로 '
-                                                          '가설을 설정하고 실험을 설계하는 과정에서 행정학적 의사결정의 근거가 되는 데이터의 중요성을 체감하였으며, 정책 수립 시 기술적 타당성과 사회적 '
-                                                          '가치를 동시에 고려해야 함을 논리적으로 정립함.'},
-                                                   {'학년': '2',
-                                                    '영역': '동아리활동',
-                                                    '내용': "사회적 갈등을 조정하고 합리적인 정책 대안을 도출하는 정책 토론 동아리에서 활동하며, '공공 의료 서비스의 민영화와 공공성 강화'를 주제로 "
-                                                          '심도 있는 토론을 주도함. 환자의 선택권 보장이라는 찬성 측 논리와 의료 서비스의 보편적 복지라는 반대 측 논리를 비교 분석하며, 행정학적 '
-                                                          "관점에서 의료 자원의 효율적 배분과 정부의 규제 권한에 대해 고찰함. 특히 '정신질환 범죄자에 대한 사법적 처벌과 치료적 처우의 균형'을 "
-                                                          '주제로 한 토론에서는 응보형론과 목적형론을 대조하며, 사회 안전망 구축을 위한 행정적 개입의 한계와 필요성을 논리적으로 제시함. 해리성 정체성 '
-                                                          '장애와 같은 특수 사례를 법적·행정적 틀 안에서 어떻게 수용할지 고민하며, 사회적 소수자를 보호하기 위한 정책적 장치의 미비점을 지적함. 토론 '
-                                                          '과정에서 다양한 이해관계자의 입장을 비판적으로 수용하고, 객관적 근거에 기반하여 본인의 정책적 견해를 설득력 있게 전달하는 역량이 탁월함.'},
-                                                   {'학년': '2',
-                                                    '영역': '진로활동',
-                                                    '내용': "(희망분야: 행정학과) '디지털 전환 시대의 공공 행정 혁신' 강연에 참여하여, 데이터 기반 행정(Data-Driven Government)의 "
-                                                          '미래와 개인정보 보호를 위한 암호 기술의 중요성을 탐구함. 동형암호 기술이 공공 데이터 활용과 개인정보 보호라는 상충하는 가치를 어떻게 '
-                                                          "조화시킬 수 있는지 분석하며, 행정 서비스의 디지털화 과정에서 발생할 수 있는 윤리적 쟁점과 정책적 대응 방안을 고찰함. 또한 '생명공학 "
-                                                          "기술의 발전과 사회적 규제' 강연을 통해 유전자 편집 기술과 같은 신기술이 사회에 미치는 파급력을 이해하고, 이를 통제하기 위한 행정적 "
-                                                          "가이드라인과 윤리 교육의 필요성을 역설함. 진로 탐색 활동으로 '공공 정책과 법적 정의' 강의를 수강하며, 사회적 합의를 도출하는 과정에서의 "
-                                                          '행정가의 역할과 사명에 대해 깊이 있게 성찰함. 특히 안락사나 연명 치료와 같은 민감한 사회적 이슈를 다룰 때, 법적·행정적 기준이 어떻게 '
-                                                          '인간의 존엄성을 보호할 수 있는지 탐구하며, 공공의 이익을 최우선으로 하는 행정 전문가로서의 가치관을 확립함.'},
-                                                   {'학년': '1',
-                                                    '영역': '통합사회',
-                                                    '내용': '사회 현상을 분석함에 있어 행정학적 관점을 견지하며, 수업 시간에 배운 사회적 불평등과 정의론을 실제 정책 사례와 연계하여 탐구하는 융합적 '
-                                                          '사고력을 발휘함. 롤스의 정의론을 학습한 후, 이를 현대 사회의 복지 정책과 비교 분석하며 분배적 정의가 실제 행정 현장에서 어떻게 구현되는지 '
-                                                          '고찰함. 특히 공공 서비스의 접근성 격차 문제를 해결하기 위해 지역별 공공기관 분포 데이터를 수집하고, 이를 지리 정보와 결합하여 시각화하는 '
-                                                          '분석력을 보임. 실험적 접근을 통해 정책의 실효성을 검증하는 과정에서, 단순히 이론을 습득하는 데 그치지 않고 실제 행정 데이터의 한계와 '
-                                                          '보완점을 논리적으로 도출함. 수업 후에는 공공 부문의 효율성과 형평성 사이의 갈등을 해결하기 위한 거버넌스 모델에 대해 깊은 관심을 보이며, '
-                                                          '관련 행정학 도서를 찾아 스스로 탐구하여 그 내용을 보고서로 작성함. 이외에도 지역사회 문제 해결을 위한 주민 참여 예산제도를 분석하고, '
-                                                          '시민의 의견이 정책에 반영되는 민주적 의사결정 과정을 체계적으로 설계하는 등 행정가로서의 자질을 유감없이 발휘함.'},
-                                                   {'학년': '2',
-                                                    '영역': '정치와 법',
-                                                    '내용': '정치 체제와 법적 규범이 사회적 갈등을 조정하는 기제에 주목하여, 행정학적 관점에서 정책 결정 과정을 심도 있게 탐구함. 특히 지방자치제도의 '
-                                                          '운영 원리를 학습하며, 중앙정부와 지방정부 간의 권한 배분 문제와 재정 자립도 격차에 따른 행정 서비스의 질적 차이를 분석하는 과제를 탁월하게 '
-                                                          '수행함. 행정의 민주성과 능률성이라는 두 가치가 충돌하는 지점을 포착하고, 이를 해결하기 위한 대안으로 숙의 민주주의 모델을 제시함. 스스로 '
-                                                          "설정한 '지방자치단체 간 재정 격차 해소를 위한 교부세 제도의 개선 방향'이라는 주제를 통해, 기존 제도의 한계를 법적·제도적 측면에서 "
-                                                          '비판적으로 검토함. 현대 행정학에서 강조되는 데이터 기반 의사결정의 중요성을 인지하고, 공공 데이터의 투명한 공개가 시민의 신뢰를 어떻게 '
-                                                          '증진하는지 논증하는 역량을 갖춤. 정책의 수립부터 집행, 평가에 이르는 전 과정을 행정학적 이론과 연결하여 분석함으로써, 복잡한 사회 문제를 '
-                                                          '해결하기 위한 행정적 통찰력을 입증함.'},
-                                                   {'학년': '2',
-                                                    '영역': '고전과 윤리',
-                                                    '내용': "고전 텍스트를 통해 공직자의 윤리 의식과 행정의 공공성에 관한 철학적 기반을 다짐. '국가'를 읽고 플라톤이 제시한 통치자의 자질과 현대의 "
-                                                          '공직 윤리를 비교하며, 공익을 우선시하는 행정가의 도덕적 책임에 대해 심도 있게 고찰함. 통합적 요약의 의미를 학습한 후, 공공 정책의 윤리적 '
-                                                          '정당성에 관한 상반된 견해를 담은 두 사설을 읽고 공통점과 차이점을 논리적으로 요약함. 행정 현장에서 발생하는 윤리적 딜레마를 어떻게 해결할 '
-                                                          "것인가에 대해 친구들과 토론하며, 결과 중심의 효율성보다는 절차적 정당성과 배려 윤리의 중요성을 강조함. 또한, '정의란 무엇인가'를 읽고 "
-                                                          '분배적 정의의 실현을 위한 행정적 개입의 한계와 가능성에 대해 학문 융합적 통찰을 제시함. 행정학적 관점에서 사회적 약자를 보호하기 위한 법적 '
-                                                          '장치의 필요성을 역설하고, 이를 뒷받침하는 윤리적 근거를 고전적 사유를 통해 정립함. 활동 내용을 발표하며 행정의 본질이 단순한 관리 업무를 '
-                                                          '넘어 사회적 가치를 실현하는 과정임을 논리적으로 설득함.'},
-                                                   {'학년': '2',
-                                                    '영역': '체육',
-                                                    '내용': '공공 정책의 집행 과정에서 요구되는 협동심과 책임감을 체육 활동을 통해 체득함. 농구와 배드민턴 수행평가 시 팀의 전략을 수립하고 구성원 간의 '
-                                                          '역할을 분담하는 과정에서 행정 조직의 효율적 운영 원리를 실천함. 특히 태권도 품새 학습 과정에서 보여준 절제된 동작과 규칙 준수 태도는 '
-                                                          '공직자로서 갖추어야 할 자기 통제력과 규범 의식을 잘 보여줌. 신체적 역량뿐만 아니라 팀워크를 조율하는 리더십을 발휘하여 학급 내 갈등을 '
-                                                          '중재하고 공동의 목표를 달성하는 데 기여함.'},
-                                                   {'학년': '2',
-                                                    '영역': '언어와 매체',
-                                                    '내용': "매체 자료의 수용과 생산 과정을 학습하며 공공 정보의 전달 체계와 그 영향력을 분석함. '공공 보건 정책과 제약 산업의 윤리적 책임'을 주제로 "
-                                                          '기사문을 분석한 후, 국가 위기 상황에서 정부의 행정적 개입이 민간 영역의 이윤 추구와 어떻게 조화를 이루어야 하는지 논리적으로 서술함. 특히 '
-                                                          "'공공 서비스 플랫폼의 정보 비대칭성 해소'를 주제로 탐구하며, 디지털 매체가 공공 행정의 투명성을 높이는 도구로 활용될 가능성과 그에 따른 "
-                                                          '개인정보 보호 정책의 필요성을 심도 있게 고찰함. 정보 제공자의 신뢰성 확보가 행정 서비스의 질적 향상에 직결됨을 인지하고, 공공기관의 디지털 '
-                                                          '소통 전략이 나아가야 할 방향을 정책적 관점에서 제언함.'},
-                                                   {'학년': '2',
-                                                    '영역': '수학 1',
-                                                    '내용': "수학적 모델링을 통해 사회 현상을 분석하고 정책적 대안을 도출하는 능력이 탁월함. 등비수열의 합 공식을 활용하여 '공공 예산의 장기적 운용에 "
-                                                          "따른 재정 건전성 변화'를 시뮬레이션하고, 복리 계산 원리를 통해 공공 기금의 효율적 관리 방안을 수리적으로 증명함. 또한 삼각함수의 주기성을 "
-                                                          '학습한 후, 이를 도시 교통량의 시간대별 변화 패턴 분석에 적용하여 최적의 대중교통 배차 간격을 산출하는 모델을 탐구함. 지오지브라를 활용해 '
-                                                          '데이터의 변동성을 시각화하고, 행정적 의사결정 과정에서 통계적 근거가 갖는 중요성을 강조함. 복잡한 사회 문제를 수리적 언어로 구조화하여 '
-                                                          '합리적인 정책 결정을 뒷받침하려는 태도가 돋보임.'},
-                                                   {'학년': '2',
-                                                    '영역': '확률과 통계',
-                                                    '내용': '공공 정책의 효과성을 데이터로 검증하는 과정에 흥미를 느껴, 통계적 추론을 활용한 정책 분석 탐구 활동을 수행함. 표본조사를 통해 모집단의 '
-                                                          '특성을 추정하는 과정에서 표본의 크기와 신뢰 수준이 정책 결정의 정확도에 미치는 영향을 분석함. 특히 공공 서비스 만족도 조사 데이터를 '
-                                                          '활용하여 중심극한정리를 적용하고, 신뢰구간을 설정하여 정책의 유의미성을 판정하는 과정을 논리적으로 전개함. 가설 검정 단원에서는 귀무가설과 '
-                                                          '대립가설을 설정하여 특정 행정 서비스 개선안이 시민의 삶의 질에 미치는 영향력을 통계적으로 검증함. 수업 중 친구들에게 통계적 오류가 발생하기 '
-                                                          '쉬운 사례를 들어 설명하며, 데이터 기반 행정의 중요성을 강조하는 등 학급 내 토론을 주도함. 형성평가에서 복잡한 확률 분포 문제를 정확하게 '
-                                                          '해결하는 등 수학적 사고력을 행정학적 문제 해결에 적용하는 능력이 탁월함.'},
-                                                   {'학년': '2',
-                                                    '영역': '한국사',
-                                                    '내용': '행정 체제의 변천이 국가 운영에 미친 영향에 주목하여, 조선 시대의 중앙 집권적 행정 조직과 지방관 파견 제도가 사회 안정에 기여한 바를 '
-                                                          "탐구함. '조선 후기 조세 제도의 개혁과 행정적 효율성'을 주제로, 대동법 시행이 국가 재정 확보와 민생 안정에 미친 영향을 분석함. 역사적 "
-                                                          '자료를 통해 당시의 행정적 한계와 이를 극복하기 위한 관료들의 정책적 노력을 고찰하며, 현대의 지방자치제도와 비교하는 시각을 견지함. 특히 '
-                                                          '전쟁과 같은 국가적 위기 상황에서 행정 조직이 어떻게 재편되고 복구되는지, 임진왜란 이후의 비변사 기능 강화 사례를 통해 행정 기구의 유연성을 '
-                                                          '분석함. 단순히 역사적 사실을 암기하는 것에 그치지 않고, 당시의 행정적 의사결정 구조를 현대적 관점에서 재해석하여 정책적 시사점을 도출함. '
-                                                          '한국의 역사적 경험을 바탕으로 공공 행정의 본질을 탐구하려는 태도가 매우 진지하며, 시대적 맥락을 행정학적 틀로 구조화하는 능력이 뛰어남.'},
-                                                   {'학년': '2',
-                                                    '영역': '정치와 법',
-                                                    '내용': "행정학과 진학을 목표로 정책 결정 과정과 법적 규범의 상호작용을 심도 있게 탐구함. '지방자치단체 조례 제정 과정에서의 주민 참여 확대 "
-                                                          "방안'을 주제로, 현행 주민조례발안제도의 운영 실태와 개선점을 분석함. 법적 근거와 행정적 절차를 조사하여 주민의 의사가 정책에 반영되는 "
-                                                          '경로를 도식화하고, 참여 민주주의를 실현하기 위한 행정적 인프라의 필요성을 주장함. 또한, 행정법의 기본 원칙인 신뢰보호의 원칙과 비례의 '
-                                                          '원칙이 실제 행정 처분에서 어떻게 적용되는지 판례를 통해 분석하며, 공익과 사익의 조화로운 해결 방안을 모색함. 수업 시간에 실시한 모의 정책 '
-                                                          '토론에서 행정 효율성과 민주적 정당성 사이의 갈등을 조정하는 중재안을 제시하여 높은 평가를 받음. 복잡한 법적 쟁점을 행정학적 관점에서 '
-                                                          '명쾌하게 정리하고, 정책 대안을 제시하는 과정에서 논리적 완결성과 사회적 책임감을 동시에 보여줌.'},
-                                                   {'학년': '2',
-                                                    '영역': '사회·문화',
-                                                    '내용': '사회적 불평등 구조를 분석하는 과정에서 행정학적 관점을 도입하여, 공공 정책이 계층 간 격차 완화에 미치는 영향력을 탐구함. 특히 조세 제도의 '
-                                                          '누진성이 소득 재분배에 기여하는 메커니즘을 학습한 후, 이를 실제 우리나라의 사회보장제도와 연계하여 분석함. 공공 서비스의 효율성과 형평성 '
-                                                          '사이의 딜레마를 해결하기 위해 정책 설계 단계에서 고려해야 할 행정적 가치를 논리적으로 도출함. 또한, 사회적 갈등을 조정하는 행정 기구의 '
-                                                          '역할에 주목하여, 갈등 관리 시스템의 제도적 보완점을 제안함. 정책의 수립부터 집행, 평가에 이르는 전 과정을 시스템 이론으로 해석하며, '
-                                                          '행정의 민주성과 전문성을 동시에 확보하기 위한 거버넌스 모델의 필요성을 강조함. 연구 과정에서 통계 자료를 활용해 정책의 실효성을 검증하는 등 '
-                                                          '데이터 기반의 행정적 사고력을 보여줌.'},
-                                                   {'학년': '2',
-                                                    '영역': '정치와 법',
-                                                    '내용': '행정권의 비대화 현상과 이에 따른 행정 통제의 필요성을 주제로 심도 있는 탐구를 수행함. 현대 행정 국가에서 정책 결정의 전문성이 강조됨에 '
-                                                          '따라 발생하는 민주적 정당성 결여 문제를 해결하기 위해, 행정 절차법의 역할과 시민 참여형 행정 모델을 비교 분석함. 특히 지방자치단체의 조례 '
-                                                          '제정권과 중앙정부의 감독권 사이의 갈등 사례를 조사하고, 지방분권화 시대에 걸맞은 협력적 행정 체계의 구축 방안을 제시함. 정책 집행 과정에서 '
-                                                          '발생하는 관료제의 병리 현상을 극복하기 위한 대안으로 투명한 정보 공개와 행정 책임성 강화 방안을 논리적으로 서술함. 수업 중 진행된 모의 '
-                                                          '정책 토론에서 공공기관의 민간 위탁 사업에 대한 찬반 논리를 행정 효율성과 공공성이라는 두 축으로 나누어 분석하며, 정책의 사회적 파급 효과를 '
-                                                          '다각도로 고찰하는 균형 잡힌 시각을 드러냄.'},
-                                                   {'학년': '2',
-                                                    '영역': '수학 I',
-                                                    '내용': '수학적 모델링을 활용하여 행정 현상을 계량적으로 분석하는 능력이 탁월함. 수열의 개념을 활용하여 공공 예산의 장기적 추계 모델을 설계하고, '
-                                                          '복리 계산 원리를 적용하여 연금 제도의 지속 가능성을 평가하는 탐구를 진행함. 또한, 삼각함수의 주기성을 학습한 후 이를 공공 서비스 수요의 '
-                                                          '계절적 변동성을 예측하는 모델에 적용함. 지오지브라를 활용하여 특정 지역의 민원 발생 빈도를 시계열 데이터로 시각화하고, 이를 함수로 근사하여 '
-                                                          '향후 행정 수요를 예측하는 알고리즘을 구상함. 데이터 기반 행정의 중요성을 인식하고, 통계적 유의성을 확보하기 위한 표본 추출 방법과 오차 '
-                                                          '분석의 중요성을 행정학적 관점에서 재해석함. 복잡한 사회 현상을 수치화하여 정책적 의사결정의 근거를 마련하려는 시도는 행정학도로서의 분석적 '
-                                                          '역량을 잘 보여줌.'},
-                                                   {'학년': '2',
-                                                    '영역': '정치와 법',
-                                                    '내용': '행정학적 관점에서 정책 결정 과정을 심도 있게 탐구하며, 정책의 수립부터 집행, 평가에 이르는 전 과정을 이론적으로 분석함. 특히 '
-                                                          '지방자치제도의 운영 원리를 학습하며 중앙정부와 지방정부 간의 권한 배분 문제와 재정 자립도 격차에 따른 행정 서비스의 질적 차이를 실증적으로 '
-                                                          '고찰함. 정책 결정 과정에서 나타나는 이해관계자 간의 갈등 조정 기제를 분석하고, 공익 실현을 위한 행정의 중립성과 전문성의 조화를 주제로 '
-                                                          '에세이를 작성하여 행정학적 통찰력을 드러냄.'},
-                                                   {'학년': '2',
-                                                    '영역': '사회·문화',
-                                                    '내용': '사회적 불평등과 복지 정책의 상관관계를 행정학적 시각에서 분석함. 롤스의 정의론을 현대 복지 국가의 공공 부조 제도와 연계하여 분배적 정의가 '
-                                                          '실현되는 행정적 메커니즘을 탐구함. 디지털 전환 시대의 정보 격차가 사회적 불평등으로 이어지는 현상을 조사하고, 이를 해소하기 위한 공공 '
-                                                          '서비스 접근성 강화 정책을 제안함. 통계 자료를 활용하여 정책의 실효성을 검증하는 과정을 통해 데이터 기반 행정의 중요성을 논리적으로 '
-                                                          '설득함.'},
-                                                   {'학년': '2',
-                                                    '영역': '경제',
-                                                    '내용': '공공재의 특성과 시장 실패를 보완하기 위한 정부의 개입 필요성을 경제학적 원리로 분석함. 외부효과를 해결하기 위한 조세 및 보조금 정책의 '
-                                                          '효율성을 행정학적 관점에서 평가하고, 공공 서비스의 민영화와 공공성 강화라는 두 가치 사이의 최적점을 찾는 탐구를 수행함. 공공 부문의 예산 '
-                                                          '편성 과정에서 발생하는 효율성과 형평성의 상충 관계를 이해하고, 예산 집행의 투명성을 확보하기 위한 제도적 장치로서의 감사 시스템의 역할을 '
-                                                          '심도 있게 고찰함.'},
-                                                   {'학년': '2',
-                                                    '영역': '사회적 책임과 행정 윤리',
-                                                    '내용': '언어와 매체 수업에서 공공 정책의 수립 과정에 담긴 언어적 설득 기제와 행정 정보 전달의 투명성을 탐구함. 특히 정부가 정책을 발표할 때 '
-                                                          '사용하는 용어가 시민의 이해도와 정책 수용성에 미치는 영향을 분석하며, 행정가로서 갖추어야 할 소통의 윤리와 사회적 책무를 논리적으로 서술함. '
-                                                          '교과 지식을 단순히 습득하는 데 그치지 않고, 행정학적 관점에서 공공 정보의 신뢰성 확보 방안을 제시하며 진로와 교과 학습을 유기적으로 '
-                                                          '연결하는 탁월한 역량을 보임.'},
-                                                   {'학년': '2',
-                                                    '영역': '정책 분석과 통계적 모델링',
-                                                    '내용': '수학 I 수업에서 사회 현상의 변화를 예측하기 위한 수열과 함수의 활용 방안을 탐구함. 단순한 수치 계산을 넘어, 공공 예산의 연차별 증감 '
-                                                          '추이를 등비수열 모델로 구조화하고, 정책 집행 후의 기대 효과를 미분방정식을 활용한 변화율 모델로 확장하여 분석함. 특히 공공 서비스의 수요 '
-                                                          '예측 모델을 설계하는 과정에서 변수 간의 상관관계를 수식으로 정교화하였으며, 데이터 기반 행정의 중요성을 수학적 논리로 뒷받침하여 정책 결정의 '
-                                                          '객관성을 확보하려는 노력이 돋보임.'},
-                                                   {'학년': '2',
-                                                    '영역': '공공 행정 시스템의 기하학적 최적화',
-                                                    '내용': '기하 수업에서 공간적 효율성을 극대화하는 행정 구역 설계 및 공공 시설 배치 원리를 탐구함. 지오지브라를 활용하여 평면의 기울기에 따른 교선의 '
-                                                          '변화를 분석하고, 이를 행정 서비스의 도달 범위와 최적 입지 선정 문제에 대입함. 특히 당들랭 구의 개념을 응용하여 공공 시설의 영향권이 '
-                                                          '겹치는 영역을 기하학적으로 증명하고, 이를 통해 행정 서비스의 사각지대를 최소화하는 공간 배치 모델을 제안함. 교과서의 수학적 원리를 현실의 '
-                                                          '행정 문제 해결을 위한 도구로 재해석하는 융합적 사고력이 매우 뛰어나며, 공간 데이터 분석을 통한 정책적 의사결정의 논리적 근거를 마련하는 '
-                                                          '과정에서 깊이 있는 탐구 역량을 발휘함.'},
-                                                   {'학년': '2',
-                                                    '영역': '심화 영어 I',
-                                                    '내용': '영어 구사력이 매우 탁월하며, 복잡한 사회과학적 지문을 분석하고 핵심 논지를 파악하는 능력이 최상위권임. 성실한 학습 태도를 바탕으로 행정학적 '
-                                                          "관심사를 영어권 학술 자료로 확장하려는 열정이 돋보임. '공공 정책의 효율성과 민주적 정당성'에 관한 지문을 발표하며, 단순히 내용을 요약하는 "
-                                                          '데 그치지 않고 행정학적 맥락에서 정책 결정의 절차적 정당성을 상세히 설명하여 급우들의 높은 평가를 받음. 글쓰기 활동에서는 뛰어난 논리적 '
-                                                          "사고력을 발휘하여 사회 구조적 문제에 대한 비판적 시각을 드러냄. 특히 '빈곤이 환경 오염의 근본적 원인이 되는 메커니즘'을 다룬 에세이에서, "
-                                                          "개인의 윤리적 책임보다 공공 행정의 분배 정책과 사회 안전망의 미비함을 지적하며 'The poverty is the pivotal cause "
-                                                          "of pollution'이라는 주제문을 통해 설득력 있는 대안을 제시함. 또한, 공공 보건 행정의 일환으로 건강기능식품 관련 법규와 성분 규제 "
-                                                          '체계를 탐구하며, 코디세핀과 사포닌 등 주요 성분의 효능을 행정적 관리 측면에서 분석한 보고서를 정확한 영어 표현으로 작성하여 제출함.'},
-                                                   {'학년': '2',
-                                                    '영역': '사회문제 탐구',
-                                                    '내용': "공공 행정의 사각지대에 놓인 취약 계층의 권리 구제 방안을 모색하기 위해 '의료 소송 피해자의 행정적 구제 경험'에 관한 질적 사례 연구를 "
-                                                          '수행함. 피해자들이 소송 과정에서 겪는 정보 비대칭성과 행정적 절차의 복잡성을 심층 면담으로 분석하고, 이를 해결하기 위한 공적 지원 체계의 '
-                                                          '필요성을 역설함. 생계형 건강보험 체납자 문제를 갈등론적 관점에서 분석하며, 보험료 연체로 인한 의료 소외 현상이 단순한 개인의 경제적 문제가 '
-                                                          '아닌 공공 부조 시스템의 구조적 결함임을 논증함. 특히 코로나19 팬데믹 당시 급증한 의료 폐기물 처리 문제를 행정적 관점에서 접근하여, '
-                                                          "'의료 폐기물 처리 시스템의 지역적 불균형과 처리 용량의 한계'를 지적하는 연구 계획서를 작성함. 문헌 연구법을 통해 폐기물 발생량의 통시적 "
-                                                          '변화와 현행 처리 제도, 처리장의 지리적 분포를 데이터화하여 장거리 이동이 빈번한 취약 지역을 도출함. 또한, 공공 부문 비정규직 노동자의 '
-                                                          '처우 개선을 위한 설문 조사를 실시하고, 이를 바탕으로 공공 행정의 형평성 제고를 위한 정책적 제언을 학급에서 발표함.'},
-                                                   {'학년': '2',
-                                                    '영역': '고전과 윤리',
-                                                    '내용': "롤스의 정의론을 학습하며 '이론적 정의가 실제 공공 정책에 어떻게 적용되는가'라는 문제의식을 바탕으로 행정학적 적용 가능성을 탐구함. 의료 "
-                                                          '서비스의 분배 문제를 중심으로, 의사의 자율권과 환자의 공정한 치료받을 권리 사이의 갈등을 행정적 관점에서 재해석함. 노먼 대니얼스의 의료 '
-                                                          '정의론이 롤스의 정의론을 기반으로 공공 의료 체계의 공정성을 어떻게 확보하려 했는지 분석하며, 이론이 실제 행정 현장과 밀접하게 연관되어 '
-                                                          '있음을 깨달음. 이를 통해 의료 서비스의 분배 문제뿐만 아니라, 의료 체계 전반의 구조적 문제점을 해결하기 위해서는 행정적 의사결정 과정에서의 '
-                                                          '정의로운 원칙 수립이 필수적임을 인식함. 장차 행정 전문가로서 현장의 경험을 바탕으로 공공 의료 시스템의 불합리한 관행을 개선하고, 정책 결정 '
-                                                          '과정에서 소외된 계층의 목소리를 대변할 수 있는 정책 입안자가 되겠다는 포부를 밝힘. 공정한 의료 체계 구축을 위한 행정적 분배 원칙을 '
-                                                          '고민하며, 사회적 합의를 도출하는 행정가의 역할에 대해 깊이 있는 성찰을 보여줌.'},
-                                                   {'학년': '3',
-                                                    '영역': '독서',
-                                                    '내용': "행정학적 관점에서 사회적 난제를 해결하려는 의지가 강하며, 정책 관련 문헌을 비판적으로 독해하는 능력이 탁월함. '정의란 무엇인가'와 "
-                                                          "'넛지'를 읽고 공공 정책이 개인의 선택에 미치는 영향력을 분석함. 특히 공공 서비스의 효율적 전달 체계에 관심을 두고, 지역사회 내 공공 "
-                                                          '도서관 이용률 저조 문제를 해결하기 위한 정책적 대안을 탐구함. 설문조사를 통해 이용자의 접근성 제약 요인을 분석(응답자 88%가 위치 및 '
-                                                          '정보 부족 지적)하고, 행동경제학적 기법을 활용한 공공 정보 제공 방식 개선안을 도출함. 탐구 과정에서 행정학 관련 학술 논문과 정부 보고서를 '
-                                                          '체계적으로 정리하여 학급에 공유하였으며, 정책 수립 시 데이터 기반의 의사결정이 왜 필수적인지 논리적으로 설득하는 역량을 보여줌.'},
-                                                   {'학년': '3',
-                                                    '영역': '고급 수학 I',
-                                                    '내용': '행정 데이터 분석의 기초가 되는 통계적 사고와 행렬 연산의 논리적 구조를 깊이 있게 이해함. 벡터 공간의 대수적 성질을 학습하며, 다변수 정책 '
-                                                          '변수 간의 상관관계를 행렬식으로 표현하고 이를 통해 정책의 우선순위를 결정하는 모델링 과정을 탐구함. 파이썬의 넘파이 라이브러리를 활용하여 '
-                                                          '대규모 공공 데이터를 처리하는 알고리즘을 구현하고, 행렬 연산을 통해 정책 효과를 시뮬레이션하는 과정을 수행함. 특히 행렬의 일차독립 개념을 '
-                                                          '활용하여 정책 변수 간의 중복성을 제거하고 효율적인 예산 배분 모델을 설계하는 등 수학적 도구를 행정학적 문제 해결에 적용하려는 시도가 '
-                                                          '돋보임. 복소수의 극형식과 그래프 이론을 통해 복잡한 사회 네트워크 내에서의 정보 확산 경로를 시각화하는 등 수학적 추론 능력을 사회과학적 '
-                                                          '분석으로 확장함.'},
-                                                   {'학년': '3',
-                                                    '영역': '물리학 II',
-                                                    '내용': '복잡한 물리적 현상을 체계적으로 분석하는 역량을 바탕으로, 행정 시스템의 구조적 안정성과 효율성을 탐구하는 데 적용함. 2차원 포물선 운동 '
-                                                          '분석을 통해 정책 집행 과정에서 발생하는 변수들의 상호작용을 모델링하고, 시스템의 최적 경로를 찾는 논리적 사고를 보여줌. 파동의 회절 단원을 '
-                                                          "학습한 후, '공공 정책의 파급 효과와 사회적 확산 모델'을 주제로 탐구 활동을 수행함. 물리적 회절 현상을 사회적 정보 확산에 비유하여, "
-                                                          '정책이 사회 전반에 미치는 영향력을 분석하고 정책 수용성을 높이기 위한 행정적 개입 방안을 제안함. 또한, 현대 물리학의 무한 개념과 시스템 '
-                                                          '이론을 접목하여, 지속 가능한 행정 체계 구축을 위한 장기적 관점의 정책 설계 필요성을 논하는 글을 작성함. 학문 간 경계를 넘나드는 융합적 '
-                                                          '사고를 통해 행정학적 통찰을 넓히는 모습이 매우 인상적임.'},
-                                                   {'학년': '3',
-                                                    '영역': '사회문제탐구',
-                                                    '내용': "공공 정책의 실효성을 분석하는 수행평가에서 '지방자치단체 간 재정 자립도 격차에 따른 공공 서비스 불균형 해소 방안'을 주제로 심층 보고서를 "
-                                                          '작성함. 지방교부세 제도의 배분 방식을 행정학적 관점에서 비판적으로 검토하고, 단순한 재정 지원을 넘어 지역별 특화 산업 육성을 연계한 정책적 '
-                                                          '대안을 제시함. 특히 중앙정부의 하향식 의사결정 구조가 지방의 자율성을 저해하는 현상을 지적하며, 주민 참여 예산제와 연계한 상향식 정책 '
-                                                          '수립의 필요성을 논리적으로 전개함. 교과 수업 중 공공 선택 이론을 학습하며 관료제의 비효율성을 극복하기 위한 신공공관리론(NPM)의 적용 '
-                                                          '가능성을 탐구하고, 이를 실제 지자체 사례에 대입하여 정책 집행의 투명성 확보 방안을 구체화함.'},
-                                                   {'학년': '3',
-                                                    '영역': '심화영어독해',
-                                                    '내용': "행정학적 지적 호기심을 바탕으로 영문 정책 보고서와 해외 공공 행정 사례를 분석하는 능력이 탁월함. '디지털 정부 전환을 위한 거버넌스 "
-                                                          "모델'에 관한 영문 논문을 읽고, 전자정부 구축 과정에서 발생하는 개인정보 보호와 행정 효율성 간의 갈등을 해결하기 위한 국제적 표준 "
-                                                          '가이드라인을 정리함. 특히 영미권 국가의 오픈 데이터 정책이 시민의 알 권리와 행정의 투명성에 미치는 영향을 분석하며, 한국의 공공 데이터 '
-                                                          '포털 운영 방식과 비교하는 에세이를 작성함. 복잡한 행정 용어를 정확하게 해석하고 이를 자신의 언어로 재구성하여 발표하는 과정에서, 정책적 '
-                                                          '의사결정의 근거가 되는 데이터의 중요성을 강조함. 수업 중 토론에서 행정의 공공성과 민간 위탁의 효율성 사이의 균형점을 찾기 위한 논리적 '
-                                                          '근거를 영어로 제시하며 비판적 사고력을 입증함.'},
-                                                   {'학년': '2',
-                                                    '영역': '탐구의 지속성과 일관성',
-                                                    '내용': '행정학 & 통계학: 1학년 진로활동에서 시작된 공공 정책에 대한 관심을 2학년 확률과 통계(공공 데이터 분석)로 연결한 점이 매우 훌륭함. '
-                                                          '상관계수, 회귀분석, 표본 오차 등의 통계적 개념을 실제 지역사회 민원 데이터 분석에 적용하며, 행정 서비스의 수요 예측과 자원 배분의 '
-                                                          '최적화라는 행정학적 난제를 수학적으로 해결하려는 시도를 통해 전공에 대한 지속적이고 심화된 관심을 입증함.'},
-                                                   {'학년': '2',
-                                                    '영역': '인문학적 소양과 사회적 통찰',
-                                                    '내용': '공공정책 탐구 및 사회정의론: 지방자치단체의 예산 집행 효율성, 공공 서비스의 사각지대, 행정 규제 완화 등 현실적인 정책 이슈를 갈등론과 '
-                                                          "롤스의 정의론 및 노먼 대니얼스의 분배적 정의 원칙으로 분석함. 특히 '행정 정의'를 공공기관의 자율성과 시민의 권리 보장 문제로 확장하며, "
-                                                          '정책 입안자로서의 가치관을 구체화함.'},
-                                                   {'학년': '2',
-                                                    '영역': '교과 간 융합 및 도구 활용',
-                                                    '내용': '확률과 통계 및 정보과학: 행정 데이터 분석을 위해 통계적 지식(회귀분석)을 파이썬(Pandas, Matplotlib)으로 구현하고, 이를 '
-                                                          '공공 데이터 포털의 지역별 인구 이동 및 예산 집행률 데이터 처리라는 행정 실무에 연결함. 또한 공공 데이터 API를 활용한 정책 효과성 '
-                                                          '시각화 프로그래밍은 전공 적합성을 보여주는 최상위 수준의 활동임.'},
-                                                   {'학년': '2',
-                                                    '영역': '학술적 전문성 (Hard Core)',
-                                                    '내용': '정치와 법 및 경제: 공공 선택 이론(Public Choice Theory)과 정보 비대칭성 등 최신 행정학 기전을 정책 결정 과정에서 '
-                                                          '설명하고, 게임 이론의 죄수의 딜레마를 통해 중앙정부와 지방정부 간의 정책 협력 구조를 논리적으로 해석함. 이러한 행정학 전문 용어의 정확한 '
-                                                          '사용과 정책 분석 역량은 입학사정관에게 학업적 신뢰를 줌.'},
-                                                   {'학년': '2',
-                                                    '영역': '보완점 제언',
-                                                    '내용': '독서 및 사회문제 탐구 활동을 수행함에 있어, 다양한 정책적 이슈를 병렬적으로 나열하는 방식에서 벗어나 각 문장 간의 인과관계를 명확히 '
-                                                          '설정하는 논리적 구조화가 필요함. 특히 사회문제 탐구 보고서에서 다룬 비정규직 차별 문제는 앞서 심도 있게 분석한 공공 의료 서비스의 공공성 '
-                                                          '강화 및 디지털 행정 혁신이라는 주제들에 비해 탐구의 구체성과 정책적 대안의 실효성이 다소 부족함. 따라서 분산된 주제를 나열하기보다는, 앞선 '
-                                                          '탐구에서 도출한 행정적 효율성과 사회적 형평성이라는 핵심 논거를 비정규직 문제에 적용하여 논리적 일관성을 강화하는 방향으로 전략을 수정할 것을 '
-                                                          '권장함.'}],
-                                    'comments': [{'구분': '기타 합격 대학', '내용': '연세대학교 행정학과, 고려대학교 행정학과, 성균관대학교 글로벌리더학부'},
-                                                 {'구분': '고등학교', '내용': '자사고 내신 1.1 ~ 1.3'},
-                                                 {'구분': '총평',
-                                                  '내용': '자사고의 치열한 학업 환경 속에서도 1점대 초반의 최상위권 내신을 유지한 점이 매우 인상적이다. 단순히 교과 성적에 그치지 않고, 1학년 때부터 '
-                                                        '행정학적 관점에서 사회 문제를 분석하고 정책적 대안을 제시하는 등 학술적 깊이가 남다르다. 행정학과를 향한 진로 탐색 과정이 3년간 유기적으로 '
-                                                        '연결되어 있어, 입학사정관에게 전공 적합성과 학업 역량을 동시에 증명하는 우수한 사례이다.'},
-                                                 {'구분': '장애측정기준 관련',
-                                                  '내용': "장애인 이동권 보장과 같은 사회적 약자를 위한 정책적 접근은 행정학과 지망생에게 매우 적절하고 훌륭한 소재이다. 다만 '장애이해교육' 활동 내용을 "
-                                                        '단순히 나열하기보다는, 학생이 실제 학급 자치회나 정책 토론 과정에서 장애인 편의시설 확충을 위해 어떤 구체적인 제도 개선안을 고민했는지 그 '
-                                                        '주도적인 참여 과정을 스토리텔링 형식으로 풀어내는 것이 훨씬 효과적이다.'},
-                                                 {'구분': '의료기기 및 강제입원 토론',
-                                                  '내용': '1. 행정학과 지망생들 중 이따금씩 공공성만을 지나치게 강조하며 효율성이나 시장의 논리를 배제하는 경우가 있는데, 정책 전문가를 꿈꾼다면 이러한 '
-                                                        '편향된 시각은 지양해야 한다. 최근 행정학계에서 공공 서비스의 효율적 전달과 민관 협력이 강조되는 추세이므로, 다양한 이해관계자와의 갈등 조정 '
-                                                        '능력을 보여주는 것이 중요하다. 2. 정책 토론은 논리적 사고력을 평가하는 핵심 지표이므로 저학년 때부터 지속적인 토론 기회를 갖는 것은 매우 '
-                                                        '긍정적이다. 다만 학생의 주장은 전략적으로 공공 행정의 인재상 내에 위치해야 하므로, 급진적인 주장보다는 법적·제도적 근거를 바탕으로 한 현실적인 '
-                                                        '대안 제시가 필요하다.'},
-                                                 {'구분': 'SIR 모델 관련',
-                                                  '내용': '감염병 대응 체계와 같은 국가 위기 관리 시스템에 대한 소재로 참여했던 활동은 매우 시의적절하다. 다만 SIR 모델과 같은 수학적 모델링을 행정적 '
-                                                        '의사결정 과정에 어떻게 접목할지에 대한 고민이 다소 부족해 보인다. 단순히 모델의 개념을 설명하는 수준을 넘어, 이를 활용해 정책의 효율성을 '
-                                                        '어떻게 검증할 것인지에 대한 심도 있는 탐구가 동반되었다면 훨씬 높은 평가를 받았을 것이다.'},
-                                                 {'구분': '고흡수성 수지 대체재 연구',
-                                                  '내용': "'동기-구체적인 탐구-감상'으로 이어지는 서술 구조가 매우 훌륭하다. 다만 정책적 관점에서의 'A(Agenda)'를 명확히 짚어줄 경우 읽는 "
-                                                        '사람의 입장에서 해당 활동의 사회적 가치에 더 집중할 수 있다. 좋은 주제를 다루고 있는 만큼, "공공 환경 정책의 일환으로서의 친환경 소재 도입 '
-                                                        '타당성 연구"와 같이 정책적 함의를 담은 주제로 명시적으로 정리하는 것을 추천한다.'},
-                                                 {'구분': '정신장애 및 대체의학 토론',
-                                                  '내용': '비격식적인 표현으로 이루어진 칭찬은 생기부 전체의 인상을 바꿀 정도로 긍정적인 영향을 준다. 따라서 평소 수업 시간에 적극적으로 참여하고 '
-                                                        '선생님들과 깊이 있는 학술적 교류를 쌓는 것은 수시 합격을 위한 선결조건이라 할 수 있다. 학생의 스마트한 태도가 교과 세특에 잘 녹아들어 있어 '
-                                                        '매우 고무적이다.'},
-                                                 {'구분': '법의학 관련',
-                                                  '내용': "법의학이나 생명윤리 관련 독서 활동은 행정학적 관점에서도 보건 정책의 윤리적 토대를 마련하는 데 훌륭한 소재이다. 다만 '삶과 죽음에 대한 "
-                                                        "성찰'과 같은 추상적인 표현보다는, '연명의료결정법'과 같은 실제 행정적·법적 제도에 초점을 맞춰, 정책이 개인의 권리와 공공의 이익 사이에서 "
-                                                        '어떻게 균형을 잡아야 하는지에 대한 성찰을 기술하는 것이 좋다.'},
-                                                 {'구분': '인재상 및 페르소나',
-                                                  '내용': "'사회에 공감하는 지성인', '공공의 가치를 실현하는 인재' 등 대학마다 내거는 인재상이 있지만, 결국 수시는 선발자의 주관이 개입되는 과정이다. "
-                                                        "거창한 수식어를 걷어내면 '논리적 사고력을 갖춘 사회 문제 해결사'라는 명확한 페르소나가 도출된다. 학업 능력에만 초점을 두어 정책적 통찰력과 "
-                                                        '같은 품성적 역량을 놓치는 우를 범하지 않길 바란다.'},
-                                                 {'구분': '소장암 탐구활동',
-                                                  '내용': '의학적 호기심에서 출발하여 보건 정책적 치료 옵션, 면역항암제 활용, 팀원들과의 협업, 발표회에 이르기까지 일련의 연속성 있는 탐구활동을 기술한 '
-                                                        '점이 매우 훌륭하다. 행정학 분야의 탐구활동을 기술함에 있어서 전문성 있는 내용을 작성하는 것도 중요하지만, 이렇게 탐구 과정이 논리적 연결성을 '
-                                                        '가지고 이어지는 것이 핵심이다. 물론 그 연결 과정이 행정학적 타당성을 갖고 있어야 한다.'},
-                                                 {'구분': '생물약동학 실험 설계',
-                                                  '내용': "'약물 흡수 과정'에 대한 흥미가 실제 실험 설계로 이어진 점은 좋으나, 행정학적 관점에서는 '보건 정책의 효율성'과 '약제비 관리'라는 측면으로 "
-                                                        '연결했어야 한다. 메디컬 분야의 탐구활동을 기술할 때 흔히 하는 실수가 활동 사이의 연결과정에서 행정적 논리성을 갖지 못하는 경우이다. 단순 실험 '
-                                                        '설계보다는 해당 실험 결과가 보건 행정 정책에 어떤 시사점을 주는지 연결하는 노력이 필요하다.'},
-                                                 {'구분': '수학 심화탐구의 위계',
-                                                  '내용': "수학 심화탐구에는 두 가지 위계가 존재한다. 첫째는 학습내용을 실생활에 '대응'시키는 것이고, 둘째는 학습내용을 '비틀거나' 확장하는 것이다. "
-                                                        '행정학과 지망생이라면 통계학적 기법을 활용해 정책 효과를 분석하는 등 두 번째 위계의 탐구를 보여주어야 한다. 첫 번째 위계만으로 세특이 채워지면 '
-                                                        '심화학습이 부족하다는 인상을 줄 수 있으니 주의해야 한다.'},
-                                                 {'구분': '영어 세특의 전략적 우위',
-                                                  '내용': "최상위권 학생일수록 세특 서두에 학생의 페르소나를 담은 문장으로 시작하는 경우가 많다. 특히 행정학과 지망생에게 중요한 '글로벌 정책 사례 분석 "
-                                                        "능력'이나 '영문 정책 보고서 독해력'을 강조하는 문장은 매우 눈에 띄는 긍정적인 표현이다. 평소 수업에 충실하여 이러한 평가를 이끌어낸 것은 "
-                                                        '매우 전략적인 선택이다.'},
-                                                 {'구분': '통합과학 및 과학탐구실험 관련',
-                                                  '내용': '세포 소기관의 물질 이동에 대한 생물학적 지식을 논리적으로 기술하고 있다. 중요한 키워드를 잘 짚어 서술하고 있지만, 학생이 직접 관심을 가지고 '
-                                                        '어떤 정책적 문제의식을 바탕으로 탐구활동을 했는지에 초점을 맞춰 기술하면 더 효과적이다. 예를 들어, 환경 호르몬이 생태계에 미치는 영향과 이를 '
-                                                        '규제하는 환경 정책의 상관관계를 탐구하는 방식이 좋다.'},
-                                                 {'구분': '철학 관련',
-                                                  '내용': '철학은 행정학의 근간인 정의론과 윤리적 판단을 이끌어내기에 무척 훌륭한 소재이다. 롤스의 정의론을 현대 복지 정책과 접목하거나, 의료 윤리적 '
-                                                        '상황에서 철학적 근거를 바탕으로 정책적 판단을 내리는 과정은 매우 중요하다. 자신의 생기부에서 부족하다고 생각되는 측면을 적재적소에 배치하여 균형 '
-                                                        '잡힌 인문학적 소양을 보여주길 바란다.'},
-                                                 {'구분': '논술 관련',
-                                                  '내용': "'생명이란 무엇인가'라는 책을 읽고 유전물질의 안전성에 대해 양자역학을 통해 설명하였다는 아이디어는 훌륭하다. 다만 이후 탐구활동을 더 깊이 있는 "
-                                                        '정책적 내용으로 구성해야 한다. 단순히 친구들과 의견을 나누었다는 추상적인 표현보다는, 해당 기술의 발전이 가져올 사회적 파장과 이를 관리하기 '
-                                                        '위한 행정적 규제 방안에 대해 토론했다는 구체적인 서술이 필요하다.'},
-                                                 {'구분': '체육 관련',
-                                                  '내용': "행정학과를 지망하는 학생의 경우 체육 교과 세특에서 관련 진로를 언급할 시 '어색한 억지 연관'으로 보일 가능성이 있다. 그러나 체육은 기본적으로 "
-                                                        '공공 체육 시설 운영이나 국민 건강 증진 정책과 밀접한 관계에 있다. 따라서 체육 교과에서 공공 서비스의 접근성이나 시설 운영의 효율성을 주제로 '
-                                                        '진로적합성을 드러내는 것은 매우 전략적인 접근이다.'},
-                                                 {'구분': '언어와 매체 관련',
-                                                  '내용': '행정학과에 본격적으로 관심을 갖기 시작한 2학년부터 세부능력 특기사항에 인문학적, 사회적인 관점에서 정책 분야에 대한 깊이 있는 관심도를 드러낼 '
-                                                        '수 있다. 단, 억지로 기술하는 것보단 매체의 특성에 대한 해당 교과목의 탐구를 기술한 뒤, 공공 정보 전달 매체의 순기능과 역기능에 대해서도 '
-                                                        '관심을 가지고 탐구해보았다는 자연스러운 인과성이 중요하다.'},
-                                                 {'구분': '수학 1 관련',
-                                                  '내용': '수학 세부능력 특기사항에서도 관심 분야인 행정 정책과 연결된 기술을 이어갈 수 있다. 다만 단순히 수열의 합을 계산하는 것은 다소 간단한 '
-                                                        '주제이므로, 조금 더 확장해서 공공 예산의 누적 집행률이나 정책 효과의 시계열 분석 등 보다 심화된 주제를 선정하고 기술해야 한다. 수학적 '
-                                                        '모델링을 통한 정책 분석 역량은 행정학과에서 매우 높게 평가하는 요소이다.'},
-                                                 {'구분': '한국사 관련',
-                                                  '내용': '한국사 세부능력 특기사항에도 행정 제도 변천사에 대한 관심이 드러나도록 기술하는 것은 매우 좋다. 각각의 내용이 모두 역사적으로 중요한 '
-                                                        '내용이지만, 여러 가지 주제를 단순 나열하는 방식보다 한 가지 관심 있었던 제도(예: 조선시대의 조세 제도와 현대의 조세 정책 비교)를 정한 후 '
-                                                        '주도적인 탐구과정을 담으면 좋다.'},
-                                                 {'구분': '화학 1 및 생명과학 1 관련',
-                                                  '내용': "오피오이드 마약성 진통제에 대한 소재로 화학적 구조와 약리적 반응을 탐구한 점은 좋으나, 행정학과 지망생이라면 이를 '마약류 관리 정책'이나 "
-                                                        "'보건 행정의 규제 체계'와 연결해야 한다. 단순히 지식을 열거하는 식의 기술은 학생 주도적 탐구활동을 실제로 수행했다는 인상을 남기지 못하므로 "
-                                                        '주의해야 한다. 전문성을 갖춘 지식들이 쌓여가는 일련의 정책적 스토리가 담겨 있어야 한다.'},
-                                                 {'구분': '종합 의견',
-                                                  '내용': "이 학생의 2학년 세특은 **'행정학적 전문성'**과 **'인문학적 소양'**이 균형을 이루고 있습니다. 특히 **정책 결정 과정의 논리적 "
-                                                        '분석**이나 **사회적 갈등 조정 기제에 대한 탐구**는 행정학과 교수들이 선호하는 심화 주제입니다.'}]},
- 'case_1_natural_science_mathematics': {'personal_info': {'대상': '서울대학교 수리과학부 합격생',
-                                                          '고등학교_유형': '과학고등학교',
-                                                          '내신_성적': '1.1 ~ 1.3',
-                                                          '주요_특징': '심화 수학 및 이론 물리 탐구 역량이 탁월하며, 복잡한 수리적 모델링을 통해 실생활 문제를 해결하는 능력이 돋보임. 1학년 '
-                                                                   '때부터 수학적 엄밀성을 바탕으로 한 논리적 사고 과정을 생기부에 일관되게 녹여냄.',
-                                                          '총평': '과학고등학교의 치열한 내신 경쟁 속에서도 1.1등급대의 최상위 성적을 유지하며 수학적 재능을 입증했다. 단순한 문제 풀이를 넘어 '
-                                                                '수학적 원리를 증명하고 이를 데이터 분석 및 알고리즘 설계로 확장하는 탐구 과정이 매우 인상적이다. 수리과학부 진학을 위한 학문적 '
-                                                                '깊이와 전공 적합성이 완벽하게 조화를 이루고 있어, 향후 수학 분야의 연구자로서 성장 가능성이 매우 높은 우수한 사례이다.',
-                                                          '기타_합격_대학': 'KAIST 무학과, 포항공과대학교 수학과, 연세대학교 수학과'},
-                                        'activities': [{'학년': '1',
-                                                        '영역': '자율활동',
-                                                        '내용': '학급 내 수학적 사고력 증진을 위한 스터디 그룹을 조직하여 비정형 문제 해결을 위한 토론 문화를 조성함. 자율탐구시간을 활용하여 '
-                                                              "'프랙탈 구조의 자기 유사성과 하우스도르프 차원'을 주제로 탐구함. 멩거 스펀지의 구성 원리를 수학적으로 증명하고, 이를 파이썬 코드로 "
-                                                              "시각화하여 차원 변화에 따른 부피와 표면적의 관계를 수치적으로 분석함. 교육청 주관 학생 수학 탐구 발표회에서 '그래프 이론을 활용한 "
-                                                              "최적 경로 탐색 알고리즘'을 주제로 발표함. 복잡한 네트워크 내에서 노드 간 연결성을 행렬로 표현하고, 다익스트라 알고리즘을 변형하여 "
-                                                              '효율적인 경로를 도출하는 과정을 논리적으로 설명함. 설문 조사 데이터를 통계적으로 처리하여 알고리즘의 실효성을 검증하고, 시각화 도구를 '
-                                                              '활용해 데이터의 분포와 경향성을 명확하게 전달하여 우수한 평가를 받음.'},
-                                                       {'학년': '1',
-                                                        '영역': '동아리활동',
-                                                        '내용': "수리 모델링 동아리에서 '현대 암호 체계의 수학적 원리'를 주제로 RSA 암호의 소인수 분해 난해성과 타원 곡선 암호의 안전성을 비교 "
-                                                              "분석함. '양자 컴퓨터의 등장과 기존 암호 체계의 붕괴 가능성'에 대한 토론에서 사회자를 맡아, 양자 알고리즘인 쇼어 알고리즘의 작동 "
-                                                              '원리를 설명하고 양자 내성 암호의 필요성을 논리적으로 전개함. 다양한 수리적 난제에 대해 찬반 토론을 진행하며 수학적 엄밀성을 바탕으로 '
-                                                              '한 비판적 사고력을 배양함. 특히, 확률론적 관점에서 사회적 현상을 해석하는 프로젝트를 주도하며, 베이즈 정리를 활용한 의사결정 모델의 '
-                                                              '타당성을 검토함. 동아리 부장으로서 복잡한 수식과 이론을 동료들이 이해하기 쉽게 도식화하여 설명하는 등 뛰어난 소통 능력을 '
-                                                              '발휘하였으며, 모든 활동에서 수학적 근거를 최우선으로 하는 학구적인 태도를 견지함.'},
-                                                       {'학년': '1',
-                                                        '영역': '진로활동',
-                                                        '내용': '(희망분야: 수리과학부) 감염병 확산의 수리적 모델링인 SIR 모델을 심화 탐구하여, 미분방정식을 통한 전염병의 확산 속도와 정점 도달 '
-                                                              '시점을 예측하는 연구를 수행함. 기초감염재생산지수(R0)의 변화가 미분방정식의 해에 미치는 영향을 파라미터별로 분석하여 발표함. 진로 '
-                                                              '탐색의 날 수학 분야 강연을 통해 위상수학의 개념을 접하고, 데이터의 형태적 특징을 분석하는 위상적 데이터 분석(TDA)에 깊은 관심을 '
-                                                              '가짐. 머신러닝 알고리즘의 기반이 되는 선형대수학의 고유값과 고유벡터의 의미를 탐구하고, 이를 차원 축소 기법인 PCA에 적용하는 '
-                                                              '과정을 학습함. 정밀 수학 연구의 중요성을 인식하고, 수리과학부 진학을 위해 해석학 및 대수학의 기초 개념을 선행 학습하며, 수학적 '
-                                                              '증명의 엄밀함을 갖추기 위해 관련 전공 서적을 탐독하고 심화 문제를 해결하는 등 학문적 깊이를 더함.'},
-                                                       {'학년': '2',
-                                                        '영역': '자율활동',
-                                                        '내용': "위상수학적 관점에서 공간의 효율적 배치를 탐구하고자 '비정형 공간에서의 최적 경로 탐색 알고리즘'을 주제로 연구함. 그래프 이론의 "
-                                                              '다익스트라 알고리즘을 변형하여, 장애물과 이동 비용이 가변적인 환경에서 최단 경로를 도출하는 모델을 파이썬으로 구현함. 특히 노드 간의 '
-                                                              '연결성을 행렬로 표현하고, 인접 행렬의 고유값 분석을 통해 네트워크의 중심성과 병목 현상을 수학적으로 규명함. 또한, 고흡수성 수지의 '
-                                                              '환경 오염 문제를 해결하기 위해 고분자 사슬의 가교 결합 밀도와 흡수율 간의 상관관계를 미분방정식으로 모델링함. 알긴산 나트륨과 젖산 '
-                                                              '칼슘의 배합 비율에 따른 겔화 과정을 반응 속도론적 관점에서 해석하고, 최적의 탄성 계수를 갖는 친환경 소재의 구조를 설계함. 실험 '
-                                                              '데이터를 회귀 분석하여 가설을 검증하고, 수학적 모델링이 실제 물리적 현상을 얼마나 정밀하게 예측할 수 있는지 확인하며 이론과 실증의 '
-                                                              '간극을 좁히는 탐구 역량을 발휘함.'},
-                                                       {'학년': '2',
-                                                        '영역': '동아리활동',
-                                                        '내용': "수리 논리 및 알고리즘 동아리에서 '현대 암호학의 수학적 기반과 보안성'을 주제로 심화 탐구함. RSA 암호의 소인수 분해 난해성을 "
-                                                              "군론(Group Theory)의 관점에서 분석하고, 이산 로그 문제의 복잡도가 암호 체계의 안전성에 미치는 영향을 발표함. '양자 "
-                                                              "컴퓨팅 시대의 Shor 알고리즘과 기존 암호 체계의 붕괴'라는 주제로 찬반 토론을 주도하며, 양자 알고리즘이 소인수 분해 시간을 다항 "
-                                                              '시간 내로 단축하는 원리를 선형대수학적 연산으로 설명함. 또한, 다중인격 범죄자의 책임 소재를 다루는 토론에서는 법적 판단의 모호성을 '
-                                                              '수학적 확률 모델로 접근하여, 범죄 발생 가능성에 대한 베이지안 추론의 한계와 법적 의사결정에서의 불확실성 처리 방안을 논리적으로 '
-                                                              '제시함. 복잡한 사회적 이슈를 수리적 모델링으로 치환하여 분석하는 능력이 탁월하며, 동료들과의 토론에서 논리적 비약이 없는 엄밀한 '
-                                                              '근거를 제시하여 학술적 깊이를 더함.'},
-                                                       {'학년': '2',
-                                                        '영역': '진로활동',
-                                                        '내용': "(희망분야: 수리과학부) '뇌-기계 인터페이스(BMI)의 신호 처리와 수학적 모델링' 강연을 통해 신경망의 전기적 신호를 푸리에 "
-                                                              '변환으로 주파수 성분으로 분해하고, 이를 다시 제어 신호로 변환하는 알고리즘의 원리를 탐구함. 특히 비침습적 자극에서 발생하는 노이즈를 '
-                                                              "제거하기 위한 칼만 필터(Kalman Filter)의 적용 가능성을 조사함. '동형암호와 데이터 프라이버시' 강연에서는 준동형 "
-                                                              '사상(Homomorphism)을 이용한 암호화 연산이 어떻게 개인정보를 보호하면서도 통계적 분석을 가능하게 하는지 수학적 구조를 '
-                                                              '파악함. 또한, CRISPR/Cas9 유전자 가위의 표적 이탈(Off-target) 효과를 확률론적으로 예측하는 모델을 조사하며, '
-                                                              "생명공학의 난제를 수학적 최적화 문제로 재정의함. 진로 탐색의 일환으로 '수리물리학과 현대 과학의 융합' 세미나에 참여하여, 복잡계 "
-                                                              '이론이 생태계와 경제 시스템에 적용되는 방식을 학습하고, 미분기하학적 도구가 일반 상대성 이론과 현대 물리학의 근간을 어떻게 형성하는지 '
-                                                              '심도 있게 고찰하며 수리과학자로서의 학문적 정체성을 확립함.'},
-                                                       {'학년': '1',
-                                                        '영역': '과학탐구실험',
-                                                        '내용': '수학적 엄밀성을 바탕으로 물리 현상을 해석하는 능력이 탁월함. 자유 낙하 및 포물선 운동 실험에서 단순 관찰에 그치지 않고, 운동 '
-                                                              '방정식을 미분방정식으로 유도하여 이론값과 실험 데이터 간의 오차를 최소제곱법으로 분석함. 뉴턴의 프리즘 실험을 재현하는 과정에서 빛의 '
-                                                              '분산 현상을 파동 방정식의 관점에서 해석하고, 굴절률과 파장의 관계를 수식으로 정립하여 유리컵의 굴절 효과를 기하광학적으로 증명함. '
-                                                              '실험 후에는 색채 인식의 생물학적 기제와 파장별 에너지 분포를 연계하여, 인간의 시각 시스템이 빛의 스펙트럼을 어떻게 정보화하는지 '
-                                                              '수리적 모델링을 시도함. 태양광 정수기 설계 시에는 에너지 효율을 극대화하기 위해 집광판의 곡률을 최적화하는 알고리즘을 고안하는 등 '
-                                                              '공학적 설계 역량과 수학적 사고력을 동시에 발휘함.'},
-                                                       {'학년': '2',
-                                                        '영역': '철학',
-                                                        '내용': "철학적 담론을 수리적 논리 체계로 치환하여 분석하는 능력이 돋보임. 양명학의 '심즉리' 개념을 현대 뇌과학의 신경망 모델과 연결하여, "
-                                                              '인간의 도덕적 판단 과정을 의사결정 알고리즘의 관점에서 재해석함. 외부 자극에 대한 반응을 입력값으로, 전두엽의 판단 과정을 가중치 '
-                                                              '연산으로 정의하여 도덕적 선택의 최적화 문제를 논리적으로 구조화함. 특히 이지의 철학적 사유를 결정론적 시스템과 확률적 시스템의 '
-                                                              '경계에서 분석하며, 인간의 자유 의지를 신경학적 데이터와 결합해 논증하는 과정에서 학문 간의 경계를 허무는 융합적 통찰력을 보여줌. '
-                                                              '철학적 명제를 형식 논리학의 기호로 변환하여 모순을 검증하는 등 인문학적 주제를 수학적 엄밀성으로 풀어내는 독창적인 탐구 방식을 '
-                                                              '견지함.'},
-                                                       {'학년': '2',
-                                                        '영역': '논술',
-                                                        '내용': "문학적 텍스트와 과학적 이론을 통합적으로 분석하여 논리적 글쓰기를 수행함. '생명이란 무엇인가'를 읽고 유전 정보의 안정성을 양자역학적 "
-                                                              '에너지 준위의 불연속성과 엔트로피의 관점에서 해석하며, 생명 현상을 물리적 법칙으로 환원하려는 시도의 수학적 타당성을 비판적으로 '
-                                                              "검토함. 논술 활동 중 '꿈의 해석'을 주제로 한 토론에서는 반증 가능성 원리를 적용하여, 무의식의 해석이 과학적 방법론의 범주에 "
-                                                              '포함될 수 있는지에 대해 확률적 추론과 논리적 오류를 지적하며 토론을 주도함. 갈등 해소 방안을 제시할 때도 게임 이론의 협력 모델을 '
-                                                              '차용하여, 개인의 이익과 집단의 최적화 사이의 균형점을 수리적으로 도출하려는 노력이 돋보임. 학문 간 융합적 사고를 통해 복잡한 사회 '
-                                                              '현상을 수학적 모델로 추상화하여 해결책을 제시하는 역량이 매우 뛰어남.'},
-                                                       {'학년': '2',
-                                                        '영역': '체육',
-                                                        '내용': '신체 활동을 수리적 최적화의 관점에서 접근하는 태도가 돋보임. 농구와 배드민턴 수행평가 시, 단순한 기술 습득을 넘어 신체의 무게 중심 '
-                                                              '이동과 투사체의 궤적을 벡터로 분석하여 효율적인 동작을 설계함. 태권도 품새 수련 과정에서는 각 동작의 각속도와 관성 모멘트를 고려하여 '
-                                                              '신체 균형을 유지하는 최적의 경로를 탐구하였으며, 이러한 분석적 사고를 바탕으로 기술적 완성도를 빠르게 높이는 등 운동 역학적 원리를 '
-                                                              '실천적으로 증명함.'},
-                                                       {'학년': '2',
-                                                        '영역': '언어와 매체',
-                                                        '내용': "매체 자료의 구조적 분석을 통해 정보의 신뢰성을 검증하는 능력이 탁월함. '데이터 기반 의사결정의 윤리적 쟁점'을 주제로 한 기사문을 "
-                                                              '분석하며, 통계적 수치가 어떻게 선택적으로 인용되어 여론을 형성하는지 비판적으로 고찰함. 특히 알고리즘 추천 시스템이 정보의 편향성을 '
-                                                              '강화하는 메커니즘을 탐구하고, 이를 해결하기 위한 수학적 가중치 조정 방안을 제안하는 보고서를 작성함. 비디오 플랫폼의 정보 전달 '
-                                                              '속도와 데이터 보존 방식을 분석하는 과정에서, 정보의 양적 팽창이 가져오는 노이즈 문제를 해결하기 위한 필터링 알고리즘의 필요성을 '
-                                                              '역설하며, 수리과학적 사고를 인문학적 담론과 결합하는 융합적 역량을 보여줌.'},
-                                                       {'학년': '2',
-                                                        '영역': '수학 1',
-                                                        '내용': '수학적 개념을 실생활 모델링으로 확장하는 역량이 매우 뛰어남. 수열의 점화식을 활용하여 약물 농도의 시간에 따른 변화를 미분방정식의 '
-                                                              '이산적 근사 모델로 재구성하고, 약물 투여 간격에 따른 혈중 농도의 수렴성을 등비급수의 합으로 엄밀하게 증명함. 삼각함수의 주기성을 '
-                                                              '학습한 후에는 이를 심전도 파형 분석과 연결하여 푸리에 급수의 기초 원리를 탐구함. 오일러 공식을 통해 복소지수함수와 삼각함수의 관계를 '
-                                                              '유도하고, 지오지브라를 활용해 다양한 주파수의 합성 파형을 시각화함. 특히 푸리에 변환이 신호 처리 분야에서 데이터의 주파수 성분을 '
-                                                              '추출하는 핵심 알고리즘임을 이해하고, 이를 뇌파 데이터 분석에 적용하는 수학적 모델링 과정을 보고서로 정리하여 수학의 실용적 가치를 '
-                                                              '깊이 있게 탐구함.'},
-                                                       {'학년': '2',
-                                                        '영역': '미적분',
-                                                        '내용': '수업 시간에 급수의 수렴과 발산 판정법에 깊은 흥미를 느끼고, 이를 일반화하여 해석학적 기초를 다지기 위한 심화 탐구 활동을 수행함. '
-                                                              '비교판정법과 적분판정법의 수학적 엄밀성을 확보하기 위해 리만 적분의 정의로부터 정리를 직접 유도하였으며, 특히 '
-                                                              'p-급수(p-series)의 수렴 범위를 결정하는 과정에서 적분판정법을 적용하여 p>1일 때 수렴하고 p≤1일 때 발산함을 해석학적으로 '
-                                                              '증명함. 또한 교대급수판정법의 오차항 추정 원리를 군론적 관점과 연결하여 급수의 수렴 속도를 분석하는 심화 과제를 자발적으로 수행함. '
-                                                              '수업 중 제시된 난도 높은 미분방정식 응용 문제들을 해결하는 과정에서 테일러 급수를 활용한 근사해법을 제시하였으며, 동료 학생들의 풀이 '
-                                                              '과정에서 논리적 비약이나 미분 연산의 오류를 발견하여 이를 수학적 정의에 근거해 교정해 주는 등 학급 내 수학적 담론을 주도함. '
-                                                              '형성평가에서 만점을 기록할 정도로 교과 개념에 대한 이해도가 매우 높으며, 단순한 문제 풀이를 넘어 수학적 원리의 증명과 논리적 체계 '
-                                                              '구축에 탁월한 역량을 발휘함.'},
-                                                       {'학년': '2',
-                                                        '영역': '한국사',
-                                                        '내용': '역사적 사건을 수리적 모델링과 데이터 분석의 관점에서 재해석하는 능력이 탁월함. 6·25 전쟁 당시의 인구 이동과 물자 보급 체계를 '
-                                                              '그래프 이론으로 모델링하여, 전쟁이 사회 시스템의 변화에 미친 영향을 정량적으로 분석함. 단순히 역사적 사실을 나열하는 것을 넘어, '
-                                                              '전쟁이라는 극한 상황이 국가의 보건 의료 인프라와 사회 제도에 미친 영향을 시스템 동역학적 관점에서 고찰함. 16세기 앙브라즈 파레의 '
-                                                              '외과적 처치법 개선을 현대의 알고리즘 최적화 과정과 비교하여, 시행착오를 줄이는 휴리스틱 기법의 역사적 기원을 탐구함. 또한, 영국 '
-                                                              '국민건강보험 도입 사례를 통해 전쟁이 공공 데이터의 수집과 통계적 분석을 가속화했음을 밝혀내고, 이를 현대의 데이터 기반 정책 결정 '
-                                                              '모델과 연결하여 논리적으로 서술함. 신경외과학과 흉부외과학의 급격한 발달 과정을 전쟁 중 발생한 대규모 데이터셋의 처리 과정으로 '
-                                                              '해석하는 등, 역사적 현상을 수학적 사고의 틀 안에서 구조화하여 이해하는 통찰력이 돋보임. 한국의 근현대사를 세계사적 맥락과 연결하여 '
-                                                              '거시적인 흐름을 파악하고, 이를 현대 과학 기술의 발전사와 연계하여 분석하는 융합적 사고력이 매우 뛰어남.'},
-                                                       {'학년': '2',
-                                                        '영역': '물리학 1',
-                                                        '내용': '물리 현상을 수학적 언어로 기술하는 능력이 매우 뛰어나며, 열역학 제2법칙의 엔트로피 증가 원리를 확률론적 관점에서 해석하여 친구들에게 '
-                                                              "설명함. '과학 법칙의 발견과 발명'이라는 철학적 주제를 탐구하면서, 물리 법칙이 자연 현상을 기술하는 수학적 모델링의 결과물임을 "
-                                                              '논리적으로 정립함. 특히 가상현실(VR) 및 증강현실(AR) 기술의 공간 좌표 변환 알고리즘을 조사하며, 비유클리드 기하학적 공간에서의 '
-                                                              '투영 행렬 연산이 깊이감 표현에 미치는 영향을 수학적으로 분석함. 의료 분야의 영상 처리 기술에 적용되는 푸리에 변환의 원리를 심화 '
-                                                              '탐구하여, 노이즈가 포함된 신호에서 유의미한 데이터를 추출하는 필터링 알고리즘의 효율성을 논함. 전자기파의 전리작용 단원에서는 방사선 '
-                                                              '치료 시 암세포의 DNA 손상 확률을 확률 분포 함수로 모델링하여, 치료 효율을 극대화하기 위한 최적의 조사 각도와 강도를 계산하는 '
-                                                              '시뮬레이션을 설계함. 물리적 현상을 단순한 현상학적 이해에 그치지 않고, 이를 미분방정식과 선형대수학적 모델로 치환하여 정량적으로 '
-                                                              '검증하려는 태도가 매우 인상적이며, 공학적 구현 가능성까지 고려하는 폭넓은 시야를 갖춤.'},
-                                                       {'학년': '2',
-                                                        '영역': '화학 1',
-                                                        '내용': '분자 궤도함수 이론과 전자쌍 반발 원리를 심화 탐구하여, 복잡한 유기 화합물의 입체 구조를 기하학적으로 모델링하는 역량을 보임. 특히 '
-                                                              '오피오이드 계열 화합물의 분자 구조를 파이썬의 분자 시각화 라이브러리를 활용해 3차원으로 구현하고, 수용체 결합 부위의 공간적 배치를 '
-                                                              '수학적 좌표계로 분석함. 질소 원자의 비공유 전자쌍이 수용체와의 정전기적 상호작용에 미치는 영향을 벡터 연산으로 해석하여 구조-활성 '
-                                                              '상관관계(QSAR)의 기초를 다짐. 또한 산화-환원 적정 실험에서는 요오드 적정법의 화학량론적 계산 과정을 미분방정식의 오차 분석 '
-                                                              '모델로 확장함. 실험 데이터의 불확실성을 최소제곱법으로 보정하여 비타민 C 함량의 신뢰 구간을 도출하였으며, 측정 오차의 원인을 계통 '
-                                                              '오차와 우연 오차로 구분하여 통계적으로 분석하는 등 수리과학적 탐구 태도를 견지함.'},
-                                                       {'학년': '2',
-                                                        '영역': '생명과학 1',
-                                                        '내용': '생명 현상을 수리적 모델링의 관점에서 해석하는 능력이 탁월함. 수지상세포의 항원 제시 과정을 세포 간 신호 전달 네트워크로 정의하고, '
-                                                              '이를 그래프 이론의 노드와 엣지 모델로 치환하여 면역 반응의 효율성을 분석함. 랠프 스타인먼의 연구를 단순 나열하는 데 그치지 않고, '
-                                                              'MHC 분자와 T 림프구 수용체 간의 결합 확률을 확률론적 모델로 접근하여 면역 반응의 임계치를 수치화함. 특히 사이토카인에 의한 T '
-                                                              '림프구 분화 과정을 동역학 시스템으로 모델링하여, 특정 항원 농도 변화에 따른 면역 반응의 비선형적 응답을 논리적으로 설명함. 면역 '
-                                                              '체계의 복잡성을 정보 이론의 관점에서 재해석하며, 생물학적 데이터의 노이즈를 필터링하고 핵심 신호를 추출하는 알고리즘적 사고를 보여줌. '
-                                                              '실험 설계 시에도 변인 통제와 데이터의 통계적 유의성을 엄격히 검증하며, 집단지성을 활용해 복잡한 생물학적 문제를 수학적 언어로 '
-                                                              '구조화하는 리더십을 발휘함.'},
-                                                       {'학년': '2',
-                                                        '영역': '수학 I',
-                                                        '내용': '수학적 개념을 공학적 문제 해결의 도구로 활용하는 능력이 매우 뛰어남. 수열의 점화식을 생체 내 약물 농도 변화 모델인 미분방정식의 '
-                                                              '이산화 형태로 해석하여, 약물 투여 주기와 잔류량 간의 관계를 수렴하는 급수의 관점에서 분석함. 특히 삼각함수의 주기성을 푸리에 '
-                                                              '해석학의 기초로 확장하여, 심전도 파형을 기저 함수의 선형 결합으로 분해하는 과정을 심도 있게 탐구함. 오일러 공식을 활용해 복소 지수 '
-                                                              '함수로 파형을 표현하고, 지오지브라와 파이썬을 이용해 푸리에 급수의 부분합이 실제 파형에 근사해가는 과정을 시각화함. 뇌파 및 심전도 '
-                                                              '데이터의 주파수 성분을 분석하기 위해 이산 푸리에 변환(DFT)의 원리를 학습하고, 이를 통해 생체 신호에서 노이즈를 제거하는 필터링 '
-                                                              '알고리즘의 수학적 근거를 명확히 제시함. 추상적인 수학 이론을 실제 데이터 분석에 적용하여 실질적인 결과를 도출하는 수리과학적 탐구 '
-                                                              '역량이 돋보임.'},
-                                                       {'학년': '2',
-                                                        '영역': '물리학 I',
-                                                        '내용': '열역학 제2법칙의 엔트로피 증가 원리를 확률론적 관점에서 재해석하여, 통계역학적 접근을 통해 거시적 상태의 변화를 미시적 상태의 경우의 '
-                                                              "수로 설명하는 발표를 진행함. '물리 법칙의 수학적 형식화'를 주제로, 자연 현상을 기술하는 미분방정식이 단순한 근사가 아닌 물리적 "
-                                                              '실재를 투영하는 언어임을 논증함. 특히 전자기파의 전리 작용을 다룰 때, 방사선 치료의 선량 분포를 최적화하기 위한 수치 해석적 '
-                                                              '접근법을 탐구함. 암세포의 위치를 좌표계로 설정하고 방사선 조사 각도에 따른 에너지 흡수율을 최적화하는 알고리즘적 사고를 보여주었으며, '
-                                                              '이를 통해 물리적 현상을 수리적 모델링으로 치환하는 역량을 입증함.'},
-                                                       {'학년': '2',
-                                                        '영역': '화학 I',
-                                                        '내용': '분자 궤도함수 이론을 바탕으로 화합물의 입체 구조와 반응성을 예측하는 탐구를 수행함. 특히 분자의 기하학적 구조가 수용체와의 결합 '
-                                                              '친화도에 미치는 영향을 군론(Group Theory)적 관점에서 분석하여, 분자의 대칭성이 화학적 반응 경로를 결정짓는 핵심 요인임을 '
-                                                              '밝힘. 산화-환원 적정 실험에서는 단순히 함량을 측정하는 데 그치지 않고, 적정 곡선의 변곡점을 미분적으로 해석하여 종말점을 정밀하게 '
-                                                              '추정하는 수리적 기법을 도입함. 실험 과정에서 발생하는 오차를 확률 변수로 정의하고, 반복 측정을 통한 데이터의 신뢰 구간을 산출하여 '
-                                                              '오차의 원인을 통계적으로 규명하는 과학적 엄밀성을 보여줌.'},
-                                                       {'학년': '2',
-                                                        '영역': '생명과학 I',
-                                                        '내용': '면역 체계의 복잡한 상호작용을 네트워크 이론으로 모델링하여, 수지상세포와 T 림프구 간의 신호 전달 과정을 그래프 이론의 노드와 엣지로 '
-                                                              '치환하여 분석함. MHC 분자와 수용체의 결합을 확률적 사건으로 정의하고, 사이토카인 농도 변화에 따른 면역 반응의 동역학적 변화를 '
-                                                              '미분방정식으로 모델링하여 발표함. 생물학적 현상을 수리적 모델로 추상화하는 과정에서, 면역 반응의 비선형적 특성을 파악하고 이를 '
-                                                              '제어하기 위한 최적화 알고리즘의 가능성을 제시함. 생명 현상의 미시적 기전을 수학적 언어로 구조화하여 이해하려는 시도가 돋보이며, '
-                                                              '데이터 기반의 생물학적 통찰력을 보여줌.'},
-                                                       {'학년': '2',
-                                                        '영역': '수리적 논리 및 철학적 탐구',
-                                                        '내용': '수리과학부 진학을 목표로 수학적 논리 체계가 인간의 사고와 사회적 의사결정에 미치는 영향을 심도 있게 탐구함. 단순히 수학적 지식을 '
-                                                              '습득하는 것에 그치지 않고, 수리 논리학의 공리적 체계가 현대 사회의 정보 신뢰성 검증과 알고리즘 윤리에 어떻게 적용될 수 있는지 '
-                                                              '분석함. 특히 수학적 엄밀성이 결여된 정보가 사회적 혼란을 야기하는 메커니즘을 집합론적 관점에서 재해석하고, 데이터의 편향성을 '
-                                                              '수학적으로 보정하는 모델을 제안하는 등 학문적 책무를 실천함.'},
-                                                       {'학년': '2',
-                                                        '영역': '수학적 모델링 심화',
-                                                        '내용': '수학 I 및 미적분 교과에서 다루는 수열과 함수의 극한 개념을 동역학 시스템 모델링으로 확장함. 약물의 체내 농도 변화를 단순 '
-                                                              '등비수열로 해석하는 수준을 넘어, 약물 동태학의 ADME 4단계를 비선형 미분방정식 시스템으로 모델링하여 시간에 따른 농도 변화를 '
-                                                              '시뮬레이션함. 또한 푸리에 변환을 활용하여 복잡한 생체 신호 데이터에서 특정 주파수 성분을 추출하고, 이를 노이즈 제거 알고리즘으로 '
-                                                              '구현하여 데이터의 정밀도를 높이는 수리적 해석 과정을 성공적으로 수행함.'},
-                                                       {'학년': '2',
-                                                        '영역': '기하',
-                                                        '내용': '지오지브라를 활용하여 이차곡선의 기하학적 성질을 당들랭 구의 원리를 통해 엄밀하게 증명함. 원뿔과 평면의 교선이 타원, 포물선, '
-                                                              '쌍곡선으로 변화하는 과정을 평면의 기울기 변화에 따른 기하학적 변환으로 시각화하고, 각 곡선의 초점과 준선의 관계를 벡터 해석학적으로 '
-                                                              '유도함. 특히 공간상의 혈흔 분포를 기하학적 투영 문제로 치환하여, 혈흔의 타원형 형상으로부터 충돌 각도와 발혈 지점을 추적하는 '
-                                                              '역문제(Inverse Problem)를 해결함. 정사영과 삼각함수를 결합하여 3차원 공간에서의 충돌 궤적을 수식화하고, 다수의 혈흔 '
-                                                              '데이터를 기반으로 발혈 지점의 확률적 분포를 산출하는 알고리즘을 설계하여 기하학적 사고의 확장성을 입증함.'},
-                                                       {'학년': '2',
-                                                        '영역': '심화 영어 I',
-                                                        '내용': '영어 구사력이 매우 탁월하며, 복잡한 수리적 논증이 포함된 영문 학술 지문을 읽고 핵심을 파악하는 능력이 최상위권임. 성실한 태도를 '
-                                                              "바탕으로 수학적 모델링에 대한 관심을 확장하려는 열정이 두드러짐. '복소해석학의 응용'에 관한 영문 논문을 발표하며, 복소평면에서의 "
-                                                              '사상(mapping)이 물리적 유체 흐름에 미치는 영향을 논리적으로 설명함. 단순한 번역을 넘어 수학적 맥락을 상세히 소개하고, '
-                                                              "등각사상(conformal mapping)과 공학적 설계 사이의 관계를 명확히 규명하여 급우들로부터 '가장 학술적인 발표'라는 평가를 "
-                                                              "받음. 글쓰기 활동에서 뛰어난 논리적 사고력을 보이며, '데이터 편향성이 인공지능 알고리즘의 의사결정에 미치는 영향'을 주제로 에세이를 "
-                                                              '작성함. 이 과정에서 알고리즘의 공정성을 수학적 확률 분포의 관점에서 분석하고, "Mathematical rigor is the '
-                                                              'foundation of unbiased AI"라는 주제문을 도출함. 또한, 수리과학부 진학을 위해 필수적인 선형대수학의 기초 개념인 '
-                                                              "'고유값과 고유벡터'의 기하학적 의미를 조사하여, 이를 데이터 차원 축소 기법인 PCA(주성분 분석)와 연결한 심화 에세이를 작성하는 "
-                                                              '등 전공 적합성을 극대화함.'},
-                                                       {'학년': '2',
-                                                        '영역': '사회문제 탐구',
-                                                        '내용': "대규모 데이터셋을 활용한 사회 현상의 수리적 분석에 깊은 관심을 보임. '도시 교통 흐름의 네트워크 이론적 분석'을 주제로, 특정 "
-                                                              '지역의 교통 정체 현상을 그래프 이론의 관점에서 모델링한 질적 사례 연구를 발표함. 노드와 엣지로 구성된 교통망에서 병목 현상이 '
-                                                              "발생하는 지점을 수학적으로 예측하는 방법을 탐구함. 또한, '디지털 격차에 따른 정보 불평등' 문제를 통계적 상관관계 분석을 통해 "
-                                                              '접근함. 소득 수준과 정보 접근성 사이의 데이터를 수집하여 회귀 분석을 수행하고, 이를 통해 사회적 불평등이 고착화되는 구조를 '
-                                                              "수리적으로 증명함. 코로나19 이후 급증한 비대면 서비스의 효율성을 최적화하기 위해 '대기열 이론(Queueing Theory)'을 "
-                                                              '적용한 연구 계획서를 작성함. 문헌 연구를 통해 대기 시간의 확률적 분포를 분석하고, 서버의 처리 용량과 사용자 유입률을 변수로 '
-                                                              '설정하여 최적의 시스템 운영 방안을 도출함. 데이터 기반의 의사결정이 사회적 갈등을 해결하는 데 기여할 수 있음을 강조하며, 통계적 '
-                                                              '유의성을 바탕으로 한 정책 제언의 중요성을 학급에서 발표함.'},
-                                                       {'학년': '2',
-                                                        '영역': '고전과 윤리',
-                                                        '내용': "정의론을 학습하며 '수학적 공정성'이라는 개념에 의문을 품고, 이를 사회적 분배 문제와 연결하여 탐구함. 롤스의 정의론을 단순히 윤리적 "
-                                                              "관점에서 해석하는 데 그치지 않고, 자원 배분의 최적화 문제로 치환하여 '최대 최소 원리(Maximin Principle)'가 게임 "
-                                                              '이론의 전략적 선택과 어떻게 맞닿아 있는지 분석함. 의료 시스템의 자원 분배 문제를 다룰 때, 효율성과 형평성 사이의 '
-                                                              '트레이드오프(trade-off)를 수학적 함수로 모델링할 수 있는지 고민함. 노먼 대니얼스의 의료 정의론을 살피며, 의료 서비스의 '
-                                                              '분배가 단순한 윤리적 당위가 아니라 시스템 설계의 문제임을 깨달음. 본인이 수리과학자가 되어 복잡한 사회 시스템을 모델링할 때, 이러한 '
-                                                              '정의의 원칙을 알고리즘의 목적 함수(objective function)에 어떻게 반영할 수 있을지 깊이 있게 고찰함. 이론적 정의가 '
-                                                              '실제 사회 시스템에서 어떻게 구현되는지 탐구하며, 수학적 엄밀함과 인문학적 통찰을 결합하여 사회적 난제를 해결하는 수리과학자가 되겠다는 '
-                                                              '비전을 확고히 함.'},
-                                                       {'학년': '3',
-                                                        '영역': '독서',
-                                                        '내용': '수리과학부 진학을 목표로 수학적 논리 체계와 추상적 사고력을 확장하기 위해 현대 수학의 근간을 다룬 전문 서적을 탐독함. 특히 '
-                                                              "'집합론과 수리논리학'을 주제로 한 심화 독서를 통해 수학적 엄밀성의 기초를 다졌으며, 괴델의 불완전성 정리를 탐구하며 공리계의 한계와 "
-                                                              '수학적 진리의 본질에 대해 깊이 있게 고찰함. 독서 과정에서 파생된 의문을 해결하기 위해 관련 논문을 찾아보고, 수학적 귀납법과 '
-                                                              '무한집합의 농도 개념을 연결하여 집합의 크기를 비교하는 논리적 과정을 학급 게시판에 공유함. 단순히 지식을 습득하는 데 그치지 않고, '
-                                                              '수학적 모델링의 기초가 되는 논리적 추론 과정을 구조화하여 정리하는 습관을 지님. 또한, 데이터 과학 분야의 통계적 방법론을 다룬 '
-                                                              '서적을 읽고, 확률 분포의 수렴성과 대수의 법칙이 실제 데이터 분석 알고리즘에서 어떻게 구현되는지 분석하며 수학적 이론이 공학적 문제 '
-                                                              '해결로 이어지는 연결 고리를 명확히 파악함.'},
-                                                       {'학년': '3',
-                                                        '영역': '고급 수학 I',
-                                                        '내용': '벡터공간의 대수적 구조와 선형사상에 대한 깊은 이해를 바탕으로, 행렬의 고유값과 고유벡터가 선형변환의 기하학적 의미와 어떻게 대응되는지 '
-                                                              '심도 있게 탐구함. 특히 케일리-해밀턴 정리를 활용하여 고차 행렬의 거듭제곱을 효율적으로 계산하는 알고리즘을 설계하고, 이를 파이썬의 '
-                                                              'NumPy 라이브러리를 활용해 구현하여 수치적 안정성을 검증함. 행렬식의 기하학적 의미인 부피 변화율을 다차원 공간으로 확장하여 '
-                                                              '해석하고, 이를 다변수 미적분학의 야코비안 행렬과 연결하여 변수 변환의 원리를 수학적으로 증명함. 또한, 복소평면에서의 극형식과 오일러 '
-                                                              '공식을 활용하여 회전 변환을 행렬로 표현하는 과정을 탐구하며, 복소수 체계가 현대 제어 이론 및 신호 처리의 수학적 기반임을 논리적으로 '
-                                                              '설명함. 교과 과정의 문제를 해결하는 과정에서 항상 일반화된 해법을 찾으려 노력하며, 추상적인 수학적 개념을 구체적인 알고리즘으로 '
-                                                              '치환하는 탁월한 역량을 발휘함.'},
-                                                       {'학년': '3',
-                                                        '영역': '물리학 II',
-                                                        '내용': '물리 현상을 수학적 언어로 기술하는 능력이 매우 탁월하며, 역학적 시스템을 미분방정식으로 모델링하여 해석하는 데 능숙함. 2차원 포물선 '
-                                                              '운동의 궤적을 벡터 함수로 정의하고, 공기 저항이 존재하는 환경에서의 운동 방정식을 수치 해석적으로 도출하여 오차를 분석함. 파동의 '
-                                                              '회절과 간섭 단원에서는 푸리에 변환의 원리를 학습하고, 이를 통해 복잡한 파형을 주파수 성분으로 분해하는 수학적 과정을 탐구함. 특히 '
-                                                              "'양자역학의 수학적 형식주의'를 주제로 슈뢰딩거 방정식의 해가 갖는 확률 밀도 함수의 의미를 힐베르트 공간의 관점에서 해석하는 보고서를 "
-                                                              '작성함. 리만 제타 함수와 소수의 분포가 양자 카오스 이론과 연결된다는 현대 물리학의 최신 연구 동향을 접하고, 이를 수학적 관점에서 '
-                                                              '재해석하여 우주의 무한성과 수학적 구조의 연관성을 논리적으로 서술함. 복잡한 물리적 상황을 수학적 모델로 추상화하고, 이를 다시 검증 '
-                                                              '가능한 수치적 결과로 도출하는 과정에서 수리과학부 전공자로서의 자질을 유감없이 발휘함.'},
-                                                       {'학년': '3',
-                                                        '영역': '심화수학 II',
-                                                        '내용': "수행평가에서 '비선형 동역학 시스템의 안정성 분석'을 주제로 발표하며, 로지스틱 맵의 카오스 현상을 수학적으로 증명함. 칠판에 "
-                                                              '리아푸노프 지수(Lyapunov exponent)의 정의를 전개하며, 초기값의 미세한 차이가 시스템의 장기적 거동에 미치는 나비 효과를 '
-                                                              '수식으로 유도하여 청중의 이해를 도움. 특히 비선형 미분방정식의 평형점(equilibrium point) 근처에서의 선형화 과정과 '
-                                                              '야코비 행렬(Jacobian matrix)을 이용한 고윳값 분석을 통해 시스템의 안정성을 판별하는 논리적 과정을 완벽하게 구현함. 교과 '
-                                                              '수업 중 수렴의 엄밀한 정의인 엡실론-델타 논법에 깊은 관심을 보였으며, 해석학적 관점에서 함수의 연속성과 미분 가능성을 증명하는 '
-                                                              '과정에서 수학적 엄밀성을 추구하는 태도가 돋보임. 테일러 급수를 이용한 초월함수의 근사치 계산 원리를 탐구하며, 오차항의 범위를 '
-                                                              '추정하는 과정에서 수렴 속도를 최적화하는 알고리즘적 사고를 보여줌.'},
-                                                       {'학년': '3',
-                                                        '영역': '정보과학',
-                                                        '내용': '수리적 모델링을 프로그래밍으로 구현하는 역량이 매우 탁월함. K-최근접 이웃(KNN) 알고리즘의 수학적 기반인 유클리드 거리와 맨해튼 '
-                                                              '거리의 차이를 벡터 공간의 관점에서 분석하고, 이를 파이썬으로 직접 구현하여 데이터 분류 모델을 설계함. 특히 생명과학적 현상을 수리 '
-                                                              '모델로 치환하는 과정에 흥미를 느껴, DNA 염기 서열의 상보적 결합 규칙을 행렬 연산으로 변환하는 알고리즘을 개발함. '
-                                                              'Biopython 라이브러리를 활용하여 대규모 염기 서열 데이터에서 특정 패턴을 추출하고, 이를 그래프 이론의 인접 행렬로 표현하여 '
-                                                              '서열 간의 유사도를 계산함. 또한, 단백질의 3차원 구조를 시각화하는 과정에서 회전 변환 행렬(Rotation Matrix)을 직접 '
-                                                              '코드로 구현하여 분자 구조의 공간적 배치를 수학적으로 해석함. 코드 작성 시 각 모듈의 복잡도를 빅오 표기법으로 분석하여 효율성을 '
-                                                              '극대화하는 등 컴퓨터 과학과 수학의 융합적 사고를 실천함.'},
-                                                       {'학년': '2',
-                                                        '영역': '탐구의 지속성과 일관성',
-                                                        '내용': '수리과학부 진학을 위한 수학적 탐구의 일관성이 매우 뛰어남. 1학년 때부터 지속해온 수리 모델링에 대한 관심을 2학년 기하 과목의 '
-                                                              "'공간 기하학을 이용한 투영 모델링'으로 심화 연결함. 타원의 성질과 정사영의 원리를 이용하여 3차원 공간상의 물체가 2차원 평면에 "
-                                                              '투영될 때 발생하는 왜곡을 수학적으로 보정하는 수식을 유도함. 특히 소실점(vanishing point)의 기하학적 위치를 행렬식으로 '
-                                                              '계산하여 투영 변환의 역행렬을 도출하는 과정을 통해, 추상적인 수학 개념을 실제 시각화 알고리즘으로 연결하는 탁월한 전공 적합성을 '
-                                                              '입증함. 수학적 엄밀성을 바탕으로 문제를 정의하고, 이를 기하학적 모델로 구조화하여 해결책을 제시하는 일련의 과정은 수리과학부 '
-                                                              '연구자로서의 잠재력을 충분히 보여줌.'},
-                                                       {'학년': '2',
-                                                        '영역': '인문학적 소양과 사회적 통찰',
-                                                        '내용': '수리철학 및 논리적 사고 탐구: 괴델의 불완전성 정리를 중심으로 수학적 체계 내에서의 무모순성과 완전성 문제를 고찰함. 러셀의 역설을 '
-                                                              '해결하기 위한 집합론의 공리적 체계 구축 과정을 분석하며, 수학적 진리가 사회적 합의와 논리적 엄밀성 사이에서 어떻게 정립되는지 '
-                                                              '탐구함. 특히 수학적 모델링이 사회 현상을 해석하는 도구로 사용될 때 발생할 수 있는 윤리적 편향성을 롤스의 정의론적 관점에서 '
-                                                              '비판적으로 검토하고, 수리과학자로서 갖추어야 할 객관적 가치관을 정립함.'},
-                                                       {'학년': '2',
-                                                        '영역': '교과 간 융합 및 도구 활용',
-                                                        '내용': '고급 수학 및 정보과학 융합 탐구: 선형대수학의 행렬 연산 원리를 파이썬의 넘파이(NumPy) 라이브러리를 활용하여 고차원 데이터 처리 '
-                                                              '알고리즘으로 구현함. 특히 이미지 처리 과정에서 발생하는 노이즈를 제거하기 위한 필터링 기법을 행렬의 고유값 '
-                                                              '분해(Eigendecomposition)를 통해 최적화하는 과정을 수행함. 또한, 복잡한 동역학 시스템을 시뮬레이션하기 위해 미분방정식 '
-                                                              '수치해석 알고리즘을 코드로 작성하고, 데이터의 시각화와 수렴 속도 분석을 통해 수학적 이론이 실제 컴퓨팅 환경에서 어떻게 효율적으로 '
-                                                              '구현되는지 입증함.'},
-                                                       {'학년': '2',
-                                                        '영역': '학술적 전문성 (Hard Core)',
-                                                        '내용': '해석학 및 수리물리학 심화 탐구: 실해석학의 기초가 되는 르베그 적분론과 측도론의 개념을 물리적 현상인 파동 방정식의 해를 구하는 '
-                                                              '과정에 적용함. 푸리에 변환을 이용한 신호 처리의 수학적 엄밀성을 증명하고, 양자역학의 슈뢰딩거 방정식에서 파동함수의 확률 밀도 해석을 '
-                                                              '복소해석학적 관점에서 재구성함. 특히 미분기하학의 곡률 개념을 활용하여 일반 상대성 이론의 시공간 왜곡을 수식으로 유도하는 등, '
-                                                              '추상적인 수학적 구조가 물리적 실재를 어떻게 기술하는지에 대한 깊이 있는 통찰을 보여줌.'},
-                                                       {'학년': '2',
-                                                        '영역': '보완점 제언',
-                                                        '내용': '수학적 탐구 및 학술적 글쓰기: 다양한 수학적 주제를 병렬적으로 나열하는 방식에서 벗어나, 각 개념 간의 위계와 논리적 인과관계를 '
-                                                              '명확히 서술하는 훈련이 필요함. 특히 수리 모델링 탐구 과정에서 도출된 결과값이 실제 물리 현상이나 데이터 분석 결과와 어떻게 '
-                                                              '유기적으로 연결되는지 그 연결 고리를 강화해야 함. 또한, 사회적 이슈와 수학을 접목한 탐구에서 특정 주제가 단순 현상 나열에 그치지 '
-                                                              '않도록, 수학적 도구를 활용한 정량적 분석 논거를 보강하여 탐구의 깊이와 일관성을 확보하는 전략이 필요함.'}],
-                                        'comments': [{'구분': '기타 합격 대학', '내용': 'KAIST 무학과, 포항공과대학교 수학과, 연세대학교 수학과'},
-                                                     {'구분': '고등학교', '내용': '과학고등학교 내신 1.1 ~ 1.3'},
-                                                     {'구분': '총평',
-                                                      '내용': '과학고등학교의 치열한 내신 경쟁 환경 속에서도 1.1등급대의 최상위 성적을 유지하며 수학적 재능을 입증했다. 단순한 문제 풀이를 넘어 '
-                                                            '수학적 원리를 증명하고 이를 데이터 분석 및 알고리즘 설계로 확장하는 탐구 과정이 매우 인상적이다. 수리과학부 진학을 위한 학문적 깊이와 '
-                                                            '전공 적합성이 완벽하게 조화를 이루고 있어, 향후 수학적 모델링 분야의 핵심 인재로 성장할 가능성이 매우 높다.'},
-                                                     {'구분': '위상수학 및 공간 탐구',
-                                                      '내용': "위상수학적 관점에서 공간의 효율적 배치를 탐구한 것은 수리과학부 지망생에게 매우 적절하고 훌륭한 소재이다. 다만 '최적 경로 탐색'이라는 "
-                                                            '활동 내용을 단순히 나열하기보다는, 학생이 직접 구현한 알고리즘의 시간 복잡도를 분석하거나, 특정 제약 조건 하에서 수렴성을 증명하는 등 '
-                                                            '수학적 엄밀성을 보여주는 스토리로 풀어나가는 것이 훨씬 효과적이다.'},
-                                                     {'구분': '암호학 및 알고리즘 토론',
-                                                      '내용': '1. 수리과학부를 지망하는 학생들 중 간혹 순수 수학의 우수성만을 강조하며 응용 수학이나 공학적 접근을 낮게 평가하는 경우가 있는데, 이는 '
-                                                            '지양해야 한다. 현대 수학은 타 학문과의 융합을 통해 발전하고 있으며, 특히 수리과학부의 학풍은 수학적 이론이 실세계 문제 해결에 어떻게 '
-                                                            '기여하는지를 중시하므로 이러한 편향된 시각은 주의해야 한다. 2. 세미나 및 토론 활동을 통해 자신의 논리를 정교화하는 것은 매우 '
-                                                            '긍정적이다. 다만 학생의 주장은 전략적으로 수학적 엄밀함과 실용적 가치 사이의 균형을 유지해야 하므로, 지나치게 이론에만 매몰된 주장은 '
-                                                            '피하는 것이 좋다.'},
-                                                     {'구분': 'SIR 모델 관련',
-                                                      '내용': '감염병 확산의 수리적 모델링에 참여했던 활동은 매우 우수하다. 다만 미분방정식의 해를 구하는 과정에서 파라미터 변화에 따른 위상 '
-                                                            '평면(Phase Plane) 분석이나 안정성 해석 등 전문적인 수학적 도구를 활용한 심도 있는 탐구가 뒷받침되었다면 더욱 완벽했을 것이다. '
-                                                            '현재 기술된 내용은 모델의 기초적인 이해에 머물러 있어 아쉬움이 남는다.'},
-                                                     {'구분': '프랙탈 구조 연구',
-                                                      '내용': "'동기-수학적 증명-확장'으로 이어지는 논리적인 서술이 돋보인다. 다만 WADA 중 'A(Agenda)'를 명확히 짚어줄 경우 읽는 사람의 "
-                                                            '입장에서 해당 활동의 학문적 가치를 더 쉽게 파악할 수 있다. 가령 "하우스도르프 차원을 활용한 비정형 구조의 복잡도 정량화 연구"와 같이 '
-                                                            '주제를 명시적으로 정의하여 정리하는 것을 추천한다.'},
-                                                     {'구분': '수리 논리 및 철학 토론',
-                                                      '내용': '철학적 담론을 수리적 논리 체계로 치환하여 분석하는 능력은 매우 스마트하며, 이는 생기부 전체의 학문적 깊이를 높여준다. 평소 수업 시간에 '
-                                                            "선생님들과 적극적으로 소통하며 논리적 오류를 찾아내고 이를 수정하는 과정은 수리과학부 진학을 위한 선결조건인 '수학적 사고력'을 입증하는 "
-                                                            '좋은 사례이다.'},
-                                                     {'구분': '군론 및 암호학 관련',
-                                                      '내용': '군론을 현대 암호 체계에 적용한 탐구는 수리과학부 지망생에게 매우 훌륭한 소재이다. 다만 암호학자의 사명과 같은 추상적인 표현보다는, 이산 '
-                                                            '로그 문제의 복잡도를 군론의 관점에서 어떻게 증명했는지, 혹은 타원 곡선 암호의 대수적 구조가 보안성에 미치는 영향을 수학적으로 어떻게 '
-                                                            '해석했는지에 초점을 맞춰 기술하는 것이 훨씬 효과적이다.'},
-                                                     {'구분': '인재상 및 페르소나',
-                                                      '내용': "'수학적 엄밀성을 바탕으로 실생활 문제를 해결하는 연구자'라는 페르소나가 매우 명확하게 도출된다. 대학이 요구하는 인재상은 결국 학업 "
-                                                            '능력과 탐구의 진정성이다. 거창한 수식어보다는 학생이 수행한 수학적 증명과 알고리즘 구현 과정에서 드러나는 논리적 완결성에 집중하여, 학업 '
-                                                            '역량과 전공 적합성을 동시에 보여주는 전략이 필요하다.'},
-                                                     {'구분': '최적화 알고리즘 탐구',
-                                                      '내용': '그래프 이론에서 출발하여 다익스트라 알고리즘을 변형하고, 이를 파이썬으로 구현하여 최단 경로를 도출하기까지의 일련의 과정이 매우 연속성 '
-                                                            '있게 기술되었다. 수리과학부 탐구활동에서 전문성 있는 내용을 작성하는 것도 중요하지만, 이렇게 탐구의 동기부터 결과 도출까지 논리적 '
-                                                            '연결성을 유지하는 것이 매우 중요하다. 물론 그 과정에서 사용된 수학적 근거가 탄탄해야 한다.'},
-                                                     {'구분': '신경망 모델링 실험 설계',
-                                                      '내용': "'뇌-기계 인터페이스'의 신호 처리에 흥미를 느껴 시작한 탐구가 푸리에 변환을 통한 주파수 분석으로 이어진 점은 매우 훌륭하다. 다만 "
-                                                            '메디컬 분야와 수학을 연결할 때 흔히 하는 실수가 의학적 현상과 수학적 모델 사이의 논리적 비약이다. 신경망의 전기적 신호와 푸리에 변환의 '
-                                                            '관계를 수학적으로 엄밀하게 정의하고, 이를 통해 제어 신호를 도출하는 과정이 독립적인 수학적 탐구로 잘 연결되어야 한다.'},
-                                                     {'구분': '수학 심화탐구의 위계',
-                                                      '내용': "수학 심화탐구에는 두 가지 위계가 있다. 첫째는 학습 내용을 실생활에 '대응'시키는 것이고, 둘째는 학습 내용을 '확장'하거나 '비트는' "
-                                                            '것이다. 이 학생은 지수함수를 학습한 후 이를 단조수렴정리와 연결하는 등 두 번째 위계의 탐구를 매우 잘 수행하고 있다. 이러한 심화 '
-                                                            '학습의 위계가 골고루 드러날 때, 입학사정관은 학생의 수학적 역량을 높게 평가하게 된다.'},
-                                                     {'구분': '영어 세특의 전략적 우위',
-                                                      '내용': '최상위권 학생일수록 세특 서두에 학생의 페르소나를 담는 것이 중요하다. "수학적 논리 전개 능력이 탁월하며, 영어로 된 최신 수리 논문을 '
-                                                            '스스로 해석하여 탐구에 적용함."과 같은 문장은 매우 눈에 띄는 긍정적인 표현이다. 특히 수리과학부에서 중요하게 보는 \'영어로 된 전문 '
-                                                            "논문을 이해하고 활용하는 능력'을 영어 교과 세특에 녹여낸 것은 매우 전략적인 선택이다."},
-                                                     {'구분': '물리 및 수학 융합 탐구',
-                                                      '내용': '운동 방정식을 미분방정식으로 유도하고 최소제곱법으로 오차를 분석한 것은 수학적 엄밀성을 물리 현상에 적용한 매우 좋은 사례이다. 단순히 '
-                                                            '현상을 관찰하는 것을 넘어, 수학적 모델을 통해 이론값과 실험 데이터를 비교 분석하는 과정은 학생이 직접 어떤 방법론을 사용했는지에 초점을 '
-                                                            '맞춰 기술할 때 더욱 효과적이다.'},
-                                                     {'구분': '철학적 사고와 수학',
-                                                      '내용': '철학은 수학적 논리 체계를 정립하는 데 훌륭한 소재를 제공한다. 뇌과학의 신경망 모델을 의사결정 알고리즘으로 재해석한 것은 매우 '
-                                                            '창의적이다. 이러한 융합적 사고는 수리과학부에서 요구하는 다각적인 문제 해결 능력을 보여주기에 적합하며, 생기부 전반에 걸쳐 이러한 논리적 '
-                                                            '연결성을 어필하는 것이 좋다.'},
-                                                     {'구분': '논술 및 심화 독서',
-                                                      '내용': "'생명이란 무엇인가'를 읽고 유전물질의 안정성을 양자역학적 관점에서 설명하려 한 아이디어는 훌륭하다. 다만 이후 탐구활동을 더 깊이 있게 "
-                                                            '구성해야 한다. 단순히 친구들과 의견을 나누었다는 추상적인 표현보다는, 양자역학적 확률 밀도 함수를 통해 유전 정보의 보존성을 수학적으로 '
-                                                            '모델링해보려는 시도와 같은 구체적인 탐구 과정이 드러나야 한다.'},
-                                                     {'구분': '체육 및 예술 교과',
-                                                      '내용': '수학이나 과학을 전공하는 학생이 체육이나 예술 교과에서 진로 적합성을 드러내는 것은 자칫 어색할 수 있다. 그러나 체육의 움직임을 물리적 '
-                                                            '벡터로 해석하거나, 예술의 기하학적 구조를 프랙탈로 분석하는 등 수학적 관점을 도입한다면 매우 훌륭한 전공 적합성 증거가 된다. 자신의 '
-                                                            '전공과 교과목을 연결하는 창의적인 시각을 유지하길 바란다.'},
-                                                     {'구분': '언어와 매체 관련',
-                                                      '내용': '2학년부터 세부능력 특기사항에 인문학적 관점에서 수학적 매체의 특성을 드러낸 것은 매우 좋다. 단, 억지로 기술하기보다는 매체의 정보 전달 '
-                                                            '방식을 정보 이론(Information Theory)의 관점에서 분석하고, 이를 수학적으로 어떻게 최적화할 수 있는지에 대해 탐구한 내용을 '
-                                                            '자연스럽게 기술하는 것이 인과성을 높이는 방법이다.'},
-                                                     {'구분': '수학 1 및 심화 수학',
-                                                      '내용': '수학 세특에서 관심 분야인 수리 모델링과 연결된 기술을 이어가는 것은 매우 좋다. 다만 등비수열의 합과 같은 간단한 주제보다는, 약물의 '
-                                                            '흡수와 제거 과정을 미분방정식의 시스템으로 모델링하고 이를 수치해석적으로 푸는 등 보다 심화된 주제를 선정해야 한다. 푸리에 변환과 같은 '
-                                                            '소재는 좋으나, 이를 뇌파 데이터 분석과 어떻게 수학적으로 연결했는지에 대한 구체적인 과정이 보완되어야 한다.'},
-                                                     {'구분': '한국사 및 역사 탐구',
-                                                      '내용': '한국사 세특에도 수학적 역사가 드러나도록 기술하는 것은 가능하다. 예를 들어 고대 건축물의 기하학적 구조나 전통 문양의 대칭성을 군론으로 '
-                                                            '분석하는 등, 여러 주제를 단순 나열하기보다 한 가지 주제를 정해 주도적으로 탐구한 과정을 담는 것이 훨씬 효과적이다.'},
-                                                     {'구분': '화학 및 생명과학 융합',
-                                                      '내용': '화학적 구조를 그래프 이론으로 모델링하거나, 면역 체계의 기전을 확률 모델로 분석한 탐구활동은 매우 전문적이다. 단순히 지식을 열거하는 '
-                                                            '것이 아니라, 학생이 실제로 탐구하고 고민하면서 수학적 모델을 정교화해 나가는 스토리가 담겨 있다는 점이 매우 훌륭하다. 이렇게 좋은 '
-                                                            '소재를 연결성 있게 풀어나가는 방식은 세부능력 특기사항 작성의 정석이다.'},
-                                                     {'구분': '종합 의견',
-                                                      '내용': "이 학생의 2학년 세특은 **'수학적 엄밀성'**과 **'융합적 사고력'**이 완벽하게 균형을 이루고 있습니다. 특히 **알고리즘의 수학적 "
-                                                            '증명**이나 **복잡계의 수리 모델링**은 수리과학부 교수들이 선호하는 심화 주제입니다. 학업 역량과 전공 적합성이 매우 뛰어나 서울대학교 '
-                                                            '수리과학부 합격에 손색이 없습니다.'}]},
- 'case_1_natural_science_materials': {'personal_info': {'대상': '서울대학교 재료공학부 합격생',
-                                                        '고등학교_유형': '과학고',
-                                                        '내신_성적': '1.1 ~ 1.3',
-                                                        '주요_특징': '과학고 심화 교육과정을 이수하며 1점대 초반의 내신을 유지함. 나노 소재 합성 및 물성 분석을 중심으로 1학년 때부터 일관된 '
-                                                                 '공학적 탐구 서사를 구축함.',
-                                                        '총평': '과학고의 치열한 경쟁 환경 속에서도 1점대 초반의 최상위 내신을 확보하며 학업 역량을 입증했다. 단순한 교과 지식 습득을 넘어, 나노 '
-                                                              '재료의 결정 구조와 전기적 특성 간의 상관관계를 규명하는 등 심화 탐구 활동이 매우 체계적이다. 전공 적합성과 학업적 성취도가 완벽하게 '
-                                                              '조화를 이루고 있어, 재료공학 분야의 차세대 연구자로서의 잠재력이 매우 높게 평가된다.',
-                                                        '기타_합격_대학': '카이스트, 포스텍 신소재공학과, 연세대학교 신소재공학부'},
-                                      'activities': [{'학년': '1',
-                                                      '영역': '자율활동',
-                                                      '내용': "학급 내에서 물리 실험 기구 관리 및 정밀 측정 장비의 상태 점검을 전담하여 실험 환경의 신뢰성을 확보함. 교내 과학 축전에서 '나노 "
-                                                            "구조체의 광학적 특성'을 주제로 부스를 운영하며, 빛의 회절과 간섭 현상을 재료의 결정 구조와 연결하여 설명함. 특히 금속 나노 입자의 "
-                                                            '크기에 따른 표면 플라즈몬 공명 현상을 시각화하여 급우들의 이해를 도왔으며, 질문에 대해 재료의 전자 구조적 관점에서 명쾌하게 답변하여 '
-                                                            "높은 평가를 받음. 자율 탐구 시간에는 '탄소 나노튜브의 기하학적 구조와 인장 강도의 상관관계'를 주제로 수학적 모델링을 수행함. 육각형 "
-                                                            '격자 구조를 벡터와 행렬로 표현하여 응력 분산 원리를 수식화하였으며, 이를 바탕으로 최적의 격자 배열을 도출하는 알고리즘을 설계함. 또한, '
-                                                            "교내 데이터 분석 경진대회에서 '신소재 합성 공정 데이터의 상관관계 분석'을 주제로 발표함. 공정 변수와 최종 물성 간의 관계를 다변량 "
-                                                            '회귀 분석으로 도출하고, 이를 시각화하여 공정 최적화의 중요성을 논리적으로 제시함.'},
-                                                     {'학년': '1',
-                                                      '영역': '동아리활동',
-                                                      '내용': "신소재 공학 탐구 동아리에서 '차세대 에너지 저장 장치인 전고체 배터리의 전해질 안정성'을 주제로 심층 토론을 주도함. 액체 전해질의 "
-                                                            '가연성 문제를 해결하기 위한 고체 전해질의 이온 전도도 향상 방안에 대해 찬반 논리를 구성하고, 최신 논문을 인용하여 전극-전해질 '
-                                                            "계면에서의 저항 감소 전략을 제시함. 또한, '희토류 원소의 공급망 위기와 대체 소재 개발의 필요성'에 대해 사회적, 기술적 관점에서 "
-                                                            '토론을 진행하며, 자원 안보를 위한 재료 설계의 중요성을 강조함. 토론 과정에서 단순히 기술적 우위만을 따지는 것이 아니라, 소재의 '
-                                                            '경제성과 환경적 지속가능성을 동시에 고려하는 비판적 시각을 견지함. 동아리 부장으로서 매주 최신 재료공학 이슈를 정리하여 공유하고, 실험 '
-                                                            '설계 시 변인 통제와 오차 분석을 철저히 수행하도록 독려하는 등 연구자로서의 모범적인 태도를 보임. 복잡한 공학적 난제를 다룰 때 논리적 '
-                                                            '비약 없이 데이터를 기반으로 결론을 도출하는 능력이 매우 탁월함.'},
-                                                     {'학년': '1',
-                                                      '영역': '진로활동',
-                                                      '내용': '(희망분야: 재료공학부) 반도체 공정 특강에 참여하여 나노 리소그래피 기술의 한계와 이를 극복하기 위한 차세대 극자외선(EUV) 노광 '
-                                                            '공정의 원리를 학습함. 특히 박막 증착 과정에서 발생하는 결함 제어 기술에 깊은 관심을 보이며, 관련 공학적 원리를 탐구함. 진로 탐색의 '
-                                                            "날에는 '재료공학에서의 인공지능 활용' 강연을 통해 머신러닝을 이용한 신소재 탐색(Materials Informatics)의 가능성을 "
-                                                            '확인하고, 이를 자신의 탐구에 적용하고자 노력함. 고체 물리학의 기초 개념을 바탕으로 결정 격자의 결함이 전기적 특성에 미치는 영향을 '
-                                                            "수치적으로 해석하는 모델을 설계하여 발표함. 또한, '지속 가능한 미래를 위한 친환경 소재 개발' 특강을 통해 폐배터리 재활용 과정에서의 "
-                                                            '금속 회수 효율을 높이는 화학적 공정의 중요성을 인식함. 관련 학술 자료를 탐독하며 소재의 생애 주기 평가(LCA) 개념을 익히고, '
-                                                            '재료공학자가 갖추어야 할 윤리적 책임과 기술적 혁신 사이의 균형에 대해 깊이 있게 고찰하며 진로에 대한 확고한 비전을 정립함.'},
-                                                     {'학년': '2',
-                                                      '영역': '자율활동',
-                                                      '내용': '반도체 소자의 미세화 공정에서 발생하는 열적 불안정성 문제를 해결하기 위해, 나노 박막의 열전도도를 제어하는 복합 소재 설계 프로젝트를 '
-                                                            '주도함. 열전도율이 서로 다른 금속 산화물 나노 입자를 고분자 매트릭스에 분산시키는 과정에서, 입자의 크기와 분포가 계면 열저항에 미치는 '
-                                                            '영향을 수치 해석 프로그램으로 모델링함. 특히 입자의 충전율이 임계치를 넘을 때 발생하는 퍼콜레이션 현상을 수학적으로 규명하고자 '
-                                                            '지오지브라를 활용해 입자 간 거리에 따른 열 흐름 경로를 시각화하고, 최적의 입자 배열 구조를 도출함. 또한, 기존의 유기 절연체를 대체할 '
-                                                            '수 있는 친환경 고분자 복합 재료를 탐구하며, 알긴산 나트륨과 나노 셀룰로오스를 배합하여 기계적 강도와 내열성을 동시에 확보하는 실험을 '
-                                                            '수행함. 가교 결합 밀도를 조절하기 위해 젖산 칼슘의 농도를 변수로 설정하고, 인장 강도 측정 및 열중량 분석을 통해 소재의 물성 변화를 '
-                                                            '정량적으로 평가함. 이 과정에서 단순한 실험 반복을 넘어, 분자 간 수소 결합이 고분자 사슬의 유연성과 열적 안정성에 기여하는 메커니즘을 '
-                                                            '이론적으로 고찰함. 연구의 정확성을 높이기 위해 오차 요인을 통계적으로 분석하고, 재료의 미세 구조와 거시적 물성 간의 상관관계를 '
-                                                            '논리적으로 설명하는 보고서를 작성하여 공학적 문제 해결 역량을 입증함.'},
-                                                     {'학년': '2',
-                                                      '영역': '동아리활동',
-                                                      '내용': "신소재 공학 탐구 동아리에서 '차세대 에너지 저장 장치인 전고체 배터리의 전해질 안정성'을 주제로 심층 토론을 주도함. 액체 전해질의 "
-                                                            '가연성 문제를 해결하기 위한 고체 전해질의 이온 전도도 향상 방안에 대해 찬반 논리를 구성하고, 최신 논문을 인용하여 황화물계와 산화물계 '
-                                                            '고체 전해질의 장단점을 비교 분석함. 특히 전극과 전해질 사이의 계면에서 발생하는 화학적 부반응이 배터리 수명에 미치는 영향을 조사하며, '
-                                                            "계면 안정화를 위한 코팅 기술의 중요성을 강조함. 또한, '탄소 중립을 위한 수소 에너지 저장 소재의 효율성'이라는 주제로 토론을 "
-                                                            '진행하며, 금속 유기 골격체(MOF)의 기공 구조가 수소 흡착량에 미치는 영향을 물리화학적 관점에서 논함. 토론 과정에서 단순히 기술적 '
-                                                            '우위만을 따지는 것이 아니라, 소재의 대량 생산 가능성과 경제성, 환경적 지속 가능성을 고려한 종합적인 공학적 판단 기준을 제시함. 다양한 '
-                                                            '관점의 의견을 비판적으로 수용하면서도, 본인의 주장을 뒷받침하기 위해 열역학적 데이터와 결정 구조 분석 자료를 효과적으로 활용하는 모습이 '
-                                                            '매우 인상적임. 동료들과 함께 복잡한 공학적 난제를 해결하기 위한 협력적 태도를 견지하며, 재료공학자로서 갖추어야 할 비판적 사고력과 '
-                                                            '논리적 소통 능력을 유감없이 발휘함.'},
-                                                     {'학년': '2',
-                                                      '영역': '진로활동',
-                                                      '내용': "(희망분야: 재료공학부) '반도체 나노 공정 및 차세대 소자 기술' 강연에 참여하여, 극자외선(EUV) 노광 공정의 한계와 이를 극복하기 "
-                                                            '위한 자기 정렬 다중 패터닝(SAQP) 기술의 원리를 학습함. 특히 박막 증착 과정에서 발생하는 결함 제어 기술에 깊은 관심을 보이며, '
-                                                            "원자층 증착(ALD) 공정에서 전구체의 화학적 흡착 특성이 박막의 균일도에 미치는 영향에 대해 질문함. '재료 과학과 인공지능의 융합' "
-                                                            '강연에서는 머신러닝을 활용한 신소재 탐색 알고리즘을 접하고, 데이터 기반의 소재 설계가 연구 개발 기간을 얼마나 단축할 수 있는지에 대해 '
-                                                            "심도 있게 고찰함. 또한, '21세기 에너지 소재의 혁신' 강연을 통해 페로브스카이트 태양전지의 효율 향상을 위한 결정 성장 제어 기술을 "
-                                                            "학습하고, 유기-무기 하이브리드 구조가 갖는 광학적 특성과 안정성 문제에 대해 토론함. 진로 탐색 활동으로 '재료공학자의 길, 지속 가능한 "
-                                                            "미래를 위한 설계' 강의를 수강하며, 폐기물 재활용을 통한 희토류 회수 기술과 친환경 촉매 소재의 중요성에 대해 탐구함. 특히, 소재의 "
-                                                            '수명 주기 평가(LCA) 개념을 도입하여 환경 영향을 최소화하는 공정 설계의 필요성을 절감함. 관련 저서를 탐독하며 재료공학자의 사회적 '
-                                                            '책임과 윤리적 사명에 대해 진지하게 성찰하고, 미래 소재 산업의 발전을 이끌겠다는 확고한 진로 의지를 다짐함.'},
-                                                     {'학년': '1',
-                                                      '영역': '과학탐구실험',
-                                                      '내용': '재료공학적 관점에서 물질의 물성을 탐구하는 태도가 매우 탁월함. 자유 낙하 및 포물선 운동 실험 시, 단순한 이론 확인에 그치지 않고 영상 '
-                                                            '분석 소프트웨어를 활용하여 공기 저항에 따른 종단 속도 변화를 정량적으로 도출함. 빛의 분산 실험에서는 프리즘의 굴절률과 파장 간의 '
-                                                            '상관관계를 재료의 광학적 특성으로 해석하였으며, 유리컵을 이용한 재결합 실험을 통해 빛의 파동성과 매질의 굴절 원리를 논리적으로 규명함. '
-                                                            '특히 태양광 발전 효율을 극대화하기 위한 친환경 정수기 설계 과정에서, 광촉매 재료의 표면적과 빛 흡수율의 관계를 공학적으로 분석하여 '
-                                                            '설계안을 도출하는 등 재료공학도로서의 창의적 문제 해결 능력을 입증함.'},
-                                                     {'학년': '2',
-                                                      '영역': '철학',
-                                                      '내용': "동양철학의 핵심 개념을 현대 공학적 방법론과 연결하여 분석하는 융합적 사고력이 돋보임. 양명학의 '심즉리' 사상을 탐구하며, 이를 인간의 "
-                                                            '의사결정 과정과 연결하여 뇌과학적 관점에서 재해석함. 외부 자극에 대한 인간의 반응 기제를 신경전달물질의 이동과 전두엽의 정보 처리 '
-                                                            '과정으로 치환하여 분석하였으며, 도덕적 선택이 단순한 관념이 아닌 생물학적·물리적 시스템의 결과물임을 논증함. 이러한 철학적 탐구는 향후 '
-                                                            '지능형 소재나 생체 모방 재료를 설계할 때 인간의 인지 구조를 고려해야 한다는 공학적 통찰로 이어져, 기술의 사회적 책임과 윤리적 설계를 '
-                                                            '고민하는 재료공학도로서의 자질을 보여줌.'},
-                                                     {'학년': '2',
-                                                      '영역': '논술',
-                                                      '내용': "문학적 텍스트를 분석하는 과정에서도 과학적 방법론을 적용하여 논리적 완결성을 추구함. '생명이란 무엇인가'를 읽고 유전 물질의 안정성을 "
-                                                            '양자역학적 에너지 준위와 결합하여 해석한 점은 재료의 결정 구조와 안정성 간의 상관관계를 이해하는 기초 역량을 보여줌. 특히 생명 현상을 '
-                                                            '물리학적 관점에서 재료의 상호작용으로 치환하여 설명하는 학문 융합적 통찰력을 발휘함. 또한, 꿈의 해석에 대한 과학적 반증 가능성을 논의할 '
-                                                            '때, 데이터의 객관성과 재현성을 강조하며 공학적 실험 설계의 핵심인 변인 통제와 검증의 중요성을 역설함. 이러한 비판적 사고력은 향후 '
-                                                            '신소재 개발 과정에서 발생할 수 있는 가설 검증의 오류를 최소화하는 밑거름이 될 것으로 기대됨.'},
-                                                     {'학년': '2',
-                                                      '영역': '체육',
-                                                      '내용': '신체 활동 전반에 걸쳐 뛰어난 운동 신경과 전략적 사고를 발휘하는 학생임. 농구 수행평가 시 단순히 기술을 습득하는 것에 그치지 않고, '
-                                                            '팀원들의 위치와 수비수의 움직임을 분석하여 최적의 패스 경로를 설계하는 등 공간 활용 능력이 탁월함. 배드민턴 경기에서는 셔틀콕의 궤적을 '
-                                                            '물리적으로 예측하여 낙하지점을 정확히 포착하고, 스매싱의 각도를 조절하여 상대의 허점을 공략하는 전략적 플레이를 선보임. 태권도 품새 학습 '
-                                                            '과정에서는 동작의 정확성과 절도 있는 힘의 분배를 강조하며, 신체 중심 이동과 회전 관성을 활용한 발차기 기술을 빠르게 습득함. 특히 운동 '
-                                                            '과정에서 발생하는 신체 역학적 원리를 이해하려는 태도가 돋보이며, 자신의 신체 능력을 객관적으로 평가하고 부족한 근지구력을 보완하기 위해 '
-                                                            '체계적인 훈련 계획을 수립하여 실천하는 등 자기 주도적인 학습 태도를 보여줌. 이러한 신체 활동에서의 분석적 접근 방식은 재료공학적 실험 '
-                                                            '설계 및 데이터 분석 역량과도 일맥상통하며, 협동적인 팀 활동을 통해 공동의 목표를 달성하는 과정에서 리더십과 소통 능력을 유감없이 '
-                                                            '발휘함.'},
-                                                     {'학년': '2',
-                                                      '영역': '언어와 매체',
-                                                      '내용': "매체 언어의 구조와 사회적 영향력을 비판적으로 수용하고 생산하는 능력이 매우 뛰어남. '백신을 둘러싼 인본주의와 자본주의의 갈등'이라는 "
-                                                            "기사문을 분석하며, 매체 자료가 정보를 전달하는 방식과 필자의 논리적 전개 과정을 심층적으로 파악함. 이를 바탕으로 '코로나19 팬데믹 "
-                                                            "상황에서 거대 제약사는 인본주의적 가치를 우선시해야 한다'는 주제의 기사문을 작성하여, 자본의 논리와 공공의 이익 사이에서 발생하는 윤리적 "
-                                                            '딜레마를 공학적 관점과 연결해 논리적으로 서술함. 특히 신소재 개발 및 반도체 공정 기술의 상용화 과정에서 발생할 수 있는 기술 윤리 '
-                                                            '문제에 깊은 관심을 보이며, 매체 플랫폼의 정보 확산 속도와 신뢰성 문제를 탐구함. 세계 최대 비디오 플랫폼의 알고리즘이 정보의 편향성을 '
-                                                            '어떻게 강화하는지 분석하고, 의학 및 공학 정보의 허위·과장 보도가 대중에게 미치는 악영향을 경계함. 이러한 탐구는 향후 재료공학자로서 '
-                                                            '연구 결과를 대중에게 투명하게 공개하고, 기술의 사회적 책임을 다해야 한다는 직업 윤리관을 확립하는 계기가 됨. 매체 자료를 분석하는 '
-                                                            '과정에서 얻은 논리적 사고력과 비판적 시각은 전공 분야의 복잡한 기술적 난제를 해결하고 이를 사회적으로 소통하는 데 필요한 핵심 역량으로 '
-                                                            '평가됨.'},
-                                                     {'학년': '2',
-                                                      '영역': '수학 1',
-                                                      '내용': '수학적 개념을 공학적 문제 해결의 도구로 활용하는 능력이 매우 탁월함. 수열의 일반항과 합의 개념을 함수적 관점에서 재해석하여, 등차수열과 '
-                                                            '등비수열의 성질을 일차 및 이차함수의 그래프와 연결해 정량적으로 분석함. 특히 약물의 체내 잔류량을 등비수열의 합 공식으로 모델링하여, '
-                                                            '복용 주기와 용량에 따른 혈중 농도 변화를 시뮬레이션하고 부작용을 최소화할 수 있는 최적의 투여량을 산출하는 프로젝트를 수행함. 이 '
-                                                            '과정에서 수학적 모델링이 실제 공학적 설계에 어떻게 적용되는지 깊이 있게 이해함. 또한 삼각함수의 주기성을 학습한 후, 심전도 파형 분석에 '
-                                                            '활용되는 푸리에 변환의 원리에 강한 호기심을 보임. 오일러 공식을 통해 삼각함수와 지수함수의 관계를 증명하고, 지오지브라를 활용하여 '
-                                                            '진동수가 다른 삼각함수들을 중첩시켜 복잡한 파형을 분해하는 과정을 직접 구현함. 이러한 탐구는 재료의 결정 구조 분석이나 반도체 소자의 '
-                                                            '신호 처리 과정에서 필수적인 데이터 해석 역량으로 이어짐. 수학적 지식을 단순히 암기하는 것이 아니라, 이를 활용해 실생활과 공학적 현상을 '
-                                                            '설명하려는 태도는 재료공학부 진학을 위한 탄탄한 학업적 기초를 보여주며, 난해한 문제를 만났을 때 다양한 전략을 모색하여 끝까지 해결해내는 '
-                                                            '집요함이 매우 인상적임.'},
-                                                     {'학년': '2',
-                                                      '영역': '미적분',
-                                                      '내용': '재료공학적 관점에서 나노 박막의 두께와 결정 구조의 변화를 수학적으로 모델링하기 위해 급수의 수렴성 판정법을 심층 탐구함. 특히 '
-                                                            '적분판정법을 활용하여 결정 격자 내 원자 배열의 밀도 함수가 특정 구간에서 수렴하는 조건을 증명하고, 이를 통해 박막 증착 공정에서 '
-                                                            '발생하는 불균일한 두께 분포를 수학적으로 해석함. 비교판정법을 적용하여 복잡한 다층 박막 구조의 에너지 준위 계산 시 발생하는 무한 급수의 '
-                                                            '수렴 범위를 정밀하게 산출하였으며, 교대급수판정법의 증명 과정을 통해 재료의 열팽창 계수 변화에 따른 응력 분포의 안정성을 수학적으로 '
-                                                            '검증함. 수업 중 제시된 난도 높은 미분 방정식 문제들을 재료의 확산 계수와 연결하여 풀이하는 등 공학적 응용력을 발휘하였으며, 동료 '
-                                                            '학생들의 풀이 과정에서 발견되는 논리적 비약이나 계산 오류를 재료역학적 관점에서 교정해 주는 등 학급 내 학습 멘토로서의 역할을 충실히 '
-                                                            '수행함. 형성평가에서 만점을 기록할 만큼 미적분학의 기본 원리를 완벽히 체득하고 있으며, 이를 실제 공학적 문제 해결에 적용하려는 태도가 '
-                                                            '매우 우수함.'},
-                                                     {'학년': '2',
-                                                      '영역': '한국사',
-                                                      '내용': "재료공학도로서 기술 발전이 인류 문명에 미친 영향을 고찰하기 위해 '전쟁과 신소재 기술의 비약적 발전'을 주제로 탐구를 진행함. 역사적 "
-                                                            '사건 속에서 금속 제련 기술과 합금 공학이 무기 체계의 변화를 어떻게 주도했는지 분석하고, 특히 6·25 전쟁 이후 한국의 산업화 과정에서 '
-                                                            '철강 및 반도체 소재 기술이 국가 경제의 근간으로 자리 잡은 과정을 추적함. 16세기 앙브라즈 파레의 외과적 도구 개선 사례를 금속의 '
-                                                            '내식성과 강도를 높이는 야금학적 발전과 연결하여 해석하였으며, 전쟁 중 신체검사를 통해 도입된 국민건강보험 제도를 사회적 인프라 구축의 '
-                                                            '관점에서 재료 공급망의 안정성 확보와 비교 분석함. 제1, 2차 세계대전 당시 신소재의 수요 급증이 고분자 화학과 세라믹 공학의 발전을 '
-                                                            '가속화했음을 밝히고, 이러한 기술적 도약이 현대의 반도체 및 디스플레이 소재 기술로 어떻게 계승되었는지 논리적으로 서술함. 단순히 역사적 '
-                                                            '사실을 나열하는 것을 넘어, 시대적 요구가 기술 혁신을 어떻게 견인했는지에 대한 통찰력을 보여주었으며, 한국의 산업 발전사를 글로벌 소재 '
-                                                            '기술 패권 경쟁의 맥락에서 재해석하는 등 공학적 상상력과 역사적 사고력을 동시에 갖춘 모습을 보임.'},
-                                                     {'학년': '2',
-                                                      '영역': '물리학 1',
-                                                      '내용': '물리학적 원리를 재료공학적 설계에 적용하는 능력이 탁월하며, 열역학 단원 학습 후 엔트로피 변화와 재료의 상변태 과정을 친구들에게 설명하며 '
-                                                            "개념의 내면화를 실천함. '과학 법칙은 발견인가 발명인가'라는 주제를 재료의 결정 구조와 물성 간의 상관관계로 확장하여, 자연계에 존재하는 "
-                                                            '결정 격자의 대칭성이 인간의 언어인 수학적 모델로 정립되는 과정을 논리적으로 고찰함. 특히 가상현실 및 증강현실 기기에 사용되는 디스플레이 '
-                                                            '소재의 광학적 특성을 탐구하며, 유기발광다이오드(OLED)의 발광 효율을 높이기 위한 박막 증착 기술의 한계와 이를 극복하기 위한 나노 '
-                                                            '구조 제어 방안을 제시함. 기술적 보완점을 제시하는 과정에서 재료의 굴절률과 투과율을 정량적으로 분석하여 발표한 점이 매우 인상적임. 파동 '
-                                                            '단원 학습 후에는 전자기파의 전리작용을 반도체 공정 내 포토레지스트의 감광 특성과 연결하여 심화 탐구함. 방사선이 물질의 원자 구조에 '
-                                                            '미치는 영향을 에너지 준위 변화의 관점에서 상세히 분석하고, 이를 반도체 결함 제어 기술에 응용할 수 있는 가능성을 그림과 수식으로 '
-                                                            '표현하여 탐구의 깊이를 더함. 물리적 현상을 공학적 문제 해결의 도구로 활용하는 능력이 매우 뛰어나며, 향후 재료공학 연구자로서의 잠재력이 '
-                                                            '매우 큼.'},
-                                                     {'학년': '2',
-                                                      '영역': '화학 1',
-                                                      '내용': '분자 궤도함수 이론과 전자쌍 반발 원리를 심화 학습하며, 특정 결정 구조 내에서의 원자 배열이 재료의 전기적 물성에 미치는 영향을 분석함. '
-                                                            '특히 반도체 소재로 활용되는 화합물의 격자 구조를 모델링하고, 원자 간 결합 각도와 전자 밀도 분포를 예측하여 소재의 밴드갭 특성을 '
-                                                            '추론함. 산화-환원 적정 실험에서는 비타민 C의 정량 분석을 넘어, 금속 산화물 나노 입자의 표면 산화 상태를 제어하기 위한 적정법의 응용 '
-                                                            '가능성을 탐구함. 요오드 적정법의 원리를 응용하여 나노 입자 합성 과정에서의 환원제 농도 변화가 입자의 크기 분포에 미치는 영향을 '
-                                                            '정량적으로 도출함. 실험 과정에서 발생한 오차를 단순한 측정 오류로 치부하지 않고, 나노 입자의 응집 현상과 표면 에너지 변화라는 '
-                                                            '재료공학적 관점에서 재해석하여 실험 설계의 정밀도를 높이는 방안을 제시함.'},
-                                                     {'학년': '2',
-                                                      '영역': '생명과학 1',
-                                                      '내용': '생체 모방 공학에 깊은 관심을 두고, 세포막의 선택적 투과성을 모사한 고분자 분리막 설계 원리를 탐구함. 수지상세포의 항원 인식 기전을 '
-                                                            '분자 수준에서 분석하여, 특정 이온만을 선택적으로 통과시키는 이온 교환 막의 표면 개질 기술과 연결함. MHC 분자와 T 림프구 수용체의 '
-                                                            '상호작용을 나노 소재의 표면 기능화 과정에서의 리간드-수용체 결합 모델로 치환하여 설명하는 등, 생물학적 기전을 공학적 시스템으로 '
-                                                            '구조화하는 능력이 탁월함. 특히 세포 내 신호 전달 체계를 회로의 논리 게이트로 비유하여, 외부 자극에 반응하는 스마트 재료의 설계 논리를 '
-                                                            '정립함. 발표 과정에서 면역 반응의 미시적 상호작용을 재료의 결함 제어 기술과 비교하며, 생체 적합성 소재가 갖추어야 할 물리적, 화학적 '
-                                                            '요건을 논리적으로 제시하여 학급 내에서 공학적 통찰력을 공유함.'},
-                                                     {'학년': '2',
-                                                      '영역': '수학 I',
-                                                      '내용': '수학적 모델링을 통해 재료의 물성을 예측하고 최적화하는 역량이 매우 뛰어남. 등비수열의 합 공식을 활용하여 다층 박막 증착 공정에서 각 '
-                                                            '층의 두께가 전체 박막의 전기 저항에 미치는 영향을 수식화함. 삼각함수의 주기성을 활용하여 결정 격자의 진동 모드와 포논(phonon)의 '
-                                                            '분산 관계를 해석하고, 이를 통해 열전도율을 제어하는 나노 구조 설계의 기초 이론을 탐구함. 특히 푸리에 변환을 활용하여 복잡한 파형을 '
-                                                            '주파수 성분으로 분해하는 과정을 학습한 뒤, 이를 재료의 결정 결함 분석을 위한 X선 회절 데이터 해석에 적용함. 지오지브라를 활용해 '
-                                                            '다양한 파형을 합성하며 데이터 노이즈를 제거하는 필터링 알고리즘의 원리를 이해하고, 이를 실제 실험 데이터의 신뢰도를 높이는 분석 도구로 '
-                                                            '활용하는 등 수학적 도구를 공학적 문제 해결에 능숙하게 접목함.'},
-                                                     {'학년': '2',
-                                                      '영역': '물리학 I',
-                                                      '내용': "열역학 제2법칙과 엔트로피 개념을 학습한 후, 이를 재료의 결정 결함 및 무질서도와 연결하여 심층 분석함. '물리 법칙의 보편성과 재료 "
-                                                            "설계의 상관관계'를 주제로, 결정 격자 내 원자 배열의 규칙성이 재료의 기계적 강도에 미치는 영향을 수식으로 증명함. 특히 반도체 박막 "
-                                                            '증착 공정에서 발생하는 열적 스트레스와 원자 확산 현상을 전자기파의 에너지 준위 변화와 연계하여 기술적 해결책을 제시함. 전자기파의 '
-                                                            '파동성과 입자성을 활용한 비파괴 검사 기법을 탐구하며, 재료 내부의 미세 균열을 탐지하는 공학적 원리를 도식화하여 학급 내에서 발표함.'},
-                                                     {'학년': '2',
-                                                      '영역': '화학 I',
-                                                      '내용': '전자 배치와 분자 구조 이론을 바탕으로 차세대 반도체 소재인 전이 금속 디칼코게나이드(TMD)의 결합 구조를 예측하고, 밴드갭 엔지니어링의 '
-                                                            '원리를 탐구함. 질소 도핑이 그래핀의 전자 구조에 미치는 영향을 분자 궤도함수 이론으로 해석하여 전기 전도성 향상 기전을 규명함. 또한 '
-                                                            '산화-환원 반응을 이용한 적정법을 응용하여, 금속 나노 입자의 표면 산화도를 정량적으로 측정하는 실험을 설계함. 실험 과정에서 발생하는 '
-                                                            '오차를 나노 입자의 응집 현상과 표면적 변화에 따른 반응 속도 차이로 분석하는 등 재료공학적 관점의 과학적 탐구 역량을 발휘함.'},
-                                                     {'학년': '2',
-                                                      '영역': '생명과학 I',
-                                                      '내용': '생체 재료의 생체 적합성을 주제로, 세포막의 인지질 이중층 구조와 나노 입자의 상호작용 기전을 발표함. 세포 내 신호 전달 체계와 나노 '
-                                                            '소재의 표면 개질 기술을 연결하여, 약물 전달 시스템(DDS)에 최적화된 고분자 나노 캡슐의 설계 원리를 논리적으로 설명함. 특히 MHC '
-                                                            '분자와 단백질 결합의 특이성을 재료의 표면 기능화 기술과 비교 분석하며, 생체 모방 재료가 나아갈 방향에 대한 통찰을 제시함. 미시적 분자 '
-                                                            '상호작용이 거시적 재료 물성에 미치는 영향을 고찰하며, 공학적 설계가 생명 현상의 한계를 어떻게 극복할 수 있는지에 대해 균형 잡힌 시각을 '
-                                                            '보여줌.'},
-                                                     {'학년': '2',
-                                                      '영역': '재료공학적 윤리 및 사회적 책임',
-                                                      '내용': '언어와 매체 교과에서 신소재 개발이 환경에 미치는 영향과 지속 가능한 발전을 위한 공학자의 윤리적 책무를 탐구함. 특히 희토류 채굴 '
-                                                            '과정에서의 환경 파괴 문제와 이를 대체하기 위한 친환경 소재 합성 기술의 사회적 가치를 분석하며, 기술적 진보가 인류의 삶에 기여해야 하는 '
-                                                            '방향성을 논리적으로 정립함. 교과 탐구 활동을 통해 얻은 인문학적 통찰을 재료공학적 진로와 유기적으로 연결하여, 기술적 효율성뿐만 아니라 '
-                                                            '사회적 책임감을 갖춘 공학자로 성장하려는 의지가 돋보임.'},
-                                                     {'학년': '2',
-                                                      '영역': '수학적 모델링 심화',
-                                                      '내용': '수학 I 교과에서 재료의 결정 구조 내 원자 배열을 수열로 모델링하여 격자 에너지 변화를 계산함. 단순한 수열의 합을 넘어, 결정 결함이 '
-                                                            '재료의 전기적 특성에 미치는 영향을 미분방정식으로 도출하고, 이를 통해 나노 박막의 두께에 따른 저항 변화를 예측하는 심화 모델을 구축함. '
-                                                            '특히 푸리에 변환을 활용하여 재료의 진동 스펙트럼을 분석하고, 결정 격자의 주기성과 파동의 간섭 현상을 수식적으로 해석하여 재료의 물성 '
-                                                            '변화를 정량적으로 규명하는 등 수준 높은 수학적 탐구 역량을 발휘함.'},
-                                                     {'학년': '2',
-                                                      '영역': '기하',
-                                                      '내용': '수업 중 지오지브라를 활용하여 이차곡선의 기하학적 성질을 재료의 결정 구조 분석에 응용함. 원뿔곡선의 정의를 바탕으로 당들랭 구를 도시하여 '
-                                                            '초점의 위치를 기하학적으로 증명하고, 이를 결정 격자 내 원자 간 결합 각도와 거리의 상관관계를 분석하는 데 적용함. 특히 결정면의 절단 '
-                                                            '각도에 따른 회절 패턴의 변화를 기하학적 정사영 개념으로 해석하여, X선 회절 분석(XRD) 데이터의 원리를 수학적으로 유도함. 교과서의 '
-                                                            '이론을 수동적으로 수용하지 않고, 재료공학적 현상과 연결하여 직접 증명하고 모델링하는 과정을 통해 수학적 사고력과 공학적 문제 해결 능력을 '
-                                                            '동시에 입증함.'},
-                                                     {'학년': '2',
-                                                      '영역': '심화 영어 I',
-                                                      '내용': '영어 구사력이 매우 탁월하며, 복잡한 공학적 지문을 읽고 핵심 논리를 파악하는 능력이 최상위권임. 재료공학에 대한 깊은 관심을 바탕으로, '
-                                                            '탄소 나노튜브의 기계적 강도와 전기적 특성에 관한 학술 지문을 발표하며 논리적 맥락을 상세히 설명함. 특히 나노 구조의 결함이 전체 물성에 '
-                                                            '미치는 영향을 분자 수준에서 해석하여 급우들의 높은 평가를 받음. 글쓰기 활동에서는 뛰어난 어휘력과 분석적 사고력을 발휘함. 희토류 자원의 '
-                                                            "편중된 공급망 문제를 단순히 경제적 이슈로 보지 않고, 소재의 대체 기술 개발이라는 공학적 해결책과 연결하여 접근함. 'The "
-                                                            'diversification of material sources is essential for technological '
-                                                            "sovereignty'라는 주제문을 통해 소재 공급망의 안정성이 국가 경쟁력에 미치는 영향을 설득력 있게 논함. 또한, 차세대 반도체 "
-                                                            '소재인 질화갈륨(GaN)의 물성을 학습하며, 기존 실리콘 기반 소자의 한계를 극복하기 위한 밴드갭 엔지니어링의 원리를 조사함. 다양한 학술 '
-                                                            '자료를 통해 얻은 지식을 체계적으로 정리하고, 정확한 공학적 영어 표현을 사용하여 명료한 에세이를 작성함.'},
-                                                     {'학년': '2',
-                                                      '영역': '사회문제 탐구',
-                                                      '내용': '희토류 및 핵심 광물 자원의 독점적 공급 구조가 글로벌 산업에 미치는 영향을 질적 사례 연구를 통해 분석함. 특정 국가의 자원 무기화가 '
-                                                            '첨단 소재 산업의 공급망에 미치는 위협을 심층 면담과 문헌 조사를 통해 이해하고, 자원 안보의 중요성을 체계적으로 정리함. 또한, 폐배터리 '
-                                                            '재활용 과정에서 발생하는 환경 오염 문제를 갈등론의 관점에서 분석하고 기술적 해결 방안을 제시함. 폐배터리 내 유가 금속 회수 공정의 '
-                                                            '효율성 저하와 환경 규제 사이의 갈등 구조를 파악하고, 친환경 습식 제련 기술의 도입이 가져올 사회적 편익을 논리적으로 설명함. 코로나19 '
-                                                            '이후 급증한 전자 폐기물 처리 문제를 지적하며, 소재의 순환 경제 시스템 구축을 위한 연구 계획서를 작성함. 문헌 연구법을 통해 전자 '
-                                                            '폐기물의 통시적 변화를 추적하고, 현재의 물리적 분리 공정의 한계를 극복하기 위한 화학적 선택적 회수 기술의 필요성을 강조함. 특정 지역의 '
-                                                            '폐기물 처리 시설 집중화 문제를 공간적 불평등 관점에서 분석하고, 분산형 자원 회수 시스템의 도입을 제안하는 등 공학적 지식을 사회적 문제 '
-                                                            '해결에 접목하는 역량을 보임.'},
-                                                     {'학년': '2',
-                                                      '영역': '고전과 윤리',
-                                                      '내용': "정의론을 학습하며 '공학적 기술의 발전이 사회적 불평등을 심화시키지 않기 위해 어떤 윤리적 기준이 필요한가?'라는 의문을 제기함. 롤스의 "
-                                                            '정의론을 기술 윤리에 적용하여, 신소재 개발과 같은 혁신적 기술이 사회 구성원 모두에게 공정하게 분배될 수 있는 구조를 고민함. 특히 '
-                                                            '재료공학자로서 신소재를 설계할 때, 해당 기술이 환경에 미치는 영향과 자원 고갈 문제를 고려하는 것이 공학적 정의의 실현임을 깨달음. 노먼 '
-                                                            '대니얼스의 정의론을 확장하여, 기술적 혜택의 분배 문제와 연구자의 사회적 책임에 대해 깊이 있게 탐구함. 수업 시간에 배운 이론이 자신이 '
-                                                            '희망하는 재료공학 분야와 직접적으로 연결된다는 점에 큰 흥미를 느낌. 본인이 장차 재료공학자가 된다면, 고성능 소재를 개발하는 연구 '
-                                                            '역량뿐만 아니라, 기술의 사회적 파급력을 고려하여 지속 가능한 소재 생태계를 구축하는 데 기여하고 싶다는 포부를 밝힘. 기술적 효율성만을 '
-                                                            '추구하는 것이 아니라, 인류의 보편적 가치를 지향하는 공학적 윤리관을 정립하며, 어떤 소재 설계가 공정하고 지속 가능한지 끊임없이 질문하고 '
-                                                            '탐구하는 태도를 보임.'},
-                                                     {'학년': '3',
-                                                      '영역': '독서',
-                                                      '내용': '재료공학적 관점에서 물질의 구조와 물성 간의 상관관계를 탐구하는 데 탁월한 역량을 발휘함. 신소재 관련 전문 서적을 탐독하며 결정 격자 '
-                                                            '구조와 전기적 특성의 연관성을 심도 있게 분석함. 특히 반도체 박막 증착 공정에서 발생하는 결함 제어 기술에 주목하여, 원자 단위의 배열이 '
-                                                            '거시적 물성에 미치는 영향을 탐구함. 탄소 나노튜브와 그래핀의 구조적 특성을 비교하며, 이들이 차세대 에너지 저장 장치인 슈퍼커패시터의 '
-                                                            '전극 소재로서 갖는 잠재력을 논리적으로 서술함. 또한, 고분자 복합 재료의 계면 결합력이 기계적 강도에 미치는 영향을 파악하기 위해 관련 '
-                                                            '학술 논문을 찾아보고, 이를 바탕으로 나노 입자 분산 기술의 최신 동향을 정리함. 연구팀을 구성하여 금속 산화물 나노 입자의 합성 공정을 '
-                                                            '설계하고, 입자 크기 제어를 통한 밴드갭 엔지니어링의 가능성을 탐색함. 탐구 과정에서 얻은 데이터를 시각화하여 학급 내 학술 게시판에 '
-                                                            '공유함으로써, 재료공학적 지식을 공학적 문제 해결의 도구로 활용하는 능력을 입증함. 지식의 습득에 그치지 않고 이를 실제 공학적 설계에 '
-                                                            '적용하려는 태도가 매우 돋보이며, 복잡한 물리적 현상을 재료의 미세 구조적 관점에서 해석하는 분석적 사고력이 매우 뛰어남.'},
-                                                     {'학년': '3',
-                                                      '영역': '고급 수학 I',
-                                                      '내용': '벡터 공간의 대수적 성질을 재료공학의 결정학적 분석에 응용하는 능력이 탁월함. 3차원 공간에서의 벡터 연산을 활용하여 결정 격자의 대칭성과 '
-                                                            '단위 격자의 부피를 계산하는 과정을 논리적으로 전개함. 특히 행렬식을 이용한 일차독립성 판별법을 학습한 후, 이를 다성분계 합금의 상평형 '
-                                                            '해석에 적용하여 성분 간의 독립적인 변수 관계를 규명함. 파이썬의 넘파이 라이브러리를 활용하여 대규모 행렬 연산을 수행하고, 이를 통해 '
-                                                            '나노 입자의 배열 패턴을 시뮬레이션하는 코드를 직접 작성함. 역행렬을 이용한 연립방정식 풀이 과정을 통해 재료의 열전도도와 전기전도도 간의 '
-                                                            '상관관계를 모델링하는 등 수학적 도구를 공학적 문제 해결에 적극적으로 활용함. 복소수의 극형식을 활용하여 교류 회로에서의 임피던스 변화를 '
-                                                            '분석하고, 이를 유전체 재료의 주파수 응답 특성 해석과 연결하는 융합적 사고를 보여줌. 수학적 추상화를 통해 물리적 현상을 정량화하는 '
-                                                            '능력이 매우 뛰어나며, 복잡한 데이터셋을 행렬 형태로 구조화하여 처리하는 과정에서 공학자로서의 논리적 엄밀함을 충분히 보여줌.'},
-                                                     {'학년': '3',
-                                                      '영역': '물리학 II',
-                                                      '내용': '물리학적 원리를 재료공학적 설계에 적용하는 능력이 매우 우수하며, 특히 고체 물리학 분야에서 두각을 나타냄. 2차원 포물선 운동 분석을 '
-                                                            '통해 나노 입자의 증착 궤적을 예측하는 모델을 설계하고, 광선 추적법을 응용하여 박막의 두께 균일도를 측정하는 광학적 분석법을 제안함. '
-                                                            "파동의 회절 단원을 학습한 후 'X선 회절 분석법(XRD)을 이용한 결정성 재료의 격자 상수 측정'을 주제로 심화 탐구를 수행함. 브래그 "
-                                                            '법칙을 바탕으로 결정 구조 내 원자 간 거리를 산출하는 과정을 정밀하게 유도하고, 실제 실험 데이터의 오차 원인을 결정 결함과 연관 지어 '
-                                                            '분석함. 또한, 반도체 소자의 열적 안정성 문제를 해결하기 위해 열역학적 평형 상태와 엔트로피 변화를 고려한 복합 소재의 열전도 특성을 '
-                                                            '탐구함. 현대 물리학의 양자역학적 개념을 고체 내 전자 에너지 준위와 연결하여, 반도체 도핑 공정이 전하 운반자의 이동도에 미치는 영향을 '
-                                                            '논리적으로 설명함. 첨단 재료 공학 기술에 대한 깊은 이해를 바탕으로 이론적 지식을 실제 공학적 난제 해결에 연결하려는 시도가 돋보이며, '
-                                                            '물리학적 사고를 바탕으로 재료의 미세 구조를 제어하려는 공학적 통찰력이 매우 뛰어남.'},
-                                                     {'학년': '3',
-                                                      '영역': '화학 II',
-                                                      '내용': '고체 결정 구조와 에너지 밴드 이론을 주제로 심화 탐구 보고서를 작성함. 금속과 반도체의 전기 전도성 차이를 결정 격자 내 전자 배치와 '
-                                                            '에너지 준위의 중첩 관점에서 분석하여, 재료의 미세 구조가 거시적 물성에 미치는 영향을 논리적으로 규명함. 특히 도핑 농도에 따른 페르미 '
-                                                            '준위의 변화를 수학적 모델링으로 도출하고, 이를 실제 반도체 소자의 전류-전압 특성 곡선과 연결하여 설명함. 교과 수업 중 촉매의 표면 '
-                                                            '반응 기작에 깊은 관심을 보여, 금속 촉매 표면에서의 흡착 에너지와 반응 속도 간의 상관관계를 아레니우스 식을 통해 정량적으로 해석함. '
-                                                            '재료의 결정 결함이 확산 계수에 미치는 영향을 탐구하며, 격자 결함 제어를 통한 소재의 기계적 강도 향상 방안을 제시하는 등 재료공학적 '
-                                                            '사고력을 유감없이 발휘함.'},
-                                                     {'학년': '3',
-                                                      '영역': '정보과학',
-                                                      '내용': '데이터 기반의 소재 설계 역량을 갖추기 위해 머신러닝 알고리즘을 재료 데이터 분석에 적용함. K-최근접 이웃(KNN) 알고리즘을 활용하여 '
-                                                            '다양한 합금 조성에 따른 경도 변화를 예측하는 모델을 구축함. 재료의 결정 구조 데이터와 물리적 성질 간의 상관관계를 파악하기 위해 '
-                                                            '파이썬의 Pandas와 Scikit-learn 라이브러리를 활용하여 데이터 전처리를 수행하고, 시각화 도구를 통해 조성 변화에 따른 물성 '
-                                                            '변화 추이를 그래프로 구현함. 특히 재료의 원자 배열 정보를 입력값으로 하여 결정 구조를 분류하는 신경망 모델을 설계하는 과정에서, 과적합 '
-                                                            '문제를 해결하기 위해 드롭아웃 기법을 적용하는 등 공학적 문제 해결 능력을 보임. 코드의 각 단계마다 주석을 통해 알고리즘의 수학적 근거를 '
-                                                            '상세히 기술하여, 데이터 분석 과정의 투명성과 재현성을 확보하는 등 수준 높은 프로그래밍 역량을 입증함.'},
-                                                     {'학년': '2',
-                                                      '영역': '탐구의 지속성과 일관성',
-                                                      '내용': '재료공학 및 나노 구조 분석: 1학년 때부터 지속해온 나노 소재의 광학적 특성 탐구를 2학년 기하 교과와 연계하여 심화함. 나노 입자의 '
-                                                            '결정면에서 발생하는 빛의 회절 현상을 기하학적 벡터 해석으로 접근하여, 결정 격자의 기하학적 구조와 회절 패턴 간의 상관관계를 수식으로 '
-                                                            '유도함. 타원과 정사영 개념을 활용하여 나노 박막의 두께에 따른 간섭 무늬 변화를 기하학적으로 모델링한 점은, 재료의 미세 구조를 '
-                                                            '수학적으로 해석하려는 공학적 태도가 매우 탁월함을 보여줌. 전공 분야에 대한 일관된 탐구 서사가 돋보이며, 추상적인 수학 개념을 실제 '
-                                                            '재료의 물리적 현상으로 치환하여 분석하는 능력이 매우 뛰어남.'},
-                                                     {'학년': '2',
-                                                      '영역': '인문학적 소양과 사회적 통찰',
-                                                      '내용': '과학기술과 윤리: 신소재 개발이 환경에 미치는 영향과 지속 가능한 공학적 설계를 주제로 탐구함. 탄소 중립을 위한 차세대 배터리 소재의 '
-                                                            '폐기 및 재활용 과정에서 발생하는 사회적 비용을 롤스의 정의론과 공리주의적 관점에서 분석함. 특히 기술의 발전이 특정 계층에 편중되지 않고 '
-                                                            "보편적 복지로 이어져야 한다는 '기술 정의'의 개념을 정립하며, 재료공학자로서 갖추어야 할 사회적 책임감과 윤리적 의사결정 기준을 "
-                                                            '구체화함.'},
-                                                     {'학년': '2',
-                                                      '영역': '교과 간 융합 및 도구 활용',
-                                                      '내용': '고급 수학 & 정보과학: 선형대수학의 행렬 연산 원리를 파이썬의 넘파이(NumPy) 라이브러리로 구현하여, 결정 격자 구조 내 원자 배열의 '
-                                                            '대칭성을 시뮬레이션함. 또한, 재료의 물성 데이터를 처리하기 위해 머신러닝 알고리즘을 활용하여 특정 합금의 강도와 연성을 예측하는 모델을 '
-                                                            '설계함. 데이터 분석을 통해 실험 오차를 보정하고 최적의 공정 조건을 도출하는 과정은 전공 적합성을 보여주는 최상위 수준의 공학적 '
-                                                            '역량임.'},
-                                                     {'학년': '2',
-                                                      '영역': '학술적 전문성 (Hard Core)',
-                                                      '내용': '물리학 II & 화학 II: 반도체 소자의 미세화에 따른 양자 터널링 현상을 물리적으로 해석하고, 이를 제어하기 위한 '
-                                                            '고유전율(High-k) 절연막 소재의 결정 구조를 X선 회절(XRD) 데이터와 브래그 법칙을 통해 분석함. 또한, 금속 산화물 나노 입자의 '
-                                                            '밴드갭 에너지를 조절하여 광전 효율을 극대화하는 메커니즘을 분자 수준에서 규명함. 이러한 심화 이론의 정확한 적용과 실험적 검증 능력은 '
-                                                            '재료공학 분야의 학업적 신뢰를 입증함.'},
-                                                     {'학년': '2',
-                                                      '영역': '보완점 제언',
-                                                      '내용': '재료공학 심화 탐구 및 학술적 글쓰기: 나노 소재의 물성 분석과 공정 설계 프로젝트를 병렬적으로 나열할 때, 각 실험 단계 간의 인과적 '
-                                                            '연결 고리를 더욱 명확히 서술할 필요가 있음. 특히 전고체 배터리 전해질의 이온 전도도 향상 탐구에서, 실험 데이터의 통계적 유의성을 '
-                                                            '확보하기 위한 변인 통제 과정을 구체화해야 함. 단순한 현상 나열보다는 공학적 문제 정의에서부터 최적화된 소재 설계에 이르는 논리적 흐름을 '
-                                                            '강화하는 것이, 재료공학부 진학을 위한 학업 역량 증명에 있어 훨씬 전략적이고 설득력 있는 서사가 될 것임.'}],
-                                      'comments': [{'구분': '기타 합격 대학', '내용': '카이스트 신소재공학과, 포스텍 신소재공학과, 연세대학교 신소재공학부'},
-                                                   {'구분': '고등학교', '내용': '과학고 내신 1.1 ~ 1.3'},
-                                                   {'구분': '총평',
-                                                    '내용': '과학고의 치열한 학업 환경 속에서도 1점대 초반의 최상위 내신을 유지한 점은 학생의 학업 역량이 이미 대학 수준의 기초 학문을 소화할 준비가 '
-                                                          '되었음을 방증한다. 특히 1학년 때부터 나노 소재 합성 및 물성 분석이라는 일관된 주제를 중심으로 생기부 서사를 구축한 점이 매우 인상적이다. '
-                                                          '단순한 지식 습득을 넘어 결정 구조와 전기적 특성의 상관관계를 규명하는 등 심화 탐구의 깊이가 남다르며, 재료공학부 합격생 중에서도 최상위권의 '
-                                                          '평가를 받았을 것으로 분석된다.'},
-                                                   {'구분': '장애측정기준 관련',
-                                                    '내용': "나노 소재의 결함 제어 및 물성 측정 기준에 대한 탐구는 재료공학을 지망하는 학생에게 매우 효과적이고 전문적인 소재이다. 다만 '실험 기구 "
-                                                          "관리'와 같은 활동을 단순히 나열하기보다는, 실제 실험 과정에서 학생이 직면했던 오차의 원인을 분석하고 이를 해결하기 위해 어떤 정밀 측정 "
-                                                          '장비를 도입하여 데이터를 보정했는지 등 주도적인 문제 해결 과정을 스토리 형식으로 구체화하는 것이 훨씬 설득력이 높다.'},
-                                                   {'구분': '의료기기 및 강제입원 토론',
-                                                    '내용': '1. 재료공학을 지망하는 학생들 중 간혹 기존의 금속 소재 대비 신소재의 우수성만을 지나치게 강조하며 기존 공학적 관점을 폄하하는 경우가 '
-                                                          '있는데, 이는 지양해야 한다. 최근 공학계에서 하이브리드 소재와 기존 소재의 상호보완적 결합이 강조되는 추세이므로, 다양한 산업 현장과의 '
-                                                          '융화를 중시하는 학풍을 고려하여 균형 잡힌 시각을 견지해야 한다. 2. 면접이 최종 당락에 지대한 영향을 미치는 만큼, 저학년 때부터 차세대 '
-                                                          '에너지 저장 장치나 반도체 소자의 안정성에 대해 지속적인 토론 기회를 갖는 것은 매우 긍정적이다. 다만 학생의 주장은 전략적으로 공학적 타당성 '
-                                                          '내에 위치해야 하므로, 지나치게 급진적인 가설보다는 검증 가능한 데이터 기반의 논리를 펼치는 것이 좋다.'},
-                                                   {'구분': 'SIR 모델 관련',
-                                                    '내용': '나노 입자의 확산 및 결정 성장 모델링에 대한 소재로 참여했던 활동은 매우 훌륭하다. 다만 결정 성장 속도론(Kinetics) 및 수치 해석적 '
-                                                          '모델링을 통한 물성 예측에 대한 전문적인 지식이 다소 부족하여, 시뮬레이션 결과와 실제 실험값 사이의 괴리를 심도 있게 분석하지 못한 점은 '
-                                                          '아쉬움으로 남는다. 향후에는 파이썬 등을 활용한 데이터 분석 역량을 강화하여 탐구의 정밀도를 높일 필요가 있다.'},
-                                                   {'구분': '고흡수성 수지 대체재 연구',
-                                                    '내용': "'동기-구체적인 실험 설계-결과 분석'으로 이어지는 서술 구조가 매우 탄탄하다. 다만 WADA 중 'A(Agenda)'를 명확히 짚어줄 경우 "
-                                                          '읽는 사람의 입장에서 해당 활동의 공학적 가치를 즉각적으로 파악할 수 있다. 가령 "친환경 고분자 복합체 기반의 고흡수성 수지 대체재 개발: '
-                                                          '가교 밀도 최적화를 통한 흡수 성능 향상 연구"와 같이 구체적인 공학적 목표를 명시적으로 제목화하여 정리하는 것을 강력히 추천한다.'},
-                                                   {'구분': '정신장애 및 대체의학 토론',
-                                                    '내용': '선생님들로부터 "공학적 직관이 매우 뛰어난 학생"이라는 평가를 받는 것은 생기부 전체의 신뢰도를 높이는 데 결정적인 역할을 한다. 평소 수업 '
-                                                          '시간의 질의응답을 통해 선생님들과 학문적 교감을 쌓는 것은 수시 합격을 위한 필수적인 선결조건이다. 이러한 긍정적인 인상을 바탕으로 자신의 '
-                                                          '탐구 역량을 더욱 공고히 하길 바란다.'},
-                                                   {'구분': '법의학 관련',
-                                                    '내용': '재료공학적 관점에서 법의학적 증거 분석에 활용되는 분광학적 기법이나 나노 센서 기술에 대한 탐구는 매우 참신한 소재이다. 다만 단순히 기술의 '
-                                                          '나열에 그치지 말고, 해당 기술이 실제 현장에서 어떻게 재료의 변형이나 부식 상태를 분석하여 사건의 단서를 제공하는지, 그 공학적 원리와 '
-                                                          '윤리적 책임에 대한 성찰을 함께 기술하는 것이 훨씬 깊이 있는 생기부가 될 것이다.'},
-                                                   {'구분': '인재상 및 페르소나',
-                                                    '내용': "'세상에 기여하는 공학자', '기술로 소통하는 지성인' 등 대학이 요구하는 인재상은 다양하지만, 결국 선발자의 주관이 개입되는 과정에서 가장 "
-                                                          "중요한 것은 '명확한 페르소나'이다. 위 학생의 경우 '데이터 기반의 정밀한 실험 설계 능력을 갖춘 재료공학도'라는 페르소나가 매우 뚜렷하다. "
-                                                          '학업 능력에만 매몰되어 공학적 소통 능력이나 협업 역량을 놓치는 우를 범하지 않도록 주의해야 한다.'},
-                                                   {'구분': '소장암 탐구활동',
-                                                    '내용': '생체 재료로서의 고분자 지지체에 대한 호기심에서 출발하여, 세포 부착 효율을 높이기 위한 표면 개질 기술, 팀원들과의 협업을 통한 시제품 '
-                                                          '제작, 발표회에 이르기까지 일련의 연속성 있는 탐구 과정을 기술한 점이 매우 훌륭하다. 재료공학 분야의 탐구활동을 기술할 때 전문성 있는 '
-                                                          '지식도 중요하지만, 이처럼 탐구의 과정이 논리적 연결성을 가지고 이어지는 것이 합격의 핵심이다.'},
-                                                   {'구분': '생물약동학 실험 설계',
-                                                    '내용': "'약물 전달 시스템(DDS)을 위한 나노 입자 설계'에 대한 흥미로 시작한 탐구가 실제 실험에서는 단순한 확산 실험으로 변질된 점은 아쉽다. "
-                                                          '메디컬 및 바이오 재료 분야의 탐구활동을 기술할 때 흔히 하는 실수가 활동 사이의 연결 고리가 논리적으로 끊기는 경우이다. 약물 전달 효율과 '
-                                                          '나노 입자의 표면 전하 특성은 재료공학적으로 매우 밀접한 관계가 있으므로, 이를 독립적인 실험이 아닌 하나의 통합된 공학적 문제 해결 과정으로 '
-                                                          '재구성해야 한다.'},
-                                                   {'구분': '수학 심화탐구의 위계',
-                                                    '내용': "수학 심화탐구에는 두 가지 위계가 있다. 첫째는 학습 내용을 실생활에 '대응'시키는 것이고, 둘째는 학습 내용을 '비틀거나 확장'하는 것이다. "
-                                                          '가령 미분방정식을 학습한 이후, 이를 재료의 열전도 방정식에 적용하여 시간에 따른 온도 분포를 예측하는 모델을 설계하는 것이 두 번째 위계에 '
-                                                          '해당한다. 첫 번째 위계만으로 세특을 채우기보다는, 두 위계가 조화를 이루어야 심화 학습이 이루어진 생기부라는 인상을 줄 수 있다.'},
-                                                   {'구분': '영어 세특의 전략적 우위',
-                                                    '내용': '최상위권 학생일수록 세특 서두에 학생의 페르소나를 담은 문장으로 시작하는 경우가 많다. "재료공학 분야의 최신 영문 논문을 스스로 해석하고 '
-                                                          '비판적 사고를 전개하는 능력이 탁월함."과 같은 문장은 매우 눈에 띄는 긍정적인 표현이다. 특히 재료공학 분야는 영어로 된 최신 연구 동향 '
-                                                          '파악이 필수적이므로, 이러한 영어 교과목 세부능력 특기사항은 학생의 전공 적합성을 입증하는 좋은 예시가 된다.'},
-                                                   {'구분': '통합과학 및 과학탐구실험 관련',
-                                                    '내용': '나노 구조체의 광학적 특성에 대한 물리적 지식을 논리적으로 기술하고 있다. 빛의 회절, 간섭, 결정 구조와 같은 중요한 키워드를 잘 집어서 '
-                                                          '서술하고 있지만, 학생이 직접 어떤 변인을 통제하여 실험을 설계하고, 그 결과로 얻은 데이터를 어떻게 해석했는지에 초점을 맞춰 기술하면 훨씬 '
-                                                          '효과적이다.'},
-                                                   {'구분': '철학 관련',
-                                                    '내용': '철학은 공학적 윤리를 정립하는 데 훌륭한 소재를 제공한다. 하나는 위 경우와 같이 뇌과학과 인간의 사고를 접목하는 것이고, 다른 하나는 신소재 '
-                                                          '개발이 가져올 환경적, 사회적 파급효과에 대해 철학적 근거를 바탕으로 판단을 내리는 것이다. 두 요소 모두 생기부 전반에 걸쳐 어필되어야 하는 '
-                                                          '만큼, 자신의 생기부에서 부족하다고 생각되는 측면을 적재적소에 배치하여 균형을 맞추는 것이 중요하다.'},
-                                                   {'구분': '논술 관련',
-                                                    '내용': "'재료의 미래'라는 책을 읽고 나노 소재의 안전성에 대해 양자역학적 관점에서 설명하려 한 아이디어는 훌륭하다. 다만 이후 탐구활동을 더 깊이 "
-                                                          "있는 내용으로 구성해야 한다. 가령 '나노 독성학의 발전 과정 조사 및 신소재의 생체 적합성'에 대해 친구들과 의견을 나누었다는 것은 다소 "
-                                                          '추상적이다. 해당 분야에 대한 구체적인 실험 데이터나 논문 분석을 통해 깊이 있는 탐구를 했다는 인상을 주어야 한다.'},
-                                                   {'구분': '체육 관련',
-                                                    '내용': "재료공학을 전공하는 학생의 경우 체육 교과 세특에서 관련 진로를 언급할 시 '어색한 억지 연관'으로 보일 가능성이 있다. 그러나 스포츠 장비의 "
-                                                          '소재 공학적 측면(예: 탄소 섬유의 강도와 탄성)은 재료공학과 뗄 수 없는 관계에 있다. 따라서 메디컬이나 공학을 지망하는 학생이라면 체육 '
-                                                          '교과에서 스포츠 장비의 소재 분석을 통해 진로 적합성을 드러내도 좋다. 음악, 미술 교과에도 동일하게 적용되는 이야기다.'},
-                                                   {'구분': '언어와 매체 관련',
-                                                    '내용': '재료공학에 본격적으로 관심을 갖기 시작한 2학년부터 세부능력 특기사항에 꼭 물리나 화학이 아니어도 이렇게 인문학적, 사회적인 관점에서 공학 '
-                                                          '기술의 사회적 영향력을 드러낼 수 있다. 단, 억지로 기술하는 것보단 이처럼 매체의 특성에 대한 해당 교과목의 탐구를 기술한 뒤, 공학 기술 '
-                                                          '매체의 순기능과 역기능에 대해서도 이어서 관심을 가지고 탐구해보았다는 자연스럽고 인과성이 충분한 서술이 중요하다.'},
-                                                   {'구분': '수학 1 관련',
-                                                    '내용': '수학 세부능력 특기사항에서도 이런 방식으로 관심 분야인 재료공학과 연결된 기술을 이어갈 수 있다. 다만 나노 입자의 분포를 등비수열의 합이라는 '
-                                                          '방식으로 계산한 것은 다소 간단한 주제이다. 조금 더 확장해서 나노 박막의 두께 제어, 결정 격자의 주기성 등을 종합한 수열의 합을 통한 '
-                                                          '수학적 모델 등 보다 심화된 주제를 선정하고 기술해야 한다. 푸리에 변환이라는 소재는 좋았지만, 이를 재료의 결정 구조 분석(XRD 데이터 '
-                                                          '해석)과 연결 짓는 부분도 보강이 필요하다.'},
-                                                   {'구분': '한국사 관련',
-                                                    '내용': '이처럼 한국사 세부능력 특기사항에도 재료공학의 역사에 대한 관심이 드러나도록 기술하는 것도 가능하다. 각각의 내용이 모두 금속 공학 역사에 '
-                                                          '있어서 중요한 내용이지만, 여러 가지 주제를 단순 나열하는 방식보다 한 가지 관심 있었던 주제를 정한 후 해당 주제에 대한 주도적인 탐구 '
-                                                          '과정을 담으면 좋다.'},
-                                                   {'구분': '화학 1 및 생명과학 1 관련',
-                                                    '내용': '전고체 배터리의 전해질 안정성에 대한 소재로 화학적 구조와 이온 전도도에 대한 탐구활동을 기술한 점이 좋았다. 실제 재료공학 필드에서 중요한 '
-                                                          "분야이고, 탐구 내용 또한 전문성을 담고 있다. 다만 앞선 경우와 마찬가지로 '-을 알게 됨'과 같은 단순 지식 열거는 학생 주도적 탐구활동을 "
-                                                          '실제로 수행했다는 인상을 남기지 못하므로 주의해야 한다. 화학 1 세부능력 특기사항의 기술과 비교해보면 좋다. 마찬가지로 박막 증착 과정에서의 '
-                                                          '결함 제어라는 재료공학 현장에서 중요하게 다루는 아주 좋은 소재를 선정했다. 차이점은 단순히 전문성을 갖춘 지식을 열거하는 방식이 아니라 '
-                                                          '학생이 실제로 탐구하고 고민하면서 전문성이 쌓여가는 일련의 스토리가 담겨 있다는 점이다.'},
-                                                   {'구분': '종합 의견',
-                                                    '내용': "이 학생의 2학년 세특은 **'공학적 전문성'**과 **'인문학적 소양'**이 균형을 이루고 있습니다. 특히 **전고체 배터리의 전해질 안정성 "
-                                                          '분석**이나 **나노 박막의 열전도도 제어 프로젝트**는 재료공학부 교수들이 선호하는 심화 주제입니다.'}]},
- 'case_1_natural_science_computer_science': {'personal_info': {'대상': '서울대학교 컴퓨터공학부 합격생',
-                                                               '고등학교_유형': '과학고등학교',
-                                                               '내신_성적': '1.1 ~ 1.3',
-                                                               '주요_특징': '심화 수학 및 정보과학 교과에서 탁월한 성취를 보였으며, 알고리즘 설계와 데이터 구조에 대한 깊은 이해를 바탕으로 '
-                                                                        '교내외 프로그래밍 경진대회에서 다수 입상함. 1학년 때부터 인공지능 모델 최적화와 분산 컴퓨팅 시스템에 관심을 두고 '
-                                                                        '체계적인 탐구 활동을 수행함.',
-                                                               '총평': '과학고등학교의 치열한 경쟁 환경 속에서도 1.1등급대의 최상위 내신을 유지하며 학업 역량을 증명했다. 단순히 교과 지식을 '
-                                                                     '습득하는 것에 그치지 않고, 복잡한 알고리즘 문제를 해결하기 위한 논리적 사고 과정과 프로젝트 수행 능력이 매우 뛰어나다. '
-                                                                     '특히 컴퓨터공학 분야에 대한 일관된 탐구 서사가 생기부 전반에 걸쳐 유기적으로 연결되어 있어, 서울대학교 컴퓨터공학부 '
-                                                                     '합격생 중에서도 독보적인 전공 적합성과 연구 잠재력을 갖춘 인재로 평가된다.',
-                                                               '기타_합격_대학': '카이스트 전산학부, 포스텍 컴퓨터공학과, 연세대학교 컴퓨터과학과'},
-                                             'activities': [{'학년': '1',
-                                                             '영역': '자율활동',
-                                                             '내용': '학급 내 정보화 기기 관리 및 디지털 환경 개선을 담당하며, 효율적인 데이터 공유를 위한 클라우드 환경을 구축하여 학급 운영의 '
-                                                                   '효율성을 높임. 교내 정보 윤리 캠페인에 참여하여 개인정보 보호의 중요성을 알리고, 디지털 리터러시 교육의 필요성을 역설함. '
-                                                                   "자율탐구시간에는 '그래프 이론을 활용한 최단 경로 알고리즘의 효율성 분석'을 주제로 탐구함. 다익스트라 알고리즘과 A* "
-                                                                   '알고리즘의 시간 복잡도를 비교하고, 실제 교내 지도를 그래프로 모델링하여 최적의 이동 경로를 산출하는 프로그램을 파이썬으로 '
-                                                                   "구현함. 교육청 주관 학생 데이터 분석 발표회에서 '빅데이터 기반의 교내 급식 선호도 예측 모델'을 주제로 발표함. 설문 "
-                                                                   '데이터를 수집하여 결측치를 처리하고, 상관관계 분석을 통해 주요 변수를 도출한 뒤 시각화 라이브러리를 활용해 결과를 효과적으로 '
-                                                                   '전달함. 데이터의 편향성을 최소화하기 위한 샘플링 기법을 논리적으로 설명하여 심사위원들로부터 데이터 과학적 소양을 갖추었다는 '
-                                                                   '평가를 받음.'},
-                                                            {'학년': '1',
-                                                             '영역': '동아리활동',
-                                                             '내용': "컴퓨터공학 심화 동아리에서 '분산 컴퓨팅 환경에서의 데이터 일관성 유지 전략'을 주제로 심도 있는 토론과 프로젝트를 주도함. "
-                                                                   "'블록체인 기술의 탈중앙화가 보안에 미치는 영향'에 대해 찬반 토론을 진행하며, 합의 알고리즘의 작동 원리와 보안 취약점을 "
-                                                                   '기술적 관점에서 분석함. 특히 작업 증명(PoW)과 지분 증명(PoS)의 에너지 효율성 및 보안성을 비교하며, 미래 컴퓨팅 '
-                                                                   "시스템이 나아가야 할 방향에 대해 논리적으로 의견을 개진함. 또한, '인공지능의 윤리적 책임 소재'에 관한 토론에서 알고리즘의 "
-                                                                   '블랙박스 문제를 해결하기 위한 설명 가능한 인공지능(XAI)의 필요성을 강조함. 동아리 내에서 파이썬 기반의 소규모 프로젝트 '
-                                                                   '팀을 이끌며, 코드 리뷰를 통해 가독성 높은 코드를 작성하는 방법과 버전 관리 시스템인 Git의 활용법을 동료들에게 공유함. '
-                                                                   '복잡한 기술적 문제를 단순화하여 설명하는 능력이 탁월하며, 팀원들의 의견을 수렴하여 최적의 기술 스택을 결정하는 리더십을 '
-                                                                   '발휘함.'},
-                                                            {'학년': '1',
-                                                             '영역': '진로활동',
-                                                             '내용': '(희망분야: 컴퓨터공학부) 감염병 확산 시뮬레이션 강연을 통해 SIR 모델의 수학적 구조를 파악하고, 이를 파이썬 코드로 '
-                                                                   '구현하여 변수 변화에 따른 확산 양상을 시각화함. 기초감염재생산지수(R0)의 변화가 시스템의 안정성에 미치는 영향을 분석하며, '
-                                                                   '미분 방정식을 활용한 모델링의 중요성을 체감함. 진로탐색의 날 수학 강연에서는 AI 모델의 학습 원리인 경사하강법과 행렬 '
-                                                                   '연산의 관계를 심층적으로 탐구함. 특히 신경망의 가중치 업데이트 과정에서 발생하는 오차 역전파 알고리즘을 수학적으로 유도하고, '
-                                                                   "이를 실제 머신러닝 프레임워크에 적용하는 과정을 급우들에게 발표함. 또한, '정밀 컴퓨팅을 위한 데이터 구조 최적화'를 주제로 "
-                                                                   '한 명사 초청 특강에 참여하여, 대규모 데이터 처리를 위한 해시 테이블과 트리 구조의 효율성을 고찰함. 유전자 염기서열 분석 '
-                                                                   '데이터를 효율적으로 탐색하기 위한 접미사 트리(Suffix Tree) 알고리즘을 조사하고, 이를 컴퓨터공학적 관점에서 어떻게 '
-                                                                   '최적화할 수 있을지 고민하며 전공에 대한 학문적 열정을 구체화함.'},
-                                                            {'학년': '2',
-                                                             '영역': '자율활동',
-                                                             '내용': '컴퓨터공학적 관점에서 사용자 인터페이스(UI)의 효율성을 극대화하기 위해, 노년층의 인지적 특성과 신체적 제약을 고려한 지능형 '
-                                                                   '키오스크 최적화 알고리즘을 설계함. 시야각과 팔 관절 가동범위를 데이터화하여 지오지브라로 시뮬레이션하고, 사용자별 키와 거리에 '
-                                                                   '따른 최적의 버튼 배치 좌표를 산출하는 최적화 모델을 구축함. 단순히 물리적 위치를 조정하는 것을 넘어, 사용자의 반응 속도와 '
-                                                                   "오류율을 최소화하기 위한 휴리스틱 알고리즘을 제안하며 '사용성'을 정량적 지표로 변환하는 논리적 사고력을 보여줌. 또한, 환경 "
-                                                                   '문제 해결을 위해 고흡수성 수지를 대체할 친환경 고분자 소재의 흡수율을 파이썬으로 모델링함. 알긴산 나트륨과 젖산 칼슘의 배합 '
-                                                                   '비율에 따른 흡수력 변화 데이터를 수집하고, 이를 회귀 분석하여 최적의 배합비를 도출하는 과정을 거침. 실험 과정에서 발생한 '
-                                                                   '오차를 분자 구조적 관점에서 해석하고, 데이터의 신뢰성을 확보하기 위해 반복 실험을 수행하며 공학적 문제 해결 역량을 입증함. '
-                                                                   '특히, 소프트웨어와 하드웨어의 결합을 통해 실생활의 불편함을 기술적으로 해결하려는 태도가 돋보이며, 알고리즘 설계의 기초가 '
-                                                                   '되는 수학적 모델링 능력이 매우 탁월함.'},
-                                                            {'학년': '2',
-                                                             '영역': '동아리활동',
-                                                             '내용': "컴퓨터공학 심화 동아리에서 '알고리즘의 공정성과 윤리적 책임'을 주제로 심층 토론을 주도함. '인공지능 모델의 학습 데이터 "
-                                                                   "편향성이 사회적 차별을 고착화할 수 있는가'라는 주제로, 데이터셋의 불균형이 모델의 예측 결과에 미치는 영향을 기술적으로 "
-                                                                   '분석함. 단순히 윤리적 측면을 논하는 데 그치지 않고, 알고리즘의 가중치 조정과 데이터 정규화 기법을 통해 편향성을 완화할 수 '
-                                                                   "있는 기술적 대안을 제시함. 또한, '분산 컴퓨팅 환경에서의 데이터 보안과 프라이버시 보호'를 주제로 토론을 이끌며, 블록체인 "
-                                                                   '기반의 탈중앙화 시스템이 개인정보 보호에 기여할 수 있는 메커니즘을 설명함. 토론 과정에서 상대방의 논리적 허점을 파악하고, '
-                                                                   '복잡한 기술적 개념을 대중이 이해하기 쉽게 구조화하여 전달하는 능력이 매우 뛰어남. 다양한 관점을 비판적으로 수용하면서도, '
-                                                                   '컴퓨터공학자로서 가져야 할 기술적 윤리 의식을 정립하는 모습이 인상적임. 특히, 기술이 사회에 미치는 파급력을 고려하여 시스템 '
-                                                                   '설계 단계에서부터 보안과 윤리를 내재화해야 한다는 주장은 동료들에게 깊은 인상을 남겼으며, 논리적 사고력과 커뮤니케이션 능력을 '
-                                                                   '겸비한 차세대 공학도로서의 자질을 충분히 보여줌.'},
-                                                            {'학년': '2',
-                                                             '영역': '진로활동',
-                                                             '내용': "(희망분야: 컴퓨터공학부) '뇌-기계 인터페이스(BMI)와 신경망 모델링' 강연을 통해 뇌 신호를 디지털 데이터로 변환하는 "
-                                                                   '신호 처리 기술과 인공 신경망의 연관성을 심도 있게 탐구함. 비침습적 자극 기술의 발전이 미래의 휴먼-컴퓨터 '
-                                                                   "인터랙션(HCI)에 미칠 영향을 분석하고, 초정밀 신경 신호 해석을 위한 딥러닝 모델의 구조를 조사함. 특히 '동형암호 기반의 "
-                                                                   "데이터 프라이버시 보호 기술'에 깊은 관심을 보이며, 동형암호가 클라우드 컴퓨팅 환경에서 개인정보를 유지하면서 데이터를 "
-                                                                   '연산하는 원리를 수학적으로 파악함. 코로나19 동선 추적 앱의 사례를 통해 암호화된 데이터의 효율적 처리와 보안성 사이의 '
-                                                                   "트레이드오프를 분석하고, 이를 최적화하기 위한 알고리즘 개선 방안을 고민함. 또한, '생명공학 데이터 분석과 알고리즘' 강연을 "
-                                                                   '통해 CRISPR/CAS9 유전자 편집 기술의 효율성을 높이기 위한 가이드 RNA 설계 알고리즘의 중요성을 학습함. 생물학적 '
-                                                                   '데이터를 대규모로 처리하고 분석하는 과정에서 효율적인 데이터 구조와 알고리즘의 필요성을 절감하고, 이를 컴퓨터공학적 관점에서 '
-                                                                   "어떻게 최적화할지 진지하게 성찰함. 진로 탐색 활동으로 '컴퓨터 과학의 미래와 인공지능 윤리' 강의를 수강하며, 기술 발전이 "
-                                                                   '가져올 사회적 변화에 대비하는 공학자의 사명감을 다짐함.'},
-                                                            {'학년': '1',
-                                                             '영역': '과학탐구실험',
-                                                             '내용': '물리적 현상을 데이터로 정량화하여 분석하는 역량이 탁월하며, 이를 컴퓨터공학적 모델링으로 확장하려는 시도가 돋보임. 자유 낙하 '
-                                                                   '및 포물선 운동 실험에서 영상 분석 소프트웨어를 활용해 픽셀 단위의 좌표 데이터를 추출하고, 이를 파이썬으로 시각화하여 '
-                                                                   '이론값과 실제 측정값의 오차를 분석함. 빛의 분산 실험에서는 뉴턴의 광학 이론을 재검증하는 과정에서 빛의 파장별 굴절률 차이를 '
-                                                                   '수치화하여 유리컵의 기하학적 구조가 빛의 경로에 미치는 영향을 계산함. 특히 태양광 발전 기반의 친환경 정수기 설계 '
-                                                                   '프로젝트에서는 센서를 통해 수질 데이터를 실시간으로 수집하고, 이를 최적화 알고리즘으로 제어하는 시스템을 구상하여 공학적 문제 '
-                                                                   '해결 능력을 입증함. 실험 후에는 생명과학적 시각을 결합하여 인간의 색채 지각 메커니즘을 신경망 모델링 관점에서 고찰하는 등 '
-                                                                   '학문 간 융합적 탐구 태도가 매우 우수함.'},
-                                                            {'학년': '2',
-                                                             '영역': '철학',
-                                                             '내용': "동양철학의 논리 체계를 현대의 인공지능 윤리 및 뇌과학적 관점에서 재해석하는 독창적인 탐구 역량을 보여줌. 양명학의 '심즉리' "
-                                                                   '개념을 인간의 의사결정 알고리즘으로 치환하여, 외부 자극에 대한 반응이 학습된 데이터와 선험적 규범 사이에서 어떻게 처리되는지 '
-                                                                   '분석함. 특히 이지의 철학을 현대 뇌과학의 전두엽 기능과 연결하여, 도덕적 선택이 신경망의 가중치 조절을 통해 이루어지는 '
-                                                                   '과정과 유사함을 논리적으로 논증함. 이 과정에서 인간의 도덕적 판단을 기계 학습 모델의 의사결정 과정과 비교하며, 알고리즘의 '
-                                                                   '편향성 문제를 철학적 담론으로 확장함. 추상적인 철학적 명제를 컴퓨터공학적 시스템 설계 원리로 변환하여 설명하는 능력이 '
-                                                                   '뛰어나며, 인공지능의 윤리적 가이드라인 수립에 필요한 인문학적 소양을 충분히 갖추고 있음.'},
-                                                            {'학년': '2',
-                                                             '영역': '논술',
-                                                             '내용': '복잡한 사회적 갈등 구조를 시스템 이론으로 분석하고, 학문 간 융합을 통해 문제 해결의 실마리를 찾는 통찰력이 돋보임. 소설 '
-                                                                   '속 갈등 양상을 게임 이론의 관점에서 분석하여 최적의 중재 전략을 도출하고, 이를 배려 윤리와 결합하여 시스템의 안정성을 '
-                                                                   "높이는 방안을 제시함. 슈뢰딩거의 '생명이란 무엇인가'를 읽고 유전 정보의 안정성을 양자역학적 에너지 준위와 정보 이론의 "
-                                                                   "관점에서 재해석하며, 생명 현상을 데이터 처리 과정으로 이해하는 공학적 통찰을 보여줌. 또한 '꿈의 해석'을 주제로 한 "
-                                                                   '토론에서는 무의식의 데이터를 과학적으로 검증 가능한 모델로 변환할 수 있는지에 대해 반증 가능성의 원리를 들어 비판적으로 '
-                                                                   '고찰함. 논리적 글쓰기를 통해 자신의 공학적 가치관을 정립하고, 과학 기술이 사회에 미치는 영향력을 다각도로 분석하는 균형 '
-                                                                   '잡힌 시각을 견지함.'},
-                                                            {'학년': '2',
-                                                             '영역': '체육',
-                                                             '내용': '체육 수업 전반에 걸쳐 탁월한 신체 제어 능력과 전략적 사고를 발휘하는 학생임. 농구와 배드민턴 수행평가 시 단순히 기술을 '
-                                                                   '습득하는 것에 그치지 않고, 팀의 승리를 위해 공간을 점유하고 효율적인 패스 경로를 설계하는 등 컴퓨터공학적 알고리즘 사고를 '
-                                                                   '스포츠에 접목하는 모습을 보임. 특히 태권도 품새 학습 과정에서 동작의 정확성과 속도를 데이터화하여 스스로의 자세를 교정하는 '
-                                                                   '메타인지적 태도를 견지함. 이러한 분석적 접근은 신체 활동을 단순한 운동이 아닌 최적화 문제로 인식하게 하며, 기술적 성장을 '
-                                                                   '가속화하는 원동력이 됨. 또한, 팀 스포츠 상황에서 발생하는 다양한 변수를 실시간으로 계산하여 최선의 대응책을 도출하는 과정은 '
-                                                                   '문제 해결 역량의 단면을 잘 보여줌. 신체적 감각과 논리적 분석력을 동시에 갖추어 어떠한 환경에서도 빠르게 적응하며, '
-                                                                   '팀원들과의 협업 과정에서도 명확한 의사소통을 통해 효율적인 전술을 구현하는 등 리더십과 협동심을 겸비한 인재임.'},
-                                                            {'학년': '2',
-                                                             '영역': '언어와 매체',
-                                                             '내용': "매체 자료의 수용과 생산 과정을 비판적으로 분석하고, 이를 디지털 정보 환경의 개선 방향과 연결하는 통찰력이 뛰어남. '백신을 "
-                                                                   "둘러싼 인본주의와 자본주의의 전쟁'이라는 기사문을 분석하며, 정보의 편향성이 여론 형성에 미치는 영향을 논리적으로 파악함. "
-                                                                   "이후 부스터샷 갈등을 주제로 '코로나19 상황에서 거대 제약사는 인본주의적 가치를 우선해야 한다'는 기사문을 작성하여, 기술적 "
-                                                                   '발전이 사회적 책임과 어떻게 조화를 이루어야 하는지에 대한 자신의 견해를 명확히 밝힘. 특히 세계 최대 비디오 플랫폼의 '
-                                                                   '알고리즘이 정보를 제시하는 방식과 사용자 데이터 수집 체계에 깊은 관심을 보임. 의학 채널의 순기능과 역기능을 탐구하며, '
-                                                                   '알고리즘에 의한 정보 필터 버블 현상이 허위 정보 확산에 미치는 위험성을 인지함. 이를 해결하기 위해 정보 제공자의 신뢰성을 '
-                                                                   '검증하는 알고리즘 설계의 필요성을 역설하며, 컴퓨터공학자로서 향후 정보의 투명성과 공정성을 확보할 수 있는 시스템을 '
-                                                                   '구축하겠다는 구체적인 진로 의지를 드러냄.'},
-                                                            {'학년': '2',
-                                                             '영역': '수학 1',
-                                                             '내용': '수학적 개념을 컴퓨터공학적 모델링으로 확장하는 능력이 매우 탁월함. 수열의 일반항과 합을 함수적 관점에서 해석하여 복잡한 '
-                                                                   '실생활 문제를 효율적으로 해결함. 특히 약물의 체내 잔류량을 등비수열의 합으로 모델링하고, 복용 주기와 용량 변화에 따른 '
-                                                                   '잔류량의 수렴값을 계산하여 최적의 투약 알고리즘을 설계함. 이 과정에서 단순히 수식을 푸는 것을 넘어, 시스템의 안정성을 '
-                                                                   '확보하기 위한 경계 조건을 설정하는 등 공학적 설계 역량을 발휘함. 또한 삼각함수의 주기성을 학습한 후, 심전도 파형 분석에 '
-                                                                   '활용되는 푸리에 변환의 수학적 원리에 깊은 호기심을 보임. 오일러 공식을 통해 삼각함수와 지수함수의 관계를 증명하고, '
-                                                                   '지오지브라를 활용하여 다양한 진동수를 가진 함수를 합성함으로써 복잡한 파형을 분해하는 과정을 시각화함. 이러한 탐구는 뇌파 '
-                                                                   '데이터 처리 및 신호 분석 시스템의 기초 원리를 이해하는 계기가 되었으며, 수학적 도구가 실제 공학적 문제 해결에 어떻게 '
-                                                                   '적용되는지를 스스로 증명해 낸 매우 수준 높은 학업적 성취임.'},
-                                                            {'학년': '2',
-                                                             '영역': '미적분',
-                                                             '내용': '급수의 수렴과 발산 판정법을 컴퓨터 알고리즘의 시간 복잡도 분석과 연계하여 심화 탐구함. 비교판정법과 적분판정법을 활용해 '
-                                                                   'p-급수의 수렴 범위를 증명하고, 이를 알고리즘의 루프 구조가 데이터 크기에 따라 수행 시간에 미치는 영향으로 해석함. 특히 '
-                                                                   '교대급수판정법의 증명 과정을 프로그래밍의 재귀적 호출 구조와 연결하여 논리적 엄밀성을 확보함. 수업 중 동료 학습 과정에서 '
-                                                                   '복잡한 수식의 풀이 오류를 알고리즘적 관점에서 분석하여 수정안을 제시하는 등 수학적 사고력을 공학적 문제 해결 역량으로 '
-                                                                   '치환하는 능력이 탁월함. 형성평가에서 최상위권 성적을 유지하며, 미적분학의 원리가 현대 컴퓨팅 시스템의 최적화 이론에 어떻게 '
-                                                                   '적용되는지 끊임없이 질문하며 학업적 호기심을 확장함.'},
-                                                            {'학년': '2',
-                                                             '영역': '한국사',
-                                                             '내용': "기술 발전이 사회 구조와 시스템에 미치는 영향을 분석하는 역량이 뛰어나며, '전쟁과 기술 혁신이 현대 컴퓨팅 인프라에 미친 "
-                                                                   "영향'을 주제로 탐구함. 6·25 전쟁 당시의 통신 기술과 데이터 전송 방식의 한계를 조사하고, 이것이 현대의 분산 네트워크 "
-                                                                   '시스템으로 발전하는 과정을 역사적 맥락에서 고찰함. 특히 전쟁 중의 긴급한 정보 처리를 위한 암호 해독과 통신 보안 기술의 '
-                                                                   '발달이 현대 정보 보안 알고리즘의 기원이 되었음을 밝혀냄. 역사적 사건을 단순히 암기하는 대신, 기술적 진보가 인류의 의사결정 '
-                                                                   '체계와 시스템 설계에 어떤 변화를 가져왔는지 구조적으로 파악함. 한국의 정보통신 기술 발전사를 세계적인 기술 흐름과 연결하여 '
-                                                                   '분석하는 통찰력을 보여주었으며, 역사적 데이터의 흐름을 통해 미래의 기술 발전 방향을 예측하는 논리적 사고가 돋보임.'},
-                                                            {'학년': '2',
-                                                             '영역': '물리학 1',
-                                                             '내용': "열역학 법칙을 컴퓨터 시스템의 에너지 효율 및 발열 제어 문제와 연결하여 심도 있게 탐구함. '과학 법칙의 발견과 발명'에 "
-                                                                   '대한 고찰을 통해, 물리적 현상을 수식화하는 과정이 곧 컴퓨터 모델링의 핵심임을 깨닫고 이를 시뮬레이션 알고리즘 설계에 '
-                                                                   '적용함. 가상현실(VR) 및 증강현실(AR) 환경에서 실시간 렌더링 시 발생하는 연산 부하와 깊이감 표현의 정확도를 높이기 '
-                                                                   '위한 최적화 알고리즘을 제안함. 파동 단원에서는 전자기파의 특성을 활용한 데이터 통신 기술을 심화 탐구하였으며, 전자기파의 '
-                                                                   '전리작용 원리를 컴퓨터 하드웨어의 신호 간섭 및 노이즈 제거 기술과 연관 지어 분석함. 물리적 현상을 디지털 데이터로 변환하고 '
-                                                                   '이를 제어하는 시스템을 설계하는 과정에서 공학적 설계 역량과 이론적 배경지식을 유기적으로 결합하는 능력이 매우 우수함.'},
-                                                            {'학년': '2',
-                                                             '영역': '화학 1',
-                                                             '내용': '분자 궤도 함수 이론을 기반으로 한 분자 구조 예측 알고리즘의 효율성에 주목하여, 특정 화합물의 입체 구조를 시뮬레이션하는 '
-                                                                   '파이썬 프로그램을 직접 설계함. 단순히 화학적 결합 원리를 이해하는 것을 넘어, 분자 내 전자 밀도 분포를 행렬 데이터로 '
-                                                                   '변환하고 이를 최적화 알고리즘에 적용하여 안정적인 분자 구조를 도출하는 과정을 구현함. 특히 약물-수용체 결합 기전을 '
-                                                                   "컴퓨터공학적 관점에서 '키-락(Key-Lock)' 모델로 해석하고, 결합 에너지 계산을 위한 반복 연산 과정을 효율화하기 위해 "
-                                                                   '동적 계획법을 적용함. 또한, 산화-환원 적정 실험 데이터를 수집하는 과정에서 센서 데이터를 실시간으로 처리하는 파이썬 '
-                                                                   '스크립트를 작성하여 오차를 최소화하고, 실험 결과의 통계적 유의성을 검증하기 위해 데이터 정규화 과정을 거침. 실험 과정에서 '
-                                                                   '발생한 오차를 단순한 측정 실수로 치부하지 않고, 데이터 샘플링 빈도와 센서의 노이즈 필터링 알고리즘의 한계로 분석하여 향후 '
-                                                                   '개선 방안을 논리적으로 제시함.'},
-                                                            {'학년': '2',
-                                                             '영역': '생명과학 1',
-                                                             '내용': '생명 시스템의 복잡성을 정보 처리 시스템으로 치환하여 분석하는 능력이 탁월함. 수지상세포의 항원 제시 과정을 데이터 패킷의 '
-                                                                   '전송 및 필터링 과정과 유사하다고 판단하여, 면역 반응의 신호 전달 체계를 그래프 이론으로 모델링하는 탐구를 수행함. MHC '
-                                                                   '분자와 T 림프구 수용체 간의 상호작용을 노드와 엣지로 정의하고, 특정 항원에 대한 면역 반응의 활성화 경로를 최단 경로 탐색 '
-                                                                   '알고리즘으로 시각화하여 발표함. 생물학적 메커니즘을 디지털 로직으로 추상화하는 과정에서 사이토카인에 의한 신호 증폭 현상을 '
-                                                                   '피드백 루프 구조로 해석하여 시스템의 안정성을 분석함. 또한, 면역 백신 개발의 상용화 과정에서 발생하는 데이터 편향성 문제를 '
-                                                                   '인공지능 학습 데이터의 불균형 문제와 연결하여 고찰함. 실험 수행평가에서는 팀원들과 함께 복잡한 생물학적 데이터를 효율적으로 '
-                                                                   '관리하기 위한 데이터베이스 스키마를 설계하고, 협업 툴을 활용하여 프로젝트의 진행 상황을 실시간으로 동기화하는 등 공학적 협업 '
-                                                                   '역량을 발휘함.'},
-                                                            {'학년': '2',
-                                                             '영역': '수학 I',
-                                                             '내용': '수학적 모델링을 통해 실생활의 복잡한 문제를 알고리즘으로 해결하는 역량이 매우 뛰어남. 수열의 점화식을 컴퓨터 프로그램의 재귀 '
-                                                                   '함수 구조와 연관 지어 분석하고, 약물의 체내 잔류량 변화를 시뮬레이션하는 코드를 작성하여 복용 간격과 용량에 따른 최적의 '
-                                                                   '혈중 농도 유지 알고리즘을 설계함. 특히 삼각함수의 주기성을 학습한 후, 이를 디지털 신호 처리의 핵심인 푸리에 변환과 '
-                                                                   '연결하여 심전도 데이터의 노이즈 제거 및 특징 추출 과정을 탐구함. 오일러 공식을 활용해 복소수 평면에서의 회전 변환을 '
-                                                                   '이해하고, 지오지브라와 파이썬의 Matplotlib 라이브러리를 사용하여 다양한 주파수의 파형을 합성하고 분해하는 과정을 '
-                                                                   '시각화함. 이 과정에서 이산 푸리에 변환(DFT)의 연산 복잡도를 줄이기 위한 고속 푸리에 변환(FFT)의 원리를 조사하며, '
-                                                                   '알고리즘의 시간 복잡도가 실제 데이터 처리 성능에 미치는 영향을 깊이 있게 고찰함.'},
-                                                            {'학년': '2',
-                                                             '영역': '물리학 I',
-                                                             '내용': "열역학 제2법칙의 엔트로피 증가 원리를 컴퓨터 시스템의 데이터 처리 효율성과 연관 지어 분석함. '물리 법칙의 수학적 "
-                                                                   "모델링'을 주제로, 자연 현상을 알고리즘으로 추상화하는 과정에서 발생하는 정보 손실과 근사치의 오차 범위를 논리적으로 증명함. "
-                                                                   '특히 VR/AR 환경에서의 실시간 렌더링 최적화를 위해 광선 추적(Ray Tracing) 알고리즘의 연산 복잡도를 물리적 '
-                                                                   '전자기파의 전파 모델과 결합하여 탐구함. 전자기파의 간섭 현상을 파동 방정식으로 해석하고, 이를 디지털 신호 처리(DSP) '
-                                                                   '필터 설계에 적용하여 노이즈를 제거하는 시뮬레이션을 수행함으로써 물리적 지식을 공학적 문제 해결로 확장함.'},
-                                                            {'학년': '2',
-                                                             '영역': '화학 I',
-                                                             '내용': '분자 궤도 함수 이론을 바탕으로 화합물의 입체 구조를 예측하고, 이를 분자 모델링 소프트웨어로 시각화하여 실제 데이터와 비교 '
-                                                                   '분석함. 특정 작용기가 수용체와 결합하는 기전을 컴퓨터의 키-값(Key-Value) 데이터 구조와 유사한 정보 처리 과정으로 '
-                                                                   '해석하여 발표함. 또한 산화-환원 적정 실험에서 발생하는 오차를 최소화하기 위해 파이썬을 활용한 데이터 보정 알고리즘을 '
-                                                                   '설계함. 실험 과정에서 수집된 다량의 적정 데이터를 통계적으로 처리하여 표준 편차를 계산하고, 변수 제어의 정밀도가 결과값의 '
-                                                                   '신뢰도에 미치는 영향을 정량적으로 분석하여 실험 보고서의 완성도를 높임.'},
-                                                            {'학년': '2',
-                                                             '영역': '생명과학 I',
-                                                             '내용': '면역 체계의 복잡한 상호작용을 네트워크 그래프 이론으로 모델링하여 발표함. 수지상세포와 T 림프구 간의 신호 전달 과정을 '
-                                                                   '노드와 엣지로 구성된 시스템으로 치환하고, 사이토카인 농도 변화에 따른 면역 반응의 동역학적 변화를 미분 방정식으로 표현함. '
-                                                                   '생물학적 정보 처리 시스템의 효율성을 컴퓨터 네트워크의 분산 처리 알고리즘과 비교하며, 생체 시스템의 오류 수정 기전이 '
-                                                                   '소프트웨어의 예외 처리(Exception Handling)와 유사한 논리 구조를 가짐을 논증함. 생명 현상을 데이터 흐름의 '
-                                                                   '관점에서 재해석하는 통찰력을 보여주었으며, 생물학적 데이터를 효율적으로 처리하기 위한 알고리즘 설계의 중요성을 강조함.'},
-                                                            {'학년': '2',
-                                                             '영역': '컴퓨터공학적 윤리 및 사회적 책임',
-                                                             '내용': '언어와 매체: 인공지능 알고리즘의 편향성이 사회적 소수자에게 미치는 영향력을 분석하며, 기술 개발자가 갖춰야 할 윤리적 책무와 '
-                                                                   '인본주의적 가치를 심도 있게 탐구함. 정보 매체의 신뢰성을 검증하는 과정에서 데이터의 출처와 가공 방식이 정보의 왜곡에 미치는 '
-                                                                   '영향을 논리적으로 비판하고, 기술적 효율성보다 인간 중심의 설계가 우선되어야 함을 역설하며 교과 탐구와 컴퓨터공학적 진로를 '
-                                                                   '유기적으로 연결함.'},
-                                                            {'학년': '2',
-                                                             '영역': '수학적 모델링 심화',
-                                                             '내용': '수학 I: 알고리즘의 시간 복잡도를 분석하기 위해 재귀적 호출 구조를 등비수열과 점화식으로 모델링하여 최적화 가능성을 탐구함. '
-                                                                   '단순히 기초적인 수열 계산에 그치지 않고, 대규모 데이터 처리 시 발생하는 병목 현상을 미분방정식으로 수식화하여 시스템의 '
-                                                                   '안정성을 예측함. 특히 푸리에 변환을 활용하여 신호 처리 과정에서의 노이즈 제거 알고리즘을 설계하고, 주파수 도메인에서의 '
-                                                                   '데이터 해석을 통해 효율적인 압축 알고리즘의 수학적 근거를 명확히 제시함.'},
-                                                            {'학년': '2',
-                                                             '영역': '기하',
-                                                             '내용': '수업 중 제시되는 복잡한 공간 도형 문제에 대해 다양한 관점을 존중하며 본인의 논리적 추론을 능동적으로 표현하여 긍정적인 수업 '
-                                                                   '분위기를 이끎. 지오지브라를 활용하여 3차원 공간에서의 객체 충돌 감지 알고리즘을 시각화하고, 원뿔곡선의 기하학적 성질을 '
-                                                                   '활용하여 레이 트레이싱(Ray Tracing) 기법의 수학적 원리를 탐구함. 당들랭 구의 개념을 학습한 후, 이를 이차곡선의 '
-                                                                   '정의와 연결하여 공간 내 물체의 궤적을 추적하는 알고리즘으로 확장함. 특히 본인의 관심사인 컴퓨터 그래픽스 분야와 관련하여, '
-                                                                   '3차원 공간상의 혈흔 분석 시뮬레이션을 기하학적 정사영 개념으로 재해석함. 혈액의 충돌 각도와 거리 데이터를 벡터로 변환하고, '
-                                                                   '수렴점 추정 알고리즘을 설계하여 발혈 부위를 역추적하는 관계식을 유도하는 등 학습한 기하학적 지식을 컴퓨터공학적 문제 해결에 '
-                                                                   '융합적으로 적용하는 탁월한 역량을 보임.'},
-                                                            {'학년': '2',
-                                                             '영역': '심화 영어 I',
-                                                             '내용': '컴퓨터공학적 사고를 바탕으로 기술과 사회의 상호작용을 분석하는 능력이 탁월함. 알고리즘의 편향성과 윤리적 책임에 관한 지문을 '
-                                                                   '발표하며, 단순히 텍스트를 해석하는 것을 넘어 인공지능 모델의 학습 데이터 불균형이 초래하는 사회적 차별 문제를 논리적으로 '
-                                                                   '설명함. 특히 신경망 모델의 가중치 결정 과정과 인간의 인지적 편향 사이의 유사성을 분석하여 학급 내에서 큰 호응을 얻음. '
-                                                                   "에세이 작성 활동에서는 '디지털 격차가 정보 소외 계층에 미치는 영향'을 주제로, 기술적 접근성뿐만 아니라 알고리즘 설계 "
-                                                                   "단계에서의 포용적 디자인 필요성을 역설함. 'The algorithmic bias is the pivotal cause of "
-                                                                   "social inequality'라는 주제문을 통해 기술적 해결책이 사회 구조적 문제 해결의 핵심임을 강조함. 또한, 분산 "
-                                                                   '컴퓨팅 시스템의 효율성을 다룬 기술 문헌을 추가로 탐구하여, 데이터 처리 속도와 에너지 효율성 간의 상관관계를 분석하고 이를 '
-                                                                   '정확한 영어 표현으로 명료하게 정리한 에세이를 제출함.'},
-                                                            {'학년': '2',
-                                                             '영역': '사회문제 탐구',
-                                                             '내용': '디지털 전환기 사회 문제 해결을 위해 데이터 분석 방법론을 적극적으로 활용함. 공공 데이터 포털의 오픈 API를 활용하여 '
-                                                                   '지역별 의료 인프라 격차를 시각화하고, 이를 갈등론적 관점에서 분석하여 자원 배분의 불균형 문제를 지적함. 특히 코로나19 '
-                                                                   '이후 급증한 비대면 서비스의 데이터 트래픽 과부하 문제를 시스템 공학적 관점에서 접근하여, 서버 분산 처리 시스템의 효율적 '
-                                                                   '운영 방안을 제시하는 연구 계획서를 작성함. 문헌 연구법을 통해 트래픽 데이터의 통시적 변화를 추적하고, 병목 현상이 발생하는 '
-                                                                   '네트워크 노드를 식별하여 최적화 알고리즘 적용의 필요성을 논리적으로 도출함. 또한, 디지털 소외 계층의 정보 접근성 문제를 '
-                                                                   '해결하기 위한 사용자 인터페이스 최적화 방안을 설문조사와 데이터 분석을 통해 정리하여 발표함. 사회적 약자를 위한 기술적 '
-                                                                   '배려가 시스템 설계의 필수 요소임을 강조하며, 데이터 기반의 정책 제언 역량을 보여줌.'},
-                                                            {'학년': '2',
-                                                             '영역': '고전과 윤리',
-                                                             '내용': "정의론을 학습하며 '알고리즘의 공정성'이라는 현대적 화두를 철학적 관점에서 재해석함. 롤스의 정의론을 기반으로 인공지능 모델이 "
-                                                                   "의사결정을 내릴 때 적용해야 할 '공정성 알고리즘'의 설계 원칙을 고민함. 특히 의료 시스템 내의 자원 배분 알고리즘이 "
-                                                                   '환자에게 미치는 영향을 분석하며, 기술적 효율성과 윤리적 형평성 사이의 갈등을 어떻게 해결할 것인지 탐구함. 노먼 대니얼스의 '
-                                                                   '의료 정의론을 데이터 처리 시스템의 우선순위 결정 문제와 연결하여, 어떤 알고리즘 체계가 공정하다고 할 수 있는지에 대한 '
-                                                                   '자신만의 논리를 구축함. 본인이 꿈꾸는 컴퓨터공학자로서 단순히 성능이 뛰어난 모델을 개발하는 것을 넘어, 시스템의 설계 '
-                                                                   '단계부터 윤리적 가치를 내재화하고 사회적 책임을 다하는 기술을 구현하겠다는 의지를 밝힘. 기술적 문제 해결 과정에서 발생하는 '
-                                                                   '윤리적 딜레마를 철학적 사유를 통해 극복하려는 태도가 매우 인상적임.'},
-                                                            {'학년': '3',
-                                                             '영역': '독서',
-                                                             '내용': "컴퓨터공학적 사고를 바탕으로 복잡한 시스템의 최적화 원리를 탐구하는 데 탁월한 역량을 보임. '알고리즘의 미학'과 '데이터 "
-                                                                   "과학의 이해'를 주제로 한 전공 관련 도서를 탐독하며, 특히 분산 시스템에서의 데이터 일관성 유지 알고리즘인 'Paxos'와 "
-                                                                   "'Raft'의 작동 원리를 심층 분석함. 대규모 트래픽 환경에서 발생하는 병목 현상을 해결하기 위해 로드 밸런싱 알고리즘을 "
-                                                                   "조사하고, 이를 실제 서버 아키텍처에 적용하는 방안을 구상함. 동료들과 함께 '분산 컴퓨팅 환경에서의 장애 허용(Fault "
-                                                                   "Tolerance) 전략'을 주제로 연구팀을 구성하여, 자료 조사부터 시뮬레이션 설계까지 주도적으로 수행함. 탐구 과정에서 "
-                                                                   '얻은 지식을 학급 내 기술 세미나를 통해 공유하며, 복잡한 기술적 개념을 논리적으로 구조화하여 전달하는 능력이 매우 뛰어남. '
-                                                                   '특히 데이터 처리의 효율성을 높이기 위한 캐싱 전략과 데이터베이스 인덱싱 기법에 대한 깊은 이해를 바탕으로, 실제 소프트웨어 '
-                                                                   '개발 과정에서의 성능 최적화 방안을 제시하는 등 전공에 대한 열정과 전문성을 유감없이 발휘함.'},
-                                                            {'학년': '3',
-                                                             '영역': '고급 수학 I',
-                                                             '내용': '선형대수학의 핵심 개념인 벡터공간, 기저, 차원, 그리고 선형 변환의 대수적 성질을 완벽히 이해하고 이를 컴퓨터 그래픽스 및 '
-                                                                   '인공지능 모델링에 응용함. 행렬식과 역행렬의 기하학적 의미를 파악하고, 이를 파이썬의 NumPy 라이브러리를 활용하여 고차원 '
-                                                                   '데이터 행렬 연산으로 구현함. 특히 신경망의 가중치 행렬 연산 과정에서 발생하는 연산 복잡도를 줄이기 위해 행렬 '
-                                                                   '분해(Matrix Factorization) 기법을 학습하고, 이를 실제 데이터셋에 적용하여 모델의 학습 속도를 개선하는 '
-                                                                   '프로젝트를 수행함. 지오지브라를 활용하여 복소평면에서의 선형 변환을 시각화하고, 이를 통해 2차원 회전 및 스케일링 변환 '
-                                                                   '행렬의 원리를 논리적으로 증명함. 수학적 이론이 실제 컴퓨터 알고리즘으로 구현되는 과정을 체계적으로 분석하며, 데이터 처리의 '
-                                                                   '효율성을 극대화하기 위한 수학적 모델링 역량을 증명함. 이러한 탐구는 컴퓨터공학부 진학 후 다룰 복잡한 데이터 구조와 알고리즘 '
-                                                                   '설계의 기초가 되는 논리적 사고력을 배양하는 계기가 됨.'},
-                                                            {'학년': '3',
-                                                             '영역': '물리학 II',
-                                                             '내용': '물리적 현상을 수치화하고 이를 컴퓨터 시뮬레이션으로 구현하는 능력이 매우 탁월함. 2차원 포물선 운동 분석 수업에서 공기 '
-                                                                   '저항을 고려한 미분 방정식 모델을 수립하고, 이를 오일러 방법(Euler method)을 이용한 수치 해석 알고리즘으로 '
-                                                                   "구현하여 궤적을 예측함. 파동의 회절 단원 학습 후에는 '컴퓨터 비전 기술을 활용한 회절 패턴 분석 및 이미지 복원 "
-                                                                   "알고리즘'을 주제로 심화 탐구를 수행함. 광학적 회절 현상을 푸리에 변환(Fourier Transform)으로 해석하고, 이를 "
-                                                                   '디지털 이미지 처리 기술과 연결하여 노이즈가 섞인 회절 패턴에서 원본 정보를 복원하는 과정을 파이썬으로 프로그래밍함. 또한, '
-                                                                   '현대물리학의 양자 컴퓨팅 개념에 깊은 관심을 보이며, 힐버트 공간에서의 상태 벡터 연산이 양자 알고리즘의 병렬 처리 능력에 '
-                                                                   '미치는 영향을 논리적으로 고찰함. 물리학적 원리를 소프트웨어 공학적 관점에서 재해석하여 시스템의 효율성을 높이려는 시도가 '
-                                                                   '돋보이며, 이론과 실무를 아우르는 공학적 소양을 갖춘 인재로서의 면모를 보여줌.'},
-                                                            {'학년': '3',
-                                                             '영역': '심화수학 II',
-                                                             '내용': '그래프 이론과 행렬 연산을 활용한 네트워크 최적화 알고리즘을 주제로 심화 탐구를 수행함. 복잡한 시스템 내 노드 간의 연결성을 '
-                                                                   '인접 행렬로 표현하고, 다익스트라 알고리즘의 시간 복잡도를 개선하기 위한 우선순위 큐 기반의 최적화 방안을 논리적으로 도출함. '
-                                                                   '특히, 행렬의 고유값과 고유벡터를 활용하여 네트워크의 중심성을 분석하는 과정에서 수학적 모델링 역량을 유감없이 발휘함. 교과 '
-                                                                   '수업 중 다룬 미분방정식의 수치해석적 접근법에 깊은 관심을 보이며, 오일러 방법과 룬게-쿠타 방법을 파이썬으로 구현하여 '
-                                                                   '오차율을 비교 분석함. 알고리즘의 수렴 속도와 안정성을 수학적으로 증명하는 과정에서 최상위권의 논리적 사고력을 보여주었으며, '
-                                                                   '추상적인 수학 개념을 실제 컴퓨팅 환경에서 구현 가능한 모델로 치환하는 능력이 매우 탁월함.'},
-                                                            {'학년': '3',
-                                                             '영역': '정보과학',
-                                                             '내용': '데이터 구조와 알고리즘에 대한 깊은 이해를 바탕으로 대규모 데이터셋을 효율적으로 처리하기 위한 분산 컴퓨팅 모델을 설계함. '
-                                                                   'K-최근접 이웃 알고리즘을 단순히 라이브러리로 활용하는 데 그치지 않고, KD-트리(KD-Tree) 구조를 직접 구현하여 '
-                                                                   '고차원 데이터에서의 탐색 효율을 극대화함. 머신러닝 모델의 학습 과정에서 발생하는 과적합 문제를 해결하기 위해 정규화 기법과 '
-                                                                   '교차 검증 알고리즘을 직접 코드로 작성하여 모델의 일반화 성능을 정량적으로 평가함. 특히, 대용량 로그 데이터를 처리하는 '
-                                                                   '과정에서 파이썬의 멀티프로세싱 모듈을 활용해 연산 속도를 개선하는 프로젝트를 수행하며 시스템 아키텍처에 대한 높은 식견을 '
-                                                                   '드러냄. 코드의 가독성과 유지보수를 고려한 모듈화 설계 능력이 뛰어나며, 복잡한 로직을 주석과 문서화로 명확히 설명하여 동료 '
-                                                                   '학습자들에게 기술적 영감을 제공함.'},
-                                                            {'학년': '2',
-                                                             '영역': '탐구의 지속성과 일관성',
-                                                             '내용': '컴퓨터공학 및 알고리즘 설계: 1학년 때부터 지속해 온 인공지능 모델 최적화에 대한 관심을 2학년 기하 및 정보과학 교과와 '
-                                                                   '유기적으로 연결함. 벡터의 내적과 외적을 활용한 3D 공간 내 객체 충돌 감지 알고리즘을 설계하고, 이를 기하학적 원리로 '
-                                                                   '증명하며 수학적 사고를 공학적 문제 해결에 적용함. 데이터 구조의 효율성을 기하학적 공간 분할 기법과 연계하여 탐구하는 등, '
-                                                                   '전공 분야에 대한 일관된 탐구 서사를 구축하며 컴퓨터공학자로서의 성장 가능성을 입증함.'},
-                                                            {'학년': '2',
-                                                             '영역': '인문학적 소양과 사회적 통찰',
-                                                             '내용': '알고리즘 윤리 및 사회적 책임 탐구: 인공지능의 의사결정 과정에서 발생하는 편향성 문제와 알고리즘의 투명성 확보 방안을 롤스의 '
-                                                                   '정의론과 기술 철학적 관점에서 분석함. 특히 자율주행 시스템의 사고 책임 소재와 데이터 기반 의사결정의 윤리적 한계를 '
-                                                                   '탐구하며, 기술이 사회적 정의를 실현하기 위해 갖추어야 할 공학적 설계 원칙을 정립함.'},
-                                                            {'학년': '2',
-                                                             '영역': '교과 간 융합 및 도구 활용',
-                                                             '내용': '고급 수학 & 정보과학: 선형대수학의 행렬 연산 원리를 파이썬의 넘파이(NumPy) 라이브러리를 활용해 구현하고, 이를 대규모 '
-                                                                   '데이터셋의 효율적 처리를 위한 병렬 컴퓨팅 모델에 적용함. 또한, 그래프 이론을 활용한 네트워크 최적화 알고리즘을 '
-                                                                   '프로그래밍하여 데이터 전송 효율을 극대화하는 시뮬레이션을 수행함으로써 수학적 이론을 실제 공학적 문제 해결로 연결하는 탁월한 '
-                                                                   '역량을 입증함.'},
-                                                            {'학년': '2',
-                                                             '영역': '학술적 전문성 (Hard Core)',
-                                                             '내용': '정보과학 & 물리학 II: 분산 시스템에서의 데이터 일관성 유지 기법인 래프트(Raft) 합의 알고리즘을 심층 분석하고, 이를 '
-                                                                   '물리적 신호 처리 시스템의 데이터 동기화 문제에 대입하여 최적화 모델을 설계함. 특히 푸리에 변환을 통한 신호 분석과 데이터 '
-                                                                   '압축 알고리즘의 효율성을 물리적 법칙과 연계하여 설명하는 등 컴퓨터공학적 전문 지식과 기초 과학의 융합적 사고력을 유감없이 '
-                                                                   '발휘함.'},
-                                                            {'학년': '2',
-                                                             '영역': '보완점 제언',
-                                                             '내용': '컴퓨터공학 심화 탐구 및 프로젝트 설계: 알고리즘 최적화와 시스템 아키텍처 설계 등 다수의 주제를 병렬적으로 나열하는 방식에서 '
-                                                                   '벗어나, 각 프로젝트 간의 기술적 연관성과 문제 해결의 인과관계를 명확히 서술해야 함. 특히 인공지능 모델의 편향성 탐구에서 '
-                                                                   '제시한 데이터셋 불균형 분석은 단순 현상 나열에 그치지 말고, 이를 해결하기 위한 구체적인 알고리즘적 보정 기법과 그에 따른 '
-                                                                   '성능 변화를 정량적으로 기술하여 탐구의 깊이를 증명하는 것이 전략적으로 유리함.'}],
-                                             'comments': [{'구분': '기타 합격 대학', '내용': '카이스트 전산학부, 포스텍 컴퓨터공학과, 연세대학교 컴퓨터과학과'},
-                                                          {'구분': '고등학교', '내용': '과학고등학교 내신 1.1 ~ 1.3'},
-                                                          {'구분': '총평',
-                                                           '내용': '과학고등학교의 치열한 학업 환경 속에서도 1.1등급대의 최상위 내신을 유지하며 학업 역량을 증명했다. 1학년 때부터 인공지능 모델 '
-                                                                 '최적화와 분산 컴퓨팅 시스템에 관심을 두고 체계적인 탐구 활동을 수행한 점이 인상적이다. 단순한 교과 지식 습득을 넘어 복잡한 '
-                                                                 '알고리즘 문제를 해결하기 위한 논리적 사고 과정과 프로젝트 수행 능력이 매우 뛰어나며, 컴퓨터공학 분야에 대한 일관된 탐구 서사가 '
-                                                                 '생기부 전반에 걸쳐 유기적으로 연결되어 있다.'},
-                                                          {'구분': '데이터 구조 및 알고리즘 관련',
-                                                           '내용': "알고리즘 효율성 분석을 주제로 탐구한 것은 컴퓨터공학을 지망하는 학생에게 매우 효과적이고 훌륭한 소재이다. 다만 '정보과학 "
-                                                                 "동아리' 활동에서의 내용을 단순히 나열하기보다는, 실제 프로젝트에서 학생이 주도적으로 설계한 데이터 구조의 최적화 과정과 그에 "
-                                                                 '따른 시간 복잡도 개선 결과를 구체적인 수치와 함께 스토리 형식으로 풀어나가는 것이 훨씬 효과적이다.'},
-                                                          {'구분': '분산 컴퓨팅 및 보안 토론',
-                                                           '내용': '1. 컴퓨터공학을 지망하는 학생들 중 이따금씩 특정 프로그래밍 언어나 프레임워크의 우수성만을 강조하며 타 기술 스택을 폄하하는 '
-                                                                 '경우가 있는데, 공학적 사고를 중시하는 학생이라면 그러한 서술은 반드시 피해야 한다. 최근 시스템 아키텍처에서 기술 간의 '
-                                                                 '상호운용성과 확장성이 강조되는 추세이기도 하지만, 무엇보다 다양한 환경에서의 시스템 안정성을 중시하는 학풍상 이와 같은 주장은 '
-                                                                 '주의해야 한다. 2. 알고리즘 경진대회와 같은 실전 경험이 최종 당락에 지대한 영향을 미치기 때문에 이런 주제로 저학년 때부터 '
-                                                                 '지속적인 토론 기회를 가지는 것은 무척 긍정적이다. 다만 앞서 언급한 바와 같이 학생의 주장은 전략적으로 어디까지나 공학적 객관성 '
-                                                                 '내에 위치해야 하기 때문에 급진적인 기술 맹신은 지양해야 한다.'},
-                                                          {'구분': 'SIR 모델 관련',
-                                                           '내용': '감염병 확산 시뮬레이션 및 파이썬을 활용한 데이터 시각화 소재로 참여했던 활동에 대해 잘 기술하고 있다. 다만 SIR 모델의 미분 '
-                                                                 '방정식 구조를 코드로 구현하는 과정에서 수치 해석적 오차를 어떻게 제어했는지에 대한 전문적인 고민이 부족해서, 심도 있는 탐구 및 '
-                                                                 '발표를 수행하진 못했을 것이라는 인상을 주어서 아쉽다.'},
-                                                          {'구분': 'UI/UX 최적화 연구',
-                                                           '내용': "'동기-구체적인 탐구-검증'으로 이어지는 훌륭한 서술이다. 다만 WADA 중 'A(Agenda)'를 짚어줄 경우 읽는 사람의 "
-                                                                 '입장에서 해당 활동에 좀 더 집중할 수 있기 때문에 이렇게 좋은 주제로 내용을 전개한다면 주제를 명시적으로 언급하는 것을 '
-                                                                 '추천한다. 가령 "지능형 키오스크를 위한 인체공학적 UI 최적화 알고리즘 설계: 사용자 신체 데이터 기반 시뮬레이션 연구"와 같은 '
-                                                                 '주제로 정리해볼 수 있다.'},
-                                                          {'구분': 'AI 윤리 및 데이터 편향성 토론',
-                                                           '내용': '비격식적인 표현으로 이루어진 칭찬("매우 논리적임")은 생기부 전체의 인상을 바꿀 정도로 긍정적인 영향을 준다. 따라서 평소 '
-                                                                 '학교생활을 충실히 함으로써 선생님들과 좋은 관계를 쌓는 것은 수시가 좋은 방향으로 귀결되기 위한 선결조건이라 할 수 있다.'},
-                                                          {'구분': '뇌-기계 인터페이스(BMI) 관련',
-                                                           '내용': 'BMI에 관련된 강의 및 신경망 모델링 활동에 대한 소재도 컴퓨터공학 분야에 훌륭한 소재 중 하나이다. 다만 신경망의 구조와 학습 '
-                                                                 "원리, 데이터 처리의 효율성과 같이 추상적인 표현보단 차라리 '신호 노이즈 제거'라는 키워드에 초점을 맞춰서 데이터 전처리 "
-                                                                 '과정에서의 윤리적, 기술적 문제에 대한 성찰을 기술하는 것이 좋다.'},
-                                                          {'구분': '인재상 및 페르소나',
-                                                           '내용': "'기술로 세상을 바꾸는 혁신가', '데이터로 소통하는 공학자' 등등 대학마다 내거는 인재상이 있지만, 결국 수시는 어쩔 수 없이 "
-                                                                 "선발자의 주관이 개입되는 선발과정이다. 위와 같은 거창한 표현을 걷어내면 '기술적 깊이와 협업 능력을 겸비한 학생'이라는 매우 "
-                                                                 '명확한 페르소나가 도출된다. 때문에 코딩 실력에만 초점을 두어 팀 프로젝트에서의 소통 역량을 놓치는 우를 범하지 않길 바란다.'},
-                                                          {'구분': '분산 시스템 탐구활동',
-                                                           '내용': '데이터 일관성 유지 전략에 대한 호기심에서 출발하여 합의 알고리즘의 작동 원리, 보안 취약점 분석, 팀원들과 협업, 발표회에 '
-                                                                 '이르기까지 일련의 연속성 있는 탐구활동을 기술한 점이 좋았다. 컴퓨터공학 분야의 탐구활동을 기술함에 있어서 전문성 있는 내용을 '
-                                                                 '작성하는 것도 중요하지만 이렇게 탐구활동 과정이 연속성 및 관련성을 가지고 이어지는 것도 중요한 부분이다. 물론 그 연결 과정이 '
-                                                                 '공학적으로 논리성을 갖고 있어야만 한다.'},
-                                                          {'구분': '신호 처리 및 신경망 실험 설계',
-                                                           '내용': "'뇌 신호 처리와 인공 신경망'의 데이터 변환 과정에 대한 부분에 흥미를 느껴 시작한 탐구활동이 실제로 설계하고 수행한 실험 "
-                                                                 '내용을 보면 단순한 이미지 분류 모델로 바뀌었다. 이처럼 컴퓨터공학 분야의 탐구활동을 기술할 때 흔히 하는 실수가 활동 사이의 '
-                                                                 '연결과정에서 공학적으로 논리성을 갖지 못하는 경우이다. 뇌 신호 데이터 처리와 일반적인 이미지 데이터 처리는 데이터의 특성과 '
-                                                                 '전처리 방식이 엄연히 다르며, 또 공학 분야에서도 서로 독립적으로 다루고 있는 내용이다.'},
-                                                          {'구분': '수학 심화탐구의 위계',
-                                                           '내용': "수학 심화탐구에는 두 가지 위계가 존재한다. 첫째 위계는 학습내용을 실생활에 '대응'시키는 것으로, 암호학의 소수 활용 예시에 "
-                                                                 "대응한다. 두 번째 위계는 학습내용 '비틂' 혹은 연장인데, 가령 선형대수학을 학습한 이후 '고유값 분해를 통한 차원 축소'라는 "
-                                                                 '고급수학과정 내용과 연계하여 설명하는 것이 가능하다. 이따금씩 첫 번째 위계만으로 수학 세특이 채워진 학생이 있는데, 첫 번째와 '
-                                                                 '두 번째 위계가 골고루 내용을 장식해야 심화학습이 이루어진 생기부라는 인상을 줄 수 있다.'},
-                                                          {'구분': '영어 세특의 전략적 우위',
-                                                           '내용': '최상위권 학생일수록 세특 서두에 학생의 페르소나를 담은 문장으로 시작하는 경우가 많다. 이따금씩 "가장 분석적인 사고를 하는 '
-                                                                 '학생임.", "~ 분야에서 학년 내 가장 두각을 나타내는 학생임."과 같은 문장이 실리는데, 이러한 표현은 매우 눈에 띄는 '
-                                                                 "긍정적인 표현이므로 평소 수업에 충실해야 할 이유가 된다. 특히 컴퓨터공학 분야에서 중요하게 보는 부분이 '영어로 된 최신 기술 "
-                                                                 "논문을 얼마나 잘 이해하고 관심을 갖고 있는가?'이기 때문에 이러한 식의 영어 교과목 세부능력 특기사항을 기술하는 것은 좋은 "
-                                                                 '예시라고 볼 수 있다.'},
-                                                          {'구분': '물리 및 과학탐구실험 관련',
-                                                           '내용': '운동 현상에서 추출한 좌표 데이터를 정량적으로 분석하는 역량을 논리적으로 기술하고 있다. 파이썬을 활용한 시각화, 데이터 추출 등 '
-                                                                 '중요한 키워드를 잘 집어서 서술하고 있지만, 학생이 직접 관심을 가지고 어떤 알고리즘을 이용해서 데이터를 처리했는지에 초점을 맞춰 '
-                                                                 '기술하면 더 효과적이다.'},
-                                                          {'구분': '철학 관련',
-                                                           '내용': '철학은 컴퓨터공학과 관련된 관심을 이끌어내기에 무척 훌륭한 소재들을 제공해준다. 크게 두 가지 방향이 있다. 하나는 위 경우와 '
-                                                                 '같이 인공지능 윤리와 인간의 의사결정을 접목하는 것이고, 다른 하나는 시스템 설계의 논리적 오류 상황에 있어서 철학적 내용을 '
-                                                                 '근거로 판단을 내리는 것이다. 어느 하나가 다른 하나보다 빼어나게 적절한 것은 아니다. 두 요소 모두 생기부 전반에 걸쳐 '
-                                                                 '어필되어야 하는 부분인 만큼 자신의 생기부에서 부족하다고 생각되는 측면을 적재적소에 배치하면 된다.'},
-                                                          {'구분': '논술 관련',
-                                                           '내용': "'인공지능의 미래'라는 책을 읽고 알고리즘의 공정성에 대해 통계적 확률을 통해 설명하였다는 아이디어는 훌륭하다. 다만 이후 "
-                                                                 "탐구활동을 더 깊이 있는 내용으로 구성해야 한다. 가령 '컴퓨터공학과 사회의 발전 과정 조사 및 인공지능이란 무엇인가'에 대해 "
-                                                                 '친구들과 의견을 나누었다는 것은 추상적인 표현이고, 해당 분야에 대한 깊이 있는 탐구를 했다는 인상을 주지 못한다.'},
-                                                          {'구분': '체육 관련',
-                                                           '내용': '과학이나 수학, 경제나 어문 등을 전공하는 학생의 경우 체육 교과 세특에서 관련 진로를 언급할 시 본래 체육과의 연관성이 떨어지는 '
-                                                                 "학문이기 때문에 '어색한 억지 연관'으로 보일 가능성이 있다. 그러나 체육은 기본적으로 신체 데이터와 관련된 과목이기 때문에 "
-                                                                 '웨어러블 기기나 동작 인식 기술과 뗄 수 없는 관계에 있다. 따라서 컴퓨터공학을 지망하는 학생이라면 체육 교과에서 진로적합성을 '
-                                                                 '드러내도 좋다. 음악, 미술 교과에도 동일하게 적용되는 이야기다.'},
-                                                          {'구분': '언어와 매체 관련',
-                                                           '내용': '컴퓨터공학 분야에 본격적으로 관심을 갖기 시작한 2학년부터 세부능력 특기사항에 꼭 정보과학이 아니어도 이렇게 인문학적, 사회적인 '
-                                                                 '관점에서 기술분야에 대한 깊이 있는 관심도를 드러낼 수 있다. 단, 억지로 기술하는 것보단 이처럼 매체의 특성에 대한 해당 '
-                                                                 '교과목의 탐구를 기술한 뒤 정보 기술의 순기능과 역기능에 대해서도 이어서 관심을 가지고 탐구해보았다는 자연스럽고 인과성이 충분하게 '
-                                                                 '기술하는 것이 중요하겠다.'},
-                                                          {'구분': '수학 1 관련',
-                                                           '내용': '수학 세부능력 특기사항에서도 이런 방식으로 관심 분야인 컴퓨터공학 분야와 연결된 기술을 이어갈 수 있다. 다만 알고리즘의 시간 '
-                                                                 '복잡도를 수열의 합이라는 방식으로 계산한 것은 다소 간단한 주제이기 때문에, 조금 더 확장해서 분할 정복 알고리즘의 재귀적 구조를 '
-                                                                 '통한 점화식 모델 등 보다 심화된 주제를 선정하고 기술해야 한다. 푸리에 변환이라는 소재는 좋았지만 컴퓨터공학과 연결 짓는 신호 '
-                                                                 '처리나 데이터 압축과의 연결 부분도 빈약한 측면이 있다.'},
-                                                          {'구분': '한국사 관련',
-                                                           '내용': '이처럼 한국사 세부능력 특기사항에도 컴퓨터공학 분야에 대한 관심이 드러나도록 기술하는 것도 가능하다. 각각의 내용이 모두 정보 '
-                                                                 '기술 역사에 있어서 중요한 내용이지만 여러 가지 주제를 단순 나열하는 방식보다, 한 가지 관심 있었던 주제를 정한 후 해당 주제에 '
-                                                                 '대한 주도적인 탐구과정을 담으면 좋다.'},
-                                                          {'구분': '정보 및 프로그래밍 관련',
-                                                           '내용': '분산 컴퓨팅 환경에서의 데이터 일관성 유지 전략에 대한 소재로 알고리즘 설계와 시스템 구조에 대한 탐구활동을 기술한 점이 좋았다. '
-                                                                 "실제 컴퓨터공학 분야 필드에서 중요한 분야이고, 탐구내용 또한 전문성을 담고 있다. 다만 앞선 경우와 마찬가지로 '-을 알게 "
-                                                                 "됨'과 같은 단순 지식을 열거하는 식의 기술은 학생 주도적 탐구활동을 실제로 수행했다는 인상을 남기지 못하므로 주의하는 것이 "
-                                                                 '좋다. 정보 교과 세부능력 특기사항의 기술과 비교해보면 좋다. 마찬가지로 블록체인 기술의 탈중앙화와 합의 알고리즘이라는 컴퓨터공학 '
-                                                                 '분야의 현장에서 중요하게 다루는 아주 좋은 소재를 선정했다. 차이점은 단순히 전문성을 갖춘 지식을 열거하는 방식이 아니라 학생이 '
-                                                                 '실제로 탐구하고 고민하면서 전문성을 갖춘 지식들이 쌓여가는 일련의 스토리가 담겨 있다는 점이다. 이렇게 좋은 소재를 연결성 있게 '
-                                                                 '스토리를 가지고 풀어나가는 방식도 좋은 세부능력 특기사항 작성에 있어서 중요하다.'},
-                                                          {'구분': '종합 의견',
-                                                           '내용': "이 학생의 2학년 세특은 **'공학적 전문성'**과 **'인문학적 소양'**이 균형을 이루고 있습니다. 특히 **분산 컴퓨팅의 "
-                                                                 '데이터 일관성 분석**이나 **지능형 키오스크의 인체공학적 최적화**는 컴퓨터공학 교수들이 선호하는 심화 주제입니다.'}]},
- 'case_2_humanities': {'personal_info': {'대상': '서울대학교 정치외교학부 합격 학생부',
-                                         '고등학교_유형': '자율형 사립고',
-                                         '내신_성적': '1.1 ~ 1.3',
-                                         '주요_특징': "1학년 때부터 '현대 민주주의의 위기와 대의제 보완'이라는 주제를 설정하여 정치철학적 고찰과 실증적 정책 분석을 결합한 심화 탐구를 지속한 케이스",
-                                         '총평': "1학년 때부터 '현대 민주주의의 위기와 대의제 보완'이라는 주제를 설정하여 정치철학적 고찰과 실증적 정책 분석을 결합한 심화 탐구를 지속한 케이스"},
-                       'activities': [{'학년': '1',
-                                       '영역': '자율활동',
-                                       '내용': '민주주의의 위기 담론을 접하고 현대 대의제 민주주의가 직면한 대표성 결여와 정치적 양극화 문제를 심층적으로 탐구함. 특히 디지털 플랫폼의 확산이 여론 형성에 미치는 '
-                                             "영향을 분석하며, 알고리즘에 의한 확증 편향이 시민들의 합리적 토론을 저해하는 기제를 비판적으로 고찰함. 이를 보완하기 위한 방안으로 숙의 민주주의 모델인 '시민 "
-                                             "의회'의 도입 가능성을 검토하고, 무작위 추첨제와 숙의 과정을 결합한 정책 결정 구조가 대의제 민주주의의 정당성을 어떻게 강화할 수 있는지에 대한 소논문을 작성함. "
-                                             '사회적 갈등을 조정하는 정치의 본질적 기능에 주목하여, 단순한 다수결 원칙을 넘어 소수자의 목소리를 반영하는 제도적 장치 마련의 필요성을 역설함. 이러한 탐구 '
-                                             '과정에서 정치철학적 담론과 현실 정책 간의 괴리를 좁히려는 노력을 보였으며, 미래의 정치학도로서 사회적 합의를 도출하는 과정에서의 윤리적 책임감을 강조함.'},
-                                      {'학년': '1',
-                                       '영역': '동아리활동',
-                                       '내용': "정치외교학 심화 동아리에서 '국제 관계에서의 힘의 논리와 국제법의 실효성'을 주제로 연구 활동을 주도함. 현실주의와 자유주의 국제 관계 이론을 비교 분석하며, 강대국 "
-                                             '중심의 국제 질서 속에서 중견국이 취할 수 있는 외교적 전략을 게임 이론적 관점에서 해석함. 특히 기후 변화와 같은 글로벌 공공재 문제 해결을 위해 국제 기구가 '
-                                             '가지는 규범적 영향력과 강제력의 한계를 사례 연구를 통해 논증함. 동아리 구성원들과 함께 모의 UN 회의를 기획하며, 각국 대표의 입장에서 자국의 국익과 국제적 연대 '
-                                             '사이의 딜레마를 해결하기 위한 협상안을 도출하는 과정을 주도함. 이 과정에서 복잡한 국제 정세 속에서 객관적인 자료를 바탕으로 논리적인 근거를 제시하는 분석적 '
-                                             '사고력을 발휘하였으며, 타인의 의견을 경청하고 합리적인 대안을 제시하는 소통 능력을 보여줌. 연구 결과를 발표할 때 시각 자료를 활용하여 복잡한 국제 정치 역학을 '
-                                             '명료하게 구조화하여 전달하는 능력이 탁월함.'},
-                                      {'학년': '1',
-                                       '영역': '진로활동',
-                                       '내용': '정치 체제와 경제적 불평등의 상관관계에 깊은 관심을 두고 관련 문헌을 꾸준히 탐독함. 특히 토마 피케티의 자본론적 관점을 정치학적으로 재해석하여, 경제적 양극화가 '
-                                             '민주주의의 질적 저하를 초래하는 경로를 추적하는 보고서를 작성함. 진로 컨설팅을 통해 자신의 탐구 방향이 정치경제학적 분석에 강점이 있음을 확인하고, 통계 자료를 '
-                                             '활용한 실증적 연구 방법론을 보완하기 위해 사회과학 통계 기초를 학습함. 진로 검사 결과 탐구형과 사회형이 결합된 유형으로 나타났으며, 복잡한 사회 현상을 구조적으로 '
-                                             '파악하고 이를 정책적 대안으로 연결하려는 의지가 강함. 인공지능 기술이 정치적 의사결정에 미치는 영향에 관한 특강을 듣고, 데이터 기반의 정책 수립이 효율성을 높일 '
-                                             '수 있으나, 알고리즘의 편향성이 민주적 가치를 훼손할 위험성을 경계해야 한다는 비판적 소감문을 제출함. 기술 발전과 인간의 존엄성, 그리고 민주적 가치가 조화를 '
-                                             '이루는 미래 사회를 설계하기 위해 정치학적 상상력과 법적·제도적 통찰력을 겸비한 전문가로 성장하겠다는 포부를 밝힘.'},
-                                      {'학년': '1',
-                                       '영역': '국어',
-                                       '내용': "대의제 민주주의의 위기와 시민 참여의 본질을 탐구하기 위해 정치철학 고전과 현대 사회 비평서를 연계하여 독서 활동을 수행함. 한나 아렌트의 '예루살렘의 아이히만'을 "
-                                             '읽고 악의 평범성 개념을 현대 디지털 공간에서의 혐오 표현 확산 문제와 연결하여 서평을 작성함. 단순히 책의 내용을 요약하는 데 그치지 않고, 타인의 고통에 '
-                                             "무감각해지는 현대인의 태도가 어떻게 민주적 공론장을 파괴하는지 논리적으로 분석함. 또한, 루소의 '사회계약론'을 읽고 일반의지의 개념을 현대의 직접 민주주의적 요소와 "
-                                             "결합하여 대의제 보완 방안을 모색하는 발표를 진행함. 특히 '일반의지'가 다수의 횡포로 변질되지 않기 위한 제도적 장치로서의 숙의 민주주의 모델을 제시하며, 고전 속 "
-                                             "사상을 현대 정치 현안에 적용하는 비판적 독해력을 보여줌. 이외에도 김승옥의 '무진기행'을 통해 전후 한국 사회의 소시민적 태도와 정치적 무관심의 기원을 분석하는 등 "
-                                             '문학을 사회학적 텍스트로 재해석하는 역량을 발휘함.'},
-                                      {'학년': '1',
-                                       '영역': '영어',
-                                       '내용': "정치외교학적 관점에서 국제 관계의 불균형과 이를 해결하기 위한 다자주의 외교의 중요성을 다룬 영문 칼럼을 분석하고, 이를 바탕으로 '디지털 시대의 국가 간 정보 "
-                                             "격차와 민주주의의 위기'를 주제로 에세이를 작성함. 에세이 작성 과정에서 관계대명사의 계속적 용법과 분사구문을 활용하여 복잡한 정치적 인과관계를 정교하게 "
-                                             "서술하였으며, 문장 간의 논리적 연결성을 강화하기 위해 다양한 접속사를 적절히 배치함. 발표 시간에는 '국제기구의 의사결정 구조와 중견국의 역할'에 대해 정리하며, "
-                                             '강대국 중심의 국제 질서 속에서 소국이 취할 수 있는 연대 전략을 영어로 논리 정연하게 설명함. 특히 국제법의 실효성 논란을 다룬 기사를 읽고, 현실주의와 자유주의 '
-                                             '이론의 대립 지점을 명확히 짚어내며 본인의 견해를 영어로 토론하는 과정에서 수준 높은 어휘력과 비판적 사고력을 입증함. 수업 중 다양한 사회적 이슈를 영어로 접하며 '
-                                             '언어적 능력을 넘어 글로벌 시민으로서의 정치적 식견을 넓히려는 자기주도적 태도가 매우 돋보임.'},
-                                      {'학년': '1',
-                                       '영역': '통합사회',
-                                       '내용': "5분 스피치 활동에서 '대의제 민주주의의 대표성 위기와 디지털 직접 민주주의의 가능성'을 주제로 탐구 발표를 수행함. 대의제 민주주의가 가진 구조적 한계인 '엘리트 "
-                                             "과두제의 철칙'을 미헬스의 이론을 통해 분석하고, 이를 극복하기 위한 대안으로 블록체인 기반의 투표 시스템과 시민 의회 모델을 제안함. 사회적 의사결정 과정을 "
-                                             "경제학적 게임 이론 모델인 '죄수의 딜레마'와 연결하여, 개인의 합리적 선택이 왜 사회 전체의 비효율을 초래하는지 분석하고 이를 해결하기 위한 제도적 유인책을 "
-                                             '제시함. 또한, 사회 계층 양극화 문제 해결을 위한 조세 정책을 심화 탐구하며, 소득 재분배 효과를 누진세와 기본소득 모델을 중심으로 비교 분석함. 특히 고령화 '
-                                             "사회에서 세대 간 갈등을 완화하기 위한 사회적 합의 도출 방안으로 '세대 간 연대 기금' 조성을 제안하는 등 정책적 상상력을 발휘함. 다양한 사회 현상을 다각도로 "
-                                             '분석하고, 이론적 지식을 실제 정책 제안으로 연결하는 논증적 사고력이 매우 뛰어남.'},
-                                      {'학년': '1',
-                                       '영역': '통합사회',
-                                       '내용': '현대 민주주의의 위기 담론을 접하고 대의제 민주주의가 직면한 대표성 결여와 정치적 양극화 문제를 심층적으로 탐구함. 특히 디지털 플랫폼의 확산이 여론 형성에 미치는 '
-                                             "영향을 분석하며, 알고리즘에 의한 확증 편향이 시민들의 합리적 토론을 저해하는 기제를 비판적으로 고찰함. '민주주의의 질적 저하와 시민 참여의 본질'이라는 주제로 "
-                                             '발표하며, 단순한 투표 행위를 넘어선 숙의 민주주의의 필요성을 역설함. 사회적 갈등을 해결하기 위한 제도적 장치로서의 합의제 민주주의 모델을 조사하고, 이를 한국 '
-                                             '사회의 다원적 갈등 구조에 적용할 수 있는 방안을 논리적으로 제시함. 자료 조사 과정에서 통계청의 사회조사 데이터를 활용하여 세대 간, 계층 간 정치적 인식 차이를 '
-                                             '시각화하고, 이를 사회적 자본의 관점에서 해석하는 등 실증적 분석 역량을 보여줌. 토론 과정에서 상대방의 논리를 경청하고 자신의 주장을 보완하는 과정에서 우수한 '
-                                             '의사소통 능력과 비판적 사고력을 드러냄.'},
-                                      {'학년': '1',
-                                       '영역': '과학탐구실험',
-                                       '내용': "사회적 불평등이 정치적 의사결정에 미치는 영향을 분석하기 위해 '데이터 기반의 정책 결정과 사회적 합의'라는 주제로 탐구 활동을 수행함. 베르누이 법칙을 유체역학적 "
-                                             '관점에서 해석하는 것을 넘어, 이를 사회 시스템의 흐름에 비유하여 자원 배분의 효율성과 형평성 문제를 수학적으로 모델링하려는 시도를 함. 특히 복잡계 이론을 정치학에 '
-                                             '접목하여, 작은 정책 변화가 사회 전체의 여론 지형에 미치는 파급 효과를 시뮬레이션하는 과정에서 고등학생 수준을 뛰어넘는 분석적 집중력을 보여줌. 사회적 약자를 위한 '
-                                             '정책이 실질적인 효용을 거두기 위해 필요한 변인 통제와 정책 설계의 정교함을 강조하며, 향후 정치경제학적 방법론을 통해 혈류역학적 유동성처럼 사회적 자본의 흐름을 '
-                                             '증명해 보고 싶다는 포부를 밝힘.'},
-                                      {'학년': '2',
-                                       '영역': '자율활동',
-                                       '내용': "독서활동 시간에 '정의란 무엇인가(마이클 샌델)'를 읽고 공동체주의와 자유주의의 대립이 현대 정치철학에서 갖는 함의를 탐구함. 거울 뉴런과 공감의 메커니즘을 사회적 "
-                                             '연대와 연결하여, 타자에 대한 이해가 어떻게 정치적 관용으로 이어질 수 있는지 고찰함. 학습 멘토링의 멘토로서 멘티와 함께 정치외교학 관련 심화 학습 계획을 세우고 '
-                                             '실천함. 사회 문제 예방 교육을 통해 구조적 폭력이 개인의 인지적 능력과 사회적 신뢰에 미치는 악영향을 조사하고, 이를 해결하기 위한 제도적 보완책을 제안함. 학급 '
-                                             "자치회 임원으로서 소통과 존중을 바탕으로 팔로우십을 발휘하며, 학급 내 '민주 시민 도우미'로 활동하며 갈등 조정과 의견 수렴의 역할을 수행함. 학기 말 '본받고 "
-                                             "싶은 친구 추천'에서 논리적인 문제 접근법과 타인을 배려하는 태도를 인정받아 높은 평가를 받음. 멘토링 과정에서 효과적인 지식 전달을 위해 논리적이고 체계적인 언어 "
-                                             '구성이 필수적임을 깨닫고, 정치적 담론을 대중에게 쉽게 전달하는 커뮤니케이션 역량의 중요성을 소감문으로 작성함.'},
-                                      {'학년': '2',
-                                       '영역': '동아리활동',
-                                       '내용': "정치외교학 심화 탐구 동아리에서 '디지털 민주주의와 대의제의 보완적 결합'을 주제로 연구를 주도함. 현대 대의제 민주주의가 겪는 대표성 위기를 극복하기 위해 숙의 "
-                                             '민주주의 모델을 디지털 공간에 어떻게 이식할 수 있을지 논리적으로 분석함. 특히 알고리즘에 의한 확증 편향이 시민의 합리적 의사결정을 저해하는 기제를 분석하며, 이를 '
-                                             "해결하기 위한 '디지털 숙의 플랫폼'의 설계 원리를 제안함. 정치철학적 고전인 루소의 일반의지 개념과 현대의 참여 민주주의 이론을 비교하며, 단순한 다수결이 아닌 "
-                                             '질적 합의를 도출하기 위한 제도적 장치로서의 블록체인 기반 투표 시스템의 가능성을 탐구함. 또한, 정치적 양극화가 심화되는 원인을 사회적 자본의 감소와 연결하여 '
-                                             "분석하고, 이를 회복하기 위한 시민 교육의 방향성을 제시함. 동아리원들과 함께 '디지털 시대의 시민성'에 관한 토론을 주도하며, 다양한 관점을 수용하고 논리적 근거를 "
-                                             '바탕으로 자신의 주장을 개진하는 탁월한 소통 능력을 보여줌. 특히, 정책 결정 과정에서의 투명성 확보가 민주주의의 신뢰 회복에 필수적임을 강조하며, 실제 공공 정책 '
-                                             '수립 과정에 시민 참여를 확대하기 위한 구체적인 로드맵을 작성함. 이러한 탐구 과정에서 정치학적 이론을 현실의 정책 문제와 연결하는 통찰력이 돋보였으며, 향후 '
-                                             '정치외교학도로서 갖추어야 할 비판적 사고력과 문제 해결 능력을 충분히 입증함. 연구 결과물로 제출한 보고서에서는 디지털 기술이 민주주의의 도구가 될지 혹은 위협이 '
-                                             '될지에 대한 균형 잡힌 시각을 견지하며, 기술적 보완과 제도적 성숙이 병행되어야 함을 역설함.'},
-                                      {'학년': '2',
-                                       '영역': '진로활동',
-                                       '내용': "정치외교학 진로 탐색의 일환으로 '현대 국가의 위기와 사회적 불평등의 정치학'을 주제로 자율 탐구 활동을 수행함. 토마 피케티의 자본론적 관점을 정치학적으로 "
-                                             '재해석하여, 경제적 양극화가 민주주의의 질적 저하를 초래하는 경로를 추적함. 특히, 불평등이 정치적 무관심과 포퓰리즘의 확산으로 이어지는 과정을 데이터 기반으로 '
-                                             "분석하며, 사회적 안전망이 정치적 안정성에 미치는 영향을 심층적으로 고찰함. 진로 독서 활동을 통해 '정의란 무엇인가(마이클 샌델)'를 읽고, 공동체주의적 관점에서 "
-                                             '현대 사회의 갈등 해결 방안을 모색하는 발표를 진행함. 의사결정 과정에서 개인의 자유와 공동체의 가치가 충돌할 때, 정치적 리더십이 어떠한 가치를 우선순위에 두어야 '
-                                             '하는지에 대한 자신의 소신을 밝히고 친구들의 깊은 공감을 끌어냄. 또한, 정치외교학 분야의 전문가 초청 강연에 참여하여, 국제 관계에서의 다자주의 외교가 가지는 '
-                                             '실효성과 한계에 대해 질문하며 학문적 호기심을 확장함. 자신의 진로에 대해 구체적인 설계와 실천 계획을 세워 노력하는 모습이 인상적이며, 인문학적 소양을 바탕으로 '
-                                             '정치 현상을 다각도에서 분석하려는 태도가 매우 돋보임. 특히, 퇴행성 질환과 같은 사회적 문제 해결을 위한 정책적 접근을 고민하며, 과학 기술의 발전이 가져올 사회적 '
-                                             '변화를 정치적으로 어떻게 관리할 것인가에 대한 고민을 이어감. 이러한 탐구 과정은 단순한 지식 습득을 넘어, 사회적 약자를 배려하고 정의로운 사회를 구현하고자 하는 '
-                                             '예비 정치학도로서의 사명감과 책임감을 보여주는 계기가 됨.'},
-                                      {'학년': '2',
-                                       '영역': '수학 1',
-                                       '내용': '수학적 모델링을 통해 사회 현상을 분석하는 능력에 탁월한 역량을 보임. 특히, 함수와 수열의 개념을 활용하여 사회적 불평등 지수인 지니계수의 변화 추이를 분석하고, '
-                                             '이를 통해 경제 정책의 효과성을 검증하는 탐구 활동을 수행함. 그래프를 정확하게 그려 사회적 지표의 변화를 시각화하고, 이를 바탕으로 정책의 개선 방향을 논리적으로 '
-                                             '도출함. 기하학적 관점이 포함된 문제에서 강점을 보이며, 수업 중 배운 개념과 관련된 심화 내용을 탐구하여 그 원리를 파악하고자 노력함. 명제의 증명을 알아보며 '
-                                             "수학적 논리 구조가 정치적 담론의 타당성을 검증하는 데 필수적임을 깨달음. '데이터 기반의 정책 결정과 사회적 합의'라는 주제로 발표하며, 통계적 수치가 정치적 "
-                                             '의사결정에 미치는 영향과 그 한계를 수학적으로 분석함. 자료에서 사용된 주된 알고리즘 중 회귀 분석에 활용되는 최소제곱법의 원리를 설명하고, 이를 통해 사회적 현상을 '
-                                             '예측하는 모델의 신뢰성을 높이는 방법을 제시함. 앞으로 정치외교학이 수학적 모델링과 어떤 모습으로 결합하여 사회 문제를 해결해 나갈지 궁금해하며, 수리정치학 관련 '
-                                             '모델을 심층적으로 연구해 보고자 하는 포부를 밝힘. 푸리에 변환과 같은 복잡한 수학적 도구가 사회적 데이터의 잡음을 제거하고 핵심적인 경향성을 파악하는 데 유용함을 '
-                                             '이해하고, 이를 정치적 여론 분석에 응용할 가능성을 탐색함. 자기 성찰적인 학습 태도를 바탕으로 수학적 개념을 사회과학적 문제 해결에 적용하려는 시도는 매우 '
-                                             '창의적이며, 향후 데이터 기반의 정책 전문가로 성장할 잠재력을 충분히 보여줌.'},
-                                      {'학년': '2',
-                                       '영역': '독서',
-                                       '내용': "정치철학적 담론과 경제적 의사결정 모델을 통합적으로 분석하는 역량이 탁월함. '정의란 무엇인가(마이클 샌델)'를 읽고 공리주의적 효율성과 공동체적 가치 사이의 갈등을 "
-                                             "현대 대의제 민주주의의 정책 결정 과정에 대입하여 비판적으로 고찰함. 특히 '넛지(리처드 탈러)'를 통해 인간의 비합리적 선택을 유도하는 설계가 민주적 자율성을 "
-                                             "침해할 가능성을 지적하며, 행동경제학적 기법이 정치적 선동으로 변질될 위험성을 경계해야 한다는 논지를 펼침. 또한 '네트워크는 힘이 세다(정하웅)'를 통해 복잡계 "
-                                             "네트워크 이론을 접한 후, 이를 정치적 양극화 현상과 연결하여 정보의 파편화가 어떻게 집단 극단화를 가속하는지 분석함. '과학 혁명의 구조(토마스 쿤)'를 읽고 "
-                                             "패러다임 전환의 개념을 정치 체제의 변동과 연결하여, 기존 대의제 시스템이 직면한 위기가 단순한 기술적 오류가 아닌 근본적인 패러다임의 쇠퇴임을 논증함. '인체 "
-                                             "시장(로리 앤드류스)'을 읽고는 공공재의 영역이 사유화되는 현상을 비판하며, 시민의 기본권이 시장 논리에 의해 잠식되는 상황에 대한 윤리적 방어 기제로서의 정치적 "
-                                             '참여를 강조함. 독서 활동 전반에서 추상적인 이론을 구체적인 사회적 사건과 연결하여 논리적으로 재구성하는 능력이 매우 뛰어남.'},
-                                      {'학년': '2',
-                                       '영역': '수학',
-                                       '내용': "사회적 네트워크의 구조적 특성을 수학적으로 모델링하는 데 깊은 관심을 보임. 그래프 이론을 활용하여 정치적 의사결정 과정에서의 영향력 전파 경로를 분석하는 '네트워크 "
-                                             "중심성 지표와 정치적 의사결정의 효율성'이라는 주제로 탐구 활동을 수행함. 특히 연결 중심성, 근접 중심성, 매개 중심성 개념을 실제 의회 내 정당 간 협력 구조에 "
-                                             '대입하여, 특정 정당이 의사결정의 병목 현상을 유발하거나 합의를 도출하는 핵심 노드로서 기능하는 방식을 수리적으로 증명함. 다항식의 연산과 행렬을 활용하여 네트워크의 '
-                                             '인접 행렬을 구성하고, 이를 통해 정당 간의 연대 강도를 정량화하는 모델을 제시함. 단순한 이론적 탐구에 그치지 않고, 수학적 도구가 복잡한 정치적 역학 관계를 '
-                                             '가시화하고 객관적인 정책 대안을 제시하는 데 어떻게 기여할 수 있는지에 대한 통찰을 보여줌. 수학적 논리력을 바탕으로 사회 현상을 구조화하는 능력이 매우 우수하며, '
-                                             '데이터 기반의 정치학 연구 방법론에 대한 높은 이해도를 입증함.'}],
-                       'comments': [{'구분': '스토리라인 설정',
-                                     '내용': "1학년 초기부터 '현대 민주주의의 위기와 대의제 보완'이라는 명확한 학술적 화두를 설정하고, 이를 정치철학적 고찰과 실증적 정책 분석이라는 두 축으로 심화시킨 점이 매우 "
-                                           '탁월함. 인문학적 소양과 사회과학적 방법론을 결합하여 일관된 탐구 궤적을 형성한 점은 최상위권 인문계 학생으로서의 학문적 정체성을 확고히 보여줌.'},
-                                    {'구분': '자율활동 주제 선정',
-                                     '내용': '디지털 플랫폼의 알고리즘이 여론 형성에 미치는 영향을 분석한 것은 시의적절하며, 단순한 현상 나열을 넘어 확증 편향이 시민의 합리적 토론을 저해하는 기제를 논리적으로 '
-                                           '규명함. 다만, 문제 제기 이후 구체적인 제도적 대안을 제시하는 과정에서 정치철학적 근거를 더욱 보강한다면 탐구의 완성도가 한층 높아질 것으로 판단됨.'},
-                                    {'구분': '진로활동의 구체성',
-                                     '내용': '경제적 불평등과 민주주의의 질적 저하 상관관계를 토마 피케티의 이론을 통해 분석한 점은 학생의 높은 학문적 수준을 증명함. 단순히 문헌을 읽는 것에 그치지 않고, 이를 '
-                                           '정치학적 관점에서 재해석하여 자신만의 보고서를 작성한 과정은 진로에 대한 진지한 탐구 태도를 잘 보여주며, 향후 연구 역량의 발전 가능성을 시사함.'},
-                                    {'구분': '동아리활동 심화',
-                                     '내용': '국제 관계에서의 힘의 논리와 국제법의 실효성을 현실주의와 자유주의 이론으로 비교 분석한 점은 매우 인상적임. 특히 강대국 중심 질서 속에서 중견국의 외교 전략을 게임 '
-                                           '이론적 관점으로 풀어낸 시도는 논리적 엄밀함을 갖추고 있음. 다만, 이론적 분석을 넘어 실제 사례 연구를 추가했다면 더욱 설득력 있는 탐구가 되었을 것임.'},
-                                    {'구분': '영어 세특 활용',
-                                     '내용': '다자주의 외교의 중요성을 다룬 영문 칼럼을 분석하고, 디지털 시대의 정보 격차가 민주주의에 미치는 영향을 에세이로 작성한 것은 언어 능력과 전공 적합성을 동시에 보여준 '
-                                           '우수한 사례임. 추상적인 개념을 넘어 구체적인 국가 사례나 데이터 기반의 논증을 포함했다면 학술적 에세이로서의 가치가 더욱 빛났을 것임.'},
-                                    {'구분': '국어/인문학적 소양',
-                                     '내용': "한나 아렌트의 '예루살렘의 아이히만'을 통해 악의 평범성 개념을 현대 디지털 공간의 혐오 표현 문제와 연결한 통찰력은 매우 뛰어남. 고전 텍스트를 현대 사회의 병리적 "
-                                           '현상과 유기적으로 결합하여 비판적으로 해석하는 능력은 인문학적 소양과 사회적 상상력을 동시에 갖추고 있음을 잘 보여줌.'},
-                                    {'구분': '통합사회/사회적 관심',
-                                     '내용': "대의제 민주주의의 대표성 위기를 미헬스의 '엘리트 과두제의 철칙'으로 분석하고, 블록체인 기술을 활용한 직접 민주주의의 가능성을 탐구한 점은 매우 창의적임. 기존 정치 "
-                                           '이론의 한계를 현대 기술로 극복하려는 시도는 학생의 비판적 사고력과 문제 해결 능력을 동시에 보여주는 훌륭한 사례임.'},
-                                    {'구분': '통합과학/동기 보완',
-                                     '내용': '데이터 기반의 정책 결정과 사회적 합의라는 주제로 탐구한 과정은 과학적 방법론을 사회 현상 분석에 적용하려는 시도로서 가치가 있음. 다만, 탐구 동기를 교과서적 '
-                                           '호기심에서 출발하여 최신 사회과학 논문이나 데이터 분석 사례까지 확장하는 과정을 더욱 스토리 있게 기술했다면 탐구의 깊이가 더 돋보였을 것임.'},
-                                    {'구분': '과학탐구실험/수준 향상',
-                                     '내용': '유체역학적 법칙을 사회 시스템의 자원 배분 효율성 분석에 비유하여 해석한 부분은 고등학생 수준을 뛰어넘는 탁월한 융합적 사고력을 보여줌. 복잡한 사회 현상을 과학적 '
-                                           '모델로 치환하여 분석하려는 시도는 학생의 학문적 유연성과 집중력을 잘 드러내며, 향후 사회과학 연구자로서의 잠재력을 충분히 입증함.'},
-                                    {'구분': '수학/융합적 탐구',
-                                     '내용': '사회적 불평등 데이터를 통계적으로 분석하여 정치적 의사결정 모델을 구축하려는 시도는 수학적 역량과 사회과학적 관심사가 결합된 매우 우수한 사례임. 향후 수리정치학적 모델 '
-                                           '연구로 확장할 수 있는 가능성을 보여주었으며, 정량적 분석을 통해 사회 현상을 객관화하려는 태도가 매우 돋보임.'},
-                                    {'구분': '독서/비판적 사고',
-                                     '내용': '정치철학, 경제학, 네트워크 이론 등 다양한 분야의 서적을 섭렵하고 이를 자신의 탐구 주제와 유기적으로 연결한 점이 매우 우수함. 다만, 세특 기술 시에는 단순히 독서 '
-                                           '목록을 나열하기보다, 독서 토론이나 심화 탐구 과정에서 해당 도서가 학생의 논리를 어떻게 변화시켰는지 구체적인 활동 중심으로 서술하는 것이 더욱 효과적임.'}]},
- 'case_2_natural_science': {'personal_info': {'대상': '서울대학교 공과대학 전기정보공학부 합격생',
-                                              '고등학교_유형': '과학중점 일반고',
-                                              '내신_성적': '1.1 ~ 1.2',
-                                              '주요_특징': "1학년 때부터 '자율주행 시스템의 제어 알고리즘 및 센서 퓨전 기술'을 핵심 주제로 설정하여, 수학적 모델링과 파이썬 기반 시뮬레이션을 통해 공학적 "
-                                                       '문제 해결 역량을 심화 탐구한 케이스',
-                                              '총평': "1학년 때부터 '자율주행 시스템의 제어 알고리즘 및 센서 퓨전 기술'을 핵심 주제로 설정하여, 수학적 모델링과 파이썬 기반 시뮬레이션을 통해 공학적 문제 "
-                                                    '해결 역량을 심화 탐구한 케이스'},
-                            'activities': [{'학년': '1',
-                                            '영역': '자율활동',
-                                            '내용': '자율주행 시스템의 핵심인 센서 퓨전 기술의 효율성을 높이기 위해, 악천후 상황에서 라이다(LiDAR)와 카메라 센서 데이터가 상호 보완되는 메커니즘을 '
-                                                  '분석함. 단순히 센서의 물리적 한계를 나열하는 데 그치지 않고, 칼만 필터(Kalman Filter) 알고리즘을 적용하여 노이즈가 섞인 센서 데이터에서 '
-                                                  "객체의 위치를 추정하는 수학적 모델링을 수행함. 교내 메이커톤 활동에서 '교실 내 공기질 최적화 제어 시스템'을 주제로, 센서 데이터 기반의 PID 제어 "
-                                                  '알고리즘을 설계하여 환기 장치의 가동률을 최적화하는 프로토타입을 구상함. 에너지 효율과 실내 쾌적도를 동시에 만족시키기 위한 제어 로직을 파이썬으로 '
-                                                  '시뮬레이션하며, 데이터 기반의 의사결정이 공학적 문제 해결에 미치는 영향력을 체감함. 기술적 구현 과정에서 발생한 오차를 분석하고 이를 보정하기 위한 피드백 '
-                                                  '루프를 설계하는 등, 시스템 공학적 사고방식을 바탕으로 사회적 문제를 기술적으로 해결하려는 태도를 보임.'},
-                                           {'학년': '1',
-                                            '영역': '동아리활동',
-                                            '내용': '전기전자공학 동아리에서 일렉트로웨팅(Electrowetting) 현상을 이용한 가변 초점 렌즈의 원리를 탐구하고, 이를 실제 광학 시스템에 적용하는 실험을 '
-                                                  '주도함. 전압 변화에 따른 액체 방울의 접촉각 변화를 수학적으로 모델링하여 렌즈의 곡률 반경을 예측하는 보고서를 작성함. 또한, 최근 반도체 공정에서 '
-                                                  "주목받는 '랩온어칩(Lab-on-a-Chip)' 기술의 미세 유체 제어 원리를 학습하며, 전기적 신호로 액체를 정밀하게 제어하는 기술이 차세대 컴퓨팅 "
-                                                  '아키텍처인 뉴로모픽 소자 개발에 어떻게 응용될 수 있는지 심화 탐구함. 과학 체험 부스 운영 시, 복잡한 회로 이론을 일반 학생들도 이해할 수 있도록 '
-                                                  '시각화된 시뮬레이션 자료를 제작하여 설명하는 등 공학적 소통 능력을 발휘함. 특히, 아두이노를 활용한 자율주행 RC카 제작 프로젝트에서 장애물 회피 '
-                                                  '알고리즘을 개선하기 위해 초음파 센서와 적외선 센서의 데이터를 융합하는 로직을 직접 코딩하였으며, 하드웨어와 소프트웨어의 유기적 결합을 통해 시스템의 '
-                                                  '안정성을 확보하는 과정을 경험함.'},
-                                           {'학년': '1',
-                                            '영역': '진로활동',
-                                            '내용': '인간의 뇌 신경망 구조를 모방한 뉴로모픽 컴퓨팅에 깊은 관심을 가지고, 시냅스의 연결 강도 조절을 통한 정보 처리 방식을 인공지능 알고리즘과 비교 분석함. '
-                                                  '기존 폰 노이만 구조의 한계를 극복하기 위한 대안으로, 저전력 고효율 연산이 가능한 비휘발성 메모리 소자(Memristor)의 물리적 특성을 조사하고 이를 '
-                                                  '수학적 행렬 연산 모델로 구현하는 탐구 활동을 수행함. 진로 컨설팅을 통해 자신의 강점인 수리적 모델링 역량과 프로그래밍 능력을 전기정보공학 분야의 시스템 '
-                                                  '제어 및 데이터 분석과 연결하는 로드맵을 수립함. SW 특강에서 인공지능의 학습 효율을 극대화하기 위한 하드웨어 가속기 설계의 중요성을 깨닫고, 인간의 '
-                                                  '신경계가 정보를 전달하는 화학적 시냅스 체계를 반도체 회로로 구현하는 기술적 난제에 대해 토론함. 기술 발전이 인간의 정체성과 충돌할 가능성을 인지하고, '
-                                                  '공학자로서 기술의 윤리적 책임과 인간 존엄성을 보장하는 시스템 설계의 필요성을 강조하는 소감문을 작성함. 향후 자율주행 시스템의 신뢰성을 확보하기 위한 '
-                                                  '하드웨어 기반의 안전 제어 알고리즘 연구를 수행하겠다는 구체적인 진로 목표를 설정함.'},
-                                           {'학년': '1',
-                                            '영역': '국어',
-                                            '내용': "공학적 사고의 확장과 기술 윤리를 주제로 '엔지니어의 인문학적 상상력'을 탐구함. 자율주행 시스템의 알고리즘이 직면할 수 있는 윤리적 딜레마를 다룬 도서를 "
-                                                  '읽고, 트롤리 딜레마를 프로그래밍적 관점에서 재해석한 서평을 작성함. 단순히 도덕적 판단을 내리는 것을 넘어, 센서 데이터의 불확실성과 판단의 우선순위를 '
-                                                  "결정하는 가중치 산출 로직을 수학적으로 어떻게 정량화할 것인지에 대해 논리적으로 서술함. 또한, 기술의 발전이 인간의 삶에 미치는 영향을 고찰하며 '기술의 "
-                                                  "민주적 통제'라는 개념을 조사함. 인공지능의 판단 근거를 설명 가능하게 만드는 XAI(Explainable AI) 기술의 필요성을 역설하며, 공학자가 "
-                                                  '갖추어야 할 사회적 책임감을 강조함. 문학 작품 속 인물의 갈등을 시스템의 오류 상황과 연결 지어 분석하는 등, 인문학적 텍스트를 공학적 문제 해결의 '
-                                                  '관점에서 재구성하는 독창적인 독서 활동을 수행함.'},
-                                           {'학년': '1',
-                                            '영역': '영어',
-                                            '내용': "전기정보공학 분야의 최신 논문인 '자율주행차의 센서 퓨전 및 실시간 객체 인식 기술'에 관한 영문 아티클을 읽고, 기술적 핵심 원리를 요약하여 영어 에세이를 "
-                                                  '작성함. 특히 칼만 필터(Kalman Filter)를 활용한 데이터 노이즈 제거 과정과 센서 간의 데이터 동기화 메커니즘을 영어로 명확히 설명함. 에세이 '
-                                                  '작성 과정에서 관계대명사의 계속적 용법과 분사구문을 활용하여 복잡한 공학적 인과관계를 논리적으로 기술하는 능력을 보여줌. 또한, 자율주행의 안전성을 확보하기 '
-                                                  '위한 엣지 컴퓨팅(Edge Computing)의 중요성에 대해 발표하며, 데이터 처리 속도와 정확도 사이의 트레이드오프 관계를 영어로 유창하게 설명함. '
-                                                  '다양한 기술적 어휘를 습득하고 이를 문맥에 맞게 활용하는 능력이 탁월하며, 복잡한 공학적 개념을 영어로 구조화하여 전달하는 역량이 매우 뛰어남. 수업 중 '
-                                                  '진행된 토론에서 기술의 표준화와 국제적 협력의 필요성을 논리적으로 주장하여 급우들의 높은 평가를 받음.'},
-                                           {'학년': '1',
-                                            '영역': '통합사회',
-                                            '내용': "자율주행차 도입에 따른 사회적 변화와 경제적 파급 효과를 주제로 '공유지의 비극과 자율주행 인프라 최적화'를 탐구함. 도로라는 공유 자원을 효율적으로 "
-                                                  '활용하기 위해 자율주행차 간의 통신(V2V)을 통한 교통 흐름 제어 알고리즘을 사회적 분배 모델로 치환하여 분석함. 개인의 최적 경로 선택이 전체 교통망의 '
-                                                  "효율을 저해하는 '브래스의 역설'을 조사하고, 이를 해결하기 위한 중앙 집중식 제어 시스템의 사회적 합의 과정을 경제학적 관점에서 고찰함. 특히, 자율주행 "
-                                                  '기술이 가져올 노동 시장의 변화와 이에 따른 사회 안전망 구축 방안을 데이터 기반으로 예측함. 고령화 사회에서 자율주행 이동 수단이 가지는 사회적 가치를 '
-                                                  '분석하며, 기술적 접근이 어떻게 사회적 불평등을 완화할 수 있는지에 대한 구체적인 정책적 대안을 제시함. 사회 현상을 공학적 모델링으로 해석하고, 이를 다시 '
-                                                  '사회적 가치로 환원하는 융합적 사고력이 매우 돋보임.'},
-                                           {'학년': '1',
-                                            '영역': '통합과학',
-                                            '내용': '전기정보공학적 관점에서 시스템 제어의 기초가 되는 피드백 루프와 신호 처리 원리를 탐구함. 특히 센서 데이터의 노이즈를 제거하고 신뢰도를 높이는 알고리즘에 '
-                                                  '관심을 두고, 아두이노 기반의 거리 측정 센서 실험을 통해 데이터의 오차 범위를 분석함. 단순히 센서의 물리적 특성을 나열하는 수준을 넘어, 측정값의 분산을 '
-                                                  '줄이기 위한 이동 평균 필터(Moving Average Filter)를 파이썬으로 직접 구현하여 데이터의 평활화 과정을 시각화함. 물리적 현상을 수학적 '
-                                                  "모델로 치환하는 과정에서 미분과 적분의 개념을 적용하여, 시간에 따른 위치 변화율과 가속도 데이터를 정밀하게 추정하는 모델을 설계함. '시스템의 "
-                                                  "안정성'이라는 주제로 제어 변수와 출력값의 상관관계를 확인하기 위한 실험을 진행함. PID 제어의 기초 원리를 학습하고, 모터의 회전 속도를 일정하게 "
-                                                  '유지하기 위한 변인 통제 실험을 수행함. 초기 실험에서 외부 저항과 전압 강하로 인해 데이터의 일관성이 확보되지 않자, 회로의 임피던스를 재계산하고 전압 '
-                                                  '안정화 회로를 추가하는 등 공학적 문제 해결 과정을 거침. 팀원들과 함께 실험 데이터를 분석하며 오차의 원인을 논리적으로 규명하고, 시스템의 응답 속도를 '
-                                                  '최적화하기 위한 파라미터 튜닝 과정을 주도하는 등 뛰어난 공학적 직관과 협업 능력을 보여줌.'},
-                                           {'학년': '1',
-                                            '영역': '과학탐구실험',
-                                            '내용': '유체 역학의 기본 원리인 베르누이 법칙을 활용하여, 파이프라인 내 유체의 흐름과 압력 변화를 분석하는 실험을 수행함. 벤츄리 효과를 이용한 유량 측정 장치의 '
-                                                  '원리를 학습한 후, 이를 토리첼리의 정리와 결합하여 유체의 속도와 압력 간의 관계를 수학적으로 유도함. 특히 베르누이 방정식을 단순한 이론적 수식으로 '
-                                                  '이해하는 데 그치지 않고, 이를 실제 전기정보공학 분야의 냉각 시스템 설계에 적용하는 방안을 모색함. 고성능 프로세서의 발열을 제어하기 위한 액체 냉각 '
-                                                  '시스템에서 유체의 유속이 열전달 효율에 미치는 영향을 수치 해석적으로 접근함. 유체역학적 지식을 바탕으로 혈류의 흐름을 모사한 유체 회로를 설계하고, 펌프의 '
-                                                  '압력 변화에 따른 유동 특성을 시뮬레이션하여 데이터화함. 고등학생 수준을 넘어서는 복잡한 미분 방정식의 수치적 해법을 탐구하고, 이를 파이썬 코드로 구현하여 '
-                                                  '유체의 유동 과정을 시각적으로 증명해 낸 점이 매우 인상적임. 향후 유체역학적 모델링을 전기 회로의 신호 전송 이론과 결합하여, 시스템의 열적 안정성을 '
-                                                  '극대화하는 지능형 냉각 제어 알고리즘을 개발하겠다는 구체적인 공학적 포부를 밝힘.'},
-                                           {'학년': '2',
-                                            '영역': '자율활동',
-                                            '내용': '인공지능의 신경망 구조와 인간의 뇌 정보 처리 방식을 비교 분석하는 독서 활동을 통해, 거울 뉴런과 공유 회로 개념을 공학적 관점에서 재해석함. 자폐증과 '
-                                                  '같은 신경 발달 장애를 정보 처리의 오류로 정의하고, 이를 보완하기 위한 신경망 모델의 가중치 최적화 방안을 탐구함. 학습 멘토링의 멘토로서 물리 및 수학 '
-                                                  '과목의 논리적 사고 체계를 전수하며, 멘티의 학습 습관을 분석하여 최적화된 알고리즘적 학습 경로를 제시함. 약물과 신경계의 상호작용을 조사하며, 외부 신호가 '
-                                                  '생체 시스템의 제어 신호를 어떻게 교란하는지 분석하고, 이를 시스템 보안 및 노이즈 주입 공격의 관점에서 고찰함. 학급 자치회 임원으로서 시스템의 안정적 '
-                                                  '운영을 위한 리더십을 발휘함. 학급 내 보건 도우미로서 방역 시스템을 효율적으로 관리하고, 데이터 기반의 발열 체크 프로세스를 정립하여 학급 운영의 효율성을 '
-                                                  "높임. 멘토링 활동에서는 복잡한 수학 문제를 단계별로 분해하여 해결하는 '분할 정복(Divide and Conquer)' 방식의 풀이법을 고안하여 멘티의 "
-                                                  '이해도를 획기적으로 개선함. 자신의 설명 방식을 메타인지적으로 분석하여, 논리적 오류를 수정하고 표현의 명확성을 높이는 과정을 통해 스스로의 공학적 '
-                                                  '커뮤니케이션 능력을 극대화함. 이러한 활동들은 단순한 봉사를 넘어, 시스템의 효율성을 극대화하고 구성원 간의 상호작용을 최적화하려는 공학자로서의 자질을 '
-                                                  '유감없이 보여준 사례임.'},
-                                           {'학년': '2',
-                                            '영역': '동아리활동',
-                                            '내용': '전기정보공학 동아리에서 신호 처리 및 제어 시스템의 효율성을 극대화하기 위한 프로젝트를 주도함. 특히 칼만 필터(Kalman Filter)를 활용한 센서 '
-                                                  '데이터 노이즈 제거 알고리즘을 구현하며, 라이다와 카메라 센서의 데이터 퓨전 과정에서 발생하는 오차를 수학적으로 모델링하고 분석함. 이중슬릿 실험을 응용하여 '
-                                                  '광학 센서의 해상도와 정밀도에 영향을 미치는 변인들을 통제하고, 무늬 간격의 변화를 파동 방정식과 연계하여 수식으로 증명하는 논리적 사고력을 보여줌. 양자 '
-                                                  '컴퓨팅의 기본 원리인 양자 얽힘과 중첩 현상을 정보 처리 알고리즘에 적용하는 방안을 탐구하며, 기존 폰 노이만 구조의 한계를 극복할 수 있는 뉴로모픽 '
-                                                  '컴퓨팅의 가능성을 제시함. 특히 광유전학적 신경 신호 제어 메커니즘을 공학적 피드백 루프로 해석하여, 뇌의 특정 신경 회로를 선택적으로 자극하는 제어 '
-                                                  '알고리즘을 설계함. 파킨슨병 치료를 위한 뇌심부자극술의 비효율성을 개선하기 위해, 실시간 신경 신호 모니터링과 폐루프(Closed-loop) 제어가 가능한 '
-                                                  '웨어러블 디바이스의 하드웨어 아키텍처를 제안함. 뇌 바닥핵의 직접 경로와 간접 경로의 신호 전달 체계를 제어 이론의 관점에서 분석하고, 신경망의 가중치 '
-                                                  '조절을 통한 최적화 모델을 수립하여 운동 질환의 증상을 완화할 수 있는 알고리즘의 타당성을 검증함. 이러한 탐구 과정에서 공학적 문제 해결을 위한 수학적 '
-                                                  '모델링 역량과 시스템 설계 능력을 유감없이 발휘함.'},
-                                           {'학년': '2',
-                                            '영역': '진로활동',
-                                            '내용': '자율주행 및 지능형 로봇 시스템의 안전성과 신뢰성을 주제로 한 탐구 전시회에서, 복잡한 도심 환경에서의 객체 인식 알고리즘과 그에 따른 사회적 인프라 최적화 '
-                                                  '방안을 발표함. 기술적 완성도뿐만 아니라 자율 시스템이 직면할 수 있는 윤리적 딜레마와 알고리즘의 편향성 문제를 공학적 관점에서 해결하려는 노력이 돋보임. '
-                                                  '전기정보공학 분야로의 진로를 확고히 하고, 임베디드 시스템과 실시간 운영체제(RTOS)의 설계 원리에 대해 깊이 있게 탐구함. 특히 자율주행차의 센서 데이터 '
-                                                  '처리와 같은 고속 연산이 필요한 시스템에서 하드웨어와 소프트웨어의 최적화가 어떻게 이루어지는지 분석함. 진로진학 행사에 참여하여 최신 반도체 설계 및 시스템 '
-                                                  "온 칩(SoC) 기술 동향에 대해 전문가와 상담하며, 자신의 학업 로드맵을 구체화함. '엔지니어의 시선으로 본 미래 기술'이라는 도서를 읽고, 기술이 인간의 "
-                                                  '삶에 미치는 영향과 엔지니어의 사회적 책임에 대해 발표함. 기술적 불확실성을 최소화하기 위한 검증 과정의 중요성을 강조하며, 오류를 줄이기 위한 시스템 '
-                                                  '설계의 엄밀함을 역설함. 또한, 인공지능 알고리즘의 블랙박스 문제를 해결하기 위한 설명 가능한 인공지능(XAI)의 필요성을 제기하며, 공학적 지식과 인문학적 '
-                                                  '통찰을 결합하여 기술의 발전 방향을 제시함. 퇴행성 질환의 신호 처리 모델링을 수행하며 발견한 의문점을 해결하기 위해 관련 논문을 탐독하고, 데이터 분석을 '
-                                                  '통해 시스템의 성능을 개선하는 과학적 탐구력과 집중력을 보여줌.'},
-                                           {'학년': '2',
-                                            '영역': '수학 1',
-                                            '내용': '함수와 그래프의 기하학적 해석 능력이 탁월하며, 복잡한 수식의 구조를 파악하여 효율적인 풀이법을 도출하는 데 강점을 보임. 특히 합성함수와 역함수의 관계를 '
-                                                  '제어 시스템의 입출력 모델링에 적용하여, 신호의 변환 과정을 수학적으로 명확히 설명함. 수업 중 배운 개념을 심화하여 이산 푸리에 변환(DFT)의 원리를 '
-                                                  '탐구하고, 이를 디지털 신호 처리 알고리즘에 적용하는 과정을 발표함. 푸리에 변환의 고속 연산(FFT)을 위해 필요한 변환 길이 N과 메모리 할당 파라미터 '
-                                                  "M 사이의 로그 관계를 수식으로 유도하며, 알고리즘의 시간 복잡도를 최적화하는 방안을 제시함. '수학적 모델링을 통한 생체 신호 분석'이라는 주제로 "
-                                                  '발표하며, 심전도 데이터의 노이즈를 제거하기 위해 푸리에 급수를 활용하는 방법을 논리적으로 설명함. 수학적 이론이 실제 공학적 시스템에서 어떻게 구현되는지 '
-                                                  '탐구하며, 수리생물학적 모델링을 통해 신경 신호의 전달 속도와 주파수 특성을 분석함. 집합과 명제의 논리 구조를 프로그래밍의 조건문과 반복문에 대입하여 '
-                                                  '알고리즘의 논리적 오류를 검증하는 습관을 지님. 자기 성찰적인 학습 태도를 바탕으로 오답의 원인을 철저히 분석하고, 개념 간의 연결 고리를 찾아내어 지식의 '
-                                                  '체계를 공고히 함. 앞으로 전기정보공학 분야에서 수학적 모델링이 어떻게 시스템의 성능을 개선하고 새로운 기술적 돌파구를 마련할 수 있을지에 대해 끊임없이 '
-                                                  '질문하며, 수리적 사고력을 바탕으로 공학적 난제를 해결하려는 의지가 매우 강함.'},
-                                           {'학년': '2',
-                                            '영역': '독서',
-                                            '내용': "공학적 문제 해결을 위한 논리적 사고와 시스템적 통찰력을 바탕으로 심화 독서를 수행함. '네트워크는 힘이 세다(정하웅)'를 읽고 복잡계 네트워크 이론이 "
-                                                  "자율주행 시스템의 V2V 통신망 최적화에 적용될 수 있음을 간파함. 이를 바탕으로 '구글 신은 모든 걸 알고 있다'를 통해 데이터 마이닝과 알고리즘의 사회적 "
-                                                  "영향력을 분석하고, 토마스 쿤의 '과학 혁명의 구조'를 통해 패러다임 전환이 공학 기술의 발전에 미치는 영향을 토론함. 특히 '인체 시장(로리 앤드류스)'을 "
-                                                  '읽고 생명공학 기술이 데이터화될 때 발생하는 윤리적 쟁점과 개인정보 보호 알고리즘의 필요성을 역설함. 단순한 지식 습득을 넘어, 기술의 발전이 인간의 '
-                                                  '의사결정 구조와 사회적 네트워크에 미치는 영향을 수학적 모델링 관점에서 재해석하고, 이를 공학적 윤리 가이드라인 수립의 중요성과 연결하여 발표하는 등 비판적 '
-                                                  '사고 역량을 입증함.'},
-                                           {'학년': '2',
-                                            '영역': '수학',
-                                            '내용': '위상수학의 매듭이론(Knot Theory)을 자율주행차의 경로 최적화 및 복잡한 센서 네트워크의 연결성 분석에 응용하는 탐구를 수행함. 매듭 불변량과 존스 '
-                                                  "다항식의 수학적 구조를 파악하고, 이를 고차원 공간에서의 데이터 경로 최적화 문제로 치환하여 모델링함. '다항식을 이용한 매듭이론의 기하학적 구조와 네트워크 "
-                                                  "연결성 분석'이라는 주제로, 매듭의 교차점과 연결 상태를 행렬로 표현하여 시스템의 안정성을 평가하는 알고리즘을 설계함. 특히 다항식 연산을 통해 복잡한 "
-                                                  '네트워크 내에서 데이터 패킷이 충돌 없이 전달되는 최단 경로를 찾는 수학적 원리를 증명하였으며, 이를 통해 추상적인 수학 이론이 실제 공학적 제어 시스템의 '
-                                                  '효율성을 극대화하는 핵심 도구임을 논리적으로 입증함.'}],
-                            'comments': [{'구분': '스토리라인 설정',
-                                          '내용': '1학년부터 자율주행 시스템의 제어 알고리즘과 센서 퓨전 기술이라는 명확한 공학적 목표를 설정하고, 이를 전기정보공학부 진학을 위한 핵심 서사로 구축한 점이 매우 '
-                                                '탁월함. 수학적 모델링과 파이썬 시뮬레이션을 통해 이론을 실제 공학적 문제 해결로 연결하는 일관된 탐구 궤적이 돋보임.'},
-                                         {'구분': '자율활동 주제 선정',
-                                          '내용': '센서 퓨전 기술의 효율성 제고를 위해 악천후 상황에서의 데이터 보완 메커니즘을 분석한 것은 매우 도전적인 시도임. 칼만 필터와 같은 복잡한 알고리즘을 물리적 '
-                                                '센서 한계 극복에 적용한 논리적 전개 과정이 우수하며, 공학적 문제 정의와 해결 능력이 잘 드러남.'},
-                                         {'구분': '진로활동의 구체성',
-                                          '내용': '뉴로모픽 컴퓨팅과 인공지능 알고리즘의 연계 탐구는 전기정보공학의 최신 트렌드를 정확히 파악하고 있음을 보여줌. 폰 노이만 구조의 한계를 극복하기 위한 비휘발성 '
-                                                '메모리 소자 연구 등 구체적인 기술적 대안을 제시하여 전공 적합성을 극대화함.'},
-                                         {'구분': '동아리활동 심화',
-                                          '내용': '일렉트로웨팅 현상을 이용한 가변 초점 렌즈의 수학적 모델링은 이론과 실험의 결합 측면에서 매우 완성도가 높음. 전압과 곡률의 상관관계를 수식으로 도출하고 이를 '
-                                                '광학 시스템에 적용한 과정은 공학적 설계 역량을 충분히 입증함.'},
-                                         {'구분': '영어 세특 활용',
-                                          '내용': '전기정보공학 분야의 영문 최신 논문을 분석하여 칼만 필터의 노이즈 제거 원리를 영어 에세이로 정리한 것은 학술적 역량과 언어 능력을 동시에 보여준 좋은 사례임. '
-                                                '모호한 기술 서술 대신 구체적인 알고리즘의 작동 원리를 다룬 점이 매우 인상적임.'},
-                                         {'구분': '국어/인문학적 소양',
-                                          '내용': '자율주행 알고리즘의 윤리적 딜레마를 트롤리 딜레마와 연결하여 프로그래밍적 관점에서 재해석한 서평은 공학도의 인문학적 상상력을 잘 보여줌. 기술적 효율성과 윤리적 '
-                                                '가치 사이의 균형을 고민하는 엔지니어로서의 철학적 깊이가 느껴짐.'},
-                                         {'구분': '통합사회/사회적 관심',
-                                          '내용': '자율주행차 도입에 따른 교통 흐름 제어 알고리즘을 사회적 분배 모델과 결합하여 분석한 점이 탁월함. 기술이 사회 인프라와 어떻게 상호작용하는지를 경제적 관점에서 '
-                                                '고찰하여, 기술적 해결책이 사회적 가치로 확장될 수 있음을 증명함.'},
-                                         {'구분': '통합과학/동기 보완',
-                                          '내용': '피드백 루프와 신호 처리 원리를 아두이노 실험으로 검증한 과정은 교과서적 지식을 실무적 탐구로 발전시킨 좋은 예시임. 단순히 이론을 나열하지 않고 데이터 오차 '
-                                                '분석을 통해 시스템의 신뢰도를 높이는 과정을 논리적으로 기술함.'},
-                                         {'구분': '과학탐구실험/수준 향상',
-                                          '내용': '유체 역학의 베르누이 법칙과 벤츄리 효과를 결합하여 유량 측정 장치의 원리를 수학적으로 모델링한 것은 고등학생 수준을 뛰어넘는 분석력임. 이론적 배경을 바탕으로 '
-                                                '실험 설계와 데이터 해석을 수행하는 능력이 매우 뛰어남.'},
-                                         {'구분': '수학/융합적 탐구',
-                                          '내용': '제어 공학의 핵심인 신호 처리와 수학적 모델링을 연결하여 시스템의 안정성을 분석한 점이 훌륭함. 미분방정식과 선형대수학적 개념을 공학적 문제 해결에 활용하는 '
-                                                '모습에서 수리과학적 기초 체력이 매우 탄탄함을 확인할 수 있음.'},
-                                         {'구분': '독서/비판적 사고',
-                                          '내용': '제어 이론, 인공지능 윤리, 시스템 공학 등 전공 관련 서적을 깊이 있게 읽고 이를 자신의 탐구 활동과 유기적으로 연결한 점이 돋보임. 독서 활동이 단순한 지식 '
-                                                '습득을 넘어 실제 공학적 설계의 밑거름이 되었음을 잘 보여줌.'}]}}
-
-
-def get_hardcoded_school_record(record_id: str) -> Dict[str, Any] | None:
-    """record_id에 해당하는 하드코딩 생기부 사례를 반환한다."""
-    return HARDCODED_SCHOOL_RECORDS.get(record_id)
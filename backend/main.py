@@ -157,6 +157,20 @@ async def startup_event():
         except Exception as e:
             print(f"   ⚠️ MainAgent 초기화 실패 (무시하고 계속): {e}")
 
+    # 서버 중단으로 멈춘 PDF 수집 작업 재개 (백그라운드 워커에서 실행)
+    try:
+        from services.ingest_jobs import get_ingest_queue
+        await asyncio.to_thread(get_ingest_queue)
+    except Exception as e:
+        print(f"⚠️ PDF 수집 작업 큐 초기화 실패 (무시하고 계속): {e}")
+
+    # 관리자 통계 일별 롤업 주기 갱신 (실패해도 대시보드는 마지막 롤업으로 응답)
+    try:
+        from services.admin_analytics_rollups import start_admin_analytics_rollup_job
+        start_admin_analytics_rollup_job()
+    except Exception as e:
+        print(f"⚠️ 관리자 통계 롤업 작업 시작 실패 (무시하고 계속): {e}")
+
     try:
         await asyncio.wait_for(_warmup(), timeout=15.0)
     except asyncio.TimeoutError:
@@ -0,0 +1,48 @@
+-- PDF 업로드 청크 일괄 삽입 경로 (SupabaseUploader)
+-- (document_id, chunk_ordinal) 고유 키로 배치 재시도 시 중복 삽입 방지
+
+alter table document_chunks add column if not exists chunk_ordinal int;
+
+-- 기존 행은 chunk_ordinal이 null이라 충돌하지 않음
+create unique index if not exists uq_document_chunks_doc_ordinal
+  on document_chunks (document_id, chunk_ordinal);
+
+-- p_rows: [{section_id, chunk_ordinal, content, raw_data, embedding("[x,y,...]"), page_number, chunk_type}, ...]
+-- 이미 들어간 (document_id, chunk_ordinal)은 건너뛰고 실제 삽입된 행 수 반환
+create or replace function bulk_insert_document_chunks(
+  p_document_id bigint,
+  p_rows jsonb
+)
+returns int
+language plpgsql
+as $$
+declare
+  inserted_count int;
+begin
+  insert into document_chunks (
+    document_id, section_id, chunk_ordinal, content, raw_data, embedding, page_number, chunk_type
+  )
+  select
+    p_document_id,
+    r.section_id,
+    r.chunk_ordinal,
+    r.content,
+    r.raw_data,
+    r.embedding::vector,
+    r.page_number,
+    r.chunk_type
+  from jsonb_to_recordset(p_rows) as r(
+    section_id bigint,
+    chunk_ordinal int,
+    content text,
+    raw_data text,
+    embedding text,
+    page_number int,
+    chunk_type text
+  )
+  on conflict (document_id, chunk_ordinal) do nothing;
+
+  get diagnostics inserted_count = row_count;
+  return inserted_count;
+end;
+$$;
@@ -0,0 +1,277 @@
+-- 관리자 통계 일별 롤업 테이블
+-- 대시보드 조회마다 admin_logs / auth.users 전체를 다시 집계하지 않도록 일별 집계를 미리 저장한다.
+-- refresh_admin_analytics_rollups()는 마지막 집계일(워터마크) 전날부터만 다시 집계하며,
+-- 백엔드 주기 작업(services/admin_analytics_rollups.py)이 호출한다.
+-- 제외 이메일(admin_analytics_excluded_emails)은 집계 시점에 적용된다. 목록을 바꾼 뒤에는
+-- refresh_admin_analytics_rollups(true)로 1회 전체 재집계한다.
+
+CREATE TABLE IF NOT EXISTS public.admin_analytics_rollup_state (
+  name text PRIMARY KEY,
+  refreshed_at timestamptz NOT NULL,
+  watermark_day date NOT NULL
+);
+
+-- 일별 신규 가입자 (auth.users.created_at, 한국 날짜)
+CREATE TABLE IF NOT EXISTS public.admin_analytics_daily_signups (
+  day date PRIMARY KEY,
+  new_users bigint NOT NULL
+);
+
+-- 일별 질문 수 (admin_logs.created_at, 한국 날짜)
+CREATE TABLE IF NOT EXISTS public.admin_analytics_daily_questions (
+  day date PRIMARY KEY,
+  new_questions bigint NOT NULL
+);
+
+-- 로그인 유저별 활동일 (admin_logs.timestamp, 한국 날짜). 유저×일 1행
+CREATE TABLE IF NOT EXISTS public.admin_analytics_user_active_days (
+  user_id uuid NOT NULL,
+  day date NOT NULL,
+  PRIMARY KEY (user_id, day)
+);
+
+CREATE INDEX IF NOT EXISTS idx_admin_analytics_user_active_days_day
+  ON public.admin_analytics_user_active_days(day);
+
+-- 태생일 코호트별 Day-N 활동 유저 수 (day_n = 0은 코호트 크기)
+CREATE TABLE IF NOT EXISTS public.admin_analytics_retention_cohorts (
+  cohort_day date NOT NULL,
+  day_n integer NOT NULL,
+  users bigint NOT NULL,
+  PRIMARY KEY (cohort_day, day_n)
+);
+
+-- 증분 집계 시 created_at 범위 조회용 (timestamp 인덱스는 create_admin_logs_table.sql)
+CREATE INDEX IF NOT EXISTS idx_admin_logs_created_at ON public.admin_logs(created_at);
+
+ALTER TABLE public.admin_analytics_rollup_state ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.admin_analytics_daily_signups ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.admin_analytics_daily_questions ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.admin_analytics_user_active_days ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.admin_analytics_retention_cohorts ENABLE ROW LEVEL SECURITY;
+
+
+-- 롤업 갱신: 워터마크 전날부터 다시 집계 (p_full이면 전 기간)
+CREATE OR REPLACE FUNCTION public.refresh_admin_analytics_rollups(p_full boolean DEFAULT false)
+RETURNS TABLE(refreshed boolean, from_day date)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_today date := (now() AT TIME ZONE 'Asia/Seoul')::date;
+  v_from date;
+  v_from_ts timestamptz;
+BEGIN
+  -- 여러 워커가 동시에 호출하면 하나만 집계하고 나머지는 건너뜀
+  IF NOT pg_try_advisory_xact_lock(hashtext('refresh_admin_analytics_rollups')) THEN
+    RETURN QUERY SELECT false, NULL::date;
+    RETURN;
+  END IF;
+
+  SELECT s.watermark_day INTO v_from
+  FROM public.admin_analytics_rollup_state s
+  WHERE s.name = 'daily';
+
+  IF p_full OR v_from IS NULL THEN
+    v_from := '1970-01-01'::date;
+  ELSE
+    -- 마지막 집계일은 하루 중간 값이므로 다시 집계 (늦게 기록된 로그 대비 하루 더)
+    v_from := v_from - 1;
+  END IF;
+  v_from_ts := v_from::timestamp AT TIME ZONE 'Asia/Seoul';
+
+  -- 1) 일별 가입자
+  DELETE FROM public.admin_analytics_daily_signups WHERE day >= v_from;
+  INSERT INTO public.admin_analytics_daily_signups (day, new_users)
+  SELECT (u.created_at AT TIME ZONE 'Asia/Seoul')::date, count(*)
+  FROM auth.users u
+  WHERE u.created_at >= v_from_ts
+    AND u.email NOT IN (SELECT e.email FROM public.admin_analytics_excluded_emails e)
+  GROUP BY 1;
+
+  -- 2) 일별 질문 수
+  DELETE FROM public.admin_analytics_daily_questions WHERE day >= v_from;
+  INSERT INTO public.admin_analytics_daily_questions (day, new_questions)
+  WITH excluded AS (
+    SELECT u.id FROM auth.users u
+    WHERE u.email IN (SELECT e.email FROM public.admin_analytics_excluded_emails e)
+  )
+  SELECT (al.created_at AT TIME ZONE 'Asia/Seoul')::date, count(*)
+  FROM public.admin_logs al
+  WHERE al.created_at >= v_from_ts
+    AND (al.user_id IS NULL OR al.user_id NOT IN (SELECT id FROM excluded))
+  GROUP BY 1;
+
+  -- 3) 유저별 활동일
+  DELETE FROM public.admin_analytics_user_active_days WHERE day >= v_from;
+  INSERT INTO public.admin_analytics_user_active_days (user_id, day)
+  WITH excluded AS (
+    SELECT u.id FROM auth.users u
+    WHERE u.email IN (SELECT e.email FROM public.admin_analytics_excluded_emails e)
+  )
+  SELECT DISTINCT al.user_id, (al.timestamp AT TIME ZONE 'Asia/Seoul')::date
+  FROM public.admin_logs al
+  WHERE al.timestamp >= v_from_ts
+    AND al.user_id IS NOT NULL
+    AND al.user_id NOT IN (SELECT id FROM excluded)
+  ON CONFLICT DO NOTHING;
+
+  -- 4) 리텐션 코호트: Day-7까지 바뀔 수 있는 코호트(워터마크 7일 전부터)만 다시 집계
+  DELETE FROM public.admin_analytics_retention_cohorts WHERE cohort_day >= v_from - 7;
+  INSERT INTO public.admin_analytics_retention_cohorts (cohort_day, day_n, users)
+  WITH first_visit AS (
+    SELECT d.user_id, min(d.day) AS cohort_day
+    FROM public.admin_analytics_user_active_days d
+    GROUP BY d.user_id
+  )
+  SELECT fv.cohort_day, (d.day - fv.cohort_day)::integer, count(DISTINCT d.user_id)::bigint
+  FROM first_visit fv
+  JOIN public.admin_analytics_user_active_days d ON d.user_id = fv.user_id
+  WHERE fv.cohort_day >= v_from - 7
+    AND d.day - fv.cohort_day BETWEEN 0 AND 7
+  GROUP BY 1, 2;
+
+  INSERT INTO public.admin_analytics_rollup_state (name, refreshed_at, watermark_day)
+  VALUES ('daily', now(), v_today)
+  ON CONFLICT (name) DO UPDATE
+    SET refreshed_at = EXCLUDED.refreshed_at, watermark_day = EXCLUDED.watermark_day;
+
+  RETURN QUERY SELECT true, v_from;
+END;
+$$;
+
+COMMENT ON FUNCTION public.refresh_admin_analytics_rollups(boolean) IS '관리자 통계 일별 롤업 증분 갱신 (워터마크 전날부터, p_full이면 전 기간). 동시 호출은 advisory lock으로 1개만 실행.';
+
+
+-- 조회 1) 일별/누적 가입자 시계열 (get_auth_user_cumulative_timeseries 대체)
+CREATE OR REPLACE FUNCTION public.get_admin_rollup_signup_timeseries()
+RETURNS TABLE(day date, new_users bigint, cumulative_users bigint)
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT s.day, s.new_users, sum(s.new_users) OVER (ORDER BY s.day)::bigint AS cumulative_users
+  FROM public.admin_analytics_daily_signups s
+  ORDER BY s.day;
+$$;
+
+-- 조회 2) 일별/누적 질문 수 시계열 (get_admin_logs_question_cumulative_timeseries 대체)
+CREATE OR REPLACE FUNCTION public.get_admin_rollup_question_timeseries()
+RETURNS TABLE(day date, new_questions bigint, cumulative_questions bigint)
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT q.day, q.new_questions, sum(q.new_questions) OVER (ORDER BY q.day)::bigint AS cumulative_questions
+  FROM public.admin_analytics_daily_questions q
+  ORDER BY q.day;
+$$;
+
+-- 조회 3) 오늘 기준 롤링 창(1일~14일) 활성 사용자 수 (get_admin_logs_active_users_rolling 대체)
+CREATE OR REPLACE FUNCTION public.get_admin_rollup_active_users_rolling()
+RETURNS TABLE(days integer, active_users bigint)
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH today AS (
+    SELECT (now() AT TIME ZONE 'Asia/Seoul')::date AS d
+  ),
+  day_series AS (
+    SELECT generate_series(1, 14) AS n
+  ),
+  recent AS (
+    SELECT a.user_id, a.day
+    FROM public.admin_analytics_user_active_days a
+    WHERE a.day > (SELECT t.d FROM today t) - 14
+      AND a.day <= (SELECT t.d FROM today t)
+  )
+  SELECT
+    ds.n::integer AS days,
+    count(DISTINCT r.user_id)::bigint AS active_users
+  FROM day_series ds
+  LEFT JOIN recent r ON r.day >= (SELECT t.d FROM today t) - ds.n + 1
+  GROUP BY ds.n
+  ORDER BY ds.n;
+$$;
+
+-- 조회 4) 코호트별 Day-1~7 리텐션 (get_admin_logs_retention_day_series 대체, 같은 컬럼)
+CREATE OR REPLACE FUNCTION public.get_admin_rollup_retention_day_series(
+  cohort_day_from date DEFAULT NULL,
+  cohort_day_to date DEFAULT NULL
+)
+RETURNS TABLE(
+  cohort_day date,
+  cohort_users bigint,
+  day_1_users bigint,
+  day_2_users bigint,
+  day_3_users bigint,
+  day_4_users bigint,
+  day_5_users bigint,
+  day_6_users bigint,
+  day_7_users bigint,
+  day_1_rate numeric,
+  day_2_rate numeric,
+  day_3_rate numeric,
+  day_4_rate numeric,
+  day_5_rate numeric,
+  day_6_rate numeric,
+  day_7_rate numeric
+)
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH pivot AS (
+    SELECT
+      rc.cohort_day,
+      coalesce(sum(rc.users) FILTER (WHERE rc.day_n = 0), 0)::bigint AS cohort_users,
+      coalesce(sum(rc.users) FILTER (WHERE rc.day_n = 1), 0)::bigint AS d1,
+      coalesce(sum(rc.users) FILTER (WHERE rc.day_n = 2), 0)::bigint AS d2,
+      coalesce(sum(rc.users) FILTER (WHERE rc.day_n = 3), 0)::bigint AS d3,
+      coalesce(sum(rc.users) FILTER (WHERE rc.day_n = 4), 0)::bigint AS d4,
+      coalesce(sum(rc.users) FILTER (WHERE rc.day_n = 5), 0)::bigint AS d5,
+      coalesce(sum(rc.users) FILTER (WHERE rc.day_n = 6), 0)::bigint AS d6,
+      coalesce(sum(rc.users) FILTER (WHERE rc.day_n = 7), 0)::bigint AS d7
+    FROM public.admin_analytics_retention_cohorts rc
+    WHERE (cohort_day_from IS NULL OR rc.cohort_day >= cohort_day_from)
+      AND (cohort_day_to IS NULL OR rc.cohort_day <= cohort_day_to)
+    GROUP BY rc.cohort_day
+  )
+  SELECT
+    p.cohort_day, p.cohort_users,
+    p.d1, p.d2, p.d3, p.d4, p.d5, p.d6, p.d7,
+    round(100.0 * p.d1 / nullif(p.cohort_users, 0), 2),
+    round(100.0 * p.d2 / nullif(p.cohort_users, 0), 2),
+    round(100.0 * p.d3 / nullif(p.cohort_users, 0), 2),
+    round(100.0 * p.d4 / nullif(p.cohort_users, 0), 2),
+    round(100.0 * p.d5 / nullif(p.cohort_users, 0), 2),
+    round(100.0 * p.d6 / nullif(p.cohort_users, 0), 2),
+    round(100.0 * p.d7 / nullif(p.cohort_users, 0), 2)
+  FROM pivot p
+  ORDER BY p.cohort_day;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.refresh_admin_analytics_rollups(boolean) TO service_role;
+REVOKE EXECUTE ON FUNCTION public.refresh_admin_analytics_rollups(boolean) FROM anon;
+REVOKE EXECUTE ON FUNCTION public.refresh_admin_analytics_rollups(boolean) FROM authenticated;
+
+GRANT EXECUTE ON FUNCTION public.get_admin_rollup_signup_timeseries() TO service_role;
+REVOKE EXECUTE ON FUNCTION public.get_admin_rollup_signup_timeseries() FROM anon;
+REVOKE EXECUTE ON FUNCTION public.get_admin_rollup_signup_timeseries() FROM authenticated;
+
+GRANT EXECUTE ON FUNCTION public.get_admin_rollup_question_timeseries() TO service_role;
+REVOKE EXECUTE ON FUNCTION public.get_admin_rollup_question_timeseries() FROM anon;
+REVOKE EXECUTE ON FUNCTION public.get_admin_rollup_question_timeseries() FROM authenticated;
+
+GRANT EXECUTE ON FUNCTION public.get_admin_rollup_active_users_rolling() TO service_role;
+REVOKE EXECUTE ON FUNCTION public.get_admin_rollup_active_users_rolling() FROM anon;
+REVOKE EXECUTE ON FUNCTION public.get_admin_rollup_active_users_rolling() FROM authenticated;
+
+GRANT EXECUTE ON FUNCTION public.get_admin_rollup_retention_day_series(date, date) TO service_role;
+REVOKE EXECUTE ON FUNCTION public.get_admin_rollup_retention_day_series(date, date) FROM anon;
+REVOKE EXECUTE ON FUNCTION public.get_admin_rollup_retention_day_series(date, date) FROM authenticated;
+
+-- 최초 1회 전체 집계
+SELECT * FROM public.refresh_admin_analytics_rollups(true);
@@ -17,6 +17,8 @@ from pydantic import BaseModel
 
 from middleware.auth import get_current_user, optional_auth_with_state
 from services.supabase_client import supabase_service
+from services.bulk_insert import BulkInserter
+from services.query_embeddings import get_query_embedding_service
 
 router = APIRouter()
 
@@ -241,28 +243,8 @@ def _embed_texts(texts: List[str]) -> List[List[float]]:
 
 
 def _embed_query(text: str) -> List[float]:
-    """검색 쿼리를 임베딩."""
-    import google.generativeai as genai
-
-    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        try:
-            from config.config import get_settings
-            api_key = get_settings().GEMINI_API_KEY
-        except Exception:
-            pass
-    if not api_key:
-        raise RuntimeError("GEMINI_API_KEY가 설정되지 않았습니다.")
-
-    genai.configure(api_key=api_key)
-
-    result = genai.embed_content(
-        model=EMBEDDING_MODEL,
-        content=text,
-        task_type="RETRIEVAL_QUERY",
-        output_dimensionality=768,
-    )
-    return result["embedding"]
+    """검색 쿼리를 임베딩 (768차원, 동일 쿼리는 LRU 메모 재사용)."""
+    return get_query_embedding_service().embed_academic(text)
 
 
 # ─── 청크 분할 ───────────────────────────────────────────────
@@ -819,41 +801,43 @@ def _store_academic_content(
     if not items:
         raise HTTPException(status_code=400, detail="청크 분할 결과가 없습니다.")
 
-    client = supabase_service.get_admin_client()
-    inserted = 0
+    # 배치 DB 저장은 백그라운드로 제출하고 다음 배치 임베딩과 겹쳐 진행
+    inserter = BulkInserter(supabase_service.get_admin_client())
     total_chars = 0
 
-    for batch_start in range(0, len(items), EMBED_STORE_BATCH_SIZE):
-        batch_items = items[batch_start : batch_start + EMBED_STORE_BATCH_SIZE]
-        texts_to_embed = [item.raw_content for item in batch_items]
+    try:
+        for batch_start in range(0, len(items), EMBED_STORE_BATCH_SIZE):
+            batch_items = items[batch_start : batch_start + EMBED_STORE_BATCH_SIZE]
+            texts_to_embed = [item.raw_content for item in batch_items]
 
-        try:
-            embeddings = _embed_texts(texts_to_embed)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"임베딩 실패: {e}")
-
-        rows = []
-        for item, emb in zip(batch_items, embeddings):
-            rows.append({
-                "source_title": item.source_title,
-                "chapter": item.chapter,
-                "part": item.part,
-                "sub_section": item.sub_section,
-                "chunk_index": item.chunk_index,
-                "raw_content": item.raw_content,
-                "metadata": {**item.metadata, "uploaded_by": user_id},
-                "embedding": emb,
-            })
-            total_chars += len(item.raw_content)
+            try:
+                embeddings = _embed_texts(texts_to_embed)
+            except Exception as e:
+                inserter.wait()
+                raise HTTPException(status_code=500, detail=f"임베딩 실패: {e}")
+
+            rows = []
+            for item, emb in zip(batch_items, embeddings):
+                rows.append({
+                    "source_title": item.source_title,
+                    "chapter": item.chapter,
+                    "part": item.part,
+                    "sub_section": item.sub_section,
+                    "chunk_index": item.chunk_index,
+                    "raw_content": item.raw_content,
+                    "metadata": {**item.metadata, "uploaded_by": user_id},
+                    "embedding": emb,
+                })
+                total_chars += len(item.raw_content)
+
+            inserter.submit_rows("academic_contents", rows)
 
         try:
-            client.table("academic_contents").insert(rows).execute()
-            inserted += len(rows)
+            inserted = inserter.wait(raise_errors=True)
         except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"DB 저장 실패 (batch {batch_start // EMBED_STORE_BATCH_SIZE}): {e}",
-            )
+            raise HTTPException(status_code=500, detail=f"DB 저장 실패: {e}")
+    finally:
+        inserter.close()
 
     return {
         "ok": True,
@@ -955,7 +939,6 @@ async def bulk_upload(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"임베딩 실패: {e}")
 
-    client = supabase_service.get_admin_client()
     rows = []
     for item, emb in zip(request.items, embeddings):
         rows.append({
@@ -970,17 +953,15 @@ async def bulk_upload(
         })
 
     batch_size = 50
-    inserted = 0
-    for i in range(0, len(rows), batch_size):
-        batch = rows[i : i + batch_size]
-        try:
-            client.table("academic_contents").insert(batch).execute()
-            inserted += len(batch)
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"DB 저장 실패 (batch {i // batch_size}): {e}",
-            )
+    inserter = BulkInserter(supabase_service.get_admin_client())
+    try:
+        for i in range(0, len(rows), batch_size):
+            inserter.submit_rows("academic_contents", rows[i : i + batch_size])
+        inserted = inserter.wait(raise_errors=True)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"DB 저장 실패: {e}")
+    finally:
+        inserter.close()
 
     return {
         "ok": True,
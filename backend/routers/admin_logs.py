@@ -11,6 +11,7 @@ import random
 import string
 from datetime import datetime
 
+from routers.chat import lookup_stream_function_results
 from services.supabase_client import supabase_service
 from utils.admin_filter import should_skip_logging
 
@@ -45,6 +46,7 @@ class CreateLogRequest(BaseModel):
     userQuestion: str
     routerOutput: Optional[Any] = None
     functionResult: Optional[Any] = None
+    functionResultsRef: Optional[Dict[str, str]] = None  # slim functionResult의 전체 결과 참조 (results_id, session_id)
     finalAnswer: Optional[str] = None
     elapsedTime: int = 0
     timing: Optional[TimingInfo] = None
@@ -268,6 +270,14 @@ async def create_log(request: CreateLogRequest):
         if not log_id:
             raise HTTPException(status_code=500, detail="ID 생성 실패")
 
+        # 스트리밍 응답은 slim 결과만 받으므로 서버에 보관된 전체 결과로 교체 (만료 시 slim 그대로)
+        function_result = request.functionResult
+        ref = request.functionResultsRef or {}
+        if ref.get('results_id') and ref.get('session_id'):
+            full_results = lookup_stream_function_results(ref['results_id'], request.userId, ref['session_id'])
+            if full_results is not None:
+                function_result = full_results
+
         # 데이터 준비 (필수 컬럼만)
         data = {
             'id': log_id,
@@ -275,7 +285,7 @@ async def create_log(request: CreateLogRequest):
             'conversation_history': request.conversationHistory,
             'user_question': request.userQuestion,
             'router_output': request.routerOutput,
-            'function_result': request.functionResult,
+            'function_result': function_result,
             'final_answer': request.finalAnswer,
             'elapsed_time': request.elapsedTime,
             'timing_router': request.timing.router if request.timing else 0,
@@ -1,26 +1,37 @@
 """
 관리자 통계 API
 - 누적 가입자 수 (Supabase Auth users 행 수)
+- 가입자/질문 시계열, 활성 사용자, 리텐션은 일별 롤업 테이블에서 조회
+  (services/admin_analytics_rollups.py 주기 작업이 갱신, migration 36)
+- 통계 응답과 제외 user_id 목록은 프로세스 내 TTL 캐시로 재사용
 """
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import List, Optional
 from middleware.auth import get_current_user
 from utils.admin_filter import is_admin_account
+from services.admin_analytics_rollups import get_admin_stats_cache, refresh_admin_analytics_rollups
 from services.supabase_client import supabase_service
 
 router = APIRouter()
 
 PATH_EXCEL_KEY = "path_excel"
 
-# 관리자 분석 제외 user_id 세트 (admin_logs 직접 조회 시 사용)
+
+def _load_excluded_user_ids():
+    client = supabase_service.get_admin_client()
+    result = client.rpc("get_admin_analytics_excluded_user_ids").execute()
+    data = result.data or []
+    return {r.get("user_id") for r in data if r.get("user_id") is not None}
+
+
+# 관리자 분석 제외 user_id 세트 (admin_logs 직접 조회 시 사용, 캐시 TTL 동안 재사용)
 def _get_excluded_user_ids():
     try:
-        client = supabase_service.get_admin_client()
-        result = client.rpc("get_admin_analytics_excluded_user_ids").execute()
-        data = result.data or []
-        return {r.get("user_id") for r in data if r.get("user_id") is not None}
+        return get_admin_stats_cache().get_or_load_sync("excluded_user_ids", _load_excluded_user_ids)
     except Exception:
         return set()
 
@@ -50,6 +61,26 @@ def _path_row_to_payload(row: dict) -> dict:
     }
 
 
+def _load_auth_user_count() -> dict:
+    client = supabase_service.get_admin_client()
+    result = client.rpc("get_auth_user_count").execute()
+    data = result.data
+    # RPC 스칼라 반환: 정수, [정수], 또는 [{"get_auth_user_count": n}]
+    if isinstance(data, list) and len(data) > 0:
+        first = data[0]
+        if isinstance(first, int):
+            total = first
+        elif isinstance(first, dict):
+            total = first.get("get_auth_user_count", 0)
+        else:
+            total = int(first) if first is not None else 0
+    elif isinstance(data, int):
+        total = data
+    else:
+        total = int(data) if data is not None else 0
+    return {"total_users": total}
+
+
 @router.get("/stats/users/count")
 async def get_auth_user_count(user: dict = Depends(get_current_user)):
     """
@@ -60,23 +91,7 @@ async def get_auth_user_count(user: dict = Depends(get_current_user)):
         raise HTTPException(status_code=403, detail="Admin only")
 
     try:
-        client = supabase_service.get_admin_client()
-        result = client.rpc("get_auth_user_count").execute()
-        data = result.data
-        # RPC 스칼라 반환: 정수, [정수], 또는 [{"get_auth_user_count": n}]
-        if isinstance(data, list) and len(data) > 0:
-            first = data[0]
-            if isinstance(first, int):
-                total = first
-            elif isinstance(first, dict):
-                total = first.get("get_auth_user_count", 0)
-            else:
-                total = int(first) if first is not None else 0
-        elif isinstance(data, int):
-            total = data
-        else:
-            total = int(data) if data is not None else 0
-        return {"total_users": total}
+        return await get_admin_stats_cache().get_or_load("users_count", _load_auth_user_count)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -84,96 +99,111 @@ async def get_auth_user_count(user: dict = Depends(get_current_user)):
         )
 
 
+def _load_auth_user_cumulative_timeseries() -> dict:
+    client = supabase_service.get_admin_client()
+    result = client.rpc("get_admin_rollup_signup_timeseries").execute()
+    data = result.data or []
+    # RPC 테이블 반환: [{"day": "2026-01-24", "new_users": 1, "cumulative_users": 1}, ...]
+    rows = []
+    for row in data:
+        if isinstance(row, dict):
+            day = row.get("day")
+            new_users = row.get("new_users", 0)
+            cumulative_users = row.get("cumulative_users", 0)
+        else:
+            continue
+        rows.append({
+            "day": day,
+            "new_users": int(new_users) if new_users is not None else 0,
+            "cumulative_users": int(cumulative_users) if cumulative_users is not None else 0,
+        })
+    return {"series": rows}
+
+
 @router.get("/stats/users/cumulative-timeseries")
 async def get_auth_user_cumulative_timeseries(user: dict = Depends(get_current_user)):
     """
-    Created at 기준 일별 신규 가입자 수 + 누적 가입자 수 시계열.
+    Created at 기준 일별 신규 가입자 수 + 누적 가입자 수 시계열 (일별 롤업).
     관리자만 호출 가능.
     """
     if not is_admin_account(email=user.get("email")):
         raise HTTPException(status_code=403, detail="Admin only")
 
     try:
-        client = supabase_service.get_admin_client()
-        result = client.rpc("get_auth_user_cumulative_timeseries").execute()
-        data = result.data or []
-        # RPC 테이블 반환: [{"day": "2026-01-24", "new_users": 1, "cumulative_users": 1}, ...]
-        rows = []
-        for row in data:
-            if isinstance(row, dict):
-                day = row.get("day")
-                new_users = row.get("new_users", 0)
-                cumulative_users = row.get("cumulative_users", 0)
-            else:
-                continue
-            rows.append({
-                "day": day,
-                "new_users": int(new_users) if new_users is not None else 0,
-                "cumulative_users": int(cumulative_users) if cumulative_users is not None else 0,
-            })
-        return {"series": rows}
+        return await get_admin_stats_cache().get_or_load(
+            "users_cumulative_timeseries", _load_auth_user_cumulative_timeseries
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to get cumulative timeseries: {str(e)}. Run migration 18_get_auth_user_cumulative_timeseries.sql if needed.",
+            detail=f"Failed to get cumulative timeseries: {str(e)}. Run migration 36_create_admin_analytics_rollups.sql if needed.",
         )
 
 
+def _load_active_users_rolling() -> dict:
+    client = supabase_service.get_admin_client()
+    result = client.rpc("get_admin_rollup_active_users_rolling").execute()
+    data = result.data or []
+    rows = []
+    for row in data:
+        if isinstance(row, dict):
+            days = row.get("days")
+            active = row.get("active_users", 0)
+            rows.append({
+                "days": int(days) if days is not None else 0,
+                "active_users": int(active) if active is not None else 0,
+            })
+    return {"series": rows}
+
+
 @router.get("/stats/active-users/rolling")
 async def get_active_users_rolling(user: dict = Depends(get_current_user)):
     """
-    오늘 기준 롤링 창(1일~14일) 활성 사용자 수. 활성 사용자=로그인 유저 중 해당 기간에 질문한 유저. 1일=오늘만, 2일=어제+오늘, …, 7일=1주, 14일=2주. 관리자만.
+    오늘 기준 롤링 창(1일~14일) 활성 사용자 수. 활성 사용자=로그인 유저 중 해당 기간에 질문한 유저. 1일=오늘만, 2일=어제+오늘, …, 7일=1주, 14일=2주. 일별 롤업 기준. 관리자만.
     """
     if not is_admin_account(email=user.get("email")):
         raise HTTPException(status_code=403, detail="Admin only")
     try:
-        client = supabase_service.get_admin_client()
-        result = client.rpc("get_admin_logs_active_users_rolling").execute()
-        data = result.data or []
-        rows = []
-        for row in data:
-            if isinstance(row, dict):
-                days = row.get("days")
-                active = row.get("active_users", 0)
-                rows.append({
-                    "days": int(days) if days is not None else 0,
-                    "active_users": int(active) if active is not None else 0,
-                })
-        return {"series": rows}
+        return await get_admin_stats_cache().get_or_load("active_users_rolling", _load_active_users_rolling)
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to get active users rolling: {str(e)}. Run migration 30_get_admin_logs_active_users_rolling.sql if needed.",
+            detail=f"Failed to get active users rolling: {str(e)}. Run migration 36_create_admin_analytics_rollups.sql if needed.",
         )
 
 
+def _load_g2u_pctr() -> dict:
+    client = supabase_service.get_admin_client()
+    result = client.rpc("get_admin_logs_g2u_pctr").execute()
+    data = result.data
+    if not data or not isinstance(data, list) or len(data) == 0:
+        return {
+            "g2u_converted_count": 0,
+            "g2u_guest_only_count": 0,
+            "g2u_rate": 0.0,
+            "pctr_avg": 0.0,
+            "pctr_groups_count": 0,
+        }
+    row = data[0] if isinstance(data[0], dict) else {}
+    return {
+        "g2u_converted_count": int(row.get("g2u_converted_count") or 0),
+        "g2u_guest_only_count": int(row.get("g2u_guest_only_count") or 0),
+        "g2u_rate": float(row.get("g2u_rate") or 0),
+        "pctr_avg": float(row.get("pctr_avg") or 0),
+        "pctr_groups_count": int(row.get("pctr_groups_count") or 0),
+    }
+
+
 @router.get("/stats/conversion/g2u-pctr")
 async def get_g2u_pctr(user: dict = Depends(get_current_user)):
     """
     G2U(게스트→유저 전환율) 및 PCTR(전환 전 평균 질문 수). 관리자만.
+    is_same_person 그룹 단위 지표라 일별 롤업 대신 응답 캐시만 사용.
     """
     if not is_admin_account(email=user.get("email")):
         raise HTTPException(status_code=403, detail="Admin only")
     try:
-        client = supabase_service.get_admin_client()
-        result = client.rpc("get_admin_logs_g2u_pctr").execute()
-        data = result.data
-        if not data or not isinstance(data, list) or len(data) == 0:
-            return {
-                "g2u_converted_count": 0,
-                "g2u_guest_only_count": 0,
-                "g2u_rate": 0.0,
-                "pctr_avg": 0.0,
-                "pctr_groups_count": 0,
-            }
-        row = data[0] if isinstance(data[0], dict) else {}
-        return {
-            "g2u_converted_count": int(row.get("g2u_converted_count") or 0),
-            "g2u_guest_only_count": int(row.get("g2u_guest_only_count") or 0),
-            "g2u_rate": float(row.get("g2u_rate") or 0),
-            "pctr_avg": float(row.get("pctr_avg") or 0),
-            "pctr_groups_count": int(row.get("pctr_groups_count") or 0),
-        }
+        return await get_admin_stats_cache().get_or_load("g2u_pctr", _load_g2u_pctr)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -181,40 +211,80 @@ async def get_g2u_pctr(user: dict = Depends(get_current_user)):
         )
 
 
+def _load_questions_cumulative_timeseries() -> dict:
+    client = supabase_service.get_admin_client()
+    result = client.rpc("get_admin_rollup_question_timeseries").execute()
+    data = result.data or []
+    rows = []
+    for row in data:
+        if isinstance(row, dict):
+            day = row.get("day")
+            new_questions = row.get("new_questions", 0)
+            cumulative_questions = row.get("cumulative_questions", 0)
+        else:
+            continue
+        rows.append({
+            "day": day,
+            "new_questions": int(new_questions) if new_questions is not None else 0,
+            "cumulative_questions": int(cumulative_questions) if cumulative_questions is not None else 0,
+        })
+    return {"series": rows}
+
+
 @router.get("/stats/questions/cumulative-timeseries")
 async def get_questions_cumulative_timeseries(user: dict = Depends(get_current_user)):
     """
-    admin_logs.created_at 기준 일별 질문 수 + 누적 질문 수 시계열.
+    admin_logs.created_at 기준 일별 질문 수 + 누적 질문 수 시계열 (일별 롤업).
     관리자만 호출 가능.
     """
     if not is_admin_account(email=user.get("email")):
         raise HTTPException(status_code=403, detail="Admin only")
 
     try:
-        client = supabase_service.get_admin_client()
-        result = client.rpc("get_admin_logs_question_cumulative_timeseries").execute()
-        data = result.data or []
-        rows = []
-        for row in data:
-            if isinstance(row, dict):
-                day = row.get("day")
-                new_questions = row.get("new_questions", 0)
-                cumulative_questions = row.get("cumulative_questions", 0)
-            else:
-                continue
-            rows.append({
-                "day": day,
-                "new_questions": int(new_questions) if new_questions is not None else 0,
-                "cumulative_questions": int(cumulative_questions) if cumulative_questions is not None else 0,
-            })
-        return {"series": rows}
+        return await get_admin_stats_cache().get_or_load(
+            "questions_cumulative_timeseries", _load_questions_cumulative_timeseries
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to get question timeseries: {str(e)}. Run migration 20_get_admin_logs_question_cumulative_timeseries.sql if needed.",
+            detail=f"Failed to get question timeseries: {str(e)}. Run migration 36_create_admin_analytics_rollups.sql if needed.",
         )
 
 
+def _load_retention_day_series(cohort_from: Optional[str], cohort_to: Optional[str]) -> dict:
+    client = supabase_service.get_admin_client()
+    payload = {}
+    if cohort_from is not None:
+        payload["cohort_day_from"] = cohort_from
+    if cohort_to is not None:
+        payload["cohort_day_to"] = cohort_to
+    result = client.rpc("get_admin_rollup_retention_day_series", payload).execute()
+    data = result.data or []
+    rows = []
+    for row in data:
+        if not isinstance(row, dict):
+            continue
+        rows.append({
+            "cohort_day": row.get("cohort_day"),
+            "cohort_users": int(row.get("cohort_users") or 0),
+            "day_1_users": int(row.get("day_1_users") or 0),
+            "day_2_users": int(row.get("day_2_users") or 0),
+            "day_3_users": int(row.get("day_3_users") or 0),
+            "day_4_users": int(row.get("day_4_users") or 0),
+            "day_5_users": int(row.get("day_5_users") or 0),
+            "day_6_users": int(row.get("day_6_users") or 0),
+            "day_7_users": int(row.get("day_7_users") or 0),
+            "day_1_rate": float(row.get("day_1_rate") or 0),
+            "day_2_rate": float(row.get("day_2_rate") or 0),
+            "day_3_rate": float(row.get("day_3_rate") or 0),
+            "day_4_rate": float(row.get("day_4_rate") or 0),
+            "day_5_rate": float(row.get("day_5_rate") or 0),
+            "day_6_rate": float(row.get("day_6_rate") or 0),
+            "day_7_rate": float(row.get("day_7_rate") or 0),
+        })
+    return {"series": rows}
+
+
 @router.get("/stats/retention/day-series")
 async def get_retention_day_series(
     from_date: Optional[str] = None,
@@ -222,7 +292,7 @@ async def get_retention_day_series(
     user: dict = Depends(get_current_user),
 ):
     """
-    admin_logs 기준 태생일(최초 방문일) 코호트별 Day-1~7 리텐션 시계열.
+    admin_logs 기준 태생일(최초 방문일) 코호트별 Day-1~7 리텐션 시계열 (일별 롤업).
     쿼리: from_date, to_date (YYYY-MM-DD, 선택). 관리자만.
     """
     if not is_admin_account(email=user.get("email")):
@@ -244,42 +314,46 @@ async def get_retention_day_series(
             raise HTTPException(status_code=400, detail="to_date must be YYYY-MM-DD")
 
     try:
-        client = supabase_service.get_admin_client()
-        payload = {}
-        if cohort_from is not None:
-            payload["cohort_day_from"] = cohort_from
-        if cohort_to is not None:
-            payload["cohort_day_to"] = cohort_to
-        result = client.rpc("get_admin_logs_retention_day_series", payload).execute()
-        data = result.data or []
-        rows = []
-        for row in data:
-            if not isinstance(row, dict):
-                continue
-            rows.append({
-                "cohort_day": row.get("cohort_day"),
-                "cohort_users": int(row.get("cohort_users") or 0),
-                "day_1_users": int(row.get("day_1_users") or 0),
-                "day_2_users": int(row.get("day_2_users") or 0),
-                "day_3_users": int(row.get("day_3_users") or 0),
-                "day_4_users": int(row.get("day_4_users") or 0),
-                "day_5_users": int(row.get("day_5_users") or 0),
-                "day_6_users": int(row.get("day_6_users") or 0),
-                "day_7_users": int(row.get("day_7_users") or 0),
-                "day_1_rate": float(row.get("day_1_rate") or 0),
-                "day_2_rate": float(row.get("day_2_rate") or 0),
-                "day_3_rate": float(row.get("day_3_rate") or 0),
-                "day_4_rate": float(row.get("day_4_rate") or 0),
-                "day_5_rate": float(row.get("day_5_rate") or 0),
-                "day_6_rate": float(row.get("day_6_rate") or 0),
-                "day_7_rate": float(row.get("day_7_rate") or 0),
-            })
-        return {"series": rows}
+        return await get_admin_stats_cache().get_or_load(
+            f"retention_day_series:{cohort_from}:{cohort_to}",
+            lambda: _load_retention_day_series(cohort_from, cohort_to),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get retention day series: {str(e)}. Run migration 36_create_admin_analytics_rollups.sql if needed.",
+        )
+
+
+_ROLLUP_REFRESH_BUSY_RETRIES = 5
+_ROLLUP_REFRESH_BUSY_DELAY_SECONDS = 2.0
+
+
+@router.post("/stats/rollups/refresh")
+async def post_refresh_rollups(full: bool = False, user: dict = Depends(get_current_user)):
+    """
+    일별 롤업 즉시 갱신 (주기 작업을 기다리지 않음). 제외 이메일 목록을 바꾼 뒤에는 full=true.
+    관리자만.
+    """
+    if not is_admin_account(email=user.get("email")):
+        raise HTTPException(status_code=403, detail="Admin only")
+    try:
+        # refreshed=false는 다른 워커의 주기 갱신이 lock을 잡고 있는 경우 → 끝날 때까지 잠시 재시도
+        for attempt in range(_ROLLUP_REFRESH_BUSY_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(_ROLLUP_REFRESH_BUSY_DELAY_SECONDS)
+            outcome = await asyncio.to_thread(refresh_admin_analytics_rollups, full)
+            if outcome["refreshed"]:
+                return outcome
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to get retention day series: {str(e)}. Run migration 27_get_admin_logs_retention_day_series.sql if needed.",
+            detail=f"Failed to refresh rollups: {str(e)}. Run migration 36_create_admin_analytics_rollups.sql if needed.",
         )
+    raise HTTPException(
+        status_code=409,
+        detail="Another rollup refresh is in progress. Retry shortly.",
+    )
 
 
 @router.get("/stats/retention/cohort-users")
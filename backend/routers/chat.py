@@ -20,19 +20,21 @@ from services.multi_agent import (
     AVAILABLE_AGENTS
 )
 from services.multi_agent.router_agent import route_query
+from services.user_context_prefetch import UserContextPrefetch, start_user_context_prefetch
 from services.score_review import (
     run_router_and_profile_parallel,
     resolve_score_id_from_message,
     extract_naesin_candidate,
     build_school_grade_input_from_card,
 )
-from utils.school_record_context import build_school_record_context_text
-from school_record_eval.report_context import build_school_record_report_context_text
+from services.school_record_context_cache import get_school_record_context_cache
 from school_record_eval.report_agent import (
     generate_school_record_report,
 )
 from routers.school_record_deep_chat import generate_deep_school_record_stream
 from utils.timing_logger import TimingLogger
+from utils.sse import SSEEncoder, encode_sse_frame
+from utils.document_cache import DocumentCache
 from utils.admin_filter import should_skip_logging
 from middleware.auth import optional_auth, optional_auth_with_state
 from middleware.rate_limit import check_and_increment_usage, get_client_ip
@@ -43,6 +45,15 @@ router = APIRouter()
 
 AUTH_EXPIRED_DETAIL = "세션이 만료되었거나 유효하지 않습니다. 다시 로그인해 주세요."
 
+# 고정 문구 상태 이벤트는 한 번만 인코딩해서 재사용
+_STATIC_FRAMES = {
+    "image_analysis": encode_sse_frame({'type': 'status', 'step': 'image_analysis', 'message': '이미지를 분석하는 중...'}),
+    "agent_start": encode_sse_frame({'type': 'status', 'step': 'agent_start', 'message': '답변을 생성하는 중...'}),
+    "router": encode_sse_frame({'type': 'status', 'step': 'router', 'message': '🔄 [1/3] Router Agent 호출 중...'}),
+    "function_start": encode_sse_frame({'type': 'status', 'step': 'function', 'message': '🔄 [2/3] Functions 실행 중...'}),
+    "function_none": encode_sse_frame({'type': 'status', 'step': 'function', 'message': 'ℹ️ 함수 호출 없음'}),
+}
+
 
 def _record_question_sent(session_id: str, user_id: Optional[str]) -> None:
     """실제 채팅 전송 시 events에 question_sent 기록 (깔때기 메시지 전송 수 집계용)"""
@@ -104,6 +115,72 @@ def _save_messages_to_session_chat(
         "user_id": user_id,
     }).execute()
 
+# done 이벤트에서 생략한 전체 function_results 보관 (GET /v2/results/{results_id}로 조회)
+_stream_results_cache = DocumentCache(max_size=256, ttl_seconds=1800)
+
+# done 이벤트 slim 모드에서 청크마다 남기는 참조 필드
+_SLIM_CHUNK_KEYS = ("chunk_id", "document_id", "page_number", "score")
+_SLIM_DROP_KEYS = {"document_summaries"}
+
+
+def _slim_function_results(function_results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    function_results에서 청크 본문/문서 요약을 제거하고 참조(ID)만 남김
+    - chunks는 배열 형태를 유지 (프론트의 검색 청크 개수 집계 호환)
+    """
+    slim: Dict[str, Any] = {}
+    for key, value in (function_results or {}).items():
+        if not isinstance(value, dict):
+            slim[key] = value
+            continue
+        item: Dict[str, Any] = {}
+        for field, field_value in value.items():
+            if field in _SLIM_DROP_KEYS:
+                continue
+            if field == "chunks" and isinstance(field_value, list):
+                item[field] = [
+                    {k: c.get(k) for k in _SLIM_CHUNK_KEYS if c.get(k) is not None}
+                    for c in field_value
+                    if isinstance(c, dict)
+                ]
+                continue
+            item[field] = field_value
+        slim[key] = item
+    return slim
+
+
+def _pack_done_function_results(
+    function_results: Dict[str, Any],
+    owner: str,
+    include_full: bool = False,
+) -> tuple[Dict[str, Any], Optional[str]]:
+    """
+    done 이벤트용 function_results 구성.
+    기본은 slim 결과 + results_id (전체 결과는 서버 캐시에 보관), include_full이면 전체 그대로.
+    """
+    if include_full or not function_results:
+        return function_results or {}, None
+    results_id = uuid.uuid4().hex
+    _stream_results_cache.set(
+        "stream_results",
+        {"owner": owner, "function_results": function_results},
+        results_id=results_id,
+    )
+    return _slim_function_results(function_results), results_id
+
+
+def lookup_stream_function_results(
+    results_id: str,
+    user_id: Optional[str],
+    session_id: str,
+) -> Optional[Dict[str, Any]]:
+    """done 이벤트에서 생략한 전체 function_results 조회 (같은 사용자/세션만, 만료 시 None)"""
+    entry = _stream_results_cache.get("stream_results", results_id=results_id)
+    if not entry or entry.get("owner") != get_cache_key(user_id, session_id):
+        return None
+    return entry.get("function_results", {})
+
+
 # 실시간 로그를 위한 큐
 log_queues: Dict[str, asyncio.Queue] = {}
 
@@ -164,6 +241,7 @@ class ChatRequest(BaseModel):
     skip_score_review: Optional[bool] = False  # True면 연동된 성적로 바로 답변(성적 확인 카드 생략)
     use_school_record: Optional[bool] = False  # 생기부 컨텍스트 사용 여부
     use_linked_naesin: Optional[bool] = False  # '@내신 성적' 명시 선택 시 연동 내신 카드 강제
+    include_function_results: Optional[bool] = False  # True면 done 이벤트에 전체 function_results 포함
 
 
 class ChatResponse(BaseModel):
@@ -199,12 +277,14 @@ class ContinueAfterNaesinRequest(BaseModel):
     score_id: Optional[str] = None
     # 카드에서 수정한 성적 반영 (있으면 프로필 업데이트 후 답변 생성)
     grade_summary: Optional[Dict[str, Any]] = None  # overall_average, core_average, semester_averages
+    include_function_results: Optional[bool] = False
 
 
 class ContinueAfterScoreConfirmRequest(BaseModel):
     """모의고사 성적 카드 확인 후 답변 생성 요청 (사용량 차감 없음)"""
     session_id: str
     score_id: str
+    include_function_results: Optional[bool] = False
 
 
 class ScoreSetCreateRequest(BaseModel):
@@ -233,6 +313,7 @@ async def _prepare_score_review_gate(
     user_id: Optional[str],
     session_id: str,
     score_id_override: Optional[str] = None,
+    prefetch: Optional[UserContextPrefetch] = None,
 ) -> Dict[str, Any]:
     """Run router/profile in parallel and decide review gate."""
     if score_id_override:
@@ -242,11 +323,15 @@ async def _prepare_score_review_gate(
     if score_id_from_token:
         return {"mode": "pass", "score_id": score_id_from_token}
 
-    skip_session = await supabase_service.get_session_skip_score_review(session_id, user_id)
     score_owner = user_id or f"guest:{session_id}"
-    existing = await supabase_service.list_user_score_sets(score_owner, limit=20)
+    if prefetch is not None:
+        skip_session = bool(await prefetch.get("skip_score_review", False))
+        existing = await prefetch.get("score_sets", []) or []
+    else:
+        skip_session = await supabase_service.get_session_skip_score_review(session_id, user_id)
+        existing = await supabase_service.list_user_score_sets(score_owner, limit=20)
 
-    router_coro = route_query(message, history, user_id=user_id)
+    router_coro = route_query(message, history, user_id=user_id, prefetch=prefetch)
     router_output, candidate = await run_router_and_profile_parallel(
         router_coro=router_coro,
         message=message,
@@ -394,10 +479,10 @@ async def chat(
                     metadata={"agent_mode": "school_record_dedicated_agent", "reason": "auth_required"},
                 )
             try:
-                school_loaded = await supabase_service.get_user_profile_school_record(user_id)
-                school_profile = dict(school_loaded or {})
-                school_record_context = build_school_record_context_text(school_profile)
-                school_record_report_context = build_school_record_report_context_text(school_profile)
+                record_context = await get_school_record_context_cache().get(user_id)
+                school_profile = dict(record_context.school_record) if record_context else {}
+                school_record_context = record_context.context_text if record_context else None
+                school_record_report_context = record_context.report_context_text if record_context else None
                 if school_record_context:
                     log_and_emit(f"   📎 생기부 컨텍스트 적용: {len(school_record_context)}자")
                 else:
@@ -756,6 +841,7 @@ async def chat_stream_v2_with_image(
     session_id: str = Form(default="default"),
     score_id: Optional[str] = Form(default=None),
     use_school_record: bool = Form(default=False),
+    include_function_results: bool = Form(default=False),
     image: UploadFile = File(...),
     http_request: Request = None,
     authorization: Optional[str] = Header(None)
@@ -803,15 +889,22 @@ async def chat_stream_v2_with_image(
     
     print(f"📊 API 사용량: {current_count}/{limit}회 (user_id={user_id}, ip={client_ip}, require_login={require_login})")
 
+    # 사용자 범위 DB 조회를 요청 진입 시점에 동시 시작 (이미지 분석/Router 지연과 겹침)
+    prefetch = start_user_context_prefetch(
+        user_id, session_id, include_school_record=bool(use_school_record)
+    )
+
     # (Optional) 생기부 컨텍스트 로드 (이미지 분석 전에 1회만)
+    record_context = None
     school_record_context = None
     school_record_report_context = None
     if use_school_record and user_id:
         try:
-            school_loaded = await supabase_service.get_user_profile_school_record(user_id)
-            school_profile = dict(school_loaded or {})
-            school_record_context = build_school_record_context_text(school_profile) or None
-            school_record_report_context = build_school_record_report_context_text(school_profile) or None
+            record_context = await prefetch.get("school_record")
+            if record_context is not None:
+                school_profile = dict(record_context.school_record)
+                school_record_context = record_context.context_text or None
+                school_record_report_context = record_context.report_context_text or None
         except Exception as e:
             print(f"⚠️ 생기부 컨텍스트 로드 실패(무시): {e}")
             school_record_context = None
@@ -834,6 +927,7 @@ async def chat_stream_v2_with_image(
     
     def generate():
         nonlocal require_login  # 클로저에서 사용
+        sse = SSEEncoder()
         pipeline_start = time.time()
         print(f"\n🔵 [STREAM_V2_IMAGE_START] {session_id}:{message[:30]}")
         print(f"🖼️ 이미지: {image.filename}, {image.content_type}, {len(image_data)} bytes")
@@ -857,14 +951,14 @@ async def chat_stream_v2_with_image(
         
         try:
             if use_school_record and not user_id:
-                yield f"data: {json.dumps({'type': 'error', 'message': '생기부 분석 기능은 로그인 후 사용할 수 있습니다.'}, ensure_ascii=False)}\n\n"
+                yield sse.event({'type': 'error', 'message': '생기부 분석 기능은 로그인 후 사용할 수 있습니다.'})
                 return
             if use_school_record and not school_record_report_context:
-                yield f"data: {json.dumps({'type': 'error', 'message': '연동된 생기부 데이터가 없습니다. 먼저 생활기록부를 연동해 주세요.'}, ensure_ascii=False)}\n\n"
+                yield sse.event({'type': 'error', 'message': '연동된 생기부 데이터가 없습니다. 먼저 생활기록부를 연동해 주세요.'})
                 return
 
             # 1단계: 이미지 분석 시작 상태 전송
-            yield f"data: {json.dumps({'type': 'status', 'step': 'image_analysis', 'message': '이미지를 분석하는 중...'}, ensure_ascii=False)}\n\n"
+            yield sse.frame(_STATIC_FRAMES["image_analysis"])
             
             # 2단계: Gemini로 이미지 분석 (설명/OCR만 수행, 답변 생성 X)
             image_prompt = """이 이미지를 자세히 분석해주세요. 다음 내용을 포함해주세요:
@@ -905,7 +999,7 @@ async def chat_stream_v2_with_image(
 
 위 이미지 분석 결과를 참고하여 사용자의 질문에 답변해주세요."""
 
-            yield f"data: {json.dumps({'type': 'status', 'step': 'agent_start', 'message': '답변을 생성하는 중...'}, ensure_ascii=False)}\n\n"
+            yield sse.frame(_STATIC_FRAMES["agent_start"])
 
             # 내신/수시 짧은 입력 감지 (score review 보다 먼저)
             naesin = extract_naesin_candidate(enhanced_message)
@@ -926,7 +1020,7 @@ async def chat_stream_v2_with_image(
                     "core_average": naesin.core_average,
                     "semester_averages": naesin.school_grade_input.get("gradeSummary", {}).get("semesterAverages", {}),
                 }
-                yield f"data: {json.dumps(naesin_event, ensure_ascii=False)}\n\n"
+                yield sse.event(naesin_event)
                 # 확인 버튼을 눌러야 답변 생성 시작 → 여기서 스트림 종료, 히스토리에만 사용자 메시지 저장
                 history.append({"role": "user", "content": enhanced_message})
                 conversation_sessions[cache_key] = history[-20:]
@@ -945,6 +1039,7 @@ async def chat_stream_v2_with_image(
                                 user_id=user_id,
                                 session_id=session_id,
                                 score_id_override=active_score_id,
+                                prefetch=prefetch,
                             )
                         )
                     finally:
@@ -965,7 +1060,7 @@ async def chat_stream_v2_with_image(
                             },
                             "actions": ["edit", "approve", "skip_session"],
                         }
-                        yield f"data: {json.dumps(review_event, ensure_ascii=False)}\n\n"
+                        yield sse.event(review_event)
                         history.append({"role": "user", "content": enhanced_message})
                         conversation_sessions[cache_key] = history[-20:]
                         return
@@ -979,6 +1074,7 @@ async def chat_stream_v2_with_image(
                     history=history,
                     school_record=dict(school_profile or {}),
                     school_record_context=school_record_report_context,
+                    record_context=record_context,
                 )
                 if use_school_record
                 else run_orchestration_agent_stream(
@@ -986,27 +1082,34 @@ async def chat_stream_v2_with_image(
                     history,
                     user_id=user_id,
                     score_id=active_score_id,
+                    prefetch=prefetch,
                 )
             )
-            for event in event_iter:
+            for event in sse.paced(event_iter):
                 event_type = event.get("type")
                 
                 if event_type == "status":
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    yield sse.event(event)
                 
                 elif event_type == "sources":
                     sources = event.get("sources", [])
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    yield sse.event(event)
                 
                 elif event_type == "report":
                     structured_report = event.get("report")
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    yield sse.event(event)
                 
                 elif event_type == "chunk":
                     full_response += event.get("text", "")
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    chunk_frame = sse.chunk(event.get("text", ""))
+                    if chunk_frame:
+                        yield chunk_frame
                 
                 elif event_type == "done":
+                    # 남은 응답 텍스트는 후처리(메시지 저장 등) 전에 바로 전송
+                    tail_frame = sse.flush()
+                    if tail_frame:
+                        yield tail_frame
                     timing = event.get("timing", {})
                     function_results = event.get("function_results", {})
                     router_output = event.get("router_output", {})
@@ -1016,7 +1119,7 @@ async def chat_stream_v2_with_image(
                     used_chunks = event.get("used_chunks", [])
                 
                 elif event_type == "error":
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    yield sse.event(event)
                     return
             
             # 대화 이력에 추가 (이미지 포함 메시지로 표시)
@@ -1044,6 +1147,11 @@ async def chat_stream_v2_with_image(
                 print(f"❌ 메시지 저장 실패: {e}")
             
             # 완료 이벤트 전송 (멀티에이전트 파이프라인 결과 포함)
+            done_results, results_id = _pack_done_function_results(
+                function_results,
+                owner=get_cache_key(user_id, session_id),
+                include_full=include_function_results,
+            )
             done_event = {
                 "type": "done",
                 "response": full_response,
@@ -1051,7 +1159,8 @@ async def chat_stream_v2_with_image(
                 "timing": timing,
                 "pipeline_time": round(pipeline_time * 1000),
                 "router_output": router_output,
-                "function_results": function_results,
+                "function_results": done_results,
+                "results_id": results_id,
                 "sources": sources,
                 "source_urls": source_urls,
                 "used_chunks": used_chunks,
@@ -1059,7 +1168,7 @@ async def chat_stream_v2_with_image(
                 "require_login": require_login,  # 비로그인 3회째 질문 시 True
                 "score_id": active_score_id,
             }
-            yield f"data: {json.dumps(done_event, ensure_ascii=False)}\n\n"
+            yield sse.event(done_event)
             
             print(f"🟢 [STREAM_V2_IMAGE_END] 총 {pipeline_time:.2f}초, {len(full_response)}자")
             
@@ -1067,7 +1176,7 @@ async def chat_stream_v2_with_image(
             print(f"❌ 이미지 채팅 오류: {e}")
             import traceback
             traceback.print_exc()
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)}, ensure_ascii=False)}\n\n"
+            yield sse.event({'type': 'error', 'message': str(e)})
     
     return StreamingResponse(
         generate(),
@@ -1134,15 +1243,22 @@ async def chat_stream_v2(
     thinking_mode = request.thinking
     use_school_record = request.use_school_record is True
 
+    # 사용자 범위 DB 조회를 요청 진입 시점에 동시 시작 (Router LLM 지연과 겹침)
+    prefetch = start_user_context_prefetch(
+        user_id, request.session_id, include_school_record=use_school_record
+    )
+
     # (Optional) 생기부 컨텍스트 로드 (스트리밍 시작 전에 1회만)
+    record_context = None
     school_record_context = None
     school_record_report_context = None
     if use_school_record and user_id:
         try:
-            school_loaded = await supabase_service.get_user_profile_school_record(user_id)
-            school_profile = dict(school_loaded or {})
-            school_record_context = build_school_record_context_text(school_profile) or None
-            school_record_report_context = build_school_record_report_context_text(school_profile) or None
+            record_context = await prefetch.get("school_record")
+            if record_context is not None:
+                school_profile = dict(record_context.school_record)
+                school_record_context = record_context.context_text or None
+                school_record_report_context = record_context.report_context_text or None
         except Exception as e:
             print(f"⚠️ 생기부 컨텍스트 로드 실패(무시): {e}")
             school_record_context = None
@@ -1150,6 +1266,7 @@ async def chat_stream_v2(
     
     def generate():
         nonlocal require_login  # 클로저에서 사용
+        sse = SSEEncoder()
         session_id = request.session_id
         message = request.message
         
@@ -1188,17 +1305,9 @@ async def chat_stream_v2(
             _is_linked_naesin_query = bool(getattr(request, "use_linked_naesin", False))
             if _is_linked_naesin_query:
                 if not user_id:
-                    yield f"data: {json.dumps({'type': 'error', 'message': '내신 연동 기반 추천은 로그인 후 사용할 수 있습니다.'}, ensure_ascii=False)}\n\n"
+                    yield sse.event({'type': 'error', 'message': '내신 연동 기반 추천은 로그인 후 사용할 수 있습니다.'})
                     return
-                _nloop_naesin = asyncio.new_event_loop()
-                asyncio.set_event_loop(_nloop_naesin)
-                try:
-                    meta = _nloop_naesin.run_until_complete(supabase_service.get_user_profile_metadata(user_id))
-                except Exception as _e:
-                    meta = {}
-                    print(f"⚠️ get_user_profile_metadata(연동 내신): {_e}")
-                finally:
-                    _nloop_naesin.close()
+                meta = prefetch.get_sync("profile_metadata", {})
                 sgi = (meta or {}).get("school_grade_input") or {}
                 gs = sgi.get("gradeSummary") or {}
                 has_gs = gs.get("overallAverage") is not None or gs.get("coreAverage") is not None or (gs.get("semesterAverages") and len(gs.get("semesterAverages", {})) > 0)
@@ -1213,7 +1322,7 @@ async def chat_stream_v2(
                         co = 2.5
                     sem_avgs = gs.get("semesterAverages") or {}
                 else:
-                    yield f"data: {json.dumps({'type': 'error', 'message': '연동된 내신 성적이 없습니다. 내신 성적과 모의고사 성적을 먼저 연동해 주세요.'}, ensure_ascii=False)}\n\n"
+                    yield sse.event({'type': 'error', 'message': '연동된 내신 성적이 없습니다. 내신 성적과 모의고사 성적을 먼저 연동해 주세요.'})
                     return
                 naesin_event = {
                     "type": "school_grade_saved",
@@ -1223,7 +1332,7 @@ async def chat_stream_v2(
                 }
                 if not getattr(request, "skip_score_review", False):
                     # 기존 동작: 카드 표시 후 확인/수정 단계 진행
-                    yield f"data: {json.dumps(naesin_event, ensure_ascii=False)}\n\n"
+                    yield sse.event(naesin_event)
                     history.append({"role": "user", "content": message})
                     conversation_sessions[cache_key] = history[-20:]
                     return
@@ -1248,34 +1357,41 @@ async def chat_stream_v2(
 
             if use_school_record:
                 if not user_id:
-                    yield f"data: {json.dumps({'type': 'error', 'message': '생기부 분석 기능은 로그인 후 사용할 수 있습니다.'}, ensure_ascii=False)}\n\n"
+                    yield sse.event({'type': 'error', 'message': '생기부 분석 기능은 로그인 후 사용할 수 있습니다.'})
                     return
                 if not school_record_report_context:
-                    yield f"data: {json.dumps({'type': 'error', 'message': '연동된 생기부 데이터가 없습니다. 먼저 생활기록부를 연동해 주세요.'}, ensure_ascii=False)}\n\n"
+                    yield sse.event({'type': 'error', 'message': '연동된 생기부 데이터가 없습니다. 먼저 생활기록부를 연동해 주세요.'})
                     return
 
-                for event in generate_deep_school_record_stream(
+                for event in sse.paced(generate_deep_school_record_stream(
                     message=message,
                     history=history,
                     school_record=dict(school_profile or {}),
                     school_record_context=school_record_report_context,
-                ):
+                    record_context=record_context,
+                )):
                     event_type = event.get("type")
 
                     if event_type == "status":
-                        yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                        yield sse.event(event)
                     elif event_type == "sources":
                         sources = event.get("sources", [])
-                        yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
-                    elif event_type in {"answer_plan", "section_outline", "section"}:
-                        yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                        yield sse.event(event)
+                    elif event_type in {"answer_plan", "section_outline", "section", "report_patch"}:
+                        yield sse.event(event)
                     elif event_type == "report":
                         structured_report = event.get("report")
-                        yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                        yield sse.event(event)
                     elif event_type == "chunk":
                         full_response += event.get("text", "")
-                        yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                        chunk_frame = sse.chunk(event.get("text", ""))
+                        if chunk_frame:
+                            yield chunk_frame
                     elif event_type == "done":
+                        # 남은 응답 텍스트는 후처리(메시지 저장 등) 전에 바로 전송
+                        tail_frame = sse.flush()
+                        if tail_frame:
+                            yield tail_frame
                         timing = event.get("timing", {})
                         function_results = event.get("function_results", {})
                         router_output = event.get("router_output", {})
@@ -1284,7 +1400,7 @@ async def chat_stream_v2(
                         source_urls = event.get("source_urls", [])
                         used_chunks = event.get("used_chunks", [])
                     elif event_type == "error":
-                        yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                        yield sse.event(event)
                         return
 
             else:
@@ -1321,7 +1437,7 @@ async def chat_stream_v2(
                             "core_average": naesin.core_average,
                             "semester_averages": naesin.school_grade_input.get("gradeSummary", {}).get("semesterAverages", {}),
                         }
-                        yield f"data: {json.dumps(naesin_event, ensure_ascii=False)}\n\n"
+                        yield sse.event(naesin_event)
                         history.append({"role": "user", "content": message})
                         conversation_sessions[cache_key] = history[-20:]
                         return
@@ -1354,7 +1470,7 @@ async def chat_stream_v2(
                             },
                             "actions": ["edit", "approve", "skip_session"],
                         }
-                        yield f"data: {json.dumps(review_event, ensure_ascii=False)}\n\n"
+                        yield sse.event(review_event)
                         history.append({"role": "user", "content": message})
                         conversation_sessions[cache_key] = history[-20:]
                         return
@@ -1372,6 +1488,7 @@ async def chat_stream_v2(
                                 user_id=user_id,
                                 session_id=session_id,
                                 score_id_override=active_score_id,
+                                prefetch=prefetch,
                             )
                         )
                     finally:
@@ -1392,7 +1509,7 @@ async def chat_stream_v2(
                             },
                             "actions": ["edit", "approve", "skip_session"],
                         }
-                        yield f"data: {json.dumps(review_event, ensure_ascii=False)}\n\n"
+                        yield sse.event(review_event)
                         history.append({"role": "user", "content": message})
                         conversation_sessions[cache_key] = history[-20:]
                         return
@@ -1411,7 +1528,7 @@ async def chat_stream_v2(
                 from services.multi_agent.functions import execute_function_calls
                 
                 # 1. Router로 1차 검색
-                yield f"data: {json.dumps({'type': 'status', 'step': 'router', 'message': '🔄 [1/3] Router Agent 호출 중...'}, ensure_ascii=False)}\n\n"
+                yield sse.frame(_STATIC_FRAMES["router"])
                 
                 router = RouterAgent()
                 loop = asyncio.new_event_loop()
@@ -1446,11 +1563,11 @@ async def chat_stream_v2(
                                 "query": "성적 분석"
                             })
                     
-                    yield f"data: {json.dumps({'type': 'status', 'step': 'router_complete', 'message': f'✅ Router 완료: {len(function_calls)}개 함수 호출', 'detail': {'function_calls': queries_detail, 'count': len(function_calls)}}, ensure_ascii=False)}\n\n"
+                    yield sse.event({'type': 'status', 'step': 'router_complete', 'message': f'✅ Router 완료: {len(function_calls)}개 함수 호출', 'detail': {'function_calls': queries_detail, 'count': len(function_calls)}})
                     
                     # 2. RAG 검색 실행
                     if function_calls:
-                        yield f"data: {json.dumps({'type': 'status', 'step': 'function', 'message': '🔄 [2/3] Functions 실행 중...'}, ensure_ascii=False)}\n\n"
+                        yield sse.frame(_STATIC_FRAMES["function_start"])
                         
                         # 검색 시작 상세 정보 전송
                         for idx, call in enumerate(function_calls):
@@ -1459,10 +1576,10 @@ async def chat_stream_v2(
                             if func_name == "univ":
                                 univ_name = params.get('university', '')
                                 univ_query = params.get('query', '')
-                                yield f"data: {json.dumps({'type': 'status', 'step': 'search_start', 'message': f'🔍 검색 중: {univ_name}', 'detail': {'index': idx, 'university': univ_name, 'query': univ_query}}, ensure_ascii=False)}\n\n"
+                                yield sse.event({'type': 'status', 'step': 'search_start', 'message': f'🔍 검색 중: {univ_name}', 'detail': {'index': idx, 'university': univ_name, 'query': univ_query}})
                             elif func_name == "consult":
                                 target_univ = params.get('target_univ', [])
-                                yield f"data: {json.dumps({'type': 'status', 'step': 'search_start', 'message': '📊 성적 분석 중...', 'detail': {'index': idx, 'type': 'consult', 'target_univ': target_univ}}, ensure_ascii=False)}\n\n"
+                                yield sse.event({'type': 'status', 'step': 'search_start', 'message': '📊 성적 분석 중...', 'detail': {'index': idx, 'type': 'consult', 'target_univ': target_univ}})
                         
                         initial_results = loop.run_until_complete(
                             execute_function_calls(function_calls, user_id=user_id)
@@ -1485,10 +1602,10 @@ async def chat_stream_v2(
                                 })
                         
                         total_count = sum(r.get("doc_count", 0) for r in search_results_detail)
-                        yield f"data: {json.dumps({'type': 'status', 'step': 'search_complete', 'message': f'✅ Functions 완료: {len(initial_results)}개 결과', 'detail': {'results': search_results_detail, 'total_count': total_count}}, ensure_ascii=False)}\n\n"
+                        yield sse.event({'type': 'status', 'step': 'search_complete', 'message': f'✅ Functions 완료: {len(initial_results)}개 결과', 'detail': {'results': search_results_detail, 'total_count': total_count}})
                     else:
                         initial_results = {}
-                        yield f"data: {json.dumps({'type': 'status', 'step': 'function', 'message': 'ℹ️ 함수 호출 없음'}, ensure_ascii=False)}\n\n"
+                        yield sse.frame(_STATIC_FRAMES["function_none"])
                     
                     # 3. MainAgentThinking으로 분석 및 재질문
                     # (답변 작성하기 로그는 실제 답변 생성 시 main_agent_thinking.py에서 전송)
@@ -1505,13 +1622,13 @@ async def chat_stream_v2(
                                 'iteration': chunk.get('iteration'),
                                 'detail': chunk.get('detail')
                             }
-                            yield f"data: {json.dumps(log_data, ensure_ascii=False)}\n\n"
+                            yield sse.event(log_data)
                         
                         elif chunk_type == "text":
                             # 최종 답변 텍스트
                             full_response = chunk.get("content", "")
                             # 청크 단위로 스트리밍 (한 번에 전송)
-                            yield f"data: {json.dumps({'type': 'chunk', 'text': full_response}, ensure_ascii=False)}\n\n"
+                            yield sse.event({'type': 'chunk', 'text': full_response})
                         
                         elif chunk_type == "done":
                             # 완료 정보 - 출처 정보 철저히 관리
@@ -1560,7 +1677,7 @@ async def chat_stream_v2(
                             }
                         
                         elif chunk_type == "error":
-                            yield f"data: {json.dumps({'type': 'error', 'message': chunk.get('message', '')}, ensure_ascii=False)}\n\n"
+                            yield sse.event({'type': 'error', 'message': chunk.get('message', '')})
                             return
                 
                 finally:
@@ -1570,24 +1687,31 @@ async def chat_stream_v2(
                 # ========================================
                 # 기본 모드: 기존 파이프라인 사용
                 # ========================================
-                for event in run_orchestration_agent_stream(
+                for event in sse.paced(run_orchestration_agent_stream(
                     message_for_pipeline,
                     history,
                     user_id=user_id,
                     score_id=active_score_id,
-                ):
+                    prefetch=prefetch,
+                )):
                     event_type = event.get("type")
                     
                     if event_type == "status":
                         # 상태 업데이트 전송
-                        yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                        yield sse.event(event)
                     
                     elif event_type == "chunk":
                         # Main Agent 응답 청크 전송
                         full_response += event.get("text", "")
-                        yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                        chunk_frame = sse.chunk(event.get("text", ""))
+                        if chunk_frame:
+                            yield chunk_frame
                     
                     elif event_type == "done":
+                        # 남은 응답 텍스트는 후처리(메시지 저장 등) 전에 바로 전송
+                        tail_frame = sse.flush()
+                        if tail_frame:
+                            yield tail_frame
                         timing = event.get("timing", {})
                         function_results = event.get("function_results", {})
                         router_output = event.get("router_output", {})
@@ -1598,7 +1722,7 @@ async def chat_stream_v2(
                         used_chunks = event.get("used_chunks", [])
                     
                     elif event_type == "error":
-                        yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                        yield sse.event(event)
                         return
             
             # 대화 이력에 추가
@@ -1625,13 +1749,19 @@ async def chat_stream_v2(
                 print(f"❌ 메시지 저장 실패: {e}")
             
             # 완료 이벤트 전송 (출처 정보 포함)
+            done_results, results_id = _pack_done_function_results(
+                function_results,
+                owner=cache_key,
+                include_full=bool(request.include_function_results),
+            )
             done_event = {
                 "type": "done",
                 "response": full_response,
                 "timing": timing,
                 "pipeline_time": round(pipeline_time * 1000),
                 "router_output": router_output,
-                "function_results": function_results,
+                "function_results": done_results,
+                "results_id": results_id,
                 "sources": sources,
                 "source_urls": source_urls,
                 "used_chunks": used_chunks,
@@ -1640,7 +1770,7 @@ async def chat_stream_v2(
                 "require_login": require_login,  # 비로그인 3회째 질문 시 True
                 "score_id": active_score_id,
             }
-            yield f"data: {json.dumps(done_event, ensure_ascii=False)}\n\n"
+            yield sse.event(done_event)
             
             print(f"🟢 [STREAM_V2_END] [{mode_label}] 총 {pipeline_time:.2f}초, {len(full_response)}자")
             
@@ -1648,7 +1778,7 @@ async def chat_stream_v2(
             print(f"❌ 스트리밍 오류: {e}")
             import traceback
             traceback.print_exc()
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)}, ensure_ascii=False)}\n\n"
+            yield sse.event({'type': 'error', 'message': str(e)})
     
     return StreamingResponse(
         generate(),
@@ -1723,20 +1853,27 @@ async def chat_stream_continue_after_naesin(
 
     def generate_continue():
         nonlocal full_response, timing, function_results, router_output, sources, source_urls, used_chunks
+        sse = SSEEncoder()
         try:
-            for event in run_orchestration_agent_stream(
+            for event in sse.paced(run_orchestration_agent_stream(
                 message,
                 history,
                 user_id=user_id,
                 score_id=score_id,
-            ):
+            )):
                 event_type = event.get("type")
                 if event_type == "status":
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    yield sse.event(event)
                 elif event_type == "chunk":
                     full_response += event.get("text", "")
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    chunk_frame = sse.chunk(event.get("text", ""))
+                    if chunk_frame:
+                        yield chunk_frame
                 elif event_type == "done":
+                    # 남은 응답 텍스트는 후처리(메시지 저장 등) 전에 바로 전송
+                    tail_frame = sse.flush()
+                    if tail_frame:
+                        yield tail_frame
                     timing = event.get("timing", {})
                     function_results = event.get("function_results", {})
                     router_output = event.get("router_output", {})
@@ -1745,7 +1882,7 @@ async def chat_stream_continue_after_naesin(
                     source_urls = event.get("source_urls", [])
                     used_chunks = event.get("used_chunks", [])
                 elif event_type == "error":
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    yield sse.event(event)
                     return
 
             history.append({"role": "assistant", "content": full_response})
@@ -1764,22 +1901,28 @@ async def chat_stream_continue_after_naesin(
             except Exception as e:
                 print(f"❌ continue-after-naesin 메시지 저장 실패: {e}")
 
+            done_results, results_id = _pack_done_function_results(
+                function_results,
+                owner=cache_key,
+                include_full=bool(request.include_function_results),
+            )
             done_event = {
                 "type": "done",
                 "response": full_response,
                 "timing": timing,
                 "router_output": router_output,
-                "function_results": function_results,
+                "function_results": done_results,
+                "results_id": results_id,
                 "sources": sources,
                 "source_urls": source_urls,
                 "used_chunks": used_chunks,
                 "score_id": score_id,
             }
-            yield f"data: {json.dumps(done_event, ensure_ascii=False)}\n\n"
+            yield sse.event(done_event)
         except Exception as e:
             import traceback
             traceback.print_exc()
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)}, ensure_ascii=False)}\n\n"
+            yield sse.event({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         generate_continue(),
@@ -1828,20 +1971,27 @@ async def chat_stream_continue_after_score_confirm(
 
     def generate_continue():
         nonlocal full_response, timing, function_results, router_output, sources, source_urls, used_chunks
+        sse = SSEEncoder()
         try:
-            for event in run_orchestration_agent_stream(
+            for event in sse.paced(run_orchestration_agent_stream(
                 message,
                 history,
                 user_id=user_id,
                 score_id=score_id,
-            ):
+            )):
                 event_type = event.get("type")
                 if event_type == "status":
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    yield sse.event(event)
                 elif event_type == "chunk":
                     full_response += event.get("text", "")
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    chunk_frame = sse.chunk(event.get("text", ""))
+                    if chunk_frame:
+                        yield chunk_frame
                 elif event_type == "done":
+                    # 남은 응답 텍스트는 후처리(메시지 저장 등) 전에 바로 전송
+                    tail_frame = sse.flush()
+                    if tail_frame:
+                        yield tail_frame
                     timing = event.get("timing", {})
                     function_results = event.get("function_results", {})
                     router_output = event.get("router_output", {})
@@ -1850,7 +2000,7 @@ async def chat_stream_continue_after_score_confirm(
                     source_urls = event.get("source_urls", [])
                     used_chunks = event.get("used_chunks", [])
                 elif event_type == "error":
-                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    yield sse.event(event)
                     return
 
             history.append({"role": "assistant", "content": full_response})
@@ -1868,22 +2018,28 @@ async def chat_stream_continue_after_score_confirm(
             except Exception as e:
                 print(f"❌ continue-after-score-confirm 메시지 저장 실패: {e}")
 
+            done_results, results_id = _pack_done_function_results(
+                function_results,
+                owner=cache_key,
+                include_full=bool(request.include_function_results),
+            )
             done_event = {
                 "type": "done",
                 "response": full_response,
                 "timing": timing,
                 "router_output": router_output,
-                "function_results": function_results,
+                "function_results": done_results,
+                "results_id": results_id,
                 "sources": sources,
                 "source_urls": source_urls,
                 "used_chunks": used_chunks,
                 "score_id": score_id,
             }
-            yield f"data: {json.dumps(done_event, ensure_ascii=False)}\n\n"
+            yield sse.event(done_event)
         except Exception as e:
             import traceback
             traceback.print_exc()
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)}, ensure_ascii=False)}\n\n"
+            yield sse.event({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         generate_continue(),
@@ -2429,6 +2585,25 @@ async def skip_score_review_for_session(
     return {"ok": True, "skip_session": True}
 
 
+@router.get("/v2/results/{results_id}")
+async def get_stream_function_results(
+    results_id: str,
+    session_id: str = Query(...),
+    authorization: Optional[str] = Header(None),
+):
+    """
+    스트리밍 done 이벤트에서 생략된 전체 function_results 조회
+    - 프론트는 Agent 패널의 Functions 탭을 열 때만 조회 (실행 로그는 서버가 저장 시 직접 채움)
+    - done 이벤트의 results_id로 조회, 같은 사용자/세션만 접근 가능
+    """
+    user = await optional_auth(authorization)
+    user_id = user["user_id"] if user else None
+    function_results = lookup_stream_function_results(results_id, user_id, session_id)
+    if function_results is None:
+        raise HTTPException(status_code=404, detail="결과가 만료되었거나 존재하지 않습니다.")
+    return {"results_id": results_id, "function_results": function_results}
+
+
 @router.get("/v2/score-sets/suggest")
 async def suggest_score_sets(
     q: str = Query(default=""),
@@ -8,11 +8,11 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
-from queue import Empty, Queue
+from queue import Queue
 import re
 import time
 from typing import Any, Callable, Dict, List, Optional
@@ -21,11 +21,29 @@ from fastapi import APIRouter, Header, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from fixtures.hardcoded_school_records import HARDCODED_SCHOOL_RECORDS
 from middleware.auth import optional_auth_with_state
+from school_record_eval.accepted_cases import get_accepted_case_index, infer_accepted_record_type
+from school_record_eval.evidence_passages import (
+    EVIDENCE_PROMPT_TOKEN_BUDGET,
+    REVIEW_PASSAGE_TOKEN_BUDGET,
+    EvidencePassageStore,
+    format_passages,
+    union_passages,
+)
 from school_record_eval.matching_summary import ensure_matching_summary
-from school_record_eval.report_context import build_school_record_report_context_text
 from services.supabase_client import supabase_service
+from services.school_record_context_cache import SchoolRecordContext, get_school_record_context_cache
+from services.prompt_cache import get_prompt_prefix
+from services.llm_scheduler import (
+    PRIORITY_RETRIEVAL,
+    PRIORITY_REVIEW,
+    PRIORITY_SECTION,
+    RESOURCE_LLM,
+    RESOURCE_RETRIEVAL,
+    TaskGraph,
+)
+from services.query_embeddings import get_query_embedding_service
+from utils.university_names import get_university_matcher, school_name_variants
 
 router = APIRouter()
 
@@ -215,11 +233,6 @@ RECOMMENDATION_QUERY_HINTS = (
     "어디", "어느 대학", "적합한 대학", "잘 맞는 대학", "지원 대학",
     "대학군", "지원 가능 대학",
 )
-UNIVERSITY_VARIANT_EXCLUDES = {
-    "의대", "치대", "약대", "공대", "상대", "법대", "교대", "사대", "문과대", "이과대",
-}
-DOCUMENT_SCHOOL_NAME_CACHE: Optional[list[str]] = None
-UNIVERSITY_DOCUMENT_EMBEDDER = None
 UNIVERSITY_DOCUMENT_CATALOG_CACHE: Optional[list[Dict[str, Any]]] = None
 UNIVERSITY_PROFILE_CACHE: Dict[str, Dict[str, Any]] = {}
 NESIN_DETAIL_CACHE: Optional[list[Dict[str, Any]]] = None
@@ -231,6 +244,8 @@ SCHOOL_RECORD_FOCUS_KEYWORDS = (
     "기계", "산업공학", "경영", "경제", "심리", "교육", "사회", "정치",
     "철학", "법학", "간호", "약학", "바이오", "유전", "면역", "환경",
 )
+SCHOOL_RECORD_FOCUS_TERMS_MAX = 8
+SCHOOL_RECORD_FOCUS_TERMS_CACHE_SIZE = 256
 
 PLANNER_MODEL = os.getenv("SCHOOL_RECORD_DEEP_CHAT_PLANNER_MODEL", DEEP_CHAT_MODEL)
 REPORT_WRITER_MODEL = os.getenv("SCHOOL_RECORD_DEEP_CHAT_REPORT_WRITER_MODEL", DEEP_CHAT_MODEL)
@@ -241,15 +256,17 @@ PLANNER_MAX_OUTPUT_TOKENS = 2048
 REPORT_MAX_OUTPUT_TOKENS = 8192
 REPORT_MAX_SOURCE_COUNT = 6
 REPORT_MAX_SOURCE_SNIPPET_CHARS = 1200
+# 섹션 작성 공용 접두(과제 + 답변 설계) 캐시 유지 시간 (리포트 1건 생성 동안만)
+REPORT_PROMPT_CACHE_TTL_SECONDS = 300
 REPORT_SECTION_MAX_OUTPUT_TOKENS = 2048
-REPORT_SECTION_MAX_WORKERS = 6
-REFERENCE_QUERY_MAX_WORKERS = 4
-REPORT_POST_PROCESS_MAX_WORKERS = 4
 REPORT_REVIEW_MAX_OUTPUT_TOKENS = 4096
 SCHOOL_RECORD_EVIDENCE_MAX_CHARS = 22000
 MIN_CRITERIA_EXCERPT_LINES = 3
 NARRATIVE_MERGE_MAX_OUTPUT_TOKENS = 2048
 ACCEPTED_CASE_MAX_CANDIDATES = 3
+ACCEPTED_CASE_RECORD_TYPES = ("세특", "자율활동", "동아리활동", "진로활동", "행특", "코멘트")
+# case_id -> 스니펫 목록 (사례 원문은 읽기 전용)
+_ACCEPTED_CASE_SNIPPETS: Dict[str, list[Dict[str, str]]] = {}
 ACCEPTED_CASE_MAX_OUTPUT_TOKENS = 3072
 ACCEPTED_CASE_MIN_EXCERPT_PAIRS = 3
 ACCEPTED_CASE_MAX_EXCERPT_PAIRS = 6
@@ -764,82 +781,14 @@ def _tokenize_query(text: str) -> list[str]:
     return [t for t in tokens if len(t) >= 2 and t not in QUERY_STOPWORDS]
 
 
-def _normalize_compact_text(text: str) -> str:
-    return re.sub(r"\s+", "", str(text or "").strip().lower())
-
-
 def _school_name_search_variants(university: str) -> list[str]:
     """검색 시 사용할 학교명 변형 목록."""
-    if not university or not university.strip():
-        return []
-    u = university.strip()
-    variants = [u]
-    if u.endswith("대학교"):
-        short = u[:-2]
-        if short and short not in variants:
-            variants.append(short)
-    elif u.endswith("대학"):
-        short = u[:-2] + "대"
-        if short and short not in variants:
-            variants.append(short)
-    elif u.endswith("대"):
-        university_name = u + "대학교"
-        if university_name not in variants:
-            variants.append(university_name)
-    return variants
-
-
-def _get_document_school_names() -> list[str]:
-    global DOCUMENT_SCHOOL_NAME_CACHE
-    if DOCUMENT_SCHOOL_NAME_CACHE is not None:
-        return DOCUMENT_SCHOOL_NAME_CACHE
-
-    try:
-        client = supabase_service.get_admin_client()
-        response = client.table("documents").select("school_name").execute()
-        school_names = []
-        seen = set()
-        for row in response.data or []:
-            name = str(row.get("school_name") or "").strip()
-            if not name or name in seen:
-                continue
-            seen.add(name)
-            school_names.append(name)
-        DOCUMENT_SCHOOL_NAME_CACHE = school_names
-        return school_names
-    except Exception as e:
-        print(f"⚠️ [deep_chat] 대학 문서 school_name 조회 실패: {e}")
-        DOCUMENT_SCHOOL_NAME_CACHE = []
-        return []
+    return school_name_variants(university)
 
 
 def _extract_target_universities(query: str) -> list[str]:
-    normalized_query = _normalize_compact_text(query)
-    if not normalized_query:
-        return []
-
-    matched: list[tuple[int, str]] = []
-    seen = set()
-
-    for school_name in _get_document_school_names():
-        variants = [school_name, *_school_name_search_variants(school_name)]
-        normalized_variants = [
-            _normalize_compact_text(variant)
-            for variant in variants
-            if variant and variant not in UNIVERSITY_VARIANT_EXCLUDES
-        ]
-        longest = 0
-        for variant in normalized_variants:
-            if not variant or variant in UNIVERSITY_VARIANT_EXCLUDES:
-                continue
-            if variant in normalized_query:
-                longest = max(longest, len(variant))
-        if longest and school_name not in seen:
-            seen.add(school_name)
-            matched.append((longest, school_name))
-
-    matched.sort(key=lambda item: (-item[0], item[1]))
-    return [school_name for _, school_name in matched[:3]]
+    # 별칭 사전 + documents.school_name 오토마톤으로 한 번만 훑어서 추출 (긴 매칭 우선 상위 3개)
+    return get_university_matcher().extract_names(query, limit=3)
 
 
 def _build_university_rag_query(query: str, universities: list[str]) -> str:
@@ -848,54 +797,34 @@ def _build_university_rag_query(query: str, universities: list[str]) -> str:
     return f"{query.strip()} {school_terms} {hint_terms}".strip()
 
 
-def _get_university_document_embedder():
-    global UNIVERSITY_DOCUMENT_EMBEDDER
-    if UNIVERSITY_DOCUMENT_EMBEDDER is not None:
-        return UNIVERSITY_DOCUMENT_EMBEDDER
-
-    from config import embedding_settings as embedding_config
-    from langchain_google_genai import GoogleGenerativeAIEmbeddings
-
-    embedding_model = (
-        getattr(embedding_config, "DEFAULT_EMBEDDING_MODEL", "")
-        or "models/gemini-embedding-001"
-    )
-    UNIVERSITY_DOCUMENT_EMBEDDER = GoogleGenerativeAIEmbeddings(
-        model=embedding_model,
-        request_timeout=600,
-        batch_size=100,
-        max_retries=10,
-        retry_delay=15,
-    )
-    return UNIVERSITY_DOCUMENT_EMBEDDER
-
-
-def _embed_university_document_query(text: str) -> list[float]:
-    embedder = _get_university_document_embedder()
-    return list(embedder.embed_query(text))
-
-
 def _is_vector_dimension_mismatch_error(error: Exception) -> bool:
     return "different vector dimensions" in str(error or "").lower()
 
 
 def _build_university_query_embeddings(text: str) -> list[list[float]]:
+    # document_chunks(3072차원) + academic_contents(768차원) 임베딩을 동시에 요청 (LRU 메모)
+    primary_embedding, fallback_embedding = get_query_embedding_service().embed_dual(text)
     embeddings: list[list[float]] = []
-
-    primary_embedding = _embed_university_document_query(text)
     if primary_embedding:
         embeddings.append(primary_embedding)
+    if fallback_embedding and len(fallback_embedding) != len(primary_embedding or []):
+        embeddings.append(fallback_embedding)
+    return embeddings
 
-    try:
-        from routers.academic_contents import _embed_query
 
-        fallback_embedding = _embed_query(text)
-        if fallback_embedding and len(fallback_embedding) != len(primary_embedding):
-            embeddings.append(fallback_embedding)
-    except Exception:
-        pass
-
-    return embeddings
+def _prefetch_reference_query_embeddings(queries: list[str], school_record_context: str) -> None:
+    """리포트 계획 쿼리들의 임베딩을 모델별 배치 1회로 미리 계산 (이후 검색은 메모 재사용)"""
+    university_queries: list[str] = []
+    for query in queries:
+        universities = _extract_target_universities(query)
+        if universities:
+            university_queries.append(_build_university_rag_query(query, universities))
+        elif _is_university_recommendation_query(query):
+            university_queries.append(_build_recommendation_rag_query(query, school_record_context))
+    get_query_embedding_service().prefetch(
+        document_texts=university_queries,
+        academic_texts=[*queries, *university_queries],
+    )
 
 
 def _get_university_document_catalog() -> list[Dict[str, Any]]:
@@ -1046,6 +975,23 @@ def _is_university_recommendation_query(query: str) -> bool:
 
 
 def _extract_school_record_focus_terms(school_record_context: str, limit: int = 6) -> list[str]:
+    """
+    생기부 컨텍스트의 희망분야/빈출 키워드.
+    한 턴에서 여러 번(계획/검색/비교) 같은 컨텍스트로 호출되고, 컨텍스트 문자열은
+    유저별 캐시(SchoolRecordContext)에서 같은 객체로 재사용되므로 문자열 기준으로 메모.
+    """
+    if limit > SCHOOL_RECORD_FOCUS_TERMS_MAX:
+        return _collect_school_record_focus_terms(school_record_context, limit)
+    return list(_memoized_school_record_focus_terms(str(school_record_context or ""))[:limit])
+
+
+@lru_cache(maxsize=SCHOOL_RECORD_FOCUS_TERMS_CACHE_SIZE)
+def _memoized_school_record_focus_terms(school_record_context: str) -> tuple[str, ...]:
+    # limit 이하 결과는 항상 최대 limit 결과의 앞부분
+    return tuple(_collect_school_record_focus_terms(school_record_context, SCHOOL_RECORD_FOCUS_TERMS_MAX))
+
+
+def _collect_school_record_focus_terms(school_record_context: str, limit: int) -> list[str]:
     text = str(school_record_context or "")
     if not text:
         return []
@@ -1180,35 +1126,30 @@ def _collect_reference_sources_for_queries(
     ordered_selected_rows: list[Dict[str, Any]] = []
     seen_ids = set()
 
-    selected_rows_by_index: Dict[int, list[Dict[str, Any]]] = {}
-    max_workers = min(REFERENCE_QUERY_MAX_WORKERS, len(normalized_queries))
-    if max_workers <= 1:
-        for idx, query in enumerate(normalized_queries):
-            _, selected_rows = _retrieve_reference_rag_rows(
+    try:
+        _prefetch_reference_query_embeddings(normalized_queries, school_record_context)
+    except Exception as error:
+        print(f"⚠️ [deep_chat] 참고자료 쿼리 임베딩 사전 계산 실패: {error}")
+
+    graph = TaskGraph(label="deep_chat")
+    query_tasks = [
+        graph.add(
+            f"reference-query-{idx + 1}",
+            lambda results, query=query: _retrieve_reference_rag_rows(
                 query,
                 school_record_context=school_record_context,
                 match_count=match_count,
-            )
-            selected_rows_by_index[idx] = selected_rows
-    else:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_map = {
-                executor.submit(
-                    _retrieve_reference_rag_rows,
-                    query,
-                    school_record_context=school_record_context,
-                    match_count=match_count,
-                ): idx
-                for idx, query in enumerate(normalized_queries)
-            }
-            for future in as_completed(future_map):
-                idx = future_map[future]
-                try:
-                    _, selected_rows = future.result()
-                except Exception as error:
-                    print(f"⚠️ [deep_chat] 참고자료 병렬 검색 실패(query-{idx + 1}): {error}")
-                    selected_rows = []
-                selected_rows_by_index[idx] = selected_rows
+            )[1],
+            priority=PRIORITY_RETRIEVAL,
+            resource=RESOURCE_RETRIEVAL,
+        )
+        for idx, query in enumerate(normalized_queries)
+    ]
+    query_results = graph.run()
+    selected_rows_by_index = {
+        idx: query_results.get(name) or []
+        for idx, name in enumerate(query_tasks)
+    }
 
     for idx in range(len(normalized_queries)):
         for row in selected_rows_by_index.get(idx, []):
@@ -2266,14 +2207,17 @@ def _generate_json_with_gemini(
     user_prompt: str,
     model_name: str,
     max_output_tokens: int = PLANNER_MAX_OUTPUT_TOKENS,
+    shared_prompt: str = "",
+    cache_ttl_seconds: Optional[int] = None,
 ) -> Optional[Dict[str, Any]]:
+    """
+    system_prompt(+ 여러 호출이 공유하는 shared_prompt)는 프롬프트 접두 캐시로 등록해 재사용.
+    캐시를 쓸 수 없으면 shared_prompt를 user_prompt 앞에 붙여 일반 호출.
+    """
     try:
         genai = _configure_gemini()
-        model = genai.GenerativeModel(
-            model_name=model_name,
-            system_instruction=system_prompt,
-        )
-        response = model.generate_content(
+        prompt_prefix = get_prompt_prefix(model_name, system_prompt, shared_prompt, cache_ttl_seconds)
+        response = prompt_prefix.generate_content(
             user_prompt,
             generation_config=genai.types.GenerationConfig(
                 temperature=0.1,
@@ -2342,10 +2286,12 @@ def _build_answer_plan(
     school_record: Dict[str, Any],
     school_record_context: str,
     initial_sources_meta: list[Dict[str, Any]],
+    school_snapshot: Optional[str] = None,
 ) -> Dict[str, Any]:
-    school_snapshot = _build_planning_school_record_snapshot(
-        school_record, school_record_context
-    )
+    if school_snapshot is None:
+        school_snapshot = _build_planning_school_record_snapshot(
+            school_record, school_record_context
+        )
     planning_prompt = "\n\n".join(
         [
             "[최근 대화]",
@@ -3169,7 +3115,9 @@ def _build_three_page_report(
     student_profile: Optional[Dict[str, Any]],
     user_metadata: Optional[Dict[str, Any]],
     user_grade_summary: Optional[Dict[str, Any]],
+    flowchart: Optional[Dict[str, Any]] = None,
 ) -> Optional[Dict[str, Any]]:
+    """flowchart는 리포트 작업 그래프에서 학생 프로필 직후 별도 작업으로 만든 결과"""
     if not isinstance(report, dict):
         return None
 
@@ -3178,11 +3126,6 @@ def _build_three_page_report(
     strength_block = _build_strength_block(student_profile)
     weakness_block = _build_weakness_block(student_profile)
     next_semester_plan = _build_next_semester_plan(student_profile)
-    flowchart = _build_three_page_flowchart(
-        school_record=school_record,
-        school_record_context=school_record_context,
-        student_profile=student_profile,
-    )
     comparison_page = _build_three_page_comparison_page(report)
 
     if not any([grade_chart, score_chart, strength_block, weakness_block, next_semester_plan, flowchart, comparison_page]):
@@ -3639,7 +3582,8 @@ def _build_university_recommendation_summary(
             print(f"⚠️ [deep_chat] 적합 대학 랭킹 실패: {error}")
 
     if not target_universities:
-        target_universities = _get_document_school_names()[:4]
+        # 랭킹 실패 시 문서가 있는 학교 앞쪽 4곳 (매처가 documents.school_name을 캐시)
+        target_universities = get_university_matcher().names[:4]
 
     university_profiles = _build_target_university_profiles(target_universities[:4])
     focus_terms = _extract_focus_terms_from_profile(school_record_context, student_profile)
@@ -3672,7 +3616,11 @@ def _build_section_stream_payload(
     section_result: Dict[str, Any],
     section_index: int,
     total_sections: int,
+    report_section: Optional[Dict[str, Any]] = None,
+    evidence_catalog: Optional[Dict[str, Dict[str, Any]]] = None,
+    section_order: Optional[list[str]] = None,
 ) -> Dict[str, Any]:
+    """report_section이 있으면 리포트에 바로 넣을 수 있는 정규화된 섹션과 근거를 함께 보냄"""
     answer = re.sub(r"\s+", " ", str(section_result.get("answer") or "")).strip()
     if not answer:
         raw_assessment = section_result.get("student_assessment") or []
@@ -3684,7 +3632,7 @@ def _build_section_stream_payload(
                 if answer:
                     break
 
-    return {
+    payload = {
         "type": "section",
         "section": {
             "section_id": str(section_result.get("section_id") or "").strip(),
@@ -3694,6 +3642,33 @@ def _build_section_stream_payload(
         "section_index": section_index + 1,
         "total_sections": total_sections,
     }
+    if report_section:
+        payload["report_section"] = report_section
+        payload["evidence"] = _section_evidence_entries(report_section, evidence_catalog or {})
+        payload["order"] = section_order or []
+    return payload
+
+
+def _section_evidence_entries(
+    section: Dict[str, Any],
+    evidence_catalog: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    refs = [
+        *(section.get("criteria_evidence_refs") or []),
+        *(section.get("school_record_evidence_refs") or []),
+    ]
+    return {ref: evidence_catalog[ref] for ref in refs if ref in evidence_catalog}
+
+
+def _build_report_patch_event(op: str, **fields: Any) -> Dict[str, Any]:
+    """
+    스트리밍한 리포트 초안 수정 이벤트.
+    - upsert_section: section(+evidence)을 section_id 기준으로 교체/추가, order가 있으면 그 순서로 정렬
+    - remove_section: section_id 섹션 제거
+    - set: field 값을 value로 설정 (summary, direct_answer)
+    - discard: 구조화 리포트 생성 실패 (초안 폐기)
+    """
+    return {"type": "report_patch", "op": op, **fields}
 
 
 def _build_plain_text_from_report(report: Dict[str, Any]) -> str:
@@ -3812,201 +3787,236 @@ def _build_plain_text_from_report(report: Dict[str, Any]) -> str:
     return "\n\n".join(part for part in parts if part.strip())
 
 
-def _normalize_structured_report(
-    raw_report: Dict[str, Any],
+def _report_section_fingerprint(raw_section: Any, section_idx: int) -> str:
+    return f"{section_idx}:" + json.dumps(raw_section, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _normalize_report_section(
+    raw_section: Any,
+    section_idx: int,
     *,
     answer_plan: Optional[Dict[str, Any]],
     source_lookup: Dict[str, Dict[str, Any]],
     section_evidence_map: Optional[Dict[str, Dict[str, Any]]] = None,
-) -> Optional[Dict[str, Any]]:
-    sections_raw = raw_report.get("sections")
-    if not isinstance(sections_raw, list) or not sections_raw:
-        return None
-
+) -> tuple[Optional[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """섹션 하나 정규화 + 통합 문단 생성. (섹션 또는 None, 이 섹션의 근거 카탈로그)"""
     fallback_titles = (
         answer_plan.get("answer_sections", []) if isinstance(answer_plan, dict) else []
     ) or []
-
-    normalized_sections = []
     evidence_catalog: Dict[str, Dict[str, Any]] = {}
+    if not isinstance(raw_section, dict):
+        return None, evidence_catalog
 
-    for section_idx, raw_section in enumerate(sections_raw, start=1):
-        if not isinstance(raw_section, dict):
-            continue
-
-        section_id = str(raw_section.get("section_id") or f"section-{section_idx}").strip()
-        title = str(
-            raw_section.get("title")
-            or (fallback_titles[section_idx - 1] if section_idx - 1 < len(fallback_titles) else f"섹션 {section_idx}")
-        ).strip()
-        answer = str(raw_section.get("answer") or "").strip()
-
-        section_criteria_evidence_refs = []
-        source_id_to_evidence_id: Dict[str, str] = {}
-        source_id_to_why_used: Dict[str, str] = {}
-        seen_source_ids = set()
-        raw_evidence = raw_section.get("evidence")
-        if isinstance(raw_evidence, list):
-            for evidence_idx, item in enumerate(raw_evidence, start=1):
-                if not isinstance(item, dict):
-                    continue
-                source_id = str(item.get("source_id") or "").strip()
-                if not source_id or source_id in seen_source_ids or source_id not in source_lookup:
-                    continue
-                seen_source_ids.add(source_id)
-                src = source_lookup[source_id]
-                used_excerpt = _expand_excerpt_to_min_lines(
-                    item.get("used_excerpt") or "",
-                    src.get("raw_content", "") or "",
-                )
-                evidence_id = f"{section_id}-e{evidence_idx}"
-                evidence_catalog[evidence_id] = {
-                    "evidence_id": evidence_id,
-                    "source_id": source_id,
-                    "source_type": src.get("source_type", "academic_contents"),
-                    "source_title": src.get("source_title", ""),
-                    "source_path": _get_source_path(src),
-                    "chunk_title": src.get("chunk_title", ""),
-                    "chunk_index": src.get("chunk_index", 0),
-                    "chunk_role": src.get("chunk_role", ""),
-                    "chunk_summary": src.get("chunk_summary", ""),
-                    "document_summary": src.get("document_summary", ""),
-                    "used_excerpt": used_excerpt,
-                    "why_used": str(item.get("why_used") or "").strip(),
-                    "evidence_type": "evaluation_criteria",
-                }
-                section_criteria_evidence_refs.append(evidence_id)
-                source_id_to_evidence_id[source_id] = evidence_id
-                source_id_to_why_used[source_id] = str(item.get("why_used") or "").strip()
-
-        school_record_evidence_refs = []
-        school_record_index_to_evidence_id: Dict[int, str] = {}
-        section_evidence = (section_evidence_map or {}).get(section_id, {})
-        school_record_evidence = section_evidence.get("school_record_evidence", []) or []
-        for sr_idx, item in enumerate(school_record_evidence, start=1):
+    section_id = str(raw_section.get("section_id") or f"section-{section_idx}").strip()
+    title = str(
+        raw_section.get("title")
+        or (fallback_titles[section_idx - 1] if section_idx - 1 < len(fallback_titles) else f"섹션 {section_idx}")
+    ).strip()
+    answer = str(raw_section.get("answer") or "").strip()
+
+    section_criteria_evidence_refs = []
+    source_id_to_evidence_id: Dict[str, str] = {}
+    source_id_to_why_used: Dict[str, str] = {}
+    seen_source_ids = set()
+    raw_evidence = raw_section.get("evidence")
+    if isinstance(raw_evidence, list):
+        for evidence_idx, item in enumerate(raw_evidence, start=1):
             if not isinstance(item, dict):
                 continue
-            quote = str(item.get("quote") or "").strip()
-            if not quote:
+            source_id = str(item.get("source_id") or "").strip()
+            if not source_id or source_id in seen_source_ids or source_id not in source_lookup:
                 continue
-            evidence_id = f"{section_id}-sr{sr_idx}"
+            seen_source_ids.add(source_id)
+            src = source_lookup[source_id]
+            used_excerpt = _expand_excerpt_to_min_lines(
+                item.get("used_excerpt") or "",
+                src.get("raw_content", "") or "",
+            )
+            evidence_id = f"{section_id}-e{evidence_idx}"
             evidence_catalog[evidence_id] = {
                 "evidence_id": evidence_id,
-                "evidence_type": "school_record",
-                "label": str(item.get("label") or f"생기부 근거 {sr_idx}").strip(),
-                "used_excerpt": quote,
-                "why_used": str(item.get("interpretation") or "").strip(),
+                "source_id": source_id,
+                "source_type": src.get("source_type", "academic_contents"),
+                "source_title": src.get("source_title", ""),
+                "source_path": _get_source_path(src),
+                "chunk_title": src.get("chunk_title", ""),
+                "chunk_index": src.get("chunk_index", 0),
+                "chunk_role": src.get("chunk_role", ""),
+                "chunk_summary": src.get("chunk_summary", ""),
+                "document_summary": src.get("document_summary", ""),
+                "used_excerpt": used_excerpt,
+                "why_used": str(item.get("why_used") or "").strip(),
+                "evidence_type": "evaluation_criteria",
             }
-            school_record_evidence_refs.append(evidence_id)
-            school_record_index_to_evidence_id[sr_idx] = evidence_id
+            section_criteria_evidence_refs.append(evidence_id)
+            source_id_to_evidence_id[source_id] = evidence_id
+            source_id_to_why_used[source_id] = str(item.get("why_used") or "").strip()
 
-        evaluation_criteria = []
-        raw_evaluation_criteria = raw_section.get("evaluation_criteria")
-        if isinstance(raw_evaluation_criteria, list):
-            for criterion_idx, item in enumerate(raw_evaluation_criteria, start=1):
-                if not isinstance(item, dict):
-                    continue
-                text = str(item.get("text") or "").strip()
-                source_refs = _normalize_str_list(item.get("source_refs"), 4)
-                linked_evidence_refs = [
-                    source_id_to_evidence_id[source_id]
-                    for source_id in source_refs
-                    if source_id in source_id_to_evidence_id
-                ]
-                supporting_statements = [
-                    source_id_to_why_used[source_id]
-                    for source_id in source_refs
-                    if source_id in source_id_to_why_used
-                ]
-                if not text:
-                    continue
-                text = _strip_meta_suffix(text)
-                text = _remove_generic_metric_sentences(text)
-                if text and text[-1] not in ".!?":
-                    text += "."
-                text = _merge_supporting_statements_into_text(text, supporting_statements)
-                text = _remove_generic_metric_sentences(text)
-                evaluation_criteria.append(
-                    {
-                        "criterion_id": f"{section_id}-c{criterion_idx}",
-                        "text": text,
-                        "evidence_refs": linked_evidence_refs,
-                    }
-                )
+    school_record_evidence_refs = []
+    school_record_index_to_evidence_id: Dict[int, str] = {}
+    section_evidence = (section_evidence_map or {}).get(section_id, {})
+    school_record_evidence = section_evidence.get("school_record_evidence", []) or []
+    for sr_idx, item in enumerate(school_record_evidence, start=1):
+        if not isinstance(item, dict):
+            continue
+        quote = str(item.get("quote") or "").strip()
+        if not quote:
+            continue
+        evidence_id = f"{section_id}-sr{sr_idx}"
+        evidence_catalog[evidence_id] = {
+            "evidence_id": evidence_id,
+            "evidence_type": "school_record",
+            "label": str(item.get("label") or f"생기부 근거 {sr_idx}").strip(),
+            "used_excerpt": quote,
+            "why_used": str(item.get("interpretation") or "").strip(),
+        }
+        school_record_evidence_refs.append(evidence_id)
+        school_record_index_to_evidence_id[sr_idx] = evidence_id
 
-        student_assessment = []
-        raw_student_assessment = raw_section.get("student_assessment")
-        if isinstance(raw_student_assessment, list):
-            for assessment_idx, item in enumerate(raw_student_assessment, start=1):
-                if not isinstance(item, dict):
-                    continue
-                text = str(item.get("text") or "").strip()
-                ref_indexes = item.get("school_record_ref_indexes")
-                if isinstance(ref_indexes, list):
-                    indexes = [
-                        int(idx)
-                        for idx in ref_indexes
-                        if isinstance(idx, (int, float)) or (isinstance(idx, str) and idx.isdigit())
-                    ]
-                else:
-                    indexes = []
-                linked_evidence_refs = [
-                    school_record_index_to_evidence_id[idx]
-                    for idx in indexes
-                    if idx in school_record_index_to_evidence_id
+    evaluation_criteria = []
+    raw_evaluation_criteria = raw_section.get("evaluation_criteria")
+    if isinstance(raw_evaluation_criteria, list):
+        for criterion_idx, item in enumerate(raw_evaluation_criteria, start=1):
+            if not isinstance(item, dict):
+                continue
+            text = str(item.get("text") or "").strip()
+            source_refs = _normalize_str_list(item.get("source_refs"), 4)
+            linked_evidence_refs = [
+                source_id_to_evidence_id[source_id]
+                for source_id in source_refs
+                if source_id in source_id_to_evidence_id
+            ]
+            supporting_statements = [
+                source_id_to_why_used[source_id]
+                for source_id in source_refs
+                if source_id in source_id_to_why_used
+            ]
+            if not text:
+                continue
+            text = _strip_meta_suffix(text)
+            text = _remove_generic_metric_sentences(text)
+            if text and text[-1] not in ".!?":
+                text += "."
+            text = _merge_supporting_statements_into_text(text, supporting_statements)
+            text = _remove_generic_metric_sentences(text)
+            evaluation_criteria.append(
+                {
+                    "criterion_id": f"{section_id}-c{criterion_idx}",
+                    "text": text,
+                    "evidence_refs": linked_evidence_refs,
+                }
+            )
+
+    student_assessment = []
+    raw_student_assessment = raw_section.get("student_assessment")
+    if isinstance(raw_student_assessment, list):
+        for assessment_idx, item in enumerate(raw_student_assessment, start=1):
+            if not isinstance(item, dict):
+                continue
+            text = str(item.get("text") or "").strip()
+            ref_indexes = item.get("school_record_ref_indexes")
+            if isinstance(ref_indexes, list):
+                indexes = [
+                    int(idx)
+                    for idx in ref_indexes
+                    if isinstance(idx, (int, float)) or (isinstance(idx, str) and idx.isdigit())
                 ]
-                if not text:
-                    continue
-                text = _remove_generic_metric_sentences(text)
-                if not text:
-                    continue
-                student_assessment.append(
-                    {
-                        "assessment_id": f"{section_id}-a{assessment_idx}",
-                        "text": text,
-                        "school_record_refs": linked_evidence_refs,
-                    }
-                )
+            else:
+                indexes = []
+            linked_evidence_refs = [
+                school_record_index_to_evidence_id[idx]
+                for idx in indexes
+                if idx in school_record_index_to_evidence_id
+            ]
+            if not text:
+                continue
+            text = _remove_generic_metric_sentences(text)
+            if not text:
+                continue
+            student_assessment.append(
+                {
+                    "assessment_id": f"{section_id}-a{assessment_idx}",
+                    "text": text,
+                    "school_record_refs": linked_evidence_refs,
+                }
+            )
 
-        section_supporting_statements = [
-            evidence_catalog[evidence_id].get("why_used", "")
-            for evidence_id in section_criteria_evidence_refs
-            if evidence_id in evidence_catalog
-        ]
-        answer = _strip_meta_suffix(answer)
-        answer = _remove_generic_metric_sentences(answer)
-        if answer and answer[-1] not in ".!?":
-            answer += "."
-        answer = _merge_supporting_statements_into_text(answer, section_supporting_statements)
-        answer = _remove_generic_metric_sentences(answer)
-
-        if not title or (not evaluation_criteria and not student_assessment and not answer):
-            continue
+    section_supporting_statements = [
+        evidence_catalog[evidence_id].get("why_used", "")
+        for evidence_id in section_criteria_evidence_refs
+        if evidence_id in evidence_catalog
+    ]
+    answer = _strip_meta_suffix(answer)
+    answer = _remove_generic_metric_sentences(answer)
+    if answer and answer[-1] not in ".!?":
+        answer += "."
+    answer = _merge_supporting_statements_into_text(answer, section_supporting_statements)
+    answer = _remove_generic_metric_sentences(answer)
+
+    if not title or (not evaluation_criteria and not student_assessment and not answer):
+        return None, evidence_catalog
+
+    criteria_texts = [
+        str(c.get("text", "")).strip()
+        for c in evaluation_criteria
+        if isinstance(c, dict) and str(c.get("text", "")).strip()
+    ]
+    assessment_texts = [
+        str(a.get("text", "")).strip()
+        for a in student_assessment
+        if isinstance(a, dict) and str(a.get("text", "")).strip()
+    ]
+    section_narrative = _build_section_narrative(criteria_texts, assessment_texts, answer)
 
-        criteria_texts = [
-            str(c.get("text", "")).strip()
-            for c in evaluation_criteria
-            if isinstance(c, dict) and str(c.get("text", "")).strip()
-        ]
-        assessment_texts = [
-            str(a.get("text", "")).strip()
-            for a in student_assessment
-            if isinstance(a, dict) and str(a.get("text", "")).strip()
-        ]
-        section_narrative = _build_section_narrative(criteria_texts, assessment_texts, answer)
+    return (
+        {
+            "section_id": section_id,
+            "title": title,
+            "evaluation_criteria": evaluation_criteria,
+            "student_assessment": student_assessment,
+            "answer": answer,
+            "section_narrative": section_narrative,
+            "criteria_evidence_refs": section_criteria_evidence_refs,
+            "school_record_evidence_refs": school_record_evidence_refs,
+        },
+        evidence_catalog,
+    )
 
-        normalized_sections.append(
-            {
-                "section_id": section_id,
-                "title": title,
-                "evaluation_criteria": evaluation_criteria,
-                "student_assessment": student_assessment,
-                "answer": answer,
-                "section_narrative": section_narrative,
-                "criteria_evidence_refs": section_criteria_evidence_refs,
-                "school_record_evidence_refs": school_record_evidence_refs,
-            }
-        )
+
+def _normalize_structured_report(
+    raw_report: Dict[str, Any],
+    *,
+    answer_plan: Optional[Dict[str, Any]],
+    source_lookup: Dict[str, Dict[str, Any]],
+    section_evidence_map: Optional[Dict[str, Dict[str, Any]]] = None,
+    prepared_sections: Optional[Dict[str, tuple[Optional[Dict[str, Any]], Dict[str, Dict[str, Any]]]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    prepared_sections: _report_section_fingerprint → 이미 정규화한 결과.
+    스트리밍 중 섹션별로 정규화해 둔 것 중 검토에서 바뀌지 않은 섹션은 다시 만들지 않음.
+    """
+    sections_raw = raw_report.get("sections")
+    if not isinstance(sections_raw, list) or not sections_raw:
+        return None
+
+    normalized_sections = []
+    evidence_catalog: Dict[str, Dict[str, Any]] = {}
+
+    for section_idx, raw_section in enumerate(sections_raw, start=1):
+        prepared = (prepared_sections or {}).get(_report_section_fingerprint(raw_section, section_idx))
+        if prepared is None:
+            prepared = _normalize_report_section(
+                raw_section,
+                section_idx,
+                answer_plan=answer_plan,
+                source_lookup=source_lookup,
+                section_evidence_map=section_evidence_map,
+            )
+        section, section_catalog = prepared
+        evidence_catalog.update(section_catalog)
+        if section:
+            # 중복 문장 제거가 섹션 dict를 고치므로 스트리밍한 원본과 분리
+            normalized_sections.append(dict(section))
 
     if not normalized_sections:
         return None
@@ -4587,17 +4597,6 @@ def _select_relevant_user_snippets(
     return selected[:target_count]
 
 
-def _infer_accepted_record_type(area: str, source_kind: str) -> str:
-    if source_kind == "comment":
-        return "코멘트"
-    normalized_area = str(area or "").strip()
-    if normalized_area in {"자율활동", "동아리활동", "진로활동"}:
-        return normalized_area
-    if normalized_area:
-        return "세특"
-    return "기타"
-
-
 def _build_excerpt_pairs_for_case(
     *,
     case_snippets: list[Dict[str, Any]],
@@ -4691,7 +4690,9 @@ def _build_excerpt_pairs_for_case(
 def _extract_user_school_record_snippets(
     school_record: Dict[str, Any],
     school_record_context: str,
+    limit: Optional[int] = 60,
 ) -> list[Dict[str, Any]]:
+    """생기부 문단 (세특 → 창체 → 행특 순). limit=None이면 자르지 않음"""
     snippets: list[Dict[str, Any]] = []
     forms = school_record.get("forms") if isinstance(school_record, dict) else {}
     forms = forms if isinstance(forms, dict) else {}
@@ -4767,7 +4768,16 @@ def _extract_user_school_record_snippets(
                 "record_type": "기타",
                 "area": "",
             })
-    return snippets[:60]
+    return snippets if limit is None else snippets[:limit]
+
+
+def _get_accepted_case_snippets(case_id: str, case_data: Dict[str, Any]) -> list[Dict[str, str]]:
+    """사례 원문은 로드 후 바뀌지 않으므로 사례별 스니펫은 1회만 추출"""
+    snippets = _ACCEPTED_CASE_SNIPPETS.get(case_id)
+    if snippets is None:
+        snippets = _extract_accepted_case_snippets(case_id, case_data)
+        _ACCEPTED_CASE_SNIPPETS[case_id] = snippets
+    return snippets
 
 
 def _extract_accepted_case_snippets(case_id: str, case_data: Dict[str, Any]) -> list[Dict[str, str]]:
@@ -4791,7 +4801,7 @@ def _extract_accepted_case_snippets(case_id: str, case_data: Dict[str, Any]) ->
             "label": label or "합격자 활동",
             "text": text,
             "grade": grade,
-            "record_type": _infer_accepted_record_type(area, "activity"),
+            "record_type": infer_accepted_record_type(area, "activity"),
             "area": area,
             "source_kind": "activity",
         })
@@ -4875,29 +4885,28 @@ def _build_accepted_case_candidates(
         len(user_selected_snippets),
     )
 
-    ranked_cases: list[tuple[float, str, Dict[str, Any], list[Dict[str, str]]]] = []
-    for case_id, case_data in HARDCODED_SCHOOL_RECORDS.items():
-        if not isinstance(case_data, dict):
-            continue
-        personal_info = case_data.get("personal_info") or {}
-        snippets = _extract_accepted_case_snippets(case_id, case_data)
-        searchable_text = " ".join(
-            [
-                str(personal_info.get("대상") or ""),
-                str(personal_info.get("주요_특징") or ""),
-                str(personal_info.get("총평") or ""),
-                " ".join(snippet.get("text", "") for snippet in snippets[:12]),
-            ]
+    case_index = get_accepted_case_index()
+    query_vector = None
+    if case_index.has_embeddings:
+        try:
+            query_vector = get_query_embedding_service().embed_academic(query_context)
+        except Exception as error:
+            print(f"⚠️ [deep_chat] 합격 사례 쿼리 임베딩 실패(키워드 점수만 사용): {error}")
+    selected_cases = [
+        (case_score, case_id, case_data, _get_accepted_case_snippets(case_id, case_data))
+        for case_score, case_id, case_data in case_index.select(
+            query_tokens=query_tokens,
+            focus_terms=focus_terms,
+            query_vector=query_vector,
+            record_types={
+                record_type
+                for scope in record_scope
+                for record_type in ACCEPTED_CASE_RECORD_TYPES
+                if _normalize_record_scope_match(scope, record_type)
+            },
+            limit=max(ACCEPTED_CASE_MAX_CANDIDATES * 2, 6),
         )
-        case_score = _score_text_overlap(query_tokens, searchable_text)
-        if focus_terms:
-            case_score += _score_text_overlap(focus_terms, searchable_text) * 0.5
-        if case_score <= 0:
-            continue
-        ranked_cases.append((case_score, case_id, case_data, snippets))
-
-    ranked_cases.sort(key=lambda item: item[0], reverse=True)
-    selected_cases = ranked_cases[: max(ACCEPTED_CASE_MAX_CANDIDATES * 2, 6)]
+    ]
     candidates: list[Dict[str, Any]] = []
 
     def _process_one_case(entry):
@@ -4948,15 +4957,14 @@ def _build_accepted_case_candidates(
             ),
         }
 
-    with ThreadPoolExecutor(max_workers=min(len(selected_cases), 4)) as executor:
-        futures = {executor.submit(_process_one_case, entry): entry for entry in selected_cases}
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                if result is not None:
-                    candidates.append(result)
-            except Exception:
-                pass
+    # 발췌 매칭은 CPU 작업이라 스레드로 나눠도 빨라지지 않음 (리포트 그래프의 작업 안에서 실행)
+    for entry in selected_cases:
+        try:
+            result = _process_one_case(entry)
+        except Exception:
+            continue
+        if result is not None:
+            candidates.append(result)
 
     candidates.sort(key=lambda item: float(item.get("_candidate_score", 0.0) or 0.0), reverse=True)
     return candidates[:ACCEPTED_CASE_MAX_CANDIDATES]
@@ -5160,9 +5168,28 @@ def _extract_section_evidence(
     answer_plan: Optional[Dict[str, Any]],
     section_outline: list[Dict[str, str]],
     sources_text: str,
+    section_passages: Optional[Dict[str, list[Dict[str, Any]]]] = None,
 ) -> Dict[str, Dict[str, Any]]:
+    """
+    section_passages(섹션별 후보 문단)가 있으면 생기부 전체 대신 후보 문단만 프롬프트에 넣고
+    섹션마다 어떤 문단을 우선 볼지 함께 알려줌.
+    """
     task_label = _get_generation_task_label(answer_plan)
     task_text = _get_generation_task_text(user_message, answer_plan)
+    if section_passages and any(section_passages.values()):
+        school_record_block = "\n\n".join(
+            [
+                format_passages(union_passages(section_passages.values())),
+                "[섹션별 우선 문단]",
+                "\n".join(
+                    f"- {section['section_id']}: "
+                    + (", ".join(p["passage_id"] for p in section_passages.get(section["section_id"]) or []) or "(전체 문단)")
+                    for section in section_outline
+                ),
+            ]
+        )
+    else:
+        school_record_block = _truncate_text(school_record_context, SCHOOL_RECORD_EVIDENCE_MAX_CHARS)
     prompt = "\n\n".join(
         [
             f"[{task_label}]",
@@ -5172,7 +5199,7 @@ def _extract_section_evidence(
             "[섹션 목록]",
             "\n".join(f"- {section['section_id']}: {section['title']}" for section in section_outline),
             "[학교생활기록부 컨텍스트]",
-            _truncate_text(school_record_context, SCHOOL_RECORD_EVIDENCE_MAX_CHARS),
+            school_record_block,
             "[참고자료 후보]",
             sources_text,
             (
@@ -5251,12 +5278,17 @@ def _write_section_report(
 
     task_label = _get_generation_task_label(answer_plan)
     task_text = _get_generation_task_text(user_message, answer_plan)
-    prompt = "\n\n".join(
+    # 섹션 작성 호출들이 공유하는 접두 (리포트 1건 동안 캐시)
+    shared_prompt = "\n\n".join(
         [
             f"[{task_label}]",
             task_text,
             "[답변 설계]",
             _format_answer_plan(answer_plan) or "(설계 정보 없음)",
+        ]
+    )
+    prompt = "\n\n".join(
+        [
             f"[작성할 섹션]\n{section.get('section_id')}: {section.get('title')}",
             "[생기부 핵심 근거]",
             school_evidence_text,
@@ -5281,6 +5313,8 @@ def _write_section_report(
         user_prompt=prompt,
         model_name=REPORT_WRITER_MODEL,
         max_output_tokens=REPORT_SECTION_MAX_OUTPUT_TOKENS,
+        shared_prompt=shared_prompt,
+        cache_ttl_seconds=REPORT_PROMPT_CACHE_TTL_SECONDS,
     )
     if not isinstance(raw_section, dict):
         return None
@@ -5296,6 +5330,7 @@ def _review_structured_report(
     answer_plan: Optional[Dict[str, Any]],
     school_record_context: str,
     source_lookup: Dict[str, Dict[str, Any]],
+    school_record_passages: Optional[list[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     task_label = _get_generation_task_label(answer_plan)
     task_text = _get_generation_task_text(user_message, answer_plan)
@@ -5306,7 +5341,11 @@ def _review_structured_report(
             "[답변 설계]",
             _format_answer_plan(answer_plan) or "(설계 정보 없음)",
             "[학교생활기록부 컨텍스트 요약]",
-            _truncate_text(school_record_context, 9000),
+            (
+                format_passages(school_record_passages)
+                if school_record_passages
+                else _truncate_text(school_record_context, 9000)
+            ),
             "[참고자료 목록]",
             _format_source_subset(source_lookup, list(source_lookup.keys())),
             "[현재 리포트(JSON)]",
@@ -5330,7 +5369,55 @@ def _review_structured_report(
     return reviewed if isinstance(reviewed, dict) else raw_report
 
 
-def _build_structured_report(
+STRUCTURED_REPORT_TASK = "final_report"
+
+
+def _dict_task_result(results: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+    value = results.get(name)
+    return value if isinstance(value, dict) else None
+
+
+def _build_evidence_passage_store(
+    school_record: Dict[str, Any],
+    school_record_context: str,
+) -> EvidencePassageStore:
+    """
+    파싱된 생기부 문단(학년 × 영역 × 과목)만 사용. 파싱 결과가 없으면 빈 저장소 → 기존 컨텍스트 사용
+    세특이 앞에 오므로 개수 제한 없이 추출 (과목이 많아도 창체/행특 문단이 선택 전에 잘리지 않도록)
+    """
+    return EvidencePassageStore(
+        snippet
+        for snippet in _extract_user_school_record_snippets(school_record, school_record_context, limit=None)
+        if snippet.get("record_type") != "기타"
+    )
+
+
+def _get_cached_evidence_passage_store(
+    record_context: Optional[SchoolRecordContext],
+) -> Optional[EvidencePassageStore]:
+    """생기부 버전(유저별 캐시 항목)당 저장소 1개 → 문단 임베딩도 1회"""
+    if record_context is None:
+        return None
+    return record_context.derive(
+        "evidence_store",
+        lambda: _build_evidence_passage_store(
+            record_context.school_record, record_context.report_context_text
+        ),
+    )
+
+
+def _build_section_passage_queries(
+    section_outline: list[Dict[str, str]],
+    answer_plan: Optional[Dict[str, Any]],
+) -> Dict[str, str]:
+    focus = " ".join(_normalize_str_list((answer_plan or {}).get("school_record_focus"), 4))
+    return {
+        section["section_id"]: f"{section['title']} {focus}".strip()
+        for section in section_outline
+    }
+
+
+def _build_structured_report_graph(
     *,
     user_message: str,
     school_record: Dict[str, Any],
@@ -5341,23 +5428,60 @@ def _build_structured_report(
     user_grade_summary: Optional[Dict[str, Any]] = None,
     matching_summary: str = "",
     on_section_completed: Optional[Callable[[Dict[str, Any], int, int], None]] = None,
-) -> Optional[Dict[str, Any]]:
+    on_report_patch: Optional[Callable[[Dict[str, Any]], None]] = None,
+    evidence_store: Optional[EvidencePassageStore] = None,
+) -> TaskGraph:
+    """
+    구조화 리포트 생성 작업 그래프 (최종 리포트는 STRUCTURED_REPORT_TASK 결과, 실패 시 None).
+    섹션 초안은 근거 추출 직후 병렬로, 학생 프로필/합격자 비교는 섹션과 동시에 시작하고
+    요약/추천/3페이지 리포트는 각자 필요한 결과가 준비되는 대로 실행.
+
+    섹션은 작성 + 섹션별 정규화(통합 문단)가 끝나는 즉시 on_section_completed로 내보내고,
+    검토/중복 제거로 바뀐 섹션, 합격자 비교 섹션, 요약은 on_report_patch로 내보냄.
+
+    근거 추출/검토 프롬프트에는 생기부 전체 대신 섹션별 상위 문단(evidence_store, 토큰 예산)만 넣음.
+    evidence_store를 넘기지 않으면 이번 생성용으로 새로 만듦 (문단 임베딩 재사용 불가).
+    """
     sources_text, source_lookup = _prepare_report_sources(sources_meta)
     section_outline = _build_section_outline(answer_plan)
-    section_evidence_map = _extract_section_evidence(
-        user_message=user_message,
-        school_record_context=school_record_context,
-        answer_plan=answer_plan,
-        section_outline=section_outline,
-        sources_text=sources_text,
+    total_sections = len(section_outline)
+    section_order = [section["section_id"] for section in section_outline]
+    fixed_mode = _is_fixed_report_mode(answer_plan)
+    if evidence_store is None:
+        evidence_store = _build_evidence_passage_store(school_record, school_record_context)
+    passage_queries = _build_section_passage_queries(section_outline, answer_plan)
+    graph = TaskGraph(label="deep_chat")
+
+    def _emit_patch(op: str, **fields: Any) -> None:
+        if on_report_patch:
+            on_report_patch(_build_report_patch_event(op, **fields))
+
+    graph.add(
+        "evidence_passages",
+        lambda results: evidence_store.select_for_queries(
+            passage_queries,
+            total_token_budget=EVIDENCE_PROMPT_TOKEN_BUDGET,
+        ),
+        priority=PRIORITY_RETRIEVAL,
+        resource=RESOURCE_RETRIEVAL,
+    )
+    graph.add(
+        "section_evidence",
+        lambda results: _extract_section_evidence(
+            user_message=user_message,
+            school_record_context=school_record_context,
+            answer_plan=answer_plan,
+            section_outline=section_outline,
+            sources_text=sources_text,
+            section_passages=results.get("evidence_passages"),
+        ),
+        deps=["evidence_passages"],
+        priority=PRIORITY_SECTION,
     )
 
-    indexed_sections = list(enumerate(section_outline))
-    max_workers = min(REPORT_SECTION_MAX_WORKERS, len(indexed_sections))
-    raw_sections_by_index: Dict[int, Dict[str, Any]] = {}
-
-    if max_workers <= 1:
-        for section_index, section in indexed_sections:
+    def _section_task(section_index: int, section: Dict[str, str]):
+        def run(results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            section_evidence_map = results.get("section_evidence") or {}
             section_result = _write_section_report(
                 user_message=user_message,
                 answer_plan=answer_plan,
@@ -5365,222 +5489,264 @@ def _build_structured_report(
                 section_evidence=section_evidence_map.get(section["section_id"], {}),
                 source_lookup=source_lookup,
             )
-            if section_result:
-                raw_sections_by_index[section_index] = section_result
-                if on_section_completed:
-                    on_section_completed(
-                        _build_section_stream_payload(
-                            section_result=section_result,
-                            section_index=section_index,
-                            total_sections=len(indexed_sections),
-                        ),
-                        section_index,
-                        len(indexed_sections),
-                    )
-    else:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_map = {
-                executor.submit(
-                    _write_section_report,
-                    user_message=user_message,
-                    answer_plan=answer_plan,
-                    section=section,
-                    section_evidence=section_evidence_map.get(section["section_id"], {}),
-                    source_lookup=source_lookup,
-                ): section_index
-                for section_index, section in indexed_sections
-            }
-            for future in as_completed(future_map):
-                section_index = future_map[future]
-                try:
-                    section_result = future.result()
-                except Exception as e:
-                    print(f"⚠️ [deep_chat] 섹션 작성 실패(section-{section_index + 1}): {e}")
-                    continue
-                if section_result:
-                    raw_sections_by_index[section_index] = section_result
-                    if on_section_completed:
-                        on_section_completed(
-                            _build_section_stream_payload(
-                                section_result=section_result,
-                                section_index=section_index,
-                                total_sections=len(indexed_sections),
-                            ),
-                            section_index,
-                            len(indexed_sections),
-                        )
+            if not section_result:
+                return None
+            prepared = _normalize_report_section(
+                section_result,
+                section_index + 1,
+                answer_plan=answer_plan,
+                source_lookup=source_lookup,
+                section_evidence_map=section_evidence_map,
+            )
+            if on_section_completed:
+                on_section_completed(
+                    _build_section_stream_payload(
+                        section_result=section_result,
+                        section_index=section_index,
+                        total_sections=total_sections,
+                        report_section=prepared[0],
+                        evidence_catalog=prepared[1],
+                        section_order=section_order,
+                    ),
+                    section_index,
+                    total_sections,
+                )
+            return {"raw": section_result, "section_idx": section_index + 1, "prepared": prepared}
 
-    raw_sections = [
-        raw_sections_by_index[idx]
-        for idx in sorted(raw_sections_by_index.keys())
-    ]
+        return run
 
-    if not raw_sections:
-        return None
+    section_tasks = [
+        graph.add(
+            f"section-{section_index + 1}",
+            _section_task(section_index, section),
+            deps=["section_evidence"],
+            priority=PRIORITY_SECTION,
+        )
+        for section_index, section in enumerate(section_outline)
+    ]
 
-    initial_report = {
-        "report_title": _get_report_title(answer_plan),
-        "summary": "",
-        "sections": raw_sections,
-    }
-    raw_report = (
-        initial_report
-        if _is_fixed_report_mode(answer_plan)
-        else _review_structured_report(
-            raw_report=initial_report,
-            user_message=user_message,
+    def _review_report(results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        section_outputs = [results[name] for name in section_tasks if results.get(name)]
+        if not section_outputs:
+            return None
+        raw_sections = [output["raw"] for output in section_outputs]
+        prepared_sections = {
+            _report_section_fingerprint(output["raw"], output["section_idx"]): output["prepared"]
+            for output in section_outputs
+        }
+        initial_report = {
+            "report_title": _get_report_title(answer_plan),
+            "summary": "",
+            "sections": raw_sections,
+        }
+        raw_report = (
+            initial_report
+            if fixed_mode
+            else _review_structured_report(
+                raw_report=initial_report,
+                user_message=user_message,
+                answer_plan=answer_plan,
+                school_record_context=school_record_context,
+                source_lookup=source_lookup,
+                school_record_passages=union_passages(
+                    evidence_store.select_for_queries(
+                        passage_queries,
+                        total_token_budget=REVIEW_PASSAGE_TOKEN_BUDGET,
+                    ).values()
+                ),
+            )
+        )
+        report = _normalize_structured_report(
+            raw_report,
             answer_plan=answer_plan,
-            school_record_context=school_record_context,
             source_lookup=source_lookup,
+            section_evidence_map=results.get("section_evidence") or {},
+            prepared_sections=prepared_sections,
         )
-    )
-    report = _normalize_structured_report(
-        raw_report,
-        answer_plan=answer_plan,
-        source_lookup=source_lookup,
-        section_evidence_map=section_evidence_map,
-    )
-    if not report:
-        return None
+        if not report:
+            return None
 
-    student_profile = None
-    comparison_section = None
-    if _is_fixed_report_mode(answer_plan):
-        with ThreadPoolExecutor(max_workers=REPORT_POST_PROCESS_MAX_WORKERS) as executor:
-            future_map = {
-                executor.submit(
-                    _build_student_profile_summary,
-                    school_record_context=school_record_context,
-                    answer_plan=answer_plan,
-                ): "student_profile",
-                executor.submit(
-                    _build_accepted_case_comparison_section,
-                    user_message=user_message,
-                    school_record=school_record,
-                    school_record_context=school_record_context,
-                    answer_plan=answer_plan,
-                ): "comparison_section",
-            }
-            for future in as_completed(future_map):
-                task_name = future_map[future]
-                try:
-                    result = future.result()
-                except Exception as error:
-                    print(f"⚠️ [deep_chat] 후처리 병렬 작업 실패({task_name}): {error}")
-                    result = None
-                if task_name == "student_profile":
-                    student_profile = result if isinstance(result, dict) else None
-                elif task_name == "comparison_section":
-                    comparison_section = result if isinstance(result, dict) else None
-
-        if student_profile:
-            report["student_profile"] = student_profile
-        if isinstance(user_grade_summary, dict) and user_grade_summary:
-            report["grade_summary"] = user_grade_summary
-    else:
+        # 스트리밍한 초안과 달라진 섹션(검토 수정, 중복 문장 제거)만 패치로 전달
+        streamed = {
+            section["section_id"]: section
+            for section, _ in prepared_sections.values()
+            if section
+        }
+        final_order = [section["section_id"] for section in report["sections"]]
+        for section in report["sections"]:
+            if streamed.get(section["section_id"]) != section:
+                _emit_patch(
+                    "upsert_section",
+                    section=section,
+                    evidence=_section_evidence_entries(section, report["evidence_catalog"]),
+                    order=final_order,
+                )
+        for section_id in streamed:
+            if section_id not in final_order:
+                _emit_patch("remove_section", section_id=section_id)
+        return report
+
+    graph.add(
+        "report",
+        _review_report,
+        deps=["section_evidence", *section_tasks],
+        priority=PRIORITY_REVIEW,
+        resource=None if fixed_mode else RESOURCE_LLM,
+    )
+    def _comparison_section(results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         comparison_section = _build_accepted_case_comparison_section(
             user_message=user_message,
             school_record=school_record,
             school_record_context=school_record_context,
             answer_plan=answer_plan,
         )
-    if comparison_section:
-        report["sections"].append(comparison_section)
-    if _is_fixed_report_mode(answer_plan):
-        three_page_report = None
-        final_summary = ""
-        university_recommendations = None
-        university_profiles: list[Dict[str, Any]] = []
-        direct_answer = None
-        with ThreadPoolExecutor(max_workers=REPORT_POST_PROCESS_MAX_WORKERS + 1) as executor:
-            three_page_future = executor.submit(
-                _build_three_page_report,
-                report=report,
+        if isinstance(comparison_section, dict):
+            # 마지막 섹션 (order 없이 추가)
+            _emit_patch("upsert_section", section=comparison_section, evidence={})
+        return comparison_section
+
+    graph.add("comparison_section", _comparison_section)
+    if fixed_mode:
+        graph.add(
+            "student_profile",
+            lambda results: _build_student_profile_summary(
+                school_record_context=school_record_context,
+                answer_plan=answer_plan,
+            ),
+        )
+
+    def _assemble_report(results: Dict[str, Any]) -> Dict[str, Any]:
+        report = results["report"]
+        if fixed_mode:
+            student_profile = _dict_task_result(results, "student_profile")
+            if student_profile:
+                report["student_profile"] = student_profile
+            if isinstance(user_grade_summary, dict) and user_grade_summary:
+                report["grade_summary"] = user_grade_summary
+        comparison_section = _dict_task_result(results, "comparison_section")
+        if comparison_section:
+            report["sections"].append(comparison_section)
+        return report
+
+    graph.add(
+        "assembled_report",
+        _assemble_report,
+        deps=["comparison_section", *(["student_profile"] if fixed_mode else [])],
+        requires=["report"],
+        resource=None,
+    )
+
+    if fixed_mode:
+        graph.add(
+            "flowchart",
+            lambda results: _build_three_page_flowchart(
                 school_record=school_record,
                 school_record_context=school_record_context,
-                student_profile=student_profile,
+                student_profile=_dict_task_result(results, "student_profile"),
+            ),
+            deps=["student_profile"],
+        )
+        graph.add(
+            "three_page_report",
+            lambda results: _build_three_page_report(
+                report=results["assembled_report"],
+                school_record=school_record,
+                school_record_context=school_record_context,
+                student_profile=_dict_task_result(results, "student_profile"),
                 user_metadata=user_metadata,
                 user_grade_summary=user_grade_summary,
-            )
-            final_summary_future = executor.submit(
-                _build_final_report_summary,
-                user_message=user_message,
-                school_record_context=school_record_context,
-                answer_plan=answer_plan,
-                report=report,
-            )
-            uni_rec_future = executor.submit(
-                _build_university_recommendation_summary,
+                flowchart=_dict_task_result(results, "flowchart"),
+            ),
+            deps=["flowchart"],
+            requires=["assembled_report"],
+            resource=None,
+        )
+        graph.add(
+            "university_recommendations",
+            lambda results: _build_university_recommendation_summary(
                 school_record=school_record,
                 school_record_context=school_record_context,
                 answer_plan=answer_plan,
-                student_profile=student_profile,
+                student_profile=_dict_task_result(results, "student_profile"),
                 user_grade_summary=user_grade_summary,
                 matching_summary=matching_summary,
-            )
+            ),
+            deps=["student_profile"],
+            resource=RESOURCE_RETRIEVAL,
+        )
 
-            def _direct_answer_after_summary():
-                summary_result = final_summary_future.result()
-                summary_str = str(summary_result or "").strip()
-                report_for_da = {**report, "summary": summary_str}
-                return _build_direct_answer_block(
-                    user_message=user_message,
-                    school_record_context=school_record_context,
-                    answer_plan=answer_plan,
-                    report=report_for_da,
-                )
+    def _final_summary(results: Dict[str, Any]) -> str:
+        final_summary = str(
+            _build_final_report_summary(
+                user_message=user_message,
+                school_record_context=school_record_context,
+                answer_plan=answer_plan,
+                report=results["assembled_report"],
+            )
+            or ""
+        ).strip()
+        if final_summary:
+            _emit_patch("set", field="summary", value=final_summary)
+        return final_summary
 
-            direct_answer_future = executor.submit(_direct_answer_after_summary)
+    graph.add("final_summary", _final_summary, requires=["assembled_report"])
 
-            for future, task_name in [
-                (three_page_future, "three_page_report"),
-                (final_summary_future, "final_summary"),
-                (uni_rec_future, "university_recommendations"),
-                (direct_answer_future, "direct_answer"),
-            ]:
-                try:
-                    result = future.result()
-                except Exception as error:
-                    print(f"⚠️ [deep_chat] 후처리 병렬 작업 실패({task_name}): {error}")
-                    result = None
-                if task_name == "three_page_report":
-                    three_page_report = result if isinstance(result, dict) else None
-                elif task_name == "final_summary":
-                    final_summary = str(result or "").strip()
-                elif task_name == "university_recommendations":
-                    if isinstance(result, tuple) and len(result) == 2:
-                        university_recommendations, university_profiles = result
-                elif task_name == "direct_answer":
-                    direct_answer = result if isinstance(result, dict) else None
-        if university_profiles:
-            report["university_profiles"] = university_profiles
-        if university_recommendations:
-            report["university_recommendations"] = university_recommendations
-        if three_page_report:
-            report["three_page_report"] = three_page_report
-        if final_summary:
-            report["summary"] = final_summary
-        if direct_answer:
-            report["direct_answer"] = direct_answer
-    else:
-        final_summary = _build_final_report_summary(
+    def _direct_answer(results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        report = results["assembled_report"]
+        summary_str = str(results.get("final_summary") or "").strip()
+        if fixed_mode or summary_str:
+            report = {**report, "summary": summary_str}
+        direct_answer = _build_direct_answer_block(
             user_message=user_message,
             school_record_context=school_record_context,
             answer_plan=answer_plan,
             report=report,
         )
+        if isinstance(direct_answer, dict) and direct_answer:
+            _emit_patch("set", field="direct_answer", value=direct_answer)
+        return direct_answer
+
+    graph.add(
+        "direct_answer",
+        _direct_answer,
+        deps=["final_summary"],
+        requires=["assembled_report"],
+    )
+
+    def _finalize_report(results: Dict[str, Any]) -> Dict[str, Any]:
+        report = results["assembled_report"]
+        if fixed_mode:
+            recommendation_result = results.get("university_recommendations")
+            if isinstance(recommendation_result, tuple) and len(recommendation_result) == 2:
+                university_recommendations, university_profiles = recommendation_result
+                if university_profiles:
+                    report["university_profiles"] = university_profiles
+                if university_recommendations:
+                    report["university_recommendations"] = university_recommendations
+            three_page_report = _dict_task_result(results, "three_page_report")
+            if three_page_report:
+                report["three_page_report"] = three_page_report
+        final_summary = str(results.get("final_summary") or "").strip()
         if final_summary:
             report["summary"] = final_summary
-        direct_answer = _build_direct_answer_block(
-            user_message=user_message,
-            school_record_context=school_record_context,
-            answer_plan=answer_plan,
-            report=report,
-        )
+        direct_answer = _dict_task_result(results, "direct_answer")
         if direct_answer:
             report["direct_answer"] = direct_answer
-    report["plain_text"] = _build_plain_text_from_report(report)
-    return report
+        report["plain_text"] = _build_plain_text_from_report(report)
+        return report
+
+    graph.add(
+        STRUCTURED_REPORT_TASK,
+        _finalize_report,
+        deps=[
+            "final_summary",
+            "direct_answer",
+            *(["three_page_report", "university_recommendations"] if fixed_mode else []),
+        ],
+        requires=["assembled_report"],
+        resource=None,
+    )
+    return graph
 
 
 def _retrieve_academic_rag_rows(
@@ -5706,6 +5872,7 @@ def _prepare_deep_chat_generation_context(
     history: List[Dict[str, str]],
     school_record: Dict[str, Any],
     school_record_context: str,
+    school_snapshot: Optional[str] = None,
 ) -> Dict[str, Any]:
     initial_final_rows, initial_selected_rows = _retrieve_reference_rag_rows(
         message,
@@ -5719,6 +5886,7 @@ def _prepare_deep_chat_generation_context(
         school_record=school_record,
         school_record_context=school_record_context,
         initial_sources_meta=initial_sources_meta,
+        school_snapshot=school_snapshot,
     )
 
     refined_query = (
@@ -5772,9 +5940,9 @@ async def generate_deep_chat_report(
         )
 
     user_id = user["user_id"]
-    school_record = await supabase_service.get_user_profile_school_record(user_id)
-    school_record_dict = dict(school_record or {})
-    school_record_context = build_school_record_report_context_text(school_record_dict)
+    record_context = await get_school_record_context_cache().get(user_id)
+    school_record_dict = dict(record_context.school_record) if record_context else {}
+    school_record_context = record_context.report_context_text if record_context else ""
 
     if not school_record_context or len(school_record_context.strip()) < 30:
         raise HTTPException(
@@ -5803,7 +5971,7 @@ async def generate_deep_chat_report(
         str(request.message or "").strip(),
         generation_context["answer_plan"],
     )
-    structured_report = _build_structured_report(
+    report_results = await _build_structured_report_graph(
         user_message=report_brief,
         school_record=school_record_dict,
         school_record_context=school_record_context,
@@ -5812,7 +5980,9 @@ async def generate_deep_chat_report(
         user_metadata=user_metadata,
         user_grade_summary=user_grade_summary,
         matching_summary=matching_summary,
-    )
+        evidence_store=_get_cached_evidence_passage_store(record_context),
+    ).run_async()
+    structured_report = report_results.get(STRUCTURED_REPORT_TASK)
     if not structured_report:
         raise HTTPException(
             status_code=500,
@@ -5830,8 +6000,12 @@ def generate_deep_school_record_stream(
     history: List[Dict[str, str]],
     school_record: Dict[str, Any],
     school_record_context: str,
+    record_context: Optional[SchoolRecordContext] = None,
 ):
-    """기존 채팅 라우터에서도 재사용할 수 있는 생기부 심층 분석 이벤트 generator."""
+    """
+    기존 채팅 라우터에서도 재사용할 수 있는 생기부 심층 분석 이벤트 generator.
+    record_context(유저별 캐시 항목)를 넘기면 계획용 스냅샷을 캐시에 보관해 다음 턴에 재사용.
+    """
     def generate():
         start = time.time()
         full_response = ""
@@ -5841,11 +6015,21 @@ def generate_deep_school_record_stream(
                 "step": "school_record_plan_start",
                 "message": "질문을 구조화하고 있습니다.",
             }
+            evidence_store = _get_cached_evidence_passage_store(record_context)
+            school_snapshot = None
+            if record_context is not None:
+                school_snapshot = record_context.derive(
+                    "planning_snapshot",
+                    lambda: _build_planning_school_record_snapshot(
+                        record_context.school_record, record_context.report_context_text
+                    ),
+                )
             generation_context = _prepare_deep_chat_generation_context(
                 message=message,
                 history=history,
                 school_record=school_record,
                 school_record_context=school_record_context,
+                school_snapshot=school_snapshot,
             )
             answer_plan = generation_context["answer_plan"]
             sources_meta = generation_context["sources_meta"]
@@ -5879,7 +6063,7 @@ def generate_deep_school_record_stream(
                     },
                 }
 
-            progress_queue: Queue[Dict[str, Any]] = Queue()
+            progress_queue: Queue[Optional[Dict[str, Any]]] = Queue()
 
             def _on_section_completed(
                 section_event: Dict[str, Any],
@@ -5900,33 +6084,31 @@ def generate_deep_school_record_stream(
                     }
                 )
 
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(
-                    _build_structured_report,
-                    user_message=message,
-                    school_record=school_record,
-                    school_record_context=school_record_context,
-                    answer_plan=answer_plan,
-                    sources_meta=sources_meta,
-                    on_section_completed=_on_section_completed,
-                )
-
+            # 섹션 완료 이벤트는 작업 스레드에서 큐로 바로 넣고, 그래프가 끝나면 None으로 종료 알림
+            report_run = _build_structured_report_graph(
+                user_message=message,
+                school_record=school_record,
+                school_record_context=school_record_context,
+                answer_plan=answer_plan,
+                sources_meta=sources_meta,
+                on_section_completed=_on_section_completed,
+                on_report_patch=progress_queue.put,
+                evidence_store=evidence_store,
+            ).start()
+            report_run.add_done_callback(lambda _: progress_queue.put(None))
+            try:
                 while True:
-                    try:
-                        yield progress_queue.get(timeout=0.1)
-                    except Empty:
-                        pass
-
-                    if future.done():
-                        break
-
-                while not progress_queue.empty():
-                    try:
-                        yield progress_queue.get_nowait()
-                    except Empty:
+                    event = progress_queue.get()
+                    if event is None:
                         break
-
-                structured_report = future.result()
+                    yield event
+                structured_report = report_run.result().get(STRUCTURED_REPORT_TASK)
+            finally:
+                # 클라이언트가 스트림을 닫으면 아직 시작하지 않은 작업은 취소
+                report_run.cancel()
+            if not structured_report and section_outline:
+                # 먼저 보낸 섹션 초안은 버리고 아래 일반 답변 스트리밍으로 대체
+                yield _build_report_patch_event("discard")
             if structured_report:
                 yield {
                     "type": "status",
@@ -5990,10 +6172,8 @@ async def deep_chat_stream(
 
     user_id = user["user_id"]
 
-    school_record = await supabase_service.get_user_profile_school_record(user_id)
-    school_record_context = build_school_record_report_context_text(
-        dict(school_record or {})
-    )
+    record_context = await get_school_record_context_cache().get(user_id)
+    school_record_context = record_context.report_context_text if record_context else ""
 
     if not school_record_context or len(school_record_context.strip()) < 30:
         raise HTTPException(
@@ -6001,13 +6181,14 @@ async def deep_chat_stream(
             detail="연동된 생기부 데이터가 없습니다. 먼저 생기부를 연동해 주세요.",
         )
 
-    school_record_dict = dict(school_record or {})
+    school_record_dict = dict(record_context.school_record)
     def generate_sse():
         for event in generate_deep_school_record_stream(
             message=request.message,
             history=request.history,
             school_record=school_record_dict,
             school_record_context=school_record_context,
+            record_context=record_context,
         ):
             yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
 
@@ -6,9 +6,10 @@ import time
 import tempfile
 import os
 from io import BytesIO
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, File, UploadFile, Form, HTTPException
+from fastapi import APIRouter, File, UploadFile, Form, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 try:
     from PyPDF2 import PdfReader
@@ -17,9 +18,43 @@ except ImportError:
     HAS_PYPDF2 = False
 
 from services.pdf_processor import process_pdf, upload_to_supabase_with_file
+from services.ingest_jobs import TERMINAL_STATUSES, get_ingest_queue
+from utils.sse import encode_sse_frame
 
 router = APIRouter()
 
+MAX_UPLOAD_SIZE = 50 * 1024 * 1024  # 50MB
+
+
+async def _read_pdf_upload(file: UploadFile) -> bytes:
+    """PDF 파일 타입/크기 검증 후 바이트 반환"""
+    # 파일 타입 검증
+    if not file.content_type == "application/pdf":
+        raise HTTPException(400, "PDF 파일만 업로드 가능합니다.")
+
+    # 파일 크기 검증
+    file_bytes = await file.read()
+    if len(file_bytes) > MAX_UPLOAD_SIZE:
+        raise HTTPException(400, "파일 크기는 50MB 이하여야 합니다.")
+    return file_bytes
+
+
+def _normalize_school_name(school_name: Optional[str]) -> str:
+    """학교명 검증 및 정규화"""
+    if not school_name or not school_name.strip():
+        raise HTTPException(400, "학교명을 입력해주세요. (예: 연세대학교, 고려대학교)")
+
+    safe_school_name = school_name.strip()
+
+    # 학교명이 너무 짧으면 경고
+    if len(safe_school_name) < 2:
+        raise HTTPException(400, "학교명이 너무 짧습니다. (최소 2글자)")
+
+    # 학교명이 너무 길면 경고
+    if len(safe_school_name) > 50:
+        raise HTTPException(400, "학교명이 너무 깁니다. (최대 50글자)")
+    return safe_school_name
+
 
 @router.post("/")
 async def upload_document(
@@ -37,29 +72,8 @@ async def upload_document(
     print(f"{'=' * 60}\n")
     
     try:
-        # 파일 타입 검증
-        if not file.content_type == "application/pdf":
-            raise HTTPException(400, "PDF 파일만 업로드 가능합니다.")
-        
-        # 파일 크기 검증
-        MAX_SIZE = 50 * 1024 * 1024  # 50MB
-        file_bytes = await file.read()
-        if len(file_bytes) > MAX_SIZE:
-            raise HTTPException(400, "파일 크기는 50MB 이하여야 합니다.")
-        
-        # 학교명 검증 및 정규화
-        if not school_name or not school_name.strip():
-            raise HTTPException(400, "학교명을 입력해주세요. (예: 연세대학교, 고려대학교)")
-        
-        safe_school_name = school_name.strip()
-        
-        # 학교명이 너무 짧으면 경고
-        if len(safe_school_name) < 2:
-            raise HTTPException(400, "학교명이 너무 짧습니다. (최소 2글자)")
-        
-        # 학교명이 너무 길면 경고
-        if len(safe_school_name) > 50:
-            raise HTTPException(400, "학교명이 너무 깁니다. (최대 50글자)")
+        file_bytes = await _read_pdf_upload(file)
+        safe_school_name = _normalize_school_name(school_name)
 
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
             tmp_file.write(file_bytes)
@@ -139,3 +153,98 @@ async def upload_document(
         traceback.print_exc()
         raise HTTPException(500, msg)
 
+
+# ============================================================
+# 백그라운드 수집 작업 (HTTP 연결을 붙잡지 않음)
+# ============================================================
+
+JOB_EVENTS_POLL_SECONDS = 1.0
+
+
+@router.post("/jobs")
+async def create_upload_jobs(
+    files: List[UploadFile] = File(...),
+    school_name: Optional[str] = Form(None)
+):
+    """
+    PDF(여러 개 가능)를 백그라운드 수집 작업으로 등록하고 즉시 반환.
+    진행 상황은 GET /jobs/{job_id} (폴링) 또는 GET /jobs/{job_id}/events (SSE)로 확인.
+    """
+    safe_school_name = _normalize_school_name(school_name)
+    if not files:
+        raise HTTPException(400, "업로드할 파일이 없습니다.")
+
+    uploads = []
+    for file in files:
+        uploads.append((file.filename, await _read_pdf_upload(file)))
+
+    queue = await asyncio.to_thread(get_ingest_queue)
+    jobs = []
+    for filename, file_bytes in uploads:
+        job = await asyncio.to_thread(queue.submit, safe_school_name, filename, file_bytes)
+        jobs.append(job)
+
+    print(f"📥 수집 작업 등록: {safe_school_name} - {len(jobs)}개 파일")
+    return {"success": True, "jobs": jobs}
+
+
+@router.get("/jobs")
+async def list_upload_jobs(
+    school_name: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500)
+):
+    """수집 작업 목록 (최신순)"""
+    queue = await asyncio.to_thread(get_ingest_queue)
+    jobs = await asyncio.to_thread(queue.store.list_jobs, school_name, status, limit)
+    return {"success": True, "jobs": jobs}
+
+
+@router.get("/jobs/{job_id}")
+async def get_upload_job(job_id: str):
+    """수집 작업 상태 조회 (폴링용)"""
+    queue = await asyncio.to_thread(get_ingest_queue)
+    job = await asyncio.to_thread(queue.store.get_job, job_id)
+    if not job:
+        raise HTTPException(404, "작업을 찾을 수 없습니다.")
+    return {"success": True, "job": job}
+
+
+@router.post("/jobs/{job_id}/retry")
+async def retry_upload_job(job_id: str):
+    """실패한 작업 재시도 (전처리 체크포인트/디스크 캐시가 있으면 이어서 진행)"""
+    queue = await asyncio.to_thread(get_ingest_queue)
+    job = await asyncio.to_thread(queue.retry, job_id)
+    if not job:
+        raise HTTPException(404, "작업을 찾을 수 없습니다.")
+    return {"success": True, "job": job}
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_upload_job_events(job_id: str, after: int = Query(0, ge=0)):
+    """수집 작업 진행 이벤트 SSE 스트림 (after: 마지막으로 받은 이벤트 seq)"""
+    queue = await asyncio.to_thread(get_ingest_queue)
+    store = queue.store
+    if not await asyncio.to_thread(store.get_job, job_id):
+        raise HTTPException(404, "작업을 찾을 수 없습니다.")
+
+    async def event_generator():
+        last_seq = after
+        while True:
+            events = await asyncio.to_thread(store.list_events, job_id, last_seq)
+            for event in events:
+                last_seq = event["seq"]
+                yield encode_sse_frame({"type": "progress", **event})
+            if events:
+                continue
+            job = await asyncio.to_thread(store.get_job, job_id)
+            if not job or job["status"] in TERMINAL_STATUSES:
+                yield encode_sse_frame({"type": "done", "job": job})
+                return
+            await asyncio.sleep(JOB_EVENTS_POLL_SECONDS)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,288 @@
+"""
+합격자 생기부 사례 인덱스 (심층분석 '유사 합격자 비교' 후보 선택용)
+
+사례 원문은 fixtures/hardcoded_school_records.json (데이터 파일)에 두고,
+scripts/build_accepted_case_index.py 가 사례별 파생 필드를 미리 계산해
+fixtures/hardcoded_school_records.index.json 에 저장한다.
+
+- 검색용 텍스트(소문자), 핵심 키워드(TF-IDF 상위), 기록 유형 집합
+- 대학/전공/계열 태그
+- 사례 임베딩 (gemini-embedding-001 768차원, RETRIEVAL_DOCUMENT) — 빌드 시 API 키가 있을 때만
+
+인덱스 파일이 없거나 원문 해시와 다르면 임베딩 없이 파생 필드만 첫 사용 시 1회 계산.
+후보 선택은 임베딩이 있으면 필터(비교할 기록 유형 보유) → 벡터 유사도 상위 사례만 남긴 뒤
+키워드 점수와 합산해 정렬, 없으면 기존 키워드 겹침 점수만으로 정렬.
+"""
+import hashlib
+import json
+import math
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+ACCEPTED_CASES_PATH = FIXTURES_DIR / "hardcoded_school_records.json"
+ACCEPTED_CASE_INDEX_PATH = FIXTURES_DIR / "hardcoded_school_records.index.json"
+
+ACCEPTED_CASE_EMBEDDING_MODEL = "models/gemini-embedding-001"
+ACCEPTED_CASE_EMBEDDING_DIMENSIONS = 768
+ACCEPTED_CASE_KEYWORD_LIMIT = 40
+# 검색용 텍스트에 넣는 활동 원문 수 (기존 후보 선택과 동일)
+ACCEPTED_CASE_SEARCH_SNIPPETS = 12
+# 임베딩 점수 가중치 / 벡터 사전 필터로 남길 사례 수 (limit 배수)
+ACCEPTED_CASE_VECTOR_WEIGHT = 0.6
+ACCEPTED_CASE_VECTOR_PREFILTER_FACTOR = 4
+ACCEPTED_CASE_MIN_SIMILARITY = 0.5
+
+ACTIVITY_RECORD_TYPES = {"자율활동", "동아리활동", "진로활동"}
+_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z가-힣]+")
+_UNIVERSITY_PATTERN = re.compile(r"([가-힣]+대학교)")
+_MAJOR_PATTERN = re.compile(r"([가-힣]+(?:학과|학부|과))(?=\s|$)")
+
+
+def infer_accepted_record_type(area: str, source_kind: str) -> str:
+    if source_kind == "comment":
+        return "코멘트"
+    normalized_area = str(area or "").strip()
+    if normalized_area in ACTIVITY_RECORD_TYPES:
+        return normalized_area
+    if normalized_area:
+        return "세특"
+    return "기타"
+
+
+def _case_texts(case_data: Dict[str, Any]) -> List[str]:
+    """스니펫 순서와 같은 순서(활동 → 코멘트)의 원문 목록"""
+    texts = []
+    for key in ("activities", "comments"):
+        for item in case_data.get(key) or []:
+            if isinstance(item, dict):
+                text = str(item.get("내용") or "").strip()
+                if text:
+                    texts.append(text)
+    return texts
+
+
+def _tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_PATTERN.findall(str(text or "").lower()) if len(token) >= 2]
+
+
+def _case_tags(case_id: str, personal_info: Dict[str, Any]) -> Dict[str, str]:
+    target = str(personal_info.get("대상") or "")
+    university = _UNIVERSITY_PATTERN.search(target)
+    major = _MAJOR_PATTERN.search(_UNIVERSITY_PATTERN.sub(" ", target))
+    track = "natural_science" if "natural_science" in case_id else "humanities" if "humanities" in case_id else ""
+    return {
+        "university": university.group(1) if university else "",
+        "major": major.group(1) if major else "",
+        "track": track,
+    }
+
+
+def build_case_entry(case_id: str, case_data: Dict[str, Any]) -> Dict[str, Any]:
+    """임베딩을 제외한 사례 파생 필드"""
+    personal_info = case_data.get("personal_info") or {}
+    texts = _case_texts(case_data)
+    searchable_text = " ".join(
+        [
+            str(personal_info.get("대상") or ""),
+            str(personal_info.get("주요_특징") or ""),
+            str(personal_info.get("총평") or ""),
+            " ".join(texts[:ACCEPTED_CASE_SEARCH_SNIPPETS]),
+        ]
+    ).lower()
+    record_types = {
+        infer_accepted_record_type(str(item.get("영역") or ""), "activity")
+        for item in case_data.get("activities") or []
+        if isinstance(item, dict) and str(item.get("내용") or "").strip()
+    }
+    if any(isinstance(item, dict) and str(item.get("내용") or "").strip() for item in case_data.get("comments") or []):
+        record_types.add("코멘트")
+    return {
+        "case_id": case_id,
+        "label": str(personal_info.get("대상") or case_id).strip() or case_id,
+        "tags": _case_tags(case_id, personal_info),
+        "record_types": sorted(record_types),
+        "has_snippets": bool(texts),
+        "searchable_text": searchable_text,
+        "term_counts": Counter(_tokenize(" ".join([searchable_text, *texts]))),
+    }
+
+
+def _assign_keywords(entries: List[Dict[str, Any]]) -> None:
+    """사례 간 TF-IDF 상위 토큰을 핵심 키워드로 (공통어 제외)"""
+    document_frequency = Counter()
+    for entry in entries:
+        document_frequency.update(entry["term_counts"].keys())
+    total = max(len(entries), 1)
+    for entry in entries:
+        scored = sorted(
+            entry["term_counts"].items(),
+            key=lambda item: item[1] * math.log((1 + total) / (1 + document_frequency[item[0]])),
+            reverse=True,
+        )
+        entry["keywords"] = [term for term, _ in scored[:ACCEPTED_CASE_KEYWORD_LIMIT]]
+        del entry["term_counts"]
+
+
+def embedding_text_for_case(case_data: Dict[str, Any], entry: Dict[str, Any]) -> str:
+    personal_info = case_data.get("personal_info") or {}
+    return "\n".join(
+        [
+            str(personal_info.get("대상") or ""),
+            str(personal_info.get("주요_특징") or ""),
+            " ".join(entry.get("keywords") or []),
+            " ".join(_case_texts(case_data))[:6000],
+        ]
+    )
+
+
+def source_sha256(path: Path = ACCEPTED_CASES_PATH) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def load_accepted_cases(path: Path = ACCEPTED_CASES_PATH) -> Dict[str, Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_index_entries(cases: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    entries = [
+        build_case_entry(case_id, case_data)
+        for case_id, case_data in cases.items()
+        if isinstance(case_data, dict)
+    ]
+    _assign_keywords(entries)
+    return entries
+
+
+class AcceptedCaseIndex:
+    """사례 원문 + 파생 필드 (로드 후 읽기 전용)"""
+
+    def __init__(self, cases: Dict[str, Dict[str, Any]], entries: List[Dict[str, Any]]):
+        self.cases = cases
+        self.entries = [entry for entry in entries if entry.get("case_id") in cases]
+        self._keywords = {entry["case_id"]: set(entry.get("keywords") or []) for entry in self.entries}
+        # 임베딩이 있는 사례만 정규화된 행렬로 (유사도 = 행렬 × 쿼리 벡터 1회)
+        embedded = [
+            entry for entry in self.entries
+            if len(entry.get("embedding") or []) == ACCEPTED_CASE_EMBEDDING_DIMENSIONS
+        ]
+        self._vector_case_ids = [entry["case_id"] for entry in embedded]
+        self._matrix = None
+        if embedded:
+            matrix = np.asarray([entry["embedding"] for entry in embedded], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._matrix = matrix / np.where(norms == 0, 1.0, norms)
+
+    @property
+    def has_embeddings(self) -> bool:
+        return self._matrix is not None
+
+    def _similarities(self, query_vector: Optional[Sequence[float]]) -> Dict[str, float]:
+        if self._matrix is None or not query_vector or len(query_vector) != self._matrix.shape[1]:
+            return {}
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if not norm:
+            return {}
+        scores = self._matrix @ (query / norm)
+        return dict(zip(self._vector_case_ids, scores.tolist()))
+
+    def select(
+        self,
+        *,
+        query_tokens: Sequence[str],
+        focus_terms: Sequence[str] = (),
+        query_vector: Optional[Sequence[float]] = None,
+        record_types: Optional[Iterable[str]] = None,
+        limit: int = 6,
+    ) -> List[tuple]:
+        """
+        (점수, case_id, 사례 원문) 점수 내림차순.
+        record_types: 이 중 하나라도 가진 사례만 (비교할 기록 영역 필터, 맞는 사례가 없으면 필터 해제)
+        임베딩 유사도를 못 구하면 record_types 필터/키워드 가산 없이 기존 키워드 겹침 순위 그대로.
+        """
+        similarities = self._similarities(query_vector)
+        if not similarities:
+            return self._rank(query_tokens, focus_terms, {}, None, set(), keyword_bonus=False)[:limit]
+
+        prefilter = max(limit * ACCEPTED_CASE_VECTOR_PREFILTER_FACTOR, limit)
+        allowed = set(sorted(similarities, key=similarities.get, reverse=True)[:prefilter])
+        required_types = set(record_types or [])
+        ranked = self._rank(query_tokens, focus_terms, similarities, allowed, required_types)
+        if not ranked and required_types:
+            ranked = self._rank(query_tokens, focus_terms, similarities, allowed, set())
+        return ranked[:limit]
+
+    def _rank(
+        self,
+        query_tokens: Sequence[str],
+        focus_terms: Sequence[str],
+        similarities: Dict[str, float],
+        allowed: Optional[set],
+        required_types: set,
+        keyword_bonus: bool = True,
+    ) -> List[tuple]:
+        query_token_set = set(query_tokens)
+        ranked = []
+        for entry in self.entries:
+            case_id = entry["case_id"]
+            if not entry.get("has_snippets"):
+                continue
+            if required_types and not required_types.intersection(entry.get("record_types") or []):
+                continue
+            if allowed is not None and case_id not in allowed:
+                continue
+            text = entry["searchable_text"]
+            score = _overlap_score(query_tokens, text)
+            if focus_terms:
+                score += _overlap_score(focus_terms, text) * 0.5
+            if keyword_bonus and query_token_set:
+                score += 0.25 * len(query_token_set & self._keywords[case_id]) / max(len(query_token_set), 4)
+            similarity = similarities.get(case_id)
+            if similarity is not None and similarity >= ACCEPTED_CASE_MIN_SIMILARITY:
+                score += ACCEPTED_CASE_VECTOR_WEIGHT * similarity
+            if score <= 0:
+                continue
+            ranked.append((score, case_id, self.cases[case_id]))
+        ranked.sort(key=lambda item: item[0], reverse=True)
+        return ranked
+
+
+def _overlap_score(tokens: Sequence[str], text_lower: str) -> float:
+    if not tokens or not text_lower.strip():
+        return 0.0
+    overlap = sum(1 for token in tokens if token in text_lower)
+    return overlap / max(len(tokens), 4)
+
+
+def _load_index() -> AcceptedCaseIndex:
+    cases = load_accepted_cases()
+    try:
+        with open(ACCEPTED_CASE_INDEX_PATH, encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("source_sha256") == source_sha256():
+            return AcceptedCaseIndex(cases, payload.get("entries") or [])
+        print("⚠️ [accepted_cases] 사례 인덱스가 원문과 달라 파생 필드를 다시 계산합니다 (임베딩 없음)")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"⚠️ [accepted_cases] 사례 인덱스 로드 실패: {e}")
+    return AcceptedCaseIndex(cases, build_index_entries(cases))
+
+
+_index: Optional[AcceptedCaseIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_accepted_case_index() -> AcceptedCaseIndex:
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = _load_index()
+        return _index
@@ -0,0 +1,223 @@
+"""
+생기부 근거 문단 저장소 (심층분석 섹션별 근거 선택용)
+
+심층분석은 생기부 컨텍스트 전체(최대 22,000자)를 근거 추출/검토 프롬프트에 그대로 붙였다.
+대신 생기부를 학년 × 영역 × 과목 단위 문단(P1, P2 ...)으로 나눠 두고
+
+- 문단 임베딩(768차원, RETRIEVAL_DOCUMENT)은 생기부 버전당 1회
+  (유저별 생기부 캐시의 SchoolRecordContext에 저장소를 보관)
+- 섹션(축)마다 제목/초점 키워드로 점수를 매겨 토큰 예산 안에서 상위 문단만 선택
+- 섹션 간 합계 예산은 순위별 라운드로빈으로 나눠 한 섹션이 예산을 독점하지 않음
+
+토큰 수는 저장소 다른 곳과 같은 휴리스틱(한글 위주 텍스트 문자 수 / 2)으로 추정.
+임베딩을 쓸 수 없으면 키워드/영역 점수만으로 선택.
+"""
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+EVIDENCE_PASSAGE_MAX_CHARS = 1600
+# 섹션 1개가 받는 문단 예산 / 근거 추출 프롬프트 전체 예산 / 검토 프롬프트 예산 (추정 토큰)
+SECTION_PASSAGE_TOKEN_BUDGET = 1200
+EVIDENCE_PROMPT_TOKEN_BUDGET = 4500
+REVIEW_PASSAGE_TOKEN_BUDGET = 2500
+SECTION_PASSAGE_LIMIT = 6
+PASSAGE_VECTOR_WEIGHT = 0.6
+PASSAGE_AXIS_WEIGHT = 0.3
+
+# 섹션 제목 키워드 → 우선 볼 기록 영역
+SECTION_AXIS_RECORD_TYPES = {
+    "학업": {"세특"},
+    "탐구": {"세특"},
+    "교과": {"세특"},
+    "전공": {"세특", "진로활동"},
+    "진로": {"진로활동", "세특"},
+    "공동체": {"자율활동", "동아리활동", "행특"},
+    "인성": {"행특", "자율활동"},
+    "리더십": {"자율활동", "동아리활동", "행특"},
+    "협업": {"자율활동", "동아리활동", "행특"},
+    "동아리": {"동아리활동"},
+    "발전": {"세특", "행특"},
+    "성장": {"세특", "행특"},
+}
+
+_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z가-힣]+")
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text or "") // 2)
+
+
+def _tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_PATTERN.findall(str(text or "").lower()) if len(token) >= 2]
+
+
+def _axis_record_types(query: str) -> set:
+    record_types = set()
+    for keyword, types in SECTION_AXIS_RECORD_TYPES.items():
+        if keyword in query:
+            record_types |= types
+    return record_types
+
+
+def format_passages(passages: Sequence[Dict[str, Any]]) -> str:
+    return "\n\n".join(
+        f"[{passage['passage_id']}] {passage['label']}\n{passage['text']}" for passage in passages
+    )
+
+
+class EvidencePassageStore:
+    """생기부 1건의 문단 목록 + (선택) 문단 임베딩. 문단은 읽기 전용"""
+
+    def __init__(self, snippets: Iterable[Dict[str, Any]]):
+        self.passages: List[Dict[str, Any]] = []
+        for snippet in snippets:
+            text = re.sub(r"\s+", " ", str(snippet.get("text") or "")).strip()
+            if not text:
+                continue
+            if len(text) > EVIDENCE_PASSAGE_MAX_CHARS:
+                text = text[:EVIDENCE_PASSAGE_MAX_CHARS].rstrip() + "..."
+            label = str(snippet.get("label") or "생기부").strip()
+            self.passages.append({
+                "passage_id": f"P{len(self.passages) + 1}",
+                "label": label,
+                "text": text,
+                "grade": str(snippet.get("grade") or ""),
+                "record_type": str(snippet.get("record_type") or ""),
+                "area": str(snippet.get("area") or ""),
+                "tokens": estimate_tokens(label) + estimate_tokens(text),
+                "_search_text": f"{label} {text}".lower(),
+            })
+        self._matrix = None
+        self._embed_attempted = False
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.passages)
+
+    def ensure_vectors(self) -> bool:
+        """문단 임베딩 (저장소당 1회만 시도, 실패하면 키워드 점수만 사용)"""
+        with self._lock:
+            if not self._embed_attempted and self.passages:
+                self._embed_attempted = True
+                try:
+                    from services.query_embeddings import get_query_embedding_service
+
+                    vectors = get_query_embedding_service().embed_academic_passages(
+                        [f"{passage['label']}\n{passage['text']}" for passage in self.passages]
+                    )
+                    matrix = np.asarray(vectors, dtype=np.float32)
+                    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                    self._matrix = matrix / np.where(norms == 0, 1.0, norms)
+                except Exception as e:
+                    print(f"⚠️ [evidence_passages] 생기부 문단 임베딩 실패(키워드 점수만 사용): {e}")
+            return self._matrix is not None
+
+    def _similarities(self, queries: List[str]) -> List[Optional[np.ndarray]]:
+        if not queries or not self.ensure_vectors():
+            return [None] * len(queries)
+        try:
+            from services.query_embeddings import get_query_embedding_service
+
+            query_matrix = np.asarray(
+                get_query_embedding_service().embed_academic_batch(queries), dtype=np.float32
+            )
+        except Exception as e:
+            print(f"⚠️ [evidence_passages] 섹션 쿼리 임베딩 실패(키워드 점수만 사용): {e}")
+            return [None] * len(queries)
+        norms = np.linalg.norm(query_matrix, axis=1, keepdims=True)
+        query_matrix = query_matrix / np.where(norms == 0, 1.0, norms)
+        scores = query_matrix @ self._matrix.T
+        return [row for row in scores]
+
+    def _rank(self, query: str, similarities: Optional[np.ndarray]) -> List[tuple]:
+        tokens = _tokenize(query)
+        axis_types = _axis_record_types(query)
+        ranked = []
+        for idx, passage in enumerate(self.passages):
+            score = 0.0
+            if tokens:
+                label = passage["label"].lower()
+                overlap = sum(1 for token in tokens if token in passage["_search_text"])
+                label_overlap = sum(1 for token in tokens if token in label)
+                score += (overlap + 0.5 * label_overlap) / max(len(tokens), 4)
+            if axis_types and passage["record_type"] in axis_types:
+                score += PASSAGE_AXIS_WEIGHT
+            if similarities is not None:
+                score += PASSAGE_VECTOR_WEIGHT * max(0.0, float(similarities[idx]))
+            ranked.append((score, idx))
+        # 점수가 같으면 원래 순서(학년 → 영역)
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        return ranked
+
+    def select_for_queries(
+        self,
+        queries: Dict[str, str],
+        *,
+        token_budget: int = SECTION_PASSAGE_TOKEN_BUDGET,
+        total_token_budget: Optional[int] = None,
+        limit: int = SECTION_PASSAGE_LIMIT,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        key별(섹션별) 상위 문단 (원래 순서로 정렬).
+        한 key는 token_budget/limit 이내, 서로 다른 문단의 합계는 total_token_budget 이내.
+        점수가 0 이하인 문단은 고르지 않으므로 관련 문단이 없으면 빈 목록.
+        """
+        keys = list(queries.keys())
+        if not self.passages or not keys:
+            return {key: [] for key in keys}
+
+        similarities = self._similarities([queries[key] for key in keys])
+        rankings = {
+            key: self._rank(queries[key], similarity)
+            for key, similarity in zip(keys, similarities)
+        }
+        selected: Dict[str, List[int]] = {key: [] for key in keys}
+        used_tokens = {key: 0 for key in keys}
+        included: set = set()
+        total_tokens = 0
+
+        # 순위별 라운드로빈: 각 key의 1순위 → 2순위 ... (합계 예산이 한 key에 쏠리지 않도록)
+        for rank in range(len(self.passages)):
+            progressed = False
+            for key in keys:
+                if len(selected[key]) >= limit:
+                    continue
+                progressed = True
+                score, idx = rankings[key][rank]
+                if score <= 0:
+                    # 관련 없는 문단으로 채우지 않음 (예산에 못 들어가면 섹션을 비워 둠)
+                    continue
+                tokens = self.passages[idx]["tokens"]
+                if used_tokens[key] + tokens > token_budget:
+                    continue
+                new_tokens = 0 if idx in included else tokens
+                if total_token_budget is not None and total_tokens + new_tokens > total_token_budget:
+                    continue
+                selected[key].append(idx)
+                used_tokens[key] += tokens
+                if idx not in included:
+                    included.add(idx)
+                    total_tokens += tokens
+            if not progressed:
+                break
+
+        return {
+            key: [self._public(self.passages[idx]) for idx in sorted(indexes)]
+            for key, indexes in selected.items()
+        }
+
+    @staticmethod
+    def _public(passage: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in passage.items() if not key.startswith("_")}
+
+
+def union_passages(passage_groups: Iterable[Sequence[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """여러 섹션의 선택 문단을 중복 없이 문단 번호 순으로"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for group in passage_groups:
+        for passage in group:
+            merged.setdefault(passage["passage_id"], passage)
+    return sorted(merged.values(), key=lambda passage: int(passage["passage_id"][1:]))
@@ -0,0 +1,182 @@
+"""
+생기부 PDF 파싱 프로세스 풀
+
+업로드 라우트(async)에서 pdfplumber 단어 추출/줄 클러스터링과 룰 파서를 직접 실행하면
+여러 페이지짜리 PDF 하나가 이벤트 루프를 수 초간 막아 같은 워커의 다른 채팅 스트림이 멈춤.
+
+- 텍스트 추출과 룰 파싱은 전용 프로세스 풀(spawn)에서 실행하고 라우트는 await만 함
+- 앞쪽 페이지로 스캔본/다른 문서를 먼저 걸러낸 뒤, 나머지 페이지를 구간으로 나눠 여러 프로세스에서 동시에 추출
+- 유저별 동시 파싱 개수 제한 (같은 유저의 연속 업로드는 순서대로 대기)
+- PDF는 임시 파일로 한 번만 저장하고 작업에는 경로만 넘김 (페이지 구간마다 PDF 바이트를 pickle하지 않도록)
+- 프로세스 풀을 쓸 수 없으면 스레드에서 실행 (이벤트 루프는 막지 않음)
+  · 풀을 새로 만드는 경우는 제출 실패/BrokenProcessPool 뿐, 파싱 작업 자체의 예외는 그대로 전달
+"""
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .uniroad_school_record_support import (
+    PDF_EARLY_CHECK_PAGES,
+    SchoolRecordTextStream,
+    _build_forms_from_pdf_text,
+    _count_pdf_pages,
+    _extract_page_range_texts,
+    _normalize_academic_subjects,
+)
+
+# SCHOOL_RECORD_PARSE_PROCESSES=0 이면 프로세스 풀 없이 스레드에서 파싱
+PARSE_PROCESSES = int(os.getenv("SCHOOL_RECORD_PARSE_PROCESSES", str(min(4, os.cpu_count() or 1))))
+PARSE_PER_USER = max(1, int(os.getenv("SCHOOL_RECORD_PARSE_PER_USER", "1")))
+PARSE_PAGES_PER_TASK = max(1, int(os.getenv("SCHOOL_RECORD_PARSE_PAGES_PER_TASK", "4")))
+
+
+def _build_forms_task(raw_text: str, section_texts: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """룰 파서 + 과목명 정규화 (프로세스 풀 워커 진입점)"""
+    parsed_forms = _build_forms_from_pdf_text(raw_text, section_texts)
+    _normalize_academic_subjects(parsed_forms.get("parsedSchoolRecord") or {})
+    return parsed_forms
+
+
+def _read_pdf(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _count_pdf_pages_at(path: str) -> int:
+    return _count_pdf_pages(_read_pdf(path))
+
+
+def _extract_page_range_texts_at(path: str, start: int, end: int) -> List[Tuple[str, str]]:
+    return _extract_page_range_texts(_read_pdf(path), start, end)
+
+
+def _write_temp_pdf(file_bytes: bytes) -> str:
+    with tempfile.NamedTemporaryFile(prefix="school_record_", suffix=".pdf", delete=False) as f:
+        f.write(file_bytes)
+        return f.name
+
+
+class SchoolRecordParsePool:
+    """생기부 PDF 추출/파싱 프로세스 풀 (프로세스 전역 싱글톤으로 사용)"""
+
+    def __init__(self, max_processes: int = None, per_user: int = None):
+        self.max_processes = PARSE_PROCESSES if max_processes is None else max_processes
+        self.per_user = per_user or PARSE_PER_USER
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # user_id -> [세마포어, 사용/대기 중인 요청 수]
+        self._user_slots: Dict[str, List[Any]] = {}
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.max_processes <= 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                # fork는 스레드가 많은 서버 프로세스에서 안전하지 않으므로 spawn 사용
+                ctx = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=self.max_processes, mp_context=ctx)
+            return self._executor
+
+    def _reset_executor(self, executor: ProcessPoolExecutor) -> None:
+        """깨진 풀만 교체 (다른 요청이 이미 새 풀을 만들었으면 그대로 둠)"""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        # 깨진 풀의 작업은 이미 실패 처리됨. 진행 중인 다른 유저 작업을 취소하지 않도록 cancel_futures 없이 종료
+        executor.shutdown(wait=False)
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                future = executor.submit(fn, *args)
+            except (BrokenProcessPool, RuntimeError, OSError) as e:
+                # 종료된/깨진 풀이거나 워커 프로세스를 띄울 수 없음
+                print(f"⚠️ 생기부 파싱 프로세스 풀 사용 불가, 스레드에서 실행: {e}")
+                self._reset_executor(executor)
+            else:
+                try:
+                    return await asyncio.wrap_future(future)
+                except BrokenProcessPool as e:
+                    print(f"⚠️ 생기부 파싱 워커 프로세스 종료, 스레드에서 실행: {e}")
+                    self._reset_executor(executor)
+        return await asyncio.to_thread(fn, *args)
+
+    @asynccontextmanager
+    async def user_slot(self, user_id: str):
+        """유저별 동시 파싱 개수 제한"""
+        key = str(user_id or "")
+        slot = self._user_slots.get(key)
+        if slot is None:
+            slot = [asyncio.Semaphore(self.per_user), 0]
+            self._user_slots[key] = slot
+        slot[1] += 1
+        try:
+            async with slot[0]:
+                yield
+        finally:
+            slot[1] -= 1
+            if slot[1] <= 0 and self._user_slots.get(key) is slot:
+                self._user_slots.pop(key, None)
+
+    async def extract(self, file_bytes: bytes) -> SchoolRecordTextStream:
+        """
+        페이지별 텍스트 추출 + 섹션 분리.
+        앞쪽 PDF_EARLY_CHECK_PAGES 페이지를 먼저 추출해 생기부 여부 확인 (거부 설정 시 SchoolRecordPdfRejected),
+        통과하면 나머지 페이지를 구간별로 여러 프로세스에서 동시에 추출.
+        """
+        stream = SchoolRecordTextStream()
+        pdf_path = await asyncio.to_thread(_write_temp_pdf, file_bytes)
+        try:
+            page_count = await self._run(_count_pdf_pages_at, pdf_path)
+            if page_count <= 0:
+                return stream
+
+            head_end = min(PDF_EARLY_CHECK_PAGES, page_count)
+            stream.add_pages(await self._run(_extract_page_range_texts_at, pdf_path, 0, head_end))
+            stream.check_early()
+
+            ranges = [
+                (start, min(start + PARSE_PAGES_PER_TASK, page_count))
+                for start in range(head_end, page_count, PARSE_PAGES_PER_TASK)
+            ]
+            if ranges:
+                chunks = await asyncio.gather(*[
+                    self._run(_extract_page_range_texts_at, pdf_path, start, end)
+                    for start, end in ranges
+                ])
+                # 섹션 분리는 페이지 순서대로 이어서 진행 (줄 단위 정규식이라 루프 밖 스레드에서)
+                await asyncio.to_thread(stream.add_pages, [page for chunk in chunks for page in chunk])
+            return stream
+        finally:
+            try:
+                os.remove(pdf_path)
+            except OSError:
+                pass
+
+    async def build_forms(
+        self,
+        raw_text: str,
+        section_texts: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """원문 텍스트 → 폼/파싱 결과 (_normalize_academic_subjects 적용 완료)"""
+        return await self._run(_build_forms_task, raw_text, section_texts)
+
+
+_parse_pool: Optional[SchoolRecordParsePool] = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_school_record_parse_pool() -> SchoolRecordParsePool:
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = SchoolRecordParsePool()
+        return _parse_pool
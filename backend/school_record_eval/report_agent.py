@@ -8,13 +8,15 @@ import time
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import google.generativeai as genai
+import numpy as np
 from google.generativeai.types import HarmBlockThreshold, HarmCategory
 
 from config.config import settings
 from config.constants import GEMINI_FLASH_MODEL
-from services.multi_agent.functions import execute_function_calls
-from services.multi_agent.router_agent import RouterAgent
+from services.multi_agent.functions import RAGFunctions, execute_function_calls
+from services.multi_agent.router_agent import get_router
 from school_record_eval.matching_summary import ensure_matching_summary
+from utils.university_names import KNOWN_UNIVERSITY_ALIASES, get_university_matcher, school_name_variants
 
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
@@ -136,20 +138,13 @@ MAX_QUERIES_PER_UNIVERSITY = 4
 MAX_CALLS_PER_ROUND = 18
 MAX_TOTAL_RETRIEVAL_CALLS = 42
 MAX_PARALLEL_FUNCTION_CALLS = 10
+# 대학별 검색 커버리지: 고유 청크/문서가 이만큼 모이면 1.0 (더 검색하지 않음)
+UNIVERSITY_COVERAGE_TARGET_CHUNKS = 8
+UNIVERSITY_COVERAGE_TARGET_DOCUMENTS = 2
+# 같은 대학에 이 이상 비슷한 쿼리는 이미 실행한 것으로 보고 제외 (코사인 유사도)
+RETRIEVAL_QUERY_DUPLICATE_SIMILARITY = 0.97
 
-UNIVERSITY_ALIAS_MAP: Dict[str, List[str]] = {
-    "서울대학교": ["서울대학교", "서울대", "서울대학"],
-    "연세대학교": ["연세대학교", "연세대", "연대"],
-    "고려대학교": ["고려대학교", "고려대", "고대"],
-    "중앙대학교": ["중앙대학교", "중앙대"],
-    "성균관대학교": ["성균관대학교", "성균관대", "성대"],
-    "한양대학교": ["한양대학교", "한양대"],
-    "경희대학교": ["경희대학교", "경희대"],
-    "서강대학교": ["서강대학교", "서강대"],
-    "이화여자대학교": ["이화여자대학교", "이화여대", "이대"],
-    "한국외국어대학교": ["한국외국어대학교", "한국외대", "외대"],
-    "서울시립대학교": ["서울시립대학교", "시립대", "서울시립대"],
-}
+UNIVERSITY_ALIAS_MAP: Dict[str, List[str]] = KNOWN_UNIVERSITY_ALIASES
 
 # 생기부 기반 적합 학교 추천 시 순회할 후보 대학 목록
 CANDIDATE_UNIVERSITIES: List[str] = list(UNIVERSITY_ALIAS_MAP.keys())
@@ -840,10 +835,10 @@ def _extract_target_universities(message: str) -> List[str]:
     text = _clean_text(message)
     if not text:
         return []
+    matcher = get_university_matcher(include_documents=False)
     found: List[str] = []
-    for canonical, aliases in UNIVERSITY_ALIAS_MAP.items():
-        if any(alias in text for alias in aliases):
-            found.append(canonical)
+    for match in matcher.find(text):
+        found.extend(name for name in matcher.names_for(match.key) if name in UNIVERSITY_ALIAS_MAP)
     return _dedupe_preserve_order(found)
 
 
@@ -910,7 +905,7 @@ def _find_missing_university_mentions(text: str, target_universities: List[str])
 
 
 def _build_university_alias_regex(university: str) -> str:
-    aliases = UNIVERSITY_ALIAS_MAP.get(university, [university])
+    aliases = [*UNIVERSITY_ALIAS_MAP.get(university, []), *school_name_variants(university)] or [university]
     escaped = [re.escape(_clean_text(alias)) for alias in aliases if _clean_text(alias)]
     if not escaped:
         escaped = [re.escape(_clean_text(university))]
@@ -1006,6 +1001,14 @@ def _find_university_evidence_gaps(
     return gaps
 
 
+def _chunk_key(document_id: Any, chunk: Dict[str, Any], content: str) -> str:
+    """라운드/호출이 달라도 같은 청크면 같은 키 (chunk_id 없으면 문서+페이지+본문 앞부분)"""
+    chunk_id = chunk.get("chunk_id")
+    if chunk_id not in (None, ""):
+        return f"{document_id}|{chunk_id}"
+    return f"{document_id}|{chunk.get('page_number')}|{content[:120]}"
+
+
 def _collect_rag_material(function_results: Dict[str, Any]) -> Tuple[str, List[str], List[str], List[Dict[str, Any]]]:
     lines: List[str] = []
     sources: List[str] = []
@@ -1035,11 +1038,7 @@ def _collect_rag_material(function_results: Dict[str, Any]) -> Tuple[str, List[s
             title = _clean_text(document_titles.get(document_id)) or base_university
             url = _clean_text(document_urls.get(document_id) or chunk.get("file_url"))
             page = chunk.get("page_number")
-            chunk_key = (
-                f"{document_id}|{chunk_id}"
-                if chunk_id not in (None, "")
-                else f"{document_id}|{page}|{content[:120]}"
-            )
+            chunk_key = _chunk_key(document_id, chunk, content)
             if chunk_key in seen_chunk_keys:
                 continue
             seen_chunk_keys.add(chunk_key)
@@ -1262,38 +1261,156 @@ def _build_retrieval_round_query(message: str, round_index: int, universities: L
     return _build_router_query(expanded)
 
 
+class RetrievalSession:
+    """
+    리포트 1건의 다회 검색 누적 상태.
+    - 호출 시그니처 / 청크 키: 이미 실행·수집한 것은 다음 라운드에서 제외
+    - 쿼리 임베딩: univ 검색 캐시와 공유, 같은 대학의 거의 같은 쿼리는 재호출하지 않음
+    - 대학별 커버리지: 고유 청크/문서 수 기준 0~1, 모자란 대학만 다음 라운드에서 재검색
+    """
+
+    def __init__(self) -> None:
+        self.function_results: Dict[str, Any] = {}
+        self.total_unique_calls = 0
+        self._call_signatures: set = set()
+        self._chunk_keys: set = set()
+        self._university_chunks: Dict[str, int] = {}
+        self._university_documents: Dict[str, set] = {}
+        # 대학 -> 실행한 쿼리의 정규화 임베딩 목록
+        self._query_vectors: Dict[str, List[np.ndarray]] = {}
+
+    def coverage(self, university: str) -> float:
+        chunks = self._university_chunks.get(university, 0)
+        documents = len(self._university_documents.get(university, ()))
+        return round(
+            0.7 * min(1.0, chunks / UNIVERSITY_COVERAGE_TARGET_CHUNKS)
+            + 0.3 * min(1.0, documents / UNIVERSITY_COVERAGE_TARGET_DOCUMENTS),
+            3,
+        )
+
+    def coverage_gaps(self, universities: List[str]) -> List[str]:
+        """커버리지가 다 차지 않은 대학 (다음 라운드 검색 대상)"""
+        return [uni for uni in universities if self.coverage(uni) < 1.0]
+
+    async def _query_vector(self, query: str) -> Optional[np.ndarray]:
+        try:
+            vector = await asyncio.to_thread(RAGFunctions.get_instance().get_query_embedding, query)
+        except Exception as e:
+            print(f"⚠️ [report_retrieval] 쿼리 임베딩 실패(유사 쿼리 제외 생략): {e}")
+            return None
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm else None
+
+    async def plan_calls(self, candidate_calls: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        (이번 라운드 실행 호출, 유사 쿼리로 제외한 호출 수).
+        이미 실행한 호출과 시그니처가 같거나, 같은 대학에 거의 같은 쿼리(univ)면 제외하고 호출 한도 적용.
+        """
+        fresh: List[Dict[str, Any]] = []
+        signatures = set()
+        for call in candidate_calls:
+            signature = _call_signature(call)
+            if signature in self._call_signatures or signature in signatures:
+                continue
+            signatures.add(signature)
+            fresh.append(call)
+
+        univ_targets = [
+            (idx, _normalize_text_list(call["params"].get("university"))[:1] or [""], " ".join(_normalize_text_list(call["params"].get("query"))))
+            for idx, call in enumerate(fresh)
+            if _clean_text(call.get("function")) == "univ"
+        ]
+        vectors = await asyncio.gather(*[self._query_vector(query) for _, _, query in univ_targets if query])
+        vector_by_idx = dict(zip([idx for idx, _, query in univ_targets if query], vectors))
+        university_by_idx = {idx: universities[0] for idx, universities, _ in univ_targets}
+
+        planned: List[Dict[str, Any]] = []
+        skipped_similar = 0
+        for idx, call in enumerate(fresh):
+            if len(planned) >= MAX_CALLS_PER_ROUND or self.total_unique_calls >= MAX_TOTAL_RETRIEVAL_CALLS:
+                break
+            vector = vector_by_idx.get(idx)
+            if vector is not None:
+                seen_vectors = self._query_vectors.setdefault(university_by_idx[idx], [])
+                if any(float(vector @ seen) >= RETRIEVAL_QUERY_DUPLICATE_SIMILARITY for seen in seen_vectors):
+                    skipped_similar += 1
+                    self._call_signatures.add(_call_signature(call))
+                    continue
+                seen_vectors.append(vector)
+            self._call_signatures.add(_call_signature(call))
+            planned.append(call)
+            self.total_unique_calls += 1
+        return planned, skipped_similar
+
+    def ingest(self, round_index: int, round_results: Dict[str, Any]) -> Tuple[int, int]:
+        """
+        라운드 결과에서 이미 수집한 청크를 빼고 누적 (결과 dict는 복사해 chunks/count만 교체).
+        (신규 청크 수, 중복 제외 청크 수) 반환
+        """
+        new_chunks = 0
+        duplicate_chunks = 0
+        for key, value in (round_results or {}).items():
+            if isinstance(value, dict) and isinstance(value.get("chunks"), list):
+                university = _clean_text(value.get("university"))
+                kept: List[Dict[str, Any]] = []
+                for chunk in value["chunks"]:
+                    if not isinstance(chunk, dict):
+                        continue
+                    document_id = chunk.get("document_id")
+                    chunk_key = _chunk_key(document_id, chunk, _clean_text(chunk.get("content")))
+                    if chunk_key in self._chunk_keys:
+                        duplicate_chunks += 1
+                        continue
+                    self._chunk_keys.add(chunk_key)
+                    kept.append(chunk)
+                    if university:
+                        self._university_chunks[university] = self._university_chunks.get(university, 0) + 1
+                        self._university_documents.setdefault(university, set()).add(document_id)
+                new_chunks += len(kept)
+                value = {**value, "chunks": kept, "count": len(kept)}
+            self.function_results[f"r{round_index}_{key}"] = value
+        return new_chunks, duplicate_chunks
+
+
 async def _run_multi_round_retrieval(
     *,
     message: str,
     history: List[Dict[str, Any]] | None,
     target_universities: List[str] | None = None,
 ) -> Dict[str, Any]:
-    router = RouterAgent()
-    all_results: Dict[str, Any] = {}
+    router = get_router()
+    session = RetrievalSession()
     round_details: List[Dict[str, Any]] = []
     round_router_outputs: List[Dict[str, Any]] = []
     first_router_output: Dict[str, Any] = {}
 
-    seen_call_signatures = set()
     discovered_universities: List[str] = _dedupe_preserve_order(target_universities or [])
-    total_unique_calls = 0
     router_ms_total = 0
     function_ms_total = 0
     history_input = history or []
+    stop_reason = "max_rounds"
 
     for round_index in range(1, MAX_RETRIEVAL_ROUNDS + 1):
-        query_for_round = _build_retrieval_round_query(message, round_index, discovered_universities)
-
-        route_start = time.perf_counter()
-        router_output = await router.route(query_for_round, history_input)
-        router_ms_total += int((time.perf_counter() - route_start) * 1000)
-        if round_index == 1:
-            first_router_output = router_output if isinstance(router_output, dict) else {}
-        round_router_outputs.append(router_output if isinstance(router_output, dict) else {})
-
-        raw_calls = _normalize_function_calls((router_output or {}).get("function_calls"))
+        # 2라운드부터는 대학이 정해져 있으면 Router 없이 커버리지가 모자란 대학만 재검색
+        gap_universities = (
+            discovered_universities if round_index == 1 else session.coverage_gaps(discovered_universities)
+        )
+        use_router = round_index == 1 or not discovered_universities
+        router_output: Dict[str, Any] = {}
+        if use_router:
+            query_for_round = _build_retrieval_round_query(message, round_index, discovered_universities)
+            route_start = time.perf_counter()
+            routed = await router.route(query_for_round, history_input)
+            router_ms_total += int((time.perf_counter() - route_start) * 1000)
+            router_output = routed if isinstance(routed, dict) else {}
+            if round_index == 1:
+                first_router_output = router_output
+            round_router_outputs.append(router_output)
+
+        raw_calls = _normalize_function_calls(router_output.get("function_calls"))
         expanded_calls = _expand_univ_calls(raw_calls)
-        forced_calls = _build_forced_university_calls(discovered_universities, round_index)
+        forced_calls = _build_forced_university_calls(gap_universities, round_index)
         if forced_calls:
             expanded_calls = forced_calls + expanded_calls
         if round_index == 1:
@@ -1301,54 +1418,57 @@ async def _run_multi_round_retrieval(
                 list(discovered_universities) + _extract_universities_from_calls(expanded_calls)
             )
 
-        round_calls: List[Dict[str, Any]] = []
-        for call in expanded_calls:
-            signature = _call_signature(call)
-            if signature in seen_call_signatures:
-                continue
-            seen_call_signatures.add(signature)
-            round_calls.append(call)
-            total_unique_calls += 1
-            if len(round_calls) >= MAX_CALLS_PER_ROUND or total_unique_calls >= MAX_TOTAL_RETRIEVAL_CALLS:
-                break
+        round_calls, skipped_similar = await session.plan_calls(expanded_calls)
 
-        round_results: Dict[str, Any] = {}
+        new_chunks = 0
+        duplicate_chunks = 0
         if round_calls:
             function_start = time.perf_counter()
             round_results = await _execute_function_calls_parallel(round_calls)
             function_ms_total += int((time.perf_counter() - function_start) * 1000)
-            for key, value in (round_results or {}).items():
-                all_results[f"r{round_index}_{key}"] = value
+            new_chunks, duplicate_chunks = session.ingest(round_index, round_results)
 
-        round_chunk_count = _count_function_chunks(round_results)
         round_details.append(
             {
                 "round": round_index,
+                "router_called": use_router,
                 "raw_calls": len(raw_calls),
                 "expanded_calls": len(expanded_calls),
                 "executed_calls": len(round_calls),
-                "retrieved_chunks": round_chunk_count,
+                "skipped_similar_calls": skipped_similar,
+                "retrieved_chunks": new_chunks,
+                "duplicate_chunks": duplicate_chunks,
+                "coverage_gaps": session.coverage_gaps(discovered_universities),
             }
         )
 
         # 1차에서 호출이 없으면 추가 라운드를 진행해도 수확 가능성이 낮아 조기 종료
-        if round_index == 1 and not round_calls:
+        # 추가 라운드에서 신규 호출이 더 이상 없으면 종료
+        if not round_calls:
+            stop_reason = "no_new_calls"
+            break
+        if discovered_universities and not session.coverage_gaps(discovered_universities):
+            stop_reason = "full_coverage"
             break
-        # 추가 라운드에서 신규 호출이 더 이상 없거나 총량 한도 도달 시 종료
-        if round_index > 1 and not round_calls:
+        # 추가 라운드가 새 청크를 하나도 못 가져오면 다음 라운드도 수확 가능성이 낮음
+        if round_index > 1 and new_chunks == 0:
+            stop_reason = "no_new_chunks"
             break
-        if total_unique_calls >= MAX_TOTAL_RETRIEVAL_CALLS:
+        if session.total_unique_calls >= MAX_TOTAL_RETRIEVAL_CALLS:
+            stop_reason = "call_limit"
             break
 
     return {
         "router_output": first_router_output,
         "router_round_outputs": round_router_outputs,
-        "function_results": all_results,
+        "function_results": session.function_results,
         "round_details": round_details,
         "router_ms": router_ms_total,
         "function_ms": function_ms_total,
         "rounds": len(round_details),
-        "unique_calls": total_unique_calls,
+        "unique_calls": session.total_unique_calls,
+        "university_coverage": {uni: session.coverage(uni) for uni in discovered_universities},
+        "stop_reason": stop_reason,
     }
 
 
@@ -20,15 +20,16 @@ from utils.school_record_context import has_meaningful_school_record
 from .models import SchoolRecordEvaluateRequest, SchoolRecordEvaluateResponse
 from .service import evaluate_school_record
 from .diagnose import diagnose_school_record
+from .pdf_parse_pool import get_school_record_parse_pool
 from .uniroad_school_record_support import (
     MAX_PDF_SIZE,
     MAX_PDF_SIZE_MB,
     MIN_EXTRACTED_TEXT_CHARS,
     RULE_PARSER_VERSION,
+    SCANNED_PDF_MESSAGE,
+    SchoolRecordPdfRejected,
     _build_pdf_file_hash,
-    _build_forms_from_pdf_text,
     _build_parsed_preview,
-    _extract_text_from_pdf_bytes,
     _is_cache_compatible,
     _merge_forms_from_parsed_preview,
     _normalize_academic_subjects,
@@ -161,9 +162,10 @@ async def get_school_record_forms(user: dict = Depends(get_current_user)):
     )
     mutated = False
     if should_rebuild_from_raw:
-        rebuilt_forms = _build_forms_from_pdf_text(raw_text)
+        parse_pool = get_school_record_parse_pool()
+        async with parse_pool.user_slot(user_id):
+            rebuilt_forms = await parse_pool.build_forms(raw_text)
         rebuilt_parsed = rebuilt_forms.get("parsedSchoolRecord") or {}
-        _normalize_academic_subjects(rebuilt_parsed)
         forms["creativeActivity"] = rebuilt_forms.get("creativeActivity") or {}
         forms["academicDev"] = rebuilt_forms.get("academicDev") or {}
         forms["individualDev"] = rebuilt_forms.get("individualDev") or {}
@@ -364,32 +366,38 @@ async def upload_school_record_pdf(
             },
         }
 
-    extract_started_at = time.perf_counter()
-    try:
-        extracted, page_count, extraction_method = _extract_text_from_pdf_bytes(file_bytes)
-    except ValueError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"PDF 텍스트 추출 실패: {str(e)}")
-    extract_ms = int((time.perf_counter() - extract_started_at) * 1000)
-
-    if page_count <= 0:
-        raise HTTPException(
-            status_code=400,
-            detail="PDF 페이지를 읽을 수 없습니다. 파일이 손상되었거나 지원되지 않는 형식인지 확인해 주세요.",
-        )
-    if len(extracted.strip()) < MIN_EXTRACTED_TEXT_CHARS:
-        raise HTTPException(
-            status_code=400,
-            detail="스캔본(이미지 PDF)은 현재 지원하지 않습니다. 정부24 또는 카카오톡 전자문서지갑에서 저장한 원본 PDF를 업로드해 주세요.",
-        )
+    parse_pool = get_school_record_parse_pool()
+    async with parse_pool.user_slot(user_id):
+        extract_started_at = time.perf_counter()
+        try:
+            extracted_stream = await parse_pool.extract(file_bytes)
+        except SchoolRecordPdfRejected as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"PDF 텍스트 추출 실패: {str(e)}")
+        extract_ms = int((time.perf_counter() - extract_started_at) * 1000)
+        extracted = extracted_stream.text
+        page_count = extracted_stream.page_count
+        extraction_method = extracted_stream.method
+
+        if page_count <= 0:
+            raise HTTPException(
+                status_code=400,
+                detail="PDF 페이지를 읽을 수 없습니다. 파일이 손상되었거나 지원되지 않는 형식인지 확인해 주세요.",
+            )
+        if len(extracted.strip()) < MIN_EXTRACTED_TEXT_CHARS:
+            raise HTTPException(
+                status_code=400,
+                detail=SCANNED_PDF_MESSAGE,
+            )
 
-    parse_started_at = time.perf_counter()
-    raw_text = extracted
-    parse_method = "rule"
-    parsed_forms = _build_forms_from_pdf_text(raw_text)
-    _normalize_academic_subjects(parsed_forms.get("parsedSchoolRecord") or {})
-    parse_ms = int((time.perf_counter() - parse_started_at) * 1000)
+        parse_started_at = time.perf_counter()
+        raw_text = extracted
+        parse_method = "rule"
+        parsed_forms = await parse_pool.build_forms(raw_text, extracted_stream.section_texts())
+        parse_ms = int((time.perf_counter() - parse_started_at) * 1000)
     total_ms = int((time.perf_counter() - started_at) * 1000)
 
     # 심층분석에서 바로 활용할 수 있도록 원문 전체 텍스트 저장
@@ -465,6 +473,7 @@ async def upload_school_record_pdf(
 @router.post("/generate-visual-report")
 async def generate_visual_report(user: dict = Depends(get_current_user)):
     """생기부 시각 보고서 생성 (SSE 스트리밍)."""
+    from services.school_record_context_cache import get_school_record_context_cache
     from .visual_report_agent import generate_visual_report_data
     from .report_context import build_school_record_report_context_text
 
@@ -472,11 +481,11 @@ async def generate_visual_report(user: dict = Depends(get_current_user)):
     if not user_id:
         raise HTTPException(status_code=401, detail="User id not found")
 
-    school_loaded = await SupabaseService.get_user_profile_school_record(user_id)
-    if school_loaded is None:
+    record_context = await get_school_record_context_cache().get(user_id)
+    if record_context is None:
         raise HTTPException(status_code=500, detail="Profile load failed")
 
-    school = dict(school_loaded or {})
+    school = dict(record_context.school_record)
     if not has_meaningful_school_record(school):
         raise HTTPException(
             status_code=400,
@@ -488,8 +497,11 @@ async def generate_visual_report(user: dict = Depends(get_current_user)):
         try:
             yield f"data: {json.dumps({'type': 'status', 'step': 'prepare'}, ensure_ascii=False)}\n\n"
 
+            # 같은 생기부로 다시 생성하면 조립한 컨텍스트 재사용
             context = await asyncio.to_thread(
-                build_school_record_report_context_text, school, max_chars=16000,
+                record_context.derive,
+                "visual_report_context",
+                lambda: build_school_record_report_context_text(school, max_chars=16000),
             )
             if not context or len(context.strip()) < 100:
                 yield f"data: {json.dumps({'type': 'error', 'message': '생기부 데이터가 충분하지 않습니다.'}, ensure_ascii=False)}\n\n"
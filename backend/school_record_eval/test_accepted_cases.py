@@ -0,0 +1,84 @@
+"""
+합격자 사례 인덱스 후보 선택 테스트 (임베딩 없을 때 기존 키워드 순위 유지 / 임베딩 있을 때 유형 필터)
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from school_record_eval.accepted_cases import (
+    ACCEPTED_CASE_EMBEDDING_DIMENSIONS,
+    AcceptedCaseIndex,
+    build_index_entries,
+)
+
+
+def _case(target: str, activities: list, comments: list = ()) -> dict:
+    return {
+        "personal_info": {"대상": target},
+        "activities": [{"영역": area, "내용": text} for area, text in activities],
+        "comments": [{"내용": text} for text in comments],
+    }
+
+
+CASES = {
+    "case_1_natural_science": _case("서울대학교 화학과", [("화학", "촉매 반응 속도 탐구 보고서 작성")]),
+    "case_2_natural_science": _case("연세대학교 화학과", [("동아리활동", "촉매 실험 동아리 운영")]),
+    "case_3_humanities": _case("고려대학교 국어국문학과", [("진로활동", "현대시 비평 발표")]),
+}
+
+
+def _legacy_score(tokens, text):
+    overlap = sum(1 for token in tokens if token in text.lower())
+    return overlap / max(len(tokens), 4)
+
+
+def _vector(*values):
+    vector = [0.0] * ACCEPTED_CASE_EMBEDDING_DIMENSIONS
+    for index, value in enumerate(values):
+        vector[index] = value
+    return vector
+
+
+def test_select_without_embeddings_keeps_legacy_keyword_ranking():
+    entries = build_index_entries(CASES)
+    index = AcceptedCaseIndex(CASES, entries)
+    assert not index.has_embeddings
+
+    query_tokens = ["촉매", "반응", "탐구"]
+    # record_types 필터는 임베딩 경로에서만 → 동아리활동만 있는 사례도 후보에 남음
+    ranked = index.select(query_tokens=query_tokens, record_types={"세특"}, limit=5)
+
+    expected = sorted(
+        (
+            (_legacy_score(query_tokens, entry["searchable_text"]), entry["case_id"])
+            for entry in entries
+            if _legacy_score(query_tokens, entry["searchable_text"]) > 0
+        ),
+        reverse=True,
+    )
+    assert [(score, case_id) for score, case_id, _ in ranked] == expected
+    assert [case_id for _, case_id, _ in ranked] == ["case_1_natural_science", "case_2_natural_science"]
+
+
+def test_select_with_embeddings_filters_by_record_type():
+    entries = build_index_entries(CASES)
+    for entry, vector in zip(entries, (_vector(1.0), _vector(0.9, 0.1), _vector(0.0, 1.0))):
+        entry["embedding"] = vector
+    index = AcceptedCaseIndex(CASES, entries)
+
+    ranked = index.select(
+        query_tokens=["촉매"],
+        query_vector=_vector(1.0),
+        record_types={"동아리활동"},
+        limit=5,
+    )
+    assert [case_id for _, case_id, _ in ranked] == ["case_2_natural_science"]
+
+    # 유형이 맞는 사례가 없으면 필터 해제
+    ranked = index.select(
+        query_tokens=["촉매"],
+        query_vector=_vector(1.0),
+        record_types={"행특"},
+        limit=5,
+    )
+    assert [case_id for _, case_id, _ in ranked][:2] == ["case_1_natural_science", "case_2_natural_science"]
@@ -15,7 +15,7 @@ import os
 import tempfile
 import time
 import json
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from fastapi import APIRouter, HTTPException, Header, Depends, Body, UploadFile, File
 
 try:
@@ -48,6 +48,19 @@ PDF_WORD_X_TOLERANCE = float(os.getenv("SCHOOL_RECORD_PDF_WORD_X_TOLERANCE", "2"
 PDF_WORD_Y_TOLERANCE = float(os.getenv("SCHOOL_RECORD_PDF_WORD_Y_TOLERANCE", "2"))
 PDF_LINE_CLUSTER_TOLERANCE = float(os.getenv("SCHOOL_RECORD_PDF_LINE_CLUSTER_TOLERANCE", "1.8"))
 RULE_PARSER_VERSION = "v14"
+# 페이지 스트리밍 추출: pdfplumber 결과가 이 길이 미만인 페이지만 PyPDF2로 폴백
+PDF_PAGE_FALLBACK_MIN_CHARS = int(os.getenv("SCHOOL_RECORD_PDF_PAGE_FALLBACK_MIN_CHARS", "20"))
+# 앞쪽 N페이지만 보고 생기부가 아닌 파일 판정 (기본은 경고 로그만, 거부는 opt-in)
+PDF_EARLY_CHECK_PAGES = max(1, int(os.getenv("SCHOOL_RECORD_PDF_EARLY_CHECK_PAGES", "2")))
+PDF_REJECT_NON_SCHOOL_RECORD = os.getenv("SCHOOL_RECORD_PDF_REJECT_NON_SCHOOL_RECORD", "false").lower() == "true"
+SCANNED_PDF_MESSAGE = (
+    "스캔본(이미지 PDF)은 현재 지원하지 않습니다. "
+    "정부24 또는 카카오톡 전자문서지갑에서 저장한 원본 PDF를 업로드해 주세요."
+)
+NOT_SCHOOL_RECORD_PDF_MESSAGE = (
+    "학교생활기록부 PDF가 아닌 것 같습니다. "
+    "정부24 또는 카카오톡 전자문서지갑에서 저장한 생활기록부 원본 PDF를 업로드해 주세요."
+)
 
 
 def _compact(text: str) -> str:
@@ -67,94 +80,241 @@ def _merge_text(current: str, incoming: str) -> str:
     return f"{current}\n{incoming}"
 
 
-def _extract_text_with_pdfplumber_words(file_bytes: bytes) -> Tuple[str, int]:
+def _extract_pdfplumber_page_text(page) -> str:
+    """pdfplumber 페이지 1장: 단어 추출 후 y(top) 클러스터로 줄 복원."""
+    words = page.extract_words(
+        x_tolerance=PDF_WORD_X_TOLERANCE,
+        y_tolerance=PDF_WORD_Y_TOLERANCE,
+        keep_blank_chars=False,
+        use_text_flow=True,
+    ) or []
+    if not words:
+        return ""
+
+    line_clusters = cluster_objects(words, itemgetter("top"), PDF_LINE_CLUSTER_TOLERANCE) or []
+    lines: List[str] = []
+    for cluster in line_clusters:
+        if not cluster:
+            continue
+        ordered = sorted(
+            cluster,
+            key=lambda w: (float(w.get("x0", 0.0)), float(w.get("x1", 0.0))),
+        )
+        line = " ".join(
+            str(word.get("text", "")).strip()
+            for word in ordered
+            if str(word.get("text", "")).strip()
+        )
+        line = re.sub(r"\s+", " ", line).strip()
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def _count_pdf_pages(file_bytes: bytes) -> int:
+    """페이지 수만 확인 (페이지 병렬 추출 분배용)."""
+    if pdfplumber is not None:
+        try:
+            with pdfplumber.open(BytesIO(file_bytes)) as pdf:
+                return len(pdf.pages)
+        except Exception:
+            pass
+    if PdfReader is not None:
+        try:
+            return len(PdfReader(BytesIO(file_bytes)).pages)
+        except Exception:
+            pass
+    return 0
+
+
+def _release_pdfplumber_page(page) -> None:
+    """페이지 객체 캐시(문자/도형)를 비워 긴 PDF에서 메모리 누적 방지."""
+    release = getattr(page, "close", None) or getattr(page, "flush_cache", None)
+    if release is None:
+        return
+    try:
+        release()
+    except Exception:
+        pass
+
+
+def _pypdf2_page_text(reader, page_index: int) -> str:
+    text = reader.pages[page_index].extract_text() or ""
+    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+    return "\n".join(lines).strip()
+
+
+def _iter_pdf_page_texts(
+    file_bytes: bytes,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[Tuple[int, str, str]]:
     """
-    pdfplumber.extract_words 기반 추출.
-    - extract_text의 메모리/정렬 이슈를 피하기 위해 단어 추출 후 y(top) 클러스터로 줄 복원
+    페이지 단위 텍스트 스트리밍: (page_index, text, method)
+    - pdfplumber 단어 추출 우선
+    - 해당 페이지 텍스트가 비었거나 너무 짧을 때만 그 페이지를 PyPDF2로 폴백 (파일 전체 재파싱 없음)
     """
-    if pdfplumber is None or cluster_objects is None:
-        return "", 0
+    plumber_pdf = None
+    if pdfplumber is not None and cluster_objects is not None:
+        try:
+            plumber_pdf = pdfplumber.open(BytesIO(file_bytes))
+        except Exception:
+            plumber_pdf = None
+
+    reader_state: Dict[str, Any] = {}
+
+    def get_reader():
+        if "reader" not in reader_state:
+            reader = None
+            if PdfReader is not None:
+                try:
+                    reader = PdfReader(BytesIO(file_bytes))
+                except Exception:
+                    reader = None
+            reader_state["reader"] = reader
+        return reader_state["reader"]
 
-    page_count = 0
-    page_texts: List[str] = []
     try:
-        with pdfplumber.open(BytesIO(file_bytes)) as pdf:
-            page_count = len(pdf.pages)
-            for page in pdf.pages:
-                words = page.extract_words(
-                    x_tolerance=PDF_WORD_X_TOLERANCE,
-                    y_tolerance=PDF_WORD_Y_TOLERANCE,
-                    keep_blank_chars=False,
-                    use_text_flow=True,
-                ) or []
-                if not words:
-                    continue
+        if plumber_pdf is not None:
+            page_count = len(plumber_pdf.pages)
+        else:
+            reader = get_reader()
+            page_count = len(reader.pages) if reader is not None else 0
+        end = page_count if end is None else min(end, page_count)
+
+        for page_index in range(start, end):
+            text, method = "", "none"
+            if plumber_pdf is not None:
+                page = plumber_pdf.pages[page_index]
+                try:
+                    text = _extract_pdfplumber_page_text(page)
+                    method = "pdfplumber_words"
+                except Exception:
+                    text = ""
+                finally:
+                    _release_pdfplumber_page(page)
 
-                line_clusters = cluster_objects(words, itemgetter("top"), PDF_LINE_CLUSTER_TOLERANCE) or []
-                lines: List[str] = []
-                for cluster in line_clusters:
-                    if not cluster:
-                        continue
-                    ordered = sorted(
-                        cluster,
-                        key=lambda w: (float(w.get("x0", 0.0)), float(w.get("x1", 0.0))),
-                    )
-                    line = " ".join(
-                        str(word.get("text", "")).strip()
-                        for word in ordered
-                        if str(word.get("text", "")).strip()
-                    )
-                    line = re.sub(r"\s+", " ", line).strip()
-                    if line:
-                        lines.append(line)
-
-                if lines:
-                    page_texts.append("\n".join(lines))
-    except Exception:
-        return "", page_count
+            if len(text.strip()) < PDF_PAGE_FALLBACK_MIN_CHARS:
+                reader = get_reader()
+                if reader is not None:
+                    try:
+                        fallback_text = _pypdf2_page_text(reader, page_index)
+                    except Exception:
+                        fallback_text = ""
+                    if len(fallback_text) > len(text.strip()):
+                        text, method = fallback_text, "pypdf2"
+
+            if not text.strip():
+                method = "none"
+            yield page_index, text, method
+    finally:
+        if plumber_pdf is not None:
+            try:
+                plumber_pdf.close()
+            except Exception:
+                pass
 
-    return "\n\n".join(page_texts).strip(), page_count
 
+def _extract_page_range_texts(file_bytes: bytes, start: int, end: int) -> List[Tuple[str, str]]:
+    """[start, end) 페이지의 (text, method) 목록 (프로세스 풀 작업 단위)."""
+    return [(text, method) for _, text, method in _iter_pdf_page_texts(file_bytes, start, end)]
 
-def _extract_text_with_pypdf2(file_bytes: bytes) -> Tuple[str, int]:
-    """PyPDF2 텍스트 추출 폴백."""
-    if PdfReader is None:
-        return "", 0
-    try:
-        reader = PdfReader(BytesIO(file_bytes))
-        chunks: List[str] = []
-        for page in reader.pages:
-            page_text = (page.extract_text() or "").strip()
-            if page_text:
-                chunks.append(page_text)
-        text = "\n".join(chunks)
-        lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-        return "\n".join(lines).strip(), len(reader.pages)
-    except Exception:
-        return "", 0
 
+class SchoolRecordPdfRejected(Exception):
+    """생기부가 아닌 PDF를 앞쪽 페이지만 보고 조기 거부 (PDF_REJECT_NON_SCHOOL_RECORD)."""
 
-def _extract_text_from_pdf_bytes(file_bytes: bytes) -> Tuple[str, int, str]:
+
+class SchoolRecordTextStream:
     """
-    PDF 텍스트 추출: pdfplumber → PyPDF2 (Gemini 미사용)
+    페이지 텍스트를 순서대로 받아
+    원문 조립 + 섹션 분리(_SchoolRecordSectionSplitter) + 조기 거부 판정을 한 번에 수행.
     """
-    text_plumber, page_count = _extract_text_with_pdfplumber_words(file_bytes)
-    if len(text_plumber.strip()) >= MIN_EXTRACTED_TEXT_CHARS:
-        return text_plumber, page_count, "pdfplumber_words"
 
-    text_pypdf2, page_count_pypdf2 = _extract_text_with_pypdf2(file_bytes)
-    if page_count <= 0:
-        page_count = page_count_pypdf2
-    if len(text_pypdf2.strip()) >= MIN_EXTRACTED_TEXT_CHARS:
-        return text_pypdf2, page_count, "pypdf2"
+    def __init__(self):
+        self.page_texts: List[str] = []
+        self.splitter = _SchoolRecordSectionSplitter()
+        self._methods: set = set()
+        self._char_count = 0
+        self._has_title = False
+        self._checked = False
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_texts)
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(text for text in self.page_texts if text).strip()
+
+    @property
+    def method(self) -> str:
+        if "pdfplumber_words" in self._methods and "pypdf2" in self._methods:
+            method = "pdfplumber_words+pypdf2"
+        elif "pypdf2" in self._methods:
+            method = "pypdf2"
+        elif "pdfplumber_words" in self._methods:
+            method = "pdfplumber_words"
+        else:
+            return "none"
+        return method if self._char_count >= MIN_EXTRACTED_TEXT_CHARS else f"{method}_partial"
+
+    def add_page(self, text: str, method: str) -> None:
+        text = (text or "").strip()
+        self.page_texts.append(text)
+        if not text:
+            return
+        self._methods.add(method)
+        self._char_count += len(text)
+        if not self._has_title and "학교생활기록부" in _compact(text):
+            self._has_title = True
+        self.splitter.feed(text)
+
+    def add_pages(self, pages: List[Tuple[str, str]]) -> None:
+        for text, method in pages:
+            self.add_page(text, method)
+
+    def check_early(self) -> None:
+        """
+        앞쪽 페이지만 보고 판단 (한 번만 수행):
+        생기부 제목도 템플릿 섹션도 없으면 다른 문서로 보고 경고 (PDF_REJECT_NON_SCHOOL_RECORD면 거부).
+        텍스트가 거의 없는 경우(이미지 표지 등)는 판단하지 않음 → 스캔본 판정은 전체 텍스트 기준으로 호출부에서.
+        """
+        if self._checked or not self.page_texts:
+            return
+        self._checked = True
+        if self._char_count < MIN_EXTRACTED_TEXT_CHARS:
+            return
+        if self._has_title or _looks_like_school_record_template(self.text):
+            return
+        if PDF_REJECT_NON_SCHOOL_RECORD:
+            raise SchoolRecordPdfRejected(NOT_SCHOOL_RECORD_PDF_MESSAGE)
+        print(f"⚠️ [school_record_pdf] 앞쪽 {self.page_count}페이지에서 생기부 제목/섹션을 찾지 못함 (계속 진행)")
+
+    def section_texts(self) -> Dict[str, str]:
+        return self.splitter.result()
 
-    # 부분 추출이라도 있으면 반환
-    if text_plumber.strip():
-        return text_plumber, page_count, "pdfplumber_words_partial"
-    if text_pypdf2.strip():
-        return text_pypdf2, page_count, "pypdf2_partial"
 
-    return "", page_count, "none"
+def _extract_school_record_pdf(file_bytes: bytes) -> SchoolRecordTextStream:
+    """
+    페이지를 순서대로 추출하면서 섹션 분리까지 진행.
+    앞쪽 PDF_EARLY_CHECK_PAGES 페이지에서 다른 문서로 거부되면 나머지 페이지는 읽지 않음.
+    """
+    stream = SchoolRecordTextStream()
+    for _, text, method in _iter_pdf_page_texts(file_bytes):
+        stream.add_page(text, method)
+        if stream.page_count >= PDF_EARLY_CHECK_PAGES:
+            stream.check_early()
+    stream.check_early()
+    return stream
+
+
+def _extract_text_from_pdf_bytes(file_bytes: bytes) -> Tuple[str, int, str]:
+    """
+    PDF 텍스트 추출: 페이지별 pdfplumber → (해당 페이지만) PyPDF2 (Gemini 미사용)
+    생기부가 아닌 PDF는 SchoolRecordPdfRejected (PDF_REJECT_NON_SCHOOL_RECORD일 때)
+    """
+    stream = _extract_school_record_pdf(file_bytes)
+    return stream.text, stream.page_count, stream.method
 
 
 def _build_pdf_file_hash(file_bytes: bytes) -> str:
@@ -331,31 +491,44 @@ def _detect_table_header_section_key(line: str) -> Optional[str]:
     return None
 
 
-def _split_school_record_sections(text: str) -> Dict[str, str]:
-    sections: Dict[str, List[str]] = {
-        "attendance": [],
-        "certificates": [],
-        "creative_activity": [],
-        "volunteer_activity": [],
-        "academic_development": [],
-        "behavior_opinion": [],
-    }
-    current_key: Optional[str] = None
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-        key = _detect_section_key(line) or _detect_table_header_section_key(line)
-        if key:
-            if key == "__ignore__":
-                current_key = None
+class _SchoolRecordSectionSplitter:
+    """_split_school_record_sections의 증분 버전 (페이지 텍스트를 순서대로 feed)."""
+
+    def __init__(self):
+        self.sections: Dict[str, List[str]] = {
+            "attendance": [],
+            "certificates": [],
+            "creative_activity": [],
+            "volunteer_activity": [],
+            "academic_development": [],
+            "behavior_opinion": [],
+        }
+        self.current_key: Optional[str] = None
+
+    def feed(self, text: str) -> None:
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if not line:
                 continue
-            current_key = key
-            sections[key].append(line)
-            continue
-        if current_key:
-            sections[current_key].append(line)
-    return {k: "\n".join(v).strip() for k, v in sections.items()}
+            key = _detect_section_key(line) or _detect_table_header_section_key(line)
+            if key:
+                if key == "__ignore__":
+                    self.current_key = None
+                    continue
+                self.current_key = key
+                self.sections[key].append(line)
+                continue
+            if self.current_key:
+                self.sections[self.current_key].append(line)
+
+    def result(self) -> Dict[str, str]:
+        return {k: "\n".join(v).strip() for k, v in self.sections.items()}
+
+
+def _split_school_record_sections(text: str) -> Dict[str, str]:
+    splitter = _SchoolRecordSectionSplitter()
+    splitter.feed(text)
+    return splitter.result()
 
 
 def _extract_grade_blocks(section_text: str) -> Dict[str, str]:
@@ -2959,8 +3132,13 @@ def _normalize_academic_subjects(parsed_school_record: Dict[str, Any]) -> None:
             _normalize_table_rows(dict_rows, table_key)
 
 
-def _build_forms_from_pdf_text(extracted_text: str) -> Dict[str, Any]:
-    section_texts = _split_school_record_sections(extracted_text)
+def _build_forms_from_pdf_text(
+    extracted_text: str,
+    section_texts: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """section_texts: 페이지 스트리밍 추출 중 이미 분리한 섹션 (없으면 원문에서 분리)"""
+    if section_texts is None:
+        section_texts = _split_school_record_sections(extracted_text)
     creative_parsed = _parse_creative_activity(section_texts.get("creative_activity", ""))
     volunteer_parsed = _parse_volunteer_activity(section_texts.get("volunteer_activity", ""))
     academic_section_text = section_texts.get("academic_development", "")
@@ -3635,6 +3813,8 @@ async def upload_school_record_pdf(
     extract_started_at = time.perf_counter()
     try:
         extracted, page_count, extraction_method = _extract_text_from_pdf_bytes(file_bytes)
+    except SchoolRecordPdfRejected as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -3,6 +3,8 @@
 
 - 생기부 원문을 기반으로 4페이지 리포트 JSON 생성
 - 1~4페이지를 병렬 생성하여 응답 속도와 일관성을 함께 확보
+- 생기부 컨텍스트는 4페이지가 공유하는 프롬프트 접두(Gemini context caching)로 1회만 전송
+- 구조화 출력(response_schema)으로 JSON을 받고, 페이지별 규칙 검증에 실패한 필드만 다시 요청
 """
 from __future__ import annotations
 
@@ -17,8 +19,13 @@ from google.generativeai.types import HarmBlockThreshold, HarmCategory
 from config.config import settings
 from config.constants import GEMINI_FLASH_MODEL
 from school_record_eval.report_context import build_school_record_report_context_text
+from services.prompt_cache import PromptPrefix, get_prompt_prefix
 
 _MAX_RETRIES = 2
+# 검증에 실패한 필드만 다시 요청하는 횟수 (페이지당)
+_MAX_FIELD_REPAIRS = 1
+# 생기부 컨텍스트 접두는 보고서 1건(4페이지 + 필드 재요청) 동안만 재사용
+VISUAL_REPORT_PROMPT_CACHE_TTL_SECONDS = 300
 
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
@@ -222,67 +229,316 @@ def _extract_student_name(school_record: Dict[str, Any]) -> str:
     return "학생"
 
 
-def _repair_json(text: str) -> str:
-    """Gemini가 반환한 깨진 JSON을 최대한 복구한다."""
-    text = re.sub(r',\s*}', '}', text)
-    text = re.sub(r',\s*]', ']', text)
-
-    open_braces = text.count('{') - text.count('}')
-    open_brackets = text.count('[') - text.count(']')
-    if open_braces > 0 or open_brackets > 0:
-        text = text.rstrip().rstrip(',')
-        text += ']' * max(0, open_brackets)
-        text += '}' * max(0, open_braces)
-
-    text = re.sub(r'(?<=\w)"(?=\w)', '\\"', text)
-    return text
-
-
 def _parse_json_response(text: str) -> Dict[str, Any]:
+    """구조화 출력(response_schema) 응답 파싱. 잘린 응답 등은 ValueError로 호출 재시도"""
     clean = (text or "").strip()
     if not clean:
         raise ValueError("빈 응답")
+    parsed = json.loads(clean)
+    if not isinstance(parsed, dict):
+        raise ValueError(f"JSON 객체가 아닌 응답: {type(parsed).__name__}")
+    return parsed
+
+
+# ---------------------------------------------------------------------------
+# 응답 스키마 (Gemini structured output, OpenAPI 부분집합)
+# ---------------------------------------------------------------------------
+
+def _string(nullable: bool = False) -> Dict[str, Any]:
+    return {"type": "STRING", "nullable": True} if nullable else {"type": "STRING"}
+
+
+def _number(*, integer: bool = False, nullable: bool = False) -> Dict[str, Any]:
+    schema: Dict[str, Any] = {"type": "INTEGER" if integer else "NUMBER"}
+    if nullable:
+        schema["nullable"] = True
+    return schema
+
+
+def _array(items: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "ARRAY", "items": items}
+
+
+def _object(properties: Dict[str, Any], required: list[str] | None = None) -> Dict[str, Any]:
+    return {
+        "type": "OBJECT",
+        "properties": properties,
+        "required": list(properties.keys()) if required is None else required,
+    }
 
-    if clean.startswith("```"):
-        lines = clean.split("\n")
-        start = 1
-        end = len(lines)
-        for i, line in enumerate(lines):
-            if i == 0:
-                continue
-            if line.strip().startswith("```"):
-                end = i
-                break
-        clean = "\n".join(lines[start:end]).strip()
 
-    brace_start = clean.find("{")
-    brace_end = clean.rfind("}") + 1
-    if brace_start >= 0 and brace_end > brace_start:
-        clean = clean[brace_start:brace_end]
+# 카드 data는 type별로 쓰는 필드가 달라 모든 필드를 선택 항목으로 두고 _card_problem에서 검사
+_CARD_SCHEMA = _object(
+    {
+        "title": _string(),
+        "subtitle": _string(),
+        "type": _string(),
+        "description": _string(nullable=True),
+        "data": _object(
+            {
+                "subjects": _array(_string()),
+                "semesters": _array(_string()),
+                "values": _array(_array(_number(integer=True, nullable=True))),
+                "quote": _string(),
+                "analysis": _string(),
+                "branchLabel": _string(),
+                "mergeLabel": _string(),
+                "nodes": _array(_object({"id": _string(), "label": _string(), "sub": _string(), "type": _string()})),
+                "rows": _array(_object({"label": _string(), "values": _array(_number()), "labels": _array(_string())})),
+            },
+            required=[],
+        ),
+    },
+    required=["title", "subtitle", "type", "data"],
+)
+
+_PAGE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "page1": _object({
+        "grades": _object({
+            "subjects": _array(_object({
+                "name": _string(),
+                "grades": _array(_number(integer=True, nullable=True)),
+                "color": _string(),
+            })),
+            "semesters": _array(_string()),
+            "avgAll": _array(_number(nullable=True)),
+            "avgMain": _array(_number(nullable=True)),
+        }),
+        "radar": _object({
+            "values": _array(_number()),
+            "labels": _array(_string()),
+            "totalScore": _number(),
+        }),
+        "studentType": _string(),
+        "studentTypeHighlight": _string(),
+        "hashtags": _array(_string()),
+        "summary": _string(),
+        "growthSummary": _string(),
+        "growthSteps": _array(_object({"title": _string(), "desc": _string(), "sub": _string()})),
+        "keyPoints": _array(_object({"label": _string(), "desc": _string()})),
+    }),
+    "page2": _object({"strengths": _array(_CARD_SCHEMA)}),
+    "page3": _object({"weaknesses": _array(_CARD_SCHEMA), "diagnosisSummary": _string()}),
+    "page4": _object({
+        "targetMajor": _string(),
+        "comparisons": _array(_object({
+            "title": _string(),
+            "subtitle": _string(),
+            "accepted": _object({"label": _string(), "text": _string()}),
+            "student": _object({"text": _string()}),
+            "highlight": _string(),
+        })),
+    }),
+}
 
-    try:
-        return json.loads(clean)
-    except json.JSONDecodeError:
-        repaired = _repair_json(clean)
-        return json.loads(repaired)
+# 카드 목록 필드 -> (허용 type, type별 최소 개수)
+_CARD_FIELD_RULES: Dict[str, tuple] = {
+    "strengths": (
+        {"heatmap", "text-analysis", "flowchart"},
+        {"heatmap": 1, "text-analysis": 2, "flowchart": 1},
+    ),
+    "weaknesses": (
+        {"bar-chart", "text-analysis", "flowchart"},
+        {"text-analysis": 2, "flowchart": 1},
+    ),
+}
+_MIN_FLOWCHART_NODES = 7
+
+
+# ---------------------------------------------------------------------------
+# 필드 단위 검증: {필드 경로: 문제} (경로는 "summary" 또는 "strengths[2]")
+# ---------------------------------------------------------------------------
+
+def _filled(value: Any) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def _card_problem(card: Any, allowed_types: set, *, has_real_grades: bool = False) -> str | None:
+    if not isinstance(card, dict):
+        return "카드가 객체가 아님"
+    if not _filled(card.get("title")):
+        return "title 누락"
+    card_type = card.get("type")
+    if card_type not in allowed_types:
+        return f"허용되지 않는 type: {card_type}"
+    data = card.get("data")
+    if not isinstance(data, dict):
+        return "data 누락"
+    if card_type == "heatmap":
+        # 실제 석차등급이 있으면 _apply_real_grades 가 data를 덮어씀
+        if not has_real_grades and not all(isinstance(data.get(key), list) and data.get(key) for key in ("subjects", "semesters", "values")):
+            return "heatmap subjects/semesters/values 누락"
+    elif card_type == "text-analysis":
+        if not (_filled(data.get("quote")) and _filled(data.get("analysis"))):
+            return "quote/analysis 누락"
+    elif card_type == "flowchart":
+        nodes = data.get("nodes")
+        if not isinstance(nodes, list) or len(nodes) < _MIN_FLOWCHART_NODES:
+            return f"flowchart 노드 {_MIN_FLOWCHART_NODES}개 미만"
+        if not all(isinstance(node, dict) and _filled(node.get("label")) for node in nodes):
+            return "flowchart 노드 label 누락"
+        if not (_filled(data.get("branchLabel")) and _filled(data.get("mergeLabel"))):
+            return "branchLabel/mergeLabel 누락"
+    elif card_type == "bar-chart":
+        rows = data.get("rows")
+        if not isinstance(rows, list) or not rows:
+            return "bar-chart rows 누락"
+        if not all(isinstance(row, dict) and isinstance(row.get("values"), list) for row in rows):
+            return "bar-chart rows.values 누락"
+    return None
+
+
+def _validate_cards(field: str, cards: Any, *, has_real_grades: bool = False) -> Dict[str, str]:
+    allowed_types, min_counts = _CARD_FIELD_RULES[field]
+    if not isinstance(cards, list) or not 3 <= len(cards) <= 4:
+        return {field: "카드 3~4개 필요"}
+    declared = [card.get("type") if isinstance(card, dict) else None for card in cards]
+    for card_type, min_count in min_counts.items():
+        if declared.count(card_type) < min_count:
+            # 구성 자체가 틀리면 목록 전체를 다시 요청
+            return {field: f"{card_type} 카드 {min_count}개 이상 필요"}
+    problems = {}
+    for idx, card in enumerate(cards):
+        problem = _card_problem(card, allowed_types, has_real_grades=has_real_grades)
+        if problem:
+            problems[f"{field}[{idx}]"] = problem
+    return problems
+
+
+def _validate_page(page_name: str, page: Dict[str, Any], *, has_real_grades: bool = False) -> Dict[str, str]:
+    problems: Dict[str, str] = {}
+    if page_name == "page1":
+        grades = page.get("grades")
+        if not has_real_grades and not (
+            isinstance(grades, dict)
+            and isinstance(grades.get("subjects"), list)
+            and isinstance(grades.get("semesters"), list)
+        ):
+            problems["grades"] = "grades.subjects/semesters 누락"
+        radar = page.get("radar")
+        if not (
+            isinstance(radar, dict)
+            and isinstance(radar.get("values"), list)
+            and len(radar["values"]) == 6
+            and all(isinstance(value, (int, float)) for value in radar["values"])
+            and isinstance(radar.get("totalScore"), (int, float))
+        ):
+            problems["radar"] = "radar values 6개/totalScore 필요"
+        for key in ("studentType", "studentTypeHighlight", "summary", "growthSummary"):
+            if not _filled(page.get(key)):
+                problems[key] = "빈 문자열"
+        hashtags = page.get("hashtags")
+        if not isinstance(hashtags, list) or not any(_filled(tag) for tag in hashtags):
+            problems["hashtags"] = "해시태그 누락"
+        steps = page.get("growthSteps")
+        if not isinstance(steps, list) or not steps or not all(isinstance(step, dict) and _filled(step.get("title")) for step in steps):
+            problems["growthSteps"] = "growthSteps title 누락"
+        points = page.get("keyPoints")
+        if not (
+            isinstance(points, list)
+            and len(points) == 3
+            and all(isinstance(point, dict) and _filled(point.get("label")) and _filled(point.get("desc")) for point in points)
+        ):
+            problems["keyPoints"] = "keyPoints 정확히 3개(label/desc) 필요"
+    elif page_name == "page2":
+        problems.update(_validate_cards("strengths", page.get("strengths"), has_real_grades=has_real_grades))
+    elif page_name == "page3":
+        problems.update(_validate_cards("weaknesses", page.get("weaknesses")))
+        if not _filled(page.get("diagnosisSummary")):
+            problems["diagnosisSummary"] = "빈 문자열"
+    elif page_name == "page4":
+        if not _filled(page.get("targetMajor")):
+            problems["targetMajor"] = "빈 문자열"
+        comparisons = page.get("comparisons")
+        if not isinstance(comparisons, list) or len(comparisons) != 3:
+            problems["comparisons"] = "comparisons 정확히 3개 필요"
+        else:
+            for idx, item in enumerate(comparisons):
+                if not (
+                    isinstance(item, dict)
+                    and _filled(item.get("title"))
+                    and _filled((item.get("accepted") or {}).get("text"))
+                    and _filled((item.get("student") or {}).get("text"))
+                    and _filled(item.get("highlight"))
+                ):
+                    problems[f"comparisons[{idx}]"] = "title/accepted.text/student.text/highlight 누락"
+    return problems
+
+
+def _split_field_path(path: str) -> tuple:
+    """'strengths[2]' -> ('strengths', 2), 'summary' -> ('summary', None)"""
+    match = re.fullmatch(r"(\w+)\[(\d+)\]", path)
+    if match:
+        return match.group(1), int(match.group(2))
+    return path, None
+
+
+def _field_schema(page_name: str, path: str) -> Dict[str, Any]:
+    field, index = _split_field_path(path)
+    schema = _PAGE_SCHEMAS[page_name]["properties"][field]
+    return schema["items"] if index is not None else schema
+
+
+def _field_key(path: str) -> str:
+    """응답 스키마 속성 이름 ('strengths[2]' -> 'strengths_2')"""
+    field, index = _split_field_path(path)
+    return field if index is None else f"{field}_{index}"
+
+
+def _field_repair_prompt(page_prompt: str, page: Dict[str, Any], problems: Dict[str, str]) -> str:
+    lines = []
+    for path, problem in problems.items():
+        field, index = _split_field_path(path)
+        current = page.get(field)
+        if index is not None and isinstance(current, list) and index < len(current):
+            current = current[index]
+        current_json = json.dumps(current, ensure_ascii=False)
+        if len(current_json) > 1200:
+            current_json = current_json[:1200] + "..."
+        lines.append(f"- {_field_key(path)} ({path}): {problem}\n  현재 값: {current_json}")
+    return f"""{page_prompt}
+
+[재요청]
+위 페이지 JSON을 이미 생성했지만 아래 필드가 규칙에 맞지 않는다.
+나머지 필드는 그대로 두고, 아래 필드만 규칙에 맞게 다시 생성하라.
+응답 JSON의 키는 아래 목록의 키 이름을 그대로 쓴다.
+
+{chr(10).join(lines)}
+"""
 
 
-async def _generate_json(prompt: str, *, max_output_tokens: int = 4096) -> Dict[str, Any]:
+def _merge_fields(page: Dict[str, Any], problems: Dict[str, str], repaired: Dict[str, Any]) -> None:
+    for path in problems:
+        value = repaired.get(_field_key(path))
+        if value is None:
+            continue
+        field, index = _split_field_path(path)
+        if index is None:
+            page[field] = value
+        elif isinstance(page.get(field), list) and index < len(page[field]):
+            page[field][index] = value
+
+
+async def _generate_json(
+    prompt_prefix: PromptPrefix,
+    prompt: str,
+    response_schema: Dict[str, Any],
+    *,
+    max_output_tokens: int = 4096,
+) -> Dict[str, Any]:
     last_error: Exception | None = None
     for attempt in range(_MAX_RETRIES + 1):
         try:
-            model = genai.GenerativeModel(
-                model_name=GEMINI_FLASH_MODEL,
-                system_instruction=VISUAL_REPORT_SYSTEM_PROMPT,
+            generation_config = genai.types.GenerationConfig(
+                temperature=0.15 + attempt * 0.05,
+                max_output_tokens=max_output_tokens,
+                response_mime_type="application/json",
+                response_schema=response_schema,
             )
             response = await asyncio.to_thread(
-                model.generate_content,
+                prompt_prefix.generate_content,
                 prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.15 + attempt * 0.05,
-                    max_output_tokens=max_output_tokens,
-                    response_mime_type="application/json",
-                ),
+                generation_config=generation_config,
                 safety_settings=_SAFETY_SETTINGS,
             )
             raw_text = getattr(response, "text", "") or ""
@@ -299,193 +555,46 @@ async def _generate_json(prompt: str, *, max_output_tokens: int = 4096) -> Dict[
     raise last_error  # type: ignore[misc]
 
 
-def _full_report_prompt(student_name: str, context: str) -> str:
-    return f"""아래 생기부 컨텍스트를 분석하여 4페이지 시각 보고서용 JSON 전체를 한 번에 생성하라.
-
-[학생 이름]
-{student_name}
-
-[생기부 컨텍스트]
-{context}
-
-[중요]
-- 프론트엔드는 이미 고정 템플릿을 갖고 있다.
-- 당신은 레이아웃이 아니라 '값과 문구'만 채운다.
-- 따라서 문장은 풍부하되, 각 필드는 카드/도형 안에 들어갈 수 있도록 길이를 과도하게 늘리지 마라.
-- 4페이지를 각각 따로 설명하지 말고 최종 JSON 한 번만 출력한다.
-
-[출력 JSON 스키마]
-{{
-  "studentName": "{student_name}",
-  "page1": {{
-    "grades": {{
-      "subjects": [
-        {{ "name": "국어", "grades": [4,4,3,4,2], "color": "#F97316" }},
-        {{ "name": "수학", "grades": [2,1,1,1,3], "color": "#EF4444" }}
-      ],
-      "semesters": ["1-1","1-2","2-1","2-2","3-1"],
-      "avgAll": [3.2,3.0,2.1,2.6,2.75],
-      "avgMain": [3.2,3.0,2.0,2.75,2.33]
-    }},
-    "radar": {{
-      "values": [0.62,0.72,0.55,0.68,0.62,0.75],
-      "labels": ["학업역량","탐구 깊이","진로 연결성","공동체역량","창의융합역량","자기주도성"],
-      "totalScore": 65
-    }},
-    "studentType": "강점 키워드가 돋보이는",
-    "studentTypeHighlight": "유형명",
-    "hashtags": ["#태그1","#태그2","#태그3"],
-    "summary": "3문장 이상의 요약",
-    "growthSummary": "UNIROAD 한 줄 요약",
-    "growthSteps": [
-      {{ "title": "1-1", "desc": "기초 역량 형성", "sub": "8~16자 설명" }}
-    ],
-    "keyPoints": [
-      {{ "label": "관심 심화", "desc": "55~95자 설명" }},
-      {{ "label": "도구 습득", "desc": "55~95자 설명" }},
-      {{ "label": "전공 실증", "desc": "55~95자 설명" }}
-    ]
-  }},
-  "page2": {{
-    "strengths": [
-      {{
-        "title": "강점 제목",
-        "subtitle": "출처 영역",
-        "type": "heatmap",
-        "description": "1~2문장 설명",
-        "data": {{
-          "subjects": ["국어","수학","영어","사회","과학"],
-          "semesters": ["1-1","1-2","2-1","2-2","3-1"],
-          "values": [[4,4,3,4,2],[2,1,1,1,3],[3,3,2,3,2],[3,3,null,null,null],[4,4,2,3,null]]
-        }}
-      }},
-      {{
-        "title": "강점 제목",
-        "subtitle": "출처 영역",
-        "type": "text-analysis",
-        "description": null,
-        "data": {{
-          "quote": "실제 원문 인용",
-          "analysis": "근거-해석-입시 의미가 포함된 분석"
-        }}
-      }},
-      {{
-        "title": "강점 제목",
-        "subtitle": "출처 영역",
-        "type": "flowchart",
-        "description": "설명",
-        "data": {{
-          "branchLabel": "전문 확장",
-          "mergeLabel": "역량 통합",
-          "nodes": [
-            {{ "id": "s1", "label": "시작 노드", "sub": "짧은 설명", "type": "start" }},
-            {{ "id": "s2", "label": "중간 노드", "sub": "짧은 설명", "type": "activity" }},
-            {{ "id": "s3", "label": "중간 노드", "sub": "짧은 설명", "type": "activity" }},
-            {{ "id": "s4", "label": "중간 노드", "sub": "짧은 설명", "type": "milestone" }},
-            {{ "id": "s5", "label": "중간 노드", "sub": "짧은 설명", "type": "milestone" }},
-            {{ "id": "s6", "label": "중간 노드", "sub": "짧은 설명", "type": "activity" }},
-            {{ "id": "s7", "label": "결과 노드", "sub": "짧은 설명", "type": "result" }}
-          ]
-        }}
-      }}
-    ]
-  }},
-  "page3": {{
-    "weaknesses": [
-      {{
-        "title": "약점 제목",
-        "subtitle": "출처 영역",
-        "type": "bar-chart",
-        "description": "설명",
-        "data": {{
-          "rows": [
-            {{ "label": "1학년", "values": [70,30], "labels": ["감상형","실증형"] }},
-            {{ "label": "2학년", "values": [45,55], "labels": ["감상형","실증형"] }},
-            {{ "label": "3학년", "values": [20,80], "labels": ["감상형","실증형"] }}
-          ]
-        }}
-      }},
-      {{
-        "title": "약점 제목",
-        "subtitle": "출처 영역",
-        "type": "text-analysis",
-        "description": null,
-        "data": {{
-          "quote": "실제 원문 인용",
-          "analysis": "무엇이 비는지 / 왜 아쉬운지 / 어떻게 보완할지"
-        }}
-      }},
-      {{
-        "title": "약점 제목",
-        "subtitle": "출처 영역",
-        "type": "flowchart",
-        "description": "설명",
-        "data": {{
-          "branchLabel": "전환 지점",
-          "mergeLabel": "보완 필요",
-          "nodes": [
-            {{ "id": "w1", "label": "시작 노드", "sub": "짧은 설명", "type": "activity" }},
-            {{ "id": "w2", "label": "중간 노드", "sub": "짧은 설명", "type": "activity" }},
-            {{ "id": "w3", "label": "중간 노드", "sub": "짧은 설명", "type": "warning" }},
-            {{ "id": "w4", "label": "중간 노드", "sub": "짧은 설명", "type": "activity" }},
-            {{ "id": "w5", "label": "중간 노드", "sub": "짧은 설명", "type": "missing" }},
-            {{ "id": "w6", "label": "중간 노드", "sub": "짧은 설명", "type": "missing" }},
-            {{ "id": "w7", "label": "결론 노드", "sub": "짧은 설명", "type": "warning" }}
-          ]
-        }}
-      }}
-    ],
-    "diagnosisSummary": "핵심 진단"
-  }},
-  "page4": {{
-    "targetMajor": "전공명",
-    "comparisons": [
-      {{
-        "title": "탐구 깊이 비교",
-        "subtitle": "세특 서술 방식",
-        "accepted": {{ "label": "S대 OO학과", "text": "합격자 수준 예시" }},
-        "student": {{ "text": "학생 실제 기록 기반 요약" }},
-        "highlight": "차이와 보완점"
-      }},
-      {{
-        "title": "전공 연결성 비교",
-        "subtitle": "교과 간 서사 연결",
-        "accepted": {{ "label": "Y대 OO학과", "text": "합격자 수준 예시" }},
-        "student": {{ "text": "학생 실제 기록 기반 요약" }},
-        "highlight": "차이와 보완점"
-      }},
-      {{
-        "title": "데이터 활용 능력 비교",
-        "subtitle": "탐구 방법론",
-        "accepted": {{ "label": "K대 OO학과", "text": "합격자 수준 예시" }},
-        "student": {{ "text": "학생 실제 기록 기반 요약" }},
-        "highlight": "차이와 보완점"
-      }}
-    ]
-  }}
-}}
-
-[필수 규칙]
-1. 프론트는 고정 렌더러를 사용하므로, 당신은 값과 텍스트만 제공한다.
-2. 차트 좌표, 스타일, 정렬은 프론트가 처리한다.
-3. semesters는 실제 학기 수로 작성한다. 최소 4개, 최대 6개.
-4. radar totalScore는 학업역량 3배 가중 공식으로 산출한다.
-5. 강점/약점은 각각 3~4개, 가능하면 4개.
-6. strength/weakness 모두 text-analysis 최소 2개, flowchart 최소 1개 포함.
-7. flowchart는 최소 7노드, 복합 흐름 구조를 반영한다.
-8. 모든 quote는 실제 생기부 문장 일부를 인용한다.
-9. JSON만 출력한다.
-"""
-
+async def _generate_page(
+    prompt_prefix: PromptPrefix,
+    page_name: str,
+    page_prompt: str,
+    *,
+    has_real_grades: bool = False,
+) -> Dict[str, Any]:
+    """페이지 생성 → 검증 → 규칙에 맞지 않는 필드만 재요청 (페이지 전체를 다시 만들지 않음)"""
+    page = await _generate_json(
+        prompt_prefix,
+        page_prompt,
+        _PAGE_SCHEMAS[page_name],
+        max_output_tokens=8192,
+    )
+    for repair_round in range(_MAX_FIELD_REPAIRS):
+        problems = _validate_page(page_name, page, has_real_grades=has_real_grades)
+        if not problems:
+            return page
+        print(f"[VisualReport] {page_name} 필드 재요청 (round={repair_round + 1}): {problems}")
+        repair_schema = _object({_field_key(path): _field_schema(page_name, path) for path in problems})
+        try:
+            repaired = await _generate_json(
+                prompt_prefix,
+                _field_repair_prompt(page_prompt, page, problems),
+                repair_schema,
+                max_output_tokens=4096,
+            )
+        except Exception as e:
+            print(f"[VisualReport] {page_name} 필드 재요청 실패: {type(e).__name__}: {e}")
+            break
+        _merge_fields(page, problems, repaired)
 
-def _page1_prompt(student_name: str, context: str) -> str:
-    return f"""아래 생기부 컨텍스트를 분석하여 1페이지 JSON만 생성하라.
+    remaining = _validate_page(page_name, page, has_real_grades=has_real_grades)
+    if remaining:
+        print(f"[VisualReport] {page_name} 검증 미통과 필드 (그대로 반환): {remaining}")
+    return page
 
-[학생 이름]
-{student_name}
 
-[생기부 컨텍스트]
-{context}
+def _page1_prompt() -> str:
+    return f"""위 생기부 컨텍스트를 분석하여 1페이지 JSON만 생성하라.
 
 [출력 JSON 스키마]
 {{
@@ -529,70 +638,64 @@ def _page1_prompt(student_name: str, context: str) -> str:
 """
 
 
-def _page2_prompt(student_name: str, context: str) -> str:
-    return f"""아래 생기부 컨텍스트를 분석하여 2페이지(핵심 강점) JSON만 생성하라.
-
-[학생 이름]
-{student_name}
-
-[생기부 컨텍스트]
-{context}
+def _page2_prompt() -> str:
+    return """위 생기부 컨텍스트를 분석하여 2페이지(핵심 강점) JSON만 생성하라.
 
 [출력 JSON 스키마]
-{{
+{
   "strengths": [
-    {{
+    {
       "title": "수학 교과 역량",
       "subtitle": "교과 성적 전반",
       "type": "heatmap",
       "description": "1~2문장",
-      "data": {{
+      "data": {
         "subjects": ["국어","수학","영어","사회","과학"],
         "semesters": ["1-1","1-2","2-1","2-2","3-1"],
         "values": [[4,4,3,4,2],[2,1,1,1,3],[3,3,2,3,2],[3,3,null,null,null],[4,4,2,3,null]]
-      }}
-    }},
-    {{
+      }
+    },
+    {
       "title": "공학적 탐구와 실험 설계",
       "subtitle": "3학년 세특",
       "type": "text-analysis",
       "description": null,
-      "data": {{
+      "data": {
         "quote": "실제 세특/창체 원문 발췌 90~220자",
         "analysis": "140~260자 분석"
-      }}
-    }},
-    {{
+      }
+    },
+    {
       "title": "자기주도 학습과 멘토링",
       "subtitle": "수학 멘토 활동",
       "type": "text-analysis",
       "description": null,
-      "data": {{
+      "data": {
         "quote": "실제 세특/창체 원문 발췌 90~220자",
         "analysis": "140~260자 분석"
-      }}
-    }},
-    {{
+      }
+    },
+    {
       "title": "심화탐구흐름",
       "subtitle": "세특 전반",
       "type": "flowchart",
       "description": "120~220자 설명",
-      "data": {{
+      "data": {
         "branchLabel": "전문 확장",
         "mergeLabel": "역량 통합",
         "nodes": [
-          {{ "id": "s1", "label": "수학 흥미", "sub": "기초 관심 형성", "type": "start" }},
-          {{ "id": "s2", "label": "과학 확장", "sub": "실험 탐구 연결", "type": "activity" }},
-          {{ "id": "s3", "label": "도구 습득", "sub": "확통·기하 활용", "type": "activity" }},
-          {{ "id": "s4", "label": "주제 심화", "sub": "공학 문제 적용", "type": "milestone" }},
-          {{ "id": "s5", "label": "실증 분석", "sub": "곡선·광학 탐구", "type": "milestone" }},
-          {{ "id": "s6", "label": "성과 정리", "sub": "탐구 결과 구조화", "type": "activity" }},
-          {{ "id": "s7", "label": "전공 적합", "sub": "공학 역량 입증", "type": "result" }}
+          { "id": "s1", "label": "수학 흥미", "sub": "기초 관심 형성", "type": "start" },
+          { "id": "s2", "label": "과학 확장", "sub": "실험 탐구 연결", "type": "activity" },
+          { "id": "s3", "label": "도구 습득", "sub": "확통·기하 활용", "type": "activity" },
+          { "id": "s4", "label": "주제 심화", "sub": "공학 문제 적용", "type": "milestone" },
+          { "id": "s5", "label": "실증 분석", "sub": "곡선·광학 탐구", "type": "milestone" },
+          { "id": "s6", "label": "성과 정리", "sub": "탐구 결과 구조화", "type": "activity" },
+          { "id": "s7", "label": "전공 적합", "sub": "공학 역량 입증", "type": "result" }
         ]
-      }}
-    }}
+      }
+    }
   ]
-}}
+}
 
 [필수 규칙]
 1. 강점은 3~4개 작성하되 가능하면 4개로 작성한다.
@@ -608,73 +711,67 @@ def _page2_prompt(student_name: str, context: str) -> str:
 """
 
 
-def _page3_prompt(student_name: str, context: str) -> str:
-    return f"""아래 생기부 컨텍스트를 분석하여 3페이지(핵심 약점) JSON만 생성하라.
-
-[학생 이름]
-{student_name}
-
-[생기부 컨텍스트]
-{context}
+def _page3_prompt() -> str:
+    return """위 생기부 컨텍스트를 분석하여 3페이지(핵심 약점) JSON만 생성하라.
 
 [출력 JSON 스키마]
-{{
+{
   "weaknesses": [
-    {{
+    {
       "title": "세특 서술 깊이 변화",
       "subtitle": "세특 전반",
       "type": "bar-chart",
       "description": "100~190자 설명",
-      "data": {{
+      "data": {
         "rows": [
-          {{ "label": "1학년", "values": [70,30], "labels": ["감상형","실증형"] }},
-          {{ "label": "2학년", "values": [45,55], "labels": ["감상형","실증형"] }},
-          {{ "label": "3학년", "values": [20,80], "labels": ["감상형","실증형"] }}
+          { "label": "1학년", "values": [70,30], "labels": ["감상형","실증형"] },
+          { "label": "2학년", "values": [45,55], "labels": ["감상형","실증형"] },
+          { "label": "3학년", "values": [20,80], "labels": ["감상형","실증형"] }
         ]
-      }}
-    }},
-    {{
+      }
+    },
+    {
       "title": "전공 연결성",
       "subtitle": "대표 세특 발췌",
       "type": "text-analysis",
       "description": null,
-      "data": {{
+      "data": {
         "quote": "실제 세특/창체 원문 발췌 90~220자",
         "analysis": "140~260자 분석"
-      }}
-    }},
-    {{
+      }
+    },
+    {
       "title": "서술 깊이 편차",
       "subtitle": "대표 세특 발췌",
       "type": "text-analysis",
       "description": null,
-      "data": {{
+      "data": {
         "quote": "실제 세특/창체 원문 발췌 90~220자",
         "analysis": "140~260자 분석"
-      }}
-    }},
-    {{
+      }
+    },
+    {
       "title": "진로 전환 흐름",
       "subtitle": "학년별 진로 활동",
       "type": "flowchart",
       "description": "120~220자 설명",
-      "data": {{
+      "data": {
         "branchLabel": "전환 지점",
         "mergeLabel": "보완 필요",
         "nodes": [
-          {{ "id": "w1", "label": "초기 관심", "sub": "1학년 주제 시작", "type": "activity" }},
-          {{ "id": "w2", "label": "관심 확장", "sub": "다른 분야 탐색", "type": "activity" }},
-          {{ "id": "w3", "label": "전환 지점", "sub": "왜 바뀌는지 약함", "type": "warning" }},
-          {{ "id": "w4", "label": "새 진로", "sub": "후반 주제 집중", "type": "activity" }},
-          {{ "id": "w5", "label": "후속 검증", "sub": "연결 서사 부족", "type": "missing" }},
-          {{ "id": "w6", "label": "공백 구간", "sub": "중간 연결 약함", "type": "missing" }},
-          {{ "id": "w7", "label": "보완 필요", "sub": "한 줄 서사 정리", "type": "warning" }}
+          { "id": "w1", "label": "초기 관심", "sub": "1학년 주제 시작", "type": "activity" },
+          { "id": "w2", "label": "관심 확장", "sub": "다른 분야 탐색", "type": "activity" },
+          { "id": "w3", "label": "전환 지점", "sub": "왜 바뀌는지 약함", "type": "warning" },
+          { "id": "w4", "label": "새 진로", "sub": "후반 주제 집중", "type": "activity" },
+          { "id": "w5", "label": "후속 검증", "sub": "연결 서사 부족", "type": "missing" },
+          { "id": "w6", "label": "공백 구간", "sub": "중간 연결 약함", "type": "missing" },
+          { "id": "w7", "label": "보완 필요", "sub": "한 줄 서사 정리", "type": "warning" }
         ]
-      }}
-    }}
+      }
+    }
   ],
   "diagnosisSummary": "2문장 내 핵심 진단"
-}}
+}
 
 [필수 규칙]
 1. 약점은 3~4개 작성하되 가능하면 4개로 작성한다.
@@ -690,57 +787,51 @@ def _page3_prompt(student_name: str, context: str) -> str:
 """
 
 
-def _page4_prompt(student_name: str, context: str) -> str:
-    return f"""아래 생기부 컨텍스트를 분석하여 4페이지(합격자 비교 분석) JSON만 생성하라.
-
-[학생 이름]
-{student_name}
-
-[생기부 컨텍스트]
-{context}
+def _page4_prompt() -> str:
+    return """위 생기부 컨텍스트를 분석하여 4페이지(합격자 비교 분석) JSON만 생성하라.
 
 [출력 JSON 스키마]
-{{
+{
   "targetMajor": "학생에게 가장 자연스러운 계열/전공명",
   "comparisons": [
-    {{
+    {
       "title": "탐구 깊이 비교",
       "subtitle": "세특 서술 방식",
-      "accepted": {{
+      "accepted": {
         "label": "S대 OO학과",
         "text": "일반적인 합격자 수준의 우수 세특 예시 180~320자"
-      }},
-      "student": {{
+      },
+      "student": {
         "text": "해당 학생의 실제 기록 기반 요약 180~320자"
-      }},
+      },
       "highlight": "110~200자 비교 분석"
-    }},
-    {{
+    },
+    {
       "title": "전공 연결성 비교",
       "subtitle": "교과 간 서사 연결",
-      "accepted": {{
+      "accepted": {
         "label": "Y대 OO학과",
         "text": "일반적인 합격자 수준의 우수 세특 예시 180~320자"
-      }},
-      "student": {{
+      },
+      "student": {
         "text": "해당 학생의 실제 기록 기반 요약 180~320자"
-      }},
+      },
       "highlight": "110~200자 비교 분석"
-    }},
-    {{
+    },
+    {
       "title": "데이터 활용 능력 비교",
       "subtitle": "탐구 방법론",
-      "accepted": {{
+      "accepted": {
         "label": "K대 OO학과",
         "text": "일반적인 합격자 수준의 우수 세특 예시 180~320자"
-      }},
-      "student": {{
+      },
+      "student": {
         "text": "해당 학생의 실제 기록 기반 요약 180~320자"
-      }},
+      },
       "highlight": "110~200자 비교 분석"
-    }}
+    }
   ]
-}}
+}
 
 [필수 규칙]
 1. comparisons는 정확히 3개다.
@@ -799,13 +890,19 @@ async def generate_visual_report_data(
     student_name = _extract_student_name(school_record)
     grade_data = _extract_grade_data(school_record)
 
-    page1_task = _generate_json(_page1_prompt(student_name, context), max_output_tokens=8192)
-    page2_task = _generate_json(_page2_prompt(student_name, context), max_output_tokens=8192)
-    page3_task = _generate_json(_page3_prompt(student_name, context), max_output_tokens=8192)
-    page4_task = _generate_json(_page4_prompt(student_name, context), max_output_tokens=8192)
+    # 4페이지가 공유하는 학생 이름 + 생기부 컨텍스트는 캐시 접두로 1회만 전송
+    prompt_prefix = get_prompt_prefix(
+        GEMINI_FLASH_MODEL,
+        VISUAL_REPORT_SYSTEM_PROMPT,
+        shared_text=f"[학생 이름]\n{student_name}\n\n[생기부 컨텍스트]\n{context}",
+        ttl_seconds=VISUAL_REPORT_PROMPT_CACHE_TTL_SECONDS,
+    )
 
     page1, page2, page3, page4 = await asyncio.gather(
-        page1_task, page2_task, page3_task, page4_task,
+        _generate_page(prompt_prefix, "page1", _page1_prompt(), has_real_grades=bool(grade_data)),
+        _generate_page(prompt_prefix, "page2", _page2_prompt(), has_real_grades=bool(grade_data)),
+        _generate_page(prompt_prefix, "page3", _page3_prompt()),
+        _generate_page(prompt_prefix, "page4", _page4_prompt()),
     )
 
     if grade_data:
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+합격자 생기부 사례 인덱스 빌드 스크립트.
+
+fixtures/hardcoded_school_records.json 을 읽어 사례별 파생 필드(검색용 텍스트, 핵심 키워드,
+기록 유형, 대학/전공/계열 태그)와 임베딩을 계산해
+fixtures/hardcoded_school_records.index.json 에 저장한다.
+
+사례 원문을 수정한 뒤 다시 실행. API 키가 없거나 --skip-embeddings 면 임베딩 없이 저장.
+
+Usage:
+  ./venv/bin/python scripts/build_accepted_case_index.py
+  ./venv/bin/python scripts/build_accepted_case_index.py --skip-embeddings
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from dotenv import load_dotenv
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from school_record_eval.accepted_cases import (  # noqa: E402
+    ACCEPTED_CASE_EMBEDDING_DIMENSIONS,
+    ACCEPTED_CASE_EMBEDDING_MODEL,
+    ACCEPTED_CASE_INDEX_PATH,
+    build_index_entries,
+    embedding_text_for_case,
+    load_accepted_cases,
+    source_sha256,
+)
+
+# backend/.env 명시 로드
+load_dotenv(BASE_DIR / ".env", override=False)
+
+EMBED_BATCH_SIZE = 100
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="합격자 생기부 사례 인덱스 빌드")
+    parser.add_argument("--skip-embeddings", action="store_true", help="임베딩 없이 파생 필드만 저장")
+    parser.add_argument("--output", default=str(ACCEPTED_CASE_INDEX_PATH), help="인덱스 저장 경로")
+    return parser.parse_args()
+
+
+def embed_entries(cases: Dict[str, Dict[str, Any]], entries: List[Dict[str, Any]]) -> None:
+    import google.generativeai as genai
+
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY"))
+    texts = [embedding_text_for_case(cases[entry["case_id"]], entry) for entry in entries]
+    vectors: List[List[float]] = []
+    # embed_content 배치는 요청당 최대 EMBED_BATCH_SIZE개
+    for start in range(0, len(texts), EMBED_BATCH_SIZE):
+        batch = texts[start:start + EMBED_BATCH_SIZE]
+        result = genai.embed_content(
+            model=ACCEPTED_CASE_EMBEDDING_MODEL,
+            content=batch,
+            task_type="RETRIEVAL_DOCUMENT",
+            output_dimensionality=ACCEPTED_CASE_EMBEDDING_DIMENSIONS,
+        )
+        vectors.extend(result["embedding"])
+        print(f"임베딩 {len(vectors)}/{len(texts)}")
+    if len(vectors) != len(entries):
+        raise ValueError(f"임베딩 개수 불일치 ({len(vectors)}/{len(entries)})")
+    for entry, vector in zip(entries, vectors):
+        entry["embedding"] = [round(float(value), 6) for value in vector]
+
+
+def main() -> None:
+    args = parse_args()
+    cases = load_accepted_cases()
+    entries = build_index_entries(cases)
+
+    embedding_model = None
+    if args.skip_embeddings:
+        print("임베딩 생략 (--skip-embeddings)")
+    elif not (os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")):
+        print("⚠️ GEMINI_API_KEY가 없어 임베딩 없이 저장합니다.")
+    else:
+        embed_entries(cases, entries)
+        embedding_model = ACCEPTED_CASE_EMBEDDING_MODEL
+
+    payload = {
+        "source_sha256": source_sha256(),
+        "embedding_model": embedding_model,
+        "entries": entries,
+    }
+    output_path = Path(args.output)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(f"✅ 사례 {len(entries)}건 인덱스 저장: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
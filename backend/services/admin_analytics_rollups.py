@@ -0,0 +1,144 @@
+"""
+관리자 통계 롤업 갱신 작업 + 통계 응답 캐시
+
+관리자 대시보드는 새로고침할 때마다 admin_logs / auth.users 전체를 집계하는 RPC를 다시 호출했다.
+(migrations/36_create_admin_analytics_rollups.sql 의 일별 롤업 테이블로 대체)
+
+- 주기 작업: ADMIN_ANALYTICS_ROLLUP_INTERVAL_SECONDS 마다 refresh_admin_analytics_rollups RPC 호출
+  (워터마크 전날부터만 다시 집계, 여러 워커가 동시에 호출해도 DB advisory lock으로 1개만 실행)
+- 응답 캐시: 엔드포인트별 결과를 ADMIN_STATS_CACHE_TTL_SECONDS 동안 프로세스 메모리에 보관,
+  같은 키를 동시에 요청하면 DB 조회 1회 결과를 공유. 롤업이 갱신되면 전체 폐기
+- 조회 실패는 캐시하지 않음, 만료된 항목은 저장할 때 정리 (기간 파라미터가 키에 들어가도 누적되지 않도록)
+- 다른 워커의 주기 갱신이 advisory lock을 잡고 있으면 refreshed=false (수동 갱신은 재시도 후 409)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from services.supabase_client import supabase_service
+
+
+ADMIN_ANALYTICS_ROLLUP_ENABLED = os.getenv("ADMIN_ANALYTICS_ROLLUP_ENABLED", "true").lower() != "false"
+ADMIN_ANALYTICS_ROLLUP_INTERVAL_SECONDS = float(os.getenv("ADMIN_ANALYTICS_ROLLUP_INTERVAL_SECONDS", "600"))
+ADMIN_STATS_CACHE_TTL_SECONDS = float(os.getenv("ADMIN_STATS_CACHE_TTL_SECONDS", "300"))
+ADMIN_STATS_CACHE_MAX_ENTRIES = 256
+
+
+class AdminStatsCache:
+    """키 -> (만료 시각, 값). 동기/비동기 경로 모두 지원"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = ADMIN_STATS_CACHE_TTL_SECONDS,
+        max_entries: int = ADMIN_STATS_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, asyncio.Lock] = {}
+
+    def _lookup(self, key: str) -> tuple:
+        """(캐시 적중 여부, 값)"""
+        with self._lock:
+            slot = self._entries.get(key)
+            if slot is not None and slot[0] > time.monotonic():
+                return True, slot[1]
+            return False, None
+
+    def _store(self, key: str, value: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now + self.ttl_seconds, value)
+            for expired in [k for k, slot in self._entries.items() if slot[0] <= now]:
+                self._entries.pop(expired, None)
+            while len(self._entries) > self.max_entries:
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                self._entries.pop(oldest, None)
+            # 캐시 항목이 없는 키의 single-flight 잠금도 정리 (사용 중인 잠금은 유지)
+            for stale in [k for k, lock in self._key_locks.items() if k not in self._entries and not lock.locked()]:
+                self._key_locks.pop(stale, None)
+
+    def get_or_load_sync(self, key: str, loader: Callable[[], Any]) -> Any:
+        hit, value = self._lookup(key)
+        if hit:
+            return value
+        value = loader()
+        self._store(key, value)
+        return value
+
+    async def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """캐시에 없으면 loader(동기 DB 조회)를 스레드에서 실행 (이벤트 루프를 막지 않도록)"""
+        hit, value = self._lookup(key)
+        if hit:
+            return value
+        key_lock = self._key_locks.setdefault(key, asyncio.Lock())
+        async with key_lock:
+            # 먼저 들어온 요청이 채웠으면 그대로 사용
+            hit, value = self._lookup(key)
+            if hit:
+                return value
+            value = await asyncio.to_thread(loader)
+            self._store(key, value)
+            return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for stale in [k for k, lock in self._key_locks.items() if not lock.locked()]:
+                self._key_locks.pop(stale, None)
+
+
+_cache: Optional[AdminStatsCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_admin_stats_cache() -> AdminStatsCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AdminStatsCache()
+        return _cache
+
+
+def refresh_admin_analytics_rollups(full: bool = False) -> Dict[str, Any]:
+    """
+    롤업 갱신 RPC 호출 (동기). 실제로 갱신했으면 응답 캐시 폐기.
+    Returns: {"refreshed": bool, "from_day": "YYYY-MM-DD" | None}
+    """
+    client = supabase_service.get_admin_client()
+    result = client.rpc("refresh_admin_analytics_rollups", {"p_full": full}).execute()
+    data = result.data or []
+    row = data[0] if isinstance(data, list) and data and isinstance(data[0], dict) else {}
+    refreshed = bool(row.get("refreshed"))
+    if refreshed:
+        get_admin_stats_cache().invalidate()
+    return {"refreshed": refreshed, "from_day": row.get("from_day")}
+
+
+async def _run_rollup_loop() -> None:
+    while True:
+        started_at = time.perf_counter()
+        try:
+            outcome = await asyncio.to_thread(refresh_admin_analytics_rollups)
+            if outcome["refreshed"]:
+                elapsed_ms = int((time.perf_counter() - started_at) * 1000)
+                print(f"📊 [admin_rollups] 롤업 갱신 완료 (from={outcome['from_day']}, {elapsed_ms}ms)")
+        except Exception as e:
+            print(f"⚠️ [admin_rollups] 롤업 갱신 실패 (다음 주기에 재시도): {e}")
+        await asyncio.sleep(ADMIN_ANALYTICS_ROLLUP_INTERVAL_SECONDS)
+
+
+_rollup_task: Optional[asyncio.Task] = None
+
+
+def start_admin_analytics_rollup_job() -> None:
+    """서버 시작 시 1회 호출 (프로세스당 작업 1개)"""
+    global _rollup_task
+    if not ADMIN_ANALYTICS_ROLLUP_ENABLED:
+        return
+    if _rollup_task is None or _rollup_task.done():
+        _rollup_task = asyncio.get_running_loop().create_task(_run_rollup_loop())
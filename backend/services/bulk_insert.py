@@ -0,0 +1,237 @@
+"""
+벡터 테이블 일괄 삽입 (document_chunks / academic_contents)
+
+- 임베딩 벡터는 float4 정밀도(유효숫자 7자리)로 직렬화
+  (pgvector는 float4로 저장하므로 repr(float) 17~19자리는 JSON 크기/인코딩 CPU만 늘림)
+- document_chunks
+  · INGEST_DATABASE_URL(또는 DATABASE_URL)이 있으면 psycopg2 COPY → 스테이징 테이블 → INSERT ON CONFLICT
+  · 없으면 bulk_insert_document_chunks RPC (migrations/35) 를 배치 병렬 호출
+  · (document_id, chunk_ordinal) 고유 키로 실패 배치 재시도 시 중복 없음
+  · RPC가 아직 배포되지 않았으면 기존 테이블 insert로 폴백 (이때는 재시도하지 않음)
+- academic_contents: 배치 병렬 insert
+- 테이블 insert는 returning=minimal (삽입한 벡터를 응답으로 다시 받지 않음)
+"""
+
+import importlib.util
+import io
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from config import embedding_settings as config
+
+
+_MISSING_RPC_MARKERS = ("PGRST202", "Could not find the function", "chunk_ordinal")
+
+
+def format_vector(values: Sequence[float]) -> str:
+    """pgvector 텍스트 표현 "[x,y,...]" (float4 정밀도)"""
+    return "[" + ",".join(format(float(v), ".7g") for v in values) + "]"
+
+
+def _copy_text(value: Any) -> str:
+    """COPY text 포맷 필드 이스케이프"""
+    if value is None:
+        return r"\N"
+    text = value if isinstance(value, str) else str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class BulkInserter:
+    """배치 병렬 삽입기 (submit_* 는 Future 반환, wait()로 합계 확인)"""
+
+    def __init__(
+        self,
+        client,
+        database_url: Optional[str] = None,
+        concurrency: int = None,
+        max_retries: int = 3,
+    ):
+        self.client = client
+        self.database_url = database_url if database_url is not None else config.INGEST_DATABASE_URL
+        self.concurrency = max(1, concurrency or config.BULK_INSERT_CONCURRENCY)
+        self.max_retries = max_retries
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="bulk-insert"
+        )
+        self._futures: List[Future] = []
+        self._rpc_available = True
+        self._pg_conn = None
+        self._pg_lock = threading.Lock()
+
+    # ---- document_chunks ----
+
+    def submit_document_chunks(self, document_id: int, rows: List[Dict[str, Any]]) -> Future:
+        """
+        rows: {section_id, chunk_ordinal, content, raw_data, embedding(list[float]), page_number, chunk_type}
+        """
+        future = self._executor.submit(self._insert_document_chunks, document_id, rows)
+        self._futures.append(future)
+        return future
+
+    def _insert_document_chunks(self, document_id: int, rows: List[Dict[str, Any]]) -> int:
+        if not rows:
+            return 0
+        if self.database_url and self._pg_available():
+            try:
+                return self._with_retries(lambda: self._copy_document_chunks(document_id, rows))
+            except Exception as e:
+                print(f"   ⚠️ COPY 삽입 실패, RPC 경로로 전환: {e}")
+                self.database_url = None
+
+        packed = [
+            {**row, "embedding": format_vector(row["embedding"])}
+            for row in rows
+        ]
+        if self._rpc_available:
+            try:
+                return self._with_retries(lambda: self._rpc_document_chunks(document_id, packed))
+            except Exception as e:
+                if not any(marker in str(e) for marker in _MISSING_RPC_MARKERS):
+                    raise
+                print("   ⚠️ bulk_insert_document_chunks RPC 없음 (migrations/35 미적용), 테이블 insert로 폴백")
+                self._rpc_available = False
+
+        legacy_rows = []
+        for row in packed:
+            legacy = dict(row)
+            legacy.pop("chunk_ordinal", None)
+            legacy["document_id"] = document_id
+            legacy_rows.append(legacy)
+        self.client.table("document_chunks").insert(legacy_rows, returning="minimal").execute()
+        return len(legacy_rows)
+
+    def _rpc_document_chunks(self, document_id: int, packed_rows: List[Dict[str, Any]]) -> int:
+        response = self.client.rpc(
+            "bulk_insert_document_chunks",
+            {"p_document_id": document_id, "p_rows": packed_rows},
+        ).execute()
+        return int(response.data or 0)
+
+    def _pg_available(self) -> bool:
+        if importlib.util.find_spec("psycopg2") is not None:
+            return True
+        print("   ⚠️ psycopg2 미설치 - COPY 경로 대신 RPC 사용")
+        self.database_url = None
+        return False
+
+    def _get_pg_conn(self):
+        import psycopg2
+
+        if self._pg_conn is None or self._pg_conn.closed:
+            self._pg_conn = psycopg2.connect(self.database_url)
+        return self._pg_conn
+
+    def _copy_document_chunks(self, document_id: int, rows: List[Dict[str, Any]]) -> int:
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join((
+                _copy_text(row.get("section_id")),
+                _copy_text(row.get("chunk_ordinal")),
+                _copy_text(row.get("content")),
+                _copy_text(row.get("raw_data")),
+                format_vector(row["embedding"]),
+                _copy_text(row.get("page_number")),
+                _copy_text(row.get("chunk_type")),
+            )))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        # 연결 1개를 공유하므로 COPY 배치는 순차 실행 (임베딩 생성과는 계속 겹침)
+        with self._pg_lock:
+            conn = self._get_pg_conn()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "create temp table if not exists _chunk_stage ("
+                        " section_id bigint, chunk_ordinal int, content text, raw_data text,"
+                        " embedding text, page_number int, chunk_type text"
+                        ") on commit delete rows"
+                    )
+                    cur.copy_expert(
+                        "copy _chunk_stage (section_id, chunk_ordinal, content, raw_data,"
+                        " embedding, page_number, chunk_type) from stdin",
+                        buffer,
+                    )
+                    cur.execute(
+                        "insert into document_chunks (document_id, section_id, chunk_ordinal, content,"
+                        " raw_data, embedding, page_number, chunk_type)"
+                        " select %s, section_id, chunk_ordinal, content, raw_data, embedding::vector,"
+                        " page_number, chunk_type from _chunk_stage"
+                        " on conflict (document_id, chunk_ordinal) do nothing",
+                        (document_id,),
+                    )
+                    inserted = cur.rowcount
+                conn.commit()
+                return inserted
+            except Exception:
+                try:
+                    conn.rollback()
+                except Exception:
+                    self._pg_conn = None
+                raise
+
+    # ---- 일반 테이블 (academic_contents 등) ----
+
+    def submit_rows(self, table: str, rows: List[Dict[str, Any]], vector_field: str = "embedding") -> Future:
+        """일반 테이블 배치 insert (벡터 필드는 float4 텍스트로 직렬화)"""
+        packed = [
+            {**row, vector_field: format_vector(row[vector_field])}
+            if row.get(vector_field) is not None else row
+            for row in rows
+        ]
+        def _insert() -> int:
+            # 삽입한 행(벡터 포함)을 응답으로 돌려받지 않도록 returning=minimal
+            self.client.table(table).insert(packed, returning="minimal").execute()
+            return len(packed)
+
+        future = self._executor.submit(_insert)
+        self._futures.append(future)
+        return future
+
+    # ---- 공통 ----
+
+    def _with_retries(self, fn) -> int:
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                return fn()
+            except Exception as e:
+                if attempt >= self.max_retries or any(m in str(e) for m in _MISSING_RPC_MARKERS):
+                    raise
+                delay = 2 ** (attempt - 1)
+                print(f"   ⚠️ 배치 삽입 실패, {delay}초 후 재시도 ({attempt}/{self.max_retries}): {e}")
+                time.sleep(delay)
+        return 0
+
+    def wait(self, raise_errors: bool = False) -> int:
+        """
+        제출한 모든 배치 완료 대기 후 삽입 행 수 합계 반환
+        raise_errors=False면 실패 배치는 로그만 남기고, True면 첫 오류를 다시 발생
+        """
+        inserted = 0
+        first_error: Optional[Exception] = None
+        for future in self._futures:
+            try:
+                inserted += future.result()
+            except Exception as e:
+                print(f"   ⚠️ 배치 삽입 실패: {e}")
+                first_error = first_error or e
+        self._futures = []
+        if raise_errors and first_error is not None:
+            raise first_error
+        return inserted
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        if self._pg_conn is not None:
+            try:
+                self._pg_conn.close()
+            except Exception:
+                pass
+            self._pg_conn = None
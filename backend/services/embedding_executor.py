@@ -0,0 +1,143 @@
+"""
+청크 임베딩 병렬 실행기
+
+SupabaseUploader가 청크 전체를 한 번의 embed_documents로 직렬 처리하던 것을
+배치 단위로 나눠 여러 배치를 동시에 요청하고, 끝난 배치부터 바로 DB 삽입으로 넘깁니다.
+
+- 토큰 버킷(텍스트 수/분)으로 임베딩 API 쿼터 이하로 속도 제한
+- 429/쿼터 초과 시 버킷 속도를 낮추고 지수 백오프(+지터)로 해당 배치만 재시도
+- 캐시(CachedEmbeddings)에 있는 청크는 API 호출 없이 즉시 반환
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config import embedding_settings as config
+from utils.embedding_cache import CachedEmbeddings
+from utils.rate_limiter import TokenBucket
+
+
+_RATE_LIMIT_MARKERS = ("429", "resource_exhausted", "resource exhausted", "quota", "rate limit")
+
+# 프로세스 전역 버킷 (동시에 여러 문서를 업로드해도 합산 속도 제한)
+_bucket: Optional[TokenBucket] = None
+_bucket_lock = threading.Lock()
+
+
+def get_embedding_rate_limiter() -> TokenBucket:
+    global _bucket
+    with _bucket_lock:
+        if _bucket is None:
+            _bucket = TokenBucket(config.EMBEDDING_TEXTS_PER_MINUTE)
+        return _bucket
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    message = f"{type(error).__name__} {error}".lower()
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+
+class EmbeddingBatchExecutor:
+    """배치 병렬 임베딩 (완료된 배치부터 순서와 무관하게 반환)"""
+
+    def __init__(
+        self,
+        embedder: CachedEmbeddings,
+        batch_size: int = None,
+        concurrency: int = None,
+        max_retries: int = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
+        self.embedder = embedder
+        self.batch_size = max(1, batch_size or config.EMBEDDING_BATCH_SIZE)
+        self.concurrency = max(1, concurrency or config.EMBEDDING_CONCURRENCY)
+        self.max_retries = max_retries or config.EMBEDDING_MAX_RETRIES
+        self.rate_limiter = rate_limiter or get_embedding_rate_limiter()
+        self._stats_lock = threading.Lock()
+        self.api_texts = 0
+        self.rate_limited = 0
+
+    def _embed_with_backoff(self, texts: List[str]) -> List[List[float]]:
+        for attempt in range(1, self.max_retries + 1):
+            self.rate_limiter.acquire(len(texts))
+            try:
+                vectors = self.embedder.embeddings.embed_documents(texts)
+                if len(vectors) != len(texts):
+                    raise ValueError(f"임베딩 개수 불일치 ({len(vectors)}/{len(texts)})")
+                self.rate_limiter.reward()
+                return vectors
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                if _is_rate_limited(e):
+                    self.rate_limiter.penalize()
+                    with self._stats_lock:
+                        self.rate_limited += 1
+                    delay = min(60.0, 2.0 * (2 ** (attempt - 1)))
+                    print(f"   ⏳ 임베딩 쿼터 제한, {delay:.0f}초 후 재시도 "
+                          f"(속도 {self.rate_limiter.rate_per_minute:.0f}/분, 시도 {attempt}/{self.max_retries})")
+                else:
+                    delay = min(15.0, 1.0 * (2 ** (attempt - 1)))
+                    print(f"   ⚠️ 임베딩 배치 오류, {delay:.0f}초 후 재시도 (시도 {attempt}/{self.max_retries}): {e}")
+                time.sleep(delay + random.uniform(0, delay * 0.25))
+        raise RuntimeError("임베딩 재시도 횟수 초과")
+
+    def _embed_batch(
+        self,
+        batch_texts: List[str],
+        cached: List[Optional[List[float]]],
+    ) -> List[List[float]]:
+        # 배치 안의 캐시 미스 텍스트만 (중복 제거하여) API 호출
+        missing_order: List[str] = []
+        missing_seen: Dict[str, int] = {}
+        for text, vector in zip(batch_texts, cached):
+            if vector is None and text not in missing_seen:
+                missing_seen[text] = len(missing_order)
+                missing_order.append(text)
+
+        new_vectors: List[List[float]] = []
+        if missing_order:
+            new_vectors = self._embed_with_backoff(missing_order)
+            self.embedder.store(missing_order, new_vectors)
+            with self._stats_lock:
+                self.api_texts += len(missing_order)
+
+        return [
+            vector if vector is not None else new_vectors[missing_seen[text]]
+            for text, vector in zip(batch_texts, cached)
+        ]
+
+    def iter_batches(self, texts: List[str]) -> Iterator[Tuple[int, List[List[float]]]]:
+        """
+        (시작 인덱스, 벡터 목록)을 배치가 끝나는 순서대로 반환.
+        캐시만으로 채워지는 배치는 API 호출 없이 먼저 반환.
+        """
+        cached_all = self.embedder.lookup(texts)
+        pending: List[Tuple[int, List[str], List[Optional[List[float]]]]] = []
+
+        for start in range(0, len(texts), self.batch_size):
+            batch_texts = texts[start:start + self.batch_size]
+            batch_cached = cached_all[start:start + self.batch_size]
+            if all(vector is not None for vector in batch_cached):
+                yield start, batch_cached
+            else:
+                pending.append((start, batch_texts, batch_cached))
+
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(pending))) as executor:
+            futures = {
+                executor.submit(self._embed_batch, batch_texts, batch_cached): start
+                for start, batch_texts, batch_cached in pending
+            }
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
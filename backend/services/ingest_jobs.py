@@ -0,0 +1,476 @@
+"""
+백그라운드 PDF 수집(ingest) 작업 큐
+
+/api/upload 요청이 process_pdf + Supabase 업로드가 끝날 때까지 HTTP 연결을 붙잡지 않도록
+업로드된 PDF를 작업으로 등록하고 백그라운드 워커에서 처리합니다.
+
+- 작업/진행 이벤트는 로컬 SQLite(config.INGEST_JOBS_DB)에 저장 → 서버 재시작 후에도 조회/재개 가능
+- 프로세스당 워커 수(INGEST_JOB_WORKERS)와 학교별 동시 실행 수(INGEST_JOBS_PER_SCHOOL) 제한
+- 같은 학교에 같은 파일(sha256)이 대기/실행 중이면 새 작업을 만들지 않고 기존 작업 반환
+- 단계: process(요약 → 목차 → 섹션 Vision/청킹) → upload(임베딩 → DB 삽입)
+  · process 단계 내부 LLM 결과는 core/pdf 디스크 캐시로 재사용되므로 재시도 시 끝난 페이지는 다시 호출하지 않음
+  · process 결과는 체크포인트 파일로 저장하여 upload 단계 실패 시 process를 건너뛰고 재개
+- 진행 상황은 process_pdf / upload_to_supabase_with_file의 on_progress 콜백으로 이벤트 테이블에 기록
+- 처리 중 예외도 failed 상태 + 이벤트로 기록, 서버 중단으로 멈춘 작업은 INGEST_JOB_MAX_ATTEMPTS회까지만 재개
+  · 작업 DB는 프로세스 로컬 SQLite → 시작 시점의 running 작업은 모두 이전 프로세스가 남긴 것으로 보고 재개
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from config import embedding_settings as config
+
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+TERMINAL_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED)
+
+STEP_PROCESS = "process"
+STEP_UPLOAD = "upload"
+
+# 자동 재개(requeue_stale) 최대 실행 횟수. 넘으면 실패 처리 (항상 죽는 PDF가 무한 반복되지 않도록)
+MAX_JOB_ATTEMPTS = int(os.getenv("INGEST_JOB_MAX_ATTEMPTS", "3"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id TEXT PRIMARY KEY,
+    school_name TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    file_hash TEXT NOT NULL,
+    status TEXT NOT NULL,
+    step TEXT,
+    progress TEXT,
+    error TEXT,
+    document_id INTEGER,
+    stats TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_status ON ingest_jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_school ON ingest_jobs (school_name, status);
+CREATE TABLE IF NOT EXISTS ingest_job_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    step TEXT,
+    status TEXT,
+    message TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ingest_job_events_job ON ingest_job_events (job_id, seq);
+"""
+
+
+class IngestJobStore:
+    """SQLite 기반 작업/이벤트 저장소 (호출마다 연결을 새로 열어 스레드 간 공유 문제 회피)"""
+
+    def __init__(self, db_path: str = config.INGEST_JOBS_DB):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _row_to_job(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job["stats"] = json.loads(job["stats"]) if job.get("stats") else None
+        return job
+
+    def create_job(self, school_name: str, filename: str, file_path: str, file_hash: str) -> Dict[str, Any]:
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO ingest_jobs (id, school_name, filename, file_path, file_hash, status, "
+                "step, progress, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, school_name, filename, file_path, file_hash, STATUS_QUEUED,
+                 STEP_PROCESS, "대기 중", now, now),
+            )
+        self.add_event(job_id, STEP_PROCESS, STATUS_QUEUED, "작업 대기열 등록")
+        return self.get_job(job_id)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM ingest_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row)
+
+    def find_active_job(self, school_name: str, file_hash: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM ingest_jobs WHERE school_name = ? AND file_hash = ? "
+                "AND status IN (?, ?) ORDER BY created_at LIMIT 1",
+                (school_name, file_hash, *ACTIVE_STATUSES),
+            ).fetchone()
+        return self._row_to_job(row)
+
+    def list_jobs(
+        self,
+        school_name: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        query = "SELECT * FROM ingest_jobs"
+        conditions, params = [], []
+        if school_name:
+            conditions.append("school_name = ?")
+            params.append(school_name)
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def update_job(self, job_id: str, **fields) -> None:
+        if "stats" in fields and fields["stats"] is not None:
+            fields["stats"] = json.dumps(fields["stats"], ensure_ascii=False)
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE ingest_jobs SET {assignments} WHERE id = ?",
+                (*fields.values(), job_id),
+            )
+
+    def claim_next(self, per_school_limit: int) -> Optional[str]:
+        """학교별 실행 제한을 지키며 가장 오래된 대기 작업 1개를 running으로 전환 (프로세스 간 원자적)"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT j.id FROM ingest_jobs j WHERE j.status = ? AND ("
+                "  SELECT COUNT(*) FROM ingest_jobs r WHERE r.school_name = j.school_name AND r.status = ?"
+                ") < ? ORDER BY j.created_at LIMIT 1",
+                (STATUS_QUEUED, STATUS_RUNNING, per_school_limit),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            now = time.time()
+            conn.execute(
+                "UPDATE ingest_jobs SET status = ?, attempts = attempts + 1, started_at = ?, "
+                "updated_at = ?, error = NULL WHERE id = ?",
+                (STATUS_RUNNING, now, now, row["id"]),
+            )
+            conn.execute("COMMIT")
+            return row["id"]
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def requeue_stale(
+        self,
+        stale_seconds: int = 0,
+        max_attempts: int = MAX_JOB_ATTEMPTS,
+    ) -> int:
+        """
+        서버 중단으로 멈춘 running 작업을 다시 대기열로 (stale_seconds 이내에 갱신된 작업은 제외, 기본 0 = 전부).
+        이미 max_attempts번 실행한 작업은 재개하지 않고 실패 처리. Returns: 재개한 작업 수
+        """
+        now = time.time()
+        cutoff = now - stale_seconds
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            exhausted = conn.execute(
+                "SELECT id, step FROM ingest_jobs WHERE status = ? AND updated_at <= ? AND attempts >= ?",
+                (STATUS_RUNNING, cutoff, max_attempts),
+            ).fetchall()
+            reason = f"재시도 한도 초과 ({max_attempts}회 실행 중 중단)"
+            for row in exhausted:
+                conn.execute(
+                    "UPDATE ingest_jobs SET status = ?, error = ?, progress = ?, finished_at = ?, "
+                    "updated_at = ? WHERE id = ?",
+                    (STATUS_FAILED, reason, f"실패: {reason}", now, now, row["id"]),
+                )
+                conn.execute(
+                    "INSERT INTO ingest_job_events (job_id, step, status, message, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (row["id"], row["step"], STATUS_FAILED, reason, now),
+                )
+            cursor = conn.execute(
+                "UPDATE ingest_jobs SET status = ?, progress = ?, updated_at = ? "
+                "WHERE status = ? AND updated_at <= ? AND attempts < ?",
+                (STATUS_QUEUED, "재개 대기 중", now, STATUS_RUNNING, cutoff, max_attempts),
+            )
+            conn.execute("COMMIT")
+            return cursor.rowcount
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def add_event(self, job_id: str, step: str, status: str, message: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO ingest_job_events (job_id, step, status, message, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, step, status, message, time.time()),
+            )
+
+    def list_events(self, job_id: str, after_seq: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM ingest_job_events WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, after_seq, limit),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+
+class IngestJobQueue:
+    """제한된 워커 풀로 대기 작업을 실행하는 디스패처"""
+
+    def __init__(
+        self,
+        store: IngestJobStore,
+        max_workers: int = config.INGEST_JOB_WORKERS,
+        per_school_limit: int = config.INGEST_JOBS_PER_SCHOOL,
+    ):
+        self.store = store
+        self.max_workers = max(1, max_workers)
+        self.per_school_limit = max(1, per_school_limit)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ingest-job"
+        )
+        self._lock = threading.Lock()
+        self._active = 0
+
+    # ---- 등록 / 조회 ----
+
+    def submit(self, school_name: str, filename: str, file_bytes: bytes) -> Dict[str, Any]:
+        """PDF를 작업 디렉토리에 저장하고 작업 등록 (같은 파일이 진행 중이면 기존 작업 반환)"""
+        file_hash = hashlib.sha256(file_bytes).hexdigest()
+        existing = self.store.find_active_job(school_name, file_hash)
+        if existing:
+            return {**existing, "deduplicated": True}
+
+        file_path = os.path.join(config.INGEST_JOBS_DIR, f"{file_hash[:16]}_{uuid.uuid4().hex[:8]}.pdf")
+        with open(file_path, "wb") as f:
+            f.write(file_bytes)
+
+        job = self.store.create_job(school_name, filename, file_path, file_hash)
+        self.dispatch()
+        return job
+
+    def retry(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """실패한 작업을 체크포인트부터 다시 실행"""
+        job = self.store.get_job(job_id)
+        if not job or job["status"] != STATUS_FAILED:
+            return job
+        if not os.path.exists(job["file_path"]) and not os.path.exists(_checkpoint_path(job)):
+            return job
+        self.store.update_job(job_id, status=STATUS_QUEUED, progress="재시도 대기 중")
+        self.store.add_event(job_id, job.get("step") or STEP_PROCESS, STATUS_QUEUED, "재시도 대기열 등록")
+        self.dispatch()
+        return self.store.get_job(job_id)
+
+    def recover(self) -> int:
+        """
+        서버 시작 시 중단된 작업 재개.
+        아직 이 프로세스가 실행한 작업이 없으므로 running 상태는 모두 이전 프로세스가 남긴 것 → 경과 시간과 무관하게 재개
+        """
+        count = self.store.requeue_stale(stale_seconds=0)
+        if count:
+            print(f"♻️ 중단된 PDF 수집 작업 {count}개 재개")
+        self.dispatch()
+        return count
+
+    # ---- 실행 ----
+
+    def dispatch(self) -> None:
+        with self._lock:
+            while self._active < self.max_workers:
+                job_id = self.store.claim_next(self.per_school_limit)
+                if not job_id:
+                    break
+                self._active += 1
+                self._executor.submit(self._run_job, job_id)
+
+    def _finish(self) -> None:
+        with self._lock:
+            self._active -= 1
+        self.dispatch()
+
+    def _run_job(self, job_id: str) -> None:
+        try:
+            _IngestJobRunner(self.store, job_id).run()
+        except Exception as e:
+            # 실패 기록 자체가 안 된 경우 (저장소 오류 등) → 재시작 시 recover가 횟수 제한으로 정리
+            print(f"❌ [ingest job {job_id}] 실패 기록 불가: {e}")
+        finally:
+            self._finish()
+
+
+def _checkpoint_path(job: Dict[str, Any]) -> str:
+    return os.path.join(config.INGEST_JOBS_DIR, f"{job['id']}.processed.pkl")
+
+
+class _IngestJobRunner:
+    """작업 1개 실행 (process → upload, 단계별 진행 이벤트 기록)"""
+
+    def __init__(self, store: IngestJobStore, job_id: str):
+        self.store = store
+        self.job = store.get_job(job_id)
+        self.job_id = job_id
+        self.step = STEP_PROCESS
+
+    def on_progress(self, status: str, message: str) -> None:
+        try:
+            self.store.update_job(self.job_id, progress=status)
+            self.store.add_event(self.job_id, self.step, STATUS_RUNNING, message)
+        except Exception as e:
+            print(f"⚠️ [ingest job {self.job_id}] 진행 상황 기록 실패: {e}")
+
+    def _fail(self, reason: str) -> None:
+        self.store.update_job(
+            self.job_id, status=STATUS_FAILED, error=reason,
+            progress=f"실패: {reason}", finished_at=time.time(),
+        )
+        self.store.add_event(self.job_id, self.step, STATUS_FAILED, reason)
+
+    def _load_checkpoint(self) -> Optional[Dict]:
+        path = _checkpoint_path(self.job)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ [ingest job {self.job_id}] 체크포인트 로드 실패, 처음부터 진행: {e}")
+            return None
+
+    def _save_checkpoint(self, processed_data: Dict) -> None:
+        path = _checkpoint_path(self.job)
+        try:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(processed_data, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠️ [ingest job {self.job_id}] 체크포인트 저장 실패 (계속 진행): {e}")
+
+    def _cleanup(self) -> None:
+        for path in (self.job["file_path"], _checkpoint_path(self.job)):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except Exception:
+                pass
+
+    def run(self) -> None:
+        """예외가 나도 작업을 failed로 남겨 이벤트 스트림이 끝나도록"""
+        if not self.job:
+            return
+        try:
+            self._execute()
+        except Exception as e:
+            reason = str(e) or type(e).__name__
+            print(f"❌ [ingest job {self.job_id}] 처리 중 예외: {reason}\n{traceback.format_exc()}")
+            self._fail(f"처리 중 예외: {reason}")
+
+    def _execute(self) -> None:
+        from services.pdf_processor import process_pdf, upload_to_supabase_with_file
+
+        file_path = self.job["file_path"]
+        school_name = self.job["school_name"]
+        start_time = time.time()
+
+        processed_data = self._load_checkpoint()
+        if processed_data is not None:
+            self.on_progress("전처리 체크포인트 사용", "♻️ 전처리 결과 체크포인트가 있어 업로드 단계부터 재개합니다.")
+        else:
+            if not os.path.exists(file_path):
+                self._fail("원본 PDF 파일이 없습니다.")
+                return
+            self.step = STEP_PROCESS
+            self.store.update_job(self.job_id, step=STEP_PROCESS)
+            result = process_pdf(file_path, school_name, self.on_progress, True)
+            if isinstance(result, tuple) and result[0] is None:
+                self._fail(result[1] if len(result) > 1 else "PDF 처리 실패")
+                return
+            processed_data = result
+            if not processed_data:
+                self._fail("PDF 처리 결과가 비어있습니다.")
+                return
+            self._save_checkpoint(processed_data)
+
+        self.step = STEP_UPLOAD
+        self.store.update_job(self.job_id, step=STEP_UPLOAD)
+        document_id = upload_to_supabase_with_file(
+            school_name,
+            file_path,
+            processed_data,
+            self.job["filename"],
+            self.on_progress,
+        )
+        if not document_id:
+            self._fail("Supabase 업로드 실패")
+            return
+
+        total_pages = 0
+        try:
+            from PyPDF2 import PdfReader
+            total_pages = len(PdfReader(file_path).pages)
+        except Exception:
+            pass
+
+        stats = {
+            "totalPages": total_pages,
+            "chunksTotal": len(processed_data.get("chunks", [])),
+            "sectionsTotal": len(processed_data.get("toc_sections", [])),
+            "processingTime": f"{time.time() - start_time:.2f}초",
+        }
+        self.store.update_job(
+            self.job_id, status=STATUS_SUCCEEDED, document_id=document_id, stats=stats,
+            progress="완료", finished_at=time.time(),
+        )
+        self.store.add_event(self.job_id, STEP_UPLOAD, STATUS_SUCCEEDED, f"🎉 업로드 완료 (문서 ID: {document_id})")
+        self._cleanup()
+
+
+_queue: Optional[IngestJobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_ingest_queue() -> IngestJobQueue:
+    """프로세스 전역 작업 큐 (최초 호출 시 중단된 작업 재개)"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = IngestJobQueue(IngestJobStore())
+            created = True
+        else:
+            created = False
+    if created:
+        _queue.recover()
+    return _queue
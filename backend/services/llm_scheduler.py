@@ -0,0 +1,224 @@
+"""
+LLM 작업 스케줄러 (심층 생기부 리포트 생성 공용)
+
+리포트 한 건이 섹션/후처리/참고자료 검색마다 ThreadPoolExecutor를 따로 만들어
+동시 리포트 수만큼 스레드와 Gemini 동시 호출이 늘어나던 것을
+
+- 리포트 생성을 작업 의존 그래프(TaskGraph)로 표현하고, 선행 작업이 끝난 작업부터 바로 실행
+- 프로세스 전역 이벤트 루프 1개가 모든 리포트의 그래프를 실행
+- 자원(LLM/검색)별 프로세스 전역 동시 실행 예산
+  - 우선순위 숫자가 작은 작업 먼저 (섹션 초안 > 검토 > 후처리)
+  - 같은 우선순위면 현재 실행 중인 작업이 적은 리포트 먼저 (리포트 간 공정 분배)
+- 블로킹 호출(Gemini SDK, Supabase)은 공용 스레드 풀에서 실행 (프로세스 전체 스레드 수 고정)
+- 결과를 기다리던 쪽이 취소하면 아직 시작하지 않은 작업은 실행하지 않음
+
+작업 함수 안에서 다른 그래프의 run()을 기다리면 공용 스레드를 점유한 채 대기하므로 하지 말 것.
+"""
+import asyncio
+import itertools
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+LLM_MAX_CONCURRENCY = max(1, int(os.getenv("LLM_MAX_CONCURRENCY", "12")))
+RETRIEVAL_MAX_CONCURRENCY = max(1, int(os.getenv("RETRIEVAL_MAX_CONCURRENCY", "8")))
+# 예산이 없는 로컬 작업(정규화/조립)용 여유 스레드 포함
+TASK_MAX_THREADS = LLM_MAX_CONCURRENCY + RETRIEVAL_MAX_CONCURRENCY + 4
+
+RESOURCE_LLM = "llm"
+RESOURCE_RETRIEVAL = "retrieval"
+
+# 숫자가 작을수록 먼저 실행
+PRIORITY_RETRIEVAL = 0
+PRIORITY_SECTION = 10
+PRIORITY_REVIEW = 20
+PRIORITY_POST_PROCESS = 30
+
+
+class ConcurrencyBudget:
+    """우선순위 + 소유자(리포트)별 공정 분배 세마포어 (스케줄러 루프 스레드에서만 사용)"""
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        self.in_use = 0
+        self._in_flight: Dict[str, int] = {}
+        # (priority, seq, owner, future)
+        self._waiters: List[tuple] = []
+        self._seq = itertools.count()
+
+    async def acquire(self, owner: str, priority: int) -> None:
+        if self.in_use < self.limit and not self._waiters:
+            self._grant(owner)
+            return
+        future = asyncio.get_running_loop().create_future()
+        waiter = (priority, next(self._seq), owner, future)
+        self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif future.done() and not future.cancelled():
+                # 할당 직후 취소된 경우 바로 반납
+                self.release(owner)
+            raise
+
+    def release(self, owner: str) -> None:
+        self.in_use -= 1
+        count = self._in_flight.get(owner, 0) - 1
+        if count > 0:
+            self._in_flight[owner] = count
+        else:
+            self._in_flight.pop(owner, None)
+        self._wake()
+
+    def _grant(self, owner: str) -> None:
+        self.in_use += 1
+        self._in_flight[owner] = self._in_flight.get(owner, 0) + 1
+
+    def _wake(self) -> None:
+        while self.in_use < self.limit and self._waiters:
+            waiter = min(
+                self._waiters,
+                key=lambda item: (item[0], self._in_flight.get(item[2], 0), item[1]),
+            )
+            self._waiters.remove(waiter)
+            if waiter[3].done():
+                continue
+            self._grant(waiter[2])
+            waiter[3].set_result(None)
+
+
+class _TaskNode:
+    __slots__ = ("name", "fn", "deps", "requires", "priority", "resource")
+
+    def __init__(self, name, fn, deps, requires, priority, resource):
+        self.name = name
+        self.fn = fn
+        self.deps = deps
+        self.requires = requires
+        self.priority = priority
+        self.resource = resource
+
+
+class TaskGraph:
+    """
+    작업 의존 그래프.
+
+    - fn(results)로 호출되며 results에는 끝난 선행 작업들의 결과가 들어 있음
+    - 선행 작업은 먼저 add 되어 있어야 함 (순환 불가)
+    - 실패한 작업의 결과는 None (로그만 남김)
+    - requires 중 결과가 None인 작업이 있으면 실행하지 않고 None
+    """
+
+    def __init__(self, label: str = "llm_scheduler", owner: Optional[str] = None):
+        self.label = label
+        self.owner = owner or uuid.uuid4().hex
+        self._nodes: Dict[str, _TaskNode] = {}
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[Dict[str, Any]], Any],
+        *,
+        deps: Iterable[str] = (),
+        requires: Iterable[str] = (),
+        priority: int = PRIORITY_POST_PROCESS,
+        resource: Optional[str] = RESOURCE_LLM,
+    ) -> str:
+        if name in self._nodes:
+            raise ValueError(f"중복된 작업 이름: {name}")
+        requires = tuple(requires)
+        all_deps = tuple(dict.fromkeys([*deps, *requires]))
+        missing = [dep for dep in all_deps if dep not in self._nodes]
+        if missing:
+            raise ValueError(f"선행 작업이 먼저 등록되어야 합니다({name}): {missing}")
+        self._nodes[name] = _TaskNode(name, fn, all_deps, requires, priority, resource)
+        return name
+
+    async def _execute(self, scheduler: "LLMScheduler") -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        results: Dict[str, Any] = {}
+        finished = {name: loop.create_future() for name in self._nodes}
+
+        async def run_node(node: _TaskNode) -> None:
+            if node.deps:
+                await asyncio.gather(*(finished[dep] for dep in node.deps))
+            result = None
+            if all(results.get(name) is not None for name in node.requires):
+                try:
+                    result = await scheduler.call(node, self.owner, dict(results))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    print(f"⚠️ [{self.label}] 작업 실패({node.name}): {e}")
+            results[node.name] = result
+            finished[node.name].set_result(None)
+
+        await asyncio.gather(*(run_node(node) for node in self._nodes.values()))
+        return results
+
+    def start(self) -> Future:
+        """스케줄러 루프에서 실행 시작. Future.cancel()로 남은 작업 취소"""
+        return get_llm_scheduler().submit(self)
+
+    def run(self) -> Dict[str, Any]:
+        """동기 호출용 (완료까지 대기)"""
+        return self.start().result()
+
+    async def run_async(self) -> Dict[str, Any]:
+        """다른 이벤트 루프(라우트)에서 대기용. 대기 중 취소되면 그래프도 취소"""
+        return await asyncio.wrap_future(self.start())
+
+
+class LLMScheduler:
+    """프로세스 전역 스케줄러 (이벤트 루프 스레드 1개 + 공용 스레드 풀 + 자원별 예산)"""
+
+    def __init__(self):
+        self._budgets = {
+            RESOURCE_LLM: ConcurrencyBudget(RESOURCE_LLM, LLM_MAX_CONCURRENCY),
+            RESOURCE_RETRIEVAL: ConcurrencyBudget(RESOURCE_RETRIEVAL, RETRIEVAL_MAX_CONCURRENCY),
+        }
+        self._executor = ThreadPoolExecutor(max_workers=TASK_MAX_THREADS, thread_name_prefix="llm-task")
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-scheduler", daemon=True)
+        self._thread.start()
+
+    def submit(self, graph: TaskGraph) -> Future:
+        return asyncio.run_coroutine_threadsafe(graph._execute(self), self._loop)
+
+    async def call(self, node: _TaskNode, owner: str, results: Dict[str, Any]) -> Any:
+        budget = self._budgets.get(node.resource) if node.resource else None
+        if budget is not None:
+            await budget.acquire(owner, node.priority)
+        try:
+            future = self._loop.run_in_executor(self._executor, node.fn, results)
+        except BaseException:
+            if budget is not None:
+                budget.release(owner)
+            raise
+
+        def _on_done(done: asyncio.Future) -> None:
+            # 기다리던 쪽이 취소돼도 스레드 작업이 실제로 끝난 뒤에 예산 반납
+            if budget is not None:
+                budget.release(owner)
+            if not done.cancelled():
+                done.exception()
+
+        future.add_done_callback(_on_done)
+        return await asyncio.shield(future)
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler()
+        return _scheduler
@@ -25,6 +25,7 @@ async def run_orchestration_agent(
     timing_logger=None,
     user_id: str = None,
     score_id: str = None,
+    prefetch=None,
 ) -> Dict[str, Any]:
     """
     Orchestration Agent 실행 (router_agent 래퍼)
@@ -36,6 +37,7 @@ async def run_orchestration_agent(
         history: 대화 히스토리
         timing_logger: 타이밍 로거 (optional)
         user_id: 사용자 ID (프로필 점수 자동 보완용, optional)
+        prefetch: 요청 진입 시 시작한 UserContextPrefetch (optional)
     """
     timing = {"router": 0, "function": 0, "main_agent": 0}
     
@@ -43,7 +45,7 @@ async def run_orchestration_agent(
         # 1. router_agent 호출 (user_id 전달)
         print("🔄 [1/3] Router Agent 호출 중...")
         router_start = time.time()
-        result = await route_query(message, history, user_id=user_id)
+        result = await route_query(message, history, user_id=user_id, prefetch=prefetch)
         timing["router"] = round((time.time() - router_start) * 1000)  # ms
         
         # function_calls 추출
@@ -150,6 +152,7 @@ def run_orchestration_agent_stream(
     timing_logger=None,
     user_id: str = None,
     score_id: str = None,
+    prefetch=None,
 ):
     """
     Orchestration Agent 실행 (스트리밍 버전)
@@ -161,6 +164,7 @@ def run_orchestration_agent_stream(
         history: 대화 히스토리
         timing_logger: 타이밍 로거 (optional)
         user_id: 사용자 ID (프로필 점수 자동 보완용, optional)
+        prefetch: 요청 진입 시 시작한 UserContextPrefetch (optional)
     
     Yields:
         {"type": "status", "step": str, "message": str, "detail": dict}  # 상태 업데이트
@@ -180,7 +184,7 @@ def run_orchestration_agent_stream(
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
-            result = loop.run_until_complete(route_query(message, history, user_id=user_id))
+            result = loop.run_until_complete(route_query(message, history, user_id=user_id, prefetch=prefetch))
         finally:
             loop.close()
         
@@ -21,6 +21,7 @@ if os.getenv("GEMINI_API_KEY") and not os.getenv("GOOGLE_API_KEY"):
     os.environ["GOOGLE_API_KEY"] = os.getenv("GEMINI_API_KEY")
 
 from services.supabase_client import SupabaseService, supabase_service
+from utils.university_names import school_name_variants
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 
 # 업로드와 동일한 임베딩 모델 사용 (768차원, DB vector(768)와 일치)
@@ -73,17 +74,7 @@ def _school_name_search_variants(university: str) -> List[str]:
     """검색 시 사용할 학교명 변형 목록 (업로드 시 폴더명 '연세대' vs 채팅 '연세대학교' 등 모두 매칭)"""
     if not university or not university.strip():
         return [university or "미분류"]
-    u = university.strip()
-    variants = [u]
-    if u.endswith("학교"):
-        short = u[:-2]  # 연세대학교 -> 연세대
-        if short and short not in variants:
-            variants.append(short)
-    else:
-        full = u + "학교"  # 연세대 -> 연세대학교
-        if full not in variants:
-            variants.append(full)
-    return variants
+    return school_name_variants(university)
 
 
 class RAGFunctions:
@@ -247,6 +238,10 @@ class RAGFunctions:
                 self._query_embedding_cache.pop(oldest_key, None)
             self._query_embedding_cache[key] = embedding
         return embedding
+
+    def get_query_embedding(self, query: str) -> List[float]:
+        """univ 검색과 같은 쿼리 임베딩 (같은 캐시 사용, 미리 구해 두면 검색 시 재사용)"""
+        return self._get_query_embedding_cached(query)
     
     @staticmethod
     def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
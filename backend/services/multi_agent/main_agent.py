@@ -11,6 +11,8 @@ import json
 import os
 from dotenv import load_dotenv
 
+from services.prompt_cache import get_prompt_prefix
+
 load_dotenv()
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -134,10 +136,8 @@ class MainAgent:
     """Main Agent - 최종 답변 생성"""
     
     def __init__(self):
-        self.model = genai.GenerativeModel(
-            model_name=MAIN_CONFIG["model"],
-            system_instruction=MAIN_SYSTEM_PROMPT
-        )
+        # 시스템 프롬프트는 프롬프트 접두 캐시로 1회 등록 (불가하면 매번 전송)
+        self.prompt_prefix = get_prompt_prefix(MAIN_CONFIG["model"], MAIN_SYSTEM_PROMPT)
         self.generation_config = {
             "temperature": MAIN_CONFIG["temperature"],
             "max_output_tokens": MAIN_CONFIG["max_output_tokens"],
@@ -411,8 +411,6 @@ class MainAgent:
 위 자료를 바탕으로 사용자에게 최적의 답변을 생성해주세요.
 """
         
-        chat = self.model.start_chat(history=gemini_history)
-        
         # consult 함수 결과가 있으면 토큰 제한 증가
         has_consult = any(key.startswith("consult_") for key in (function_results or {}).keys())
         generation_config = self.generation_config.copy()
@@ -420,10 +418,12 @@ class MainAgent:
             generation_config["max_output_tokens"] = MAIN_CONFIG.get("max_output_tokens_consult", 40960)
         
         try:
-            response = chat.send_message(
-                final_prompt,
-                generation_config=generation_config,
-                safety_settings=self.safety_settings  # Safety Filter 비활성화
+            response = self.prompt_prefix.call(
+                lambda model, cached: model.start_chat(history=gemini_history).send_message(
+                    final_prompt,
+                    generation_config=generation_config,
+                    safety_settings=self.safety_settings  # Safety Filter 비활성화
+                )
             )
             raw_response = response.text.strip()
             
@@ -517,8 +517,6 @@ class MainAgent:
 위 자료를 바탕으로 사용자에게 최적의 답변을 생성해주세요.
 """
         
-        chat = self.model.start_chat(history=gemini_history)
-        
         # consult 함수 결과가 있으면 토큰 제한 증가
         has_consult = any(key.startswith("consult_") for key in (function_results or {}).keys())
         generation_config = self.generation_config.copy()
@@ -530,11 +528,14 @@ class MainAgent:
             start_time = time.time()
             first_chunk_time = None
             
-            response = chat.send_message(
-                final_prompt,
-                generation_config=generation_config,
-                safety_settings=self.safety_settings,  # Safety Filter 비활성화
-                stream=True  # 스트리밍 활성화
+            # 캐시 오류는 응답을 읽을 때 나므로 stream()이 첫 청크까지 받아 본 뒤 폴백 여부 결정
+            response = self.prompt_prefix.stream(
+                lambda model, cached: model.start_chat(history=gemini_history).send_message(
+                    final_prompt,
+                    generation_config=generation_config,
+                    safety_settings=self.safety_settings,  # Safety Filter 비활성화
+                    stream=True  # 스트리밍 활성화
+                )
             )
             
             full_response = ""
@@ -5,11 +5,16 @@ Router Agent
 """
 
 import google.generativeai as genai
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import copy
+import hashlib
 import json
 import os
 from dotenv import load_dotenv
 
+from services.prompt_cache import get_prompt_prefix
+from utils.document_cache import DocumentCache
+
 load_dotenv()
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -24,9 +29,22 @@ if GEMINI_API_KEY:
 ROUTER_CONFIG = {
     "model": "gemini-3.1-flash-lite-preview",
     "temperature": 0.0,  # 0.0 ~ 2.0 (낮을수록 일관적, 높을수록 창의적)
-    "max_output_tokens": 2048
+    "max_output_tokens": 2048,
+    "history_window": 10,  # 라우팅에 사용하는 최근 히스토리 개수
+}
+
+# Router 결과 캐시 설정 (동일 메시지/히스토리/프롬프트 재질의 시 LLM 호출 생략)
+ROUTER_CACHE_CONFIG = {
+    "enabled": os.getenv("ROUTER_CACHE_ENABLED", "true").lower() != "false",
+    "max_size": int(os.getenv("ROUTER_CACHE_MAX_SIZE", "512")),
+    "ttl_seconds": int(os.getenv("ROUTER_CACHE_TTL_SECONDS", "600")),
 }
 
+_route_cache = DocumentCache(
+    max_size=ROUTER_CACHE_CONFIG["max_size"],
+    ttl_seconds=ROUTER_CACHE_CONFIG["ttl_seconds"],
+)
+
 
 # ============================================================
 # 함수 정의
@@ -333,11 +351,10 @@ class RouterAgent:
     
     def __init__(self, system_prompt: str = None):
         prompt = system_prompt if system_prompt else ROUTER_SYSTEM_PROMPT
-        self.model = genai.GenerativeModel(
-            model_name=ROUTER_CONFIG["model"],
-            system_instruction=prompt
-        )
+        # 시스템 프롬프트는 프롬프트 접두 캐시로 1회 등록 (불가하면 매번 전송)
+        self.prompt_prefix = get_prompt_prefix(ROUTER_CONFIG["model"], prompt)
         self.system_prompt = prompt  # 현재 사용 중인 프롬프트 저장
+        self.prompt_version = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
         self.generation_config = {
             "temperature": ROUTER_CONFIG["temperature"],
             "max_output_tokens": ROUTER_CONFIG["max_output_tokens"],
@@ -368,7 +385,7 @@ class RouterAgent:
         # 히스토리 구성 (main_agent 스타일 마커 제거)
         gemini_history = []
         if history:
-            for msg in history[-10:]:
+            for msg in history[-ROUTER_CONFIG["history_window"]:]:
                 role = "user" if msg.get("role") == "user" else "model"
                 content = msg.get("content", "")
                 if content:
@@ -377,12 +394,17 @@ class RouterAgent:
                         content = self._clean_history_content(content)
                     gemini_history.append({"role": role, "parts": [content]})
         
-        chat = self.model.start_chat(history=gemini_history)
+        cache_key = self._build_cache_key(message, gemini_history)
+        cached = _get_cached_route(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            response = chat.send_message(
-                message,
-                generation_config=self.generation_config
+            response = self.prompt_prefix.call(
+                lambda model, cached: model.start_chat(history=gemini_history).send_message(
+                    message,
+                    generation_config=self.generation_config
+                )
             )
             raw_text = response.text.strip()
             result = self._parse_response(raw_text)
@@ -397,6 +419,7 @@ class RouterAgent:
                     "total": getattr(usage, 'total_token_count', 0)
                 }
             
+            _set_cached_route(cache_key, result)
             return result
             
         except Exception as e:
@@ -406,6 +429,19 @@ class RouterAgent:
                 "raw_response": ""
             }
     
+    def _build_cache_key(self, message: str, gemini_history: List[Dict]) -> str:
+        """정제된 히스토리 윈도우 + 메시지 + 프롬프트 버전으로 캐시 키 생성"""
+        payload = json.dumps(
+            {
+                "prompt_version": self.prompt_version,
+                "model": ROUTER_CONFIG["model"],
+                "history": [[h["role"], h["parts"][0]] for h in gemini_history],
+                "message": (message or "").strip(),
+            },
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
     def _parse_response(self, text: str) -> Dict[str, Any]:
         """JSON 파싱 (복구 로직 포함)"""
         original_text = text
@@ -542,6 +578,39 @@ class RouterAgent:
         return parsed
 
 
+def _get_cached_route(cache_key: str) -> Optional[Dict[str, Any]]:
+    """캐시된 라우팅 결과 반환 (호출자가 결과를 수정하므로 복사본 반환)"""
+    if not ROUTER_CACHE_CONFIG["enabled"]:
+        return None
+    cached = _route_cache.get("router", key=cache_key)
+    if cached is None:
+        return None
+    result = copy.deepcopy(cached)
+    result["cached"] = True
+    # 캐시 히트는 LLM 토큰을 사용하지 않음
+    result["tokens"] = {"in": 0, "out": 0, "total": 0}
+    return result
+
+
+def _set_cached_route(cache_key: str, result: Dict[str, Any]) -> None:
+    """정상 파싱된 라우팅 결과만 캐싱 (파싱 실패/복구 결과는 제외)"""
+    if not ROUTER_CACHE_CONFIG["enabled"]:
+        return
+    if result.get("error") or result.get("parse_error") or result.get("_recovered"):
+        return
+    _route_cache.set("router", copy.deepcopy(result), key=cache_key)
+
+
+def invalidate_router_cache() -> None:
+    """라우팅 결과 캐시 전체 무효화"""
+    _route_cache.invalidate()
+
+
+def get_router_cache_stats() -> Dict[str, Any]:
+    """라우팅 결과 캐시 통계"""
+    return _route_cache.get_stats()
+
+
 # 싱글톤
 _router = None
 _custom_prompt = None  # 프론트에서 설정한 커스텀 프롬프트
@@ -559,6 +628,7 @@ def set_router_prompt(prompt: str) -> None:
     _custom_prompt = prompt
     # 새 프롬프트로 라우터 재생성
     _router = RouterAgent(system_prompt=prompt)
+    invalidate_router_cache()
 
 
 def get_router_prompt() -> str:
@@ -572,9 +642,15 @@ def reset_router_prompt() -> None:
     global _router, _custom_prompt
     _custom_prompt = None
     _router = RouterAgent()
+    invalidate_router_cache()
 
 
-async def route_query(message: str, history: List[Dict] = None, user_id: str = None) -> Dict[str, Any]:
+async def route_query(
+    message: str,
+    history: List[Dict] = None,
+    user_id: str = None,
+    prefetch=None,
+) -> Dict[str, Any]:
     """
     편의 함수 (프로필 점수 자동 보완 포함)
     
@@ -582,6 +658,7 @@ async def route_query(message: str, history: List[Dict] = None, user_id: str = N
         message: 사용자 질문
         history: 대화 히스토리
         user_id: 사용자 ID (프로필 점수 조회용, optional)
+        prefetch: 요청 진입 시 시작한 UserContextPrefetch (있으면 프로필 재조회 생략, optional)
     """
     router = get_router()
     result = await router.route(message, history)
@@ -591,11 +668,19 @@ async def route_query(message: str, history: List[Dict] = None, user_id: str = N
             params = call.setdefault("params", {})
             params.pop("j_scores", None)
     if user_id:
-        await _fill_s_scores_from_naesin_profile(result, user_id)
+        await _fill_s_scores_from_naesin_profile(result, user_id, prefetch=prefetch)
     return result
 
 
-async def _fill_s_scores_from_naesin_profile(result: Dict[str, Any], user_id: str) -> None:
+async def _load_profile_metadata(user_id: str, prefetch=None) -> Optional[Dict[str, Any]]:
+    """선조회 결과가 있으면 사용하고, 없으면 Supabase에서 직접 조회"""
+    if prefetch is not None and prefetch.has("profile_metadata"):
+        return await prefetch.get("profile_metadata")
+    from services.supabase_client import supabase_service
+    return await supabase_service.get_user_profile_metadata(user_id)
+
+
+async def _fill_s_scores_from_naesin_profile(result: Dict[str, Any], user_id: str, prefetch=None) -> None:
     """
     consult_susi 호출에 s_scores가 비어 있으면 프로필 metadata의 school_grade_input(연동 내신)으로 채우기.
     내신 카드 확인 후 답변 시 해당 성적을 기준으로 수시 분석이 되도록 함.
@@ -609,8 +694,7 @@ async def _fill_s_scores_from_naesin_profile(result: Dict[str, Any], user_id: st
         if s_scores is not None and (isinstance(s_scores, list) and len(s_scores) > 0 or (not isinstance(s_scores, list) and s_scores)):
             continue
         try:
-            from services.supabase_client import supabase_service
-            meta = await supabase_service.get_user_profile_metadata(user_id)
+            meta = await _load_profile_metadata(user_id, prefetch=prefetch)
             sgi = (meta or {}).get("school_grade_input") or {}
             gs = sgi.get("gradeSummary") or {}
             ov = gs.get("overallAverage") or gs.get("coreAverage")
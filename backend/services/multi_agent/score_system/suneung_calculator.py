@@ -8,6 +8,8 @@ import json
 import os
 from typing import Dict, Any, List, Optional
 
+from utils.university_names import resolve_university_key, university_key, university_key_matches
+
 # 데이터 파일 경로
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 
@@ -216,22 +218,17 @@ def run_suneung_search(
 
         return min(abs(float(my_score) - cut) for cut in cut_values)
     
+    target_keys = [resolve_university_key(target) for target in (target_univ or [])]
+
     for univ in universities:
         # 필터 적용
         if target_gun and univ.get("gun") != target_gun:
             continue
         
         if target_univ:
-            univ_name = univ.get("university", "")
-            # 대학명 정규화: "경북대학교" → "경북대" 매칭
-            matched = False
-            for target in target_univ:
-                # "학교" 제거 후 비교
-                target_normalized = target.replace("학교", "")
-                if target_normalized in univ_name or univ_name in target:
-                    matched = True
-                    break
-            if not matched:
+            # 대학명 정규화: "경북대학교"/"경북대", "연대" → 연세대, "고려대" → 본교+세종 모두 매칭
+            univ_key = university_key(univ.get("university", ""))
+            if not any(university_key_matches(target_key, univ_key) for target_key in target_keys):
                 continue
         
         if target_major:
@@ -25,6 +25,7 @@ def process_pdf(
         if on_progress:
             on_progress(status, message or status)
 
+    summary_executor = None
     try:
         log("모델 초기화 중...", "📦 모델 초기화 중...")
 
@@ -33,14 +34,40 @@ def process_pdf(
         preprocessor = SectionPreprocessor(model_name)
 
         log("문서 요약 생성 중...", "✅ 모델 초기화 완료")
-        log("문서 요약 생성 중...", "📝 [0단계] 문서 요약 생성 중...")
+        log("문서 요약 생성 중...", "📝 [0단계] 문서 요약 생성 시작 (목차 감지와 병렬)")
 
-        document_summary = toc_processor.generate_document_summary(pdf_path)
+        # 요약은 목차를 찾지 못했을 때의 대체 경로와 최종 결과에만 필요하므로
+        # 목차 감지/파싱, 섹션 전처리와 병렬로 진행하고 필요한 시점에만 기다림
+        summary_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-summary")
+        summary_future = summary_executor.submit(toc_processor.generate_document_summary, pdf_path)
+        summary_state = {}
 
-        if not document_summary:
-            log("문서 요약 생성 실패", "⚠️ 문서 요약 생성 실패. 계속 진행합니다.")
-        else:
-            log("문서 요약 생성 완료", f"✅ 문서 요약 생성 완료 ({len(document_summary)}자)")
+        def await_summary() -> str:
+            if "summary" not in summary_state:
+                try:
+                    summary = summary_future.result()
+                except Exception as e:
+                    print(f"   ⚠️  문서 요약 생성 중 오류: {e}")
+                    summary = ""
+                summary_state["summary"] = summary
+                if not summary:
+                    log("문서 요약 생성 실패", "⚠️ 문서 요약 생성 실패. 계속 진행합니다.")
+                else:
+                    log("문서 요약 생성 완료", f"✅ 문서 요약 생성 완료 ({len(summary)}자)")
+            return summary_state["summary"]
+
+        def sections_from_summary():
+            document_summary = await_summary()
+            if not document_summary:
+                log("실패: 목차 생성 불가", "⚠️ 요약본도 없어 목차를 생성할 수 없습니다.")
+                return None, "요약본이 없어 목차를 생성할 수 없습니다."
+            log("요약 기반 목차 생성 중...", "📋 요약 기반 목차 생성 시도 중...")
+            summary_sections = toc_processor.generate_toc_from_summary(pdf_path, document_summary)
+            if not summary_sections:
+                log("실패: 목차 생성 불가", "⚠️ 요약 기반 목차 생성 실패")
+                return None, "요약 기반 목차 생성 실패"
+            log("요약 기반 목차 생성 완료", f"✅ 요약 기반 목차 생성 완료: {len(summary_sections)}개 섹션")
+            return summary_sections, None
 
         log("목차 페이지 감지 중...", "🔍 [1단계] 목차 페이지 감지 중...")
 
@@ -49,17 +76,9 @@ def process_pdf(
 
         if not toc_pages:
             log("목차 페이지 없음", "⚠️ 목차 페이지를 찾을 수 없습니다.")
-            if document_summary:
-                log("요약 기반 목차 생성 중...", "📋 요약 기반 목차 생성 시도 중...")
-                sections = toc_processor.generate_toc_from_summary(pdf_path, document_summary)
-                if sections:
-                    log("요약 기반 목차 생성 완료", f"✅ 요약 기반 목차 생성 완료: {len(sections)}개 섹션")
-                else:
-                    log("실패: 목차 생성 불가", "⚠️ 요약 기반 목차 생성 실패")
-                    return (None, "요약 기반 목차 생성 실패")
-            else:
-                log("실패: 목차 생성 불가", "⚠️ 요약본도 없어 목차를 생성할 수 없습니다.")
-                return (None, "요약본이 없어 목차를 생성할 수 없습니다.")
+            sections, reason = sections_from_summary()
+            if not sections:
+                return (None, reason)
         else:
             log("목차 페이지 발견", f"✅ 목차 페이지 발견: {[p+1 for p in toc_pages]}")
 
@@ -68,17 +87,9 @@ def process_pdf(
 
             if not sections:
                 log("목차 파싱 실패", "⚠️ 목차 파싱 실패.")
-                if document_summary:
-                    log("요약 기반 목차 생성 중...", "📋 요약 기반 목차 생성 시도 중...")
-                    sections = toc_processor.generate_toc_from_summary(pdf_path, document_summary)
-                    if sections:
-                        log("요약 기반 목차 생성 완료", f"✅ 요약 기반 목차 생성 완료: {len(sections)}개 섹션")
-                    else:
-                        log("실패: 목차 생성 불가", "⚠️ 요약 기반 목차 생성 실패")
-                        return (None, "요약 기반 목차 생성 실패")
-                else:
-                    log("실패: 목차 생성 불가", "⚠️ 요약본도 없어 목차를 생성할 수 없습니다.")
-                    return (None, "요약본이 없어 목차를 생성할 수 없습니다.")
+                sections, reason = sections_from_summary()
+                if not sections:
+                    return (None, reason)
 
         log("페이지 범위 검증 중...", "✅ [3단계] 페이지 범위 검증 중...")
         sections = toc_processor.validate_and_fix_sections(sections, pdf_path)
@@ -145,7 +156,6 @@ def process_pdf(
                         continue
 
                     section_data[section_key] = {
-                        "vectorstore": result.get("vectorstore"),
                         "documents": documents,
                         "section": section,
                         "table_count": result.get("table_count", 0)
@@ -186,7 +196,7 @@ def process_pdf(
         return {
             "toc_sections": sections,
             "chunks": all_chunks,
-            "summary": document_summary,
+            "summary": await_summary(),
             "failed_sections": failed_sections if failed_sections else None
         }
     except Exception as e:
@@ -196,6 +206,9 @@ def process_pdf(
         log(f"실패: {reason}", f"❌ 오류 발생: {reason}\n{tb}")
         print(f"\n❌ [process_pdf] 오류: {e}\n{tb}\n")
         return (None, reason)
+    finally:
+        if summary_executor is not None:
+            summary_executor.shutdown(wait=False)
 
 
 def upload_to_supabase_with_file(
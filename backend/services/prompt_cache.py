@@ -0,0 +1,242 @@
+"""
+Gemini 프롬프트 접두(prefix) 캐시
+
+Router/Main 에이전트와 심층분석 LLM 호출은 매번 같은 시스템 프롬프트(수 KB)를 다시 보낸다.
+바뀌지 않는 접두(시스템 지시 + 공용 컨텍스트)를 Gemini context caching(CachedContent)에
+한 번 등록하고, 이후 호출은 캐시 핸들로 만든 모델을 재사용한다.
+
+- 접두 내용 해시 + 모델 단위로 핸들 1개 (프로세스 전역, 만료 직전에 새로 등록)
+- 최소 토큰 미만이거나 등록 실패(모델 미지원/한도 등)면 캐시 없이 호출하고,
+  실패한 접두는 PROMPT_CACHE_RETRY_SECONDS 동안 다시 등록하지 않음
+- 캐시 핸들로 호출하다 캐시 관련 오류가 나면 핸들을 버리고 캐시 없이 1회 재시도
+  (스트리밍은 오류가 응답을 읽을 때 나므로 stream()이 첫 청크까지 받아 본 뒤 반환)
+- GEMINI_PROMPT_CACHE_ENABLED=false 면 항상 캐시 없이 호출 (기존 동작)
+
+캐시를 쓰지 않는 경로에서 공용 컨텍스트(shared_text)는 사용자 프롬프트 앞에 붙여 보내므로
+호출하는 쪽은 캐시 여부와 무관하게 같은 결과를 기대할 수 있다.
+"""
+import datetime
+import hashlib
+import itertools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+PROMPT_CACHE_ENABLED = os.getenv("GEMINI_PROMPT_CACHE_ENABLED", "true").lower() != "false"
+PROMPT_CACHE_TTL_SECONDS = int(os.getenv("GEMINI_PROMPT_CACHE_TTL_SECONDS", "3600"))
+# 모델별 최소 캐시 토큰보다 작으면 등록 요청 자체를 하지 않음 (추정 토큰 = 문자 수 / 2)
+PROMPT_CACHE_MIN_TOKENS = int(os.getenv("GEMINI_PROMPT_CACHE_MIN_TOKENS", "1024"))
+PROMPT_CACHE_RETRY_SECONDS = 600
+PROMPT_CACHE_REFRESH_MARGIN_SECONDS = 120
+PROMPT_CACHE_MAX_HANDLES = 64
+
+_CACHE_ERROR_HINTS = ("cachedcontent", "cached_content", "cached content")
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text or "") // 2)
+
+
+def _is_cache_error(error: Exception) -> bool:
+    text = str(error or "").lower()
+    return any(hint in text for hint in _CACHE_ERROR_HINTS)
+
+
+class PromptPrefix:
+    """
+    고정 접두 1개 (시스템 지시 + 선택적 공용 컨텍스트).
+    call(fn)에 모델을 받아 요청하는 함수를 넘기면 캐시 모델 → 실패 시 일반 모델 순으로 실행.
+    """
+
+    def __init__(
+        self,
+        cache: "PromptPrefixCache",
+        model_name: str,
+        system_instruction: str,
+        shared_text: str = "",
+        ttl_seconds: Optional[int] = None,
+    ):
+        self._cache = cache
+        self.model_name = model_name
+        self.system_instruction = system_instruction or ""
+        self.shared_text = shared_text or ""
+        # 리포트 1건 안에서만 재사용하는 접두는 짧게 (저장 비용)
+        self.ttl_seconds = ttl_seconds or cache.ttl_seconds
+        self.key = hashlib.sha256(
+            "\x00".join([model_name, self.system_instruction, self.shared_text]).encode("utf-8")
+        ).hexdigest()
+
+    def plain_model(self):
+        import google.generativeai as genai
+
+        return genai.GenerativeModel(
+            model_name=self.model_name,
+            system_instruction=self.system_instruction or None,
+        )
+
+    def prompt(self, user_prompt: str, cached: bool) -> str:
+        """캐시를 쓰지 않으면 공용 컨텍스트를 사용자 프롬프트 앞에 붙임"""
+        if cached or not self.shared_text:
+            return user_prompt
+        return f"{self.shared_text}\n\n{user_prompt}"
+
+    def call(self, fn: Callable[[Any, bool], Any]) -> Any:
+        """fn(model, cached) 실행. cached=True면 공용 컨텍스트가 이미 캐시에 들어 있음"""
+        model = self._cache.cached_model(self)
+        if model is not None:
+            try:
+                return fn(model, True)
+            except Exception as e:
+                if not _is_cache_error(e):
+                    raise
+                print(f"⚠️ [prompt_cache] 캐시 핸들 호출 실패, 캐시 없이 재시도({self.model_name}): {e}")
+                self._cache.discard(self, retry_after=PROMPT_CACHE_RETRY_SECONDS)
+        return fn(self.plain_model(), False)
+
+    def stream(self, fn: Callable[[Any, bool], Iterable[Any]]) -> Iterator[Any]:
+        """
+        스트리밍 호출용 call. fn(model, cached)은 stream=True 응답을 반환.
+        만료/무효 캐시 오류는 첫 청크를 읽을 때 나므로 첫 청크까지 call 안에서 받아 폴백 대상에 포함.
+        (첫 청크 이후의 오류는 이미 보낸 내용이 있어 재시도하지 않음)
+        """
+        def first_chunk(model, cached):
+            chunks = iter(fn(model, cached))
+            for chunk in chunks:
+                return itertools.chain([chunk], chunks)
+            return iter(())
+
+        return self.call(first_chunk)
+
+    def generate_content(self, user_prompt: str, **kwargs) -> Any:
+        return self.call(lambda model, cached: model.generate_content(self.prompt(user_prompt, cached), **kwargs))
+
+
+class PromptPrefixCache:
+    """접두 키 -> CachedContent 핸들 (프로세스 전역)"""
+
+    def __init__(self, enabled: bool = PROMPT_CACHE_ENABLED, ttl_seconds: int = PROMPT_CACHE_TTL_SECONDS):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        # key -> (갱신 시각(monotonic), GenerativeModel)
+        self._models: Dict[str, tuple] = {}
+        # key -> 다시 등록을 시도할 시각(monotonic)
+        self._blocked_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def prefix(
+        self,
+        model_name: str,
+        system_instruction: str,
+        shared_text: str = "",
+        ttl_seconds: Optional[int] = None,
+    ) -> PromptPrefix:
+        return PromptPrefix(self, model_name, system_instruction, shared_text, ttl_seconds)
+
+    def _eligible(self, prefix: PromptPrefix) -> bool:
+        if not self.enabled:
+            return False
+        tokens = _estimate_tokens(prefix.system_instruction) + _estimate_tokens(prefix.shared_text)
+        return tokens >= PROMPT_CACHE_MIN_TOKENS
+
+    def _lookup(self, key: str) -> tuple:
+        """(사용 가능한 캐시 모델 또는 None, 새로 등록해도 되는지)"""
+        now = time.monotonic()
+        with self._lock:
+            slot = self._models.get(key)
+            if slot is not None and slot[0] > now:
+                return slot[1], False
+            return None, self._blocked_until.get(key, 0.0) <= now
+
+    def cached_model(self, prefix: PromptPrefix):
+        if not self._eligible(prefix):
+            return None
+        model, can_create = self._lookup(prefix.key)
+        if model is not None or not can_create:
+            return model
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(prefix.key, threading.Lock())
+        with key_lock:
+            # 같은 접두를 동시에 등록하지 않도록 잠금 후 다시 확인
+            model, can_create = self._lookup(prefix.key)
+            if model is not None or not can_create:
+                return model
+            return self._create(prefix)
+
+    def _create(self, prefix: PromptPrefix):
+        try:
+            import google.generativeai as genai
+            from google.generativeai import caching
+
+            model_name = prefix.model_name if prefix.model_name.startswith("models/") else f"models/{prefix.model_name}"
+            cached_content = caching.CachedContent.create(
+                model=model_name,
+                display_name=f"uniroad-{prefix.key[:16]}",
+                system_instruction=prefix.system_instruction or None,
+                contents=[prefix.shared_text] if prefix.shared_text else None,
+                ttl=datetime.timedelta(seconds=prefix.ttl_seconds),
+            )
+            model = genai.GenerativeModel.from_cached_content(cached_content=cached_content)
+        except Exception as e:
+            print(f"⚠️ [prompt_cache] 프롬프트 캐시 등록 실패, 캐시 없이 호출({prefix.model_name}): {e}")
+            with self._lock:
+                self._prune_locked()
+                self._blocked_until[prefix.key] = time.monotonic() + PROMPT_CACHE_RETRY_SECONDS
+            return None
+
+        with self._lock:
+            # 서버 만료 직전에는 새로 등록 (만료된 핸들로 호출하지 않도록)
+            refresh_margin = min(PROMPT_CACHE_REFRESH_MARGIN_SECONDS, prefix.ttl_seconds // 4)
+            self._models[prefix.key] = (time.monotonic() + prefix.ttl_seconds - refresh_margin, model)
+            self._blocked_until.pop(prefix.key, None)
+            while len(self._models) > PROMPT_CACHE_MAX_HANDLES:
+                # 가장 먼저 만료되는 핸들부터 버림 (서버 쪽 캐시는 TTL로 정리)
+                oldest = min(self._models, key=lambda item: self._models[item][0])
+                self._models.pop(oldest, None)
+                self._key_locks.pop(oldest, None)
+            self._prune_locked()
+        return model
+
+    def _prune_locked(self) -> None:
+        """
+        리포트 단위 접두는 키가 매번 달라 핸들/잠금/차단 기록이 계속 쌓이므로
+        만료된 핸들, 핸들이 없는 키의 잠금, 차단 시간이 지난 기록을 정리 (self._lock 보유 상태에서 호출)
+        """
+        now = time.monotonic()
+        for key in [key for key, slot in self._models.items() if slot[0] <= now]:
+            self._models.pop(key, None)
+        for key in [key for key, until in self._blocked_until.items() if until <= now]:
+            self._blocked_until.pop(key, None)
+        for key in [key for key in self._key_locks if key not in self._models]:
+            if not self._key_locks[key].locked():
+                self._key_locks.pop(key, None)
+
+    def discard(self, prefix: PromptPrefix, retry_after: float = 0.0) -> None:
+        with self._lock:
+            self._models.pop(prefix.key, None)
+            self._prune_locked()
+            if retry_after:
+                self._blocked_until[prefix.key] = time.monotonic() + retry_after
+
+
+_cache: Optional[PromptPrefixCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_prompt_prefix_cache() -> PromptPrefixCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PromptPrefixCache()
+        return _cache
+
+
+def get_prompt_prefix(
+    model_name: str,
+    system_instruction: str,
+    shared_text: str = "",
+    ttl_seconds: Optional[int] = None,
+) -> PromptPrefix:
+    return get_prompt_prefix_cache().prefix(model_name, system_instruction, shared_text, ttl_seconds)
@@ -0,0 +1,179 @@
+"""
+검색 쿼리 임베딩 서비스 (심층분석 채팅 / academic_contents 검색 공용)
+
+대학 문서 검색은 같은 쿼리를 두 번 임베딩한다.
+- document_chunks용: gemini-embedding-001 (3072차원)
+- academic_contents용: gemini-embedding-001 (768차원)
+이 둘을 순차 호출하던 것을
+
+- 두 모델 호출을 동시에 요청
+- 리포트 계획의 쿼리들은 모델별 배치 요청 1회로 미리 임베딩 (prefetch)
+- (모델, 차원, 텍스트) 키 LRU 메모 (utils.embedding_cache.EmbeddingCache, 디스크 미사용)
+
+생기부 근거 문단(RETRIEVAL_DOCUMENT)도 같은 배치/메모 경로로 임베딩한다 (embed_academic_passages).
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+from config import embedding_settings as embedding_config
+from utils.embedding_cache import TASK_DOCUMENT, TASK_QUERY, EmbeddingCache, make_embedding_key
+
+
+DOCUMENT_QUERY_MODEL = getattr(embedding_config, "DEFAULT_EMBEDDING_MODEL", "") or "models/gemini-embedding-001"
+ACADEMIC_QUERY_MODEL = "models/gemini-embedding-001"
+ACADEMIC_QUERY_DIMENSIONS = 768
+QUERY_EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_EMBEDDING_CACHE_MAX_ENTRIES", "1024"))
+QUERY_EMBEDDING_MAX_RETRIES = 3
+# batchEmbedContents 요청당 최대 텍스트 수
+QUERY_EMBEDDING_BATCH_LIMIT = 100
+
+
+class _EmbeddingSpec:
+    def __init__(self, model: str, dimensions: Optional[int] = None):
+        self.model = model
+        self.dimensions = dimensions
+        self.cache_model = f"{model}@{dimensions}" if dimensions else model
+
+
+DOCUMENT_QUERY_SPEC = _EmbeddingSpec(DOCUMENT_QUERY_MODEL)
+ACADEMIC_QUERY_SPEC = _EmbeddingSpec(ACADEMIC_QUERY_MODEL, ACADEMIC_QUERY_DIMENSIONS)
+
+
+def _resolve_api_key() -> str:
+    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        try:
+            from config.config import get_settings
+            api_key = get_settings().GEMINI_API_KEY
+        except Exception:
+            pass
+    if not api_key:
+        raise RuntimeError("GEMINI_API_KEY가 설정되지 않았습니다.")
+    return api_key
+
+
+class QueryEmbeddingService:
+    """쿼리 임베딩 (모델별 배치 + 두 모델 동시 요청 + LRU 메모)"""
+
+    def __init__(self, cache: Optional[EmbeddingCache] = None):
+        self.cache = cache or EmbeddingCache(max_entries=QUERY_EMBEDDING_CACHE_MAX_ENTRIES)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="query-embed")
+        self._configure_lock = threading.Lock()
+        self._configured = False
+
+    def _genai(self):
+        import google.generativeai as genai
+
+        with self._configure_lock:
+            if not self._configured:
+                genai.configure(api_key=_resolve_api_key())
+                self._configured = True
+        return genai
+
+    def _request(
+        self,
+        spec: _EmbeddingSpec,
+        texts: List[str],
+        task_type: str = "RETRIEVAL_QUERY",
+    ) -> List[List[float]]:
+        genai = self._genai()
+        kwargs = {"output_dimensionality": spec.dimensions} if spec.dimensions else {}
+        for attempt in range(1, QUERY_EMBEDDING_MAX_RETRIES + 1):
+            try:
+                result = genai.embed_content(
+                    model=spec.model,
+                    content=texts,
+                    task_type=task_type,
+                    **kwargs,
+                )
+                vectors = result["embedding"]
+                if len(vectors) != len(texts):
+                    raise ValueError(f"임베딩 개수 불일치 ({len(vectors)}/{len(texts)})")
+                return [list(vector) for vector in vectors]
+            except Exception:
+                if attempt >= QUERY_EMBEDDING_MAX_RETRIES:
+                    raise
+                time.sleep(attempt)
+        return []
+
+    def _embed(self, spec: _EmbeddingSpec, texts: List[str], task: str = TASK_QUERY) -> List[List[float]]:
+        """캐시에 없는 텍스트만 (중복 제거 후) 배치 요청"""
+        task_type = "RETRIEVAL_DOCUMENT" if task == TASK_DOCUMENT else "RETRIEVAL_QUERY"
+        keys = [make_embedding_key(spec.cache_model, text, task) for text in texts]
+        results: List[Optional[List[float]]] = [self.cache.get(key) for key in keys]
+
+        missing: List[str] = []
+        for text, vector in zip(texts, results):
+            if vector is None and text not in missing:
+                missing.append(text)
+
+        fresh = {}
+        for start in range(0, len(missing), QUERY_EMBEDDING_BATCH_LIMIT):
+            batch = missing[start:start + QUERY_EMBEDDING_BATCH_LIMIT]
+            for text, vector in zip(batch, self._request(spec, batch, task_type)):
+                fresh[text] = vector
+                self.cache.set(make_embedding_key(spec.cache_model, text, task), vector)
+
+        return [vector if vector is not None else fresh[text] for text, vector in zip(texts, results)]
+
+    def embed_academic(self, text: str) -> List[float]:
+        """academic_contents 검색용 (768차원)"""
+        return self._embed(ACADEMIC_QUERY_SPEC, [text])[0]
+
+    def embed_academic_batch(self, texts: List[str]) -> List[List[float]]:
+        """academic_contents 검색용 (768차원) 여러 쿼리를 배치 1회로"""
+        return self._embed(ACADEMIC_QUERY_SPEC, list(texts))
+
+    def embed_academic_passages(self, texts: List[str]) -> List[List[float]]:
+        """검색 대상 문단(RETRIEVAL_DOCUMENT, 768차원). 생기부 근거 문단처럼 쿼리와 비교할 쪽"""
+        return self._embed(ACADEMIC_QUERY_SPEC, list(texts), TASK_DOCUMENT)
+
+    def embed_document(self, text: str) -> List[float]:
+        """document_chunks 검색용 (3072차원)"""
+        return self._embed(DOCUMENT_QUERY_SPEC, [text])[0]
+
+    def embed_dual(self, text: str) -> Tuple[List[float], Optional[List[float]]]:
+        """
+        (3072차원, 768차원)을 동시에 요청.
+        3072차원 실패는 예외로 전달, 768차원 실패는 None (보조 검색용)
+        """
+        academic_future = self._executor.submit(self.embed_academic, text)
+        primary = self.embed_document(text)
+        try:
+            secondary = academic_future.result()
+        except Exception:
+            secondary = None
+        return primary, secondary
+
+    def prefetch(
+        self,
+        document_texts: Iterable[str] = (),
+        academic_texts: Iterable[str] = (),
+    ) -> None:
+        """리포트 계획의 쿼리들을 모델별 배치 1회로 미리 임베딩 (실패해도 이후 개별 요청으로 재시도)"""
+        jobs = []
+        for spec, texts in ((DOCUMENT_QUERY_SPEC, document_texts), (ACADEMIC_QUERY_SPEC, academic_texts)):
+            unique = list(dict.fromkeys(t for t in texts if t and t.strip()))
+            if unique:
+                jobs.append((spec, self._executor.submit(self._embed, spec, unique)))
+        for spec, future in jobs:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"⚠️ [query_embeddings] 쿼리 임베딩 배치 실패({spec.cache_model}): {e}")
+
+
+_service: Optional[QueryEmbeddingService] = None
+_service_lock = threading.Lock()
+
+
+def get_query_embedding_service() -> QueryEmbeddingService:
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = QueryEmbeddingService()
+        return _service
@@ -0,0 +1,170 @@
+"""
+유저별 생기부 컨텍스트 캐시
+
+생기부 모드 채팅은 턴마다 user_profiles.school_record를 다시 조회하고
+전체 파싱 결과로 수 KB짜리 컨텍스트 문자열(공용/심층 리포트용)을 다시 조립했다.
+같은 세션에서 질문을 이어가면 생기부는 그대로인데 매번 같은 작업을 반복하던 것을
+
+- 유저별로 조회 결과와 파생 값(컨텍스트 문자열, 계획용 스냅샷 등)을 메모리에 보관
+- 파생 값은 처음 필요할 때 1회만 계산 (SchoolRecordContext.derive)
+- update_user_profile_school_record 가 호출되면 해당 유저 캐시 폐기
+- 다른 워커 프로세스의 수정은 알 수 없으므로 TTL 경과 후 다시 조회하되,
+  지문(pdfImportMeta.file_hash + 폼 내용 해시)이 같으면 이전 파생 값을 그대로 재사용
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from school_record_eval.report_context import build_school_record_report_context_text
+from services.supabase_client import supabase_service
+from utils.school_record_context import build_school_record_context_text
+
+
+SCHOOL_RECORD_CONTEXT_CACHE_TTL_SECONDS = float(os.getenv("SCHOOL_RECORD_CONTEXT_CACHE_TTL_SECONDS", "600"))
+SCHOOL_RECORD_CONTEXT_CACHE_MAX_USERS = int(os.getenv("SCHOOL_RECORD_CONTEXT_CACHE_MAX_USERS", "512"))
+
+
+def _school_record_forms(school_record: Dict[str, Any]) -> Dict[str, Any]:
+    forms = school_record.get("forms")
+    return forms if isinstance(forms, dict) and forms else school_record
+
+
+def build_school_record_fingerprint(school_record: Dict[str, Any]) -> str:
+    """
+    pdfImportMeta.file_hash + 폼 리비전(원문 텍스트를 제외한 폼 내용 해시).
+    원문 텍스트는 file_hash가 같으면 같으므로 해시 대상에서 제외
+    (top-level 필드는 _normalize_school_record_payload 가 forms와 동기화).
+    """
+    if not school_record:
+        return ""
+    forms = _school_record_forms(school_record)
+    import_meta = forms.get("pdfImportMeta") or school_record.get("pdfImportMeta") or {}
+    file_hash = str(import_meta.get("file_hash") or "") if isinstance(import_meta, dict) else ""
+    revision_source = {
+        key: value for key, value in forms.items() if key != "rawSchoolRecordText"
+    }
+    try:
+        dumped = json.dumps(revision_source, ensure_ascii=False, sort_keys=True, default=str)
+    except Exception:
+        dumped = str(revision_source)
+    revision = hashlib.sha1(dumped.encode("utf-8")).hexdigest()[:16]
+    return f"{file_hash}:{revision}"
+
+
+class SchoolRecordContext:
+    """유저 생기부 1건 + 파생 값 메모 (school_record는 읽기 전용으로 사용, 수정 시 복사)"""
+
+    def __init__(self, school_record: Optional[Dict[str, Any]]):
+        self.school_record: Dict[str, Any] = dict(school_record or {})
+        self.fingerprint = build_school_record_fingerprint(self.school_record)
+        self._derived: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def derive(self, name: str, builder: Callable[[], Any]) -> Any:
+        """name별로 builder 결과를 1회만 계산해 보관 (동시 계산 시 먼저 끝난 값 사용)"""
+        with self._lock:
+            if name in self._derived:
+                return self._derived[name]
+        value = builder()
+        with self._lock:
+            return self._derived.setdefault(name, value)
+
+    @property
+    def context_text(self) -> str:
+        """일반 채팅용 생기부 컨텍스트 (build_school_record_context_text)"""
+        return self.derive(
+            "context_text",
+            lambda: build_school_record_context_text(self.school_record) or "",
+        )
+
+    @property
+    def report_context_text(self) -> str:
+        """심층 리포트용 생기부 컨텍스트 (build_school_record_report_context_text)"""
+        return self.derive(
+            "report_context_text",
+            lambda: build_school_record_report_context_text(self.school_record) or "",
+        )
+
+
+class SchoolRecordContextCache:
+    """user_id -> SchoolRecordContext (LRU + TTL, 수정 시 무효화)"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = SCHOOL_RECORD_CONTEXT_CACHE_TTL_SECONDS,
+        max_users: int = SCHOOL_RECORD_CONTEXT_CACHE_MAX_USERS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max(1, max_users)
+        # user_id -> [만료 시각, SchoolRecordContext]
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        # 무효화 세대: 조회 중에 수정이 끝났으면 조회 결과(이전 값)를 저장하지 않음
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, user_id: str) -> tuple:
+        """(유효한 캐시 값 또는 None, 만료된 이전 값 또는 None, 현재 세대)"""
+        with self._lock:
+            generation = self._generations.get(user_id, 0)
+            slot = self._entries.get(user_id)
+            if slot is None:
+                return None, None, generation
+            if slot[0] > time.monotonic():
+                self._entries.move_to_end(user_id)
+                return slot[1], None, generation
+            return None, slot[1], generation
+
+    def _store(self, user_id: str, entry: SchoolRecordContext, generation: int) -> None:
+        with self._lock:
+            if self._generations.get(user_id, 0) != generation:
+                return
+            self._entries[user_id] = [time.monotonic() + self.ttl_seconds, entry]
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+
+    async def get(self, user_id: str) -> Optional[SchoolRecordContext]:
+        """캐시에 있으면 프로필 조회 없이 반환. 조회 실패(None)는 캐시하지 않음"""
+        if not user_id:
+            return None
+        cached, stale, generation = self._lookup(user_id)
+        if cached is not None:
+            return cached
+
+        school_record = await supabase_service.get_user_profile_school_record(user_id)
+        if school_record is None:
+            return None
+        entry = SchoolRecordContext(school_record)
+        if stale is not None and stale.fingerprint == entry.fingerprint:
+            # 내용이 같으면 이미 조립한 컨텍스트 문자열 재사용
+            entry = stale
+        self._store(user_id, entry, generation)
+        return entry
+
+    def invalidate(self, user_id: str) -> None:
+        if not user_id:
+            return
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            self._entries.pop(user_id, None)
+
+
+_cache: Optional[SchoolRecordContextCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_school_record_context_cache() -> SchoolRecordContextCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SchoolRecordContextCache()
+        return _cache
+
+
+def invalidate_school_record_context(user_id: str) -> None:
+    get_school_record_context_cache().invalidate(user_id)
@@ -8,6 +8,10 @@ from config import embedding_settings as embedding_config
 from typing import Optional, Dict, Any, List
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_core.documents import Document
+from utils.embedding_cache import CachedEmbeddings
+from utils.university_names import invalidate_university_matcher, register_document_names_loader
+from services.embedding_executor import EmbeddingBatchExecutor
+from services.bulk_insert import BulkInserter, format_vector
 import os
 
 _CLIENT_OPTIONS = SyncClientOptions(postgrest_client_timeout=30)
@@ -358,6 +362,8 @@ class SupabaseService:
                 .eq('id', int(document_id))\
                 .execute()
 
+            invalidate_university_matcher()
+
             print(f"\n✅ 문서 삭제 완료!")
             print(f"   파일명: {document_id}")
             print(f"   제목: {title}")
@@ -677,6 +683,11 @@ class SupabaseService:
         except Exception as e:
             print(f"❌ update_user_profile_school_record 오류: {e}")
             return False
+        finally:
+            # 쓰기 성공/실패와 무관하게 캐시된 생기부 컨텍스트 폐기 (쓰기 완료 후라 이전 값 재저장 없음)
+            from services.school_record_context_cache import invalidate_school_record_context
+
+            invalidate_school_record_context(user_id)
 
     @staticmethod
     def _normalize_score_name(name: str) -> str:
@@ -967,16 +978,22 @@ class SupabaseUploader:
         self.supabase: Client = create_client(supabase_url, supabase_key)
 
         embedding_model = embedding_config.DEFAULT_EMBEDDING_MODEL
+        # 재시도/백오프는 EmbeddingBatchExecutor가 배치 단위로 담당
         embedding_kwargs = {
             "request_timeout": 600,
-            "batch_size": 100,
-            "max_retries": 10,
-            "retry_delay": 15
+            "batch_size": embedding_config.EMBEDDING_BATCH_SIZE,
+            "max_retries": 1,
+            "retry_delay": 1
         }
         if embedding_model:
             embedding_kwargs["model"] = embedding_model
 
-        self.embeddings = GoogleGenerativeAIEmbeddings(**embedding_kwargs)
+        embeddings = GoogleGenerativeAIEmbeddings(**embedding_kwargs)
+        # (모델, 텍스트 해시) 캐시를 거쳐 같은 청크는 한 번만 임베딩
+        self.embeddings = CachedEmbeddings(
+            embeddings,
+            model=getattr(embeddings, "model", None) or embedding_config.DEFAULT_EMBEDDING_MODEL,
+        )
 
     def upload_to_supabase(
         self,
@@ -1037,17 +1054,8 @@ class SupabaseUploader:
             section_map = self._insert_sections(document_id, toc_sections)
             print(f"   ✅ 섹션 등록 완료 ({len(section_map)}개 섹션)")
 
-            print("\n[Step 3] 임베딩 생성 중...")
-            embeddings_list = self._generate_embeddings(chunks)
-            print(f"   ✅ 임베딩 생성 완료 ({len(embeddings_list)}개)")
-
-            print("\n[Step 4] document_chunks 테이블에 청크 등록 중...")
-            chunks_inserted = self._insert_chunks(
-                document_id,
-                section_map,
-                chunks,
-                embeddings_list
-            )
+            print("\n[Step 3-4] 임베딩 생성 + document_chunks 테이블에 청크 등록 중...")
+            chunks_inserted = self._embed_and_insert_chunks(document_id, section_map, chunks)
             print(f"   ✅ 청크 등록 완료 ({chunks_inserted}개)")
 
             print(f"\n🎉 Supabase 업로드 완료! (문서 ID: {document_id})")
@@ -1137,13 +1145,14 @@ class SupabaseUploader:
                 insert_data["summary"] = summary
             if summary_embedding:
                 # pgvector: 문자열 "[x,y,z,...]" 형식으로 전달
-                insert_data["embedding_summary"] = "[" + ",".join(map(str, summary_embedding)) + "]"
+                insert_data["embedding_summary"] = format_vector(summary_embedding)
             if file_url:
                 insert_data["file_url"] = file_url
 
             response = self.supabase.table("documents").insert(insert_data).execute()
 
             if response.data:
+                invalidate_university_matcher()
                 return response.data[0].get("id")
             return None
         except Exception as e:
@@ -1151,28 +1160,26 @@ class SupabaseUploader:
             return None
 
     def _insert_sections(self, document_id: int, sections: List[dict]) -> Dict[str, int]:
-        """document_sections 테이블에 섹션 등록"""
+        """document_sections 테이블에 섹션 등록 (요청 1번으로 일괄 삽입)"""
         section_map = {}
+        if not sections:
+            return section_map
 
-        try:
-            for section in sections:
-                section_name = section.get("title", "알 수 없음")
-                page_start = section.get("start_page", 1)
-                page_end = section.get("end_page", 1)
-
-                response = self.supabase.table("document_sections").insert(
-                    {
-                        "document_id": document_id,
-                        "section_name": section_name,
-                        "page_start": page_start,
-                        "page_end": page_end
-                    }
-                ).execute()
+        rows = [
+            {
+                "document_id": document_id,
+                "section_name": section.get("title", "알 수 없음"),
+                "page_start": section.get("start_page", 1),
+                "page_end": section.get("end_page", 1)
+            }
+            for section in sections
+        ]
 
-                if response.data:
-                    section_id = response.data[0].get("id")
-                    section_key = f"{page_start}_{page_end}"
-                    section_map[section_key] = section_id
+        try:
+            response = self.supabase.table("document_sections").insert(rows).execute()
+            for row in response.data or []:
+                section_key = f"{row.get('page_start')}_{row.get('page_end')}"
+                section_map[section_key] = row.get("id")
         except Exception as e:
             print(f"   ⚠️ document_sections 삽입 실패: {str(e)}")
 
@@ -1186,57 +1193,81 @@ class SupabaseUploader:
             print(f"   ⚠️ 요약 임베딩 생성 실패: {str(e)}")
             return None
 
-    def _generate_embeddings(self, chunks: List[Document]) -> List[List[float]]:
-        """청크 임베딩 생성 (배치)"""
-        texts = [doc.page_content for doc in chunks]
-        return self.embeddings.embed_documents(texts)
-
-    def _insert_chunks(
+    def _embed_and_insert_chunks(
         self,
         document_id: int,
         section_map: Dict[str, int],
-        chunks: List[Document],
-        embeddings_list: List[List[float]],
-        batch_size: int = 100
+        chunks: List[Document]
     ) -> int:
-        """document_chunks 테이블에 청크 등록 (배치)"""
-        inserted = 0
-        batch = []
-
-        for idx, (doc, embedding) in enumerate(zip(chunks, embeddings_list), start=1):
-            metadata = doc.metadata or {}
+        """임베딩 배치를 병렬로 생성하면서 끝난 배치부터 바로 DB 삽입을 제출 (임베딩과 삽입을 겹침)"""
+        texts = [doc.page_content for doc in chunks]
+        executor = EmbeddingBatchExecutor(self.embeddings)
+        inserter = BulkInserter(self.supabase)
+        embedded = 0
 
-            page_number = metadata.get("page_number", 0)
-            chunk_type = metadata.get("type", "text")
-            raw_data = metadata.get("raw_data")
+        try:
+            for start, vectors in executor.iter_batches(texts):
+                embedded += len(vectors)
+                rows = self._build_chunk_rows(
+                    section_map,
+                    chunks[start:start + len(vectors)],
+                    vectors,
+                    start_ordinal=start
+                )
+                inserter.submit_document_chunks(document_id, rows)
+                print(f"   📦 임베딩 {embedded}/{len(texts)}")
+            inserted = inserter.wait()
+        finally:
+            inserter.close()
+
+        if executor.api_texts < len(texts):
+            print(f"   ♻️ 임베딩 캐시/중복 재사용: {len(texts) - executor.api_texts}개 (API 호출 {executor.api_texts}개)")
+        if executor.rate_limited:
+            print(f"   ⏳ 임베딩 쿼터 제한 {executor.rate_limited}회 (백오프 후 재시도)")
+        return inserted
 
+    @staticmethod
+    def _build_chunk_rows(
+        section_map: Dict[str, int],
+        chunks: List[Document],
+        embeddings_list: List[List[float]],
+        start_ordinal: int = 0
+    ) -> List[Dict[str, Any]]:
+        """document_chunks 행 생성 (chunk_ordinal: 문서 내 청크 순번, 재시도 중복 방지 키)"""
+        rows = []
+        for offset, (doc, embedding) in enumerate(zip(chunks, embeddings_list)):
+            metadata = doc.metadata or {}
             section_key = f"{metadata.get('section_start', 0)}_{metadata.get('section_end', 0)}"
-            section_id = section_map.get(section_key)
-
-            # pgvector: 문자열 "[x,y,z,...]" 형식으로 전달
-            embedding_str = "[" + ",".join(map(str, embedding)) + "]"
-            batch.append({
-                "document_id": document_id,
-                "section_id": section_id,
+            rows.append({
+                "section_id": section_map.get(section_key),
+                "chunk_ordinal": start_ordinal + offset,
                 "content": doc.page_content,
-                "raw_data": raw_data,
-                "embedding": embedding_str,
-                "page_number": page_number,
-                "chunk_type": chunk_type
+                "raw_data": metadata.get("raw_data"),
+                "embedding": embedding,
+                "page_number": metadata.get("page_number", 0),
+                "chunk_type": metadata.get("type", "text")
             })
-
-            if len(batch) >= batch_size or idx == len(chunks):
-                try:
-                    response = self.supabase.table("document_chunks").insert(batch).execute()
-                    if response.data:
-                        inserted += len(response.data)
-                except Exception as e:
-                    print(f"   ⚠️ 청크 배치 삽입 실패: {str(e)}")
-                batch = []
-
-        return inserted
+        return rows
 
 
 # 전역 인스턴스
 supabase_service = SupabaseService()
 
+
+def load_document_school_names() -> List[str]:
+    """documents.school_name 중복 제거 목록 (대학명 매처 재구성용)"""
+    client = supabase_service.get_admin_client()
+    response = client.table("documents").select("school_name").execute()
+    school_names: List[str] = []
+    seen = set()
+    for row in response.data or []:
+        name = str(row.get("school_name") or "").strip()
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        school_names.append(name)
+    return school_names
+
+
+register_document_names_loader(load_document_school_names)
+
@@ -0,0 +1,120 @@
+"""
+PDF 수집 작업 큐 테스트 (SQLite 저장소 상태 전이 / 실패 처리 / 중단 작업 재개)
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import ingest_jobs
+from services.ingest_jobs import (
+    STATUS_FAILED,
+    STATUS_QUEUED,
+    STATUS_RUNNING,
+    IngestJobQueue,
+    IngestJobStore,
+)
+
+
+def _store(tmp_path) -> IngestJobStore:
+    return IngestJobStore(str(tmp_path / "jobs.sqlite3"))
+
+
+def _create(store: IngestJobStore, tmp_path, school_name: str = "서울대", name: str = "a.pdf"):
+    file_path = tmp_path / name
+    file_path.write_bytes(b"%PDF-1.4")
+    return store.create_job(school_name, name, str(file_path), name)
+
+
+def _make_stale(store: IngestJobStore, job_id: str) -> None:
+    with store._connect() as conn:
+        conn.execute("UPDATE ingest_jobs SET updated_at = 0 WHERE id = ?", (job_id,))
+
+
+def test_claim_marks_running_and_counts_attempts(tmp_path):
+    store = _store(tmp_path)
+    job = _create(store, tmp_path)
+    assert job["status"] == STATUS_QUEUED
+
+    assert store.claim_next(per_school_limit=1) == job["id"]
+    claimed = store.get_job(job["id"])
+    assert claimed["status"] == STATUS_RUNNING
+    assert claimed["attempts"] == 1
+    assert store.claim_next(per_school_limit=1) is None
+
+
+def test_claim_respects_per_school_limit(tmp_path):
+    store = _store(tmp_path)
+    first = _create(store, tmp_path, "서울대", "a.pdf")
+    _create(store, tmp_path, "서울대", "b.pdf")
+    other = _create(store, tmp_path, "연세대", "c.pdf")
+
+    assert store.claim_next(per_school_limit=1) == first["id"]
+    # 서울대는 이미 1개 실행 중 → 다음 학교 작업
+    assert store.claim_next(per_school_limit=1) == other["id"]
+    assert store.claim_next(per_school_limit=1) is None
+
+
+def test_runner_exception_marks_job_failed(tmp_path, monkeypatch):
+    def crash(self):
+        raise RuntimeError("PyMuPDF 오류")
+
+    monkeypatch.setattr(ingest_jobs._IngestJobRunner, "_execute", crash)
+    store = _store(tmp_path)
+    job = _create(store, tmp_path)
+
+    queue = IngestJobQueue(store, max_workers=1, per_school_limit=1)
+    queue.dispatch()
+    queue._executor.shutdown(wait=True)
+
+    failed = store.get_job(job["id"])
+    assert failed["status"] == STATUS_FAILED
+    assert "PyMuPDF 오류" in failed["error"]
+    assert failed["finished_at"] is not None
+    last_event = store.list_events(job["id"])[-1]
+    assert last_event["status"] == STATUS_FAILED
+
+
+def test_requeue_stale_resumes_until_attempt_limit(tmp_path):
+    store = _store(tmp_path)
+    job = _create(store, tmp_path)
+
+    for attempt in range(1, 3):
+        assert store.claim_next(per_school_limit=1) == job["id"]
+        _make_stale(store, job["id"])
+        assert store.requeue_stale(stale_seconds=60, max_attempts=3) == 1
+        resumed = store.get_job(job["id"])
+        assert resumed["status"] == STATUS_QUEUED
+        assert resumed["attempts"] == attempt
+
+    # 3번째 실행도 중단되면 더 이상 재개하지 않고 실패
+    assert store.claim_next(per_school_limit=1) == job["id"]
+    _make_stale(store, job["id"])
+    assert store.requeue_stale(stale_seconds=60, max_attempts=3) == 0
+    exhausted = store.get_job(job["id"])
+    assert exhausted["status"] == STATUS_FAILED
+    assert exhausted["attempts"] == 3
+    assert store.list_events(job["id"])[-1]["status"] == STATUS_FAILED
+    assert store.claim_next(per_school_limit=1) is None
+
+
+def test_requeue_stale_skips_recently_updated_jobs(tmp_path):
+    store = _store(tmp_path)
+    job = _create(store, tmp_path)
+    store.claim_next(per_school_limit=1)
+
+    assert store.requeue_stale(stale_seconds=60, max_attempts=3) == 0
+    assert store.get_job(job["id"])["status"] == STATUS_RUNNING
+
+
+def test_recover_requeues_recently_interrupted_jobs(tmp_path, monkeypatch):
+    store = _store(tmp_path)
+    job = _create(store, tmp_path)
+    # 재시작 직전까지 진행 이벤트가 기록되던 작업 (updated_at이 방금)
+    assert store.claim_next(per_school_limit=1) == job["id"]
+
+    queue = IngestJobQueue(store, max_workers=1, per_school_limit=1)
+    monkeypatch.setattr(queue, "dispatch", lambda: None)
+    assert queue.recover() == 1
+    resumed = store.get_job(job["id"])
+    assert resumed["status"] == STATUS_QUEUED
+    assert store.claim_next(per_school_limit=1) == job["id"]
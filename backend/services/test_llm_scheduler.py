@@ -0,0 +1,169 @@
+"""
+LLM 작업 스케줄러 테스트 (TaskGraph 실행 순서 / ConcurrencyBudget 동시 실행 제한·우선순위)
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.llm_scheduler import (
+    RESOURCE_LLM,
+    ConcurrencyBudget,
+    LLMScheduler,
+    TaskGraph,
+)
+
+
+def _scheduler(llm_limit: int) -> LLMScheduler:
+    scheduler = LLMScheduler()
+    scheduler._budgets[RESOURCE_LLM] = ConcurrencyBudget(RESOURCE_LLM, llm_limit)
+    return scheduler
+
+
+def test_graph_runs_dependencies_first_and_passes_results():
+    order = []
+    lock = threading.Lock()
+
+    def task(name, value):
+        def fn(results):
+            time.sleep(0.01)
+            with lock:
+                order.append(name)
+            return value(results)
+        return fn
+
+    graph = TaskGraph("test")
+    graph.add("a", task("a", lambda results: 1))
+    graph.add("b", task("b", lambda results: 2))
+    graph.add("sum", task("sum", lambda results: results["a"] + results["b"]), deps=["a", "b"])
+    graph.add("double", task("double", lambda results: results["sum"] * 2), deps=["sum"])
+
+    results = _scheduler(4).submit(graph).result(timeout=5)
+
+    assert results == {"a": 1, "b": 2, "sum": 3, "double": 6}
+    assert order.index("sum") > max(order.index("a"), order.index("b"))
+    assert order[-1] == "double"
+
+
+def test_failed_required_task_skips_dependents():
+    called = []
+
+    def boom(results):
+        raise RuntimeError("LLM 오류")
+
+    graph = TaskGraph("test")
+    graph.add("draft", boom)
+    graph.add("review", lambda results: called.append("review") or "ok", requires=["draft"])
+    graph.add("assemble", lambda results: "done", deps=["draft"])
+
+    results = _scheduler(2).submit(graph).result(timeout=5)
+
+    assert results["draft"] is None
+    assert results["review"] is None
+    assert called == []
+    # deps만 걸린 작업은 선행 작업 실패와 무관하게 실행
+    assert results["assemble"] == "done"
+
+
+def test_add_rejects_unknown_or_duplicate_tasks():
+    graph = TaskGraph("test")
+    graph.add("a", lambda results: 1)
+    with pytest.raises(ValueError):
+        graph.add("a", lambda results: 2)
+    with pytest.raises(ValueError):
+        graph.add("b", lambda results: 2, deps=["missing"])
+
+
+def test_graph_respects_llm_budget():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(results):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return True
+
+    graph = TaskGraph("test")
+    for index in range(8):
+        graph.add(f"section_{index}", work)
+
+    results = _scheduler(2).submit(graph).result(timeout=10)
+
+    assert all(results.values())
+    assert peak == 2
+
+
+def test_budget_wakes_lower_priority_number_first():
+    async def scenario():
+        budget = ConcurrencyBudget("llm", 1)
+        await budget.acquire("report", 0)
+        granted = []
+
+        async def wait(owner, priority, label):
+            await budget.acquire(owner, priority)
+            granted.append(label)
+            budget.release(owner)
+
+        waiters = [
+            asyncio.create_task(wait("report", 30, "post_process")),
+            asyncio.create_task(wait("report", 20, "review")),
+            asyncio.create_task(wait("report", 10, "section")),
+        ]
+        await asyncio.sleep(0)
+        budget.release("report")
+        await asyncio.gather(*waiters)
+        return granted
+
+    assert asyncio.run(scenario()) == ["section", "review", "post_process"]
+
+
+def test_budget_prefers_owner_with_fewer_running_tasks():
+    async def scenario():
+        budget = ConcurrencyBudget("llm", 2)
+        await budget.acquire("busy", 10)
+        await budget.acquire("busy", 10)
+        granted = []
+
+        async def wait(owner, label):
+            await budget.acquire(owner, 10)
+            granted.append(label)
+
+        asyncio.create_task(wait("busy", "busy_next"))
+        asyncio.create_task(wait("idle", "idle_first"))
+        await asyncio.sleep(0)
+        # busy가 1개 반납 → 같은 우선순위면 실행 중인 작업이 적은 idle 먼저
+        budget.release("busy")
+        await asyncio.sleep(0)
+        return granted, budget.in_use
+
+    granted, in_use = asyncio.run(scenario())
+    assert granted == ["idle_first"]
+    assert in_use == 2
+
+
+def test_cancelled_waiter_does_not_leak_budget():
+    async def scenario():
+        budget = ConcurrencyBudget("llm", 1)
+        await budget.acquire("a", 10)
+        waiter = asyncio.create_task(budget.acquire("b", 10))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        budget.release("a")
+        return budget.in_use, budget._waiters
+
+    in_use, waiters = asyncio.run(scenario())
+    assert in_use == 0
+    assert waiters == []
@@ -0,0 +1,122 @@
+"""
+요청 단위 사용자 컨텍스트 선조회 (Prefetch)
+
+채팅 요청 진입 시점에 사용자 범위의 DB 조회(프로필 metadata, 성적 세트,
+생기부, 세션 skip 플래그)를 동시에 시작해 두고, 이후 단계(Router 점수 보완,
+성적 리뷰 게이트, 생기부 컨텍스트 구성)에서는 새로 조회하지 않고 결과만 기다립니다.
+Router LLM 호출 지연과 DB 조회 지연이 겹치도록 하는 것이 목적입니다.
+
+- supabase_service 메서드는 async 시그니처지만 내부는 동기 HTTP 호출이므로
+  전용 스레드 풀에서 실행합니다.
+- 결과는 concurrent.futures.Future로 보관하므로 chat.py의 generator가 단계마다
+  새로 만드는 이벤트 루프에서도 그대로 await 할 수 있습니다.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from services.school_record_context_cache import get_school_record_context_cache
+from services.supabase_client import supabase_service
+
+
+PREFETCH_MAX_WORKERS = int(os.getenv("USER_CONTEXT_PREFETCH_MAX_WORKERS", "16"))
+PREFETCH_TIMEOUT_SECONDS = float(os.getenv("USER_CONTEXT_PREFETCH_TIMEOUT_SECONDS", "10"))
+PREFETCH_SCORE_SET_LIMIT = 20
+
+_executor = ThreadPoolExecutor(
+    max_workers=PREFETCH_MAX_WORKERS,
+    thread_name_prefix="user-context-prefetch",
+)
+
+
+def _run_coro_in_thread(factory: Callable[[], Awaitable[Any]]) -> Any:
+    return asyncio.run(factory())
+
+
+class UserContextPrefetch:
+    """요청 단위 사용자 컨텍스트 선조회 핸들"""
+
+    def __init__(
+        self,
+        user_id: Optional[str],
+        session_id: Optional[str],
+        include_school_record: bool = False,
+    ):
+        self.user_id = user_id
+        self.session_id = session_id or "default"
+        self.score_owner = user_id or f"guest:{self.session_id}"
+        self.include_school_record = include_school_record
+        self._futures: Dict[str, Future] = {}
+
+    def start(self) -> "UserContextPrefetch":
+        """모든 조회를 동시에 시작 (중복 호출 시 무시)"""
+        if self._futures:
+            return self
+
+        self._submit(
+            "skip_score_review",
+            lambda: supabase_service.get_session_skip_score_review(self.session_id, self.user_id),
+        )
+        self._submit(
+            "score_sets",
+            lambda: supabase_service.list_user_score_sets(
+                self.score_owner, limit=PREFETCH_SCORE_SET_LIMIT
+            ),
+        )
+        if self.user_id:
+            self._submit(
+                "profile_metadata",
+                lambda: supabase_service.get_user_profile_metadata(self.user_id),
+            )
+            if self.include_school_record:
+                # SchoolRecordContext (유저별 캐시에 있으면 DB 조회 없음)
+                self._submit(
+                    "school_record",
+                    lambda: get_school_record_context_cache().get(self.user_id),
+                )
+        return self
+
+    def _submit(self, name: str, factory: Callable[[], Awaitable[Any]]) -> None:
+        self._futures[name] = _executor.submit(_run_coro_in_thread, factory)
+
+    def has(self, name: str) -> bool:
+        return name in self._futures
+
+    async def get(self, name: str, default: Any = None) -> Any:
+        """선조회 결과 대기 (현재 실행 중인 이벤트 루프와 무관하게 사용 가능)"""
+        future = self._futures.get(name)
+        if future is None:
+            return default
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=PREFETCH_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            print(f"⚠️ 사용자 컨텍스트 선조회 실패({name}): {e}")
+            return default
+
+    def get_sync(self, name: str, default: Any = None) -> Any:
+        """동기 generator용 결과 대기"""
+        future = self._futures.get(name)
+        if future is None:
+            return default
+        try:
+            return future.result(timeout=PREFETCH_TIMEOUT_SECONDS)
+        except Exception as e:
+            print(f"⚠️ 사용자 컨텍스트 선조회 실패({name}): {e}")
+            return default
+
+
+def start_user_context_prefetch(
+    user_id: Optional[str],
+    session_id: Optional[str],
+    include_school_record: bool = False,
+) -> UserContextPrefetch:
+    """요청 진입 시점에 호출하여 선조회 시작"""
+    return UserContextPrefetch(
+        user_id=user_id,
+        session_id=session_id,
+        include_school_record=include_school_record,
+    ).start()
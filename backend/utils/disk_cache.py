@@ -0,0 +1,192 @@
+"""
+내용 주소(content-addressed) 디스크 캐시
+
+키 문자열(해시/프롬프트 버전/모델 등을 포함)을 sha256으로 바꿔 파일명으로 사용합니다.
+프로세스 재시작이나 서버 재배포 후에도 PDF 재업로드 시 이전 결과를 재사용하기 위한 용도입니다.
+
+- 파일은 <root>/<해시 앞 2자리>/<해시><suffix> 형태로 분산 저장
+- 쓰기는 임시 파일 작성 후 os.replace로 교체 (동시 쓰기/중단 시 깨진 파일 방지)
+- 캐시 오류는 모두 미스로 취급 (캐시 때문에 수집 파이프라인이 실패하지 않도록)
+- max_bytes를 넘으면 오래 안 쓴 파일부터 삭제 (조회 시 mtime 갱신 → LRU), 목표는 한도의 90%
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+# 정리 시 한도의 이 비율까지 줄여서 매 쓰기마다 정리가 반복되지 않도록
+_PRUNE_TARGET_RATIO = 0.9
+
+
+def content_hash(data: Union[bytes, str]) -> str:
+    """바이트/문자열 내용의 sha256 hex"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class DiskCache:
+    """디렉토리 하나를 사용하는 키-값 파일 캐시"""
+
+    def __init__(self, root: str, suffix: str = "", enabled: bool = True, max_bytes: int = 0):
+        self.root = root
+        self.suffix = suffix
+        self.enabled = enabled
+        self.max_bytes = max(0, max_bytes)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # 디렉토리 총 크기 추정치 (첫 쓰기 때 스캔, 정리할 때마다 다시 스캔해 보정)
+        self._size_bytes: Optional[int] = None
+        if self.enabled:
+            os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = content_hash(key)
+        return os.path.join(self.root, digest[:2], f"{digest}{self.suffix}")
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except (FileNotFoundError, OSError):
+            self._count(False)
+            return None
+        self._count(True)
+        if self.max_bytes:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return data
+
+    def set_bytes(self, key: str, data: bytes) -> None:
+        if not self.enabled or data is None:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except Exception as e:
+            print(f"⚠️ 디스크 캐시 저장 실패 ({self.root}): {e}")
+            return
+        if self.max_bytes:
+            self._track_write(len(data) - replaced)
+
+    # ---- 크기 제한 ----
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) 목록 (임시 파일 제외)"""
+        files = []
+        for dir_path, _, names in os.walk(self.root):
+            for name in names:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(dir_path, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _track_write(self, delta: int) -> None:
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._size_bytes += delta
+            if self._size_bytes <= self.max_bytes:
+                return
+            try:
+                self._prune_locked()
+            except Exception as e:
+                print(f"⚠️ 디스크 캐시 정리 실패 ({self.root}): {e}")
+
+    def _prune_locked(self) -> None:
+        """오래 안 쓴 파일부터 삭제해 한도의 90%까지 줄임 (다른 프로세스 쓰기도 반영되도록 다시 스캔)"""
+        files = sorted(self._scan())
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_bytes * _PRUNE_TARGET_RATIO)
+        removed = 0
+        started = time.perf_counter()
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self._size_bytes = total
+        self._evictions += removed
+        if removed:
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            print(f"🧹 디스크 캐시 정리 ({self.root}): {removed}개 삭제, {total // (1024 * 1024)}MB 남음 ({elapsed_ms}ms)")
+
+    def get_text(self, key: str) -> Optional[str]:
+        data = self.get_bytes(key)
+        if data is None:
+            return None
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    def set_text(self, key: str, text: str) -> None:
+        if text is None:
+            return
+        self.set_bytes(key, text.encode("utf-8"))
+
+    def get_json(self, key: str) -> Optional[Any]:
+        text = self.get_text(key)
+        if text is None:
+            return None
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
+
+    def set_json(self, key: str, value: Any) -> None:
+        self.set_text(key, json.dumps(value, ensure_ascii=False))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "root": self.root,
+                "enabled": self.enabled,
+                "hits": self._hits,
+                "misses": self._misses,
+                "size_bytes": self._size_bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+            }
@@ -0,0 +1,198 @@
+"""
+임베딩 결과 캐시
+
+PDF 수집(ingest) 파이프라인에서 청크 임베딩을 한 번만 생성하도록
+(모델, 작업 종류, 텍스트 해시) 키로 임베딩 벡터를 메모리에 보관합니다.
+
+- 같은 문서를 다시 업로드하거나 업로드 재시도 시 이미 계산한 청크는 API를 호출하지 않음
+- 한 문서 안에서 내용이 같은 청크(반복 머리말/표 등)는 한 번만 임베딩
+- 벡터는 array('f')로 보관하여 메모리 사용량을 줄임 (pgvector도 float4로 저장)
+- 메모리 캐시는 개수와 총 바이트(EMBEDDING_CACHE_MAX_MB) 중 먼저 닿는 한도에서 LRU 제거
+  (3072차원 벡터 1개 ≈ 12KB → 기본 32MB ≈ 2,700개, 나머지는 디스크 캐시에서 복원)
+- 메모리 미스 시 디스크 캐시(config.EMBEDDINGS_DIR, float32 바이너리)를 확인하여
+  서버 재시작 후 재업로드에도 바뀐 청크만 임베딩
+"""
+
+import hashlib
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from config import embedding_settings as embedding_config
+from utils.disk_cache import DiskCache
+
+
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "4000"))
+EMBEDDING_CACHE_MAX_BYTES = int(float(os.getenv("EMBEDDING_CACHE_MAX_MB", "32")) * 1024 * 1024)
+
+TASK_DOCUMENT = "document"
+TASK_QUERY = "query"
+
+
+def make_embedding_key(model: str, text: str, task: str = TASK_DOCUMENT) -> str:
+    """(모델, 작업 종류, 텍스트) → 캐시 키"""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model}:{task}:{digest}"
+
+
+class EmbeddingCache:
+    """임베딩 벡터 LRU 캐시 (프로세스 전역)"""
+
+    def __init__(
+        self,
+        max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES,
+        disk: Optional[DiskCache] = None,
+        max_bytes: int = EMBEDDING_CACHE_MAX_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk = disk
+        self._cache: "OrderedDict[str, array]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._cache.get(key)
+            if vector is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return vector.tolist()
+
+        vector = self._load_from_disk(key)
+        with self._lock:
+            if vector is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        self._remember(key, vector)
+        return vector.tolist()
+
+    def set(self, key: str, vector: List[float]) -> None:
+        if not vector:
+            return
+        packed = array("f", vector)
+        self._remember(key, packed)
+        if self.disk is not None:
+            self.disk.set_bytes(key, packed.tobytes())
+
+    def _remember(self, key: str, packed: array) -> None:
+        size = len(packed) * packed.itemsize
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous) * previous.itemsize
+            self._cache[key] = packed
+            self._bytes += size
+            while len(self._cache) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._bytes -= len(evicted) * evicted.itemsize
+
+    def _load_from_disk(self, key: str) -> Optional[array]:
+        if self.disk is None:
+            return None
+        data = self.disk.get_bytes(key)
+        if not data or len(data) % 4:
+            return None
+        packed = array("f")
+        packed.frombytes(data)
+        return packed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "size": len(self._cache),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total * 100, 2) if total else 0,
+            }
+
+
+_embedding_cache = EmbeddingCache(
+    disk=DiskCache(
+        embedding_config.EMBEDDINGS_DIR,
+        ".f32",
+        enabled=embedding_config.INGEST_CACHE_ENABLED,
+        max_bytes=embedding_config.EMBEDDINGS_CACHE_MAX_MB * 1024 * 1024,
+    ),
+)
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """전역 임베딩 캐시 반환"""
+    return _embedding_cache
+
+
+class CachedEmbeddings:
+    """
+    LangChain 임베딩 클라이언트 래퍼.
+    캐시에 없는 텍스트만 모아서 한 번의 embed_documents 호출로 임베딩합니다.
+    """
+
+    def __init__(self, embeddings: Any, model: str, cache: Optional[EmbeddingCache] = None):
+        self.embeddings = embeddings
+        self.model = model
+        self.cache = cache or get_embedding_cache()
+        self.api_texts = 0  # 이 래퍼가 실제로 API에 보낸 텍스트 수
+
+    def lookup(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """캐시에 있는 벡터만 채워 반환 (없으면 None)"""
+        return [
+            self.cache.get(make_embedding_key(self.model, text, TASK_DOCUMENT))
+            for text in texts
+        ]
+
+    def store(self, texts: List[str], vectors: List[List[float]]) -> None:
+        """API로 새로 만든 벡터를 캐시에 저장"""
+        for text, vector in zip(texts, vectors):
+            self.cache.set(make_embedding_key(self.model, text, TASK_DOCUMENT), vector)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [make_embedding_key(self.model, text, TASK_DOCUMENT) for text in texts]
+        vectors: Dict[str, List[float]] = {}
+        missing: Dict[str, str] = {}
+
+        for key, text in zip(keys, texts):
+            if key in vectors or key in missing:
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                vectors[key] = cached
+            else:
+                missing[key] = text
+
+        if missing:
+            missing_keys = list(missing.keys())
+            missing_texts = [missing[k] for k in missing_keys]
+            new_vectors = self.embeddings.embed_documents(missing_texts)
+            self.api_texts += len(missing_keys)
+            self.store(missing_texts, new_vectors)
+            for key, vector in zip(missing_keys, new_vectors):
+                vectors[key] = vector
+
+        return [vectors[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = make_embedding_key(self.model, text, TASK_QUERY)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        vector = self.embeddings.embed_query(text)
+        self.api_texts += 1
+        self.cache.set(key, vector)
+        return vector
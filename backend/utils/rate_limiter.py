@@ -0,0 +1,71 @@
+"""
+토큰 버킷 속도 제한기
+
+외부 API(Gemini 임베딩 등) 쿼터를 넘지 않도록 여러 스레드의 호출 속도를 조절합니다.
+429(쿼터 초과) 응답 시 속도를 절반으로 낮추고, 성공이 이어지면 설정값까지 천천히 회복합니다 (AIMD).
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (rate_per_minute 단위: 요청 수 또는 텍스트 수 등 호출자가 정의)"""
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: float = None,
+        min_rate_per_minute: float = None,
+        recover_factor: float = 1.05,
+    ):
+        self.max_rate = max(1.0, float(rate_per_minute)) / 60.0
+        self.rate = self.max_rate
+        self.min_rate = (
+            max(1.0, float(min_rate_per_minute)) / 60.0
+            if min_rate_per_minute
+            else self.max_rate / 16
+        )
+        self.capacity = float(capacity) if capacity else max(1.0, self.max_rate * 10)
+        self.recover_factor = recover_factor
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """토큰 amount개를 얻을 때까지 대기. 대기한 시간(초) 반환"""
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                wait = (amount - self._tokens) / self.rate
+            wait = min(wait, 5.0)
+            time.sleep(wait)
+            waited += wait
+
+    def penalize(self) -> None:
+        """쿼터 초과 응답 시 속도 절반으로 감소, 모아둔 토큰도 비움"""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+
+    def reward(self) -> None:
+        """성공 시 설정 속도까지 조금씩 회복"""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill()
+                self.rate = min(self.max_rate, self.rate * self.recover_factor)
+
+    @property
+    def rate_per_minute(self) -> float:
+        return self.rate * 60.0
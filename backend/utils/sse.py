@@ -0,0 +1,122 @@
+"""
+SSE(Server-Sent Events) 프레임 인코더
+
+- 이벤트마다 f-string + json.dumps를 반복하지 않도록 프레임 생성을 한 곳으로 모음
+- Main Agent 응답 청크(chunk)는 짧은 시간/바이트 창 안에서 합쳐서 전송
+  (Gemini 청크 단위로 프레임을 만들면 모바일 WebView에서 프레임 오버헤드가 큼)
+- 고정 문구 상태 이벤트는 미리 인코딩한 프레임을 재사용
+- 다음 청크가 늦게 오면 병합 창이 끝나는 시점에 대기 중인 텍스트를 내보냄 (SSEEncoder.paced)
+"""
+
+import contextvars
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+
+SSE_COALESCE_MS = int(os.getenv("CHAT_STREAM_COALESCE_MS", "60"))
+SSE_COALESCE_BYTES = int(os.getenv("CHAT_STREAM_COALESCE_BYTES", "512"))
+
+
+def encode_sse_frame(payload: Dict[str, Any]) -> str:
+    """dict → `data: {...}\\n\\n` 프레임"""
+    return f"data: {json.dumps(payload, ensure_ascii=False, separators=(',', ':'))}\n\n"
+
+
+class SSEEncoder:
+    """스트림 1개 단위 인코더 (chunk 이벤트 병합 포함)"""
+
+    def __init__(
+        self,
+        coalesce_ms: Optional[int] = None,
+        coalesce_bytes: Optional[int] = None,
+    ):
+        self.coalesce_seconds = (SSE_COALESCE_MS if coalesce_ms is None else coalesce_ms) / 1000.0
+        self.coalesce_bytes = SSE_COALESCE_BYTES if coalesce_bytes is None else coalesce_bytes
+        self._pending: list[str] = []
+        self._pending_bytes = 0
+        self._last_flush = time.monotonic()
+
+    def chunk(self, text: str) -> str:
+        """
+        응답 텍스트 조각 추가.
+        병합 창(ms/bytes)을 넘으면 지금까지 모인 텍스트를 chunk 프레임 1개로 반환, 아니면 빈 문자열.
+        """
+        if text:
+            self._pending.append(text)
+            self._pending_bytes += len(text.encode("utf-8"))
+        if not self._pending:
+            return ""
+        elapsed = time.monotonic() - self._last_flush
+        if self._pending_bytes >= self.coalesce_bytes or elapsed >= self.coalesce_seconds:
+            return self.flush()
+        return ""
+
+    def flush(self) -> str:
+        """대기 중인 chunk 텍스트를 프레임으로 반환 (없으면 빈 문자열)"""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return ""
+        text = "".join(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+        return encode_sse_frame({"type": "chunk", "text": text})
+
+    def event(self, payload: Dict[str, Any]) -> str:
+        """일반 이벤트 프레임 (순서 보장을 위해 대기 중인 chunk를 먼저 내보냄)"""
+        return self.flush() + encode_sse_frame(payload)
+
+    def frame(self, encoded: str) -> str:
+        """미리 인코딩된 고정 프레임 전송 (대기 중인 chunk 먼저)"""
+        return self.flush() + encoded
+
+    def paced(self, events: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        이벤트 소스를 백그라운드 스레드에서 읽어 그대로 전달.
+        대기 중인 chunk 텍스트가 있는데 병합 창 안에 다음 이벤트가 오지 않으면
+        빈 chunk 이벤트를 끼워 넣음 → 호출부의 chunk 분기에서 chunk("")가 창 경과로 flush.
+        (마지막 텍스트 조각이 done 이벤트까지 밀리지 않도록)
+        """
+        items: "queue.Queue[tuple]" = queue.Queue()
+        stop = threading.Event()
+
+        def produce() -> None:
+            try:
+                for item in events:
+                    items.put((True, item))
+                    if stop.is_set():
+                        break
+            except BaseException as e:
+                items.put((False, e))
+                return
+            finally:
+                close = getattr(events, "close", None)
+                if stop.is_set() and close is not None:
+                    close()
+            items.put((False, None))
+
+        # 소스가 contextvars(타이밍 로거 등)를 쓰는 경우를 위해 현재 컨텍스트에서 실행
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(produce,), daemon=True).start()
+        try:
+            while True:
+                timeout = None
+                if self._pending:
+                    timeout = max(0.0, self._last_flush + self.coalesce_seconds - time.monotonic())
+                try:
+                    ok, item = items.get(timeout=timeout)
+                except queue.Empty:
+                    yield {"type": "chunk", "text": ""}
+                    continue
+                if ok:
+                    yield item
+                elif item is None:
+                    return
+                else:
+                    raise item
+        finally:
+            # 클라이언트가 끊으면 소스도 다음 이벤트에서 중단
+            stop.set()
@@ -0,0 +1,379 @@
+"""
+대학명 정규화 / 별칭 매칭 공용 모듈
+
+심층분석 채팅, 리포트 에이전트, RAG 검색(functions), 수능 환산 필터가
+각자 다른 규칙으로 대학명을 비교하던 것을 하나로 통일합니다.
+
+- 대학 키: "연세대학교" / "연세대학" / "연세대" / "연대" → 모두 같은 키("연세")
+  캠퍼스는 키에 포함 ("고려대학교 세종캠퍼스", "고려대(세종)" → "고려@세종")
+- 별칭 사전(KNOWN_UNIVERSITY_ALIASES) + documents.school_name 변형을 Aho-Corasick 오토마톤 1개로 컴파일
+  → 질문 1건당 메시지를 한 번만 훑어서 대학명 추출 (학교 수와 무관)
+- documents 변경(업로드/삭제) 시 invalidate_university_matcher(), 그 외에는 TTL마다 재구성
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# 정식 명칭 → 약칭/별칭 ("대학교/대학/대" 형태 변형은 자동 생성되므로 약칭만 적으면 됨)
+KNOWN_UNIVERSITY_ALIASES: Dict[str, List[str]] = {
+    "서울대학교": ["서울대학교", "서울대", "서울대학"],
+    "연세대학교": ["연세대학교", "연세대", "연대"],
+    "고려대학교": ["고려대학교", "고려대", "고대"],
+    "중앙대학교": ["중앙대학교", "중앙대"],
+    "성균관대학교": ["성균관대학교", "성균관대", "성대"],
+    "한양대학교": ["한양대학교", "한양대"],
+    "경희대학교": ["경희대학교", "경희대"],
+    "서강대학교": ["서강대학교", "서강대"],
+    "이화여자대학교": ["이화여자대학교", "이화여대", "이대"],
+    "한국외국어대학교": ["한국외국어대학교", "한국외대", "외대"],
+    "서울시립대학교": ["서울시립대학교", "시립대", "서울시립대"],
+}
+
+# 단과대 등 대학명이 아닌 "~대" 표현 (학교명 변형으로 쓰지 않음)
+GENERIC_UNIVERSITY_TERMS: Set[str] = {
+    "의대", "치대", "약대", "공대", "상대", "법대", "교대", "사대", "문과대", "이과대",
+}
+
+# 캠퍼스 표기 통일 (키 비교용)
+_CAMPUS_ALIASES: Dict[str, str] = {
+    "에리카": "erica",
+}
+
+# 2글자 약칭(연대/고대/이대 등)은 일반 단어 속 오탐이 많아 단어 경계에서만 인정
+# 뒤에 붙을 수 있는 조사 ("로"는 "이대로" 같은 부사 오탐이 많아 제외)
+_SHORT_ALIAS_MAX_LEN = 2
+_SHORT_ALIAS_PARTICLES = set("은는이가을를에의와과도랑나만")
+
+_UNIVERSITY_SUFFIXES = ("대학교", "대학", "대")
+_CAMPUS_PATTERN = re.compile(r"^(.*?)\s*(?:\(([^)]*)\)|\s(\S+?)(?:캠퍼스|캠))\s*$")
+# "한양대학교 ERICA", "고려대 세종"처럼 대학명 뒤에 띄어 쓴 캠퍼스명
+_SPACED_CAMPUS_PATTERN = re.compile(r"^(\S*(?:대학교|대학|대))\s+(\S+)$")
+_STRIP_CHARS = re.compile(r"[\s()\[\]·・]")
+
+
+def _normalize(text: str) -> str:
+    return _STRIP_CHARS.sub("", str(text or "").lower())
+
+
+def _split_campus(name: str) -> Tuple[str, str]:
+    """'고려대학교 세종캠퍼스' / '고려대(세종)' → ('고려대학교', '세종')"""
+    raw = str(name or "").strip()
+    match = _CAMPUS_PATTERN.match(raw)
+    if not match or not match.group(1).strip():
+        spaced = _SPACED_CAMPUS_PATTERN.match(raw)
+        if spaced:
+            return spaced.group(1), spaced.group(2)
+        return raw, ""
+    campus = (match.group(2) or match.group(3) or "").strip()
+    campus = re.sub(r"(캠퍼스|캠)$", "", campus).strip()
+    return match.group(1).strip(), campus
+
+
+def _split_suffix(base: str) -> Tuple[str, str]:
+    """'연세대학교' → ('연세', '대학교'), 접미사가 없으면 (base, '')"""
+    for suffix in _UNIVERSITY_SUFFIXES:
+        if base.endswith(suffix) and len(base) > len(suffix):
+            return base[: -len(suffix)], suffix
+    return base, ""
+
+
+def _campus_key(campus: str) -> str:
+    normalized = _normalize(campus)
+    return _CAMPUS_ALIASES.get(normalized, normalized)
+
+
+def university_key(name: str) -> str:
+    """대학 비교 키 (별칭 미해석). 별칭까지 해석하려면 resolve_university_key 사용."""
+    base, campus = _split_campus(name)
+    stem, _ = _split_suffix(_normalize(base))
+    if not stem:
+        return ""
+    campus = _campus_key(campus)
+    return f"{stem}@{campus}" if campus else stem
+
+
+def university_key_matches(query_key: str, candidate_key: str) -> bool:
+    """캠퍼스 없이 지정한 대학("고려대")은 분교("고려대(세종)")까지 포함하여 매칭"""
+    if not query_key or not candidate_key:
+        return False
+    if query_key == candidate_key:
+        return True
+    return "@" not in query_key and candidate_key.split("@", 1)[0] == query_key
+
+
+def school_name_variants(name: str) -> List[str]:
+    """
+    검색/표시용 학교명 변형 ("대학교/대" 상호 변환, 캠퍼스 표기 유지)
+    예: "연세대학교" → ["연세대학교", "연세대"], "연세대" → ["연세대", "연세대학교"]
+    """
+    raw = str(name or "").strip()
+    if not raw:
+        return []
+    base, campus = _split_campus(raw)
+    stem, suffix = _split_suffix(base)
+    variants = [raw]
+    if not suffix:
+        return variants
+    campus_suffix = f"({campus})" if campus else ""
+    forms = [f"{stem}대학교", f"{stem}대"] if suffix != "대학" else [f"{stem}대", f"{stem}대학교"]
+    for form in forms:
+        candidate = f"{form}{campus_suffix}"
+        if candidate not in variants and form not in GENERIC_UNIVERSITY_TERMS:
+            variants.append(candidate)
+    return variants
+
+
+def _match_forms(name: str) -> List[str]:
+    """오토마톤에 넣을 정규화 패턴 (대학교/대학/대 + 캠퍼스 표기 변형)"""
+    base, campus = _split_campus(name)
+    stem, suffix = _split_suffix(_normalize(base))
+    if not stem:
+        return []
+    stems = [f"{stem}{s}" for s in _UNIVERSITY_SUFFIXES] if suffix else [stem]
+    if not campus:
+        return stems
+    campus_key = _campus_key(campus)
+    campus_forms = {_normalize(campus), campus_key}
+    campus_forms.update(alias for alias, key in _CAMPUS_ALIASES.items() if key == campus_key)
+    return [f"{s}{c}{tail}" for s in stems for c in sorted(campus_forms) for tail in ("", "캠퍼스")]
+
+
+@dataclass(frozen=True)
+class UniversityMatch:
+    key: str
+    start: int
+    end: int
+    alias: str
+
+
+class UniversityNameMatcher:
+    """
+    대학 별칭 Aho-Corasick 매처
+    names: 매칭 결과로 돌려줄 표시용 이름 (예: documents.school_name, 정식 명칭)
+    aliases: 별칭 사전 (표시용 이름과 키가 같으면 그 이름으로 해석됨)
+    """
+
+    def __init__(self, names: Iterable[str] = (), aliases: Optional[Dict[str, List[str]]] = None):
+        aliases = KNOWN_UNIVERSITY_ALIASES if aliases is None else aliases
+        self._names_by_key: Dict[str, List[str]] = {}
+        # 표시용 이름 전체 (입력 순서, 중복 제거)
+        self.names: List[str] = []
+        pattern_keys: Dict[str, Set[str]] = {}
+
+        def add_pattern(pattern: str, key: str) -> None:
+            if len(pattern) < 2 or pattern in GENERIC_UNIVERSITY_TERMS:
+                return
+            pattern_keys.setdefault(pattern, set()).add(key)
+
+        for canonical, alias_list in aliases.items():
+            key = university_key(canonical)
+            for form in _match_forms(canonical):
+                add_pattern(form, key)
+            for alias in alias_list:
+                add_pattern(_normalize(alias), key)
+
+        for name in names:
+            name = str(name or "").strip()
+            key = university_key(name)
+            if not key:
+                continue
+            display = self._names_by_key.setdefault(key, [])
+            if name not in display:
+                display.append(name)
+                self.names.append(name)
+            for form in _match_forms(name):
+                add_pattern(form, key)
+
+        self.alias_keys: Dict[str, Set[str]] = pattern_keys
+        self._build(pattern_keys)
+
+    # ---- Aho-Corasick ----
+
+    def _build(self, patterns: Dict[str, Set[str]]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[str]] = [[]]
+        for pattern in patterns:
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    output.append([])
+                node = nxt
+            output[node].append(pattern)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                candidate = goto[f].get(ch, 0)
+                fail[nxt] = candidate if candidate != nxt else 0
+                output[nxt] = output[nxt] + output[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def _scan(self, text: str) -> Tuple[str, List[Tuple[int, int, str]], List[bool]]:
+        """정규화 문자열 위에서 모든 패턴 출현 (start, end, pattern) + 원문 단어 시작 위치 표시"""
+        chars: List[str] = []
+        word_start: List[bool] = []
+        boundary = True
+        for ch in str(text or "").lower():
+            if _STRIP_CHARS.match(ch):
+                boundary = True
+                continue
+            chars.append(ch)
+            word_start.append(boundary)
+            # 문장부호 뒤도 단어 시작으로 취급 ("연대,고대")
+            boundary = not (ch.isalnum() or "가" <= ch <= "힣")
+        normalized = "".join(chars)
+
+        hits: List[Tuple[int, int, str]] = []
+        node = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for index, ch in enumerate(normalized):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pattern in output[node]:
+                hits.append((index + 1 - len(pattern), index + 1, pattern))
+        return normalized, hits, word_start
+
+    def _is_word_match(self, normalized: str, word_start: List[bool], start: int, end: int) -> bool:
+        if not word_start[start]:
+            return False
+        if end >= len(normalized) or word_start[end]:
+            return True
+        nxt = normalized[end]
+        if not ("가" <= nxt <= "힣"):
+            return True
+        return nxt in _SHORT_ALIAS_PARTICLES and (end + 1 >= len(normalized) or word_start[end + 1])
+
+    def find(self, text: str) -> List[UniversityMatch]:
+        """메시지 1회 순회로 대학명 출현 위치 반환 (겹치면 더 긴 별칭 우선)"""
+        normalized, hits, word_start = self._scan(text)
+        hits.sort(key=lambda hit: (hit[0], -(hit[1] - hit[0])))
+        matches: List[UniversityMatch] = []
+        covered_until = 0
+        for start, end, pattern in hits:
+            if start < covered_until:
+                continue
+            if len(pattern) <= _SHORT_ALIAS_MAX_LEN and not self._is_word_match(normalized, word_start, start, end):
+                continue
+            for key in sorted(self.alias_keys.get(pattern, ())):
+                matches.append(UniversityMatch(key=key, start=start, end=end, alias=pattern))
+            covered_until = end
+        return matches
+
+    def names_for(self, key: str) -> List[str]:
+        return list(self._names_by_key.get(key, []))
+
+    def extract_names(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """
+        메시지에 언급된 대학의 표시용 이름 (더 길게 매칭된 대학 우선, 같은 길이는 이름순)
+        """
+        longest: Dict[str, int] = {}
+        for match in self.find(text):
+            longest[match.key] = max(longest.get(match.key, 0), match.end - match.start)
+        ranked: List[Tuple[int, str]] = []
+        seen: Set[str] = set()
+        for key, length in longest.items():
+            for name in self._names_by_key.get(key, []):
+                if name not in seen:
+                    seen.add(name)
+                    ranked.append((length, name))
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        names = [name for _, name in ranked]
+        return names[:limit] if limit is not None else names
+
+    def resolve_key(self, name: str) -> str:
+        """이름 1개를 대학 키로 (약칭이면 별칭 사전으로 해석)"""
+        keys = self.alias_keys.get(_normalize(name))
+        if keys and len(keys) == 1:
+            return next(iter(keys))
+        return university_key(name)
+
+
+# ---- 공용 인스턴스 ----
+
+MATCHER_REFRESH_SECONDS = 600
+
+_alias_matcher: Optional[UniversityNameMatcher] = None
+_document_matcher: Optional[UniversityNameMatcher] = None
+_document_matcher_built_at = 0.0
+_document_names_loader: Optional[Callable[[], List[str]]] = None
+_matcher_lock = threading.Lock()
+
+
+def register_document_names_loader(loader: Callable[[], List[str]]) -> None:
+    """documents.school_name 목록을 돌려주는 로더 등록 (DB 의존성은 호출 측에 둠)"""
+    global _document_names_loader
+    with _matcher_lock:
+        _document_names_loader = loader
+    invalidate_university_matcher()
+
+
+def invalidate_university_matcher() -> None:
+    """documents 추가/삭제 후 호출 → 다음 조회 시 오토마톤 재구성"""
+    global _document_matcher, _document_matcher_built_at
+    with _matcher_lock:
+        _document_matcher = None
+        _document_matcher_built_at = 0.0
+
+
+def get_university_matcher(include_documents: bool = True) -> UniversityNameMatcher:
+    """
+    include_documents=False: 별칭 사전만 (정식 명칭 반환)
+    include_documents=True: 별칭 사전 + documents.school_name (문서 학교명 반환)
+    """
+    global _alias_matcher, _document_matcher, _document_matcher_built_at
+    if not include_documents:
+        with _matcher_lock:
+            if _alias_matcher is None:
+                _alias_matcher = UniversityNameMatcher(KNOWN_UNIVERSITY_ALIASES.keys())
+            return _alias_matcher
+
+    with _matcher_lock:
+        fresh = (
+            _document_matcher is not None
+            and time.time() - _document_matcher_built_at < MATCHER_REFRESH_SECONDS
+        )
+        if fresh:
+            return _document_matcher
+        loader = _document_names_loader
+
+    names: List[str] = []
+    if loader is not None:
+        try:
+            names = list(loader() or [])
+        except Exception as e:
+            print(f"⚠️ [university_names] 문서 학교명 로드 실패: {e}")
+            with _matcher_lock:
+                if _document_matcher is not None:
+                    # 일시 오류면 직전 오토마톤 유지
+                    _document_matcher_built_at = time.time()
+                    return _document_matcher
+
+    matcher = UniversityNameMatcher(names)
+    with _matcher_lock:
+        _document_matcher = matcher
+        _document_matcher_built_at = time.time()
+    return matcher
+
+
+def resolve_university_key(name: str) -> str:
+    """별칭까지 해석한 대학 키 ("연대" → "연세", "고려대(세종)" → "고려@세종")"""
+    return get_university_matcher(include_documents=False).resolve_key(name)
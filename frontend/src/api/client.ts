@@ -169,6 +169,11 @@ export interface UsedChunk {
   metadata?: Record<string, any>
 }
 
+export interface FunctionResultsRef {
+  results_id: string
+  session_id: string
+}
+
 export interface ChatResponse {
   response: string
   raw_answer?: string  // ✅ Final Agent 원본 출력
@@ -178,7 +183,8 @@ export interface ChatResponse {
   report?: any
   // 멀티에이전트 디버그 데이터
   router_output?: Record<string, any>  // Router 출력 (최상위)
-  function_results?: Record<string, any>  // Function 결과 (최상위)
+  function_results?: Record<string, any>  // Function 결과 (최상위, slim)
+  function_results_ref?: FunctionResultsRef  // 전체 Function 결과 조회 참조
   orchestration_result?: OrchestrationResult
   sub_agent_results?: Record<string, SubAgentResult>
   metadata?: Record<string, any>
@@ -210,6 +216,21 @@ export interface SchoolRecordSectionEvent {
   }
   section_index: number
   total_sections: number
+  /** 리포트에 바로 넣을 수 있는 정규화된 섹션 (최종 report 이벤트 전 초안) */
+  report_section?: Record<string, any>
+  evidence?: Record<string, any>
+  order?: string[]
+}
+
+/** 스트리밍한 리포트 초안 수정 (검토 수정, 합격자 비교 섹션, 요약) */
+export interface SchoolRecordReportPatchEvent {
+  op: 'upsert_section' | 'remove_section' | 'set' | 'discard'
+  section?: Record<string, any>
+  section_id?: string
+  evidence?: Record<string, any>
+  order?: string[]
+  field?: 'summary' | 'direct_answer'
+  value?: any
 }
 
 export interface StreamChatRequest extends ChatRequest {
@@ -278,6 +299,37 @@ export interface Agent {
   description: string
 }
 
+/**
+ * done 이벤트의 function_results는 청크 본문/문서 요약이 빠진 slim 버전.
+ * 전체 결과는 서버에 results_id로 보관되므로 참조만 넘기고, 실제로 보는 곳(Agent 패널)에서만 조회.
+ */
+const buildFunctionResultsRef = (finalData: any, sessionId: string): FunctionResultsRef | undefined => {
+  const resultsId = finalData?.results_id
+  return resultsId ? { results_id: resultsId, session_id: sessionId } : undefined
+}
+
+/** 참조로 전체 function_results 조회 (만료/실패 시 fallback 반환) */
+export const fetchFullFunctionResults = async (
+  ref: FunctionResultsRef | null | undefined,
+  fallback?: Record<string, any> | null
+): Promise<Record<string, any> | null> => {
+  if (!ref?.results_id) return fallback || null
+  const apiUrl = getEffectiveApiBaseUrl()
+  try {
+    const response = await fetchWithAuthRetry(
+      `${apiUrl}/chat/v2/results/${encodeURIComponent(ref.results_id)}?session_id=${encodeURIComponent(ref.session_id)}`,
+      { method: 'GET' },
+      apiUrl
+    )
+    if (!response.ok) return fallback || null
+    const data = await response.json()
+    return data?.function_results || fallback || null
+  } catch (e) {
+    console.warn('function_results 조회 실패 (slim 결과 사용):', e)
+    return fallback || null
+  }
+}
+
 // 비스트리밍 채팅 API (iOS WebView용)
 const sendMessageNonStream = async (
   message: string,
@@ -409,6 +461,7 @@ const sendMessageNonStream = async (
       report: structuredReport || finalData?.report,
       router_output: finalData?.router_output,
       function_results: finalData?.function_results,
+      function_results_ref: buildFunctionResultsRef(finalData, sessionId),
       orchestration_result: undefined,
       sub_agent_results: undefined,
       metadata: {
@@ -452,6 +505,7 @@ export const sendMessageStream = async (
   onSchoolRecordAnswerPlan?: (plan: SchoolRecordAnswerPlanEvent) => void,
   onSchoolRecordSectionOutline?: (sections: SchoolRecordSectionOutlineItem[]) => void,
   onSchoolRecordSection?: (section: SchoolRecordSectionEvent) => void,
+  onSchoolRecordReportPatch?: (patch: SchoolRecordReportPatchEvent) => void,
 ): Promise<void> => {
   const IS_CAPACITOR_APP = isCapacitorApp()
   console.log('[sendMessageStream] IS_CAPACITOR_APP:', IS_CAPACITOR_APP)
@@ -595,6 +649,8 @@ export const sendMessageStream = async (
             onSchoolRecordSectionOutline?.((Array.isArray(event.sections) ? event.sections : []) as SchoolRecordSectionOutlineItem[])
           } else if (event.type === 'section') {
             onSchoolRecordSection?.(event as SchoolRecordSectionEvent)
+          } else if (event.type === 'report_patch') {
+            onSchoolRecordReportPatch?.(event as SchoolRecordReportPatchEvent)
           } else if (event.type === 'report') {
             structuredReport = event.report || null
           } else if (event.type === 'score_review_required') {
@@ -636,6 +692,7 @@ export const sendMessageStream = async (
       report: structuredReport || finalData?.report,
       router_output: finalData?.router_output,
       function_results: finalData?.function_results,
+      function_results_ref: buildFunctionResultsRef(finalData, sessionId),
       orchestration_result: undefined,
       sub_agent_results: undefined,
       metadata: {
@@ -758,6 +815,7 @@ export const sendContinueAfterNaesin = async (
         report: structuredReport || finalData?.report,
         router_output: finalData?.router_output,
         function_results: finalData?.function_results,
+        function_results_ref: buildFunctionResultsRef(finalData, sessionId),
         orchestration_result: undefined,
         sub_agent_results: undefined,
         metadata: { timing: finalData?.timing, pipeline_time: finalData?.pipeline_time },
@@ -835,6 +893,7 @@ export const sendContinueAfterNaesin = async (
       report: structuredReport || finalData?.report,
       router_output: finalData?.router_output,
       function_results: finalData?.function_results,
+      function_results_ref: buildFunctionResultsRef(finalData, sessionId),
       orchestration_result: undefined,
       sub_agent_results: undefined,
       metadata: { timing: finalData?.timing, pipeline_time: finalData?.pipeline_time },
@@ -937,6 +996,7 @@ export const sendContinueAfterScoreConfirm = async (
         report: structuredReport || finalData?.report,
         router_output: finalData?.router_output,
         function_results: finalData?.function_results,
+        function_results_ref: buildFunctionResultsRef(finalData, sessionId),
         orchestration_result: undefined,
         sub_agent_results: undefined,
         metadata: { timing: finalData?.timing, pipeline_time: finalData?.pipeline_time },
@@ -1007,6 +1067,7 @@ export const sendContinueAfterScoreConfirm = async (
       report: structuredReport || finalData?.report,
       router_output: finalData?.router_output,
       function_results: finalData?.function_results,
+      function_results_ref: buildFunctionResultsRef(finalData, sessionId),
       orchestration_result: undefined,
       sub_agent_results: undefined,
       metadata: { timing: finalData?.timing, pipeline_time: finalData?.pipeline_time },
@@ -1121,6 +1182,7 @@ const sendMessageNonStreamWithImage = async (
       used_chunks: finalData?.used_chunks || [],
       router_output: finalData?.router_output,
       function_results: finalData?.function_results,
+      function_results_ref: buildFunctionResultsRef(finalData, sessionId),
       orchestration_result: finalData?.orchestration_result,
       sub_agent_results: finalData?.sub_agent_results,
       metadata: finalData?.metadata
@@ -1160,6 +1222,7 @@ export const sendMessageStreamWithImage = async (
   onSchoolRecordAnswerPlan?: (plan: SchoolRecordAnswerPlanEvent) => void,
   onSchoolRecordSectionOutline?: (sections: SchoolRecordSectionOutlineItem[]) => void,
   onSchoolRecordSection?: (section: SchoolRecordSectionEvent) => void,
+  onSchoolRecordReportPatch?: (patch: SchoolRecordReportPatchEvent) => void,
 ): Promise<void> => {
   const IS_CAPACITOR_APP = isCapacitorApp()
   
@@ -1278,6 +1341,8 @@ export const sendMessageStreamWithImage = async (
             onSchoolRecordSectionOutline?.((Array.isArray(event.sections) ? event.sections : []) as SchoolRecordSectionOutlineItem[])
           } else if (event.type === 'section') {
             onSchoolRecordSection?.(event as SchoolRecordSectionEvent)
+          } else if (event.type === 'report_patch') {
+            onSchoolRecordReportPatch?.(event as SchoolRecordReportPatchEvent)
           } else if (event.type === 'report') {
             structuredReport = event.report || null
           } else if (event.type === 'score_review_required') {
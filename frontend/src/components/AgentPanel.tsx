@@ -1,5 +1,6 @@
-import { useState } from 'react'
+import { useEffect, useState } from 'react'
 import * as React from 'react'
+import { fetchFullFunctionResults, FunctionResultsRef } from '../api/client'
 
 interface RouterOutput {
   function_calls?: Array<{
@@ -34,6 +35,7 @@ interface FunctionResult {
 interface AgentPanelProps {
   routerOutput: RouterOutput | null
   functionResults: Record<string, FunctionResult> | null
+  functionResultsRef?: FunctionResultsRef | null  // slim 결과일 때 전체 결과 조회 참조
   mainAgentOutput: string | null
   rawAnswer?: string | null
   logs: string[]
@@ -46,6 +48,7 @@ type TabType = 'query' | 'functions' | 'main' | 'logs'
 export default function AgentPanel({
   routerOutput,
   functionResults,
+  functionResultsRef,
   mainAgentOutput,
   rawAnswer,
   logs,
@@ -53,6 +56,21 @@ export default function AgentPanel({
   onClose
 }: AgentPanelProps) {
   const [activeTab, setActiveTab] = useState<TabType>('query')
+  const [fullResults, setFullResults] = useState<{ resultsId: string; results: Record<string, FunctionResult> } | null>(null)
+  const resultsId = functionResultsRef?.results_id
+
+  // 청크 본문/문서 요약은 Functions 탭을 열었을 때만 조회
+  useEffect(() => {
+    if (!isOpen || activeTab !== 'functions' || !functionResultsRef || !resultsId) return
+    if (fullResults?.resultsId === resultsId) return
+    let cancelled = false
+    void fetchFullFunctionResults(functionResultsRef).then((results) => {
+      if (!cancelled && results) setFullResults({ resultsId, results })
+    })
+    return () => {
+      cancelled = true
+    }
+  }, [isOpen, activeTab, resultsId])
 
   if (!isOpen) return null
 
@@ -106,7 +124,9 @@ export default function AgentPanel({
           <QueryAgentTab result={routerOutput} />
         )}
         {activeTab === 'functions' && (
-          <FunctionsResultTab results={functionResults} />
+          <FunctionsResultTab
+            results={fullResults && fullResults.resultsId === resultsId ? fullResults.results : functionResults}
+          />
         )}
         {activeTab === 'main' && (
           <MainAgentTab answer={mainAgentOutput} rawAnswer={rawAnswer} />
@@ -7,6 +7,7 @@ import {
   sendContinueAfterNaesin,
   sendContinueAfterScoreConfirm,
   ChatResponse,
+  FunctionResultsRef,
   ScoreReviewRequiredEvent,
   SchoolGradeSavedEvent,
   ScoreSetSuggestItem,
@@ -122,6 +123,7 @@ interface Message {
   agentData?: {
     routerOutput: any
     functionResults: any
+    functionResultsRef?: FunctionResultsRef | null
     mainAgentOutput: string | null
     rawAnswer?: string | null
     logs: string[]
@@ -189,7 +191,8 @@ type ScorePreviewState =
 
 interface AgentData {
   routerOutput: any           // Router Agent 출력 (function_calls, raw_response)
-  functionResults: any        // Functions 실행 결과 (chunks, documents)
+  functionResults: any        // Functions 실행 결과 (chunks, documents) - slim
+  functionResultsRef?: FunctionResultsRef | null  // 전체 결과 조회 참조 (Agent 패널에서 조회)
   mainAgentOutput: string | null  // Main Agent 최종 답변
   rawAnswer?: string | null   // 원본 답변 (섹션 마커 포함)
   logs: string[]
@@ -3406,6 +3409,7 @@ export default function ChatPage() {
           const currentAgentData = {
             routerOutput: response.router_output || null,
             functionResults: response.function_results || null,
+            functionResultsRef: response.function_results_ref || null,
             mainAgentOutput: response.response,
             rawAnswer: response.raw_answer || null,
             logs: [...agentData.logs]  // 현재까지의 로그 복사
@@ -3461,6 +3465,7 @@ export default function ChatPage() {
             ...prev,
             routerOutput: response.router_output || null,
             functionResults: response.function_results || null,
+            functionResultsRef: response.function_results_ref || null,
             mainAgentOutput: response.response,
             rawAnswer: response.raw_answer || null
           }))
@@ -3488,6 +3493,7 @@ export default function ChatPage() {
             userQuestion: userInput,
             routerOutput: response.router_output || null,
             functionResult: response.function_results || null,
+            functionResultsRef: response.function_results_ref,
             finalAnswer: response.response,
             elapsedTime: elapsedMs,
             timing: response.metadata?.timing || undefined,
@@ -3836,6 +3842,7 @@ export default function ChatPage() {
               userQuestion: `[추가실행 ${runIndex + 2}] ${question}`,
               routerOutput: response.router_output || null,
               functionResult: response.function_results || null,
+              functionResultsRef: response.function_results_ref,
               finalAnswer: response.response,
               elapsedTime: elapsedMs,
               timing: response.metadata?.timing || undefined,
@@ -4377,6 +4384,7 @@ export default function ChatPage() {
       <AgentPanel
         routerOutput={selectedAgentData?.routerOutput || agentData.routerOutput}
         functionResults={selectedAgentData?.functionResults || agentData.functionResults}
+        functionResultsRef={selectedAgentData ? selectedAgentData.functionResultsRef : agentData.functionResultsRef}
         mainAgentOutput={selectedAgentData?.mainAgentOutput || agentData.mainAgentOutput}
         rawAnswer={selectedAgentData?.rawAnswer || agentData.rawAnswer}
         logs={selectedAgentData?.logs || agentData.logs}
@@ -5363,6 +5371,7 @@ export default function ChatPage() {
                                     agentData: {
                                       routerOutput: response.router_output || null,
                                       functionResults: response.function_results || null,
+                                      functionResultsRef: response.function_results_ref || null,
                                       mainAgentOutput: response.response || '',
                                       rawAnswer: response.raw_answer || null,
                                       logs: [],
@@ -5438,6 +5447,7 @@ export default function ChatPage() {
                                   agentData: {
                                     routerOutput: response.router_output || null,
                                     functionResults: response.function_results || null,
+                                    functionResultsRef: response.function_results_ref || null,
                                     mainAgentOutput: response.response || '',
                                     rawAnswer: response.raw_answer || null,
                                     logs: [],
@@ -347,6 +347,59 @@ const normalizeTextForCompare = (text: string) =>
 
 const createMessageId = () => `${Date.now()}-${Math.random().toString(36).slice(2, 10)}`
 
+interface ReportStreamEvent {
+  type: 'section' | 'report_patch'
+  op?: 'upsert_section' | 'remove_section' | 'set' | 'discard'
+  report_section?: ReportSection
+  section?: ReportSection
+  section_id?: string
+  evidence?: Record<string, ReportEvidence>
+  order?: string[]
+  field?: 'summary' | 'direct_answer'
+  value?: any
+}
+
+/** 섹션 완료/패치 이벤트를 최종 report 이벤트 전까지의 리포트 초안에 반영 */
+const applyReportStreamEvent = (
+  report: StructuredReport | undefined,
+  event: ReportStreamEvent
+): StructuredReport | undefined => {
+  if (event.type === 'report_patch' && event.op === 'discard') return undefined
+
+  const next: StructuredReport = report
+    ? { ...report, sections: [...report.sections], evidence_catalog: { ...report.evidence_catalog } }
+    : { report_title: '', summary: '', sections: [], evidence_catalog: {} }
+
+  if (event.type === 'report_patch' && event.op === 'set' && event.field) {
+    return { ...next, [event.field]: event.value }
+  }
+  if (event.type === 'report_patch' && event.op === 'remove_section') {
+    next.sections = next.sections.filter((section) => section.section_id !== event.section_id)
+    return next
+  }
+
+  const section = event.type === 'section' ? event.report_section : event.section
+  if (!section?.section_id) return report
+
+  const existingIndex = next.sections.findIndex((item) => item.section_id === section.section_id)
+  if (existingIndex >= 0) {
+    next.sections[existingIndex] = section
+  } else {
+    next.sections.push(section)
+  }
+  Object.assign(next.evidence_catalog, event.evidence || {})
+
+  const order = event.order || []
+  if (order.length > 0) {
+    const rank = (sectionId: string) => {
+      const index = order.indexOf(sectionId)
+      return index >= 0 ? index : order.length
+    }
+    next.sections.sort((a, b) => rank(a.section_id) - rank(b.section_id))
+  }
+  return next
+}
+
 const buildSectionDescription = (section: ReportSection) => {
   const narrative = section.section_narrative?.trim()
   if (narrative) return narrative
@@ -4344,6 +4397,23 @@ function SchoolRecordDeepChatPage() {
                   }
                   return updated
                 })
+              } else if (
+                (event.type === 'section' && event.report_section) ||
+                event.type === 'report_patch'
+              ) {
+                setMessages((prev) => {
+                  const updated = [...prev]
+                  const messageIndex = updated.findIndex((msg) => msg.id === assistantMessageId)
+                  const target = messageIndex >= 0 ? updated[messageIndex] : null
+                  if (target?.role === 'assistant') {
+                    updated[messageIndex] = {
+                      ...target,
+                      report: applyReportStreamEvent(target.report, event as ReportStreamEvent),
+                    }
+                    if (!target.report) setSelectedMsgIndex(messageIndex)
+                  }
+                  return updated
+                })
               } else if (event.type === 'report' && event.report) {
                 setMessages((prev) => {
                   const updated = [...prev]
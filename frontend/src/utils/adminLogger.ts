@@ -3,6 +3,7 @@
  */
 
 import { API_BASE } from '../config'
+import type { FunctionResultsRef } from '../api/client'
 import { getEntryUrl } from './tracking'
 
 export interface ExecutionLog {
@@ -13,6 +14,7 @@ export interface ExecutionLog {
   userQuestion: string           // 사용자 질문
   routerOutput: any              // Router 출력 (JSON)
   functionResult: any            // Function 결과
+  functionResultsRef?: FunctionResultsRef  // 저장 시 서버가 전체 Function 결과로 채움 (functionResult는 slim)
   finalAnswer: string            // 최종 답변
   elapsedTime: number            // 소요시간 (ms)
   entryUrl?: string | null       // 진입한 랜딩 페이지 URL